@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Compare two hot-path benchmark result files and report regressions.
+
+The JSON files are written by tests/integration/performance (``pytest -m benchmark``).
+Each benchmark records its own relative regression threshold; a benchmark regresses
+when its median grows by more than that ratio (and by more than ``--min-delta-ms``,
+so sub-millisecond noise does not fail the comparison).
+
+Usage:
+    LORAIRO_BENCH_OUTPUT=.benchmarks/base.json uv run pytest -m benchmark   # on the base commit
+    LORAIRO_BENCH_OUTPUT=.benchmarks/head.json uv run pytest -m benchmark   # on the head commit
+    python scripts/compare_benchmarks.py .benchmarks/base.json .benchmarks/head.json
+    python scripts/compare_benchmarks.py base.json head.json --threshold 0.1
+
+Exit code is 1 when at least one benchmark regressed, 0 otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, NamedTuple
+
+SCHEMA_VERSION = 1
+DEFAULT_MIN_DELTA_MS = 1.0
+
+
+class Comparison(NamedTuple):
+    """Comparison of a single benchmark between two result files."""
+
+    name: str
+    base_ms: float | None
+    head_ms: float | None
+    threshold: float
+    status: str  # "ok" | "regressed" | "improved" | "added" | "removed"
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.base_ms or self.head_ms is None:
+            return None
+        return self.head_ms / self.base_ms - 1.0
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Load a benchmark result file and validate its schema version."""
+    data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported schema {data.get('schema')!r} (expected {SCHEMA_VERSION})")
+    return data
+
+
+def compare(
+    base: dict[str, Any],
+    head: dict[str, Any],
+    *,
+    threshold: float | None = None,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> list[Comparison]:
+    """Compare per-benchmark medians.
+
+    Args:
+        base: Result file of the reference commit.
+        head: Result file of the commit under test.
+        threshold: Overrides every benchmark's own threshold when given.
+        min_delta_ms: Absolute slowdown below which a benchmark never counts as regressed.
+    """
+    base_benchmarks: dict[str, Any] = base["benchmarks"]
+    head_benchmarks: dict[str, Any] = head["benchmarks"]
+    comparisons: list[Comparison] = []
+    for name in sorted(base_benchmarks.keys() | head_benchmarks.keys()):
+        base_entry = base_benchmarks.get(name)
+        head_entry = head_benchmarks.get(name)
+        entry = head_entry or base_entry
+        assert entry is not None
+        limit = threshold if threshold is not None else float(entry.get("threshold", 0.25))
+        base_ms = base_entry["median_ms"] if base_entry else None
+        head_ms = head_entry["median_ms"] if head_entry else None
+
+        if base_ms is None:
+            status = "added"
+        elif head_ms is None:
+            status = "removed"
+        elif head_ms - base_ms > max(base_ms * limit, min_delta_ms):
+            status = "regressed"
+        elif base_ms - head_ms > max(base_ms * limit, min_delta_ms):
+            status = "improved"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(name, base_ms, head_ms, limit, status))
+    return comparisons
+
+
+def _format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def print_report(comparisons: list[Comparison], base: dict[str, Any], head: dict[str, Any]) -> None:
+    """Print a plain-text comparison table."""
+    print(f"base: {base.get('git', {}).get('commit')}  dataset={base.get('dataset')}")
+    print(f"head: {head.get('git', {}).get('commit')}  dataset={head.get('dataset')}")
+    if base.get("dataset") != head.get("dataset"):
+        print("WARNING: datasets differ; timings are not directly comparable")
+    print()
+
+    width = max((len(c.name) for c in comparisons), default=9)
+    print(f"{'benchmark':<{width}}  {'base ms':>10}  {'head ms':>10}  {'change':>8}  {'limit':>6}  status")
+    for c in comparisons:
+        change = "-" if c.ratio is None else f"{c.ratio:+.1%}"
+        print(
+            f"{c.name:<{width}}  {_format_ms(c.base_ms):>10}  {_format_ms(c.head_ms):>10}  "
+            f"{change:>8}  {c.threshold:>6.0%}  {c.status}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare hot-path benchmark results")
+    parser.add_argument("base", type=Path, help="Result JSON of the reference commit")
+    parser.add_argument("head", type=Path, help="Result JSON of the commit under test")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=None,
+        help="Relative slowdown allowed for every benchmark (overrides per-benchmark thresholds)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=DEFAULT_MIN_DELTA_MS,
+        help=f"Ignore slowdowns smaller than this many ms (default: {DEFAULT_MIN_DELTA_MS})",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        base = load_results(args.base)
+        head = load_results(args.head)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    comparisons = compare(base, head, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+    print_report(comparisons, base, head)
+
+    regressed = [c.name for c in comparisons if c.status == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} benchmark(s) regressed: {', '.join(regressed)}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -116,11 +116,7 @@ def _score_tag(tag: str) -> TagScore:
             reasons.append("escaped_paren_short_tag_bias")
         # Tag-style "name (title) (series)" pattern, even if long.
         paren_pattern = r"^[^,]+\\\([^,]+\\\)(?:\s*\\\([^,]+\\\))*$"
-        if (
-            re.match(paren_pattern, tag)
-            and all(p not in tag for p in ".!?:;")
-            and "," not in tag
-        ):
+        if re.match(paren_pattern, tag) and all(p not in tag for p in ".!?:;") and "," not in tag:
             score -= 3
             reasons.append("escaped_paren_title_pattern")
 
@@ -139,7 +135,13 @@ def _score_tag(tag: str) -> TagScore:
             reasons.append("romanized_title_question")
 
     # Romanized title-like phrases ending with "!" or "?!" (often LN titles).
-    if tag.endswith("!") or tag.endswith("?!") or tag.endswith("!?") or tag.endswith("!?~") or tag.endswith("?!~"):
+    if (
+        tag.endswith("!")
+        or tag.endswith("?!")
+        or tag.endswith("!?")
+        or tag.endswith("!?~")
+        or tag.endswith("?!~")
+    ):
         is_lower = tag == lower
         has_strong_en = any(tok in lower for tok in (" is ", " a ", " an ", " the ", " and ", " with "))
         if (
@@ -167,11 +169,7 @@ def _score_tag(tag: str) -> TagScore:
 
     # Short name with escaped paren descriptor (often character tags).
     if has_escaped_paren:
-        if (
-            re.fullmatch(r"[^,]+\\\([^,]+\\\)", tag)
-            and wc <= 6
-            and "," not in tag
-        ):
+        if re.fullmatch(r"[^,]+\\\([^,]+\\\)", tag) and wc <= 6 and "," not in tag:
             score -= 2
             reasons.append("escaped_paren_name_descriptor")
 
@@ -205,6 +203,11 @@ def _chunked(items: list[str], size: int) -> list[list[str]]:
     return [items[i : i + size] for i in range(0, len(items), size)]
 
 
+def _tag_in(placeholders: str) -> str:
+    """tags 行をタグ文字列で絞る条件 (文字列は語彙 tag_strings 側で照合する)。"""
+    return f"tag_string_id IN (SELECT id FROM tag_strings WHERE tag IN ({placeholders}))"
+
+
 def _find_base_db_paths() -> list[Path]:
     cache_root = Path(os.environ.get("USERPROFILE", str(Path.home()))) / ".cache" / "huggingface" / "hub"
     if not cache_root.exists():
@@ -283,7 +286,10 @@ def main() -> int:
 
     conn = sqlite3.connect(image_db_path)
     cur = conn.cursor()
-    cur.execute("SELECT tag, COUNT(*) FROM tags GROUP BY tag")
+    cur.execute(
+        "SELECT ts.tag, COUNT(*) FROM tags t JOIN tag_strings ts ON ts.id = t.tag_string_id "
+        "GROUP BY t.tag_string_id"
+    )
     rows = cur.fetchall()
     tag_list = [row[0] for row in rows if row[0]]
     tag_clean_map = {tag: tag.lstrip() for tag in tag_list}
@@ -336,7 +342,7 @@ def main() -> int:
                     for chunk in _chunked(tags_to_move, 900):
                         placeholders = ",".join(["?"] * len(chunk))
                         cur.execute(
-                            f"SELECT COUNT(*) FROM tags WHERE tag IN ({placeholders})",
+                            f"SELECT COUNT(*) FROM tags WHERE {_tag_in(placeholders)}",
                             chunk,
                         )
                         moved_rows += int(cur.fetchone()[0])
@@ -344,20 +350,20 @@ def main() -> int:
                             f"""
                             INSERT OR IGNORE INTO captions
                                 (image_id, model_id, caption, existing, is_edited_manually)
-                            SELECT image_id, model_id, tag, existing, is_edited_manually
-                            FROM tags
-                            WHERE tag IN ({placeholders})
+                            SELECT t.image_id, t.model_id, ts.tag, t.existing, t.is_edited_manually
+                            FROM tags t JOIN tag_strings ts ON ts.id = t.tag_string_id
+                            WHERE ts.tag IN ({placeholders})
                             """,
                             chunk,
                         )
-                        conn.execute(f"DELETE FROM tags WHERE tag IN ({placeholders})", chunk)
+                        conn.execute(f"DELETE FROM tags WHERE {_tag_in(placeholders)}", chunk)
                 print(f"moved to captions: {moved_rows} tag rows")
             else:
                 total_rows = 0
                 for chunk in _chunked(tags_to_move, 900):
                     placeholders = ",".join(["?"] * len(chunk))
                     cur.execute(
-                        f"SELECT COUNT(*) FROM tags WHERE tag IN ({placeholders})",
+                        f"SELECT COUNT(*) FROM tags WHERE {_tag_in(placeholders)}",
                         chunk,
                     )
                     total_rows += int(cur.fetchone()[0])
@@ -368,7 +374,7 @@ def main() -> int:
         with conn:
             for chunk in _chunked(tags_to_delete, 900):
                 placeholders = ",".join(["?"] * len(chunk))
-                conn.execute(f"DELETE FROM tags WHERE tag IN ({placeholders})", chunk)
+                conn.execute(f"DELETE FROM tags WHERE {_tag_in(placeholders)}", chunk)
         print("deleted caption-like tags")
 
     conn.close()
@@ -159,6 +159,30 @@ def render() -> str:
         "`item` 行に包みます。検索駆動コマンドは公開フィルタ契約",
         "`ImageFilterCriteria` を晒しますが、生 SQL や DB スキーマは晒しません。",
         "",
+        "## 常駐デーモン (`lorairo-cli serve`)",
+        "",
+        "小さなコマンドを大量に呼ぶ自動化では、起動 (import・ServiceContainer・SQLite 接続) が",
+        "処理時間の大半になります。`serve` はそれらを保持したまま Unix domain socket で常駐し、",
+        "コマンドを in-process で実行します (opt-in、Unix 系のみ)。",
+        "",
+        "```bash",
+        "lorairo-cli serve --idle-timeout 600 &",
+        "export LORAIRO_CLI_DAEMON=1   # または socket パス",
+        "lorairo-cli --json images show --project demo 1",
+        "lorairo-cli serve --stop",
+        "```",
+        "",
+        "- `LORAIRO_CLI_DAEMON` を設定すると `--json` のコマンドだけがデーモンへ転送されます。",
+        "  デーモンが居なければ通常どおり実行されます。rich 出力・`serve`・`debug` は転送しません。",
+        "- リクエストは 1 件ずつ直列に実行されます。`--project` の無いリクエストの前には",
+        "  アクティブプロジェクトが解除され、プロジェクトごとの DB 接続は再利用されます。",
+        "- `--idle-timeout` 秒 (既定 900、0 で無期限) リクエストが無ければ終了します。",
+        "- 設定ファイルや環境変数 (API キー等) はデーモン起動時のものが使われます。",
+        "  変更した場合はデーモンを再起動してください。",
+        '- socket へ直接 `{"argv": ["images", "show", "--project", "demo", "1"], "json": true}`',
+        "  を 1 行送ると、`exit_code` / `stdout` / `stderr` / `elapsed_ms` を持つ JSON が 1 行返ります。",
+        "  `stdout` は通常実行と同じ JSONL です。",
+        "",
         "## Command Reference",
         "",
         "> Generated by `scripts/generate_cli_docs.py`. Edit introspection specs, then regenerate.",
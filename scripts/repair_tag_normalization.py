@@ -33,6 +33,7 @@ from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from lorairo.database.db_core import ensure_tag_db_initialized
+from lorairo.database.repository.base import resolve_tag_string_ids
 from lorairo.database.schema import Tag
 from lorairo.utils.config import get_config
 
@@ -298,10 +299,12 @@ def apply_repair_plan(session: Session, plan: RepairPlan) -> None:
     # 削除を flush してから更新を反映する。
     session.flush()
 
+    # 更新後の文字列は語彙 tag_strings へまとめて登録し、行は整数参照を差し替える。
+    string_ids = resolve_tag_string_ids(session, (update.new_tag for update in plan.updates))
     for update in plan.updates:
         row = session.get(Tag, update.tag_row_id)
         if row is not None:
-            row.tag = update.new_tag
+            row.tag_string_id = string_ids[update.new_tag]
 
 
 def _make_session_factory(db_path: Path) -> sessionmaker[Session]:
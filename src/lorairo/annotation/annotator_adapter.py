@@ -7,8 +7,13 @@ ConfigurationServiceからAPIキーを取得し、api_keysパラメータとし
 
 from __future__ import annotations
 
+import importlib.metadata
+import os
 import threading
+import time
+from collections import defaultdict
 from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -23,8 +28,11 @@ from image_annotator_lib import (
 from image_annotator_lib.core.types import TaskCapability
 from PIL import Image
 
+from lorairo.annotation.inference_cache import InferenceCacheKey, InferenceResultCache, hash_prompt
+from lorairo.annotation.model_residency import ModelResidencyManager
 from lorairo.services.configuration_service import ConfigurationService
 from lorairo.services.model_registry_protocol import ModelInfo
+from lorairo.services.model_throughput_stats import ModelThroughputStats
 from lorairo.services.provider_batch_library_compat import (
     to_library_handle,
     to_library_submit_request,
@@ -63,6 +71,15 @@ _CAPABILITY_VALUES: dict[TaskCapability, str] = {
 __all__ = ["AnnotatorLibraryAdapter"]
 
 
+def _usage_tokens(usage: Any, names: tuple[str, ...]) -> int | None:
+    """usage (dict / 属性) から最初に見つかった整数のトークン数を返す。"""
+    for name in names:
+        value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return None
+
+
 class AnnotatorLibraryAdapter:
     """image-annotator-lib統合アダプター
 
@@ -71,13 +88,31 @@ class AnnotatorLibraryAdapter:
     `ModelRegistryServiceProtocol` を実装する (構造的サブタイピング)。
     """
 
-    def __init__(self, config_service: ConfigurationService):
+    def __init__(
+        self,
+        config_service: ConfigurationService,
+        inference_cache: InferenceResultCache | None = None,
+        model_residency: ModelResidencyManager | None = None,
+        throughput_stats: ModelThroughputStats | None = None,
+        per_model_timing: bool = False,
+    ):
         """AnnotatorLibraryAdapter初期化
 
         Args:
             config_service: 設定サービス（APIキー取得用）
+            inference_cache: 推論結果キャッシュ。None ならキャッシュせず毎回推論する
+            model_residency: ローカルモデルの常駐管理。None なら常駐状況を追跡しない
+            throughput_stats: モデル別の実測統計。None なら観測値を記録しない
+            per_model_timing: 複数モデルの呼び出しをモデルごとに分けて実測するか。
+                False なら 1 回の呼び出しのまま、単一モデルの呼び出しだけを記録する
         """
         self.config_service = config_service
+        self.inference_cache = inference_cache
+        self.model_residency = model_residency
+        self.throughput_stats = throughput_stats
+        self.per_model_timing = per_model_timing
+        self._model_version: str | None = None
+        self._local_model_sizes: dict[str, int | None] | None = None
         logger.info("AnnotatorLibraryAdapter初期化完了（実ライブラリ統合モード）")
 
     def list_annotator_info(self) -> list[AnnotatorInfo]:
@@ -244,18 +279,86 @@ class AnnotatorLibraryAdapter:
                 f"pHash指定={'あり' if phash_list else 'なし'}"
             )
 
-            # APIキー準備（引数として渡す形式）
-            api_keys = self._prepare_api_keys()
-            logger.debug(f"利用可能プロバイダー: {list(api_keys.keys()) if api_keys else '（なし）'}")
-
             # additional_prompt: 空文字列は None に統一（追記しない）
             additional_prompt = self.config_service.get_setting("prompts", "additional", "") or None
 
-            # image-annotator-lib API呼び出し
-            from image_annotator_lib import annotate
+            # 推論結果キャッシュは pHash が画像と 1 対 1 で渡された場合のみ使う
+            if self.inference_cache is not None and phash_list and len(phash_list) == len(images):
+                return self._annotate_with_cache(
+                    self.inference_cache, images, litellm_model_ids, phash_list, additional_prompt
+                )
+            return self._annotate_uncached(images, litellm_model_ids, phash_list, additional_prompt)
+
+        except Exception as e:
+            error_msg = f"アノテーション実行エラー: {e}"
+            logger.opt(exception=True).error(error_msg)
+            raise
 
-            logger.debug(f"image-annotator-lib.annotate() 呼び出し: model_name_list={litellm_model_ids}")
+    def _annotate_uncached(
+        self,
+        images: list[Image.Image],
+        litellm_model_ids: list[str],
+        phash_list: list[str] | None,
+        additional_prompt: str | None,
+    ) -> PHashAnnotationResults:
+        """image-annotator-lib の ``annotate()`` を呼び出す。
 
+        スループット統計が有効なら、単一モデルの呼び出しの所要時間・失敗数・トークン数を
+        記録する。複数モデルの呼び出しは ``per_model_timing`` が有効な場合だけモデルごとに
+        分けて呼び出して記録し (ライブラリ内でもモデルは順に実行されるため結果は同じ)、
+        それ以外は 1 回の呼び出しのまま記録しない。
+        """
+        # APIキー準備（引数として渡す形式）
+        api_keys = self._prepare_api_keys()
+        logger.debug(f"利用可能プロバイダー: {list(api_keys.keys()) if api_keys else '（なし）'}")
+
+        model_ids = list(dict.fromkeys(litellm_model_ids))
+        stats = self.throughput_stats
+        if stats is not None and len(model_ids) == 1:
+            results = self._call_library_measured(
+                stats, images, model_ids[0], phash_list, api_keys, additional_prompt
+            )
+        elif stats is not None and self.per_model_timing:
+            merged: dict[str, dict[str, Any]] = {}
+            for model_id in model_ids:
+                model_results = self._call_library_measured(
+                    stats, images, model_id, phash_list, api_keys, additional_prompt
+                )
+                for phash, per_model in model_results.items():
+                    merged.setdefault(phash, {}).update(per_model)
+            results = cast("PHashAnnotationResults", merged)
+        else:
+            results = self._call_library(images, litellm_model_ids, phash_list, api_keys, additional_prompt)
+
+        logger.info(f"アノテーション実行完了: {len(results)}件の結果")
+        return results
+
+    def _call_library(
+        self,
+        images: list[Image.Image],
+        litellm_model_ids: list[str],
+        phash_list: list[str] | None,
+        api_keys: dict[str, str],
+        additional_prompt: str | None,
+    ) -> PHashAnnotationResults:
+        return self._invoke_library(images, litellm_model_ids, phash_list, api_keys, additional_prompt)[0]
+
+    def _invoke_library(
+        self,
+        images: list[Image.Image],
+        litellm_model_ids: list[str],
+        phash_list: list[str] | None,
+        api_keys: dict[str, str],
+        additional_prompt: str | None,
+    ) -> tuple[PHashAnnotationResults, tuple[str, ...], float]:
+        """ライブラリを呼び出し、(結果, 新規ロードしたローカルモデル, 呼び出しの所要秒数) を返す。"""
+        # image-annotator-lib API呼び出し
+        from image_annotator_lib import annotate
+
+        logger.debug(f"image-annotator-lib.annotate() 呼び出し: model_name_list={litellm_model_ids}")
+
+        with self._residency_scope(litellm_model_ids) as loaded:
+            started = time.perf_counter()
             results = annotate(
                 images_list=images,
                 model_name_list=litellm_model_ids,
@@ -263,14 +366,221 @@ class AnnotatorLibraryAdapter:
                 api_keys=api_keys,  # 明示的に引数として渡す
                 additional_prompt=additional_prompt,
             )
+            return results, tuple(loaded), time.perf_counter() - started
 
-            logger.info(f"アノテーション実行完了: {len(results)}件の結果")
-            return results
+    def _call_library_measured(
+        self,
+        stats: ModelThroughputStats,
+        images: list[Image.Image],
+        model_id: str,
+        phash_list: list[str] | None,
+        api_keys: dict[str, str],
+        additional_prompt: str | None,
+    ) -> PHashAnnotationResults:
+        """1 モデル分を呼び出し、観測値をスループット統計へ記録する。
 
-        except Exception as e:
-            error_msg = f"アノテーション実行エラー: {e}"
-            logger.opt(exception=True).error(error_msg)
+        ローカルモデルをこの呼び出しで新規にロードした場合は、所要時間に重みの読み込みが
+        含まれ定常の推論時間を代表しないため記録しない。
+        """
+        started = time.perf_counter()
+        try:
+            results, loaded, elapsed = self._invoke_library(
+                images, [model_id], phash_list, api_keys, additional_prompt
+            )
+        except Exception:
+            stats.record(
+                model_id, images=len(images), seconds=time.perf_counter() - started, failures=len(images)
+            )
             raise
+        if loaded:
+            logger.debug(f"スループット統計: {model_id} は初回ロードを含むため記録しません")
+            return results
+
+        model_results = [per_model[model_id] for per_model in results.values() if model_id in per_model]
+        # 結果の欠けた画像も失敗として数える
+        failures = sum(1 for result in model_results if self._result_has_error(result))
+        failures += max(len(images) - len(model_results), 0)
+        input_tokens, output_tokens = self._sum_token_usage(model_results)
+        stats.record(
+            model_id,
+            images=len(images),
+            seconds=elapsed,
+            failures=failures,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+        return results
+
+    @staticmethod
+    def _sum_token_usage(results: list[Any]) -> tuple[int | None, int | None]:
+        """結果に含まれるトークン使用量 (``usage``) を (入力, 出力) ごとに合計する。
+
+        ライブラリが使用量を返さないモデル (ローカル ML 等) は (None, None)。
+        """
+        input_total: int | None = None
+        output_total: int | None = None
+        for result in results:
+            usage = result.get("usage") if isinstance(result, dict) else getattr(result, "usage", None)
+            if usage is None:
+                continue
+            input_tokens = _usage_tokens(usage, ("input_tokens", "prompt_tokens"))
+            output_tokens = _usage_tokens(usage, ("output_tokens", "completion_tokens"))
+            if input_tokens is not None:
+                input_total = (input_total or 0) + input_tokens
+            if output_tokens is not None:
+                output_total = (output_total or 0) + output_tokens
+        return input_total, output_total
+
+    def _annotate_with_cache(
+        self,
+        cache: InferenceResultCache,
+        images: list[Image.Image],
+        litellm_model_ids: list[str],
+        phash_list: list[str],
+        additional_prompt: str | None,
+    ) -> PHashAnnotationResults:
+        """推論結果キャッシュを引き、ミスした (画像 × モデル) だけをライブラリで推論する。
+
+        キーは (pHash, ファイルサイズ, モデル ID, モデルバージョン, プロンプトハッシュ)。
+        ファイルサイズが分からない画像 (ファイル由来でない PIL 画像) はキャッシュしない。
+        ミスした組は「不足モデルの組み合わせ」ごとに画像をまとめて 1 回ずつ推論し、
+        error を持たない結果だけを保存する。
+        """
+        model_ids = list(litellm_model_ids)
+        keys = self._build_cache_keys(images, model_ids, phash_list, hash_prompt(additional_prompt))
+        cached = cache.get_many(keys.values())
+
+        merged: dict[str, dict[str, Any]] = {}
+        missing_groups: dict[tuple[str, ...], list[int]] = defaultdict(list)
+        for index, phash in enumerate(phash_list):
+            missing: list[str] = []
+            for model_id in model_ids:
+                key = keys.get((index, model_id))
+                if key is not None and key in cached:
+                    merged.setdefault(phash, {})[model_id] = cached[key]
+                else:
+                    missing.append(model_id)
+            if missing:
+                missing_groups[tuple(missing)].append(index)
+
+        hit_count = sum(len(model_results) for model_results in merged.values())
+        logger.debug(
+            f"推論結果キャッシュ: ヒット {hit_count}件 / {len(phash_list) * len(model_ids)}件, "
+            f"推論グループ {len(missing_groups)}件"
+        )
+
+        to_store: list[tuple[InferenceCacheKey, Any]] = []
+        for group_models, indices in missing_groups.items():
+            group_results = self._annotate_uncached(
+                [images[i] for i in indices],
+                list(group_models),
+                [phash_list[i] for i in indices],
+                additional_prompt,
+            )
+            for phash, model_results in group_results.items():
+                merged.setdefault(phash, {}).update(model_results)
+            to_store.extend(self._cacheable_results(group_results, keys, phash_list, indices))
+        if to_store:
+            cache.put_many(to_store)
+
+        logger.info(f"アノテーション実行完了: {len(merged)}件の結果 (キャッシュヒット {hit_count}件)")
+        return cast("PHashAnnotationResults", merged)
+
+    def _build_cache_keys(
+        self,
+        images: list[Image.Image],
+        model_ids: list[str],
+        phash_list: list[str],
+        prompt_hash: str,
+    ) -> dict[tuple[int, str], InferenceCacheKey]:
+        """(画像 index, モデル ID) → キャッシュキー。ファイルサイズ不明の画像は含めない。"""
+        model_version = self._get_model_version()
+        keys: dict[tuple[int, str], InferenceCacheKey] = {}
+        for index, (image, phash) in enumerate(zip(images, phash_list, strict=True)):
+            file_size = self._image_file_size(image)
+            if file_size is None:
+                continue
+            for model_id in model_ids:
+                keys[(index, model_id)] = InferenceCacheKey(
+                    phash, file_size, model_id, model_version, prompt_hash
+                )
+        return keys
+
+    def _cacheable_results(
+        self,
+        results: PHashAnnotationResults,
+        keys: dict[tuple[int, str], InferenceCacheKey],
+        phash_list: list[str],
+        indices: list[int],
+    ) -> list[tuple[InferenceCacheKey, Any]]:
+        """推論結果のうち保存対象 (キーがあり error を持たないもの) を返す。"""
+        index_by_phash = {phash_list[i]: i for i in indices}
+        cacheable: list[tuple[InferenceCacheKey, Any]] = []
+        for phash, model_results in results.items():
+            index = index_by_phash.get(phash)
+            if index is None:
+                continue
+            for model_id, result in model_results.items():
+                key = keys.get((index, model_id))
+                if key is not None and not self._result_has_error(result):
+                    cacheable.append((key, result))
+        return cacheable
+
+    def _residency_scope(self, litellm_model_ids: list[str]) -> AbstractContextManager[tuple[str, ...]]:
+        """ローカルモデルを含む呼び出しを常駐管理で囲むコンテキストを返す。
+
+        コンテキストは新規にロードされるローカルモデルのタプルを返す (常駐管理なしは空)。
+        """
+        if self.model_residency is None:
+            return nullcontext(())
+        sizes = self._get_local_model_sizes()
+        local_ids = [model_id for model_id in litellm_model_ids if model_id in sizes]
+        if not local_ids:
+            return nullcontext(())
+        return self.model_residency.use(local_ids, {model_id: sizes[model_id] for model_id in local_ids})
+
+    def _get_local_model_sizes(self) -> dict[str, int | None]:
+        """ローカル ML モデルの ``litellm_model_id`` → 推定サイズ (バイト)。初回のみライブラリに問い合わせる。"""
+        if self._local_model_sizes is None:
+            try:
+                infos = self.list_annotator_info()
+            except Exception:
+                # 判定できなければ常駐管理の対象外として推論だけ行う (次回再取得する)
+                return {}
+            self._local_model_sizes = {
+                (info.litellm_model_id or info.name): (
+                    int(info.estimated_size_gb * 1024**3) if info.estimated_size_gb else None
+                )
+                for info in infos
+                if not info.is_api
+            }
+        return self._local_model_sizes
+
+    def _get_model_version(self) -> str:
+        """キャッシュキーに使う推論実装のバージョン (image-annotator-lib のバージョン)。"""
+        if self._model_version is None:
+            try:
+                self._model_version = importlib.metadata.version("image-annotator-lib")
+            except importlib.metadata.PackageNotFoundError:
+                self._model_version = "unknown"
+        return self._model_version
+
+    @staticmethod
+    def _image_file_size(image: Image.Image) -> int | None:
+        """PIL 画像の元ファイルのバイト数。ファイル由来でなければ None。"""
+        filename = getattr(image, "filename", None)
+        if not filename:
+            return None
+        try:
+            return os.stat(filename).st_size
+        except OSError:
+            return None
+
+    @staticmethod
+    def _result_has_error(result: Any) -> bool:
+        """UnifiedResult (属性) / dict どちらの形でも error の有無を返す。"""
+        error = result.get("error") if isinstance(result, dict) else getattr(result, "error", None)
+        return bool(error)
 
     def submit_batch(self, request: BatchSubmitRequest) -> ProviderBatchSubmission:
         """Provider Batch API job を image-annotator-lib の公開 API へ委譲する。"""
@@ -0,0 +1,770 @@
+"""WebAPI アノテーションの並列ディスパッチャ
+
+Business Logic Layer: Qt 非依存
+
+リモートのビジョンモデル (OpenAI / Anthropic / Google / OpenRouter を litellm 経由で
+呼ぶもの) は I/O 待ちが支配的なため、(モデル × 画像チャンク) 単位のリクエストを
+provider ごとのスレッドプールで並列に送る。provider ごとに以下を適用する:
+
+- トークンバケットによるレート制限 (requests/分)
+- 429 / 一時エラーの指数バックオフ再試行 (Retry-After を優先)
+- AIMD (加算増加・乗算減少) による同時実行数の自動調整
+
+完了したリクエストの結果は ``on_result`` コールバックで **呼び出し元スレッド上で**
+順次通知する。SQLite のセッションはスレッドに紐づくため、DB 保存 (AnnotationSaveService)
+はコールバック側で行い、ワーカースレッドからは DB に触れない。
+
+送信処理そのもの (``annotate_fn``) は注入するため、実 provider を使わずに
+偽の provider 関数でテストできる。
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from lorairo.utils.log import logger
+
+if TYPE_CHECKING:
+    from image_annotator_lib import PHashAnnotationResults
+
+    from lorairo.services.model_throughput_stats import ModelThroughputStats
+
+# annotate_fn(image_paths=..., litellm_model_ids=..., phash_list=...) の形 (AnnotationRunner 互換)
+AnnotateFn = Callable[..., "PHashAnnotationResults"]
+
+DEFAULT_PROVIDER_KEY = "default"
+# キャンセル確認のための待機ポーリング間隔 (秒)
+_WAIT_POLL_SECONDS = 0.1
+_THROTTLE_MESSAGE_PATTERN = re.compile(r"\b429\b|rate[ _-]?limit|too many requests|quota", re.IGNORECASE)
+_RETRYABLE_CLASS_NAMES = ("RateLimit", "Timeout", "APIConnection", "ServiceUnavailable", "InternalServer")
+# チャンクサイズ自動選択時の 1 リクエストあたりの目標所要秒数と画像数の上限
+AUTO_CHUNK_TARGET_SECONDS = 30.0
+AUTO_CHUNK_MAX_SIZE = 16
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """provider 1 つぶんのレート制限と同時実行数の設定。
+
+    Attributes:
+        requests_per_minute: 1 分あたりの最大リクエスト数 (契約クォータ)。
+        max_concurrency: 同時実行数の上限 (= provider 用スレッドプールのサイズ)。
+        initial_concurrency: 開始時の同時実行数。None なら上限の半分から始める。
+        burst: トークンバケットの容量。None なら max_concurrency。
+    """
+
+    requests_per_minute: float = 60.0
+    max_concurrency: int = 4
+    initial_concurrency: int | None = None
+    burst: int | None = None
+
+    @classmethod
+    def from_mapping(
+        cls, values: Mapping[str, Any], fallback: ProviderLimits | None = None
+    ) -> ProviderLimits:
+        """設定ファイルの辞書から生成する。不正値は fallback (既定値) を使う。"""
+        base = fallback or cls()
+
+        def _number(key: str, default: float | int | None, cast: type) -> Any:
+            value = values.get(key, default)
+            if isinstance(value, bool) or not isinstance(value, int | float) or value <= 0:
+                return default
+            return cast(value)
+
+        return cls(
+            requests_per_minute=_number("requests_per_minute", base.requests_per_minute, float),
+            max_concurrency=_number("max_concurrency", base.max_concurrency, int),
+            initial_concurrency=_number("initial_concurrency", base.initial_concurrency, int),
+            burst=_number("burst", base.burst, int),
+        )
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """一時エラーの再試行方針 (指数バックオフ + ジッタ)。
+
+    Attributes:
+        max_attempts: 1 リクエストの最大試行回数 (初回を含む)。
+        base_delay: 初回再試行までの待機秒数。以後 2 倍ずつ伸ばす。
+        max_delay: 待機秒数の上限 (Retry-After もこの値で頭打ちにする)。
+        jitter: 待機秒数に加える乱数の割合 (0.1 なら最大 +10%)。
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: float = 0.1
+
+    def delay_for(self, attempt: int, retry_after: float | None = None) -> float:
+        """``attempt`` 回目の失敗後の待機秒数を返す。
+
+        provider が Retry-After を返した場合はその値を優先する。
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_delay)
+        delay = min(self.max_delay, self.base_delay * (2.0 ** max(attempt - 1, 0)))
+        return delay * (1.0 + random.uniform(0.0, self.jitter))
+
+
+class ErrorClassification(NamedTuple):
+    """送信エラーの分類結果。"""
+
+    retryable: bool
+    throttled: bool
+    retry_after: float | None
+
+
+def _status_code_of(exc: BaseException) -> int | None:
+    for candidate in (exc, getattr(exc, "response", None)):
+        status = getattr(candidate, "status_code", None)
+        if isinstance(status, int) and not isinstance(status, bool):
+            return status
+    return None
+
+
+def _retry_after_of(exc: BaseException) -> float | None:
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if isinstance(headers, Mapping):
+            value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        # HTTP-date 形式の Retry-After は扱わず、通常のバックオフに任せる
+        return None
+
+
+def classify_error(exc: BaseException) -> ErrorClassification:
+    """送信時の例外を再試行可否・スロットリング有無に分類する。
+
+    litellm / provider SDK の例外型に依存しないよう、HTTP ステータス
+    (``status_code`` / ``response.status_code``)、例外クラス名、メッセージの順に判定する。
+    """
+    retry_after = _retry_after_of(exc)
+    status = _status_code_of(exc)
+    if status is not None:
+        if status == 429:
+            return ErrorClassification(True, True, retry_after)
+        if status in (408, 409) or status >= 500:
+            return ErrorClassification(True, False, retry_after)
+        return ErrorClassification(False, False, None)
+
+    class_names = [cls.__name__ for cls in type(exc).__mro__]
+    if any("RateLimit" in name for name in class_names):
+        return ErrorClassification(True, True, retry_after)
+    if any(marker in name for name in class_names for marker in _RETRYABLE_CLASS_NAMES):
+        return ErrorClassification(True, False, retry_after)
+    if isinstance(exc, TimeoutError | ConnectionError):
+        return ErrorClassification(True, False, retry_after)
+    if _THROTTLE_MESSAGE_PATTERN.search(str(exc)):
+        return ErrorClassification(True, True, retry_after)
+    return ErrorClassification(False, False, None)
+
+
+def is_throttled_result_error(error: Any) -> bool:
+    """``UnifiedResult.error`` の文字列がレート制限由来かを判定する。
+
+    image-annotator-lib は provider エラーを例外でなく結果の ``error`` に格納する
+    ことがあるため、結果側でも 429 を検出して再試行対象にする。
+    """
+    return bool(error) and bool(_THROTTLE_MESSAGE_PATTERN.search(str(error)))
+
+
+def _result_error(result: Any) -> Any:
+    """UnifiedResult (属性) / dict どちらの形でも ``error`` を取り出す。"""
+    if isinstance(result, Mapping):
+        return result.get("error")
+    return getattr(result, "error", None)
+
+
+class TokenBucket:
+    """スレッドセーフなトークンバケット (requests/秒 で補充)。
+
+    429 の Retry-After を受けたときは :meth:`pause` で provider 全体の送信を止める。
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self.capacity = max(float(capacity), 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._paused_until = 0.0
+
+    def try_acquire(self) -> float:
+        """トークンを 1 つ取得する。取得できれば 0、できなければ必要な待機秒数を返す。"""
+        with self._lock:
+            now = self._clock()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second
+            )
+            self._updated_at = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate_per_second
+
+    def acquire(self, is_canceled: Callable[[], bool] | None = None) -> bool:
+        """トークンが得られるまで待つ。キャンセルされた場合は False を返す。"""
+        while True:
+            if is_canceled is not None and is_canceled():
+                return False
+            wait_seconds = self.try_acquire()
+            if wait_seconds <= 0:
+                return True
+            self._sleep(min(wait_seconds, _WAIT_POLL_SECONDS) if is_canceled else wait_seconds)
+
+    def pause(self, seconds: float) -> None:
+        """``seconds`` 秒間トークンの払い出しを止め、バーストも使い切った扱いにする。"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + max(seconds, 0.0))
+            self._tokens = 0.0
+            self._updated_at = self._paused_until
+
+
+class AimdConcurrency:
+    """AIMD (Additive Increase / Multiplicative Decrease) による同時実行数の制御。
+
+    成功が現在の上限回数ぶん続くごとに上限を +1 し、スロットリング (429) を受けたら
+    半分にする。同時に飛んでいたリクエストが一斉に 429 を返しても 1 回の減少で
+    済むよう、減少後 ``decrease_cooldown`` 秒間は追加の減少を行わない。
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        minimum: int = 1,
+        maximum: int,
+        decrease_cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self._limit = min(max(initial, self.minimum), self.maximum)
+        self._decrease_cooldown = decrease_cooldown
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease_at: float | None = None
+
+    @property
+    def limit(self) -> int:
+        """現在の同時実行数の上限。"""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """実行中のリクエスト数。"""
+        return self._in_flight
+
+    def acquire(self, is_canceled: Callable[[], bool] | None = None) -> bool:
+        """実行枠を 1 つ確保する。キャンセルされた場合は False を返す。"""
+        with self._condition:
+            while self._in_flight >= self._limit:
+                if is_canceled is not None and is_canceled():
+                    return False
+                self._condition.wait(_WAIT_POLL_SECONDS)
+            if is_canceled is not None and is_canceled():
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """実行枠を返却する。"""
+        with self._condition:
+            self._in_flight = max(self._in_flight - 1, 0)
+            self._condition.notify()
+
+    def on_success(self) -> None:
+        """成功を記録し、上限回数ぶん成功が続いたら上限を 1 増やす。"""
+        with self._condition:
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < self.maximum:
+                self._limit += 1
+                self._successes = 0
+                self._condition.notify()
+
+    def on_throttle(self) -> None:
+        """スロットリングを記録し、上限を半分にする (クールダウン中は据え置き)。"""
+        with self._condition:
+            now = self._clock()
+            self._successes = 0
+            if (
+                self._last_decrease_at is not None
+                and now - self._last_decrease_at < self._decrease_cooldown
+            ):
+                return
+            self._last_decrease_at = now
+            self._limit = max(self.minimum, self._limit // 2)
+
+
+@dataclass(frozen=True)
+class DispatchRequest:
+    """1 回の送信単位 (1 モデル × 画像チャンク)。
+
+    Attributes:
+        model_id: 送信先モデルの ``litellm_model_id``。
+        provider: レート制限を適用する provider 名。
+        image_paths: 対象画像パス。
+        phash_list: 画像パスと同順の pHash。None ならライブラリ側で計算する。
+    """
+
+    model_id: str
+    provider: str
+    image_paths: tuple[str, ...]
+    phash_list: tuple[str, ...] | None = None
+
+
+@dataclass
+class DispatchOutcome:
+    """1 リクエストの最終結果 (再試行後)。
+
+    Attributes:
+        request: 対象リクエスト。
+        results: 成功時のアノテーション結果。
+        error: 再試行を使い切った / 再試行不能だった場合の最後の例外。
+        attempts: 試行回数。
+        canceled: キャンセルにより送信 / 再試行を打ち切ったか。
+    """
+
+    request: DispatchRequest
+    results: PHashAnnotationResults | None = None
+    error: Exception | None = None
+    attempts: int = 0
+    canceled: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        """結果を得られたか。"""
+        return self.error is None and self.results is not None
+
+
+@dataclass
+class ProviderStats:
+    """provider 別の送信統計。"""
+
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    throttled: int = 0
+    failures: int = 0
+    final_concurrency: int = 0
+
+
+@dataclass
+class DispatchReport:
+    """ディスパッチ全体の結果概要。"""
+
+    total_requests: int = 0
+    completed_requests: int = 0
+    canceled: bool = False
+    provider_stats: dict[str, ProviderStats] = field(default_factory=dict)
+
+
+class _ThrottledResultError(Exception):
+    """結果の error に 429 相当が入っていた場合の再試行用内部例外。"""
+
+
+class _ProviderLane:
+    """provider 1 つぶんのレート制限・同時実行制御・統計。"""
+
+    def __init__(
+        self,
+        name: str,
+        limits: ProviderLimits,
+        *,
+        clock: Callable[[], float],
+        sleep: Callable[[float], None],
+    ) -> None:
+        self.name = name
+        self.limits = limits
+        maximum = max(limits.max_concurrency, 1)
+        initial = limits.initial_concurrency or max(maximum // 2, 1)
+        self.bucket = TokenBucket(
+            limits.requests_per_minute / 60.0,
+            limits.burst or maximum,
+            clock=clock,
+            sleep=sleep,
+        )
+        self.concurrency = AimdConcurrency(initial, maximum=maximum, clock=clock)
+        self.stats = ProviderStats()
+        self._stats_lock = threading.Lock()
+
+    def add_stats(self, **increments: int) -> None:
+        with self._stats_lock:
+            for name, value in increments.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+
+class ConcurrentAnnotationDispatcher:
+    """(モデル × 画像チャンク) のリクエストを provider 別に並列送信する。
+
+    Example:
+        >>> dispatcher = ConcurrentAnnotationDispatcher(runner.execute_annotation, limits)
+        >>> requests = build_dispatch_requests(paths, {"gpt-4o": "openai"}, chunk_size=4)
+        >>> report = dispatcher.dispatch(requests, on_result=save_chunk)
+    """
+
+    def __init__(
+        self,
+        annotate_fn: AnnotateFn,
+        provider_limits: Mapping[str, ProviderLimits] | None = None,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Args:
+            annotate_fn: ``image_paths`` / ``litellm_model_ids`` / ``phash_list`` キーワードを受け取り
+                PHashAnnotationResults を返す送信関数 (``AnnotationRunner.execute_annotation`` 等)。
+            provider_limits: provider 名 → 制限。未登録 provider は ``"default"`` キーの値を使う。
+            retry_policy: 再試行方針。
+            clock: 単調増加時計 (テスト用に差し替え可能)。
+            sleep: 待機関数 (テスト用に差し替え可能)。
+        """
+        self._annotate_fn = annotate_fn
+        self._provider_limits = dict(provider_limits or {})
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._clock = clock
+        self._sleep = sleep
+        self._lanes: dict[str, _ProviderLane] = {}
+        self._canceled = threading.Event()
+        self._is_canceled_external: Callable[[], bool] | None = None
+
+    def limits_for(self, provider: str) -> ProviderLimits:
+        """provider に適用する制限を返す。"""
+        key = provider.strip().lower()
+        return (
+            self._provider_limits.get(key)
+            or self._provider_limits.get(DEFAULT_PROVIDER_KEY)
+            or ProviderLimits()
+        )
+
+    def cancel(self) -> None:
+        """未送信リクエストの送信を止める (送信中のリクエストは完了を待つ)。"""
+        self._canceled.set()
+
+    def _is_canceled(self) -> bool:
+        if self._canceled.is_set():
+            return True
+        if self._is_canceled_external is not None and self._is_canceled_external():
+            self._canceled.set()
+            return True
+        return False
+
+    def _lane(self, provider: str) -> _ProviderLane:
+        key = provider.strip().lower() or DEFAULT_PROVIDER_KEY
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = _ProviderLane(key, self.limits_for(key), clock=self._clock, sleep=self._sleep)
+            self._lanes[key] = lane
+        return lane
+
+    def dispatch(
+        self,
+        requests: Iterable[DispatchRequest],
+        *,
+        on_result: Callable[[DispatchOutcome], None] | None = None,
+        is_canceled: Callable[[], bool] | None = None,
+    ) -> DispatchReport:
+        """リクエストを並列送信し、完了順に ``on_result`` を呼ぶ。
+
+        ``on_result`` は本メソッドを呼んだスレッド上で実行される (DB 保存を安全に行える)。
+        キャンセル時は未送信リクエストを破棄し、送信中のものの完了を待ってから返る。
+
+        Args:
+            requests: 送信リクエスト。
+            on_result: 完了したリクエストごとのコールバック。
+            is_canceled: キャンセル要求を返す関数 (ワーカーのキャンセル状態等)。
+
+        Returns:
+            DispatchReport: 件数と provider 別統計。
+        """
+        request_list = list(requests)
+        self._canceled.clear()
+        self._is_canceled_external = is_canceled
+        report = DispatchReport(total_requests=len(request_list))
+        self._reset_stats()
+
+        executors: dict[str, ThreadPoolExecutor] = {}
+        try:
+            pending = {self._submit(executors, request) for request in request_list}
+            while pending:
+                done, pending = wait(pending, timeout=_WAIT_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled() or future.result().canceled:
+                        # キャンセルで送信 / 再試行を打ち切ったリクエストは通知しない
+                        continue
+                    report.completed_requests += 1
+                    if on_result is not None:
+                        on_result(future.result())
+                if self._is_canceled():
+                    for future in pending:
+                        future.cancel()
+        except BaseException:
+            # コールバック失敗等: 未送信分を止めてから送出する
+            self._canceled.set()
+            raise
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+            self._is_canceled_external = None
+
+        report.canceled = self._canceled.is_set()
+        report.provider_stats = self._collect_stats()
+        self._log_report(report)
+        return report
+
+    def _reset_stats(self) -> None:
+        # AIMD の上限は前回の実行から引き継ぎ、統計だけを実行単位でリセットする
+        for lane in self._lanes.values():
+            lane.stats = ProviderStats()
+
+    def _collect_stats(self) -> dict[str, ProviderStats]:
+        for lane in self._lanes.values():
+            lane.stats.final_concurrency = lane.concurrency.limit
+        return {name: lane.stats for name, lane in self._lanes.items()}
+
+    def _submit(
+        self, executors: dict[str, ThreadPoolExecutor], request: DispatchRequest
+    ) -> Future[DispatchOutcome]:
+        """provider 別のスレッドプールへリクエストを投入する。"""
+        lane = self._lane(request.provider)
+        executor = executors.get(lane.name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=lane.concurrency.maximum, thread_name_prefix=f"annotate-{lane.name}"
+            )
+            executors[lane.name] = executor
+        return executor.submit(self._run_request, lane, request)
+
+    @staticmethod
+    def _log_report(report: DispatchReport) -> None:
+        logger.info(
+            f"WebAPI 並列ディスパッチ完了: {report.completed_requests}/{report.total_requests}件"
+            + (" (キャンセル)" if report.canceled else "")
+            + "".join(
+                f", {name}: retries={stats.retries} throttled={stats.throttled} "
+                f"failures={stats.failures} concurrency={stats.final_concurrency}"
+                for name, stats in report.provider_stats.items()
+            )
+        )
+
+    def _run_request(self, lane: _ProviderLane, request: DispatchRequest) -> DispatchOutcome:
+        """1 リクエストを再試行込みで実行する (プールスレッド上)。"""
+        outcome = DispatchOutcome(request=request)
+        lane.add_stats(requests=1)
+        while outcome.attempts < self._retry_policy.max_attempts:
+            if not lane.concurrency.acquire(self._is_canceled):
+                outcome.canceled = True
+                break
+            error: Exception | None = None
+            try:
+                if not lane.bucket.acquire(self._is_canceled):
+                    outcome.canceled = True
+                    break
+                outcome.attempts += 1
+                lane.add_stats(attempts=1)
+                results = self._annotate_fn(
+                    image_paths=list(request.image_paths),
+                    litellm_model_ids=[request.model_id],
+                    phash_list=list(request.phash_list) if request.phash_list is not None else None,
+                )
+                if self._all_results_throttled(results, request.model_id):
+                    raise _ThrottledResultError(f"{request.model_id}: provider rate limit (result error)")
+            except Exception as exc:
+                error = exc
+            finally:
+                # バックオフ待機中は実行枠を占有しない
+                lane.concurrency.release()
+
+            if error is None:
+                lane.concurrency.on_success()
+                outcome.results = results
+                outcome.error = None
+                return outcome
+            outcome.error = error
+            if not self._handle_failure(lane, outcome, error):
+                break
+
+        if outcome.canceled:
+            return outcome
+        lane.add_stats(failures=1)
+        logger.warning(
+            f"WebAPI リクエスト失敗: model={request.model_id}, images={len(request.image_paths)}, "
+            f"attempts={outcome.attempts}: {outcome.error}"
+        )
+        return outcome
+
+    def _handle_failure(self, lane: _ProviderLane, outcome: DispatchOutcome, exc: Exception) -> bool:
+        """失敗を記録し、再試行する場合は待機して True を返す。"""
+        if isinstance(exc, _ThrottledResultError):
+            classification = ErrorClassification(True, True, None)
+        else:
+            classification = classify_error(exc)
+        if classification.throttled:
+            lane.add_stats(throttled=1)
+            lane.concurrency.on_throttle()
+        if not classification.retryable or outcome.attempts >= self._retry_policy.max_attempts:
+            return False
+
+        delay = self._retry_policy.delay_for(outcome.attempts, classification.retry_after)
+        if classification.throttled:
+            # 429 は provider 全体のクォータ超過なので、同 provider の他リクエストも止める
+            lane.bucket.pause(delay)
+        lane.add_stats(retries=1)
+        logger.debug(
+            f"WebAPI リクエスト再試行: model={outcome.request.model_id}, attempt={outcome.attempts}, "
+            f"wait={delay:.2f}s, throttled={classification.throttled}: {exc}"
+        )
+        deadline = self._clock() + delay
+        while not self._is_canceled():
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                return True
+            self._sleep(min(remaining, _WAIT_POLL_SECONDS))
+        outcome.canceled = True
+        return False
+
+    @staticmethod
+    def _all_results_throttled(results: PHashAnnotationResults, model_id: str) -> bool:
+        errors = [
+            _result_error(annotations[model_id])
+            for annotations in results.values()
+            if model_id in annotations
+        ]
+        return bool(errors) and all(is_throttled_result_error(error) for error in errors)
+
+
+def build_dispatch_requests(
+    image_paths: Sequence[str],
+    model_providers: Mapping[str, str],
+    *,
+    chunk_size: int,
+    phash_list: Sequence[str] | None = None,
+) -> list[DispatchRequest]:
+    """(モデル × 画像チャンク) のリクエスト列を作る。
+
+    同じ画像チャンクの全モデルが近いタイミングで完了するよう、チャンク優先の順で並べる。
+
+    Args:
+        image_paths: 対象画像パス。
+        model_providers: ``litellm_model_id`` → provider 名。
+        chunk_size: 1 リクエストあたりの画像数。
+        phash_list: 画像パスと同順の pHash (省略時はライブラリ側で計算)。
+
+    Returns:
+        送信順のリクエストリスト。
+    """
+    size = max(chunk_size, 1)
+    requests: list[DispatchRequest] = []
+    for start in range(0, len(image_paths), size):
+        paths = tuple(image_paths[start : start + size])
+        phashes = tuple(phash_list[start : start + size]) if phash_list is not None else None
+        for model_id, provider in model_providers.items():
+            requests.append(DispatchRequest(model_id, provider, paths, phashes))
+    return requests
+
+
+@dataclass(frozen=True)
+class WebApiDispatchSettings:
+    """設定ファイル ``[annotation]`` セクションの並列ディスパッチ設定。
+
+    Attributes:
+        enabled: WebAPI モデルを並列ディスパッチするか (既定は無効 = 従来の一括呼び出し)。
+        chunk_size: 1 リクエストあたりの画像数 (自動選択時は未計測モデルの既定値)。
+        auto_chunk_size: 実測スループットからチャンクサイズを選ぶか (``webapi_chunk_size = 0``)。
+        retry_policy: 再試行方針。
+        provider_limits: provider 名 → 制限 (``"default"`` は未登録 provider 用)。
+    """
+
+    enabled: bool = False
+    chunk_size: int = 4
+    auto_chunk_size: bool = False
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    provider_limits: dict[str, ProviderLimits] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config_service: Any) -> WebApiDispatchSettings:
+        """ConfigurationService から読み込む。型が不正な値は既定値に置き換える。"""
+
+        def _get(key: str, default: Any) -> Any:
+            try:
+                return config_service.get_setting("annotation", key, default)
+            except Exception:
+                return default
+
+        enabled = _get("concurrent_webapi", False) is True
+        chunk_size = _get("webapi_chunk_size", cls.chunk_size)
+        auto_chunk_size = chunk_size == 0 and not isinstance(chunk_size, bool)
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size <= 0:
+            chunk_size = cls.chunk_size
+        max_attempts = _get("webapi_max_attempts", RetryPolicy.max_attempts)
+        if isinstance(max_attempts, bool) or not isinstance(max_attempts, int) or max_attempts <= 0:
+            max_attempts = RetryPolicy.max_attempts
+
+        limits: dict[str, ProviderLimits] = {}
+        raw_limits = _get("provider_limits", {})
+        if isinstance(raw_limits, Mapping):
+            default_limits = ProviderLimits()
+            raw_default = raw_limits.get(DEFAULT_PROVIDER_KEY)
+            if isinstance(raw_default, Mapping):
+                default_limits = ProviderLimits.from_mapping(raw_default)
+            limits[DEFAULT_PROVIDER_KEY] = default_limits
+            for name, values in raw_limits.items():
+                if isinstance(name, str) and isinstance(values, Mapping) and name != DEFAULT_PROVIDER_KEY:
+                    limits[name.strip().lower()] = ProviderLimits.from_mapping(values, default_limits)
+
+        return cls(
+            enabled=enabled,
+            chunk_size=chunk_size,
+            auto_chunk_size=auto_chunk_size,
+            retry_policy=RetryPolicy(max_attempts=max_attempts),
+            provider_limits=limits,
+        )
+
+    def resolve_chunk_size(
+        self, model_ids: Iterable[str], throughput_stats: ModelThroughputStats | None
+    ) -> int:
+        """実際に使うチャンクサイズを返す。
+
+        自動選択時は 1 リクエストが :data:`AUTO_CHUNK_TARGET_SECONDS` 前後で終わる枚数を
+        モデルごとに求め、最も小さいものを使う (遅いモデルのリクエストが長引かないように)。
+        未計測のモデルは ``chunk_size`` で見積もる。
+        """
+        if not self.auto_chunk_size or throughput_stats is None:
+            return self.chunk_size
+        sizes = [
+            throughput_stats.recommend_batch_size(
+                [model_id],
+                default=self.chunk_size,
+                maximum=AUTO_CHUNK_MAX_SIZE,
+                target_seconds=AUTO_CHUNK_TARGET_SECONDS,
+            )
+            for model_id in model_ids
+        ]
+        return min(sizes, default=self.chunk_size)
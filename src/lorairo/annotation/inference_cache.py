@@ -0,0 +1,330 @@
+"""アノテーション推論結果の内容アドレス型キャッシュ。
+
+タガー / スコアラー / WebAPI モデルの推論結果 (UnifiedResult) を、画像内容
+``(pHash, ファイルサイズ)``・モデル ID・モデルバージョン・プロンプトハッシュを
+キーに SQLite へ保存する。再登録・プロジェクト間で重複した画像の再アノテーションや、
+クラッシュ後の再実行では推論 / API 呼び出しの代わりにこのキャッシュを引く。
+
+キャッシュはプロジェクト DB とは独立した使い捨てファイルで、壊れていたり
+:data:`INFERENCE_CACHE_VERSION` が異なる場合は作り直す
+(:func:`lorairo.utils.sqlite_cache.open_versioned_cache`)。合計サイズが上限を超えたら
+最後に使われた時刻が古いものから削除する (LRU)。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from lorairo.utils.log import logger
+from lorairo.utils.sqlite_cache import open_versioned_cache
+
+# キャッシュ値の形式 (UnifiedResult の保存方法等) を変えたら上げる。
+# 既存キャッシュは次回オープン時に破棄される。
+# 2: pickle → JSON
+INFERENCE_CACHE_VERSION = 2
+# 既定の合計サイズ上限 (バイト)
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# SELECT ... IN (...) 1 回あたりのキー数 (SQLite の変数上限より十分小さく)
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS inference_results (
+        cache_key TEXT PRIMARY KEY,
+        phash TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        model_id TEXT NOT NULL,
+        model_version TEXT NOT NULL,
+        prompt_hash TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        payload_size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        last_used_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_inference_results_model_id ON inference_results (model_id)",
+    "CREATE INDEX IF NOT EXISTS ix_inference_results_last_used_at ON inference_results (last_used_at)",
+)
+
+_UPSERT = """
+INSERT INTO inference_results (
+    cache_key, phash, file_size, model_id, model_version, prompt_hash,
+    payload, payload_size, created_at, last_used_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(cache_key) DO UPDATE SET
+    payload = excluded.payload,
+    payload_size = excluded.payload_size,
+    created_at = excluded.created_at,
+    last_used_at = excluded.last_used_at
+"""
+
+
+def hash_prompt(prompt: str | None) -> str:
+    """追加プロンプトをキャッシュキー用の短いハッシュにする (未指定は空文字扱い)。"""
+    return hashlib.sha256((prompt or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _dump_json(value: Any) -> str:
+    """推論結果を JSON 文字列にする (pydantic モデルは ``model_dump_json()``)。
+
+    Raises:
+        TypeError / ValueError: JSON にできない値
+    """
+    dump = getattr(value, "model_dump_json", None)
+    if callable(dump):
+        return str(dump())
+    return json.dumps(value, ensure_ascii=False)
+
+
+@dataclass(frozen=True)
+class InferenceCacheKey:
+    """推論結果 1 件 (画像 × モデル) のキャッシュキー。
+
+    Attributes:
+        phash: 画像の pHash。
+        file_size: 画像ファイルのバイト数 (pHash 衝突の別画像を区別する)。
+        model_id: ``litellm_model_id``。
+        model_version: 推論実装のバージョン (image-annotator-lib のバージョン等)。
+        prompt_hash: 追加プロンプトのハッシュ (:func:`hash_prompt`)。
+    """
+
+    phash: str
+    file_size: int
+    model_id: str
+    model_version: str
+    prompt_hash: str
+
+    @property
+    def digest(self) -> str:
+        """主キーとして保存するハッシュ値。"""
+        raw = "\x1f".join(
+            (self.phash, str(self.file_size), self.model_id, self.model_version, self.prompt_hash)
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class InferenceResultCache:
+    """内容アドレス型の推論結果キャッシュ。
+
+    値は JSON で保存する (pydantic モデルの UnifiedResult は ``model_dump_json()``)。
+    読み戻した値は dict になる (保存側・集計側は dict / モデルの両方を受け付ける)。
+    読み戻せない値はミス扱いにして削除する。ワーカースレッドや並列ディスパッチのスレッドからも
+    使えるよう、接続へのアクセスはロックで直列化する。
+
+    Attributes:
+        hits: キャッシュヒット数 (画像 × モデル単位)
+        misses: キャッシュミス数
+        stores: 保存件数
+        evictions: サイズ上限による削除件数
+    """
+
+    def __init__(self, db_path: Path | str, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Args:
+            db_path: キャッシュ DB のパス。``":memory:"`` でプロセス内のみのキャッシュ
+            max_bytes: 保存値の合計サイズ上限 (バイト)
+        """
+        self._db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        return open_versioned_cache(
+            self._db_path, INFERENCE_CACHE_VERSION, _SCHEMA, label="推論結果キャッシュ"
+        )
+
+    def get_many(self, keys: Iterable[InferenceCacheKey]) -> dict[InferenceCacheKey, Any]:
+        """キャッシュ済みの推論結果をまとめて引く。
+
+        Args:
+            keys: 検索するキー
+
+        Returns:
+            ヒットしたキー → 推論結果。ミスしたキーは含まない
+        """
+        by_digest = {key.digest: key for key in keys}
+        if not by_digest:
+            return {}
+        digests = list(by_digest)
+        found: dict[InferenceCacheKey, Any] = {}
+        broken: list[str] = []
+        with self._lock:
+            for start in range(0, len(digests), _LOOKUP_CHUNK):
+                chunk = digests[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT cache_key, payload FROM inference_results WHERE cache_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for digest, payload in rows:
+                    try:
+                        found[by_digest[digest]] = json.loads(payload)
+                    except Exception as e:
+                        logger.debug(f"推論結果キャッシュを読み戻せないため破棄します: {e}")
+                        broken.append(digest)
+            try:
+                with self._conn:
+                    if found:
+                        now = time.time()
+                        self._conn.executemany(
+                            "UPDATE inference_results SET last_used_at = ? WHERE cache_key = ?",
+                            [(now, key.digest) for key in found],
+                        )
+                    if broken:
+                        self._conn.executemany(
+                            "DELETE FROM inference_results WHERE cache_key = ?", [(d,) for d in broken]
+                        )
+            except sqlite3.Error as e:
+                logger.warning(f"推論結果キャッシュの使用時刻更新に失敗しました: {e}")
+            self.hits += len(found)
+            self.misses += len(by_digest) - len(found)
+        return found
+
+    def put_many(self, items: Iterable[tuple[InferenceCacheKey, Any]]) -> int:
+        """推論結果を保存し、サイズ上限を超えた分を古いものから削除する。
+
+        Args:
+            items: (キー, 推論結果) の組。JSON にできない値は保存しない
+
+        Returns:
+            保存した件数
+        """
+        now = time.time()
+        rows = []
+        for key, value in items:
+            try:
+                payload = _dump_json(value)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"推論結果を保存形式に変換できないためキャッシュしません: {key.model_id}, {e}")
+                continue
+            rows.append(
+                (
+                    key.digest,
+                    key.phash,
+                    key.file_size,
+                    key.model_id,
+                    key.model_version,
+                    key.prompt_hash,
+                    payload,
+                    len(payload.encode("utf-8")),
+                    now,
+                    now,
+                )
+            )
+        if not rows:
+            return 0
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(_UPSERT, rows)
+                    evicted = self._evict_over_budget()
+            except sqlite3.Error as e:
+                # キャッシュの書き込み失敗は処理を止めない (次回再推論されるだけ)
+                logger.warning(f"推論結果キャッシュの書き込みに失敗しました: {e}")
+                return 0
+            self.stores += len(rows)
+            self.evictions += evicted
+        if evicted:
+            logger.debug(f"推論結果キャッシュ: サイズ上限超過で {evicted}件を削除")
+        return len(rows)
+
+    def _evict_over_budget(self) -> int:
+        """合計サイズが上限を超えていれば、最終使用時刻の古い順に削除する (ロック保持中に呼ぶ)。"""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(payload_size), 0) FROM inference_results"
+        ).fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return 0
+        victims: list[tuple[str]] = []
+        freed = 0
+        for cache_key, payload_size in self._conn.execute(
+            "SELECT cache_key, payload_size FROM inference_results ORDER BY last_used_at, created_at"
+        ):
+            victims.append((cache_key,))
+            freed += payload_size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM inference_results WHERE cache_key = ?", victims)
+        return len(victims)
+
+    def invalidate(self, *, model_id: str | None = None, phash: str | None = None) -> int:
+        """条件に一致するエントリを削除する。条件を指定しなければ全件削除する。
+
+        Args:
+            model_id: このモデルの結果のみ削除する
+            phash: この画像 (pHash) の結果のみ削除する
+
+        Returns:
+            削除した件数
+        """
+        clauses: list[str] = []
+        params: list[str] = []
+        if model_id is not None:
+            clauses.append("model_id = ?")
+            params.append(model_id)
+        if phash is not None:
+            clauses.append("phash = ?")
+            params.append(phash)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock, self._conn:
+            deleted = self._conn.execute(f"DELETE FROM inference_results{where}", params).rowcount
+        if not clauses:
+            self._vacuum()
+        logger.info(f"推論結果キャッシュを無効化: {deleted}件 (model={model_id}, phash={phash})")
+        return int(deleted)
+
+    def _vacuum(self) -> None:
+        with self._lock:
+            try:
+                self._conn.execute("VACUUM")
+            except sqlite3.Error as e:
+                logger.debug(f"推論結果キャッシュの VACUUM に失敗しました: {e}")
+
+    def close(self) -> None:
+        """接続を閉じる。"""
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        キャッシュの統計情報を取得する。
+
+        Returns:
+            統計情報の辞書 (件数・合計サイズ・上限・モデル別件数・ヒット / ミス数)
+        """
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(payload_size), 0) FROM inference_results"
+            ).fetchone()
+            per_model = dict(
+                self._conn.execute(
+                    "SELECT model_id, COUNT(*) FROM inference_results GROUP BY model_id ORDER BY model_id"
+                ).fetchall()
+            )
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "total_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "models": per_model,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
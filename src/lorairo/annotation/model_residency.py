@@ -0,0 +1,369 @@
+"""ローカル ML モデルの常駐管理 (メモリ予算付き LRU ウォームプール)。
+
+CPU のみの環境では、小さなジョブのレイテンシの大半が ONNX / torch タガーの重み読み込みに
+なる。image-annotator-lib はロード済みモデルをプロセス内で保持できるため、LoRAIro 側で
+「どのモデルが常駐しているか・どれだけメモリを使っているか」を追跡し、CLI のストリーミング
+バッチ間や GUI のアノテーション実行間でモデルを使い回す。
+
+無制限に保持すると長時間のセッションでメモリを食い潰すため、常駐サイズの合計が予算を
+超えたら最後に使われた時刻が古いモデルから解放する。常駐サイズは初回ロード時の
+プロセス RSS の増分で計測し、計測できない場合 (他の推論呼び出しと重なった場合を含む)
+はモデルの推定サイズを使う。
+
+Qt に依存しないため、GUI ワーカー・CLI の両方から :class:`AnnotatorLibraryAdapter`
+経由で利用される。
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib
+import importlib.util
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from lorairo.utils.log import logger
+
+# 推定サイズも計測値も無いモデルを仮に見積もるサイズ (バイト)
+UNKNOWN_MODEL_BYTES = 1024 * 1024 * 1024
+# 予算が未設定 (0) のとき物理メモリのうちモデル常駐に充てる割合
+AUTO_BUDGET_RATIO = 0.5
+# 物理メモリ量を取得できない環境での既定予算 (バイト)
+FALLBACK_BUDGET_BYTES = 4 * 1024 * 1024 * 1024
+
+_MIB = 1024 * 1024
+
+
+def current_rss_bytes() -> int | None:
+    """現在のプロセス常駐メモリ (RSS) をバイトで返す。取得できなければ None。
+
+    psutil がインストールされていればそれを、無ければ Linux の ``/proc/self/statm`` を使う。
+    """
+    if importlib.util.find_spec("psutil") is not None:
+        import psutil
+
+        return int(psutil.Process().memory_info().rss)
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def physical_memory_bytes() -> int | None:
+    """物理メモリ量をバイトで返す。取得できなければ None。"""
+    if importlib.util.find_spec("psutil") is not None:
+        import psutil
+
+        return int(psutil.virtual_memory().total)
+    try:
+        return int(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES"))
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def release_library_model(model_name: str) -> bool:
+    """image-annotator-lib にロード済みモデルの解放を依頼する。
+
+    インストールされているライブラリが公開している解放 API を探して呼び出す
+    (公開 ``release_model`` → ``ModelLoad.release_model`` の順)。どちらも無ければ
+    何もせず False を返す。
+
+    Args:
+        model_name: 解放するモデル名
+
+    Returns:
+        解放 API を呼び出せたら True
+    """
+    release: Callable[[str], Any] | None = None
+    try:
+        image_annotator_lib = importlib.import_module("image_annotator_lib")
+        release = getattr(image_annotator_lib, "release_model", None)
+        if not callable(release):
+            model_factory = importlib.import_module("image_annotator_lib.core.model_factory")
+            release = getattr(getattr(model_factory, "ModelLoad", None), "release_model", None)
+    except ImportError:
+        return False
+    if not callable(release):
+        logger.debug(f"image-annotator-lib にモデル解放 API が無いため解放をスキップ: {model_name}")
+        return False
+    release(model_name)
+    gc.collect()
+    return True
+
+
+def resolve_budget_bytes(budget_mb: Any) -> int:
+    """設定値 (MiB、0 以下 / 未設定は自動) から常駐予算をバイトで求める。"""
+    if isinstance(budget_mb, int | float) and not isinstance(budget_mb, bool) and budget_mb > 0:
+        return int(budget_mb * _MIB)
+    total = physical_memory_bytes()
+    if total is None:
+        return FALLBACK_BUDGET_BYTES
+    return int(total * AUTO_BUDGET_RATIO)
+
+
+@dataclass
+class ResidentModel:
+    """常駐中のモデル 1 件。
+
+    Attributes:
+        model_id: ``litellm_model_id`` (ローカルモデルではライブラリのモデル名と同じ)。
+        size_bytes: 常駐サイズ (計測値、計測できなければ推定値)。
+        measured: size_bytes が RSS の増分から計測した値か。
+        last_used: 最後に使われた時刻 (``clock`` の値)。
+        uses: 使われた回数。
+    """
+
+    model_id: str
+    size_bytes: int
+    measured: bool
+    last_used: float
+    uses: int = 1
+
+
+class ModelResidencyManager:
+    """メモリ予算付きの LRU モデル常駐管理。
+
+    :meth:`use` でローカルモデルの推論呼び出しを囲むと、呼び出し前に予算を空けるため
+    古いモデルを解放し、呼び出し後に新しくロードされたモデルの常駐サイズを記録する。
+    アダプターは複数のワーカースレッドから呼ばれるため、状態はロックで保護する
+    (推論そのものはロックの外で行い、使用中のモデルは参照カウントで解放対象から外す)。
+
+    ライブラリに解放 API が無い場合は、追跡しても解放できないため常駐管理を無効にする。
+
+    Attributes:
+        budget_bytes: 常駐サイズ合計の上限
+        enabled: 常駐管理が有効か (解放 API が無いと分かった時点で False)
+        loads: 新規ロード (非常駐からの使用) 回数
+        warm_hits: 常駐済みモデルの再利用回数
+        evictions: 予算超過による解放回数
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int,
+        *,
+        release_fn: Callable[[str], bool] = release_library_model,
+        rss_fn: Callable[[], int | None] = current_rss_bytes,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            budget_bytes: 常駐サイズ合計の上限 (バイト)
+            release_fn: モデルを解放する関数 (既定はライブラリの解放 API)。
+                解放 API が無ければ False を返す
+            rss_fn: プロセス RSS を返す関数 (テスト用に差し替え可能)
+            clock: 最終使用時刻に使う時計
+        """
+        self.budget_bytes = budget_bytes
+        self.enabled = True
+        self._release_fn = release_fn
+        self._rss_fn = rss_fn
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._resident: dict[str, ResidentModel] = {}
+        # 推論中のモデル → 使用中の呼び出し数 (解放対象から外す)
+        self._in_use: Counter[str] = Counter()
+        # 実行中の呼び出し数と、呼び出し開始の通し番号 (RSS 計測の重なり判定用)
+        self._active_calls = 0
+        self._call_seq = 0
+        self.loads = 0
+        self.warm_hits = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, config_service: Any) -> ModelResidencyManager:
+        """``annotation.local_model_memory_budget_mb`` から生成する。"""
+        budget_mb = config_service.get_setting("annotation", "local_model_memory_budget_mb", 0)
+        budget = resolve_budget_bytes(budget_mb)
+        logger.debug(f"ローカルモデル常駐予算: {budget / _MIB:.0f} MiB")
+        return cls(budget)
+
+    @property
+    def resident_bytes(self) -> int:
+        """常駐サイズの合計。"""
+        with self._lock:
+            return sum(model.size_bytes for model in self._resident.values())
+
+    def is_resident(self, model_id: str) -> bool:
+        """モデルが常駐中か。"""
+        with self._lock:
+            return model_id in self._resident
+
+    @contextmanager
+    def use(
+        self,
+        model_ids: Sequence[str],
+        estimated_sizes: Mapping[str, int | None] | None = None,
+    ) -> Iterator[tuple[str, ...]]:
+        """ローカルモデルを使う推論呼び出しを囲む。
+
+        推論中はロックを保持しない。常駐サイズは RSS の増分で計測するが、他の呼び出しと
+        期間が重なった場合は他スレッドの確保が混ざるため推定サイズを使う。
+
+        Args:
+            model_ids: 呼び出しで使うローカルモデル
+            estimated_sizes: モデル → 推定サイズ (バイト)。計測できないときの見積もりに使う
+
+        Yields:
+            この呼び出しで新規にロードされるモデル (常駐していなかったもの)。
+            常駐管理が無効なら空
+        """
+        if not self.enabled:
+            yield ()
+            return
+        estimates = estimated_sizes or {}
+        unique_ids = tuple(dict.fromkeys(model_ids))
+        with self._lock:
+            new_models = tuple(model_id for model_id in unique_ids if model_id not in self._resident)
+            incoming = sum(self._estimate(model_id, estimates) for model_id in new_models)
+            self._in_use.update(unique_ids)
+            self._evict_until(self.budget_bytes - incoming)
+            isolated = self._active_calls == 0
+            self._active_calls += 1
+            self._call_seq += 1
+            call_seq = self._call_seq
+            rss_before = self._rss_fn() if new_models and isolated else None
+        try:
+            yield new_models
+        finally:
+            with self._lock:
+                self._active_calls -= 1
+                # 実行中に別の呼び出しが始まっていたら RSS の増分は使わない
+                isolated = isolated and self._call_seq == call_seq
+                rss_after = self._rss_fn() if rss_before is not None and isolated else None
+                for model_id in unique_ids:
+                    self._in_use[model_id] -= 1
+                    if self._in_use[model_id] <= 0:
+                        del self._in_use[model_id]
+                self._record_use(unique_ids, new_models, estimates, rss_before, rss_after)
+                # 単体で予算を超えるモデルは保持しない (次の呼び出しで再ロードする)
+                self._evict_until(self.budget_bytes)
+
+    def _estimate(self, model_id: str, estimates: Mapping[str, int | None]) -> int:
+        estimate = estimates.get(model_id)
+        return estimate if estimate and estimate > 0 else UNKNOWN_MODEL_BYTES
+
+    def _record_use(
+        self,
+        model_ids: Sequence[str],
+        new_models: Sequence[str],
+        estimates: Mapping[str, int | None],
+        rss_before: int | None,
+        rss_after: int | None,
+    ) -> None:
+        """使用を記録し、新規ロード分の RSS 増分を推定サイズの比で按分する。"""
+        now = self._clock()
+        # 重なった別の呼び出しが先に記録したモデルは再利用として扱う
+        loaded = [model_id for model_id in new_models if model_id not in self._resident]
+        measured_total = (
+            rss_after - rss_before if rss_before is not None and rss_after is not None else None
+        )
+        estimate_total = sum(self._estimate(model_id, estimates) for model_id in loaded)
+        for model_id in loaded:
+            estimate = self._estimate(model_id, estimates)
+            if measured_total is not None and measured_total > 0:
+                size = int(measured_total * estimate / estimate_total)
+                measured = True
+            else:
+                # RSS が減った (GC 等) / 計測不能 / 他の呼び出しと重なった場合は推定値で代用する
+                size, measured = estimate, False
+            self._resident[model_id] = ResidentModel(model_id, size, measured, now)
+            self.loads += 1
+            logger.debug(
+                f"ローカルモデル常駐: {model_id} {size / _MIB:.0f} MiB ({'計測' if measured else '推定'})"
+            )
+        for model_id in model_ids:
+            if model_id in loaded:
+                continue
+            resident = self._resident.get(model_id)
+            if resident is not None:
+                resident.last_used = now
+                resident.uses += 1
+                self.warm_hits += 1
+
+    def _evict_until(self, limit: int) -> None:
+        """常駐合計が limit 以下になるまで、使用中でないモデルを最終使用時刻が古い順に解放する。"""
+        total = sum(model.size_bytes for model in self._resident.values())
+        if total <= limit:
+            return
+        for model in sorted(self._resident.values(), key=lambda m: m.last_used):
+            if total <= limit or not self.enabled:
+                break
+            if model.model_id in self._in_use:
+                continue
+            if self._release(model):
+                total -= model.size_bytes
+
+    def _release(self, model: ResidentModel) -> bool:
+        """モデルを解放し、解放できたら常駐扱いから外す (ロック保持中に呼ぶ)。"""
+        try:
+            released = self._release_fn(model.model_id)
+        except Exception as e:
+            # 解放に失敗したモデルはロードされたままなので常駐扱いを続ける
+            logger.warning(f"ローカルモデルの解放に失敗しました: {model.model_id}, {e}")
+            return False
+        if not released:
+            # 解放 API が無ければ予算を守れないため、以降は常駐を追跡しない
+            self.enabled = False
+            logger.warning(
+                f"image-annotator-lib にモデル解放 API が無いため常駐管理を無効にします: {model.model_id}"
+            )
+            return False
+        del self._resident[model.model_id]
+        self.evictions += 1
+        logger.info(
+            f"ローカルモデルを解放: {model.model_id} ({model.size_bytes / _MIB:.0f} MiB, "
+            f"予算 {self.budget_bytes / _MIB:.0f} MiB)"
+        )
+        return True
+
+    def evict(self, model_id: str) -> bool:
+        """指定モデルを解放する。常駐していない・解放できなければ False。"""
+        with self._lock:
+            model = self._resident.get(model_id)
+            if model is None or model_id in self._in_use:
+                return False
+            return self._release(model)
+
+    def clear(self) -> None:
+        """使用中でない常駐モデルをすべて解放する。"""
+        with self._lock:
+            for model in list(self._resident.values()):
+                if not self.enabled:
+                    break
+                if model.model_id not in self._in_use:
+                    self._release(model)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        常駐状況の統計情報を取得する。
+
+        Returns:
+            統計情報の辞書 (予算・常駐合計・モデル別サイズ・ロード / 再利用 / 解放回数)
+        """
+        with self._lock:
+            models = {
+                model.model_id: {
+                    "size_bytes": model.size_bytes,
+                    "measured": model.measured,
+                    "uses": model.uses,
+                }
+                for model in sorted(self._resident.values(), key=lambda m: m.last_used, reverse=True)
+            }
+            return {
+                "enabled": self.enabled,
+                "budget_bytes": self.budget_bytes,
+                "resident_bytes": sum(model["size_bytes"] for model in models.values()),
+                "models": models,
+                "loads": self.loads,
+                "warm_hits": self.warm_hits,
+                "evictions": self.evictions,
+            }
@@ -34,28 +34,63 @@ class SidecarAnnotationReader:
             'image_path': str(image_path)
         }
         """
-        existing_annotations = {
+        tag_path = image_path.with_suffix(".txt")
+        caption_path = image_path.with_suffix(".caption")
+
+        try:
+            has_tag = tag_path.exists()
+            has_caption = caption_path.exists()
+        except OSError as e:
+            logger.error(f"アノテーションファイルの確認中にエラーが発生しました: {e}")
+            return None
+
+        if not has_tag and not has_caption:
+            logger.debug(f"既存アノテーション無し: {image_path}")
+            return None
+
+        return self.read_sidecar_files(
+            image_path,
+            tag_path=tag_path if has_tag else None,
+            caption_path=caption_path if has_caption else None,
+        )
+
+    def read_sidecar_files(
+        self,
+        image_path: Path,
+        *,
+        tag_path: Path | None = None,
+        caption_path: Path | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        存在が分かっているサイドカーファイルからタグとキャプションを読み込む。
+
+        ディレクトリ走査 (``FileSystemManager.scan_image_files``) で得たサイドカーを
+        渡すことで、``get_existing_annotations`` の存在確認を省略できる。
+
+        Args:
+            image_path (Path): 画像ファイルのパス
+            tag_path (Path | None): .txt ファイルのパス。無ければ None
+            caption_path (Path | None): .caption ファイルのパス。無ければ None
+
+        Returns:
+            Optional[dict[str, Any]]: ``get_existing_annotations`` と同じ形式の辞書。
+            None : サイドカーが無い、または読み込みに失敗した場合
+        """
+        if tag_path is None and caption_path is None:
+            return None
+
+        existing_annotations: dict[str, Any] = {
             "tags": [],
             "captions": [],
             "image_path": str(image_path),
         }
 
-        tag_path = image_path.with_suffix(".txt")
-        caption_path = image_path.with_suffix(".caption")
-
         try:
-            if tag_path.exists():
-                tags = self._read_annotations(tag_path)
-                existing_annotations["tags"] = tags
-
-            if caption_path.exists():
-                captions = self._read_captions(caption_path)
-                existing_annotations["captions"] = captions
-
-            # Return result even if empty, since files exist
-            if not tag_path.exists() and not caption_path.exists():
-                logger.debug(f"既存アノテーション無し: {image_path}")
-                return None
+            if tag_path is not None:
+                existing_annotations["tags"] = self._read_annotations(tag_path)
+
+            if caption_path is not None:
+                existing_annotations["captions"] = self._read_captions(caption_path)
 
         except Exception as e:
             logger.error(f"アノテーションファイルの読み込み中にエラーが発生しました: {e}")
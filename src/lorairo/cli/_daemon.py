@@ -0,0 +1,464 @@
+"""``lorairo-cli serve`` 常駐デーモンと thin client。
+
+エージェントが ``tags add`` / ``images search`` / ``images show`` のような小さな
+コマンドを数千回呼ぶと、処理時間の大半がプロセス起動 (import / ServiceContainer /
+SQLite 接続 / タグ DB / annotator レジストリ) になる。``serve`` はそれらを保持した
+プロセスを Unix domain socket の背後に常駐させ、コマンドを in-process で実行する。
+
+Wire format (1 接続 = 1 リクエスト、どちらも改行終端の JSON 1 行):
+
+- リクエスト: ``{"argv": [...], "json": true, "cwd": "...", "stdin": "..."}``
+  (``argv`` はプログラム名を除いた引数列、``json`` はクライアント側で解決済みの
+  出力モード、``stdin`` は省略可)。制御用に ``{"op": "ping"}`` / ``{"op": "shutdown"}``。
+- レスポンス: ``{"exit_code": 0, "stdout": "...", "stderr": "...", "elapsed_ms": 1.2}``。
+  ``stdout`` は通常実行と同一の ADR 0057 JSONL (item / result / error 行) そのもの。
+
+リクエストは 1 件ずつ直列に処理する (``sys.stdout`` / cwd / ServiceContainer は
+プロセス全体で共有されるため)。``--project`` を伴わないリクエストの前には
+アクティブプロジェクトを解除し、前のリクエストのプロジェクト DB が漏れないようにする。
+一定時間リクエストが無ければ自動終了する。
+
+thin client は env ``LORAIRO_CLI_DAEMON`` で opt-in する。JSON モードのコマンドだけを
+転送し、デーモンに接続できなければ通常どおり in-process で実行する。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from lorairo.utils.log import logger
+
+if TYPE_CHECKING:
+    _UnixServerBase = socketserver.UnixStreamServer
+else:
+    # Windows の CPython には UnixStreamServer が無い (serve は supports_unix_sockets で弾く)
+    _UnixServerBase = getattr(socketserver, "UnixStreamServer", socketserver.TCPServer)
+
+DAEMON_ENV_VAR = "LORAIRO_CLI_DAEMON"
+
+_TRUTHY_ENV = frozenset({"1", "true", "yes", "on"})
+# デーモン経由で実行しないトップレベルコマンド (デーモン自身の制御・子プロセス計測)
+_LOCAL_ONLY_COMMANDS = frozenset({"serve", "debug"})
+_PROJECT_OPTIONS = ("--project", "-p")
+# 値を取る root オプション (サブコマンド名の判定で値をスキップする)
+_ROOT_VALUE_OPTIONS = frozenset({"--log-level"})
+_CONNECT_TIMEOUT_S = 0.5
+# 接続ごとのソケット読み書きタイムアウト。リクエストは接続直後に 1 行で届くため、
+# これを超えて止まっている (停止・半開きの) クライアントは切断して後続を処理する。
+_REQUEST_IO_TIMEOUT_S = 10.0
+
+# リクエストを実行する関数: (argv, json_mode) -> exit code
+Runner = Callable[[list[str], bool], int]
+
+
+class DaemonUnavailableError(RuntimeError):
+    """デーモンに接続できない (未起動・非対応プラットフォーム・安全でない socket ディレクトリ)。"""
+
+
+class InsecureSocketDirectoryError(PermissionError):
+    """socket の親ディレクトリが自分専用 (自分の所有・0700・非シンボリックリンク) でない。"""
+
+
+def supports_unix_sockets() -> bool:
+    """このプラットフォームで Unix domain socket が使えるか。"""
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> Path:
+    """ユーザー単位のデフォルト socket パスを返す。
+
+    ``$XDG_RUNTIME_DIR`` (ログインユーザー専用の 0700 ディレクトリ) があればその下、
+    無ければ temp ディレクトリ下のユーザー専用ディレクトリ (``lorairo-<uid>``) を使う。
+    temp 下のディレクトリは他ユーザーが先に作れるため、bind / connect の前に
+    :func:`check_socket_directory` で所有者と権限を確認する。
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "lorairo" / "cli.sock"
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"lorairo-{uid}" / "cli.sock"
+
+
+def resolve_client_socket(env: dict[str, str] | None = None) -> Path | None:
+    """env ``LORAIRO_CLI_DAEMON`` から転送先 socket を解決する。
+
+    ``1`` / ``true`` 等ならデフォルトパス、それ以外の非空値は socket パスとして扱う。
+
+    Returns:
+        転送先 socket パス。opt-in されていなければ ``None``。
+    """
+    value = (os.environ if env is None else env).get(DAEMON_ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in _TRUTHY_ENV:
+        return default_socket_path()
+    return Path(value).expanduser()
+
+
+def requested_project(argv: Sequence[str]) -> str | None:
+    """argv の ``--project`` / ``-p`` の値を返す (無ければ ``None``)。"""
+    for index, token in enumerate(argv):
+        if token == "--":
+            break
+        for option in _PROJECT_OPTIONS:
+            if token == option and index + 1 < len(argv):
+                return argv[index + 1]
+            if token.startswith(f"{option}="):
+                return token.partition("=")[2]
+    return None
+
+
+def should_forward(argv: Sequence[str], json_mode: bool) -> bool:
+    """thin client がデーモンへ転送すべきリクエストか。
+
+    転送するのは JSON モードのコマンド実行だけ。rich 出力 (TTY 装飾・対話 confirm) と
+    ``serve`` / ``debug`` は in-process で実行する。
+    """
+    if not json_mode:
+        return False
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _ROOT_VALUE_OPTIONS:
+            next(tokens, None)
+        elif not token.startswith("-"):
+            return token not in _LOCAL_ONLY_COMMANDS
+    return False
+
+
+def check_socket_directory(directory: Path) -> None:
+    """socket の親ディレクトリが自分専用であることを確認する。
+
+    ``lstat`` で、シンボリックリンクでない・ディレクトリである・所有者が自分・
+    group / other の権限が無い (``mode & 0o077 == 0``) ことを要求する。他ユーザーが
+    用意したディレクトリに bind / connect すると、socket の差し替えでコマンドや
+    出力を横取りされ得るため。uid を持たないプラットフォームでは所有者と権限は確認しない。
+
+    Raises:
+        InsecureSocketDirectoryError: 条件を満たさない場合
+        FileNotFoundError: ディレクトリが存在しない場合
+    """
+    info = os.lstat(directory)
+    if stat.S_ISLNK(info.st_mode):
+        raise InsecureSocketDirectoryError(f"Socket directory is a symlink: {directory}")
+    if not stat.S_ISDIR(info.st_mode):
+        raise InsecureSocketDirectoryError(f"Socket directory is not a directory: {directory}")
+    if not hasattr(os, "getuid"):
+        return
+    if info.st_uid != os.getuid():
+        raise InsecureSocketDirectoryError(
+            f"Socket directory is owned by uid {info.st_uid}, not by the current user: {directory}"
+        )
+    if info.st_mode & 0o077:
+        raise InsecureSocketDirectoryError(
+            f"Socket directory is accessible by other users (mode {stat.S_IMODE(info.st_mode):o}): "
+            f"{directory}; run chmod 700 on it"
+        )
+
+
+@contextlib.contextmanager
+def _private_umask() -> Iterator[None]:
+    """作成するファイル (bind 時の socket) を自分だけが読み書きできる権限で作らせる。"""
+    saved = os.umask(0o077)
+    try:
+        yield
+    finally:
+        os.umask(saved)
+
+
+# ===== client =====
+
+
+def send_request(
+    socket_path: Path, request: dict[str, Any], *, timeout: float | None = None
+) -> dict[str, Any]:
+    """デーモンにリクエストを 1 件送り、レスポンスを返す。
+
+    Args:
+        socket_path: デーモンの socket パス
+        request: リクエスト JSON
+        timeout: レスポンス待ちのタイムアウト (秒、``None`` は無制限)
+
+    Returns:
+        レスポンス JSON
+
+    Raises:
+        DaemonUnavailableError: 接続できない場合 (socket ディレクトリが自分専用でない場合を含む。
+            リクエストは送信されていない)
+        ConnectionError: 送信後に接続が切れた場合
+    """
+    if not supports_unix_sockets():
+        raise DaemonUnavailableError("Unix domain sockets are not supported on this platform")
+    try:
+        check_socket_directory(socket_path.parent)
+    except OSError as exc:
+        raise DaemonUnavailableError(f"Refusing to connect to {socket_path}: {exc}") from exc
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT_S)
+        try:
+            sock.connect(str(socket_path))
+        except OSError as exc:
+            raise DaemonUnavailableError(f"No daemon listening on {socket_path}: {exc}") from exc
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    finally:
+        sock.close()
+    if not line:
+        raise ConnectionError(f"Daemon at {socket_path} closed the connection without a response")
+    response: dict[str, Any] = json.loads(line)
+    return response
+
+
+def forward(argv: Sequence[str], json_mode: bool, socket_path: Path) -> int | None:
+    """コマンドをデーモンで実行し、出力を自プロセスの stdout / stderr に書き出す。
+
+    Args:
+        argv: プログラム名を除いた引数列
+        json_mode: 解決済みの出力モード
+        socket_path: デーモンの socket パス
+
+    Returns:
+        デーモン側の exit code。デーモンが居なければ ``None`` (呼び出し側が
+        in-process で実行する)。
+    """
+    request: dict[str, Any] = {"argv": list(argv), "json": json_mode, "cwd": os.getcwd()}
+    if "-" in argv:
+        # ``--query -`` 等の stdin 入力はクライアントで読んで同梱する
+        request["stdin"] = sys.stdin.read()
+    try:
+        response = send_request(socket_path, request)
+    except DaemonUnavailableError:
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stderr.flush()
+    return int(response.get("exit_code", 1))
+
+
+# ===== server =====
+
+
+class _StreamSwitch:
+    """書き込み先を差し替えられる stdout / stderr のプロキシ。
+
+    デーモン稼働中は ``sys.stdout`` / ``sys.stderr`` をこのオブジェクトに固定し、
+    リクエストごとに書き込み先だけを差し替える。``sys.stderr`` の同一性が保たれるため、
+    ``_configure`` はリクエストごとにログシンクを作り直さずに済む。
+    """
+
+    def __init__(self, target: Any) -> None:
+        self.target = target
+
+    def write(self, text: str) -> int:
+        written: int = self.target.write(text)
+        return written
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.target, name)
+
+
+@contextlib.contextmanager
+def _captured_stdio(stdin_text: str) -> Iterator[tuple[io.StringIO, io.StringIO]]:
+    """1 リクエストの間 stdio の書き込み先を差し替える (rich Console / print / loguru が対象)。"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    switches = [stream for stream in (sys.stdout, sys.stderr) if isinstance(stream, _StreamSwitch)]
+    if len(switches) != 2:
+        # serve_until_idle の外 (テスト等) では stdio オブジェクトごと差し替える
+        saved = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin, sys.stdout, sys.stderr = io.StringIO(stdin_text), stdout, stderr
+        try:
+            yield stdout, stderr
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = saved
+        return
+
+    out_switch, err_switch = switches
+    saved_targets = out_switch.target, err_switch.target
+    saved_stdin = sys.stdin
+    out_switch.target, err_switch.target = stdout, stderr
+    sys.stdin = io.StringIO(stdin_text)
+    try:
+        yield stdout, stderr
+    finally:
+        out_switch.target, err_switch.target = saved_targets
+        sys.stdin = saved_stdin
+
+
+@contextlib.contextmanager
+def _working_directory(cwd: str | None) -> Iterator[None]:
+    """クライアントの cwd で相対パス引数を解決させる。"""
+    if not cwd:
+        yield
+        return
+    saved = os.getcwd()
+    os.chdir(cwd)
+    try:
+        yield
+    finally:
+        os.chdir(saved)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: CliDaemonServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.connection.settimeout(self.server.request_timeout)
+
+    def handle(self) -> None:
+        try:
+            line = self.rfile.readline()
+        except TimeoutError:
+            logger.warning(
+                f"CLI daemon client sent no request within {self.server.request_timeout}s, closing connection"
+            )
+            return
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            response = self.server.dispatch(request)
+        except ValueError as exc:
+            response = {"exit_code": 2, "stdout": "", "stderr": f"Invalid daemon request: {exc}\n"}
+        try:
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+        except TimeoutError:
+            logger.warning(
+                f"CLI daemon client did not read the response within {self.server.request_timeout}s, closing"
+            )
+
+
+class CliDaemonServer(_UnixServerBase):
+    """コマンドを直列に in-process 実行する Unix socket サーバ。
+
+    Args:
+        socket_path: listen する socket パス
+        runner: ``(argv, json_mode) -> exit code`` でコマンドを実行する関数
+        idle_timeout: この秒数リクエストが無ければ :meth:`serve_until_idle` を抜ける (0 は無期限)
+        before_request: 各コマンド実行前に ``argv`` を渡して呼ぶフック
+            (アクティブプロジェクトの分離に使う)
+        request_timeout: 接続ごとのソケット読み書きタイムアウト (秒)。停止したクライアントが
+            後続のリクエストを塞がないよう、超えたら接続を閉じる
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        runner: Runner,
+        *,
+        idle_timeout: float,
+        before_request: Callable[[list[str]], None] | None = None,
+        request_timeout: float = _REQUEST_IO_TIMEOUT_S,
+    ) -> None:
+        self.socket_path = socket_path
+        self.request_timeout = request_timeout
+        self.runner = runner
+        self.before_request = before_request
+        self.timeout = idle_timeout if idle_timeout > 0 else None
+        self.request_count = 0
+        self.started_at = time.monotonic()
+        self._stop = False
+        _prepare_socket_path(socket_path)
+        with _private_umask():
+            super().__init__(str(socket_path), _RequestHandler)
+
+    def serve_until_idle(self) -> None:
+        """shutdown 要求か idle timeout まで 1 件ずつリクエストを処理する。"""
+        saved = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = _StreamSwitch(sys.stdout), _StreamSwitch(sys.stderr)
+        try:
+            while not self._stop:
+                self.handle_request()
+        finally:
+            sys.stdout, sys.stderr = saved
+
+    def handle_timeout(self) -> None:
+        logger.info(f"CLI daemon idle for {self.timeout}s, shutting down")
+        self._stop = True
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """リクエスト JSON を処理してレスポンス JSON を返す。
+
+        Raises:
+            ValueError: リクエストの形式が不正な場合
+        """
+        op = request.get("op", "run")
+        if op == "ping":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "requests": self.request_count,
+                "uptime_s": round(time.monotonic() - self.started_at, 3),
+            }
+        if op == "shutdown":
+            self._stop = True
+            return {"ok": True}
+        if op != "run":
+            raise ValueError(f"unknown op: {op}")
+
+        argv = request.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(token, str) for token in argv):
+            raise ValueError("argv must be a list of strings")
+        self.request_count += 1
+        start = time.perf_counter()
+        with (
+            _working_directory(request.get("cwd")),
+            _captured_stdio(str(request.get("stdin", ""))) as (
+                stdout,
+                stderr,
+            ),
+        ):
+            if self.before_request is not None:
+                self.before_request(argv)
+            exit_code = self.runner(argv, bool(request.get("json", True)))
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+
+
+def _prepare_socket_path(socket_path: Path) -> None:
+    """socket の親ディレクトリを用意・検証し、残骸の socket ファイルを取り除く。
+
+    Raises:
+        InsecureSocketDirectoryError: 親ディレクトリが自分専用でない場合
+        FileExistsError: 既に別のデーモンが listen している場合
+    """
+    with _private_umask():
+        socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    check_socket_directory(socket_path.parent)
+    if not socket_path.exists():
+        return
+    try:
+        send_request(socket_path, {"op": "ping"}, timeout=_CONNECT_TIMEOUT_S)
+    except (DaemonUnavailableError, ConnectionError, OSError, ValueError):
+        socket_path.unlink()  # 前回のデーモンが異常終了して残った socket
+        return
+    raise FileExistsError(f"A daemon is already listening on {socket_path}")
@@ -0,0 +1,98 @@
+"""サブコマンドグループの遅延ロード。
+
+``lorairo-cli`` のサブコマンドモジュール (``lorairo.cli.commands.*``) は
+ServiceContainer / SQLAlchemy / PIL / pydantic を module import 時に読み込む。
+root app に ``add_typer`` で全グループを登録すると、``--help`` や ``version`` でも
+全モジュールの import を払うことになる。
+
+:class:`LazyTyperGroup` はグループ名と import パスだけを保持し、実際に解決された
+グループのモジュールだけを import する。root の help 表示中は import せず、
+登録済みの help 文字列を持つプレースホルダを返す。
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """遅延ロードするサブコマンドグループ。
+
+    Attributes:
+        import_path: ``"module.path:attr"`` 形式の Typer app の場所
+        help: root の help に表示する説明 (``add_typer(help=...)`` 相当)
+    """
+
+    import_path: str
+    help: str
+
+
+class LazyTyperGroup(TyperGroup):
+    """``lazy_subcommands`` のグループを初回解決時に import する TyperGroup。
+
+    Typer は ``cls`` をキーワード引数付きで自前生成するため、登録内容は
+    :func:`lazy_group_class` で作るサブクラスのクラス属性として渡す。
+    """
+
+    lazy_subcommands: ClassVar[dict[str, LazySubcommand]] = {}
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._formatting_help = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        # ロード済みの遅延グループも登録順 (help の表示順) を保つ
+        eager = [name for name in super().list_commands(ctx) if name not in self.lazy_subcommands]
+        return eager + list(self.lazy_subcommands)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        spec = self.lazy_subcommands.get(cmd_name)
+        if spec is None:
+            return None
+        if self._formatting_help:
+            # root help は一覧の説明文しか使わないため、モジュールを import しない
+            return TyperGroup(name=cmd_name, help=spec.help)
+        command = self._load(cmd_name, spec)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+    @staticmethod
+    def _load(cmd_name: str, spec: LazySubcommand) -> click.Command:
+        module_path, _, attr = spec.import_path.partition(":")
+        sub_app = getattr(importlib.import_module(module_path), attr or "app")
+        # add_typer と同じ規則でグループ化する (単一コマンドの app も
+        # グループのまま残し、help 上書きも add_typer(help=...) と同じにする)
+        holder = typer.Typer()
+        holder.add_typer(sub_app, name=cmd_name, help=spec.help)
+        group = typer.main.get_command(holder)
+        assert isinstance(group, TyperGroup)
+        return group.commands[cmd_name]
+
+
+def lazy_group_class(subcommands: dict[str, LazySubcommand]) -> type[LazyTyperGroup]:
+    """``subcommands`` を遅延登録した :class:`LazyTyperGroup` サブクラスを返す。
+
+    Args:
+        subcommands: グループ名 → :class:`LazySubcommand` (help の表示順)
+
+    Returns:
+        ``typer.Typer(cls=...)`` に渡すグループクラス
+    """
+    return type("LorairoLazyGroup", (LazyTyperGroup,), {"lazy_subcommands": dict(subcommands)})
@@ -1,4 +1,5 @@
 """CLIコマンド実装モジュール。
 
-各サブコマンド（project, images, annotate, export）の実装。
+各サブコマンド（project, images, annotate, export, debug 等）の実装。
+`lorairo.cli.main` から遅延ロードされるため、ここでは何も import しない。
 """
@@ -29,6 +29,7 @@ if TYPE_CHECKING:
     from lorairo.database.repository.model import ModelRepository
     from lorairo.services.batch_import_service import BatchImportResult
 
+from lorairo.annotation.inference_cache import InferenceResultCache
 from lorairo.cli._boundary import command_boundary
 from lorairo.cli._console import make_console
 from lorairo.cli._emit import emit_item, emit_result
@@ -42,13 +43,17 @@ from lorairo.public_api.exceptions import (
     ResultSetTooLargeError,
 )
 from lorairo.public_api.project import get_project as api_get_project
+from lorairo.services.cost_estimation_service import CostEstimationService, format_duration
 from lorairo.services.model_registry_protocol import selection_includes_webapi_model
 from lorairo.services.model_route_service import validate_api_keys_for_models
+from lorairo.services.model_throughput_stats import ModelThroughputStats
 from lorairo.services.moderation_preflight_service import (
     ModerationPreflightService,
     build_annotation_runner_runner,
 )
 from lorairo.services.service_container import get_service_container
+from lorairo.utils.config import DEFAULT_INFERENCE_CACHE_PATH
+from lorairo.utils.image_decode import decode_image
 from lorairo.utils.log import logger
 
 # サブコマンドアプリ定義
@@ -60,6 +65,10 @@ console_err = make_console(stderr=True)
 
 MAX_ANNOTATE_IMAGES = 500
 
+# アノテーション入力のデコード時縮小の下限長辺 (px)。WebAPI プロバイダは入力を 2048px 程度
+# 以下へ縮小して扱い、ローカルモデルの入力はさらに小さいため、これを超える解像度は使われない。
+ANNOTATION_DECODE_MAX_EDGE = 2048
+
 
 class LoadFailureAction(Enum):
     """画像ロード失敗時の対応方針 (Issue #537)。"""
@@ -124,12 +133,14 @@ def _iter_record_batches(records: list[dict[str, Any]], batch_size: int) -> Iter
 
 def _load_batch_images(
     records_chunk: list[dict[str, Any]],
+    max_edge: int | None = ANNOTATION_DECODE_MAX_EDGE,
 ) -> tuple[list[Image.Image], list[dict[str, Any]], int, int]:
     """1 チャンク分の画像のみ open/load する (Issue #536 / #537)。
 
-    各レコードについて ``stored_image_path`` を解決し ``Image.open`` →
-    ``img.load()`` で実体をメモリに展開する。例外は ``_classify_load_failure``
-    で分岐する:
+    各レコードについて ``stored_image_path`` を解決し ``decode_image`` で実体を
+    メモリに展開する。JPEG は長辺 ``max_edge`` 以上を保つ範囲でデコード時に縮小する。
+    ただし DB 上の pHash を持たないレコードは、アノテータが画像から pHash を再計算する
+    ためフル解像度でデコードする。例外は ``_classify_load_failure`` で分岐する:
 
     - ``FATAL`` (メモリ/リソース枯渇): 既にロード済みの画像を close してから
       ``ImageLoadMemoryError`` を raise し、呼び出し元で致命扱いさせる。
@@ -139,6 +150,7 @@ def _load_batch_images(
 
     Args:
         records_chunk: ``_iter_record_batches`` が返す 1 チャンク分のレコード。
+        max_edge: デコード時縮小の下限長辺 (px)。None はフル解像度。
 
     Returns:
         tuple: (ロード済み PIL 画像リスト, ロード成功レコードリスト, ロード成功数, ロード失敗数)。
@@ -164,8 +176,7 @@ def _load_batch_images(
         image_path = resolve_stored_path(stored_path_str)
 
         try:
-            img = Image.open(image_path)
-            img.load()
+            img = decode_image(image_path, max_edge if record.get("phash") is not None else None)
         except Exception as exc:
             # per-image 例外は分類のため広く捕捉し、FATAL は再 raise、SKIP は継続する。
             action = _classify_load_failure(exc)
@@ -265,6 +276,52 @@ def _check_annotation_errors(
     return success_detected, error_detected_models
 
 
+# --batch-size 省略時: 未計測モデルを含む場合の既定値と、実測から選ぶ場合の上限
+DEFAULT_ANNOTATE_BATCH_SIZE = 10
+MAX_AUTO_ANNOTATE_BATCH_SIZE = 32
+
+
+def _resolve_annotate_batch_size(
+    batch_size: int | None, throughput: ModelThroughputStats | None, litellm_model_ids: list[str]
+) -> int:
+    """``--batch-size`` 省略時は実測スループットからチャンクサイズを選ぶ。
+
+    1 チャンクがおよそ一定時間 (``DEFAULT_TARGET_CHUNK_SECONDS``) で終わる枚数にする。
+    未計測のモデルを含む場合は :data:`DEFAULT_ANNOTATE_BATCH_SIZE`。
+    """
+    if batch_size is not None:
+        return batch_size
+    if throughput is None:
+        return DEFAULT_ANNOTATE_BATCH_SIZE
+    return throughput.recommend_batch_size(
+        litellm_model_ids, default=DEFAULT_ANNOTATE_BATCH_SIZE, maximum=MAX_AUTO_ANNOTATE_BATCH_SIZE
+    )
+
+
+def _get_throughput_stats_best_effort(container: Any) -> ModelThroughputStats | None:
+    """ServiceContainer からスループット統計を取得する。使えなければ None (固定仮定で見積もる)。"""
+    try:
+        throughput = container.model_throughput_stats
+    except Exception as e:
+        logger.debug(f"スループット統計を取得できません: {e}")
+        return None
+    return throughput if isinstance(throughput, ModelThroughputStats) else None
+
+
+def _print_annotation_eta(
+    throughput: ModelThroughputStats | None, litellm_model_ids: list[str], image_count: int, batch_size: int
+) -> None:
+    """推定所要時間とチャンクサイズを表示する (実測値のあるモデル数も併記)。"""
+    est_seconds, measured = CostEstimationService(throughput).estimate_seconds(
+        litellm_model_ids, image_count
+    )
+    unique_models = len(dict.fromkeys(litellm_model_ids))
+    _status_console().print(
+        f"[cyan]Estimated time: {format_duration(est_seconds)} for {image_count} image(s) "
+        f"(measured {measured}/{unique_models} model(s), batch size {batch_size})[/cyan]"
+    )
+
+
 def _status_console() -> Any:
     """Return stderr console in JSON mode so stdout stays JSONL-only."""
     return console_err if is_json_mode() else console
@@ -880,12 +937,15 @@ def run(
         "-o",
         help="Output directory for annotation results (optional)",
     ),
-    batch_size: int = typer.Option(
-        10,
+    batch_size: int | None = typer.Option(
+        None,
         "--batch-size",
         "-b",
         min=1,
-        help="Batch size for processing (>=1; bounds memory per chunk)",
+        help=(
+            "Batch size for processing (>=1; bounds memory per chunk). "
+            "Default: chosen from measured model throughput (10 when unmeasured)"
+        ),
     ),
     limit: int | None = typer.Option(
         None,
@@ -1020,6 +1080,12 @@ def run(
         # MissingApiKeyError が出てから初めて失敗していた。
         _validate_required_api_keys(model_repo, config, resolved_litellm_ids)
 
+        throughput = _get_throughput_stats_best_effort(container)
+        effective_batch_size = _resolve_annotate_batch_size(batch_size, throughput, resolved_litellm_ids)
+        _print_annotation_eta(
+            throughput, resolved_litellm_ids, len(records_to_process), effective_batch_size
+        )
+
         # アノテーション実行 (Issue #536: チャンクストリーミング)
         target_console.print("[cyan]Starting annotation...[/cyan]")
         try:
@@ -1046,7 +1112,7 @@ def run(
 
         summary = _stream_annotate(
             records_to_process=records_to_process,
-            batch_size=batch_size,
+            batch_size=effective_batch_size,
             annotator=annotator,
             save_service=container.annotation_save_service,
             resolved_litellm_ids=resolved_litellm_ids,
@@ -1174,3 +1240,109 @@ def import_batch(
             return
 
         _display_batch_import_result(result, dry_run=dry_run)
+
+
+# ===== cache サブコマンド (推論結果キャッシュ) =====
+
+cache_app = typer.Typer(help="Inference result cache commands")
+app.add_typer(cache_app, name="cache")
+
+
+def _open_inference_cache() -> InferenceResultCache:
+    """推論結果キャッシュを開く (設定で無効化されていても確認・削除できるよう直接開く)。"""
+    return InferenceResultCache(DEFAULT_INFERENCE_CACHE_PATH)
+
+
+@cache_app.command("stats")
+def cache_stats() -> None:
+    """Show inference result cache statistics.
+    推論結果キャッシュの件数・サイズ・モデル別件数を表示する。
+
+    Hit / miss counters are per process and are reported in the annotation logs;
+    this command shows what is stored on disk.
+    ヒット / ミス数はプロセス単位のためアノテーション実行時のログに出力されます。
+
+    Example:
+        lorairo-cli annotate cache stats
+    """
+    with command_boundary():
+        cache = _open_inference_cache()
+        try:
+            stats = cache.get_stats()
+        finally:
+            cache.close()
+
+        if is_json_mode():
+            for model_id, entries in stats["models"].items():
+                emit_item({"model_id": model_id, "entries": entries})
+            emit_result(
+                f"Inference cache holds {stats['entries']} result(s)",
+                path=str(DEFAULT_INFERENCE_CACHE_PATH),
+                entries=stats["entries"],
+                total_bytes=stats["total_bytes"],
+                models=len(stats["models"]),
+            )
+            return
+
+        table = Table(title="Inference Result Cache")
+        table.add_column("Model", style="cyan")
+        table.add_column("Entries", style="green", justify="right")
+        for model_id, entries in stats["models"].items():
+            table.add_row(model_id, str(entries))
+        console.print(table)
+        console.print(
+            f"合計: {stats['entries']} 件 / {stats['total_bytes'] / 1_048_576:.1f} MiB "
+            f"({DEFAULT_INFERENCE_CACHE_PATH})"
+        )
+
+
+@cache_app.command("clear")
+def cache_clear(
+    model: str | None = typer.Option(
+        None,
+        "--model",
+        "-m",
+        help="Only invalidate results of this LiteLLM model ID",
+    ),
+    phash: str | None = typer.Option(
+        None,
+        "--phash",
+        help="Only invalidate results of the image with this pHash",
+    ),
+    force: bool = typer.Option(False, "--force", "-f", help="Delete without confirmation"),
+) -> None:
+    """Invalidate inference result cache entries.
+    推論結果キャッシュを削除する。条件を指定しなければ全件削除します。
+
+    モデルの重み・プロンプト以外の推論条件を変えた場合など、キャッシュ済みの結果を
+    使わずに再推論したいときに使います。
+
+    Examples:
+        lorairo-cli annotate cache clear
+        lorairo-cli annotate cache clear --model wd-vit-tagger-v3 --force
+    """
+    with command_boundary():
+        if not force:
+            # JSON mode は対話 confirm を stdout に書けないため --force 必須 (project delete と同じ)
+            if is_json_mode():
+                raise click.UsageError("annotate cache clear requires --force in JSON mode")
+            target = "all cached results" if model is None and phash is None else "matching cached results"
+            if not typer.confirm(f"Delete {target}? They will be re-inferred on the next run."):
+                console.print("[yellow]Cancelled[/yellow]")
+                return
+
+        cache = _open_inference_cache()
+        try:
+            deleted = cache.invalidate(model_id=model, phash=phash)
+        finally:
+            cache.close()
+
+        if is_json_mode():
+            emit_result(
+                f"Invalidated {deleted} cached result(s)",
+                deleted=deleted,
+                model_id=model,
+                phash=phash,
+            )
+            return
+        console.print(f"推論結果キャッシュを {deleted} 件削除しました")
@@ -0,0 +1,114 @@
+"""Project database maintenance commands.
+
+プロジェクト DB (SQLite) の統計更新・WAL 切り詰め・空きページ返却を行うコマンド群。
+
+出力は ADR 0057/0058 に従う: ``--json`` 時は stdout に JSONL (item/result)、
+それ以外は rich 人間向け。
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import typer
+from rich.table import Table
+
+from lorairo.cli._boundary import command_boundary
+from lorairo.cli._console import make_console
+from lorairo.cli._emit import emit_item, emit_result
+from lorairo.cli._output_mode import is_json_mode
+from lorairo.public_api.exceptions import DatabaseConnectionError
+from lorairo.public_api.project import get_project as api_get_project
+from lorairo.services.service_container import get_service_container
+
+app = typer.Typer(help="Project database maintenance commands")
+console = make_console()
+
+# before/after 表に並べる統計項目 (DatabaseStats.to_dict のキー, 表示名)
+_STAT_ROWS: tuple[tuple[str, str], ...] = (
+    ("file_bytes", "DB file (bytes)"),
+    ("wal_bytes", "WAL file (bytes)"),
+    ("page_size", "Page size"),
+    ("page_count", "Pages"),
+    ("freelist_count", "Free pages"),
+    ("free_ratio", "Free ratio"),
+    ("auto_vacuum", "auto_vacuum"),
+    ("journal_mode", "journal_mode"),
+    ("stat1_rows", "sqlite_stat1 rows"),
+)
+
+
+def _print_stats_table(title: str, before: dict[str, Any], after: dict[str, Any] | None) -> None:
+    table = Table(title=title)
+    table.add_column("Stat", style="cyan")
+    table.add_column("Before", style="white", justify="right")
+    if after is not None:
+        table.add_column("After", style="green", justify="right")
+    for key, label in _STAT_ROWS:
+        row = [label, str(before.get(key, ""))]
+        if after is not None:
+            row.append(str(after.get(key, "")))
+        table.add_row(*row)
+    console.print(table)
+
+
+@app.command("maintain")
+def maintain(
+    project: str = typer.Option(..., "--project", "-p", help="Project name"),
+    vacuum: bool = typer.Option(
+        False,
+        "--vacuum",
+        help="Rebuild the DB with VACUUM (applies page_size / auto_vacuum=INCREMENTAL; slow on large DBs)",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show current statistics without changing the DB"
+    ),
+) -> None:
+    """Run ANALYZE, PRAGMA optimize, free-page reclaim and WAL truncation.
+
+    実行前後の DB 統計 (ファイル / WAL サイズ、空きページ、統計行数) を表示する。
+    GUI を開いたまま実行しても良いが、読み取り中の接続があると WAL の切り詰めは
+    延期される (wal_checkpoint の busy=1)。
+
+    Example:
+        lorairo-cli db maintain --project proj
+        lorairo-cli db maintain --project proj --vacuum
+    """
+    with command_boundary():
+        api_get_project(project)
+        container = get_service_container()
+        container.set_active_project(project)
+        service = container.db_manager.maintenance_service
+        if service is None:
+            raise DatabaseConnectionError(project, "ファイル DB ではないためメンテナンスできません")
+
+        if dry_run:
+            before = service.collect_stats().to_dict()
+            if is_json_mode():
+                emit_result("Dry-run: no maintenance performed", before=before, after=None, dry_run=True)
+            else:
+                _print_stats_table(f"Database statistics ({project})", before, None)
+                console.print("[dim]Dry-run: no maintenance performed[/dim]")
+            return
+
+        report = service.maintain(vacuum=vacuum)
+        before = report.before.to_dict()
+        after = report.after.to_dict()
+        failed = [action["action"] for action in report.actions if not action.get("ok")]
+        message = (
+            f"Completed {len(report.actions)} maintenance action(s)"
+            if not failed
+            else f"Maintenance finished with failures: {', '.join(failed)}"
+        )
+
+        if is_json_mode():
+            for action in report.actions:
+                emit_item(action)
+            emit_result(message, ok=report.ok, before=before, after=after, dry_run=False)
+            return
+
+        _print_stats_table(f"Database maintenance ({project})", before, after)
+        for action in report.actions:
+            mark = "[green]ok[/green]" if action.get("ok") else f"[red]failed: {action.get('error')}[/red]"
+            console.print(f"  {action['action']}: {mark} ({action['elapsed_ms']} ms)")
+        console.print(f"[green]{message}[/green]" if report.ok else f"[yellow]{message}[/yellow]")
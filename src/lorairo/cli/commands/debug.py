@@ -0,0 +1,435 @@
+"""CLI developer diagnostics.
+
+CLI 開発者向けの診断コマンド。``import-time`` は fresh interpreter で
+``python -X importtime`` を実行し、``lorairo-cli`` 起動時の import コストと
+読み込まれた重いモジュールを報告する。エージェントが CLI を数千回呼ぶ用途では
+起動コストがそのまま処理時間になるため、予算 (:data:`STARTUP_MODULE_BUDGET` /
+:data:`STARTUP_TIME_BUDGET_S`) を超えていないかをここで確認する。
+
+``db-profile`` はプロジェクト DB に代表的な検索フィルタの組合せを流し、
+``lorairo.database.query_profiler`` でステートメントごとのレイテンシ・
+``EXPLAIN QUERY PLAN``・全件走査を報告する。インデックス調整の材料にする。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+
+import click
+import typer
+
+from lorairo.cli._boundary import command_boundary
+from lorairo.cli._console import make_console
+from lorairo.cli._emit import emit_item, emit_result
+from lorairo.cli._output_mode import is_json_mode
+
+# サブコマンドアプリ定義
+app = typer.Typer(help="Diagnostics for CLI developers")
+
+# Rich console (Issue #254: Windows では safe_box=True で ASCII 罫線)
+console = make_console()
+
+# `import lorairo.cli.main` (= `lorairo-cli --help` / `version`) の予算。
+# サブコマンドは遅延ロードされるため、root の import でこれらを超えたら退行とみなす。
+STARTUP_MODULE_BUDGET = 400
+STARTUP_TIME_BUDGET_S = 1.0
+
+# root の import で読み込まれてはならないモジュール (前方一致)。
+# ML ランタイム・GUI・DB/画像スタックは、それを使うサブコマンドの中でだけ import する。
+HEAVY_MODULES = (
+    "image_annotator_lib",
+    "torch",
+    "tensorflow",
+    "onnxruntime",
+    "transformers",
+    "cv2",
+    "litellm",
+    "PySide6",
+    "sqlalchemy",
+    "alembic",
+    "PIL",
+    "numpy",
+    "pydantic",
+    "lorairo.services",
+    "lorairo.database",
+    "lorairo.cli.commands",
+    "lorairo.cli.introspection",
+)
+
+_MAIN_MODULE = "lorairo.cli.main"
+
+# db-profile で流す検索フィルタの組合せ (名前, ImageFilterCriteria の引数)。
+# GUI 検索 / CLI images search が実際に組み立てる次元を 1 つずつ有効にする。
+DB_PROFILE_FILTERS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("all", {"include_nsfw": True}),
+    ("default", {}),
+    ("tag", {"tags": ["1girl"], "include_nsfw": True}),
+    ("tags_and", {"tags": ["1girl", "solo"], "use_and": True, "include_nsfw": True}),
+    ("tags_or", {"tags": ["1girl", "solo"], "use_and": False, "include_nsfw": True}),
+    ("excluded_tag", {"excluded_tags": ["monochrome"], "include_nsfw": True}),
+    ("caption", {"caption": ["smile"], "include_nsfw": True}),
+    ("untagged", {"include_untagged": True, "include_nsfw": True}),
+    ("unrated", {"only_unrated": True, "include_nsfw": True}),
+    ("manual_rating", {"manual_rating_filter": ["PG", "PG-13"], "include_nsfw": True}),
+    ("ai_rating", {"ai_rating_filter": "R", "include_nsfw": True}),
+    ("score_range", {"score_min": 5.0, "score_max": 10.0, "include_nsfw": True}),
+    ("date_range", {"start_date": "2000-01-01T00:00:00", "end_date": "2100-01-01T00:00:00"}),
+    ("resolution", {"resolution": 512, "include_nsfw": True}),
+    ("sort_file_path", {"sort_field": "file_path", "sort_direction": "desc", "include_nsfw": True}),
+)
+# db-profile の 1 ページ取得件数 (GUI 検索の 1 ページ相当)
+DB_PROFILE_PAGE_SIZE = 100
+
+# 子プロセスで対象を import し、import 時間と import 後の sys.modules を stdout に JSON で返す。
+# 時間は -X importtime ではなく子プロセス内で測る (lorairo.cli.main は early_init で
+# stderr を再設定するため、自身の importtime 行が出力されない)。
+_PROBE = (
+    "import importlib, json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "seconds = time.perf_counter() - start\n"
+    "json.dump({'seconds': seconds, 'modules': sorted(sys.modules)}, sys.stdout)\n"
+)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """``-X importtime`` の 1 行分。
+
+    Attributes:
+        module: モジュール名
+        self_us: モジュール自身の import 時間 (マイクロ秒)
+        cumulative_us: 依存を含む import 時間 (マイクロ秒)
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class ImportReport:
+    """fresh interpreter で 1 モジュールを import したときの計測結果。
+
+    Attributes:
+        target: import したモジュール
+        import_seconds: 対象モジュールの import 時間 (依存込み、秒)
+        modules: import 後に ``sys.modules`` にあるモジュール名
+        timings: ``-X importtime`` の全行
+    """
+
+    target: str
+    import_seconds: float
+    modules: list[str]
+    timings: list[ImportTiming] = field(default_factory=list)
+
+    @property
+    def module_count(self) -> int:
+        """import 後のモジュール数 (インタプリタ起動時分を含む)"""
+        return len(self.modules)
+
+    def heavy_modules_loaded(self, heavy: tuple[str, ...] = HEAVY_MODULES) -> list[str]:
+        """読み込まれた重いモジュール (トップレベル名) を返す。"""
+        return sorted(
+            {
+                name
+                for name in heavy
+                for module in self.modules
+                if module == name or module.startswith(f"{name}.")
+            }
+        )
+
+    def slowest(self, count: int) -> list[ImportTiming]:
+        """自身の import 時間が長い順に ``count`` 件返す。"""
+        return sorted(self.timings, key=lambda timing: timing.self_us, reverse=True)[:count]
+
+
+def _parse_importtime(stderr: str) -> list[ImportTiming]:
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # ヘッダ行 ("self [us] | cumulative | imported package")
+        timings.append(ImportTiming(parts[2].strip(), int(parts[0]), int(parts[1])))
+    return timings
+
+
+def measure_import(target: str = _MAIN_MODULE, *, timeout: float = 120.0) -> ImportReport:
+    """fresh interpreter で ``target`` を import し、import コストを計測する。
+
+    親プロセスの ``sys.path`` を子に引き継ぐため、editable install が無い環境でも
+    同じ lorairo を計測する。
+
+    Args:
+        target: import するモジュール名
+        timeout: 子プロセスのタイムアウト (秒)
+
+    Returns:
+        計測結果
+
+    Raises:
+        RuntimeError: 子プロセスでの import に失敗した場合
+    """
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(sys.path),
+        "LORAIRO_CLI_MODE": "true",
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, target],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        tail = "\n".join(line for line in result.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"Failed to import {target}: {tail[-2000:]}")
+
+    probe = json.loads(result.stdout)
+    return ImportReport(
+        target=target,
+        import_seconds=float(probe["seconds"]),
+        modules=list(probe["modules"]),
+        timings=_parse_importtime(result.stderr),
+    )
+
+
+def _resolve_target(ctx: typer.Context, command: str | None) -> str:
+    """サブコマンドグループ名を、そのグループのモジュール名に解決する。"""
+    if not command:
+        return _MAIN_MODULE
+    root = ctx.find_root().command
+    spec = getattr(root, "lazy_subcommands", {}).get(command)
+    if spec is None:
+        raise click.UsageError(f"Unknown command group: {command}")
+    module_path: str = spec.import_path.partition(":")[0]
+    return module_path
+
+
+@app.command("import-time")
+def import_time(
+    ctx: typer.Context,
+    command: str | None = typer.Argument(
+        None,
+        help="Command group to measure (e.g. 'images'). Defaults to the CLI entry point.",
+    ),
+    top: int = typer.Option(15, "--top", min=0, help="Number of slowest modules to list."),
+) -> None:
+    """Report cold-start import time and heavy modules loaded by lorairo-cli.
+
+    fresh interpreter で ``-X importtime`` を実行し、import 時間・モジュール数・
+    読み込まれた重いモジュール・自身の import 時間が長いモジュールを表示します。
+    COMMAND 省略時は ``lorairo-cli`` 本体 (全サブコマンド共通の起動コスト) を計測し、
+    予算 (モジュール数 / 時間 / 重いモジュール無し) を満たすかを判定します。
+
+    Example:
+        lorairo-cli debug import-time
+
+        lorairo-cli debug import-time images --top 30
+    """
+    with command_boundary():
+        target = _resolve_target(ctx, command)
+        report = measure_import(target)
+        heavy = report.heavy_modules_loaded()
+        is_entry_point = target == _MAIN_MODULE
+        within_budget = (
+            not heavy
+            and report.module_count <= STARTUP_MODULE_BUDGET
+            and report.import_seconds <= STARTUP_TIME_BUDGET_S
+            if is_entry_point
+            else None
+        )
+        slowest = report.slowest(top)
+
+        if is_json_mode():
+            emit_result(
+                f"{target}: {report.import_seconds:.3f}s, {report.module_count} modules",
+                target=target,
+                import_seconds=round(report.import_seconds, 4),
+                module_count=report.module_count,
+                heavy_modules=heavy,
+                within_budget=within_budget,
+                budget={"modules": STARTUP_MODULE_BUDGET, "seconds": STARTUP_TIME_BUDGET_S}
+                if is_entry_point
+                else None,
+                slowest=[
+                    {
+                        "module": t.module,
+                        "self_ms": t.self_us / 1000,
+                        "cumulative_ms": t.cumulative_us / 1000,
+                    }
+                    for t in slowest
+                ],
+            )
+            return
+
+        from rich.table import Table
+
+        console.print(f"[bold]{target}[/bold]: {report.import_seconds:.3f}s, {report.module_count} modules")
+        if is_entry_point:
+            verdict = "[green]within budget[/green]" if within_budget else "[red]over budget[/red]"
+            console.print(
+                f"Budget: {STARTUP_MODULE_BUDGET} modules / {STARTUP_TIME_BUDGET_S:.1f}s -> {verdict}"
+            )
+        console.print(f"Heavy modules: {', '.join(heavy) if heavy else '(none)'}")
+        if slowest:
+            table = Table(title="Slowest imports (self time)")
+            table.add_column("Module", style="cyan")
+            table.add_column("Self (ms)", justify="right")
+            table.add_column("Cumulative (ms)", justify="right")
+            for timing in slowest:
+                table.add_row(
+                    timing.module, f"{timing.self_us / 1000:.1f}", f"{timing.cumulative_us / 1000:.1f}"
+                )
+            console.print(table)
+
+
+def run_filter_matrix(repository: Any, repeat: int) -> list[dict[str, Any]]:
+    """:data:`DB_PROFILE_FILTERS` の各フィルタで件数取得と 1 ページ取得を ``repeat`` 回流す。
+
+    Args:
+        repository: ``ImageRepository``
+        repeat: 各フィルタの繰り返し回数
+
+    Returns:
+        フィルタごとの ``name`` / ``elapsed_ms`` (合計) / ``matched`` / ``error``
+    """
+    import time
+
+    from lorairo.database.filter_criteria import ImageFilterCriteria
+
+    results: list[dict[str, Any]] = []
+    for name, kwargs in DB_PROFILE_FILTERS:
+        count_criteria = ImageFilterCriteria(**kwargs)
+        page_criteria = ImageFilterCriteria(**kwargs, limit=DB_PROFILE_PAGE_SIZE, include_annotations=False)
+        start = time.perf_counter()
+        matched: int | None = None
+        error: str | None = None
+        try:
+            for _ in range(repeat):
+                matched = repository.get_images_count_only(count_criteria)
+                repository.get_images_by_filter(page_criteria)
+        except Exception as e:
+            # 1 つのフィルタの失敗で残りの計測を止めない
+            error = str(e)
+        results.append(
+            {
+                "name": name,
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+                "matched": matched,
+                "error": error,
+            }
+        )
+    return results
+
+
+@app.command("db-profile")
+def db_profile(
+    project: str = typer.Option(
+        ...,
+        "--project",
+        "-p",
+        help="Project name",
+    ),
+    repeat: int = typer.Option(3, "--repeat", min=1, max=100, help="Runs per filter combination."),
+    slow_ms: float = typer.Option(
+        0.0,
+        "--slow-ms",
+        min=0.0,
+        help="Capture EXPLAIN QUERY PLAN for statements at or above this latency (0 = every SELECT).",
+    ),
+    top: int = typer.Option(20, "--top", min=1, help="Number of statements to list (by total time)."),
+) -> None:
+    """Profile image search queries and report latency, query plans and full scans.
+
+    代表的な検索フィルタの組合せ (タグ / キャプション / NSFW / レーティング /
+    スコア / 日付 / 未タグ等) で件数取得と 1 ページ取得をプロジェクト DB に流し、
+    正規化 SQL x Repository メソッドごとのレイテンシ、``EXPLAIN QUERY PLAN`` と
+    インデックスを使わない全件走査を表示します。
+
+    Example:
+        lorairo-cli debug db-profile --project my_project
+
+        lorairo-cli --json debug db-profile -p my_project --repeat 10 --slow-ms 5
+    """
+    with command_boundary():
+        from lorairo.database.query_profiler import get_query_profiler
+        from lorairo.public_api.project import get_project as api_get_project
+        from lorairo.services.service_container import get_service_container
+
+        api_get_project(project)
+
+        container = get_service_container()
+        container.set_active_project(project)
+        repository = container.db_manager.image_repo
+
+        profiler = get_query_profiler()
+        was_enabled, previous_slow_ms = profiler.enabled, profiler.slow_ms
+        profiler.reset()
+        profiler.enable(slow_ms=slow_ms)
+        try:
+            filters = run_filter_matrix(repository, repeat)
+        finally:
+            profiler.slow_ms = previous_slow_ms
+            if not was_enabled:
+                profiler.disable()
+        summary = profiler.summary(top=top)
+        statements = summary["statements"]
+
+        if is_json_mode():
+            for statement in statements:
+                emit_item(statement)
+            emit_result(
+                f"{len(filters)} filter(s) x {repeat}: {len(statements)} statement(s), "
+                f"{len(summary['full_scans'])} table(s) with full scans",
+                count=len(statements),
+                project=project,
+                repeat=repeat,
+                slow_ms=slow_ms,
+                filters=filters,
+                callers=summary["callers"],
+                full_scans=summary["full_scans"],
+            )
+            return
+
+        from rich.table import Table
+
+        filter_table = Table(title=f"Filters ({repeat} run(s) each)")
+        filter_table.add_column("Filter", style="cyan")
+        filter_table.add_column("Matched", justify="right")
+        filter_table.add_column("Total (ms)", justify="right")
+        for entry in filters:
+            matched = entry["error"] or str(entry["matched"])
+            filter_table.add_row(entry["name"], matched, f"{entry['elapsed_ms']:.1f}")
+        console.print(filter_table)
+
+        statement_table = Table(title="Statements (by total time)")
+        statement_table.add_column("Caller", style="cyan")
+        statement_table.add_column("Count", justify="right")
+        statement_table.add_column("Mean (ms)", justify="right")
+        statement_table.add_column("p95 (ms)", justify="right")
+        statement_table.add_column("Max (ms)", justify="right")
+        statement_table.add_column("Full scans", style="red")
+        statement_table.add_column("SQL", overflow="fold")
+        for statement in statements:
+            statement_table.add_row(
+                statement["caller"],
+                str(statement["count"]),
+                f"{statement['mean_ms']:.2f}",
+                f"{statement['p95_ms']:.2f}",
+                f"{statement['max_ms']:.2f}",
+                ", ".join(statement["full_scans"]),
+                statement["sql"][:300],
+            )
+        console.print(statement_table)
+        console.print(
+            f"Full table scans: {', '.join(summary['full_scans']) if summary['full_scans'] else '(none)'}"
+        )
@@ -686,6 +686,46 @@ class AnnotateImportBatchResult(BaseModel):
     model_config = ConfigDict(title="AnnotateImportBatchResult")
 
 
+class AnnotateCacheStatsItem(BaseModel):
+    """JSONL item payload emitted by ``annotate cache stats --json`` (one row per model)."""
+
+    model_id: str
+    entries: int
+
+    model_config = ConfigDict(title="AnnotateCacheStatsItem")
+
+
+class AnnotateCacheStatsResult(BaseModel):
+    """JSONL result payload emitted by ``annotate cache stats --json``."""
+
+    kind: Literal["result"] = "result"
+    ok: Literal[True] = True
+    message: str
+    path: str
+    entries: int
+    total_bytes: int
+    models: int
+
+    model_config = ConfigDict(title="AnnotateCacheStatsResult")
+
+
+class AnnotateCacheClearResult(BaseModel):
+    """JSONL result payload emitted by ``annotate cache clear --json``.
+
+    JSON mode requires ``--force``; without it an INVALID_INPUT error row is emitted
+    and nothing is deleted.
+    """
+
+    kind: Literal["result"] = "result"
+    ok: Literal[True] = True
+    message: str
+    deleted: int
+    model_id: str | None = None
+    phash: str | None = None
+
+    model_config = ConfigDict(title="AnnotateCacheClearResult")
+
+
 class ErrorRecordItem(BaseModel):
     """JSONL item payload emitted by ``errors list --json``."""
 
@@ -724,6 +764,155 @@ class ErrorsResolveResult(BaseModel):
     model_config = ConfigDict(title="ErrorsResolveResult")
 
 
+class DbMaintainActionItem(BaseModel):
+    """JSONL item payload emitted by ``db maintain --json`` (one row per maintenance action)."""
+
+    kind: Literal["item"] = "item"
+    action: Literal["analyze", "optimize", "vacuum", "incremental_vacuum", "wal_checkpoint"]
+    ok: bool
+    elapsed_ms: float
+    detail: dict[str, Any] | None = None
+    error: str | None = None
+
+    model_config = ConfigDict(title="DbMaintainActionItem")
+
+
+class DatabaseStatsSchema(BaseModel):
+    """Database file / page statistics reported before and after ``db maintain``."""
+
+    file_bytes: int
+    wal_bytes: int
+    page_size: int
+    page_count: int
+    freelist_count: int
+    free_ratio: float
+    auto_vacuum: Literal["none", "full", "incremental"]
+    journal_mode: str
+    stat1_rows: int
+
+    model_config = ConfigDict(title="DatabaseStats")
+
+
+class DbMaintainResult(BaseModel):
+    """JSONL result payload emitted by ``db maintain --json``."""
+
+    kind: Literal["result"] = "result"
+    ok: bool
+    message: str
+    before: DatabaseStatsSchema
+    after: DatabaseStatsSchema | None = None
+    dry_run: bool
+
+    model_config = ConfigDict(title="DbMaintainResult")
+
+
+class ImportTimingItem(BaseModel):
+    """One slowest-import row in ``debug import-time --json``."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+
+    model_config = ConfigDict(title="ImportTimingItem")
+
+
+class StartupBudgetSchema(BaseModel):
+    """Startup budget of the CLI entry point."""
+
+    modules: int
+    seconds: float
+
+    model_config = ConfigDict(title="StartupBudget")
+
+
+class DebugImportTimeResult(BaseModel):
+    """JSONL result payload emitted by ``debug import-time --json``."""
+
+    kind: Literal["result"] = "result"
+    ok: bool
+    message: str
+    target: str
+    import_seconds: float
+    module_count: int
+    heavy_modules: list[str]
+    within_budget: bool | None = None
+    budget: StartupBudgetSchema | None = None
+    slowest: list[ImportTimingItem]
+
+    model_config = ConfigDict(title="DebugImportTimeResult")
+
+
+class DbProfileStatementItem(BaseModel):
+    """One statement row in ``debug db-profile --json`` (ordered by total time)."""
+
+    sql: str
+    caller: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    slow_count: int
+    histogram: dict[str, int]
+    plan: list[str]
+    full_scans: list[str]
+
+    model_config = ConfigDict(title="DbProfileStatementItem")
+
+
+class DbProfileFilterRun(BaseModel):
+    """Elapsed time of one filter combination in ``debug db-profile``."""
+
+    name: str
+    elapsed_ms: float
+    matched: int | None = None
+    error: str | None = None
+
+    model_config = ConfigDict(title="DbProfileFilterRun")
+
+
+class DbProfileCaller(BaseModel):
+    """Per-repository-method totals in ``debug db-profile``."""
+
+    caller: str
+    count: int
+    total_ms: float
+    max_ms: float
+
+    model_config = ConfigDict(title="DbProfileCaller")
+
+
+class DebugDbProfileResult(BaseModel):
+    """JSONL result payload emitted by ``debug db-profile --json``."""
+
+    kind: Literal["result"] = "result"
+    ok: bool
+    message: str
+    count: int
+    project: str
+    repeat: int
+    slow_ms: float
+    filters: list[DbProfileFilterRun]
+    callers: list[DbProfileCaller]
+    full_scans: list[str]
+
+    model_config = ConfigDict(title="DebugDbProfileResult")
+
+
+class ServeResult(BaseModel):
+    """JSONL result payload emitted by ``serve --json`` (on start and with ``--stop``)."""
+
+    kind: Literal["result"] = "result"
+    ok: bool
+    message: str
+    socket: str
+    pid: int | None = None
+    idle_timeout: float | None = None
+
+    model_config = ConfigDict(title="ServeResult")
+
+
 @dataclass(frozen=True)
 class FieldSpec:
     name: str
@@ -1091,7 +1280,11 @@ TOOL_SPECS: dict[str, ToolSpec] = {
                     _f("limit", "int>=1?"),
                     _f("offset", "int>=0", default=0),
                     _f("image_id", "list[int]?"),
-                    _f("batch_size", "int>=1", default=10),
+                    _f(
+                        "batch_size",
+                        "int>=1?",
+                        description="Omitted: chosen from measured model throughput (10 when unmeasured).",
+                    ),
                     _f("unrated", "bool", default=False),
                     _f("missing_model", "str?"),
                 ),
@@ -1160,6 +1353,66 @@ TOOL_SPECS: dict[str, ToolSpec] = {
         ),
         errors=(ERROR_MODEL,),
     ),
+    "annotate cache stats": ToolSpec(
+        name="annotate cache stats",
+        path="annotate cache stats",
+        summary="Show the number and size of cached inference results per model.",
+        read_only=True,
+        side_effects=("file_read",),
+        inputs=(_input("AnnotateCacheStatsInput", ()),),
+        outputs=(
+            _output(
+                "AnnotateCacheStatsItem",
+                (_f("model_id", "str"), _f("entries", "int")),
+                schema=AnnotateCacheStatsItem,
+            ),
+            _output(
+                "AnnotateCacheStatsResult",
+                (
+                    _f("path", "path"),
+                    _f("entries", "int"),
+                    _f("total_bytes", "int"),
+                    _f("models", "int", description="Number of models with cached results"),
+                ),
+                schema=AnnotateCacheStatsResult,
+            ),
+        ),
+        errors=(ERROR_MODEL,),
+    ),
+    "annotate cache clear": ToolSpec(
+        name="annotate cache clear",
+        path="annotate cache clear",
+        summary=(
+            "Delete cached inference results (all, or only one model / image) so they are "
+            "re-inferred on the next run."
+        ),
+        read_only=False,
+        side_effects=("file_read", "file_write"),
+        inputs=(
+            _input(
+                "AnnotateCacheClearInput",
+                (
+                    _f("model", "str?", description="Only delete results of this LiteLLM model ID"),
+                    _f("phash", "str?", description="Only delete results of the image with this pHash"),
+                    _f(
+                        "force",
+                        "bool",
+                        default=False,
+                        description="Required in JSON mode (--json): omitting it yields INVALID_INPUT "
+                        "since interactive confirmation cannot be driven over stdout.",
+                    ),
+                ),
+            ),
+        ),
+        outputs=(
+            _output(
+                "AnnotateCacheClearResult",
+                (_f("deleted", "int"), _f("model_id", "str?"), _f("phash", "str?")),
+                schema=AnnotateCacheClearResult,
+            ),
+        ),
+        errors=(ERROR_MODEL,),
+    ),
     "export create": ToolSpec(
         name="export create",
         path="export create",
@@ -2386,6 +2639,197 @@ TOOL_SPECS: dict[str, ToolSpec] = {
         ),
         errors=(ERROR_MODEL,),
     ),
+    "db maintain": ToolSpec(
+        name="db maintain",
+        path="db maintain",
+        summary=(
+            "Run ANALYZE, PRAGMA optimize, free-page reclaim and WAL truncation on the project DB, "
+            "reporting before/after statistics. Use --dry-run to only read statistics."
+        ),
+        read_only=False,
+        side_effects=("db_read", "db_write", "file_write"),
+        inputs=(
+            _input(
+                "DbMaintainInput",
+                (
+                    _f("project", "str", required=True),
+                    _f(
+                        "vacuum",
+                        "bool",
+                        default=False,
+                        description="Rebuild with VACUUM (applies page_size / auto_vacuum=INCREMENTAL)",
+                    ),
+                    _f("dry_run", "bool", default=False, description="Report statistics without changes"),
+                ),
+            ),
+        ),
+        outputs=(
+            _output(
+                "DbMaintainActionItem",
+                (
+                    _f("action", "str"),
+                    _f("ok", "bool"),
+                    _f("elapsed_ms", "float"),
+                    _f("detail", "dict?"),
+                    _f("error", "str?"),
+                ),
+                description="Emitted once per maintenance action (not emitted with --dry-run).",
+                schema=DbMaintainActionItem,
+            ),
+            _output(
+                "DbMaintainResult",
+                (
+                    _f("ok", "bool"),
+                    _f("before", "DatabaseStats"),
+                    _f("after", "DatabaseStats?"),
+                    _f("dry_run", "bool"),
+                ),
+                schema=DbMaintainResult,
+            ),
+        ),
+        errors=(ERROR_MODEL,),
+    ),
+    "debug db-profile": ToolSpec(
+        name="debug db-profile",
+        path="debug db-profile",
+        summary=(
+            "Run representative image search filters against a project DB and report per-statement "
+            "latency, EXPLAIN QUERY PLAN and full table scans."
+        ),
+        read_only=True,
+        side_effects=("db_read",),
+        inputs=(
+            _input(
+                "DebugDbProfileInput",
+                (
+                    _f("project", "str", required=True),
+                    _f("repeat", "int", default=3, description="Runs per filter combination (1-100)"),
+                    _f(
+                        "slow_ms",
+                        "float",
+                        default=0.0,
+                        description="Capture query plans for statements at or above this latency (0 = all)",
+                    ),
+                    _f("top", "int", default=20, description="Number of statements to list"),
+                ),
+            ),
+        ),
+        outputs=(
+            _output(
+                "DbProfileStatementItem",
+                (
+                    _f("sql", "str"),
+                    _f("caller", "str"),
+                    _f("count", "int"),
+                    _f("total_ms", "float"),
+                    _f("mean_ms", "float"),
+                    _f("p95_ms", "float"),
+                    _f("max_ms", "float"),
+                    _f("plan", "list[str]"),
+                    _f("full_scans", "list[str]"),
+                ),
+                schema=DbProfileStatementItem,
+            ),
+            _output(
+                "DebugDbProfileResult",
+                (
+                    _f("count", "int"),
+                    _f("project", "str"),
+                    _f("repeat", "int"),
+                    _f("slow_ms", "float"),
+                    _f("filters", "list[DbProfileFilterRun]"),
+                    _f("callers", "list[DbProfileCaller]"),
+                    _f("full_scans", "list[str]"),
+                ),
+                schema=DebugDbProfileResult,
+            ),
+        ),
+        errors=(ERROR_MODEL,),
+    ),
+    "debug import-time": ToolSpec(
+        name="debug import-time",
+        path="debug import-time",
+        summary=(
+            "Measure cold-start import time, module count and heavy modules of lorairo-cli "
+            "(or one command group) in a fresh interpreter."
+        ),
+        read_only=True,
+        side_effects=(),
+        inputs=(
+            _input(
+                "DebugImportTimeInput",
+                (
+                    _f(
+                        "command",
+                        "str?",
+                        description="Command group to measure (e.g. images). Defaults to the entry point.",
+                    ),
+                    _f("top", "int", default=15, description="Number of slowest modules to list"),
+                ),
+            ),
+        ),
+        outputs=(
+            _output(
+                "DebugImportTimeResult",
+                (
+                    _f("target", "str"),
+                    _f("import_seconds", "float"),
+                    _f("module_count", "int"),
+                    _f("heavy_modules", "list[str]"),
+                    _f("within_budget", "bool?", description="Only set for the entry point"),
+                    _f("budget", "StartupBudget?"),
+                    _f("slowest", "list[ImportTimingItem]"),
+                ),
+                schema=DebugImportTimeResult,
+            ),
+        ),
+        errors=(ERROR_MODEL,),
+    ),
+    "serve": ToolSpec(
+        name="serve",
+        path="serve",
+        summary=(
+            "Run a warm CLI daemon on a per-user Unix socket (or stop it with --stop). "
+            "JSON-mode commands are forwarded to it when LORAIRO_CLI_DAEMON is set."
+        ),
+        read_only=False,
+        side_effects=("db_read", "db_write", "file_read", "file_write"),
+        inputs=(
+            _input(
+                "ServeInput",
+                (
+                    _f(
+                        "socket",
+                        "path?",
+                        description="Unix socket path (default: $XDG_RUNTIME_DIR/lorairo/cli.sock)",
+                    ),
+                    _f(
+                        "idle_timeout",
+                        "float",
+                        default=900.0,
+                        description="Exit after this many idle seconds (0 = never)",
+                    ),
+                    _f(
+                        "stop", "bool", default=False, description="Stop the daemon listening on the socket"
+                    ),
+                ),
+                description="The socket directory must be owned by the user and not accessible by others.",
+            ),
+        ),
+        outputs=(
+            _output(
+                "ServeResult",
+                (
+                    _f("socket", "str"),
+                    _f("pid", "int?", description="Daemon pid (start only)"),
+                    _f("idle_timeout", "float?", description="Start only"),
+                ),
+                description="Emitted once when the daemon starts listening, or after --stop.",
+                schema=ServeResult,
+            ),
+        ),
+        errors=(ERROR_MODEL,),
+    ),
 }
 
 
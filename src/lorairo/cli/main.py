@@ -13,20 +13,23 @@ from lorairo.cli._early_init import early_init
 
 early_init()
 
+import os
 import sys
 import traceback
+from collections.abc import Callable
 from enum import StrEnum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import click
 import typer
-from rich.table import Table
 
 from lorairo.cli._boundary import command_boundary
 from lorairo.cli._console import make_console
 from lorairo.cli._emit import emit_error, emit_result
 from lorairo.cli._errors import ErrorCode, ErrorInfo, classify_exception, hint_for
 from lorairo.cli._glyphs import FAIL, OK
+from lorairo.cli._lazy_group import LazySubcommand, lazy_group_class
 from lorairo.cli._output_mode import (
     has_prescanned_mode,
     is_json_mode,
@@ -34,15 +37,35 @@ from lorairo.cli._output_mode import (
     set_json_mode,
     strip_mode_flags,
 )
-from lorairo.cli.commands import annotate, batch, errors, export, images, models, project, tags
-from lorairo.cli.introspection import emit_describe, emit_list_commands
-from lorairo.services.service_container import get_service_container
 from lorairo.utils.config import DEFAULT_CLI_LOG_PATH, DEFAULT_CONFIG_PATH
 from lorairo.utils.log import initialize_logging
 
 if TYPE_CHECKING:
     from lorairo.services.service_container import ServiceContainer
 
+# `lorairo-cli serve` がこの秒数リクエストを受けなければ終了する
+_DAEMON_IDLE_TIMEOUT_S = 900.0
+
+# 直近に initialize_logging へ渡した設定と、そのときの sys.stderr
+_logging_state: tuple[dict[str, Any], object] | None = None
+
+# ===== サブコマンドグループ (遅延ロード) =====
+# 各グループのモジュールは ServiceContainer / SQLAlchemy / PIL 等を import するため、
+# 実際に呼ばれたグループだけを import する (`--help` / `version` は読み込まない)。
+# 登録順が root help の表示順になる。
+_SUBCOMMANDS: dict[str, LazySubcommand] = {
+    "project": LazySubcommand("lorairo.cli.commands.project:app", "Project management commands"),
+    "images": LazySubcommand("lorairo.cli.commands.images:app", "Image management commands"),
+    "annotate": LazySubcommand("lorairo.cli.commands.annotate:app", "Annotation commands"),
+    "export": LazySubcommand("lorairo.cli.commands.export:app", "Dataset export commands"),
+    "models": LazySubcommand("lorairo.cli.commands.models:app", "Model registry commands"),
+    "batch": LazySubcommand("lorairo.cli.commands.batch:app", "Provider Batch API job commands"),
+    "tags": LazySubcommand("lorairo.cli.commands.tags:app", "Tag editing commands (agent-friendly)"),
+    "errors": LazySubcommand("lorairo.cli.commands.errors:app", "Error record management commands"),
+    "db": LazySubcommand("lorairo.cli.commands.db:app", "Project database maintenance commands"),
+    "debug": LazySubcommand("lorairo.cli.commands.debug:app", "Diagnostics for CLI developers"),
+}
+
 
 class LogLevel(StrEnum):
     """`--log-level` で指定可能なログレベル。"""
@@ -81,6 +104,7 @@ app = typer.Typer(
     ),
     add_completion=True,
     no_args_is_help=True,
+    cls=lazy_group_class(_SUBCOMMANDS),
 )
 
 # Rich console (Issue #254: Windows では safe_box=True で ASCII 罫線)
@@ -88,15 +112,12 @@ console = make_console()
 # エラー/人間向け装飾は stderr へ (stdout は機械可読 JSONL 専用、ADR 0057 §1)
 console_err = make_console(stderr=True)
 
-# ===== サブコマンドグループ登録 =====
-app.add_typer(project.app, name="project", help="Project management commands")
-app.add_typer(images.app, name="images", help="Image management commands")
-app.add_typer(annotate.app, name="annotate", help="Annotation commands")
-app.add_typer(export.app, name="export", help="Dataset export commands")
-app.add_typer(models.app, name="models", help="Model registry commands")
-app.add_typer(batch.app, name="batch", help="Provider Batch API job commands")
-app.add_typer(tags.app, name="tags", help="Tag editing commands (agent-friendly)")
-app.add_typer(errors.app, name="errors", help="Error record management commands")
+
+def get_service_container() -> ServiceContainer:
+    """ServiceContainer を返す (``status`` 実行時まで services の import を遅延する)。"""
+    from lorairo.services.service_container import get_service_container as _get_service_container
+
+    return _get_service_container()
 
 
 @app.callback()
@@ -124,8 +145,6 @@ def _configure(
     prescan が先に解決済みだが、CliRunner 等 ``main`` をすり抜ける経路でも本 callback が
     モードを確定できるよう、明示フラグが与えられたら反映する (未指定なら env を見る)。
     """
-    import os
-
     if json_output is not None:
         set_json_mode(json_output)
     elif not has_prescanned_mode():
@@ -135,14 +154,19 @@ def _configure(
     # CLI ログパスは env で上書き可能にする (Issue #1176: テストや別環境が
     # 本番 logs/lorairo-cli.log を汚染しないための隔離ポイント)
     cli_log_path = os.environ.get("LORAIRO_CLI_LOG_PATH") or str(DEFAULT_CLI_LOG_PATH)
-    initialize_logging(
-        {
-            "level": log_level.value,
-            "file_path": cli_log_path,
-            "rotation": "25 MB",
-            "levels": {},
-        }
-    )
+    log_config: dict[str, Any] = {
+        "level": log_level.value,
+        "file_path": cli_log_path,
+        "rotation": "25 MB",
+        "levels": {},
+    }
+    # 常駐デーモンでは同じ設定・同じ stderr で毎リクエスト呼ばれる。シンクの再作成
+    # (loguru の add は数 ms かかる) を避け、設定か stderr が変わったときだけ作り直す。
+    global _logging_state
+    if _logging_state is not None and _logging_state[0] == log_config and _logging_state[1] is sys.stderr:
+        return
+    initialize_logging(log_config)
+    _logging_state = (log_config, sys.stderr)
 
 
 # CLI のバージョン文字列 (pyproject.toml の version と一致させる)。
@@ -171,6 +195,8 @@ def version() -> None:
 @app.command("list-commands")
 def list_commands() -> None:
     """List machine-readable command metadata."""
+    from lorairo.cli.introspection import emit_list_commands
+
     with command_boundary():
         emit_list_commands()
 
@@ -186,12 +212,16 @@ def describe(
     ),
 ) -> None:
     """Describe a command for agents and CI."""
+    from lorairo.cli.introspection import emit_describe
+
     with command_boundary():
         emit_describe(command, schema=schema)  # type: ignore[arg-type]
 
 
 def _show_cli_status(container: ServiceContainer) -> None:
     """CLIモードのステータス表示。設定ファイルとAPIキー状況を表示する。"""
+    from rich.table import Table
+
     table = Table(title="LoRAIro CLI Status")
     table.add_column("Item", style="cyan")
     table.add_column("Status", style="green")
@@ -217,6 +247,8 @@ def _show_cli_status(container: ServiceContainer) -> None:
 
 def _show_gui_status(summary: dict[str, Any]) -> None:
     """GUIモードのステータス表示。サービス初期化状況テーブルを表示する。"""
+    from rich.table import Table
+
     table = Table(title="Service Status")
     table.add_column("Service", style="cyan")
     table.add_column("Status", style="green")
@@ -276,6 +308,119 @@ def status() -> None:
             _show_gui_status(summary)
 
 
+@app.command("serve")
+def serve(
+    socket_path: Path | None = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket path (default: per-user runtime directory).",
+    ),
+    idle_timeout: float = typer.Option(
+        _DAEMON_IDLE_TIMEOUT_S,
+        "--idle-timeout",
+        min=0,
+        help="Exit after this many seconds without requests (0 = never).",
+    ),
+    stop: bool = typer.Option(False, "--stop", help="Stop the daemon listening on the socket."),
+) -> None:
+    """Run a warm CLI daemon on a local Unix socket (opt-in).
+
+    ServiceContainer / DB 接続 / サブコマンドを保持したまま常駐し、socket 経由の
+    コマンドを in-process で実行します。``LORAIRO_CLI_DAEMON=1`` (または socket パス) を
+    設定すると、``--json`` のコマンドは自動的にデーモンへ転送されます
+    (デーモンが居なければ通常どおり実行)。
+
+    Example:
+        lorairo-cli serve --idle-timeout 600 &
+
+        LORAIRO_CLI_DAEMON=1 lorairo-cli --json images show --project demo 1
+
+        lorairo-cli serve --stop
+    """
+    from lorairo.cli import _daemon
+
+    with command_boundary():
+        if not _daemon.supports_unix_sockets():
+            raise click.UsageError(
+                "serve requires Unix domain sockets, which this platform does not support"
+            )
+        path = socket_path or _daemon.default_socket_path()
+
+        if stop:
+            try:
+                _daemon.send_request(path, {"op": "shutdown"}, timeout=10.0)
+            except _daemon.DaemonUnavailableError as exc:
+                raise FileNotFoundError(f"No CLI daemon is listening on {path}") from exc
+            if is_json_mode():
+                emit_result(f"CLI daemon stopped: {path}", socket=str(path))
+            else:
+                console.print(f"[green]{OK}[/green] CLI daemon stopped: {path}")
+            return
+
+        # root の Click グループは 1 度だけ構築して使い回す (遅延ロード済みの
+        # サブコマンドも保持されるため、2 回目以降は再構築も import も発生しない)
+        root = typer.main.get_command(app)
+        server = _daemon.CliDaemonServer(
+            path,
+            _run_in_daemon(root),
+            idle_timeout=idle_timeout,
+            before_request=_isolate_daemon_project,
+        )
+        try:
+            _warm_up_daemon(root)
+            if is_json_mode():
+                emit_result(
+                    f"CLI daemon listening on {path}",
+                    socket=str(path),
+                    pid=os.getpid(),
+                    idle_timeout=idle_timeout,
+                )
+            else:
+                console.print(f"[green]{OK}[/green] CLI daemon listening on {path} (pid {os.getpid()})")
+            sys.stdout.flush()
+            server.serve_until_idle()
+        finally:
+            server.server_close()
+
+
+def _run_in_daemon(root: click.Command) -> Callable[[list[str], bool], int]:
+    """デーモンが 1 リクエストを ``root`` で実行する関数を返す。"""
+
+    def runner(argv: list[str], json_mode: bool) -> int:
+        try:
+            run_cli(["--json" if json_mode else "--no-json", *argv], command=root)
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                return exc.code or 0
+            return 1
+        return 0
+
+    return runner
+
+
+def _isolate_daemon_project(argv: list[str]) -> None:
+    """``--project`` の無いリクエストに前リクエストのプロジェクト DB を使わせない。"""
+    from lorairo.cli._daemon import requested_project
+
+    if requested_project(argv) is None:
+        get_service_container().clear_active_project()
+
+
+def _warm_up_daemon(root: click.Command) -> None:
+    """常駐前にサービスを初期化し、サブコマンドを ``root`` に読み込んでおく。"""
+    container = get_service_container()
+    _ = container.config_service
+    _ = container.project_management_service
+    if not isinstance(root, click.Group):
+        return
+    ctx = click.Context(root)
+    for name in root.list_commands(ctx):
+        try:
+            root.get_command(ctx, name)
+        except Exception as exc:  # 任意依存の欠落はそのグループの初回実行時に報告する
+            console_err.print(f"[yellow]Warning:[/yellow] Failed to preload '{name}': {exc}")
+
+
 def _report_error(message: str, info: ErrorInfo, *, json_mode: bool) -> None:
     """エラーを出力モードに応じて出す (JSONL or rich)。
 
@@ -338,6 +483,9 @@ def main(argv: list[str] | None = None) -> None:
     ``standalone_mode=False`` で Typer/Click の自動 exit をバイパスして、
     usage error も含む全失敗を 1 箇所で構造化エラー + exit code に写す。
 
+    env ``LORAIRO_CLI_DAEMON`` が設定されていれば、JSON モードのコマンドを
+    ``lorairo-cli serve`` のデーモンへ転送する (デーモンが居なければ in-process で実行)。
+
     ``LORAIRO_CLI_MODE`` 設定とログ初期化は ``@app.callback()`` (``_configure``)
     でサブコマンド実行時に行う (Issue #539 / #540)。stdio 初期化は module top-level の
     ``early_init()`` で完了済。
@@ -346,6 +494,40 @@ def main(argv: list[str] | None = None) -> None:
         argv: 引数列 (省略時は ``sys.argv[1:]`` を Click が解決)。テスト用に注入可能。
     """
     raw_argv = list(sys.argv[1:] if argv is None else argv)
+    if os.environ.get("LORAIRO_CLI_DAEMON"):
+        exit_code = _forward_to_daemon(raw_argv)
+        if exit_code is not None:
+            if exit_code != 0:
+                raise SystemExit(exit_code)
+            return
+    run_cli(raw_argv)
+
+
+def _forward_to_daemon(raw_argv: list[str]) -> int | None:
+    """コマンドをデーモンで実行して exit code を返す。転送しなければ ``None``。"""
+    from lorairo.cli import _daemon
+
+    socket_path = _daemon.resolve_client_socket()
+    json_mode = resolve_output_mode(raw_argv)
+    if socket_path is None or not _daemon.should_forward(raw_argv, json_mode):
+        return None
+    try:
+        return _daemon.forward(raw_argv, json_mode, socket_path)
+    except (OSError, ValueError) as exc:
+        # 送信後の切断は再実行すると二重適用になり得るため、in-process に戻さずエラーにする
+        return _handle_cli_exception(exc, json_mode=json_mode)
+
+
+def run_cli(raw_argv: list[str], *, command: Callable[..., Any] = app) -> None:
+    """出力モードを解決してコマンドを実行し、失敗を exit code に写す。
+
+    Args:
+        raw_argv: プログラム名を除いた引数列。
+        command: 実行する Typer app / Click コマンド (デーモンは構築済みグループを渡す)。
+
+    Raises:
+        SystemExit: 非 0 の exit code で終了する場合。
+    """
     json_mode = resolve_output_mode(raw_argv)
     set_json_mode(json_mode, prescanned=True)
     # モードフラグは prescan 済みなので Click パース前に除去する (サブコマンド後位置でも
@@ -354,7 +536,7 @@ def main(argv: list[str] | None = None) -> None:
     try:
         # standalone_mode=False: ctx.exit() / --help は exit code を返し、
         # ClickException / Abort / 一般例外は伝播する。
-        result = app(args=cli_argv, standalone_mode=False)
+        result = command(args=cli_argv, standalone_mode=False)
     except click.exceptions.Abort:
         raise SystemExit(130) from None
     except click.ClickException as exc:
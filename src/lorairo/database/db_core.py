@@ -5,8 +5,11 @@
 `config/lorairo.toml` から読み込まれます。
 """
 
+import os
+import zlib
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +21,15 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from ..utils.config import get_config
 from ..utils.log import logger
+from .maintenance import (
+    StoragePragmas,
+    available_memory_bytes,
+    database_file_bytes,
+    sqlite_file_path,
+    tune_storage_pragmas,
+)
+from .pool_metrics import install_pool_metrics, install_writer_gate
+from .query_profiler import DEFAULT_SLOW_MS, get_query_profiler
 
 # --- Configuration --- #
 
@@ -29,6 +41,21 @@ dir_config = config.get("directories", {})
 # SQLite 書き込みロック競合時の待機時間 (ミリ秒)。GUI/CLI 併用時の一時的な
 # `database is locked` を即時失敗させず、この時間まで再試行待機する (Issue #767)。
 BUSY_TIMEOUT_MS: int = int(db_config.get("busy_timeout_ms", 30000))
+# 読み取り専用エンジン (検索・件数・facet) の常駐接続数。同数まで一時的に超過を許す。
+READ_POOL_SIZE: int = max(1, int(db_config.get("read_pool_size", 4)))
+# クエリのレイテンシ / プラン計測 (オプトイン)。環境変数 LORAIRO_DB_PROFILE=1 でも有効化できる。
+QUERY_PROFILING: bool = bool(db_config.get("query_profiling", False)) or os.environ.get(
+    "LORAIRO_DB_PROFILE", ""
+).lower() in ("1", "true", "yes")
+# この時間 (ミリ秒) 以上かかった SELECT の EXPLAIN QUERY PLAN を記録する
+SLOW_QUERY_MS: float = float(db_config.get("slow_query_ms", DEFAULT_SLOW_MS))
+# DB サイズと空きメモリに合わせて cache_size / mmap_size / temp_store を接続ごとに設定する
+# (maintenance.tune_storage_pragmas)。mmap が問題になるファイルシステムでは無効化できる。
+STORAGE_TUNING: bool = bool(db_config.get("storage_tuning", True))
+
+get_query_profiler().slow_ms = SLOW_QUERY_MS
+if QUERY_PROFILING:
+    get_query_profiler().enable()
 
 
 def get_project_dir(base_dir_name: str, project_name: str) -> Path:
@@ -204,27 +231,53 @@ def resolve_stored_path(stored_path: str) -> Path:
     if cached is not None:
         return cached
 
+    resolved = _join_stored_path(path, project_root)
+    logger.trace(f"パス解決: {stored_path} -> {resolved}")
+    _resolve_cache[stored_path] = resolved
+    return resolved
+
+
+def _join_stored_path(path: Path, project_root: Path) -> Path:
+    """相対の stored path (バックスラッシュ正規化済み) をプロジェクトルートと結合する。"""
     # 二重結合防止: stored_path にプロジェクトディレクトリ名が含まれている場合、
     # それ以降の部分のみをプロジェクトルートからの相対パスとして使用
     # (例: "lorairo_data/main_dataset_20250707_001/image_dataset/..." →
     #  "image_dataset/..." を抽出して project_root と結合)
-    project_dir_name = project_root.name
-    try:
-        idx = path.parts.index(project_dir_name)
-        remainder_parts = path.parts[idx + 1 :]
+    if project_root.name in path.parts:
+        remainder_parts = path.parts[path.parts.index(project_root.name) + 1 :]
         if remainder_parts:
-            resolved = project_root.joinpath(*remainder_parts)
-            # per-item firehose のため TRACE (通常デバッグでは抑制、ADR 0047)
-            logger.trace(f"パス解決（プレフィックス正規化）: {stored_path} -> {resolved}")
-            _resolve_cache[stored_path] = resolved
-            return resolved
+            return project_root.joinpath(*remainder_parts)
+    return project_root / path  # バックスラッシュ正規化済みの path を使う (Issue #707)
+
+
+def path_key(path: Path, project_root: Path) -> str:
+    """絶対パスから ``images.path_key`` (パス検索用の正規化キー) を求める。
+
+    プロジェクトルート配下はルートからの相対パス、それ以外は絶対パスを、``..`` / ``.`` を
+    畳んだ POSIX 形式にする (プロジェクトを移動してもキーが変わらないように)。
+    シンボリックリンクは解決しない (ファイルシステムに触れない字句的な正規化)。
+    """
+    normalized = Path(os.path.normcase(os.path.normpath(path)))
+    root = Path(os.path.normcase(os.path.normpath(project_root)))
+    try:
+        return normalized.relative_to(root).as_posix()
     except ValueError:
-        pass
+        return normalized.as_posix()
 
-    resolved = project_root / path  # バックスラッシュ正規化済みの path を使う (Issue #707)
-    logger.trace(f"パス解決: {stored_path} -> {resolved}")
-    _resolve_cache[stored_path] = resolved
-    return resolved
+
+def stored_path_key(stored_path: str, project_root: Path | None = None) -> str:
+    """DB内の stored_image_path から ``images.path_key`` を求める。
+
+    Args:
+        stored_path: DB内のパス（相対パスまたは絶対パス）
+        project_root: プロジェクトルート。省略時は現在接続中のプロジェクト
+
+    Returns:
+        :func:`path_key` による正規化キー
+    """
+    root = project_root if project_root is not None else get_current_project_root()
+    path = Path(stored_path.replace("\\", "/"))
+    return path_key(path if path.is_absolute() else _join_stored_path(path, root), root)
 
 
 # --- Tag DB Path --- #
@@ -282,11 +335,77 @@ def get_user_tag_db_path() -> Path | None:
 DATABASE_URL = f"sqlite:///{IMG_DB_PATH.resolve()}?check_same_thread=False"
 
 
-def create_db_engine(database_url: str | None = None) -> Engine:
-    """指定された URL で SQLAlchemy エンジンを作成し、イベントリスナーを設定します。"""
+def _apply_sqlite_pragmas(cursor: Any, *, read_only: bool, storage: StoragePragmas | None = None) -> None:
+    """接続ごとの PRAGMA を設定する (各 PRAGMA の失敗は警告に留める)。
+
+    Args:
+        cursor: DBAPI カーソル。
+        read_only: ``PRAGMA query_only`` を設定するか。
+        storage: ``cache_size`` / ``mmap_size`` / ``temp_store`` の値。None なら SQLite 既定のまま。
+    """
+    try:
+        cursor.execute("PRAGMA foreign_keys=ON")
+        logger.debug("PRAGMA foreign_keys=ON executed.")
+    except Exception:
+        logger.opt(exception=True).warning("Failed to configure PRAGMA foreign_keys")
+
+    try:
+        # busy_timeout は synchronous より先に、かつ単独の try/except で設定する
+        # (Issue #767 の待機が他 PRAGMA の失敗で無効化されるのを防ぐ、Issue #1002)。
+        cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        logger.debug(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS} executed.")
+    except Exception:
+        logger.opt(exception=True).warning("Failed to configure PRAGMA busy_timeout")
+
+    # Note: journal_mode=WAL は per-connection では設定しない (Issue #1165)。
+    # WAL は DB ヘッダに永続化されるため、接続ごとに再設定する必要はない。毎接続で
+    # PRAGMA journal_mode=WAL を実行すると、GUI/CLI 併用時 (9p bind mount) にその
+    # 一瞬の排他取得が busy_timeout の効かないまま database is locked / disk I/O error
+    # になり、接続セットアップ自体がクラッシュしていた。WAL の設定は DB 準備時に
+    # 1 回だけ _ensure_wal_journal_mode() で行う。
+
+    try:
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        logger.debug("PRAGMA synchronous=NORMAL executed.")
+    except Exception:
+        logger.opt(exception=True).warning("Failed to configure PRAGMA synchronous")
+
+    if storage is not None:
+        try:
+            # 負値は KiB 単位 (ページサイズに依存しない上限) の指定
+            cursor.execute(f"PRAGMA cache_size=-{storage.cache_size_kib}")
+            cursor.execute(f"PRAGMA mmap_size={storage.mmap_size}")
+            cursor.execute(f"PRAGMA temp_store={storage.temp_store}")
+        except Exception:
+            logger.opt(exception=True).warning("Failed to configure storage PRAGMAs")
+
+    if read_only:
+        try:
+            # 読み取り接続が誤って書き込みロックを取らないことを SQLite 側で保証する
+            cursor.execute("PRAGMA query_only=ON")
+        except Exception:
+            logger.opt(exception=True).warning("Failed to configure PRAGMA query_only")
+
+
+def create_db_engine(database_url: str | None = None, *, read_only: bool = False) -> Engine:
+    """指定された URL で SQLAlchemy エンジンを作成し、イベントリスナーを設定します。
+
+    書き込みエンジン (既定) には同一プロセス内の書き込みトランザクションを直列化する
+    writer gate を、``read_only=True`` のエンジンには ``PRAGMA query_only`` と
+    ``READ_POOL_SIZE`` のプールを設定する。どちらもプール計測を取り付け
+    (``pool_metrics.get_engine_metrics``)、クエリ計測の対象に登録する
+    (``query_profiler.get_query_profiler``)。
+
+    Args:
+        database_url: 接続 URL。省略時は ``DATABASE_URL``。
+        read_only: 検索・件数取得専用のエンジンを作る場合 ``True``。
+
+    Returns:
+        Engine: 作成したエンジン。
+    """
     if database_url is None:
         database_url = DATABASE_URL
-    logger.info(f"Creating SQLAlchemy engine for: {database_url}")
+    logger.info(f"Creating SQLAlchemy {'read-only ' if read_only else ''}engine for: {database_url}")
     # StaticPool は 1 本の生コネクションを全セッションで共有するため、GUI メインスレッドと
     # RefinementWorker (QThread) が同一エンジンを共有すると sqlite3 の真の同時アクセスで
     # "bad parameter or other API misuse" を招く (Issue #1002)。実ファイル DB では
@@ -296,10 +415,21 @@ def create_db_engine(database_url: str | None = None) -> Engine:
         "connect_args": {"check_same_thread": False},  # SQLite に必要
         "echo": False,  # SQL 文のデバッグ用に True に設定
     }
-    if ":memory:" in database_url:
+    in_memory = ":memory:" in database_url
+    if in_memory:
         engine_kwargs["poolclass"] = StaticPool
+    elif read_only:
+        engine_kwargs["pool_size"] = READ_POOL_SIZE
+        engine_kwargs["max_overflow"] = READ_POOL_SIZE
     engine = create_engine(database_url, **engine_kwargs)
 
+    # ストレージ PRAGMA はエンジン作成時の DB サイズ / 空きメモリで 1 回だけ決める
+    db_path = sqlite_file_path(engine)
+    storage: StoragePragmas | None = None
+    if STORAGE_TUNING and db_path is not None:
+        storage = tune_storage_pragmas(database_file_bytes(db_path), available_memory_bytes())
+        logger.debug(f"SQLite storage PRAGMAs for {db_path.name}: {storage}")
+
     # --- イベントリスナー設定 ---
     # リスナー関数をエンジン作成時に動的に定義・登録する
 
@@ -311,32 +441,7 @@ def create_db_engine(database_url: str | None = None) -> Engine:
 
         cursor = dbapi_connection.cursor()
         try:
-            try:
-                cursor.execute("PRAGMA foreign_keys=ON")
-                logger.debug("PRAGMA foreign_keys=ON executed.")
-            except Exception:
-                logger.opt(exception=True).warning("Failed to configure PRAGMA foreign_keys")
-
-            try:
-                # busy_timeout は synchronous より先に、かつ単独の try/except で設定する
-                # (Issue #767 の待機が他 PRAGMA の失敗で無効化されるのを防ぐ、Issue #1002)。
-                cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
-                logger.debug(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS} executed.")
-            except Exception:
-                logger.opt(exception=True).warning("Failed to configure PRAGMA busy_timeout")
-
-            # Note: journal_mode=WAL は per-connection では設定しない (Issue #1165)。
-            # WAL は DB ヘッダに永続化されるため、接続ごとに再設定する必要はない。毎接続で
-            # PRAGMA journal_mode=WAL を実行すると、GUI/CLI 併用時 (9p bind mount) にその
-            # 一瞬の排他取得が busy_timeout の効かないまま database is locked / disk I/O error
-            # になり、接続セットアップ自体がクラッシュしていた。WAL の設定は DB 準備時に
-            # 1 回だけ _ensure_wal_journal_mode() で行う。
-
-            try:
-                cursor.execute("PRAGMA synchronous=NORMAL")
-                logger.debug("PRAGMA synchronous=NORMAL executed.")
-            except Exception:
-                logger.opt(exception=True).warning("Failed to configure PRAGMA synchronous")
+            _apply_sqlite_pragmas(cursor, read_only=read_only, storage=storage)
         finally:
             cursor.close()
 
@@ -344,9 +449,32 @@ def create_db_engine(database_url: str | None = None) -> Engine:
     # Tag databases no longer use ATTACH DATABASE; managed via genai-tag-db-tools repository pattern
     # Base DBs + User DB are accessed through public API (search_tags, register_tag, MergedTagReader)
 
+    install_pool_metrics(engine, "read" if read_only else "write")
+    if not read_only and not in_memory:
+        install_writer_gate(engine, timeout_s=BUSY_TIMEOUT_MS / 1000)
+    get_query_profiler().register_engine(engine)
+
     return engine
 
 
+def create_read_engine(write_engine: Engine) -> Engine:
+    """``write_engine`` と同じ DB を読む読み取り専用エンジンを作成する。
+
+    :memory: (接続ごとに別 DB になる) と SQLite 以外のバックエンドでは
+    ``write_engine`` をそのまま返す。
+
+    Args:
+        write_engine: 書き込みエンジン。
+
+    Returns:
+        Engine: 読み取り専用エンジン (または ``write_engine``)。
+    """
+    url = write_engine.url
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return write_engine
+    return create_db_engine(url.render_as_string(hide_password=False), read_only=True)
+
+
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
     """指定されたエンジンにバインドされたセッションファクトリを作成します。"""
     logger.info("Creating SQLAlchemy session factory.")
@@ -378,6 +506,41 @@ def _ensure_wal_journal_mode(engine: Engine) -> None:
         logger.opt(exception=True).warning("Failed to set WAL journal mode at DB preparation")
 
 
+def _initialize_new_database_layout(engine: Engine) -> None:
+    """まだ何も作られていない DB に page_size と ``auto_vacuum=INCREMENTAL`` を設定する。
+
+    どちらも DB ファイルのレイアウトに関わるため、既存 DB では VACUUM し直さない限り
+    変えられない (``lorairo-cli db maintain --vacuum``)。incremental にしておくと、画像削除で
+    生じた空きページを ``PRAGMA incremental_vacuum`` で全体を書き直さずに返却できる。
+
+    Args:
+        engine: 対象の SQLAlchemy エンジン。``:memory:`` DB・既存 DB では何もしない。
+    """
+    db_path = sqlite_file_path(engine)
+    if db_path is None:
+        return
+    try:
+        with engine.connect() as connection:
+            connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+            if connection.exec_driver_sql("SELECT count(*) FROM sqlite_master").scalar():
+                return
+            page_size = tune_storage_pragmas(
+                database_file_bytes(db_path), available_memory_bytes()
+            ).page_size
+            connection.exec_driver_sql(f"PRAGMA page_size={page_size}")
+            connection.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+            # 空 DB の VACUUM でヘッダを書き出し、上記の設定を確定させる
+            connection.exec_driver_sql("VACUUM")
+            logger.debug(f"New project DB layout: page_size={page_size}, auto_vacuum=INCREMENTAL")
+    except SQLAlchemyError:
+        logger.opt(exception=True).warning("Failed to initialize new DB page layout")
+
+
+_CANONICAL_MODEL_TYPES = ("tags", "scores", "caption", "upscaler", "multimodal", "ratings")
+
+_MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+
+
 def _ensure_model_types_seeded(engine: Engine) -> None:
     """Ensure canonical model type rows exist after create_all().
 
@@ -388,11 +551,10 @@ def _ensure_model_types_seeded(engine: Engine) -> None:
 
     from .schema import ModelType
 
-    canonical_model_types = ("tags", "scores", "caption", "upscaler", "multimodal", "ratings")
     session_factory = create_session_factory(engine)
     with session_factory() as session:
         existing = set(session.execute(select(ModelType.name)).scalars())
-        missing = [ModelType(name=name) for name in canonical_model_types if name not in existing]
+        missing = [ModelType(name=name) for name in _CANONICAL_MODEL_TYPES if name not in existing]
         if not missing:
             return
         session.add_all(missing)
@@ -404,11 +566,10 @@ def _make_alembic_config(project_db_path: Path) -> Any:
     """Create an Alembic config pinned to the given project database."""
     from alembic.config import Config
 
-    migrations_dir = Path(__file__).resolve().parent / "migrations"
     alembic_config = Config()
     alembic_config.set_main_option(
         "script_location",
-        str(migrations_dir),
+        str(_MIGRATIONS_DIR),
     )
     alembic_config.set_main_option(
         "sqlalchemy.url",
@@ -441,6 +602,50 @@ def _upgrade_alembic_head(project_db_path: Path) -> None:
     command.upgrade(_make_alembic_config(project_db_path), "head")
 
 
+@cache
+def _schema_fingerprint() -> int:
+    """Return the fingerprint of the schema this build expects in a project DB.
+
+    The fingerprint covers the migration revision files (their file names carry the
+    revision ids), the table/column/index shape of ``Base.metadata`` and the canonical
+    model types seeded after ``create_all``. Any change to one of them produces a new
+    value, so a DB stamped by an older build takes the full preparation path again.
+
+    The value is stored in SQLite's ``PRAGMA user_version`` (signed 32-bit) and is
+    never 0, which is the value of a DB that has never been prepared.
+    """
+    from .schema import Base
+
+    parts = sorted(path.name for path in (_MIGRATIONS_DIR / "versions").glob("*.py"))
+    for table in sorted(Base.metadata.sorted_tables, key=lambda t: t.name):
+        parts.append(table.name)
+        parts.extend(f"{column.name}:{column.type!r}:{column.nullable}" for column in table.columns)
+        parts.extend(sorted(f"ix:{index.name}:{index.unique}" for index in table.indexes))
+    parts.extend(_CANONICAL_MODEL_TYPES)
+    return zlib.crc32("\n".join(parts).encode("utf-8")) & 0x7FFFFFFF or 1
+
+
+def _read_schema_fingerprint(engine: Engine) -> int:
+    """Return the fingerprint stored in the DB (0 when never prepared or unreadable)."""
+    try:
+        with engine.connect() as connection:
+            value = connection.exec_driver_sql("PRAGMA user_version").scalar()
+    except SQLAlchemyError:
+        logger.opt(exception=True).warning("Failed to read schema fingerprint; running full DB preparation")
+        return 0
+    return int(value or 0)
+
+
+def _write_schema_fingerprint(engine: Engine) -> None:
+    """Record that the DB matches this build's schema (see :func:`_schema_fingerprint`)."""
+    try:
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f"PRAGMA user_version = {_schema_fingerprint()}")
+    except SQLAlchemyError:
+        # 書けなくても次回もフル準備になるだけで、DB 自体は利用できる
+        logger.opt(exception=True).warning("Failed to write schema fingerprint")
+
+
 def _prepare_project_database(project_db_path: Path) -> Engine:
     """Create or migrate a project image DB before repositories use it.
 
@@ -449,12 +654,24 @@ def _prepare_project_database(project_db_path: Path) -> Engine:
     Existing Alembic-managed DBs are upgraded before ``create_all`` can mask
     missing tables, which prevents stale production DBs from failing later during
     search result loading.
-    """
-    from .schema import Base
 
+    When the DB already carries this build's :func:`_schema_fingerprint`, all of the
+    above (including loading the migration scripts) is skipped after one
+    ``PRAGMA user_version`` read. Every Alembic run resets the fingerprint
+    (see ``migrations/env.py``), so out-of-band migrations also force a full pass.
+    """
     project_db_path.parent.mkdir(parents=True, exist_ok=True)
     db_url = f"sqlite:///{project_db_path.resolve()}?check_same_thread=False"
     engine = create_db_engine(db_url)
+
+    if _read_schema_fingerprint(engine) == _schema_fingerprint():
+        logger.debug(f"Project DB schema fingerprint matches; skipping migrations: {project_db_path}")
+        return engine
+
+    from .schema import Base
+
+    # page_size / auto_vacuum は WAL 化・テーブル作成より前でないと反映されない
+    _initialize_new_database_layout(engine)
     # WAL は接続ごとではなく DB 準備時に 1 回だけ永続化する (Issue #1165)。
     _ensure_wal_journal_mode(engine)
 
@@ -462,20 +679,26 @@ def _prepare_project_database(project_db_path: Path) -> Engine:
         Base.metadata.create_all(engine)
         _ensure_model_types_seeded(engine)
         _stamp_alembic_head(project_db_path)
+        _write_schema_fingerprint(engine)
         logger.info(f"Initialized new project DB schema and stamped Alembic head: {project_db_path}")
         return engine
 
     if _has_alembic_version_table(engine):
         _upgrade_alembic_head(project_db_path)
         logger.info(f"Applied pending Alembic migrations for project DB: {project_db_path}")
+        tracked = True
     else:
         logger.warning(
             "Project DB has existing tables but no alembic_version table; "
             f"leaving migration state unchanged: {project_db_path}"
         )
+        tracked = False
 
     Base.metadata.create_all(engine)
     _ensure_model_types_seeded(engine)
+    # Alembic 管理外の DB は migration 状態を保証できないため、毎回フル準備を続ける
+    if tracked:
+        _write_schema_fingerprint(engine)
     return engine
 
 
@@ -495,10 +718,32 @@ def create_project_session_factory(project_db_path: Path) -> sessionmaker[Sessio
     return create_session_factory(engine)
 
 
+def create_project_session_factories(
+    project_db_path: Path,
+) -> tuple[sessionmaker[Session], sessionmaker[Session]]:
+    """指定プロジェクト DB 用の書き込み / 読み取り専用セッションファクトリを生成。
+
+    DB の準備は :func:`create_project_session_factory` と同じ。読み取り専用ファクトリは
+    検索・件数・facet 取得用で、書き込みトランザクションの間も待たされない。
+
+    Args:
+        project_db_path: プロジェクト DB ファイルの絶対パス。
+
+    Returns:
+        tuple[sessionmaker[Session], sessionmaker[Session]]: (書き込み, 読み取り専用)。
+    """
+    engine = _prepare_project_database(project_db_path)
+    return create_session_factory(engine), create_session_factory(create_read_engine(engine))
+
+
 # --- デフォルトの Engine と Session Factory --- #
 # 通常のアプリケーション実行時に使用される
 default_engine: Engine | None = None
 _default_session_factory: sessionmaker[Session] | None = None
+default_read_engine: Engine | None = None
+_default_read_session_factory: sessionmaker[Session] | None = None
+# default_read_engine を作った時点の default_engine (差し替えられたら作り直す)
+_default_read_source: Engine | None = None
 
 
 def _get_default_session_factory() -> sessionmaker[Session]:
@@ -524,6 +769,24 @@ def DefaultSessionLocal() -> Session:
     return _get_default_session_factory()()
 
 
+def _get_default_read_session_factory() -> sessionmaker[Session]:
+    """デフォルト DB の読み取り専用セッションファクトリを返す (書き込み側と同じ DB に追従)。"""
+    global default_read_engine, _default_read_session_factory, _default_read_source
+    write_factory = _get_default_session_factory()
+    if default_engine is None:
+        return write_factory
+    if _default_read_session_factory is None or _default_read_source is not default_engine:
+        default_read_engine = create_read_engine(default_engine)
+        _default_read_session_factory = create_session_factory(default_read_engine)
+        _default_read_source = default_engine
+    return _default_read_session_factory
+
+
+def DefaultReadSessionLocal() -> Session:
+    """デフォルト DB の読み取り専用セッションを返す (検索・件数・facet 用)。"""
+    return _get_default_read_session_factory()()
+
+
 # --- セッションコンテキストマネージャ (ファクトリを受け取るように変更) --- #
 @contextmanager
 def get_db_session(
@@ -1,6 +1,9 @@
 """DBマネージャー (高レベルインターフェース)"""
 
+import threading
 import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
@@ -13,9 +16,17 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from ..filesystem import FileSystemManager
+from ..utils.image_feature_cache import ImageFeatureCache
 from ..utils.log import logger
 from ..utils.tools import calculate_phash
+from .error_record_sink import ErrorRecordSink
 from .filter_criteria import ImageFilterCriteria
+from .maintenance import (
+    DatabaseMaintenanceService,
+    engine_for_session_factory,
+    get_maintenance_service,
+    note_bulk_write,
+)
 from .repository.annotation_record import AnnotationRepository
 from .repository.error_record import ErrorRecordRepository
 from .repository.image import ImageRepository, PhashClassification
@@ -91,6 +102,7 @@ class ImageDatabaseManager:
         image_repo: ImageRepository | None = None,
         annotation_repo: AnnotationRepository | None = None,
         provider_batch_repo: ProviderBatchRepository | None = None,
+        feature_cache: ImageFeatureCache | None = None,
     ):
         """ImageDatabaseManagerのコンストラクタ。
 
@@ -115,10 +127,13 @@ class ImageDatabaseManager:
                 (ADR 0035 段階 5)。
             provider_batch_repo: Provider Batch API job/item/artifact の Repository
                 (ADR 0035 段階 6)。
+            feature_cache: 画像特徴量キャッシュ。指定時は登録・重複検出で pHash /
+                画像情報を ``(path, size, mtime_ns)`` 単位で再利用する。
 
         """
         self.config_service = config_service
         self.fsm = fsm
+        self.feature_cache = feature_cache
         if session_factory is None:
             for repo in (
                 image_repo,
@@ -154,6 +169,9 @@ class ImageDatabaseManager:
             session_factory=session_factory
         )
         self._cached_project_id: int | None = None
+        self._error_record_sink: ErrorRecordSink | None = None
+        self._error_sink_lock = threading.Lock()
+        self._error_buffering = threading.local()
         logger.info("ImageDatabaseManager initialized.")
 
     @classmethod
@@ -236,14 +254,14 @@ class ImageDatabaseManager:
 
         """
         # 1. 画像情報を取得
-        original_metadata = fsm.get_image_info(image_path)
+        original_metadata = self._get_image_features(image_path, fsm.get_image_info)
         if not original_metadata:
             logger.error(f"画像情報の取得に失敗: {image_path}")
             raise ValueError(f"画像情報の取得に失敗: {image_path}")
 
         # 2. pHash を計算
         try:
-            phash = calculate_phash(image_path)
+            phash = self._get_phash(image_path)
         except (ValueError, FileNotFoundError) as e:
             logger.warning(f"画像をスキップ: {e}")
             raise
@@ -260,6 +278,50 @@ class ImageDatabaseManager:
 
         return original_metadata, phash
 
+    def _get_phash(self, image_path: Path) -> str:
+        """pHash を取得する。特徴量キャッシュがあればファイル未変更時は再計算しない。"""
+        if self.feature_cache is not None:
+            return self.feature_cache.phash(image_path, calculate_phash)
+        return calculate_phash(image_path)
+
+    def _get_image_features(
+        self, image_path: Path, compute: Callable[[Path], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """画像情報を取得する。特徴量キャッシュがあればファイル未変更時は再デコードしない。"""
+        if self.feature_cache is not None:
+            return self.feature_cache.image_info(image_path, compute)
+        return compute(image_path)
+
+    def flush_feature_cache(self) -> None:
+        """特徴量キャッシュの未保存分を書き込む (キャッシュ未設定時は何もしない)。
+
+        ディレクトリ単位の登録・スキャンの終わりに呼ぶ。
+        """
+        if self.feature_cache is not None:
+            self.feature_cache.flush()
+
+    def note_bulk_write(self, rows: int) -> None:
+        """一括登録の完了を通知し、必要なら統計更新・WAL 切り詰めを行う。
+
+        閾値判定は ``maintenance.DatabaseMaintenanceService.after_bulk_write`` が行う。
+
+        Args:
+            rows: 書き込んだ画像数。
+        """
+        note_bulk_write(self.image_repo.session_factory, rows)
+
+    @property
+    def maintenance_service(self) -> DatabaseMaintenanceService | None:
+        """画像 DB の書き込みエンジンに対するメンテナンスサービス (ファイル DB 以外は None)。"""
+        engine = engine_for_session_factory(self.image_repo.session_factory)
+        return get_maintenance_service(engine) if engine is not None else None
+
+    def run_idle_maintenance(self) -> None:
+        """アプリ終了時のメンテナンス (PRAGMA optimize / 空きページ返却 / WAL 切り詰め)。"""
+        service = self.maintenance_service
+        if service is not None:
+            service.run_idle_maintenance()
+
     def register_original_image(
         self,
         image_path: Path,
@@ -1391,7 +1453,7 @@ class ImageDatabaseManager:
 
         # pHash 計算失敗は重複なしとして扱う (正常系扱い)
         try:
-            phash = calculate_phash(image_path)
+            phash = self._get_phash(image_path)
         except (ValueError, FileNotFoundError, OSError) as e:
             logger.warning(f"画像をスキップ: {e}")
             return None
@@ -1399,7 +1461,7 @@ class ImageDatabaseManager:
         # 分類には属性が要るため画像情報も取得する (取得失敗は重複なし扱い)
         # get_image_info は staticmethod のため fsm 未注入でも呼べる。
         try:
-            image_info = FileSystemManager.get_image_info(image_path)
+            image_info = self._get_image_features(image_path, FileSystemManager.get_image_info)
         except (OSError, ValueError) as e:
             logger.warning(f"画像情報取得に失敗したため重複なし扱い: {image_path}, Error: {e}")
             return None
@@ -1481,6 +1543,7 @@ class ImageDatabaseManager:
                 image_id = self.detect_duplicate_image(image_file)
                 if image_id:
                     image_ids.append(image_id)
+            self.flush_feature_cache()
 
             logger.info(f"ディレクトリ {directory_path} から {len(image_ids)} 件の画像IDを取得しました")
             return image_ids
@@ -1898,9 +1961,23 @@ class ImageDatabaseManager:
         Returns:
             int: 作成された error_record_id。**二次エラー発生時は sentinel `-1`**
                 (DB 保存失敗を呼び出し元の error handling 経路から隠す)。
+                バッファリング中 (``buffered_error_records`` 内) は ID 未確定のため ``0``。
 
         """
         try:
+            if getattr(self._error_buffering, "depth", 0) > 0:
+                self.error_record_sink.submit(
+                    {
+                        "operation_type": operation_type,
+                        "error_type": error_type,
+                        "error_message": error_message,
+                        "image_id": image_id,
+                        "stack_trace": stack_trace,
+                        "file_path": file_path,
+                        "model_name": model_name,
+                    }
+                )
+                return 0
             # ADR 0035 段階 3 (#423): injected error_record_repo 経由で呼び出し DI contract を維持。
             error_id = self.error_record_repo.save_error_record(
                 operation_type=operation_type,
@@ -1924,6 +2001,47 @@ class ImageDatabaseManager:
             logger.opt(exception=True).error(f"エラーレコード保存中にエラー（二次エラー）: {e}")
             return -1
 
+    @property
+    def error_record_sink(self) -> ErrorRecordSink:
+        """エラーレコードのバッファ付きシンク (初回アクセス時に生成)。"""
+        with self._error_sink_lock:
+            if self._error_record_sink is None:
+                self._error_record_sink = ErrorRecordSink(self.error_record_repo)
+            return self._error_record_sink
+
+    @contextmanager
+    def buffered_error_records(self) -> Iterator[ErrorRecordSink]:
+        """呼び出しスレッドの ``save_error_record`` をシンク経由の一括書き込みに切り替える。
+
+        失敗が大量に出るワーカーのホットループで 1 件ごとの commit を避けるため、
+        ``LoRAIroWorkerBase.run`` が ``execute()`` 全体をこのスコープで囲む。
+        最外側のスコープを抜ける際 (例外・キャンセル時も) に ``flush`` するので、
+        ワーカーの終了シグナル時点ではすべてのレコードが保存済みになる。
+        """
+        sink = self.error_record_sink
+        depth = getattr(self._error_buffering, "depth", 0)
+        self._error_buffering.depth = depth + 1
+        try:
+            yield sink
+        finally:
+            self._error_buffering.depth = depth
+            if depth == 0:
+                self.flush_error_records()
+
+    def flush_error_records(self) -> int:
+        """バッファ済みのエラーレコードを同期で書き込む (二次エラー防止のため例外は送出しない)。
+
+        Returns:
+            int: 書き込みを試みた件数。
+        """
+        if self._error_record_sink is None:
+            return 0
+        try:
+            return self._error_record_sink.flush()
+        except Exception as e:
+            logger.opt(exception=True).error(f"エラーレコードのフラッシュ中にエラー（二次エラー）: {e}")
+            return 0
+
     def mark_errors_resolved_batch(self, error_ids: list[int]) -> tuple[bool, int]:
         """複数エラーを一括解決済みマーク（Manager層Facade）
 
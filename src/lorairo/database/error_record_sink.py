@@ -0,0 +1,146 @@
+"""ワーカーのエラーレコードをまとめて書き込むバッファ付きシンク。
+
+壊れたディレクトリの登録や API 障害時のアノテーションでは、失敗 1 件ごとに
+``ErrorRecordRepository.save_error_record`` が session を開いて commit するため、
+ホットループが書き込みロック待ちで律速される。本シンクは ``submit`` でレコードを
+キューに積んで即座に戻り、バックグラウンドの書き込みスレッドが ``batch_size`` 件
+または ``flush_interval`` 秒ごとに複数行 INSERT 1 トランザクションで保存する。
+
+ワーカーの終了シグナル前に ``flush`` を呼ぶことで、完了後のエラー一覧表示では
+すべてのレコードが見える (``ImageDatabaseManager.buffered_error_records`` 参照)。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from ..utils.log import logger
+
+if TYPE_CHECKING:
+    from .repository.error_record import ErrorRecordRepository
+    from .schema import ErrorRecordData
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 1.0
+_JOIN_TIMEOUT = 5.0
+
+
+class ErrorRecordSink:
+    """エラーレコードのバッファ付き非同期書き込み。
+
+    書き込み失敗は呼び出し元 (ワーカーのエラー処理経路) を再 fail させないよう
+    ログに残して ``dropped`` に数えるだけにする (``save_error_record`` の
+    二次エラー防止と同じ方針)。
+
+    Attributes:
+        submitted: ``submit`` された件数。
+        written: 保存に成功した件数。
+        dropped: 保存に失敗して破棄した件数。
+        flushes: 実際に書き込みを行った回数。
+    """
+
+    def __init__(
+        self,
+        repository: ErrorRecordRepository,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
+        self._repository = repository
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending: list[ErrorRecordData] = []
+        self._condition = threading.Condition()
+        # 書き込み中のバッチが終わるまで flush() を待たせ、flush() の戻り時点で
+        # それ以前に submit されたレコードがすべて保存済みであることを保証する。
+        self._write_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.flushes = 0
+
+    @property
+    def pending(self) -> int:
+        """未書き込みの件数。"""
+        with self._condition:
+            return len(self._pending)
+
+    def submit(self, record: ErrorRecordData) -> None:
+        """レコードをキューに積む (書き込みを待たない)。
+
+        ``close`` 後は従来どおり同期で書き込む。
+        """
+        with self._condition:
+            self.submitted += 1
+            if not self._closed:
+                self._pending.append(record)
+                self._ensure_writer()
+                if len(self._pending) >= self._batch_size:
+                    self._condition.notify()
+                return
+        with self._write_lock:
+            self._write([record])
+
+    def flush(self) -> int:
+        """キュー内のレコードを同期で書き込む。
+
+        Returns:
+            int: 今回書き込みを試みた件数 (失敗して破棄した分を含む)。
+        """
+        with self._write_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._write(batch)
+            return len(batch)
+
+    def close(self) -> None:
+        """残りを書き込み、書き込みスレッドを停止する。"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=_JOIN_TIMEOUT)
+        self.flush()
+
+    def _ensure_writer(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="error-record-sink", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                # 最初の 1 件から flush_interval 秒、または batch_size 件に達するまで溜める
+                deadline = time.monotonic() + self._flush_interval
+                while len(self._pending) < self._batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            self.flush()
+
+    def _write(self, batch: list[ErrorRecordData]) -> None:
+        self.flushes += 1
+        try:
+            self.written += self._repository.save_error_records_batch(batch)
+        except Exception as e:
+            # 二次エラー防止: エラー記録の失敗でワーカーを止めない
+            self.dropped += len(batch)
+            logger.opt(exception=True).error(
+                f"エラーレコードの一括保存に失敗しました ({len(batch)}件): {e}"
+            )
@@ -0,0 +1,163 @@
+"""
+画像 ID 選択集合 (昇順 ID 配列)。
+
+``DatasetStateManager`` の選択状態として保持し、``selection_changed`` でそのまま渡す。
+20 万件規模の「すべて選択」でも ``array('q')`` 1 本 (1 ID = 8 byte) に収まり、
+包含判定は二分探索で O(log n)。不変オブジェクトなので Signal の受信側や呼び出し元へ
+防御的コピーなしで渡せる。
+
+``Sequence[int]`` として振る舞い、スライスは ``list[int]`` を返すため、``list[int]``
+を受け取っていたリポジトリのバッチ操作 (チャンク分割 / ``in_()``) へ直接渡せる。
+``repository.base.image_id_condition`` は連続区間 (``runs``) を BETWEEN にまとめ、
+検索結果の一括選択でも ID ごとのバインド変数を展開しない。
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+# これ以下の件数の追加・削除は既存配列への挿入・削除で行う
+_SMALL_CHANGE = 64
+
+
+class ImageIdSelection(Sequence[int]):
+    """
+    重複なし・昇順の画像 ID 集合 (不変)。
+
+    集合演算 (``|`` / ``&`` / ``-``) と ``with_ids`` / ``without_ids`` は新しい
+    インスタンスを返す。反復順は常に ID 昇順 (選択操作の順序は保持しない)。
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[int] = ()) -> None:
+        """
+        Args:
+            ids: 画像 ID (重複・順不同可)。
+        """
+        if isinstance(ids, ImageIdSelection):
+            self._ids: array[int] = ids._ids
+        else:
+            self._ids = array("q", sorted(set(ids)))
+
+    @classmethod
+    def _from_sorted(cls, ids: array[int]) -> ImageIdSelection:
+        selection = cls.__new__(cls)
+        selection._ids = ids
+        return selection
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            return self._ids[index].tolist()
+        return self._ids[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __contains__(self, image_id: object) -> bool:
+        if not isinstance(image_id, int):
+            return False
+        position = bisect_left(self._ids, image_id)
+        return position < len(self._ids) and self._ids[position] == image_id
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ImageIdSelection):
+            return self._ids == other._ids
+        if isinstance(other, Sequence) and not isinstance(other, str | bytes):
+            return len(self._ids) == len(other) and self._ids.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        preview = self._ids[:5].tolist()
+        suffix = ", ..." if len(self._ids) > 5 else ""
+        return f"ImageIdSelection({preview}{suffix} n={len(self._ids)})"
+
+    def __or__(self, other: Iterable[int]) -> ImageIdSelection:
+        return self.union(other)
+
+    def __and__(self, other: Iterable[int]) -> ImageIdSelection:
+        return self.intersection(other)
+
+    def __sub__(self, other: Iterable[int]) -> ImageIdSelection:
+        return self.difference(other)
+
+    def to_list(self) -> list[int]:
+        """ID 昇順の list を返す。"""
+        return self._ids.tolist()
+
+    def union(self, other: Iterable[int]) -> ImageIdSelection:
+        """和集合を返す。"""
+        other_ids = _as_id_set(other)
+        if not other_ids:
+            return self
+        if len(other_ids) <= _SMALL_CHANGE:
+            # クリック 1 回分の追加は配列コピー + 挿入 (全件の再ソートをしない)
+            ids = array("q", self._ids)
+            for image_id in sorted(other_ids):
+                position = bisect_left(ids, image_id)
+                if position == len(ids) or ids[position] != image_id:
+                    ids.insert(position, image_id)
+            return ImageIdSelection._from_sorted(ids)
+        return ImageIdSelection(other_ids.union(self._ids))
+
+    def intersection(self, other: Iterable[int]) -> ImageIdSelection:
+        """積集合を返す。"""
+        other_ids = _as_id_set(other)
+        if len(other_ids) < len(self._ids):
+            # 小さい側を二分探索で照合する
+            return ImageIdSelection([image_id for image_id in other_ids if image_id in self])
+        return ImageIdSelection._from_sorted(
+            array("q", [image_id for image_id in self._ids if image_id in other_ids])
+        )
+
+    def difference(self, other: Iterable[int]) -> ImageIdSelection:
+        """差集合 (self - other) を返す。"""
+        other_ids = _as_id_set(other)
+        if not other_ids:
+            return self
+        if len(other_ids) <= _SMALL_CHANGE:
+            ids = array("q", self._ids)
+            for image_id in other_ids:
+                position = bisect_left(ids, image_id)
+                if position < len(ids) and ids[position] == image_id:
+                    del ids[position]
+            return ImageIdSelection._from_sorted(ids)
+        return ImageIdSelection._from_sorted(
+            array("q", [image_id for image_id in self._ids if image_id not in other_ids])
+        )
+
+    def runs(self) -> list[tuple[int, int]]:
+        """連続する ID を閉区間 ``(first, last)`` にまとめて昇順で返す。"""
+        result: list[tuple[int, int]] = []
+        ids = self._ids
+        if not ids:
+            return result
+        first = last = ids[0]
+        for image_id in ids[1:]:
+            if image_id == last + 1:
+                last = image_id
+                continue
+            result.append((first, last))
+            first = last = image_id
+        result.append((first, last))
+        return result
+
+
+def _as_id_set(ids: Iterable[int]) -> set[int] | frozenset[int]:
+    if isinstance(ids, set | frozenset):
+        return ids
+    return set(ids)
@@ -0,0 +1,552 @@
+"""プロジェクト DB (SQLite) のストレージ調整と定期メンテナンス。
+
+2 つの役割を持つ:
+
+- :func:`tune_storage_pragmas` は DB サイズと空きメモリから接続ごとの
+  ``cache_size`` / ``mmap_size`` / ``temp_store`` と新規 DB の ``page_size`` を決める。
+  ``db_core.create_db_engine`` がエンジン作成時に 1 回計算し、全接続に適用する。
+- :class:`DatabaseMaintenanceService` は統計 (``sqlite_stat1``) の更新、WAL の
+  チェックポイント、空きページの返却を受け持つ。一括登録・アノテーション保存の後に
+  :func:`note_bulk_write` で呼ばれ、閾値を超えたときだけ実際に作業する。GUI 終了時の
+  :meth:`DatabaseMaintenanceService.run_idle_maintenance` と
+  ``lorairo-cli db maintain`` からも使う。
+
+メンテナンスの失敗は警告ログに留め、呼び出し元 (登録・保存処理) には伝播させない。
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..utils.config import get_config
+from ..utils.log import logger
+from .pool_metrics import get_writer_gate
+
+_KIB = 1024
+_MIB = 1024 * 1024
+_GIB = 1024 * 1024 * 1024
+
+# 空きメモリを取得できない環境で仮定する値 (控えめに 2 GiB)
+_FALLBACK_RAM_BYTES = 2 * _GIB
+# page_size を大きくする DB サイズの下限
+_LARGE_DB_BYTES = 1 * _GIB
+# ANALYZE / PRAGMA optimize が 1 インデックスあたりに読む行数の上限 (近似統計で十分)
+_ANALYSIS_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class StoragePragmas:
+    """接続ごとに設定するストレージ関連 PRAGMA の値。
+
+    Attributes:
+        cache_size_kib: ページキャッシュの上限 (KiB)。``PRAGMA cache_size`` には負値で渡す。
+        mmap_size: メモリマップ I/O に使う最大バイト数。
+        temp_store: 一時テーブル・ソート領域の置き場所 (``MEMORY`` / ``DEFAULT``)。
+        page_size: 新規 DB (および VACUUM 時) のページサイズ。
+    """
+
+    cache_size_kib: int
+    mmap_size: int
+    temp_store: str
+    page_size: int
+
+
+_MEMINFO_PATH = Path("/proc/meminfo")
+
+
+def available_memory_bytes() -> int | None:
+    """利用可能な物理メモリ (バイト) を返す。取得できない環境では None。
+
+    Linux では ``/proc/meminfo`` の ``MemAvailable`` (解放可能なページキャッシュを含む)
+    を使う。``SC_AVPHYS_PAGES`` は ``MemFree`` 相当で、ページキャッシュが温まった
+    マシンでは実際より大幅に小さくなるため使わない。それ以外の環境では psutil があれば
+    ``virtual_memory().available`` を使う。
+    """
+    try:
+        with _MEMINFO_PATH.open(encoding="ascii") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * _KIB
+    except (OSError, ValueError, IndexError):
+        pass
+    if importlib.util.find_spec("psutil") is not None:
+        import psutil
+
+        return int(psutil.virtual_memory().available)
+    return None
+
+
+def tune_storage_pragmas(db_bytes: int, available_ram: int | None) -> StoragePragmas:
+    """DB サイズと空きメモリから PRAGMA 値を決める。
+
+    - cache_size: DB の 1/4 を 8〜256 MiB に収め、空きメモリの 1/64 を超えない。
+      読み取りエンジンは接続ごとにキャッシュを持つため、接続数分を見込んで控えめにする。
+    - mmap_size: DB の 2 倍 (成長分) を最低 64 MiB・最大 1 GiB とし、空きメモリの 1/8 まで。
+      mmap はページキャッシュと共有されるので接続数分のメモリは消費しない。
+    - temp_store: 空きメモリが 4 GiB 以上なら MEMORY (大きな ORDER BY / DISTINCT の一時領域)。
+    - page_size: 1 GiB 以上の DB は 8 KiB、それ以外は SQLite 既定の 4 KiB。
+
+    Args:
+        db_bytes: DB ファイル (+ WAL) のサイズ。
+        available_ram: 空きメモリ。None なら控えめな既定値を仮定する。
+
+    Returns:
+        StoragePragmas: 算出した値。
+    """
+    ram = available_ram if available_ram and available_ram > 0 else _FALLBACK_RAM_BYTES
+    db_bytes = max(0, db_bytes)
+
+    cache_bytes = min(max(db_bytes // 4, 8 * _MIB), 256 * _MIB, max(ram // 64, 2 * _MIB))
+    mmap_size = min(max(db_bytes * 2, 64 * _MIB), 1 * _GIB, ram // 8)
+    return StoragePragmas(
+        cache_size_kib=cache_bytes // _KIB,
+        mmap_size=max(0, mmap_size),
+        temp_store="MEMORY" if ram >= 4 * _GIB else "DEFAULT",
+        page_size=8192 if db_bytes >= _LARGE_DB_BYTES else 4096,
+    )
+
+
+def database_file_bytes(db_path: Path) -> int:
+    """DB ファイルと WAL ファイルの合計サイズ (存在しなければ 0)。"""
+    total = 0
+    for path in (db_path, _wal_path(db_path)):
+        try:
+            total += path.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _wal_path(db_path: Path) -> Path:
+    return db_path.with_name(db_path.name + "-wal")
+
+
+def sqlite_file_path(engine: Engine) -> Path | None:
+    """ファイル DB を指す SQLite エンジンならそのパス、それ以外 (:memory: 等) は None。"""
+    url = engine.url
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return None
+    return Path(url.database)
+
+
+@dataclass(frozen=True)
+class MaintenanceThresholds:
+    """一括書き込み後メンテナンスの発動条件。
+
+    Attributes:
+        analyze_after_rows: 前回の ANALYZE 以降の書き込み行数がこれを超えたら ANALYZE する。
+        wal_truncate_bytes: WAL ファイルがこれを超えたら TRUNCATE チェックポイントを行う。
+        optimize_interval_s: ``PRAGMA optimize`` の最短実行間隔 (秒)。
+        vacuum_free_ratio: 空きページの割合がこれを超えたら incremental vacuum で返却する。
+        idle_vacuum_pages: アイドル時メンテナンス 1 回で返却する空きページ数の上限。
+    """
+
+    analyze_after_rows: int = 1000
+    wal_truncate_bytes: int = 64 * _MIB
+    optimize_interval_s: float = 3600.0
+    vacuum_free_ratio: float = 0.1
+    idle_vacuum_pages: int = 2048
+
+    @classmethod
+    def from_config(cls) -> MaintenanceThresholds:
+        """``[database]`` 設定から閾値を読み込む (未設定のキーは既定値)。"""
+        db_config = get_config().get("database", {})
+        defaults = cls()
+        return cls(
+            analyze_after_rows=int(db_config.get("analyze_after_rows", defaults.analyze_after_rows)),
+            wal_truncate_bytes=int(
+                float(db_config.get("wal_truncate_mb", defaults.wal_truncate_bytes / _MIB)) * _MIB
+            ),
+            optimize_interval_s=float(db_config.get("optimize_interval_s", defaults.optimize_interval_s)),
+            vacuum_free_ratio=float(db_config.get("vacuum_free_ratio", defaults.vacuum_free_ratio)),
+            idle_vacuum_pages=int(db_config.get("idle_vacuum_pages", defaults.idle_vacuum_pages)),
+        )
+
+
+@dataclass
+class DatabaseStats:
+    """DB ファイルとページ構成のスナップショット。"""
+
+    file_bytes: int = 0
+    wal_bytes: int = 0
+    page_size: int = 0
+    page_count: int = 0
+    freelist_count: int = 0
+    auto_vacuum: str = "none"
+    journal_mode: str = ""
+    stat1_rows: int = 0
+
+    @property
+    def free_ratio(self) -> float:
+        """全ページに占める空きページの割合。"""
+        return self.freelist_count / self.page_count if self.page_count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 出力用の dict を返す。"""
+        data = asdict(self)
+        data["free_ratio"] = round(self.free_ratio, 4)
+        return data
+
+
+@dataclass
+class MaintenanceReport:
+    """:meth:`DatabaseMaintenanceService.maintain` の結果。"""
+
+    before: DatabaseStats
+    after: DatabaseStats
+    actions: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """全アクションが成功したか。"""
+        return all(action.get("ok", False) for action in self.actions)
+
+
+_AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+
+class MaintenanceSkippedError(RuntimeError):
+    """writer gate を取得できず、メンテナンス操作を見送ったことを示す。
+
+    同一プロセスの長い書き込みと重なった場合に送出される。次の機会に再実行すればよい
+    ため、呼び出し側は失敗ではなく「今回は見送り」として扱う。
+    """
+
+
+class DatabaseMaintenanceService:
+    """1 つの書き込みエンジンに対するメンテナンス処理。
+
+    メンテナンス用の PRAGMA / ANALYZE / VACUUM は AUTOCOMMIT 接続で実行し、同一プロセスの
+    書き込みとはエンジンの writer gate (``pool_metrics``) で直列化する。ゲートを
+    取得できなければその操作は見送る (:class:`MaintenanceSkippedError`)。他プロセス
+    (GUI と CLI の併用) との競合は ``busy_timeout`` に委ね、失敗しても警告に留める。
+
+    エンジンは弱参照で保持する (:func:`get_maintenance_service` のレジストリがエンジンを
+    キーにしているため、強参照するとエンジンが解放されなくなる)。
+    """
+
+    def __init__(self, engine: Engine, thresholds: MaintenanceThresholds | None = None) -> None:
+        self._engine_ref = weakref.ref(engine)
+        self.thresholds = thresholds or MaintenanceThresholds.from_config()
+        self._lock = threading.Lock()
+        self._pending_rows = 0
+        self._last_optimize = time.monotonic()
+
+    @property
+    def engine(self) -> Engine:
+        """対象の書き込みエンジン。
+
+        Raises:
+            RuntimeError: エンジンが既に解放されている場合。
+        """
+        engine = self._engine_ref()
+        if engine is None:
+            raise RuntimeError("メンテナンス対象のエンジンは既に解放されています")
+        return engine
+
+    @property
+    def db_path(self) -> Path | None:
+        """対象 DB ファイルのパス (:memory: の場合 None)。"""
+        return sqlite_file_path(self.engine)
+
+    @contextmanager
+    def _maintenance_connection(self) -> Iterator[Connection]:
+        gate = get_writer_gate(self.engine)
+        if gate is not None and not gate.acquire():
+            # ゲート無しで続行すると同一プロセスの書き込みと SQLite のロックを奪い合う
+            raise MaintenanceSkippedError(f"writer gate を {gate.timeout_s} 秒以内に取得できませんでした")
+        try:
+            with self.engine.connect() as connection:
+                yield connection.execution_options(isolation_level="AUTOCOMMIT")
+        finally:
+            if gate is not None:
+                gate.release()
+
+    # --- 統計 ---
+
+    def collect_stats(self) -> DatabaseStats:
+        """ファイルサイズとページ構成を読み取る。"""
+        stats = DatabaseStats()
+        db_path = self.db_path
+        if db_path is not None:
+            stats.file_bytes = _file_size(db_path)
+            stats.wal_bytes = _file_size(_wal_path(db_path))
+        with self.engine.connect() as connection:
+            stats.page_size = _pragma_int(connection, "page_size")
+            stats.page_count = _pragma_int(connection, "page_count")
+            stats.freelist_count = _pragma_int(connection, "freelist_count")
+            stats.auto_vacuum = _AUTO_VACUUM_MODES.get(_pragma_int(connection, "auto_vacuum"), "none")
+            stats.journal_mode = str(connection.exec_driver_sql("PRAGMA journal_mode").scalar() or "")
+            has_stat1 = connection.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            ).scalar()
+            if has_stat1:
+                stats.stat1_rows = int(
+                    connection.exec_driver_sql("SELECT count(*) FROM sqlite_stat1").scalar() or 0
+                )
+        return stats
+
+    # --- 個別操作 ---
+
+    def optimize(self) -> None:
+        """``PRAGMA optimize`` (統計が古いテーブルだけ近似 ANALYZE する)。"""
+        with self._maintenance_connection() as connection:
+            connection.exec_driver_sql(f"PRAGMA analysis_limit={_ANALYSIS_LIMIT}")
+            connection.exec_driver_sql("PRAGMA optimize")
+        self._last_optimize = time.monotonic()
+
+    def analyze(self) -> None:
+        """全テーブルの統計を近似 ANALYZE で更新する。"""
+        with self._maintenance_connection() as connection:
+            connection.exec_driver_sql(f"PRAGMA analysis_limit={_ANALYSIS_LIMIT}")
+            connection.exec_driver_sql("ANALYZE")
+        with self._lock:
+            self._pending_rows = 0
+
+    def checkpoint(self, *, truncate: bool = True) -> tuple[int, int, int]:
+        """WAL をチェックポイントする。
+
+        Args:
+            truncate: True なら ``TRUNCATE`` (WAL ファイルを 0 バイトに戻す)、False なら ``PASSIVE``。
+
+        Returns:
+            ``(busy, log_frames, checkpointed_frames)``。busy=1 は読み取り中の接続があり
+            完了できなかったことを示す。
+        """
+        mode = "TRUNCATE" if truncate else "PASSIVE"
+        with self._maintenance_connection() as connection:
+            row = connection.exec_driver_sql(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        if row is None:
+            return (0, 0, 0)
+        busy, log_frames, checkpointed = (int(value) for value in row)
+        return (busy, log_frames, checkpointed)
+
+    def incremental_vacuum(self, pages: int | None = None) -> int:
+        """``auto_vacuum=INCREMENTAL`` の DB で空きページをファイルから返却する。
+
+        Args:
+            pages: 返却するページ数の上限。None なら全空きページ。
+
+        Returns:
+            返却したページ数。incremental モードでない DB では 0。
+        """
+        with self._maintenance_connection() as connection:
+            if _pragma_int(connection, "auto_vacuum") != 2:
+                return 0
+            before = _pragma_int(connection, "freelist_count")
+            limit = "" if pages is None else f"({int(pages)})"
+            # 1 ステップで 1 ページずつ返却するため、DBAPI カーソルで最後まで進める
+            # (SQLAlchemy の Result は行を返さない文として即座に閉じてしまう)
+            cursor = connection.connection.cursor()
+            try:
+                cursor.execute(f"PRAGMA incremental_vacuum{limit}")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return before - _pragma_int(connection, "freelist_count")
+
+    def vacuum(self, page_size: int | None = None) -> None:
+        """DB を作り直し、``page_size`` と ``auto_vacuum=INCREMENTAL`` を適用する。
+
+        WAL モードではページサイズを変更できないため、一時的に DELETE モードへ切り替えて
+        VACUUM し、WAL に戻す。DB 全体を書き直すので、大きな DB では時間がかかる。
+
+        Args:
+            page_size: 新しいページサイズ。None なら DB サイズから決める。
+        """
+        if page_size is None:
+            db_path = self.db_path
+            db_bytes = database_file_bytes(db_path) if db_path is not None else 0
+            page_size = tune_storage_pragmas(db_bytes, available_memory_bytes()).page_size
+        with self._maintenance_connection() as connection:
+            journal_mode = str(connection.exec_driver_sql("PRAGMA journal_mode").scalar() or "")
+            wal = journal_mode.lower() == "wal"
+            if wal:
+                connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+                connection.exec_driver_sql("PRAGMA journal_mode=DELETE")
+            try:
+                connection.exec_driver_sql(f"PRAGMA page_size={int(page_size)}")
+                connection.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+                connection.exec_driver_sql("VACUUM")
+            finally:
+                if wal:
+                    connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+    # --- スケジューリング ---
+
+    def after_bulk_write(self, rows: int) -> None:
+        """一括書き込みの後に呼ぶ。閾値を超えた作業だけを実行する。
+
+        - 前回の ANALYZE 以降 ``analyze_after_rows`` 行以上書き込まれたら ANALYZE
+          (統計の無い新規 DB は初回の一括書き込みで必ず ANALYZE する)
+        - WAL が ``wal_truncate_bytes`` を超えたら TRUNCATE チェックポイント
+        - 前回から ``optimize_interval_s`` 経過していたら ``PRAGMA optimize``
+
+        Args:
+            rows: 今回書き込んだ行数 (画像数・アノテーション件数)。
+        """
+        if rows <= 0:
+            return
+        with self._lock:
+            self._pending_rows += rows
+            pending = self._pending_rows
+        try:
+            if pending >= self.thresholds.analyze_after_rows or not self._has_statistics():
+                logger.debug(f"一括書き込み後の ANALYZE を実行します: {pending} rows")
+                self.analyze()
+            elif time.monotonic() - self._last_optimize >= self.thresholds.optimize_interval_s:
+                self.optimize()
+            self._truncate_wal_if_large()
+        except MaintenanceSkippedError as e:
+            logger.debug(f"一括書き込み後の DB メンテナンスを見送りました: {e}")
+        except SQLAlchemyError:
+            logger.opt(exception=True).warning("一括書き込み後の DB メンテナンスに失敗しました")
+
+    def run_idle_maintenance(self) -> None:
+        """アプリ終了時などアイドル時の軽いメンテナンス。
+
+        ``PRAGMA optimize``、空きページ返却 (incremental モードかつ空き率が閾値超過時、
+        1 回あたり ``idle_vacuum_pages`` ページまで)、WAL の TRUNCATE チェックポイントを行う。
+        """
+        try:
+            self.optimize()
+            stats = self.collect_stats()
+            if stats.auto_vacuum == "incremental" and stats.free_ratio > self.thresholds.vacuum_free_ratio:
+                released = self.incremental_vacuum(pages=self.thresholds.idle_vacuum_pages)
+                logger.debug(f"incremental vacuum で {released} ページを返却しました")
+            self.checkpoint(truncate=True)
+        except MaintenanceSkippedError as e:
+            logger.debug(f"アイドル時の DB メンテナンスを見送りました: {e}")
+        except SQLAlchemyError:
+            logger.opt(exception=True).warning("アイドル時の DB メンテナンスに失敗しました")
+
+    def maintain(self, *, vacuum: bool = False) -> MaintenanceReport:
+        """全メンテナンスを実行し、前後の統計を返す (``lorairo-cli db maintain``)。
+
+        Args:
+            vacuum: True なら VACUUM で DB を作り直す (page_size / auto_vacuum も適用)。
+                False なら incremental vacuum (可能な場合) のみ。
+
+        Returns:
+            MaintenanceReport: 実行前後の統計と各アクションの結果。
+        """
+        before = self.collect_stats()
+        report = MaintenanceReport(before=before, after=before)
+
+        def run(name: str, operation: Callable[[], dict[str, Any] | None]) -> None:
+            start = time.perf_counter()
+            entry: dict[str, Any] = {"action": name}
+            try:
+                detail = operation()
+            except MaintenanceSkippedError as e:
+                logger.warning(f"DB メンテナンス '{name}' を見送りました: {e}")
+                entry.update(ok=False, skipped=True, error=str(e))
+            except SQLAlchemyError as e:
+                logger.opt(exception=True).warning(f"DB メンテナンス '{name}' に失敗しました")
+                entry.update(ok=False, error=str(e))
+            else:
+                entry["ok"] = True
+                if detail is not None:
+                    entry["detail"] = detail
+            entry["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            report.actions.append(entry)
+
+        def full_vacuum() -> dict[str, Any]:
+            self.vacuum()
+            return {"page_size": self.collect_stats().page_size}
+
+        def wal_checkpoint() -> dict[str, Any]:
+            busy, log_frames, checkpointed = self.checkpoint(truncate=True)
+            return {"busy": busy, "log_frames": log_frames, "checkpointed_frames": checkpointed}
+
+        run("analyze", self.analyze)
+        run("optimize", self.optimize)
+        if vacuum:
+            run("vacuum", full_vacuum)
+        else:
+            run("incremental_vacuum", lambda: {"released_pages": self.incremental_vacuum()})
+        run("wal_checkpoint", wal_checkpoint)
+        report.after = self.collect_stats()
+        return report
+
+    def _has_statistics(self) -> bool:
+        with self.engine.connect() as connection:
+            return bool(
+                connection.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+                ).scalar()
+            )
+
+    def _truncate_wal_if_large(self) -> None:
+        db_path = self.db_path
+        if db_path is None or _file_size(_wal_path(db_path)) < self.thresholds.wal_truncate_bytes:
+            return
+        busy, _log, _checkpointed = self.checkpoint(truncate=True)
+        if busy:
+            logger.debug("WAL の TRUNCATE チェックポイントは読み取り中の接続があるため延期されました")
+
+
+def _pragma_int(connection: Connection, name: str) -> int:
+    return int(connection.exec_driver_sql(f"PRAGMA {name}").scalar() or 0)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+# エンジン → メンテナンスサービス (サービスはエンジンを弱参照するので、エンジンの解放を妨げない)
+_SERVICES: weakref.WeakKeyDictionary[Engine, DatabaseMaintenanceService] = weakref.WeakKeyDictionary()
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_maintenance_service(engine: Engine) -> DatabaseMaintenanceService | None:
+    """エンジンごとのメンテナンスサービスを返す (ファイル DB 以外は None)。"""
+    if sqlite_file_path(engine) is None:
+        return None
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(engine)
+        if service is None:
+            service = _SERVICES[engine] = DatabaseMaintenanceService(engine)
+        return service
+
+
+def engine_for_session_factory(session_factory: Any) -> Engine | None:
+    """セッションファクトリがバインドしている書き込みエンジンを返す (特定できなければ None)。"""
+    from . import db_core
+
+    if session_factory is db_core.DefaultSessionLocal:
+        bind = db_core.default_engine
+    else:
+        bind = getattr(session_factory, "kw", {}).get("bind")
+    return bind if isinstance(bind, Engine) else None
+
+
+def note_bulk_write(session_factory: Any, rows: int) -> None:
+    """一括書き込みの完了を通知し、必要なら統計更新・WAL 切り詰めを行う。
+
+    エンジンを特定できない (テスト用のモック等) 場合や :memory: DB では何もしない。
+
+    Args:
+        session_factory: 書き込みに使ったセッションファクトリ。
+        rows: 書き込んだ行数。
+    """
+    if rows <= 0:
+        return
+    engine = engine_for_session_factory(session_factory)
+    service = get_maintenance_service(engine) if engine is not None else None
+    if service is not None:
+        service.after_bulk_write(rows)
@@ -110,6 +110,9 @@ def run_migrations_online() -> None:
 
         with context.begin_transaction():
             context.run_migrations()
+            # db_core の schema fingerprint を無効化する。upgrade / downgrade / stamp を
+            # db_core 外から実行した場合も、次回のプロジェクト DB オープンでフル準備が走る。
+            connection.exec_driver_sql("PRAGMA user_version = 0")
 
 
 # --- process_revision_directives removed as render_as_batch is used ---
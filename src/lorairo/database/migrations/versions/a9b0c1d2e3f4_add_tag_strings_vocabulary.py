@@ -0,0 +1,113 @@
+"""タグ文字列を語彙テーブル tag_strings へ移し、tags.tag を整数参照 tag_string_id に置き換える。
+
+tags は数百万行になっても異なる文字列は数千程度のため、文字列を ``tag_strings`` に
+集め ``tags.tag_string_id`` (NOT NULL) で参照する。既存行の文字列を語彙へ登録して
+ID を埋めたうえで、一意制約 ``uq_tags_image_model_tag`` を
+``(image_id, model_id, tag_string_id)`` に張り替え、文字列列 ``tags.tag`` と
+その索引 ``ix_tags_tag`` を削除する (テーブル再作成)。語彙は大文字小文字を
+区別するため、(image, model, tag) の一意性は整数に置き換えても変わらない。
+
+以降の tag_string_id は ``AnnotationRepository`` がタグ書き込み時に設定する。
+本 revision の初版は行単位のトリガーで tag_string_id を同期していたため、
+初版を適用済みの DB からはトリガーを取り除く。
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "a9b0c1d2e3f4"
+down_revision: str | None = "f8a9b0c1d2e3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_UNIQUE_INDEX_NAME = "uq_tags_image_model_tag"
+_LEGACY_TRIGGERS = ("trg_tags_tag_string_insert", "trg_tags_tag_string_update")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for name in _LEGACY_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    if "tags" not in tables:
+        return
+
+    if "tag_strings" not in tables:
+        op.create_table(
+            "tag_strings",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("tag", sa.String(), nullable=False),
+            sa.UniqueConstraint("tag"),
+        )
+    columns = {column["name"] for column in inspector.get_columns("tags")}
+    if "tag" not in columns:
+        return
+    if "tag_string_id" not in columns:
+        # NULL 既定の REFERENCES 付き列は ALTER TABLE で追加できる (埋めてから NOT NULL にする)
+        op.execute("ALTER TABLE tags ADD COLUMN tag_string_id INTEGER REFERENCES tag_strings (id)")
+
+    bind.execute(
+        sa.text(
+            "INSERT INTO tag_strings (tag) SELECT DISTINCT tag FROM tags "
+            "WHERE tag NOT IN (SELECT tag FROM tag_strings) ORDER BY tag"
+        )
+    )
+    bind.execute(
+        sa.text(
+            "UPDATE tags SET tag_string_id = (SELECT id FROM tag_strings WHERE tag_strings.tag = tags.tag)"
+        )
+    )
+
+    indexes = {index["name"] for index in inspector.get_indexes("tags")}
+    with op.batch_alter_table("tags", recreate="always") as batch_op:
+        if "ix_tags_tag" in indexes:
+            batch_op.drop_index("ix_tags_tag")
+        if _UNIQUE_INDEX_NAME in indexes:
+            batch_op.drop_index(_UNIQUE_INDEX_NAME)
+        batch_op.alter_column("tag_string_id", existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column("tag")
+        if "ix_tags_tag_string_id" not in indexes:
+            batch_op.create_index("ix_tags_tag_string_id", ["tag_string_id"])
+        if _UNIQUE_INDEX_NAME in indexes:
+            batch_op.create_index(
+                _UNIQUE_INDEX_NAME, ["image_id", "model_id", "tag_string_id"], unique=True
+            )
+
+
+def downgrade() -> None:  # pragma: no cover
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "tags" not in set(inspector.get_table_names()):
+        return
+    columns = {column["name"] for column in inspector.get_columns("tags")}
+    if "tag_string_id" not in columns:
+        return
+
+    if "tag" not in columns:
+        op.add_column("tags", sa.Column("tag", sa.String(), nullable=True))
+    bind.execute(
+        sa.text(
+            "UPDATE tags SET tag = (SELECT tag FROM tag_strings WHERE tag_strings.id = tags.tag_string_id)"
+        )
+    )
+
+    indexes = {index["name"] for index in inspector.get_indexes("tags")}
+    with op.batch_alter_table("tags", recreate="always") as batch_op:
+        if _UNIQUE_INDEX_NAME in indexes:
+            batch_op.drop_index(_UNIQUE_INDEX_NAME)
+        if "ix_tags_tag_string_id" in indexes:
+            batch_op.drop_index("ix_tags_tag_string_id")
+        batch_op.drop_column("tag_string_id")
+        batch_op.alter_column("tag", existing_type=sa.String(), nullable=False)
+        batch_op.create_index("ix_tags_tag", ["tag"])
+        if _UNIQUE_INDEX_NAME in indexes:
+            batch_op.create_index(_UNIQUE_INDEX_NAME, ["image_id", "model_id", "tag"], unique=True)
+    op.drop_table("tag_strings")
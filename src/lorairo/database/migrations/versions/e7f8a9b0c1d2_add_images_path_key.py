@@ -0,0 +1,108 @@
+"""images にパス検索用の正規化キー (path_key) と UNIQUE インデックスを追加する。
+
+``ImageRepository.get_image_ids_by_filepaths`` は filename IN (...) で候補を取り、
+候補ごとに stored_image_path を resolve して Python 側で比較していた。同名ファイルが
+多数のサブディレクトリにあると比較が膨らむため、プロジェクトルート相対の正規化パスを
+``images.path_key`` に保存し、UNIQUE インデックスで 1 回の索引検索に置き換える。
+
+既存行は backfill する。キーの求め方は ``lorairo.database.db_core.stored_path_key`` と
+同じ (プロジェクトルート = DB ファイルのディレクトリ)。同じキーになる行が複数ある場合は
+最小 ID の行のみにキーを設定し、残りは NULL (検索は従来の比較へフォールバック) にする。
+
+Revision ID: e7f8a9b0c1d2
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-19
+"""
+
+import logging
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import op
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+revision: str = "e7f8a9b0c1d2"
+down_revision: str | None = "c9d0e1f2a3b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_INDEX = "uq_images_path_key"
+
+
+def _path_key(stored_path: str, project_root: Path) -> str:
+    """db_core.stored_path_key と同じ正規化 (migration 時点の実装を固定するため複製)。"""
+    path = Path(stored_path.replace("\\", "/"))
+    if not path.is_absolute():
+        if project_root.name in path.parts:
+            remainder = path.parts[path.parts.index(project_root.name) + 1 :]
+            path = project_root.joinpath(*remainder) if remainder else project_root / path
+        else:
+            path = project_root / path
+    normalized = Path(os.path.normcase(os.path.normpath(path)))
+    root = Path(os.path.normcase(os.path.normpath(project_root)))
+    try:
+        return normalized.relative_to(root).as_posix()
+    except ValueError:
+        return normalized.as_posix()
+
+
+def _project_root(bind: sa.engine.Connection) -> Path:
+    database = bind.engine.url.database
+    if not database or database == ":memory:":
+        return Path.cwd()
+    return Path(database).resolve().parent
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "images" not in set(inspector.get_table_names()):
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("images")}
+    if "path_key" not in columns:
+        op.add_column("images", sa.Column("path_key", sa.String(), nullable=True))
+
+    if "stored_image_path" in columns:
+        project_root = _project_root(bind)
+        rows = bind.execute(
+            sa.text("SELECT id, stored_image_path FROM images WHERE path_key IS NULL ORDER BY id")
+        ).fetchall()
+        taken = {
+            key
+            for (key,) in bind.execute(sa.text("SELECT path_key FROM images WHERE path_key IS NOT NULL"))
+        }
+        updates = []
+        collisions = 0
+        for image_id, stored_path in rows:
+            key = _path_key(stored_path, project_root)
+            if key in taken:
+                collisions += 1
+                continue
+            taken.add(key)
+            updates.append({"id": image_id, "path_key": key})
+        if updates:
+            bind.execute(sa.text("UPDATE images SET path_key = :path_key WHERE id = :id"), updates)
+        if collisions:
+            logger.info(f"images.path_key: {collisions} row(s) share a path with another row; left NULL")
+
+    existing_indexes = {index["name"] for index in inspector.get_indexes("images")}
+    if _INDEX not in existing_indexes:
+        op.create_index(_INDEX, "images", ["path_key"], unique=True)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "images" not in set(inspector.get_table_names()):
+        return
+
+    existing_indexes = {index["name"] for index in inspector.get_indexes("images")}
+    if _INDEX in existing_indexes:
+        op.drop_index(_INDEX, table_name="images")
+    columns = {column["name"] for column in inspector.get_columns("images")}
+    if "path_key" in columns:
+        with op.batch_alter_table("images") as batch_op:
+            batch_op.drop_column("path_key")
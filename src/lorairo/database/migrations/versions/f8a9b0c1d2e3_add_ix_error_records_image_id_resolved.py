@@ -0,0 +1,36 @@
+"""Add composite index ix_error_records_image_id_resolved on error_records(image_id, resolved_at)
+
+WebAPI アノテーション送信前の refusal prefilter は、プロジェクト全体の未解決 refusal
+image_id を Python set に読み込んでから候補と突き合わせていた。候補 image_id に絞った
+検索 (image_id IN (...) AND resolved_at IS NULL) を index seek にするための索引。
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-19
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "f8a9b0c1d2e3"
+down_revision = "e7f8a9b0c1d2"
+branch_labels = None
+depends_on = None
+
+_INDEX = "ix_error_records_image_id_resolved"
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "error_records" not in set(inspector.get_table_names()):
+        return
+    if _INDEX not in {index["name"] for index in inspector.get_indexes("error_records")}:
+        op.create_index(_INDEX, "error_records", ["image_id", "resolved_at"])
+
+
+def downgrade() -> None:  # pragma: no cover
+    inspector = sa.inspect(op.get_bind())
+    if "error_records" not in set(inspector.get_table_names()):
+        return
+    if _INDEX in {index["name"] for index in inspector.get_indexes("error_records")}:
+        op.drop_index(_INDEX, table_name="error_records")
@@ -0,0 +1,245 @@
+"""SQLite エンジンの接続プール計測と書き込みゲート。
+
+プロジェクト DB は WAL モードの SQLite で、GUI スレッド・ワーカー・件数推定スレッド・
+CLI が同じファイルを共有する。読み取り専用エンジン (``PRAGMA query_only``) と書き込み
+エンジンを分け、書き込みエンジンには :class:`WriterGate` を取り付けて同一プロセス内の
+書き込みトランザクションを 1 本ずつ直列化する。直列化しない場合、並行した書き込みは
+SQLite の busy handler (sleep を挟むポーリング) で待ち合わせるため、待機が長くなりやすい。
+
+ゲートはトランザクション中の最初の DML で取得し、commit / rollback / プール返却で解放する。
+同一スレッド内の入れ子セッションはゲートを再入できる。取得が ``busy_timeout`` 内に
+できなければゲート無しで続行し、従来どおり SQLite のロック待ちに委ねる。
+
+計測値は :func:`get_engine_metrics` で取得し、``ServiceContainer.get_service_summary``
+から参照する。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..utils.log import logger
+
+# 書き込みゲートを必要とする SQL の先頭キーワード
+_WRITE_KEYWORDS = frozenset({"INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "DROP", "ALTER"})
+# 接続ごとの info に置く「ゲート保持中」フラグのキー
+_GATE_HELD_KEY = "lorairo_writer_gate_held"
+
+
+@dataclass
+class PoolMetrics:
+    """1 エンジン分の接続プール計測値。
+
+    Attributes:
+        role: エンジンの役割 (``"write"`` / ``"read"``)
+        connects: 新規に開いた DBAPI 接続数
+        checkouts: プールからの貸し出し回数
+        checkins: プールへの返却回数
+        checked_out: 現在貸し出し中の接続数
+        peak_checked_out: 貸し出し中接続数の最大値
+    """
+
+    role: str
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    checked_out: int = 0
+    peak_checked_out: int = 0
+
+
+@dataclass
+class WriterGateMetrics:
+    """書き込みゲートの計測値。
+
+    Attributes:
+        acquisitions: ゲートを取得した書き込みトランザクション数 (再入は数えない)
+        contended: 他スレッドの解放を待った回数
+        wait_ms_total: 待機時間の合計 (ミリ秒)
+        wait_ms_max: 待機時間の最大値 (ミリ秒)
+        timeouts: タイムアウトしてゲート無しで続行した回数
+    """
+
+    acquisitions: int = 0
+    contended: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    timeouts: int = 0
+
+
+class WriterGate:
+    """スレッド単位で再入可能な、どのスレッドからも解放できる書き込みゲート。
+
+    ``threading.RLock`` はプール返却がガベージコレクション経由で別スレッドから
+    走ると解放できないため、Condition で所有スレッドと深さを管理する。
+    """
+
+    def __init__(self, timeout_s: float) -> None:
+        self.timeout_s = timeout_s
+        self.metrics = WriterGateMetrics()
+        self._condition = threading.Condition()
+        self._owner: int | None = None
+        self._depth = 0
+
+    def acquire(self) -> bool:
+        """ゲートを取得する。
+
+        Returns:
+            取得できたら ``True``。``timeout_s`` 以内に取得できなければ ``False``。
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._owner == me:
+                self._depth += 1
+                return True
+            start = time.perf_counter()
+            contended = self._owner is not None
+            if not self._condition.wait_for(lambda: self._owner is None, timeout=self.timeout_s):
+                self.metrics.timeouts += 1
+                return False
+            waited_ms = (time.perf_counter() - start) * 1000
+            self._owner = me
+            self._depth = 1
+            self.metrics.acquisitions += 1
+            if contended:
+                self.metrics.contended += 1
+                self.metrics.wait_ms_total += waited_ms
+                self.metrics.wait_ms_max = max(self.metrics.wait_ms_max, waited_ms)
+            return True
+
+    def release(self) -> None:
+        """ゲートを 1 段解放する (最外段で他スレッドに譲る)。"""
+        with self._condition:
+            if self._depth == 0:
+                return
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._condition.notify()
+
+    @property
+    def held(self) -> bool:
+        """いずれかのスレッドがゲートを保持しているか。"""
+        return self._owner is not None
+
+
+# エンジン → 計測値 (エンジンの寿命に合わせて消える)
+_POOL_METRICS: weakref.WeakKeyDictionary[Engine, PoolMetrics] = weakref.WeakKeyDictionary()
+_WRITER_GATES: weakref.WeakKeyDictionary[Engine, WriterGate] = weakref.WeakKeyDictionary()
+
+
+def install_pool_metrics(engine: Engine, role: str) -> PoolMetrics:
+    """``engine`` のプールイベントを計測する。
+
+    Args:
+        engine: 計測するエンジン
+        role: ``"write"`` / ``"read"``
+
+    Returns:
+        計測値 (イベントで更新され続ける)
+    """
+    metrics = PoolMetrics(role=role)
+    _POOL_METRICS[engine] = metrics
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        metrics.connects += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        metrics.checkouts += 1
+        metrics.checked_out += 1
+        metrics.peak_checked_out = max(metrics.peak_checked_out, metrics.checked_out)
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        metrics.checkins += 1
+        metrics.checked_out = max(0, metrics.checked_out - 1)
+
+    return metrics
+
+
+def install_writer_gate(engine: Engine, timeout_s: float) -> WriterGate:
+    """``engine`` の書き込みトランザクションを :class:`WriterGate` で直列化する。
+
+    Args:
+        engine: 書き込みエンジン
+        timeout_s: ゲート取得の最大待機秒数 (超えたらゲート無しで続行する)
+
+    Returns:
+        取り付けたゲート
+    """
+    gate = WriterGate(timeout_s)
+    _WRITER_GATES[engine] = gate
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _acquire_for_write(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        if conn.info.get(_GATE_HELD_KEY) or not _is_write_statement(statement):
+            return
+        if gate.acquire():
+            conn.info[_GATE_HELD_KEY] = True
+        else:
+            logger.warning(
+                f"Writer gate wait exceeded {gate.timeout_s:.0f}s; falling back to SQLite busy_timeout"
+            )
+
+    def _release(info: dict[str, Any]) -> None:
+        if info.pop(_GATE_HELD_KEY, False):
+            gate.release()
+
+    @event.listens_for(engine, "commit")
+    def _release_on_commit(conn: Any) -> None:
+        _release(conn.info)
+
+    @event.listens_for(engine, "rollback")
+    def _release_on_rollback(conn: Any) -> None:
+        _release(conn.info)
+
+    @event.listens_for(engine, "checkin")
+    def _release_on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        # commit / rollback を経ずに返却された接続 (例外・GC) でもゲートを残さない
+        if connection_record is not None:
+            _release(connection_record.info)
+
+    return gate
+
+
+def _is_write_statement(statement: str) -> bool:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword in _WRITE_KEYWORDS
+
+
+def get_writer_gate(engine: Engine) -> WriterGate | None:
+    """``engine`` に取り付けた書き込みゲートを返す (未設定なら None)。
+
+    PRAGMA / ANALYZE / VACUUM はゲートの自動取得対象外のため、DB メンテナンスは
+    このゲートを明示的に保持して同一プロセスの書き込みと直列化する。
+    """
+    return _WRITER_GATES.get(engine)
+
+
+def get_engine_metrics(engine: Engine) -> dict[str, Any]:
+    """``engine`` のプール状態と計測値を返す。
+
+    Args:
+        engine: 対象エンジン
+
+    Returns:
+        ``role`` / 計測カウンタ / ``pool`` (プール実装の状態) と、書き込みエンジンなら
+        ``writer_gate`` を持つ dict。計測していないエンジンは ``pool`` だけを返す。
+    """
+    metrics = _POOL_METRICS.get(engine)
+    summary: dict[str, Any] = asdict(metrics) if metrics is not None else {}
+    summary["pool"] = engine.pool.status()
+    gate = _WRITER_GATES.get(engine)
+    if gate is not None:
+        summary["writer_gate"] = {**asdict(gate.metrics), "held": gate.held}
+    return summary
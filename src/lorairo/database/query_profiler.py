@@ -0,0 +1,406 @@
+"""SQLite クエリのレイテンシ・クエリプラン計測 (オプトイン)。
+
+``_build_image_filter_query`` が組み立てるフィルタの組合せのうち、どれが実運用で
+遅いのかを調べるための計測層。SQLAlchemy の ``before_cursor_execute`` /
+``after_cursor_execute`` イベントで実行時間を測り、正規化 SQL と呼び出し元の
+Repository メソッドの組ごとにレイテンシのヒストグラムを集計する。
+
+しきい値 (``slow_ms``) 以上かかった SELECT は同じ接続で ``EXPLAIN QUERY PLAN`` を
+取り、インデックスを使わない全件走査 (``SCAN <table>``) を記録する。
+
+既定では無効。設定 ``database.query_profiling = true`` または環境変数
+``LORAIRO_DB_PROFILE=1`` で起動時から有効になるほか、GUI の診断ダイアログや
+``lorairo-cli debug db-profile`` から実行時に切り替えられる。無効時はイベント
+リスナーを外すため、計測コストはかからない。
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..utils.log import logger
+
+# ヒストグラムのバケット上端 (ミリ秒)。最後のバケットはこれを超えたもの。
+BUCKET_EDGES_MS: tuple[float, ...] = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+DEFAULT_SLOW_MS = 50.0
+# 1 ステートメントあたりの EXPLAIN QUERY PLAN 取得回数の上限
+MAX_PLAN_SAMPLES = 3
+# 集計するステートメント (正規化 SQL x 呼び出し元) の上限。超えた分は dropped に数える
+MAX_STATEMENTS = 1000
+
+# 呼び出し元とみなすモジュール (前方一致)
+CALLER_MODULES: tuple[str, ...] = ("lorairo.database.repository", "lorairo.database.db_manager")
+_MAX_CALLER_DEPTH = 60
+# 接続ごとの info に積む開始時刻スタックのキー
+_START_KEY = "lorairo_query_profiler_start"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN \(\?(?:, ?\?)*\)", re.IGNORECASE)
+_FULL_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+_NON_TABLE_SCANS = frozenset({"CONSTANT", "SUBQUERY"})
+
+
+def normalize_sql(statement: str) -> str:
+    """リテラルと ``IN`` の要素数を畳み込み、集計キーにする SQL を返す。
+
+    Args:
+        statement: 実行された SQL
+
+    Returns:
+        空白を 1 つにまとめ、文字列・数値リテラルを ``?``、``IN (?, ?, ...)`` を
+        ``IN (...)`` に置き換えた SQL
+    """
+    normalized = _WHITESPACE_RE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL_RE.sub("?", normalized)
+    normalized = _NUMBER_LITERAL_RE.sub("?", normalized)
+    return _IN_LIST_RE.sub("IN (...)", normalized)
+
+
+def find_full_scans(plan: list[str]) -> list[str]:
+    """``EXPLAIN QUERY PLAN`` の detail 行からインデックスを使わない走査のテーブル名を返す。
+
+    ``SCAN images`` は全件走査、``SCAN images USING INDEX ...`` (カバリング
+    インデックスの走査) や ``SCAN CONSTANT ROW`` は対象外とする。
+    """
+    tables: list[str] = []
+    for detail in plan:
+        match = _FULL_SCAN_RE.match(detail.strip())
+        if match is None or " USING " in detail:
+            continue
+        table = match.group(1)
+        if table.upper() not in _NON_TABLE_SCANS and table not in tables:
+            tables.append(table)
+    return tables
+
+
+@dataclass
+class QueryStat:
+    """正規化 SQL x 呼び出し元 1 組分の計測値。
+
+    Attributes:
+        sql: 正規化 SQL
+        caller: 呼び出し元 (``ClassName.method``)。特定できなければ ``"<unknown>"``
+        count: 実行回数
+        total_ms: 実行時間の合計 (ミリ秒)
+        max_ms: 実行時間の最大値 (ミリ秒)
+        buckets: :data:`BUCKET_EDGES_MS` ごとの件数 (末尾は上限超え)
+        slow_count: ``slow_ms`` 以上かかった回数
+        plan: 最後に取得した ``EXPLAIN QUERY PLAN`` の detail 行
+        plan_samples: ``EXPLAIN QUERY PLAN`` を取得した回数
+        full_scans: プランに現れた全件走査のテーブル名
+    """
+
+    sql: str
+    caller: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BUCKET_EDGES_MS) + 1))
+    slow_count: int = 0
+    plan: list[str] = field(default_factory=list)
+    plan_samples: int = 0
+    full_scans: list[str] = field(default_factory=list)
+
+    @property
+    def mean_ms(self) -> float:
+        """平均実行時間 (ミリ秒)。"""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile_ms(self, quantile: float) -> float:
+        """ヒストグラムから分位点を推定する (該当バケットの上端、最大値で頭打ち)。
+
+        Args:
+            quantile: 0.0-1.0 の分位
+
+        Returns:
+            推定値 (ミリ秒)。未実行なら 0.0。
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(quantile * self.count))
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                if index < len(BUCKET_EDGES_MS):
+                    return min(float(BUCKET_EDGES_MS[index]), self.max_ms)
+                break
+        return self.max_ms
+
+    def record(self, elapsed_ms: float, slow: bool) -> None:
+        """1 回分の実行時間を加える。"""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        index = next(
+            (i for i, edge in enumerate(BUCKET_EDGES_MS) if elapsed_ms <= edge), len(BUCKET_EDGES_MS)
+        )
+        self.buckets[index] += 1
+        if slow:
+            self.slow_count += 1
+
+    def copy(self) -> QueryStat:
+        """スナップショット用の複製を返す。"""
+        return QueryStat(
+            sql=self.sql,
+            caller=self.caller,
+            count=self.count,
+            total_ms=self.total_ms,
+            max_ms=self.max_ms,
+            buckets=list(self.buckets),
+            slow_count=self.slow_count,
+            plan=list(self.plan),
+            plan_samples=self.plan_samples,
+            full_scans=list(self.full_scans),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 出力用の dict に変換する。"""
+        return {
+            "sql": self.sql,
+            "caller": self.caller,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "p50_ms": round(self.percentile_ms(0.5), 3),
+            "p95_ms": round(self.percentile_ms(0.95), 3),
+            "max_ms": round(self.max_ms, 3),
+            "slow_count": self.slow_count,
+            "histogram": dict(zip([*map(str, BUCKET_EDGES_MS), "inf"], self.buckets, strict=True)),
+            "plan": list(self.plan),
+            "full_scans": list(self.full_scans),
+        }
+
+
+class QueryProfiler:
+    """登録されたエンジンの SQL 実行時間とクエリプランを集計する。
+
+    ``create_db_engine`` が作ったエンジンはすべて :meth:`register_engine` で登録され、
+    :meth:`enable` 中だけイベントリスナーが付く。集計はスレッドセーフ。
+    """
+
+    def __init__(self, caller_modules: tuple[str, ...] = CALLER_MODULES) -> None:
+        """QueryProfiler を初期化する。
+
+        Args:
+            caller_modules: 呼び出し元とみなすモジュール名 (前方一致)
+        """
+        self._caller_modules = caller_modules
+        self._lock = threading.Lock()
+        self._engines: weakref.WeakSet[Engine] = weakref.WeakSet()
+        self._stats: dict[tuple[str, str], QueryStat] = {}
+        self._enabled = False
+        self._dropped = 0
+        self.slow_ms = DEFAULT_SLOW_MS
+        # event.remove は登録時と同一の関数オブジェクトを要求するため、bound method を保持する
+        self._before_listener = self._before_cursor_execute
+        self._after_listener = self._after_cursor_execute
+        self._error_listener = self._handle_error
+
+    @property
+    def enabled(self) -> bool:
+        """計測中か。"""
+        return self._enabled
+
+    def register_engine(self, engine: Engine) -> None:
+        """計測対象のエンジンを登録する (計測中なら即座にリスナーを付ける)。"""
+        with self._lock:
+            if engine in self._engines:
+                return
+            self._engines.add(engine)
+            if self._enabled:
+                self._attach(engine)
+
+    def enable(self, slow_ms: float | None = None) -> None:
+        """計測を開始する。
+
+        Args:
+            slow_ms: ``EXPLAIN QUERY PLAN`` を取得するしきい値 (ミリ秒)。省略時は現在値。
+        """
+        with self._lock:
+            if slow_ms is not None:
+                self.slow_ms = max(0.0, float(slow_ms))
+            if self._enabled:
+                return
+            self._enabled = True
+            for engine in list(self._engines):
+                self._attach(engine)
+        logger.info(f"Query profiling enabled (slow_ms={self.slow_ms:g})")
+
+    def disable(self) -> None:
+        """計測を止める (集計済みの値は残す)。"""
+        with self._lock:
+            if not self._enabled:
+                return
+            self._enabled = False
+            for engine in list(self._engines):
+                self._detach(engine)
+        logger.info("Query profiling disabled")
+
+    def reset(self) -> None:
+        """集計済みの値を捨てる。"""
+        with self._lock:
+            self._stats.clear()
+            self._dropped = 0
+
+    def snapshot(self) -> list[QueryStat]:
+        """集計値の複製を合計時間の長い順に返す。"""
+        with self._lock:
+            stats = [stat.copy() for stat in self._stats.values()]
+        return sorted(stats, key=lambda stat: stat.total_ms, reverse=True)
+
+    def summary(self, top: int | None = None) -> dict[str, Any]:
+        """計測状態・ステートメント別・呼び出し元別の集計を dict で返す。
+
+        Args:
+            top: ステートメント別の出力件数の上限。``None`` なら全件。
+
+        Returns:
+            ``enabled`` / ``slow_ms`` / ``dropped`` / ``statements`` / ``callers`` /
+            ``full_scans`` を持つ dict
+        """
+        stats = self.snapshot()
+        callers: dict[str, dict[str, Any]] = {}
+        for stat in stats:
+            entry = callers.setdefault(
+                stat.caller, {"caller": stat.caller, "count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            entry["count"] += stat.count
+            entry["total_ms"] += stat.total_ms
+            entry["max_ms"] = max(entry["max_ms"], stat.max_ms)
+        for entry in callers.values():
+            entry["total_ms"] = round(entry["total_ms"], 3)
+            entry["max_ms"] = round(entry["max_ms"], 3)
+        return {
+            "enabled": self._enabled,
+            "slow_ms": self.slow_ms,
+            "dropped": self._dropped,
+            "statements": [stat.to_dict() for stat in stats[:top]],
+            "callers": sorted(callers.values(), key=lambda entry: entry["total_ms"], reverse=True),
+            "full_scans": sorted({table for stat in stats for table in stat.full_scans}),
+        }
+
+    # === Event listeners ===
+
+    def _attach(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_listener)
+        event.listen(engine, "after_cursor_execute", self._after_listener)
+        event.listen(engine, "handle_error", self._error_listener)
+
+    def _detach(self, engine: Engine) -> None:
+        for name, listener in (
+            ("before_cursor_execute", self._before_listener),
+            ("after_cursor_execute", self._after_listener),
+            ("handle_error", self._error_listener),
+        ):
+            if event.contains(engine, name, listener):
+                event.remove(engine, name, listener)
+
+    def _before_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        starts = conn.info.get(_START_KEY)
+        if not starts:
+            return  # 計測開始前に走り始めたステートメント
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+        slow = elapsed_ms >= self.slow_ms
+        key = (normalize_sql(statement), _find_caller(self._caller_modules))
+
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                if len(self._stats) >= MAX_STATEMENTS:
+                    self._dropped += 1
+                    return
+                stat = self._stats[key] = QueryStat(sql=key[0], caller=key[1])
+            stat.record(elapsed_ms, slow)
+            sample_plan = (
+                slow
+                and not executemany
+                and stat.plan_samples < MAX_PLAN_SAMPLES
+                and conn.dialect.name == "sqlite"
+                and _is_select(statement)
+            )
+            if sample_plan:
+                stat.plan_samples += 1
+
+        if sample_plan:
+            plan = _explain_query_plan(cursor, statement, parameters)
+            if plan:
+                with self._lock:
+                    stat.plan = plan
+                    stat.full_scans = sorted(set(stat.full_scans) | set(find_full_scans(plan)))
+
+    def _handle_error(self, exception_context: Any) -> None:
+        conn = exception_context.connection
+        if conn is not None:
+            starts = conn.info.get(_START_KEY)
+            if starts:
+                starts.pop()
+
+
+def _is_select(statement: str) -> bool:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword in ("SELECT", "WITH")
+
+
+def _explain_query_plan(cursor: Any, statement: str, parameters: Any) -> list[str]:
+    """同じ DBAPI 接続で ``EXPLAIN QUERY PLAN`` を実行し、detail 行を返す。"""
+    explain_cursor = cursor.connection.cursor()
+    try:
+        explain_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        return [str(row[-1]) for row in explain_cursor.fetchall()]
+    except Exception as e:
+        logger.debug(f"EXPLAIN QUERY PLAN failed: {e}")
+        return []
+    finally:
+        explain_cursor.close()
+
+
+def _find_caller(caller_modules: tuple[str, ...]) -> str:
+    """スタックを遡り、SQL を発行した Repository / DB Manager のメソッドを特定する。
+
+    内部ヘルパー (``_`` 始まり) より公開メソッドを優先し、どちらも無ければ最も内側の
+    Repository フレームを使う。
+    """
+    frame: FrameType | None = sys._getframe(2)
+    fallback: str | None = None
+    for _ in range(_MAX_CALLER_DEPTH):
+        if frame is None:
+            break
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(caller_modules):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            label = f"{type(owner).__name__}.{name}" if owner is not None else f"{module}.{name}"
+            if not name.startswith("_"):
+                return label
+            fallback = fallback or label
+        frame = frame.f_back
+    return fallback or "<unknown>"
+
+
+_profiler = QueryProfiler()
+
+
+def get_query_profiler() -> QueryProfiler:
+    """プロセス共通の :class:`QueryProfiler` を返す。"""
+    return _profiler
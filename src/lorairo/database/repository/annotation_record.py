@@ -40,7 +40,7 @@ genai-tag-db-tools (外部 tag_db) 統合を本 Repository に集約する。
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -72,8 +72,9 @@ from ..schema import (
     ScoreLabelAnnotationData,
     Tag,
     TagAnnotationData,
+    TagString,
 )
-from .base import BaseRepository
+from .base import BaseRepository, image_id_condition, resolve_tag_string_ids, tag_string_condition
 from .model import ModelRepository
 
 # ADR 0068 (改訂): 保存境界で焼き込む基準フォーマット。非手動タグはこの format の
@@ -297,9 +298,11 @@ class AnnotationRepository(BaseRepository):
         for start in range(0, len(items), effective_chunk_size):
             chunk = items[start : start + effective_chunk_size]
             with self.session_factory() as session:
+                # チャンク (= 1 トランザクション) 内で解決済みの tag_string_id を共有する
+                tag_string_ids: dict[str, int] = {}
                 try:
                     for item in chunk:
-                        self._save_annotations_in_session(session, item)
+                        self._save_annotations_in_session(session, item, tag_string_ids)
                         # autoflush=False のため、同一 chunk 内で同じ image_id が再登場した場合も
                         # 後続 item の upsert query が先行 item の行を参照できるよう明示 flush する。
                         session.flush()
@@ -319,8 +322,17 @@ class AnnotationRepository(BaseRepository):
 
         return saved_count
 
-    def _save_annotations_in_session(self, session: Session, item: AnnotationSaveItem) -> None:
-        """既存 session 内で1画像分の annotation を保存する（commitしない）。"""
+    def _save_annotations_in_session(
+        self,
+        session: Session,
+        item: AnnotationSaveItem,
+        tag_string_ids: dict[str, int] | None = None,
+    ) -> None:
+        """既存 session 内で1画像分の annotation を保存する（commitしない）。
+
+        ``tag_string_ids`` はバッチ保存で同一トランザクションの画像間に共有する
+        タグ文字列 → tag_string_id の解決済みマップ (``_resolve_tag_string_ids``)。
+        """
         image_id = item.image_id
         annotations = item.annotations
         # ADR 0035 段階 5: cross-repo 呼び出しを避けるため、Image 存在チェックを
@@ -333,7 +345,13 @@ class AnnotationRepository(BaseRepository):
 
         # 各アノテーションタイプを処理
         if annotations.get("tags"):
-            self._save_tags(session, image_id, annotations["tags"], tag_id_cache=item.tag_id_cache)
+            self._save_tags(
+                session,
+                image_id,
+                annotations["tags"],
+                tag_id_cache=item.tag_id_cache,
+                tag_string_ids=tag_string_ids,
+            )
         if annotations.get("captions"):
             self._save_captions(session, image_id, annotations["captions"])
         if annotations.get("scores"):
@@ -344,7 +362,7 @@ class AnnotationRepository(BaseRepository):
             self._save_ratings(session, image_id, annotations["ratings"])
 
     @staticmethod
-    def _build_existing_tags_map(session: Session, image_ids: list[int]) -> dict[int, set[str]]:
+    def _build_existing_tags_map(session: Session, image_ids: Sequence[int]) -> dict[int, set[str]]:
         """画像IDごとの既存タグマップを構築する。
 
         Args:
@@ -355,25 +373,37 @@ class AnnotationRepository(BaseRepository):
             image_id -> タグ名(小文字)のセットのマッピング。
 
         """
-        existing_tags_stmt = select(Tag).where(
-            Tag.image_id.in_(image_ids),
-            Tag.rejected_at.is_(None),
+        existing_tags_stmt = (
+            select(Tag.image_id, TagString.tag)
+            .join(TagString, TagString.id == Tag.tag_string_id)
+            .where(
+                image_id_condition(Tag.image_id, image_ids),
+                Tag.rejected_at.is_(None),
+            )
         )
-        all_existing_tags = session.execute(existing_tags_stmt).scalars().all()
 
         existing_tags_by_image: dict[int, set[str]] = {}
-        for tag_obj in all_existing_tags:
-            if tag_obj.image_id is None:
+        for image_id, tag in session.execute(existing_tags_stmt):
+            if image_id is None:
                 continue
-            if tag_obj.image_id not in existing_tags_by_image:
-                existing_tags_by_image[tag_obj.image_id] = set()
-            existing_tags_by_image[tag_obj.image_id].add(tag_obj.tag.lower())
+            if image_id not in existing_tags_by_image:
+                existing_tags_by_image[image_id] = set()
+            existing_tags_by_image[image_id].add(tag.lower())
         return existing_tags_by_image
 
+    def _resolve_tag_string_ids(
+        self,
+        session: Session,
+        tag_strings: Iterable[str],
+        resolved: dict[str, int] | None = None,
+    ) -> dict[str, int]:
+        """保存するタグ文字列の tag_string_id を解決する (``resolve_tag_string_ids`` 参照)。"""
+        return resolve_tag_string_ids(session, tag_strings, resolved)
+
     def _plan_tag_addition(
         self,
         session: Session,
-        image_ids: list[int],
+        image_ids: Sequence[int],
         resolved_tag: str,
         model_id: int | None,
     ) -> tuple[list[int], dict[int, Tag]]:
@@ -401,7 +431,7 @@ class AnnotationRepository(BaseRepository):
         existing_tags_by_image = self._build_existing_tags_map(session, image_ids)
 
         rejected_rows_stmt = select(Tag).where(
-            Tag.image_id.in_(image_ids),
+            image_id_condition(Tag.image_id, image_ids),
             Tag.rejected_at.is_not(None),
             (Tag.model_id == model_id) if model_id is not None else Tag.model_id.is_(None),
         )
@@ -432,7 +462,7 @@ class AnnotationRepository(BaseRepository):
 
     def preview_add_tag_to_images_batch(
         self,
-        image_ids: list[int],
+        image_ids: Sequence[int],
         resolved_tag: str,
         model_id: int | None = None,
     ) -> int:
@@ -461,7 +491,7 @@ class AnnotationRepository(BaseRepository):
 
     def add_tag_to_images_batch(
         self,
-        image_ids: list[int],
+        image_ids: Sequence[int],
         tag: str,
         model_id: int | None,
         resolved: tuple[str, int | None] | None = None,
@@ -502,7 +532,7 @@ class AnnotationRepository(BaseRepository):
         with self.session_factory() as session:
             try:
                 # canonical 解決を dedup の前に1回だけ行う (日本語→canonical, alias→preferred)。
-                # 保存する tags.tag を解決後の canonical 文字列に置換する (ADR 0083 §4 / #988)。
+                # 保存するタグ文字列を解決後の canonical 文字列に置換する (ADR 0083 §4 / #988)。
                 resolved_tag, external_tag_id = self._resolution_for_batch_add(session, input_tag, resolved)
                 if external_tag_id is None:
                     logger.warning(
@@ -522,11 +552,16 @@ class AnnotationRepository(BaseRepository):
                         f"Revived soft-rejected tag '{resolved_tag}' for image_id {image_id}",
                     )
 
+                tag_string_id = (
+                    self._resolve_tag_string_ids(session, [resolved_tag])[resolved_tag]
+                    if to_insert
+                    else None
+                )
                 for image_id in to_insert:
                     new_tag = Tag(
                         image_id=image_id,
                         model_id=model_id,
-                        tag=resolved_tag,
+                        tag_string_id=tag_string_id,
                         tag_id=external_tag_id,
                         confidence_score=None,
                         existing=False,
@@ -549,7 +584,7 @@ class AnnotationRepository(BaseRepository):
                 raise
 
     def _plan_tag_removal(
-        self, session: Session, image_ids: list[int], normalized_tag: str
+        self, session: Session, image_ids: Sequence[int], normalized_tag: str
     ) -> list[tuple[int, str]]:
         """タグ削除の適用計画 (image_id ごとの changed/skipped) を読み取り専用で組み立てる。
 
@@ -577,7 +612,9 @@ class AnnotationRepository(BaseRepository):
                 per_item.append((image_id, "changed"))
         return per_item
 
-    def preview_remove_tag_from_images_batch(self, image_ids: list[int], tag: str) -> list[tuple[int, str]]:
+    def preview_remove_tag_from_images_batch(
+        self, image_ids: Sequence[int], tag: str
+    ) -> list[tuple[int, str]]:
         """タグ削除の dry-run 見積り (would_remove の根拠) を返す (読み取り専用、Issue #1217)。
 
         `remove_tag_from_images_batch` と同じ判定 (`_plan_tag_removal`) で
@@ -597,7 +634,7 @@ class AnnotationRepository(BaseRepository):
 
     def remove_tag_from_images_batch(
         self,
-        image_ids: list[int],
+        image_ids: Sequence[int],
         tag: str,
         reason: str = REJECT_REASON_INCORRECT,
     ) -> tuple[bool, list[tuple[int, str]]]:
@@ -645,7 +682,7 @@ class AnnotationRepository(BaseRepository):
                             # 保存値は大小混在しうる (canonical 解決結果 / 未解決タグ)。
                             # 計画側 (`_plan_tag_removal`) が小文字化して判定するため、
                             # 更新側も揃えないと「成功報告 + 0 行更新」になる (#1288)。
-                            func.lower(Tag.tag) == normalized_tag,
+                            tag_string_condition(func.lower(TagString.tag) == normalized_tag),
                             Tag.rejected_at.is_(None),
                         )
                         .values(
@@ -670,7 +707,7 @@ class AnnotationRepository(BaseRepository):
 
     def replace_tag_for_images_batch(
         self,
-        image_ids: list[int],
+        image_ids: Sequence[int],
         from_tag: str,
         to_tag: str,
     ) -> tuple[bool, list[tuple[int, str]]]:
@@ -724,7 +761,7 @@ class AnnotationRepository(BaseRepository):
                         .where(
                             Tag.image_id.in_(images_to_change),
                             # 保存値の大小混在に追従する (#1288)
-                            func.lower(Tag.tag) == normalized_from,
+                            tag_string_condition(func.lower(TagString.tag) == normalized_from),
                             Tag.rejected_at.is_(None),
                         )
                         .values(
@@ -735,24 +772,27 @@ class AnnotationRepository(BaseRepository):
                     )
 
                     # 変換先タグを追加（各画像で既存チェックして重複回避）
-                    to_tag_external_id: int | None = None
-                    for image_id in images_to_change:
-                        existing_tags = existing_tags_by_image.get(image_id, set())
-                        if normalized_to not in existing_tags:
-                            if to_tag_external_id is None:
-                                to_tag_external_id = self._get_or_create_tag_id_external(
-                                    session, normalized_to
-                                )
-                            new_tag = Tag(
-                                image_id=image_id,
-                                model_id=None,
-                                tag=normalized_to,
-                                tag_id=to_tag_external_id,
-                                confidence_score=None,
-                                existing=False,
-                                is_edited_manually=True,
-                            )
-                            session.add(new_tag)
+                    images_to_add = [
+                        iid
+                        for iid in images_to_change
+                        if normalized_to not in existing_tags_by_image.get(iid, set())
+                    ]
+                    if images_to_add:
+                        to_tag_external_id = self._get_or_create_tag_id_external(session, normalized_to)
+                        to_tag_string_id = self._resolve_tag_string_ids(session, [normalized_to])[
+                            normalized_to
+                        ]
+                    for image_id in images_to_add:
+                        new_tag = Tag(
+                            image_id=image_id,
+                            model_id=None,
+                            tag_string_id=to_tag_string_id,
+                            tag_id=to_tag_external_id,
+                            confidence_score=None,
+                            existing=False,
+                            is_edited_manually=True,
+                        )
+                        session.add(new_tag)
 
                 session.commit()
                 changed = len(images_to_change)
@@ -769,7 +809,7 @@ class AnnotationRepository(BaseRepository):
 
     def restore_tag_for_images_batch(
         self,
-        image_ids: list[int],
+        image_ids: Sequence[int],
         tag: str,
     ) -> tuple[bool, list[tuple[int, str]]]:
         """soft-reject されたタグを復活する (rejected_at を NULL に戻す、Issue #792)。
@@ -802,9 +842,9 @@ class AnnotationRepository(BaseRepository):
                 rejected_rows = session.execute(
                     select(Tag.image_id)
                     .where(
-                        Tag.image_id.in_(image_ids),
+                        image_id_condition(Tag.image_id, image_ids),
                         # 保存値の大小混在に追従する (#1288)
-                        func.lower(Tag.tag) == normalized_tag,
+                        tag_string_condition(func.lower(TagString.tag) == normalized_tag),
                         Tag.rejected_at.is_not(None),
                     )
                     .distinct()
@@ -820,7 +860,7 @@ class AnnotationRepository(BaseRepository):
                         .where(
                             Tag.image_id.in_(rejected_image_ids),
                             # 保存値の大小混在に追従する (#1288)
-                            func.lower(Tag.tag) == normalized_tag,
+                            tag_string_condition(func.lower(TagString.tag) == normalized_tag),
                             Tag.rejected_at.is_not(None),
                         )
                         .values(
@@ -862,7 +902,8 @@ class AnnotationRepository(BaseRepository):
         with self.session_factory() as session:
             try:
                 rows = session.execute(
-                    select(Tag.tag, Tag.tag_id, Tag.is_edited_manually, Tag.reject_reason)
+                    select(TagString.tag, Tag.tag_id, Tag.is_edited_manually, Tag.reject_reason)
+                    .join(TagString, TagString.id == Tag.tag_string_id)
                     .where(Tag.image_id == image_id, Tag.rejected_at.is_not(None))
                     .order_by(Tag.rejected_at)
                 ).all()
@@ -1002,7 +1043,7 @@ class AnnotationRepository(BaseRepository):
         保持する (ADR 0083 §4 / #988)。
 
         `_get_or_create_tag_id_external` との違い:
-          - 戻り値に canonical 文字列を含める (保存する `tags.tag` を canonical へ置換するため)。
+          - 戻り値に canonical 文字列を含める (保存するタグ文字列を canonical へ置換するため)。
           - `resolve_preferred=True` で alias→preferred を解決する (手動追加経路専用)。
 
         Args:
@@ -1016,7 +1057,7 @@ class AnnotationRepository(BaseRepository):
 
         """
         # 検索・登録には clean_format 正規化を使うが、未ヒット時の保存値は入力をそのまま
-        # 残す (既存挙動を踏襲: tags.tag は入力 verbatim、外部 DB 側のみ正規化形を使う)。
+        # 残す (既存挙動を踏襲: 保存するタグ文字列は入力 verbatim、外部 DB 側のみ正規化形を使う)。
         normalized_tag = TagCleaner.clean_format(tag_string).strip()
         if not normalized_tag:
             logger.warning(f"Tag normalization resulted in empty string: '{tag_string}'")
@@ -1042,7 +1083,7 @@ class AnnotationRepository(BaseRepository):
                 return (canonical, tag_id)
 
             # 翻訳/エイリアス未ヒット → 入力をそのまま保存しつつ外部 DB へ新規登録
-            # (source_tag に生入力を保持。tags.tag は入力 verbatim を維持)
+            # (source_tag に生入力を保持。保存するタグ文字列は入力 verbatim を維持)
             retry_request = TagSearchRequest(
                 query=normalized_tag,
                 partial=False,
@@ -1533,6 +1574,7 @@ class AnnotationRepository(BaseRepository):
         tags_data: list[TagAnnotationData],
         *,
         tag_id_cache: dict[str, int | None] | None = None,
+        tag_string_ids: dict[str, int] | None = None,
     ) -> None:
         """タグ情報を保存・更新 (Upsert)
 
@@ -1548,6 +1590,8 @@ class AnnotationRepository(BaseRepository):
             tag_id_cache: 正規化済みタグ文字列→tag_idのキャッシュ。
                 canonical 解決できなかった非手動タグ・手動タグの tag_id 解決に使う。
                 キャッシュミス時は従来通り_get_or_create_tag_id_external()にフォールバック。
+            tag_string_ids: タグ文字列→tag_string_id の解決済みマップ (バッチ内で共有)。
+                未解決の文字列はここで tag_strings へ一括登録して書き足す。
 
         """
         logger.debug(f"Saving/Updating {len(tags_data)} tags for image_id {image_id}")
@@ -1571,16 +1615,25 @@ class AnnotationRepository(BaseRepository):
         }
         canonical_map = self._resolve_danbooru_canonical(canonical_targets)
 
+        planned: list[tuple[TagAnnotationData, str, CanonicalTag | None]] = []
         for tag_info in tags_data:
             # 全取込経路の tag をまず clean_format 整形に統一する (lower 化はしない)。
             clean_tag = TagCleaner.clean_format(tag_info["tag"]).strip()
             if not clean_tag:
                 # 整形後に空文字になったタグはスキップ
                 continue
-
             # 非手動タグは canonical 解決できれば preferred 文字列 + preferred tag_id を採用する。
             is_manual = bool(tag_info.get("is_edited_manually"))
-            canonical = None if is_manual else canonical_map.get(clean_tag)
+            planned.append((tag_info, clean_tag, None if is_manual else canonical_map.get(clean_tag)))
+
+        # 保存する文字列の tag_string_id を 1 回でまとめて解決する
+        string_ids = self._resolve_tag_string_ids(
+            session,
+            (canonical.tag if canonical is not None else clean_tag for _, clean_tag, canonical in planned),
+            tag_string_ids,
+        )
+
+        for tag_info, clean_tag, canonical in planned:
             tag_string = canonical.tag if canonical is not None else clean_tag
 
             model_id = tag_info.get("model_id")  # Optional
@@ -1618,7 +1671,7 @@ class AnnotationRepository(BaseRepository):
                 # rejected_at / reject_reason は触らない: soft-reject はユーザー判断を
                 # 優先して維持する (Issue #1065 ユーザー確認済みポリシー / ADR 0065)。
                 logger.debug(f"Updating existing tag: id={existing_record.id}, tag='{tag_string}'")
-                existing_record.tag = tag_string
+                existing_record.tag_string_id = string_ids[tag_string]
                 existing_record.tag_id = external_tag_id
                 existing_record.confidence_score = confidence
                 existing_record.existing = is_existing_tag
@@ -1630,7 +1683,7 @@ class AnnotationRepository(BaseRepository):
                 new_tag = Tag(
                     image_id=image_id,
                     model_id=model_id,
-                    tag=tag_string,
+                    tag_string_id=string_ids[tag_string],
                     tag_id=external_tag_id,
                     confidence_score=confidence,
                     existing=is_existing_tag,
@@ -1915,7 +1968,7 @@ class AnnotationRepository(BaseRepository):
 
     def update_rating_batch(
         self,
-        image_ids: list[int],
+        image_ids: Sequence[int],
         rating: str,
         model_id: int,
     ) -> tuple[bool, int]:
@@ -1949,7 +2002,7 @@ class AnnotationRepository(BaseRepository):
         with self.session_factory() as session:
             try:
                 # 既存の Rating レコードを一括取得（N+1回避）
-                existing_ratings_stmt = select(Rating).where(Rating.image_id.in_(image_ids))
+                existing_ratings_stmt = select(Rating).where(image_id_condition(Rating.image_id, image_ids))
                 existing_ratings = session.execute(existing_ratings_stmt).scalars().all()
                 existing_rating_map = {r.image_id: r for r in existing_ratings}
 
@@ -1993,7 +2046,7 @@ class AnnotationRepository(BaseRepository):
                 )
                 raise
 
-    def get_rating_breakdown_for_images(self, image_ids: list[int]) -> dict[str, int]:
+    def get_rating_breakdown_for_images(self, image_ids: Sequence[int]) -> dict[str, int]:
         """指定画像IDセットの normalized_rating 別件数を返す。
 
         Args:
@@ -2012,7 +2065,7 @@ class AnnotationRepository(BaseRepository):
         with self.session_factory() as session:
             stmt = (
                 select(Rating.normalized_rating, func.count(Rating.id))
-                .where(Rating.image_id.in_(image_ids))
+                .where(image_id_condition(Rating.image_id, image_ids))
                 .group_by(Rating.normalized_rating)
             )
             rows = session.execute(stmt).all()
@@ -2020,7 +2073,7 @@ class AnnotationRepository(BaseRepository):
 
     def update_score_batch(
         self,
-        image_ids: list[int],
+        image_ids: Sequence[int],
         score: float,
         model_id: int | None,
     ) -> tuple[bool, int]:
@@ -2053,7 +2106,7 @@ class AnnotationRepository(BaseRepository):
         with self.session_factory() as session:
             try:
                 # 既存の Score レコードを一括取得（N+1回避）
-                existing_scores_stmt = select(Score).where(Score.image_id.in_(image_ids))
+                existing_scores_stmt = select(Score).where(image_id_condition(Score.image_id, image_ids))
                 existing_scores = session.execute(existing_scores_stmt).scalars().all()
                 existing_score_map = {s.image_id: s for s in existing_scores}
 
@@ -1,15 +1,109 @@
 """Repository 層の共通基盤 (ADR 0035 §2)。
 
 `ImageRepository` を Aggregate 単位で分割した後、全 Repository クラスが本基盤を継承する。
-共通プロパティ (`session_factory`) と全体定数 (`BATCH_CHUNK_SIZE`) を保持する。
+共通プロパティ (`session_factory` / `read_session_factory`) と全体定数 (`BATCH_CHUNK_SIZE`) を保持する。
 """
 
-from collections.abc import Callable
-from typing import ClassVar
+from collections.abc import Callable, Iterable
+from typing import Any, ClassVar
 
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
-from ..db_core import DefaultSessionLocal
+from ..db_core import DefaultReadSessionLocal, DefaultSessionLocal
+from ..image_id_selection import ImageIdSelection
+from ..schema import Tag, TagString
+
+# image_id_condition で BETWEEN に展開する区間数の上限。OR の連鎖は SQLite の
+# 式の深さ上限 (既定 1000) に数えられるため、断片化した選択は IN にフォールバックする。
+MAX_ID_RANGE_TERMS = 200
+
+
+def image_id_condition(
+    column: InstrumentedAttribute[Any] | ColumnElement[Any], image_ids: Iterable[int]
+) -> ColumnElement[bool]:
+    """``column`` が ``image_ids`` のいずれかに一致する条件を返す。
+
+    ``ImageIdSelection`` は連続区間を ``BETWEEN`` にまとめ、残りの単独 ID だけを
+    ``IN`` に渡す。検索結果の「すべて選択」のように ID が連続する大きな選択でも
+    バインド変数が区間数程度で済む。区間が ``MAX_ID_RANGE_TERMS`` を超える場合と
+    それ以外の入力は従来どおり ``IN`` にする。
+
+    Args:
+        column: 画像 ID 列 (``Tag.image_id`` 等)。
+        image_ids: 画像 ID の集合。
+
+    Returns:
+        WHERE 句に渡す条件式。
+    """
+    if not isinstance(image_ids, ImageIdSelection):
+        return column.in_(image_ids)
+    ranges: list[tuple[int, int]] = []
+    singles: list[int] = []
+    for first, last in image_ids.runs():
+        if first == last:
+            singles.append(first)
+        else:
+            ranges.append((first, last))
+    if not ranges or len(ranges) > MAX_ID_RANGE_TERMS:
+        return column.in_(image_ids)
+    terms = [column.between(first, last) for first, last in ranges]
+    if singles:
+        terms.append(column.in_(singles))
+    return or_(*terms)
+
+
+def tag_string_condition(predicate: ColumnElement[bool]) -> ColumnElement[bool]:
+    """タグ文字列の条件を満たす tags 行の条件を ``tag_string_id`` の整数比較で返す。
+
+    ``predicate`` (``TagString.tag`` に対する完全一致 / LIKE / lower 比較等) は数千行の
+    語彙テーブルで評価し、tags 側は ``ix_tags_tag_string_id`` の整数 IN で引く。
+
+    Args:
+        predicate: ``TagString.tag`` に対する条件式。
+
+    Returns:
+        WHERE 句に渡す tags の条件式。
+    """
+    return Tag.tag_string_id.in_(select(TagString.id).where(predicate))
+
+
+def resolve_tag_string_ids(
+    session: Session,
+    tag_strings: Iterable[str],
+    resolved: dict[str, int] | None = None,
+) -> dict[str, int]:
+    """タグ文字列を tag_strings 語彙へ登録し、文字列 → tag_string_id を返す。
+
+    未解決の異なる文字列だけを ``INSERT ... ON CONFLICT DO NOTHING`` でまとめて
+    追加し、ID を 1 回の SELECT で引く。tags 行の ``tag_string_id`` は書き込み時に
+    この結果を直接設定する。
+
+    Args:
+        session: SQLAlchemy セッション。
+        tag_strings: tags に保存するタグ文字列 (大文字小文字は区別する)。
+        resolved: 解決済みマップ。渡された場合は未解決分だけ照会して書き足し、
+            同じ dict を返す (バッチ保存でトランザクション内に共有する)。
+
+    Returns:
+        タグ文字列 → tag_string_id のマッピング。
+    """
+    result = resolved if resolved is not None else {}
+    missing = sorted({tag for tag in tag_strings if tag not in result})
+    chunk_size = BaseRepository.BATCH_CHUNK_SIZE
+    for start in range(0, len(missing), chunk_size):
+        chunk = missing[start : start + chunk_size]
+        session.execute(
+            sqlite_insert(TagString)
+            .values([{"tag": tag} for tag in chunk])
+            .on_conflict_do_nothing(index_elements=["tag"])
+        )
+        for tag, string_id in session.execute(
+            select(TagString.tag, TagString.id).where(TagString.tag.in_(chunk))
+        ):
+            result[tag] = string_id
+    return result
 
 
 class BaseRepository:
@@ -20,6 +114,7 @@ class BaseRepository:
 
     Attributes:
         session_factory: SQLAlchemy セッションを生成する callable。
+        read_session_factory: 検索・件数取得用の読み取り専用セッションを生成する callable。
         BATCH_CHUNK_SIZE: SQLite バインド変数上限の安全マージン (32,766 の約半分)。
             IN 句以外にもクエリ内で変数を使うため余裕を持たせる。
 
@@ -29,16 +124,28 @@ class BaseRepository:
     # IN句以外にもクエリ内で変数を使うため余裕を持たせる
     BATCH_CHUNK_SIZE: ClassVar[int] = 15000
 
-    def __init__(self, session_factory: Callable[[], Session] = DefaultSessionLocal) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = DefaultSessionLocal,
+        read_session_factory: Callable[[], Session] | None = None,
+    ) -> None:
         """BaseRepository のコンストラクタ。
 
         Args:
             session_factory: SQLAlchemy セッションを生成するファクトリ関数。
                 デフォルトは `db_core.DefaultSessionLocal` を使用。
                 テスト時にモック化可能。
+            read_session_factory: 読み取り専用セッションのファクトリ関数。省略時は
+                `session_factory` がデフォルトなら `db_core.DefaultReadSessionLocal`、
+                それ以外は `session_factory` 自身を使う (テストの単一 DB をそのまま読む)。
 
         """
         self.session_factory = session_factory
+        if read_session_factory is None:
+            read_session_factory = (
+                DefaultReadSessionLocal if session_factory is DefaultSessionLocal else session_factory
+            )
+        self.read_session_factory = read_session_factory
 
     def get_session(self) -> Session:
         """セッションを取得する（生 SQL を実行する際に使用）。
@@ -18,14 +18,15 @@ Note:
 from __future__ import annotations
 
 import datetime
+from collections.abc import Sequence
 from datetime import UTC
 
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.future import select
 
 from ...utils.log import logger
-from ..schema import ErrorRecord
+from ..schema import ErrorRecord, ErrorRecordData
 from .base import BaseRepository
 
 
@@ -88,6 +89,47 @@ class ErrorRecordRepository(BaseRepository):
                 logger.opt(exception=True).error(f"エラーレコードの保存中にエラーが発生しました: {e}")
                 raise
 
+    def save_error_records_batch(self, records: Sequence[ErrorRecordData]) -> int:
+        """複数のエラーレコードを 1 トランザクションの複数行 INSERT で保存する。
+
+        ワーカーの大量失敗 (壊れたディレクトリの登録等) で 1 件ごとに commit すると
+        書き込みロックを奪い合うため、:class:`ErrorRecordSink` がまとめて呼び出す。
+
+        Args:
+            records: 保存するエラーレコード (``save_error_record`` の引数と同じキー)。
+
+        Returns:
+            int: 保存した件数。
+
+        Raises:
+            SQLAlchemyError: データベース操作でエラーが発生した場合。
+        """
+        rows = [
+            {
+                "image_id": record.get("image_id"),
+                "operation_type": record["operation_type"],
+                "error_type": record["error_type"],
+                "error_message": record["error_message"],
+                "stack_trace": record.get("stack_trace"),
+                "file_path": record.get("file_path"),
+                "model_name": record.get("model_name"),
+            }
+            for record in records
+        ]
+        if not rows:
+            return 0
+        with self.session_factory() as session:
+            try:
+                for start in range(0, len(rows), self.BATCH_CHUNK_SIZE):
+                    session.execute(insert(ErrorRecord), rows[start : start + self.BATCH_CHUNK_SIZE])
+                session.commit()
+                logger.debug(f"エラーレコードを一括保存しました: {len(rows)}件")
+                return len(rows)
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.opt(exception=True).error(f"エラーレコードの一括保存中にエラーが発生しました: {e}")
+                raise
+
     def get_error_count_unresolved(self, operation_type: str | None = None) -> int:
         """未解決エラー件数を取得する (resolved_at IS NULL)。
 
@@ -119,6 +161,7 @@ class ErrorRecordRepository(BaseRepository):
         operation_type: str | None = None,
         resolved: bool = False,
         error_types: list[str] | None = None,
+        image_ids: Sequence[int] | None = None,
     ) -> list[int]:
         """エラー画像のID一覧を取得する。
 
@@ -129,6 +172,9 @@ class ErrorRecordRepository(BaseRepository):
             error_types: 特定 error_type のみに絞る (例:
                 ["SAFETY_REFUSAL", "CONTENT_POLICY_REFUSAL"])。
                 None = 全 type。ADR 0023 Phase 1.5 の送信前 filter で使用。
+            image_ids: 候補の画像 ID に絞る (None = プロジェクト全体)。送信前 filter は
+                候補分だけを ``ix_error_records_image_id_resolved`` で引き、
+                全件の ID 集合を読み込まない。
 
         Returns:
             list[int]: 画像IDリスト (重複除去済み、None を除外)。
@@ -148,14 +194,23 @@ class ErrorRecordRepository(BaseRepository):
                 if error_types:
                     query = query.where(ErrorRecord.error_type.in_(error_types))
 
-                results = session.execute(query).scalars().all()
-                image_ids = [id for id in results if id is not None]
+                if image_ids is None:
+                    results = list(session.execute(query).scalars().all())
+                else:
+                    candidates = list(dict.fromkeys(image_ids))
+                    results = []
+                    for start in range(0, len(candidates), self.BATCH_CHUNK_SIZE):
+                        chunk = candidates[start : start + self.BATCH_CHUNK_SIZE]
+                        results.extend(
+                            session.execute(query.where(ErrorRecord.image_id.in_(chunk))).scalars()
+                        )
+                error_image_ids = [id for id in results if id is not None]
                 logger.debug(
-                    f"エラー画像ID一覧を取得: {len(image_ids)}件 "
+                    f"エラー画像ID一覧を取得: {len(error_image_ids)}件 "
                     f"(operation_type={operation_type or 'all'}, resolved={resolved}, "
                     f"error_types={error_types or 'all'})",
                 )
-                return image_ids
+                return error_image_ids
             except SQLAlchemyError as e:
                 logger.opt(exception=True).error(f"エラー画像ID一覧の取得中にエラーが発生しました: {e}")
                 raise
@@ -27,6 +27,7 @@
 from __future__ import annotations
 
 import datetime
+import os
 from enum import StrEnum
 from pathlib import Path
 from typing import Any, ClassVar
@@ -42,7 +43,7 @@ from sqlalchemy import (
     select,
 )
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 
 from ...domain.quality_tier import compute_quality_summary
 from ...domain.score_scaler import calibrate_to_display, display_weight_for
@@ -62,8 +63,9 @@ from ..schema import (
     Score,
     ScoreLabel,
     Tag,
+    TagString,
 )
-from .base import BaseRepository
+from .base import BaseRepository, tag_string_condition
 from .model import ModelRepository
 
 
@@ -583,11 +585,12 @@ class ImageRepository(BaseRepository):
             logger.debug(f"別版を検出: 同一pHashの新規行として挿入します (pHash: {phash})")
 
         # 新しい Image オブジェクトを作成
+        stored_image_path = str(info["stored_image_path"]).replace("\\", "/")
         new_image = Image(
             uuid=info["uuid"],
             phash=phash,
             original_image_path=str(info["original_image_path"]).replace("\\", "/"),
-            stored_image_path=str(info["stored_image_path"]).replace("\\", "/"),
+            stored_image_path=stored_image_path,
             width=info["width"],
             height=info["height"],
             format=info["format"],
@@ -605,6 +608,7 @@ class ImageRepository(BaseRepository):
 
         with self.session_factory() as session:
             try:
+                new_image.path_key = self._available_path_key(session, stored_image_path)
                 session.add(new_image)
                 session.flush()  # ID を取得するために flush
                 image_id = new_image.id
@@ -910,6 +914,50 @@ class ImageRepository(BaseRepository):
                 )
                 raise
 
+    def get_image_annotation_metadata_batch(self, image_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """複数画像のアノテーションを表示用フォーマットで一括取得する。
+
+        ``get_image_annotation_metadata`` のバッチ版。DatasetStateManager の
+        アノテーションスナップショットがページ単位で先読みするために使い、選択ごとの
+        単一画像クエリを不要にする。``BATCH_CHUNK_SIZE`` ごとに 1 クエリ (+ selectinload)。
+
+        Args:
+            image_ids: 取得対象の画像IDリスト。
+
+        Returns:
+            ``{image_id: アノテーション辞書}``。存在しない image_id は含まれない。
+
+        Raises:
+            SQLAlchemyError: データベース操作でエラーが発生した場合。
+        """
+        result: dict[int, dict[str, Any]] = {}
+        if not image_ids:
+            return result
+
+        with self.session_factory() as session:
+            try:
+                for i in range(0, len(image_ids), self.BATCH_CHUNK_SIZE):
+                    chunk = image_ids[i : i + self.BATCH_CHUNK_SIZE]
+                    stmt = (
+                        select(Image)
+                        .where(Image.id.in_(chunk))
+                        .options(
+                            selectinload(Image.tags).selectinload(Tag.model),
+                            selectinload(Image.captions).selectinload(Caption.model),
+                            selectinload(Image.scores).selectinload(Score.model),
+                            selectinload(Image.score_labels).selectinload(ScoreLabel.model),
+                            selectinload(Image.ratings).selectinload(Rating.model),
+                        )
+                    )
+                    for img in session.execute(stmt).scalars():
+                        result[img.id] = self._format_annotations_for_metadata(img)
+                return result
+            except SQLAlchemyError as e:
+                logger.opt(exception=True).error(
+                    f"画像アノテーションの一括取得中にエラーが発生しました (count={len(image_ids)}): {e}"
+                )
+                raise
+
     def get_batch_available_resolutions(self, image_ids: list[int]) -> dict[int, list[int]]:
         """複数画像の利用可能な処理済み解像度を一括取得する。
 
@@ -1323,9 +1371,9 @@ class ImageRepository(BaseRepository):
     def _assemble_annotations(self, image: Image, *, include_rejected: bool) -> dict[str, Any]:
         """eager-load 済み ``Image`` から 6-key アノテーション dict を組み立てる。
 
-        ``get_image_annotations`` と ``get_image_annotations_batch`` で共有し、単一/一括で
-        返り値の形状が完全一致することを保証する (#1140)。soft-reject フィルタは
-        tags/captions のみに適用する (scores/score_labels/ratings は非対象)。
+        ``get_image_annotations`` が使う。Core 行版の ``get_image_annotations_batch`` も同じ
+        ``_format_*_annotation`` で行を整形するため、単一/一括で返り値の形状が一致する (#1140)。
+        soft-reject フィルタは tags/captions のみに適用する (scores/score_labels/ratings は非対象)。
         """
         annotations: dict[str, Any] = {
             "tags": [],
@@ -1360,13 +1408,15 @@ class ImageRepository(BaseRepository):
     def get_image_annotations_batch(
         self, image_ids: list[int], *, include_rejected: bool = False
     ) -> dict[int, dict[str, Any]]:
-        """複数画像のアノテーションを 1 クエリで一括取得する (#1140 N+1 解消)。
+        """複数画像のアノテーションを Core 行で一括取得する (#1140 N+1 解消)。
 
-        ``get_image_annotations`` と同じ 6-key dict を image_id ごとに返す。
-        ``joinedload`` による行増殖を避けるため ``selectinload`` を使う (tag/caption/
-        score は ``.model`` を参照しないので relation のみ、rating/score_label は
-        ``.model`` も先読みする)。存在しない image_id は空スケルトンを返す (単一版と
-        同じ振る舞い)。
+        ``get_image_annotations`` と同じ 6-key dict を image_id ごとに返す。数千件規模の
+        バッチでは ``Image`` ORM グラフの hydrate (identity map 登録 + relationship
+        構築) と per-row 整形が支配的になるため、チャンクごとに annotation テーブル
+        1 つにつき 1 本の列指定 SELECT を発行し、結果行から直接 dict を組み立てる。
+        score_labels / ratings は ``models`` を OUTER JOIN して model 名を同じ行で取得する。
+        soft-reject フィルタ (tags/captions) は SQL 側の ``rejected_at IS NULL`` で行う。
+        存在しない image_id は空スケルトンを返す (単一版と同じ振る舞い)。
 
         Args:
             image_ids: 取得対象の画像 ID リスト。
@@ -1374,6 +1424,7 @@ class ImageRepository(BaseRepository):
 
         Returns:
             ``{image_id: {tags/captions/scores/score_labels/ratings/quality_summary}}``。
+            各リストは id 昇順。
 
         Raises:
             SQLAlchemyError: データベース操作でエラーが発生した場合。
@@ -1392,33 +1443,148 @@ class ImageRepository(BaseRepository):
         if not image_ids:
             return result
 
+        existing_ids: set[int] = set()
         with self.session_factory() as session:
             try:
                 # チャンク分割で SQLite バインド変数上限を回避 (数百件なら 1 チャンク)。
                 for i in range(0, len(image_ids), self.BATCH_CHUNK_SIZE):
                     chunk = image_ids[i : i + self.BATCH_CHUNK_SIZE]
-                    stmt = (
-                        select(Image)
-                        .where(Image.id.in_(chunk))
-                        .options(
-                            selectinload(Image.tags),
-                            selectinload(Image.captions),
-                            selectinload(Image.scores),
-                            selectinload(Image.score_labels).selectinload(ScoreLabel.model),
-                            selectinload(Image.ratings).selectinload(Rating.model),
+                    existing_ids.update(
+                        self._collect_annotation_rows(
+                            session, chunk, result, include_rejected=include_rejected
                         )
                     )
-                    for image in session.execute(stmt).unique().scalars():
-                        result[image.id] = self._assemble_annotations(
-                            image, include_rejected=include_rejected
-                        )
-                return result
             except SQLAlchemyError as e:
                 logger.opt(exception=True).error(
                     f"アノテーションの一括取得中にエラーが発生しました (count={len(image_ids)}): {e}"
                 )
                 raise
 
+        # ADR 0029: derived view、永続化しない。raw annotation から毎回計算する。
+        # 存在しない image_id は空スケルトン ({} の quality_summary) のまま返す。
+        for image_id in existing_ids:
+            annotations = result[image_id]
+            annotations["quality_summary"] = compute_quality_summary(
+                annotations["score_labels"], annotations["scores"]
+            )
+        return result
+
+    @classmethod
+    def _collect_annotation_rows(
+        cls,
+        session: Session,
+        chunk: list[int],
+        result: dict[int, dict[str, Any]],
+        *,
+        include_rejected: bool,
+    ) -> set[int]:
+        """1 チャンク分の annotation 行を列指定 SELECT で取得し ``result`` へ追記する。
+
+        結果行は ORM 属性と同名の列を持つため、``_format_*_annotation`` にそのまま渡して
+        単一版と同じ整形を共有する。score_labels / ratings は ``models`` を ``model`` として
+        OUTER JOIN し、``row.model`` (``Model`` または None) で model 名を解決する。
+        ``result`` は呼び出し側で全 image_id のスケルトンを初期化済みであること。
+
+        Returns:
+            チャンク内で ``images`` に実在した image_id の集合。
+        """
+        existing_ids = set(session.scalars(select(Image.id).where(Image.id.in_(chunk))))
+        model = aliased(Model, name="model")
+
+        tag_stmt = (
+            select(
+                Tag.image_id,
+                Tag.id,
+                TagString.tag,
+                Tag.tag_id,
+                Tag.model_id,
+                Tag.existing,
+                Tag.is_edited_manually,
+                Tag.confidence_score,
+                Tag.rejected_at,
+                Tag.created_at,
+                Tag.updated_at,
+            )
+            .join(TagString, TagString.id == Tag.tag_string_id)
+            .where(Tag.image_id.in_(chunk))
+        )
+        if not include_rejected:
+            tag_stmt = tag_stmt.where(Tag.rejected_at.is_(None))
+        for tag in session.execute(tag_stmt.order_by(Tag.image_id, Tag.id)):
+            result[tag.image_id]["tags"].append(cls._format_tag_annotation(tag))
+
+        caption_stmt = select(
+            Caption.image_id,
+            Caption.id,
+            Caption.caption,
+            Caption.model_id,
+            Caption.existing,
+            Caption.is_edited_manually,
+            Caption.rejected_at,
+            Caption.created_at,
+            Caption.updated_at,
+        ).where(Caption.image_id.in_(chunk))
+        if not include_rejected:
+            caption_stmt = caption_stmt.where(Caption.rejected_at.is_(None))
+        for caption in session.execute(caption_stmt.order_by(Caption.image_id, Caption.id)):
+            result[caption.image_id]["captions"].append(cls._format_caption_annotation(caption))
+
+        score_stmt = (
+            select(
+                Score.image_id,
+                Score.id,
+                Score.score,
+                Score.model_id,
+                Score.is_edited_manually,
+                Score.created_at,
+                Score.updated_at,
+            )
+            .where(Score.image_id.in_(chunk))
+            .order_by(Score.image_id, Score.id)
+        )
+        for score in session.execute(score_stmt):
+            result[score.image_id]["scores"].append(cls._format_score_annotation(score))
+
+        score_label_stmt = (
+            select(
+                ScoreLabel.image_id,
+                ScoreLabel.id,
+                ScoreLabel.label,
+                ScoreLabel.model_id,
+                ScoreLabel.is_edited_manually,
+                ScoreLabel.created_at,
+                ScoreLabel.updated_at,
+                model,
+            )
+            .outerjoin(model, ScoreLabel.model_id == model.id)
+            .where(ScoreLabel.image_id.in_(chunk))
+            .order_by(ScoreLabel.image_id, ScoreLabel.id)
+        )
+        for score_label in session.execute(score_label_stmt):
+            result[score_label.image_id]["score_labels"].append(
+                cls._format_score_label_annotation(score_label)
+            )
+
+        rating_stmt = (
+            select(
+                Rating.image_id,
+                Rating.id,
+                Rating.raw_rating_value,
+                Rating.normalized_rating,
+                Rating.model_id,
+                Rating.confidence_score,
+                Rating.created_at,
+                Rating.updated_at,
+                model,
+            )
+            .outerjoin(model, Rating.model_id == model.id)
+            .where(Rating.image_id.in_(chunk))
+            .order_by(Rating.image_id, Rating.id)
+        )
+        for rating in session.execute(rating_stmt):
+            result[rating.image_id]["ratings"].append(cls._format_rating_annotation(rating))
+        return existing_ids
+
     def get_low_res_image_paths_batch(self, image_ids: list[int]) -> dict[int, str]:
         """複数画像の最低解像度処理済み画像パスを 1 クエリで一括取得する (#1140)。
 
@@ -1527,6 +1693,15 @@ class ImageRepository(BaseRepository):
         # logger.debug(f"Prepared pattern: '{pattern}', is_exact: {is_exact} for term: '{term}'")
         return pattern, is_exact
 
+    @staticmethod
+    def _tag_text_condition(pattern: str, is_exact: bool) -> ColumnElement[bool]:
+        """タグ文字列の一致条件を語彙テーブル (tag_strings) 経由の整数比較で返す。
+
+        LIKE / 完全一致は数千行の ``tag_strings`` に対して評価し、tags 側は
+        ``ix_tags_tag_string_id`` の整数 IN で引く (``tag_string_condition``)。
+        """
+        return tag_string_condition((TagString.tag == pattern) if is_exact else TagString.tag.like(pattern))
+
     def _apply_date_filter(
         self,
         query: Select[Any],
@@ -1570,7 +1745,7 @@ class ImageRepository(BaseRepository):
             conditions: list[ColumnElement[bool]] = []
             for tag_term in tags:
                 pattern, is_exact = self._prepare_like_pattern(tag_term)
-                subquery_condition = (Tag.tag == pattern) if is_exact else Tag.tag.like(pattern)
+                subquery_condition = self._tag_text_condition(pattern, is_exact)
                 conditions.append(
                     select(Tag.id)
                     .where(Tag.image_id == Image.id, Tag.rejected_at.is_(None), subquery_condition)
@@ -1582,7 +1757,7 @@ class ImageRepository(BaseRepository):
         tag_criteria: list[ColumnElement[bool]] = []
         for tag_term in tags:
             pattern, is_exact = self._prepare_like_pattern(tag_term)
-            tag_criteria.append((Tag.tag == pattern) if is_exact else Tag.tag.like(pattern))
+            tag_criteria.append(self._tag_text_condition(pattern, is_exact))
         return (
             select(Tag.id)
             .where(Tag.image_id == Image.id, Tag.rejected_at.is_(None), or_(*tag_criteria))
@@ -1628,7 +1803,7 @@ class ImageRepository(BaseRepository):
             return conditions
         for excluded_tag in excluded_tags:
             pattern, is_exact = self._prepare_like_pattern(excluded_tag)
-            excluded_condition = (Tag.tag == pattern) if is_exact else Tag.tag.like(pattern)
+            excluded_condition = self._tag_text_condition(pattern, is_exact)
             conditions.append(
                 select(Tag.id)
                 .where(Tag.image_id == Image.id, Tag.rejected_at.is_(None), excluded_condition)
@@ -1995,7 +2170,8 @@ class ImageRepository(BaseRepository):
 
             # 手動レーティングに基づく除外条件（ratingsテーブルから最新のMANUAL_EDIT ratingを参照）
             # ADR 0035 段階 4: MANUAL_EDIT model lookup は ModelRepository static helper を直接呼ぶ。
-            manual_edit_model_id = ModelRepository._get_or_create_manual_edit_model(session)
+            # 検索は読み取り専用セッションで行うため、行を作らないサブクエリで参照する。
+            manual_edit_model_id = ModelRepository._manual_edit_model_id_subquery()
             manual_nsfw_condition = (
                 exists()
                 .where(
@@ -2012,7 +2188,7 @@ class ImageRepository(BaseRepository):
                 .where(
                     Tag.image_id == Image.id,
                     Tag.rejected_at.is_(None),
-                    func.lower(Tag.tag).in_(["nsfw", "explicit"]),
+                    tag_string_condition(func.lower(TagString.tag).in_(["nsfw", "explicit"])),
                 )
                 .correlate(Image)
             )
@@ -2228,7 +2404,8 @@ class ImageRepository(BaseRepository):
             return None
 
         # ADR 0035 段階 4: MANUAL_EDIT model lookup は ModelRepository static helper を直接呼ぶ。
-        manual_edit_model_id = ModelRepository._get_or_create_manual_edit_model(session)
+        # 検索は読み取り専用セッションで行うため、行を作らないサブクエリで参照する。
+        manual_edit_model_id = ModelRepository._manual_edit_model_id_subquery()
         has_manual_rating_subq = (
             select(Rating.image_id).where(Rating.model_id == manual_edit_model_id).distinct()
         )
@@ -2522,16 +2699,16 @@ class ImageRepository(BaseRepository):
         # model 単位で最新行を 1 つに絞る (legacy 複数行データは近似)。
         # model_id は SET NULL で None になり得る (model 削除済み orphan 行)。
         latest_by_model: dict[int | None, Score] = {}
-        for score_row in ai_scores:
-            existing = latest_by_model.get(score_row.model_id)
-            if existing is None or score_row.created_at > existing.created_at:
-                latest_by_model[score_row.model_id] = score_row
+        for score in ai_scores:
+            existing = latest_by_model.get(score.model_id)
+            if existing is None or score.created_at > existing.created_at:
+                latest_by_model[score.model_id] = score
 
         weighted_sum: float = 0.0
         total_weight: float = 0.0
-        for score_row in latest_by_model.values():
-            model_name = score_row.model.name if score_row.model else ""
-            value = calibrate_to_display(model_name, float(score_row.score))
+        for score in latest_by_model.values():
+            model_name = score.model.name if score.model else ""
+            value = calibrate_to_display(model_name, float(score.score))
             weight = display_weight_for(model_name)
             weighted_sum += value * weight
             total_weight += weight
@@ -3119,7 +3296,7 @@ class ImageRepository(BaseRepository):
                 limit=filter_criteria.limit,
             )
 
-        with self.session_factory() as session:
+        with self.read_session_factory() as session:
             try:
                 query = self._build_image_filter_query(
                     session=session,
@@ -3220,7 +3397,7 @@ class ImageRepository(BaseRepository):
             )
             return total_count
 
-        with self.session_factory() as session:
+        with self.read_session_factory() as session:
             try:
                 filtered_query = self._build_image_filter_query(
                     session=session,
@@ -3289,7 +3466,7 @@ class ImageRepository(BaseRepository):
         """
         filter_criteria = criteria or ImageFilterCriteria()
 
-        with self.session_factory() as session:
+        with self.read_session_factory() as session:
             try:
                 filtered_query = self._build_image_filter_query(
                     session=session,
@@ -3375,7 +3552,7 @@ class ImageRepository(BaseRepository):
 
     def get_total_image_count(self) -> int:
         """データベース内のオリジナル画像の総数を取得します。"""
-        with self.session_factory() as session:
+        with self.read_session_factory() as session:
             try:
                 stmt = select(func.count(Image.id))
                 count = session.execute(stmt).scalar_one()
@@ -3448,28 +3625,27 @@ class ImageRepository(BaseRepository):
             int | None: 画像ID（見つからない場合は None）
 
         """
-        with self.session_factory() as session:
-            try:
-                from ..db_core import resolve_stored_path
-
-                input_path = Path(filepath).resolve()
-                filename = input_path.name
-
-                # filenameで候補を検索
-                stmt = select(Image).where(Image.filename == filename)
-                results = session.execute(stmt).scalars().all()
+        return self.get_image_ids_by_filepaths([filepath]).get(filepath)
 
-                # 候補が見つかった場合、stored_image_pathを正規化して比較
-                for image in results:
-                    resolved_stored_path = resolve_stored_path(image.stored_image_path)
-                    if resolved_stored_path.resolve() == input_path:
-                        return image.id
+    @staticmethod
+    def _available_path_key(session: Session, stored_image_path: str) -> str | None:
+        """新規行に設定する ``path_key`` を返す。同じキーの行が既にあれば None。
 
-                return None
+        同じファイルを指す行が既にある場合 (別版登録等) は UNIQUE 違反で登録を失敗させず、
+        キー無し (検索は従来の比較へフォールバック) で登録する。
+        """
+        from ..db_core import stored_path_key
 
-            except Exception as e:
-                logger.error(f"ファイルパスからの画像ID取得エラー: {filepath}, {e}")
-                return None
+        try:
+            key = stored_path_key(stored_image_path)
+        except (OSError, ValueError, RuntimeError) as exc:
+            logger.warning(f"path_key を計算できないためキー無しで登録: {stored_image_path!r}, {exc}")
+            return None
+        exists = session.execute(select(Image.id).where(Image.path_key == key).limit(1)).first()
+        if exists is not None:
+            logger.debug(f"同じ path_key の画像が既に存在するためキー無しで登録: {key} (ID {exists[0]})")
+            return None
+        return key
 
     @staticmethod
     def _normalize_input_paths(filepaths: list[str]) -> tuple[dict[str, Path], set[str]]:
@@ -3547,13 +3723,73 @@ class ImageRepository(BaseRepository):
             )
             return None
 
+    @staticmethod
+    def _input_path_keys(raw: str, resolved: Path) -> set[str]:
+        """入力 path に対応しうる ``path_key`` の候補を返す。
+
+        stored 側のキーは字句的な正規化のため、入力は字句的な絶対パスと resolve 後の
+        パスの両方から (プロジェクトルートも resolve 前後の両方で) キーを作る。
+        """
+        from ..db_core import get_current_project_root, path_key
+
+        project_root = get_current_project_root()
+        roots = {project_root}
+        candidates = {resolved}
+        try:
+            roots.add(project_root.resolve())
+            candidates.add(Path(os.path.abspath(raw.replace("\\", "/"))))
+        except (OSError, RuntimeError, ValueError):
+            pass
+        return {path_key(candidate, root) for candidate in candidates for root in roots}
+
+    def _match_by_path_key(
+        self, session: Session, path_resolved: dict[str, Path], result: dict[str, int | None]
+    ) -> None:
+        """``path_key`` の UNIQUE インデックスで入力 path を一括解決し、result を埋める。"""
+        keys_by_raw = {raw: self._input_path_keys(raw, resolved) for raw, resolved in path_resolved.items()}
+        all_keys = list({key for keys in keys_by_raw.values() for key in keys})
+        id_by_key: dict[str, int] = {}
+        for start in range(0, len(all_keys), self.BATCH_CHUNK_SIZE):
+            chunk = all_keys[start : start + self.BATCH_CHUNK_SIZE]
+            stmt = select(Image.path_key, Image.id).where(Image.path_key.in_(chunk))
+            for key, image_id in session.execute(stmt):
+                if key is not None:
+                    id_by_key[key] = image_id
+        for raw, keys in keys_by_raw.items():
+            for key in keys:
+                if key in id_by_key:
+                    result[raw] = id_by_key[key]
+                    break
+
+    def _match_by_filename(
+        self, session: Session, path_resolved: dict[str, Path], result: dict[str, int | None]
+    ) -> None:
+        """filename 候補を resolve 比較して解決する (``path_key`` で引けなかった path 用)。
+
+        ``path_key`` の無い行 (手動挿入・backfill 時の衝突) や、シンボリックリンク経由で
+        字句的なキーが一致しない path を従来どおり解決する。
+        """
+        filenames = {resolved.name for resolved in path_resolved.values()}
+        stmt = select(Image).where(Image.filename.in_(filenames))
+        candidates = list(session.execute(stmt).scalars().all())
+        by_filename = self._build_candidates_by_filename(candidates)
+
+        # input path ごとに対応する image_id を resolve 比較で確定
+        for raw, resolved_input in path_resolved.items():
+            matches = by_filename.get(resolved_input.name, [])
+            for stored_resolved, image_id, _phash in matches:
+                if stored_resolved == resolved_input:
+                    result[raw] = image_id
+                    break
+
     def get_image_ids_by_filepaths(self, filepaths: list[str]) -> dict[str, int | None]:
         """複数のファイルパスから画像 ID をバッチ解決する。
 
         ADR 0023 Phase 1.5 (Issue #42, Codex P2 r3209342204): N+1 クエリ回避。
-        `get_image_id_by_filepath()` を N 回呼ぶ代わりに、filename を IN 句で
-        一括取得して input path と stored_image_path の resolve 比較を Python 側
-        で行う。GUI スレッドや Worker 内のループ内で大量パスを引く場合に使用。
+        入力 path を正規化したキーで ``images.path_key`` の UNIQUE インデックスを
+        一括検索する。引けなかった path のみ、filename を IN 句で取得して
+        stored_image_path との resolve 比較を Python 側で行う。GUI スレッドや
+        Worker 内のループ内で大量パスを引く場合に使用。
 
         Args:
             filepaths: 解決対象の画像 path リスト (絶対 / 相対パス混在可)。
@@ -3572,24 +3808,21 @@ class ImageRepository(BaseRepository):
         if not filenames:
             return result
 
+        # resolve できなかった path は DB 検索対象から除外する
+        searchable = {
+            raw: path_resolved[raw] for raw in path_resolved if path_resolved[raw].name in filenames
+        }
         with self.session_factory() as session:
             try:
-                # filename IN (...) で 1 クエリ取得 (重複 filename もまとめて)
-                stmt = select(Image).where(Image.filename.in_(filenames))
-                candidates = list(session.execute(stmt).scalars().all())
-                by_filename = self._build_candidates_by_filename(candidates)
-
-                # input path ごとに対応する image_id を resolve 比較で確定
-                for raw, resolved_input in path_resolved.items():
-                    matches = by_filename.get(resolved_input.name, [])
-                    for stored_resolved, image_id, _phash in matches:
-                        if stored_resolved == resolved_input:
-                            result[raw] = image_id
-                            break
+                self._match_by_path_key(session, searchable, result)
+                unmatched = {raw: resolved for raw, resolved in searchable.items() if result[raw] is None}
+                if unmatched:
+                    self._match_by_filename(session, unmatched, result)
 
                 logger.debug(
                     f"バッチ画像 ID 解決: 入力 {len(filepaths)}件 → "
-                    f"解決 {sum(1 for v in result.values() if v is not None)}件"
+                    f"解決 {sum(1 for v in result.values() if v is not None)}件 "
+                    f"(path_key 未一致 {len(unmatched)}件)"
                 )
                 return result
             except Exception as e:
@@ -3618,16 +3851,20 @@ class ImageRepository(BaseRepository):
 
         with self.session_factory() as session:
             try:
-                stmt = (
-                    select(Rating.image_id, Rating.normalized_rating)
-                    .where(Rating.image_id.in_(requested_ids))
-                    .order_by(Rating.image_id.asc(), Rating.created_at.desc(), Rating.id.desc())
-                )
-                results = session.execute(stmt).all()
                 latest_ratings: dict[int, str | None] = {}
-                for image_id, normalized_rating in results:
-                    if image_id not in latest_ratings:
-                        latest_ratings[image_id] = normalized_rating.upper() if normalized_rating else None
+                # 大規模プロジェクトの全候補でも SQLite のバインド変数上限を超えないよう分割する
+                for start in range(0, len(requested_ids), self.BATCH_CHUNK_SIZE):
+                    chunk = requested_ids[start : start + self.BATCH_CHUNK_SIZE]
+                    stmt = (
+                        select(Rating.image_id, Rating.normalized_rating)
+                        .where(Rating.image_id.in_(chunk))
+                        .order_by(Rating.image_id.asc(), Rating.created_at.desc(), Rating.id.desc())
+                    )
+                    for image_id, normalized_rating in session.execute(stmt):
+                        if image_id not in latest_ratings:
+                            latest_ratings[image_id] = (
+                                normalized_rating.upper() if normalized_rating else None
+                            )
 
                 logger.debug(
                     f"最新 rating 取得: 対象 {len(requested_ids)}件 → 解決 {len(latest_ratings)}件"
@@ -3739,7 +3976,7 @@ class ImageRepository(BaseRepository):
         Returns:
             list of (bin_start, bin_end, count)。空データの場合は空リスト。
         """
-        with self.session_factory() as session:
+        with self.read_session_factory() as session:
             result = session.execute(select(func.min(Image.created_at), func.max(Image.created_at))).one()
             min_dt, max_dt = result[0], result[1]
             if min_dt is None or max_dt is None:
@@ -12,7 +12,7 @@ from __future__ import annotations
 import datetime
 from typing import Any, ClassVar
 
-from sqlalchemy import select
+from sqlalchemy import ScalarSelect, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session, selectinload
 
@@ -166,6 +166,16 @@ class ModelRepository(BaseRepository):
                 logger.opt(exception=True).error(f"モデル一括取得エラー: {e}")
                 raise
 
+    @staticmethod
+    def _manual_edit_model_id_subquery() -> ScalarSelect[int]:
+        """MANUAL_EDIT モデル ID を返すスカラーサブクエリ (行が無ければ NULL)。
+
+        検索・件数取得は読み取り専用セッションで実行するため、フィルタ条件の構築では
+        :meth:`_get_or_create_manual_edit_model` による行作成を行わずに参照する。
+        MANUAL_EDIT 行が無い DB には手動レーティングも存在しないので結果は同じ。
+        """
+        return select(Model.id).where(Model.litellm_model_id == MANUAL_EDIT_LITELLM_ID).scalar_subquery()
+
     @staticmethod
     def _get_or_create_manual_edit_model(session: Session) -> int:
         """手動編集用のモデルIDを取得または作成します。
@@ -9,6 +9,7 @@ from sqlalchemy import (
     TIMESTAMP,
     Boolean,
     Column,  # Table で使用
+    ColumnElement,
     Float,
     ForeignKey,
     Index,
@@ -18,8 +19,10 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    select,
     text,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 # ADR 0023 Phase 1.11 (Issue #238): MANUAL_EDIT 行は推論経路に乗らない特殊行のため、
@@ -197,6 +200,10 @@ class Image(Base):
     phash: Mapped[str] = mapped_column(String, nullable=False, index=True)
     original_image_path: Mapped[str] = mapped_column(String, nullable=False)
     stored_image_path: Mapped[str] = mapped_column(String, nullable=False)
+    # パス → 画像 ID 解決用の正規化キー (db_core.stored_path_key: プロジェクトルート相対の
+    # POSIX パス)。UNIQUE インデックスで 1 回の索引検索に解決する。NULL は未設定の行
+    # (手動挿入・backfill 時の衝突) で、検索は従来の filename + resolve 比較へフォールバックする。
+    path_key: Mapped[str | None] = mapped_column(String, nullable=True)
     width: Mapped[int] = mapped_column(Integer, nullable=False)
     height: Mapped[int] = mapped_column(Integer, nullable=False)
     format: Mapped[str] = mapped_column(String, nullable=False)
@@ -254,7 +261,10 @@ class Image(Base):
 
     # uuid と phash の組み合わせはユニークであるべき
     # phash が NOT NULL になったため、複合ユニーク制約を追加可能
-    __table_args__ = (UniqueConstraint("uuid", "phash", name="uix_uuid_phash"),)
+    __table_args__ = (
+        UniqueConstraint("uuid", "phash", name="uix_uuid_phash"),
+        Index("uq_images_path_key", "path_key", unique=True),
+    )
 
     def __repr__(self) -> str:
         return f"<Image(id={self.id}, uuid='{self.uuid}', filename='{self.filename}')>"
@@ -296,6 +306,24 @@ class ProcessedImage(Base):
         return f"<ProcessedImage(id={self.id}, image_id={self.image_id}, width={self.width}, height={self.height})>"
 
 
+class TagString(Base):
+    """タグ文字列の語彙 (intern テーブル)。
+
+    ``tags`` は数百万行でも異なる文字列は数千程度のため、tags は文字列を持たず
+    ``tags.tag_string_id`` でこの語彙を整数参照する。タグ検索 (完全一致 / LIKE) は
+    この小さなテーブルで候補 ID を引き、一意制約と集計は整数で行う。
+    行の追加と ID の設定は ``AnnotationRepository`` がタグ書き込み時に行う。
+    """
+
+    __tablename__ = "tag_strings"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tag: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+
+    def __repr__(self) -> str:
+        return f"<TagString(id={self.id}, tag='{self.tag}')>"
+
+
 class Tag(Base):
     """画像に関連付けられたタグ情報"""
 
@@ -307,7 +335,8 @@ class Tag(Base):
     tag_id: Mapped[int | None] = mapped_column(Integer)
     image_id: Mapped[int | None] = mapped_column(ForeignKey("images.id", ondelete="CASCADE"))
     model_id: Mapped[int | None] = mapped_column(ForeignKey("models.id", ondelete="SET NULL"))
-    tag: Mapped[str] = mapped_column(String, nullable=False)
+    # タグ文字列は語彙 tag_strings への整数参照で持つ (書き込みは AnnotationRepository が ID を解決する)
+    tag_string_id: Mapped[int] = mapped_column(ForeignKey("tag_strings.id"), nullable=False)
     # existing: 元ファイル(プロンプト等)由来のタグかどうかを示すフラグ (AI生成ではない)
     existing: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     is_edited_manually: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
@@ -326,17 +355,39 @@ class Tag(Base):
     # Relationships
     image: Mapped[Image] = relationship("Image", back_populates="tags")
     model: Mapped[Model] = relationship("Model", back_populates="tags")
+    # innerjoin にすると Image.tags の eager load が「LEFT JOIN (tags JOIN tag_strings)」の
+    # 入れ子になり、SQLite が tags 全体を走査するため外部結合のまま連ねる
+    tag_string: Mapped[TagString] = relationship("TagString", lazy="joined")
 
     __table_args__ = (
         Index("ix_tags_image_id", "image_id"),
-        Index("ix_tags_tag", "tag"),
+        Index("ix_tags_tag_string_id", "tag_string_id"),
         Index("ix_tags_rejected_at", "rejected_at"),
         # (image, model, tag) 単位で一意 (Issue #1065)。同一モデルの再付与は
         # upsert (updated_at 更新) になり、異なるモデルの同一タグは別行のまま。
         # SQLite は NULL model_id 同士を別値扱いするため NULL 重複は制約外。
-        Index("uq_tags_image_model_tag", "image_id", "model_id", "tag", unique=True),
+        Index("uq_tags_image_model_tag", "image_id", "model_id", "tag_string_id", unique=True),
     )
 
+    @hybrid_property
+    def tag(self) -> str:
+        """タグ文字列 (語彙 ``tag_strings`` から読む。書き込みは ``tag_string_id`` で行う)。"""
+        return self.tag_string.tag
+
+    @tag.inplace.expression
+    @classmethod
+    def _tag_expression(cls) -> ColumnElement[str]:
+        # クエリ側の絞り込み・集計は TagString を引いて tag_string_id で比較すること。
+        # この相関サブクエリは行ごとに語彙を引くため、表示用の列取得に限って使う。
+        # 外側のクエリが tag_strings を JOIN していても語彙側は相関させない
+        return (
+            select(TagString.tag)
+            .where(TagString.id == cls.tag_string_id)
+            .correlate_except(TagString)
+            .scalar_subquery()
+            .label("tag")
+        )
+
     def __repr__(self) -> str:
         return f"<Tag(id={self.id}, image_id={self.image_id}, tag='{self.tag}')>"
 
@@ -565,6 +616,8 @@ class ErrorRecord(Base):
         Index("ix_error_records_operation_type", "operation_type"),
         Index("ix_error_records_created_at", "created_at"),
         Index("ix_error_records_resolved", "resolved_at"),
+        # 送信前 refusal prefilter (候補 image_id IN (...) AND resolved_at IS NULL) 用
+        Index("ix_error_records_image_id_resolved", "image_id", "resolved_at"),
     )
 
     def __repr__(self) -> str:
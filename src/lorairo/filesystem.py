@@ -2,7 +2,7 @@ import json
 import math
 import os
 import shutil
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from io import BytesIO
 from itertools import islice
@@ -13,6 +13,8 @@ import numpy as np
 import toml
 from PIL import Image, ImageCms
 
+from .utils import directory_scan
+from .utils.directory_scan import ScannedImage
 from .utils.log import logger
 
 Image.MAX_IMAGE_PIXELS = 1000000000  # 大きな画像に対応(ローカルアプリ前提)
@@ -177,21 +179,36 @@ class FileSystemManager:
             )
             raise
 
+    @staticmethod
+    def scan_image_files(
+        input_dir: Path, is_canceled: Callable[[], bool] | None = None
+    ) -> Iterator[ScannedImage]:
+        """
+        ディレクトリ配下の画像ファイルを並列に走査し、パス順に返す｡
+
+        同じディレクトリ一覧から対応する .txt/.caption ファイルも併せて返すため、
+        サイドカーの存在確認を画像ごとに行う必要がない｡
+
+        Args:
+            input_dir: 走査するディレクトリ
+            is_canceled: True を返したら走査を打ち切るコールバック
+
+        Returns:
+            Iterator[ScannedImage]: 画像パスとサイドカーファイル (パス順)
+        """
+        return directory_scan.scan_image_files(
+            input_dir, FileSystemManager.image_extensions, is_canceled=is_canceled
+        )
+
     @staticmethod
     def get_image_files(input_dir: Path) -> list[Path]:
         """
         ディレクトリから画像ファイルのリストを取得｡
 
         Returns:
-            list[Path]: 画像ファイルのパスのリスト
+            list[Path]: 画像ファイルのパスのリスト (ソート済み)
         """
-        exts = {ext.lower() for ext in FileSystemManager.image_extensions}
-        image_files: list[Path] = []
-        for path in input_dir.rglob("*"):
-            if not path.is_file():
-                continue
-            if path.suffix.lower() in exts:
-                image_files.append(path)
+        image_files = sorted(scanned.path for scanned in FileSystemManager.scan_image_files(input_dir))
         logger.debug("get_image_files found={} dir={}", len(image_files), input_dir)
         return image_files
 
@@ -301,6 +318,8 @@ class FileSystemManager:
                 has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
                 icc_profile = img.info.get("icc_profile")
                 # グレースケール相当判定 (Issue #631 / ADR 0061)。画像が開いている間に算出する。
+                # 判定結果と colorfulness_score は DB に保存されるため、デコード時縮小
+                # (reduce_on_load) は使わずフル解像度から算出し、登録済み画像と値を揃える。
                 is_grayscale_like, colorfulness_score = FileSystemManager._compute_grayscale_likeness(img)
 
             # 色域情報の詳細な取得
@@ -1,6 +1,7 @@
 # src/lorairo/gui/cache/__init__.py
 """GUI キャッシュモジュール"""
 
+from .annotation_snapshot import AnnotationSnapshot
 from .thumbnail_page_cache import ThumbnailPageCache
 
-__all__ = ["ThumbnailPageCache"]
+__all__ = ["AnnotationSnapshot", "ThumbnailPageCache"]
@@ -0,0 +1,283 @@
+# src/lorairo/gui/cache/annotation_snapshot.py
+"""
+プロジェクト単位のアノテーションスナップショット。
+
+DatasetStateManager が保持し、詳細パネル / タグパネル / Rating エディタが共有する。
+``ImageRepository.get_image_annotation_metadata`` と同じキー形状の dict を受け取り、
+アノテーション種別ごとの列 (tags / captions / scores / score_labels / ratings) に
+タプルで格納する。タグ文字列・モデル名・rating 値などの反復文字列は ``sys.intern``
+で共有し、画像数千件分を保持しても dict-per-entry 表現より小さく保つ。
+
+無効化は ``invalidate`` (DatasetStateManager.invalidate_annotations 経由) のみで行い、
+キャッシュヒット時は DB を一切照会しない。
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Mapping
+from typing import Any, ClassVar
+
+from ...utils.log import logger
+
+# 列に値が無い (元 dict にキーが無かった) ことを表すセンチネル
+_MISSING: Any = object()
+
+
+class AnnotationSnapshot:
+    """
+    画像IDをキーにした列指向アノテーションスナップショット。
+
+    各画像は 1 行 (row) に対応し、アノテーション種別ごとの列リストへ
+    ``tuple[tuple[Any, ...], ...]`` (1 entry = フィールド値タプル) で格納する。
+    ``get`` は呼び出し元が自由に変更できるよう毎回新しい dict を組み立てて返す。
+
+    Attributes:
+        hits: ``get`` のキャッシュヒット数
+        misses: ``get`` のキャッシュミス数
+    """
+
+    # 種別ごとのフィールド順 (= _format_annotations_for_metadata の per-entry キー)
+    ENTRY_FIELDS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "tags": (
+            "id",
+            "tag",
+            "tag_id",
+            "model_id",
+            "model_name",
+            "source",
+            "existing",
+            "is_edited_manually",
+            "confidence_score",
+            "created_at",
+            "updated_at",
+        ),
+        "captions": (
+            "id",
+            "caption",
+            "model_id",
+            "model_name",
+            "existing",
+            "is_edited_manually",
+            "created_at",
+            "updated_at",
+        ),
+        "scores": (
+            "id",
+            "score",
+            "model_id",
+            "model_name",
+            "is_edited_manually",
+            "created_at",
+            "updated_at",
+        ),
+        "score_labels": (
+            "id",
+            "label",
+            "model_id",
+            "model",
+            "is_edited_manually",
+            "created_at",
+            "updated_at",
+        ),
+        "ratings": (
+            "id",
+            "raw_rating_value",
+            "normalized_rating",
+            "model_id",
+            "model",
+            "model_name",
+            "source",
+            "confidence_score",
+            "created_at",
+            "updated_at",
+        ),
+    }
+
+    # 反復出現する短い文字列フィールド (intern 対象)。caption 本文は画像ごとに固有なので対象外。
+    _INTERNED_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"tag", "model_name", "model", "source", "label", "raw_rating_value", "normalized_rating"}
+    )
+
+    # tags_text / caption_text は画像ごとに固有なので intern しない
+    _INTERNED_SCALARS: ClassVar[frozenset[str]] = frozenset(
+        {"rating_value", "ai_rating_value", "manual_rating_value"}
+    )
+
+    # 画像単位のスカラー値 (派生値を含む)
+    SCALAR_KEYS: ClassVar[tuple[str, ...]] = (
+        "tags_text",
+        "caption_text",
+        "score_value",
+        "ai_score_value",
+        "manual_score_value",
+        "rating_value",
+        "ai_rating_value",
+        "manual_rating_value",
+        "quality_summary",
+    )
+
+    def __init__(self) -> None:
+        self._row_by_id: dict[int, int] = {}
+        self._free_rows: list[int] = []
+        self._columns: dict[str, list[tuple[tuple[Any, ...], ...] | None]] = {
+            kind: [] for kind in self.ENTRY_FIELDS
+        }
+        self._scalars: list[tuple[Any, ...] | None] = []
+        self.hits = 0
+        self.misses = 0
+        # 格納済みの行を破棄した invalidate と clear で進む世代番号。非同期先読みの
+        # 結果が取得中に無効化された行を書き戻さないよう、取得開始時の値と比較する。
+        # 未格納 ID だけの invalidate では進めない (無関係な先読みを捨てないため)。
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._row_by_id)
+
+    def __contains__(self, image_id: object) -> bool:
+        return image_id in self._row_by_id
+
+    def put(self, image_id: int, annotations: Mapping[str, Any]) -> None:
+        """
+        画像のアノテーションを格納する (既存行は上書き)。
+
+        Args:
+            image_id: 画像ID
+            annotations: ``get_image_annotation_metadata`` 形状のアノテーション辞書
+        """
+        row = self._row_by_id.get(image_id)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = len(self._scalars)
+                self._scalars.append(None)
+                for column in self._columns.values():
+                    column.append(None)
+            self._row_by_id[image_id] = row
+
+        for kind, fields in self.ENTRY_FIELDS.items():
+            entries = annotations.get(kind)
+            self._columns[kind][row] = None if entries is None else self._encode_entries(entries, fields)
+        scalars: list[Any] = []
+        for key in self.SCALAR_KEYS:
+            value = annotations.get(key, _MISSING)
+            scalars.append(self._intern(value) if key in self._INTERNED_SCALARS else value)
+        self._scalars[row] = tuple(scalars)
+
+    def get(self, image_id: int) -> dict[str, Any] | None:
+        """
+        画像のアノテーション辞書を組み立てて返す。
+
+        Args:
+            image_id: 画像ID
+
+        Returns:
+            アノテーション辞書 (呼び出し元が変更してよい新規 dict)。未格納なら None
+        """
+        row = self._row_by_id.get(image_id)
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        annotations: dict[str, Any] = {}
+        for kind, fields in self.ENTRY_FIELDS.items():
+            entries = self._columns[kind][row]
+            if entries is not None:
+                annotations[kind] = [dict(zip(fields, values, strict=True)) for values in entries]
+        scalars = self._scalars[row] or ()
+        for key, value in zip(self.SCALAR_KEYS, scalars, strict=False):
+            if value is _MISSING:
+                continue
+            annotations[key] = dict(value) if isinstance(value, dict) else value
+        return annotations
+
+    def missing_ids(self, image_ids: Iterable[int]) -> list[int]:
+        """
+        未格納の画像IDを入力順 (重複除去) で返す。
+
+        Args:
+            image_ids: 判定対象の画像ID
+
+        Returns:
+            スナップショットに存在しない画像IDのリスト
+        """
+        seen: set[int] = set()
+        missing: list[int] = []
+        for image_id in image_ids:
+            if image_id in self._row_by_id or image_id in seen:
+                continue
+            seen.add(image_id)
+            missing.append(image_id)
+        return missing
+
+    def invalidate(self, image_ids: Iterable[int]) -> int:
+        """
+        指定画像の行を破棄する。行は空きリストに戻り次回 ``put`` で再利用される。
+
+        Args:
+            image_ids: 無効化対象の画像ID (未格納IDは無視)
+
+        Returns:
+            実際に破棄した行数 (1 行以上破棄したときだけ ``generation`` を進める)
+        """
+        removed = 0
+        for image_id in image_ids:
+            row = self._row_by_id.pop(image_id, None)
+            if row is None:
+                continue
+            for column in self._columns.values():
+                column[row] = None
+            self._scalars[row] = None
+            self._free_rows.append(row)
+            removed += 1
+        if removed:
+            self.generation += 1
+        return removed
+
+    def clear(self) -> None:
+        """スナップショットを全て破棄する (プロジェクト切り替え時)。"""
+        count = len(self._row_by_id)
+        self.generation += 1
+        self._row_by_id.clear()
+        self._free_rows.clear()
+        for column in self._columns.values():
+            column.clear()
+        self._scalars.clear()
+        self.hits = 0
+        self.misses = 0
+        logger.debug(f"AnnotationSnapshot cleared: {count} images removed")
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        スナップショットの統計情報を取得する。
+
+        Returns:
+            統計情報の辞書
+        """
+        return {
+            "images": len(self._row_by_id),
+            "rows": len(self._scalars),
+            "free_rows": len(self._free_rows),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    @classmethod
+    def _encode_entries(
+        cls, entries: Iterable[Mapping[str, Any]], fields: tuple[str, ...]
+    ) -> tuple[tuple[Any, ...], ...]:
+        """per-entry dict 群をフィールド順のタプル群へ変換する。"""
+        return tuple(
+            tuple(
+                cls._intern(entry.get(field)) if field in cls._INTERNED_FIELDS else entry.get(field)
+                for field in fields
+            )
+            for entry in entries
+        )
+
+    @staticmethod
+    def _intern(value: Any) -> Any:
+        """文字列なら intern して同一オブジェクトを共有する。"""
+        return sys.intern(value) if type(value) is str else value
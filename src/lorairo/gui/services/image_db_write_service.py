@@ -1,9 +1,16 @@
 # src/lorairo/gui/services/image_db_write_service.py
 
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import ClassVar
+
 from sqlalchemy.exc import SQLAlchemyError
 
 from ...database.db_manager import ImageDatabaseManager
+from ...database.repository.annotation_record import AnnotationSaveItem
 from ...database.schema import (
+    AnnotationsDict,
     CaptionAnnotationData,
     RatingAnnotationData,
     ScoreAnnotationData,
@@ -12,6 +19,32 @@ from ...database.schema import (
 from ...utils.log import logger
 
 
+@dataclass
+class ManualEditFlushResult:
+    """手動編集のまとめ書き (``apply_manual_edits``) の結果。
+
+    Attributes:
+        written_image_ids: 書き込みが確定 (commit 済み) した画像 ID
+        missing_image_ids: 書き込み時点で存在しなかった画像 ID (編集後に削除された等の競合)
+        failed_image_ids: DB エラーで書き込めなかった画像 ID
+        added_tags: 追加に成功したタグ
+        failed_tags: 追加に失敗したタグ
+        elapsed_ms: 書き込みにかかった時間 (ミリ秒)
+    """
+
+    written_image_ids: list[int] = field(default_factory=list)
+    missing_image_ids: list[int] = field(default_factory=list)
+    failed_image_ids: list[int] = field(default_factory=list)
+    added_tags: list[str] = field(default_factory=list)
+    failed_tags: list[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """競合・失敗が無く全件書き込めたか。"""
+        return not (self.missing_image_ids or self.failed_image_ids or self.failed_tags)
+
+
 class ImageDBWriteService:
     """
     画像データベース書き込みサービス（GUI専用）
@@ -34,8 +67,12 @@ class ImageDBWriteService:
     - update_score: Score更新
     - update_tags: Tags更新（カンマ区切り文字列）
     - update_caption: Caption更新
+    - apply_manual_edits: Rating/Score/タグ追加のまとめ書き (WriteBehindQueue 用)
     """
 
+    # Rating値（Civitai標準）
+    VALID_RATINGS: ClassVar[tuple[str, ...]] = ("PG", "PG-13", "R", "X", "XXX")
+
     def __init__(self, db_manager: ImageDatabaseManager):
         """ImageDBWriteServiceコンストラクタ（SearchFilterServiceと同一パターン）"""
         self.db_manager = db_manager
@@ -54,9 +91,10 @@ class ImageDBWriteService:
         """
         try:
             # Rating値のバリデーション（Civitai標準）
-            valid_ratings = ["PG", "PG-13", "R", "X", "XXX"]
-            if rating not in valid_ratings:
-                logger.warning(f"Invalid rating value: '{rating}'. Must be one of {valid_ratings}")
+            if rating not in self.VALID_RATINGS:
+                logger.warning(
+                    f"Invalid rating value: '{rating}'. Must be one of {list(self.VALID_RATINGS)}"
+                )
                 return False
 
             # RatingAnnotationData を作成（手動編集時はraw_rating_valueとnormalized_ratingは同じ値）
@@ -220,7 +258,7 @@ class ImageDBWriteService:
             logger.opt(exception=True).error(f"DB error updating caption for image_id {image_id}")
             return False
 
-    def add_tag_batch(self, image_ids: list[int], tag: str) -> bool:
+    def add_tag_batch(self, image_ids: Sequence[int], tag: str) -> bool:
         """
         複数画像に1つのタグを追加（既存タグに追加、重複は許可しない）
 
@@ -275,7 +313,7 @@ class ImageDBWriteService:
             logger.opt(exception=True).error("DB error in batch tag add")
             return False
 
-    def update_rating_batch(self, image_ids: list[int], rating: str) -> bool:
+    def update_rating_batch(self, image_ids: Sequence[int], rating: str) -> bool:
         """複数画像のRatingを一括更新
 
         Args:
@@ -290,8 +328,7 @@ class ImageDBWriteService:
             return False
 
         # バリデーション
-        valid_ratings = ["PG", "PG-13", "R", "X", "XXX"]
-        if rating not in valid_ratings:
+        if rating not in self.VALID_RATINGS:
             logger.warning(f"Invalid rating value for batch update: '{rating}'")
             return False
 
@@ -317,7 +354,7 @@ class ImageDBWriteService:
             logger.opt(exception=True).error("DB error in batch rating update")
             return False
 
-    def update_score_batch(self, image_ids: list[int], score: int) -> bool:
+    def update_score_batch(self, image_ids: Sequence[int], score: int) -> bool:
         """複数画像のScoreを一括更新
 
         Args:
@@ -360,3 +397,114 @@ class ImageDBWriteService:
         except SQLAlchemyError:
             logger.opt(exception=True).error("DB error in batch score update")
             return False
+
+    def apply_manual_edits(
+        self,
+        ratings: dict[int, str],
+        scores: dict[int, int],
+        tag_adds: dict[str, list[int]],
+    ) -> ManualEditFlushResult:
+        """画像ごとにまとめた手動編集を少数のトランザクションで書き込む。
+
+        Rating/Score は ``save_annotations_batch`` の単一トランザクションで保存する。
+        存在しない画像が混ざってバッチが失敗した場合だけ画像単位に書き直し、
+        競合 (missing) と DB エラー (failed) を切り分ける。タグ追加はタグごとに
+        ``add_tag_batch`` (1 トランザクション) で保存する。
+
+        Args:
+            ratings: image_id → Rating 値 (検証済み)
+            scores: image_id → Score 値 (0-1000 の UI 値、検証済み)
+            tag_adds: タグ → 追加先 image_id リスト
+
+        Returns:
+            書き込み結果
+        """
+        start = time.perf_counter()
+        result = ManualEditFlushResult()
+        written: set[int] = set()
+
+        image_ids = list(dict.fromkeys([*ratings, *scores]))
+        if image_ids:
+            try:
+                model_id = self.db_manager.get_manual_edit_model_id()
+            except SQLAlchemyError:
+                logger.opt(exception=True).error("DB error resolving manual edit model for batched edits")
+                result.failed_image_ids.extend(image_ids)
+                image_ids = []
+            items = [
+                AnnotationSaveItem(
+                    image_id=image_id,
+                    annotations=self._manual_edit_annotations(
+                        model_id, ratings.get(image_id), scores.get(image_id)
+                    ),
+                )
+                for image_id in image_ids
+            ]
+            try:
+                if items:
+                    self.db_manager.annotation_repo.save_annotations_batch(items)
+                written.update(image_ids)
+            except (ValueError, SQLAlchemyError) as e:
+                logger.warning(f"Batched manual edit failed ({e}); retrying per image")
+                self._apply_items_individually(items, result, written)
+
+        for tag, tag_image_ids in tag_adds.items():
+            if self.add_tag_batch(tag_image_ids, tag):
+                result.added_tags.append(tag)
+                written.update(tag_image_ids)
+            else:
+                result.failed_tags.append(tag)
+
+        result.written_image_ids = sorted(written)
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            f"Manual edits flushed: images={len(result.written_image_ids)}, "
+            f"missing={len(result.missing_image_ids)}, failed={len(result.failed_image_ids)}, "
+            f"tags={len(result.added_tags)}/{len(tag_adds)}, {result.elapsed_ms:.1f}ms"
+        )
+        return result
+
+    @staticmethod
+    def _manual_edit_annotations(model_id: int, rating: str | None, score: int | None) -> AnnotationsDict:
+        """手動編集 1 画像分の AnnotationsDict を組み立てる (update_rating / update_score と同じ値)。"""
+        annotations: AnnotationsDict = {}
+        if rating is not None:
+            annotations["ratings"] = [
+                {
+                    "model_id": model_id,
+                    "raw_rating_value": rating,
+                    "normalized_rating": rating,
+                    "confidence_score": None,
+                }
+            ]
+        if score is not None:
+            db_score = score / 100.0
+            annotations["scores"] = [
+                {
+                    "model_id": model_id,
+                    "score": db_score,
+                    "display_score": db_score,
+                    "is_edited_manually": True,
+                }
+            ]
+        return annotations
+
+    def _apply_items_individually(
+        self,
+        items: list[AnnotationSaveItem],
+        result: ManualEditFlushResult,
+        written: set[int],
+    ) -> None:
+        """バッチ失敗時に画像単位で保存し、結果を ``result`` / ``written`` に振り分ける。"""
+        for item in items:
+            try:
+                self.db_manager.annotation_repo.save_annotations(item.image_id, item.annotations)
+                written.add(item.image_id)
+            except ValueError:
+                logger.warning(f"Manual edit skipped: image_id {item.image_id} not found")
+                result.missing_image_ids.append(item.image_id)
+            except SQLAlchemyError:
+                logger.opt(exception=True).error(
+                    f"DB error writing manual edit for image_id {item.image_id}"
+                )
+                result.failed_image_ids.append(item.image_id)
@@ -5,6 +5,7 @@ from enum import Enum
 from typing import Any
 
 from lorairo.gui.workers.terminal import CancelReason, WorkerTerminalEvent
+from lorairo.utils.stage_telemetry import TelemetrySnapshot
 
 
 class OperationType(Enum):
@@ -57,3 +58,4 @@ class WorkerOperationEvent:
     error: str | None = None
     cancel_reason: CancelReason | None = None
     worker_terminal: WorkerTerminalEvent | None = None
+    telemetry: TelemetrySnapshot | None = None
@@ -148,7 +148,7 @@ class ProgressStateService:
         Args:
             worker_id: ワーカーID
             current: 現在の処理数
-            total: 総処理数
+            total: 総処理数 (0 は総数未確定)
             filename: 処理中のファイル名
 
 
@@ -157,10 +157,13 @@ class ProgressStateService:
             return
 
         try:
-            percentage = int((current / total) * 100) if total > 0 else 0
-
-            # Update status bar with detailed batch progress
-            status_message = f"バッチ処理中... {current}/{total} ({percentage}%) - {filename}"
+            # total=0 は総数未確定 (走査しながらの登録等)。処理件数のみ表示する
+            if total > 0:
+                percentage = int((current / total) * 100)
+                status_message = f"バッチ処理中... {current}/{total} ({percentage}%) - {filename}"
+            else:
+                percentage = 0
+                status_message = f"バッチ処理中... {current}件 - {filename}"
             self.status_bar.showMessage(status_message)
 
             logger.debug(f"バッチ進捗更新: {worker_id} - {current}/{total} ({percentage}%) - {filename}")
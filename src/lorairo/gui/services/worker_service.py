@@ -927,6 +927,7 @@ class WorkerService(QObject):
                 error=event.error,
                 cancel_reason=event.cancel_reason,
                 worker_terminal=event,
+                telemetry=event.telemetry,
             )
         )
         self._worker_operations.pop(event.worker_id, None)
@@ -1085,6 +1086,8 @@ class WorkerService(QObject):
         # Issue #805: 未 flush のステージ進捗バッファが残っていれば破棄 (leak 防止)。
         self._pending_stage_progress.pop(event.worker_id, None)
         status, summary = self._ledger_status_for_outcome(outcome, event)
+        if event.telemetry is not None:
+            self.job_ledger.set_telemetry(event.worker_id, event.telemetry)
         if self.job_ledger.finish(event.worker_id, status, summary) is not None:
             self.job_ledger_changed.emit()
 
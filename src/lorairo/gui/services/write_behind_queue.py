@@ -0,0 +1,260 @@
+# src/lorairo/gui/services/write_behind_queue.py
+"""GUI の手動編集 (Rating / Score / タグ追加) の write-behind キュー。
+
+ホットキーで数百枚を連続評価すると、1 キー操作ごとにセッション生成・commit・fsync が
+走り、GUI スレッドが ``busy_timeout`` 待ちで固まる。本キューは編集を画像単位で合成
+(同じ画像の Rating は最後の値だけ残す) してメモリに溜め、タイマー満了または件数しきい値で
+ワーカースレッドから ``ImageDBWriteService.apply_manual_edits`` にまとめて書き込む。
+
+書き込み結果 (確定した画像・競合・失敗) は :attr:`WriteBehindQueue.flushed` で UI に返す。
+検索・一括編集・ウィンドウ終了の前には :meth:`WriteBehindQueue.flush_now` で同期的に
+書き切り、未反映の編集を読み飛ばしたり失ったりしないようにする。
+"""
+
+import itertools
+from dataclasses import dataclass, field
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from ...utils.log import logger
+from .image_db_write_service import ImageDBWriteService, ManualEditFlushResult
+
+
+@dataclass
+class _EditBatch:
+    """合成済みの未書込編集。"""
+
+    ratings: dict[int, str] = field(default_factory=dict)
+    scores: dict[int, int] = field(default_factory=dict)
+    # タグ → 追加先 image_id (挿入順を保った重複なし集合)
+    tag_adds: dict[str, dict[int, None]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.ratings.keys() | self.scores.keys()) + sum(
+            len(ids) for ids in self.tag_adds.values()
+        )
+
+    def apply(self, service: ImageDBWriteService) -> ManualEditFlushResult:
+        return service.apply_manual_edits(
+            dict(self.ratings),
+            dict(self.scores),
+            {tag: list(image_ids) for tag, image_ids in self.tag_adds.items()},
+        )
+
+
+class _FlushTaskSignals(QObject):
+    """フラッシュタスク用シグナル。"""
+
+    finished = Signal(int, object)  # flush_id, ManualEditFlushResult
+
+
+class _FlushTask(QRunnable):
+    """合成済みの編集をバックグラウンドで書き込むタスク。"""
+
+    def __init__(self, flush_id: int, batch: _EditBatch, service: ImageDBWriteService) -> None:
+        super().__init__()
+        self._flush_id = flush_id
+        self._batch = batch
+        self._service = service
+        self.signals = _FlushTaskSignals()
+        # run() 完了後の結果 (flush_now が完了通知を待たずに受け取るため)
+        self.result: ManualEditFlushResult | None = None
+
+    def run(self) -> None:
+        """書き込みを実行し、結果を UI スレッドへ通知する。"""
+        try:
+            result = self._batch.apply(self._service)
+        except Exception:
+            # apply_manual_edits は DB エラーを結果に畳むため、ここに来るのは想定外の例外のみ
+            logger.opt(exception=True).error("Unexpected error while flushing manual edits")
+            result = ManualEditFlushResult(
+                failed_image_ids=sorted(self._batch.ratings.keys() | self._batch.scores.keys()),
+                failed_tags=list(self._batch.tag_adds),
+            )
+        self.result = result
+        try:
+            self.signals.finished.emit(self._flush_id, result)
+        except RuntimeError:
+            # キューが先に破棄された (signal source deleted) 場合は通知を捨てる
+            logger.debug(f"Manual edit flush notification skipped (flush_id={self._flush_id})")
+
+
+class WriteBehindQueue(QObject):
+    """手動編集を合成し、まとめて非同期に書き込むキュー。
+
+    書き込みは専用の 1 スレッドで順番に行うため、編集の順序は保たれる。
+    フラッシュ中に届いた編集は次のバッチに溜め、完了後に続けて書き込む。
+    """
+
+    flushed = Signal(object)  # ManualEditFlushResult
+    pending_changed = Signal(int)  # 未書込の編集数
+
+    DEFAULT_FLUSH_INTERVAL_MS = 400
+    DEFAULT_MAX_PENDING = 200
+    # flush_now が書き込み中のバッチを待つ時間 (GUI スレッドを止める上限)
+    DEFAULT_WAIT_MS = 5000
+    # 終了時は編集を失わないことを優先して長めに待つ
+    SHUTDOWN_WAIT_MS = 30000
+
+    def __init__(
+        self,
+        write_service: ImageDBWriteService,
+        *,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        parent: QObject | None = None,
+    ) -> None:
+        """WriteBehindQueue を初期化する。
+
+        Args:
+            write_service: 実際の書き込みを行うサービス
+            flush_interval_ms: 最後の編集からフラッシュまでの待ち時間
+            max_pending: この件数に達したらタイマーを待たずにフラッシュする
+            parent: 親 QObject
+        """
+        super().__init__(parent)
+        self._write_service = write_service
+        self._max_pending = max(1, max_pending)
+        self._pending = _EditBatch()
+        self._flush_ids = itertools.count(1)
+        self._in_flight_id: int | None = None
+        # 実行中タスクへの Python 側参照 (signals の GC 防止、CountEstimateWidget と同じ理由)
+        self._in_flight_tasks: dict[int, _FlushTask] = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    # === Public API ===
+
+    @property
+    def pending_count(self) -> int:
+        """未書込 (フラッシュ待ち) の編集数。"""
+        return len(self._pending)
+
+    @property
+    def is_flushing(self) -> bool:
+        """バックグラウンドで書き込み中か。"""
+        return self._in_flight_id is not None
+
+    def enqueue_rating(self, image_id: int, rating: str) -> bool:
+        """Rating 編集を積む (同じ画像の未書込 Rating は置き換える)。
+
+        Returns:
+            受け付けた場合 True。値が不正なら False。
+        """
+        if rating not in ImageDBWriteService.VALID_RATINGS:
+            logger.warning(f"Invalid rating value: '{rating}'")
+            return False
+        self._pending.ratings[image_id] = rating
+        self._after_enqueue()
+        return True
+
+    def enqueue_score(self, image_id: int, score: int) -> bool:
+        """Score 編集 (0-1000 の UI 値) を積む (同じ画像の未書込 Score は置き換える)。
+
+        Returns:
+            受け付けた場合 True。値が不正なら False。
+        """
+        if not (0 <= score <= 1000):
+            logger.warning(f"Invalid score value: {score}")
+            return False
+        self._pending.scores[image_id] = score
+        self._after_enqueue()
+        return True
+
+    def enqueue_tag(self, image_ids: list[int], tag: str) -> bool:
+        """タグ追加を積む (同じタグの追加先は 1 回の一括追加にまとめる)。
+
+        Returns:
+            受け付けた場合 True。対象が空なら False。
+        """
+        tag = tag.strip()
+        if not image_ids or not tag:
+            logger.warning("Empty image_ids or tag for queued tag add")
+            return False
+        self._pending.tag_adds.setdefault(tag, {}).update(dict.fromkeys(image_ids))
+        self._after_enqueue()
+        return True
+
+    def flush(self) -> None:
+        """未書込の編集をバックグラウンドで書き込む (書き込み中なら完了後に続ける)。"""
+        self._timer.stop()
+        if self._in_flight_id is not None or not len(self._pending):
+            return
+        batch, self._pending = self._pending, _EditBatch()
+        flush_id = next(self._flush_ids)
+        task = _FlushTask(flush_id, batch, self._write_service)
+        task.signals.finished.connect(self._on_flush_finished)
+        self._in_flight_id = flush_id
+        self._in_flight_tasks[flush_id] = task
+        self.pending_changed.emit(0)
+        self._pool.start(task)
+
+    def flush_now(self, timeout_ms: int = DEFAULT_WAIT_MS) -> ManualEditFlushResult | None:
+        """書き込み中のバッチを待ち、残りの編集を呼び出しスレッドで同期的に書き込む。
+
+        検索の直前・一括編集の直前・ウィンドウ終了時に使う。書き込み中のバッチが
+        ``timeout_ms`` 内に終わらなければ、順序が入れ替わらないよう残りの編集は
+        書き込まずにキューへ残す (そのバッチの完了後に続けて書き込まれる)。
+
+        Args:
+            timeout_ms: 書き込み中のバッチを待つ最大時間 (呼び出しスレッドを止める時間)
+
+        Returns:
+            同期的に書き込んだ分の結果。未書込の編集が無い場合、または待ちきれず
+            書き込まなかった場合は None (後者は :attr:`pending_count` が残る)。
+        """
+        self._timer.stop()
+        if self._in_flight_id is not None and not self._pool.waitForDone(timeout_ms):
+            logger.warning(
+                f"Manual edit flush still running after {timeout_ms}ms; "
+                f"keeping {len(self._pending)} pending edits queued"
+            )
+            return None
+        batch, self._pending = self._pending, _EditBatch()
+        if self._in_flight_id is not None:
+            # 書き込み中だったバッチは完了済み。イベントループ経由の完了通知を待たずに
+            # ここで処理する (後から届く通知は _on_flush_finished が読み捨てる)
+            flush_id = self._in_flight_id
+            task = self._in_flight_tasks.get(flush_id)
+            if task is not None and task.result is not None:
+                self._on_flush_finished(flush_id, task.result)
+        if not len(batch):
+            return None
+        self.pending_changed.emit(0)
+        result = batch.apply(self._write_service)
+        self.flushed.emit(result)
+        return result
+
+    def shutdown(self) -> None:
+        """終了前に未書込の編集をすべて書き切る。"""
+        self.flush_now(self.SHUTDOWN_WAIT_MS)
+        if len(self._pending):
+            logger.error(f"{len(self._pending)} manual edits were still pending at shutdown")
+        if self._in_flight_id is None:
+            self._in_flight_tasks.clear()
+
+    # === Internal ===
+
+    def _after_enqueue(self) -> None:
+        count = len(self._pending)
+        self.pending_changed.emit(count)
+        if count >= self._max_pending:
+            self.flush()
+        else:
+            self._timer.start()
+
+    def _on_flush_finished(self, flush_id: int, result: ManualEditFlushResult) -> None:
+        if self._in_flight_tasks.pop(flush_id, None) is None:
+            # flush_now で処理済みの完了通知
+            return
+        if self._in_flight_id == flush_id:
+            self._in_flight_id = None
+        self.flushed.emit(result)
+        if len(self._pending) and not self._timer.isActive():
+            self.flush()
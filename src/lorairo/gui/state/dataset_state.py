@@ -1,11 +1,46 @@
 # src/lorairo/gui/state/dataset_state.py
 
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 
+from ...database.image_id_selection import ImageIdSelection
+from ...services.image_result_set import ImageResultSet
 from ...utils.log import logger
+from ..cache.annotation_snapshot import AnnotationSnapshot
+
+
+class _AnnotationPrefetchSignals(QObject):
+    """アノテーション先読みタスク用シグナル。"""
+
+    finished = Signal(int, int, object)  # task_id, snapshot_generation, {image_id: annotations}
+
+
+class _AnnotationPrefetchTask(QRunnable):
+    """``get_image_annotation_metadata_batch`` をバックグラウンド実行するタスク。"""
+
+    def __init__(self, task_id: int, generation: int, image_ids: list[int], image_repo: Any) -> None:
+        super().__init__()
+        self._task_id = task_id
+        self._generation = generation
+        self.image_ids = image_ids
+        self._image_repo = image_repo
+        self.signals = _AnnotationPrefetchSignals()
+
+    def run(self) -> None:
+        """バックグラウンドで一括取得して UI スレッドへ通知する (失敗時は空 dict)。"""
+        try:
+            annotations_by_id = self._image_repo.get_image_annotation_metadata_batch(self.image_ids)
+        except Exception as e:
+            logger.opt(exception=True).error(f"アノテーション先読み失敗: count={len(self.image_ids)}: {e}")
+            annotations_by_id = {}
+        try:
+            self.signals.finished.emit(self._task_id, self._generation, annotations_by_id)
+        except RuntimeError:
+            # 受信側が破棄済み (アプリ終了時等) なら結果は不要
+            logger.debug(f"アノテーション先読み完了通知をスキップ: task_id={self._task_id}")
 
 
 class DatasetStateManager(QObject):
@@ -19,12 +54,16 @@ class DatasetStateManager(QObject):
     dataset_loaded = Signal(int)  # total_image_count
 
     # === 画像リスト・フィルター状態シグナル ===
-    images_filtered = Signal(list)  # List[Dict[str, Any]] - filtered image metadata
-    images_loaded = Signal(list)  # List[Dict[str, Any]] - all image metadata
+    # ImageResultSet (Sequence[dict]) を渡す。Signal(list) だと emit ごとに全行を
+    # list へ変換 (= 全行 dict を materialize) するため object で送る。
+    images_filtered = Signal(object)  # ImageResultSet - filtered image metadata
+    images_loaded = Signal(object)  # ImageResultSet - all image metadata
     filter_cleared = Signal()
 
     # === 選択状態シグナル ===
-    selection_changed = Signal(list)  # List[int] - selected image IDs
+    # 不変の ImageIdSelection (Sequence[int]、ID 昇順) を渡す。Signal(list) だと
+    # emit ごとに全 ID の list を作るため object で送る。
+    selection_changed = Signal(object)  # ImageIdSelection - selected image IDs
     current_image_changed = Signal(int)  # current_image_id
     current_image_data_changed = Signal(dict)  # current_image_data (complete metadata)
     current_image_cleared = Signal()
@@ -40,15 +79,29 @@ class DatasetStateManager(QObject):
         # === プライベート状態 ===
         self._dataset_path: Path | None = None
         # Issue #969: 検索結果(全件)とフィルター済みの2層モデルは実 UX で
-        # 分岐せず形骸化していたため _all_images の単一リストに統合した。
-        # filtered_* 系アクセサ・signal は後方互換のため _all_images を参照する。
-        self._all_images: list[dict[str, Any]] = []
-        # _all_images の id→metadata 遅延インデックス (get_image_by_id を O(1) 化)。
-        # _all_images の内容が変わる箇所で _invalidate_image_index() により無効化する。
-        self._id_index: dict[int, dict[str, Any]] | None = None
-        self._selected_image_ids: list[int] = []
+        # 分岐せず形骸化していたため _images の単一リストに統合した。
+        # filtered_* 系アクセサ・signal は後方互換のため _images を参照する。
+        # 列指向の ImageResultSet で保持し、id→行インデックスで O(1) 検索する。
+        self._images = ImageResultSet()
+        self._selection = ImageIdSelection()
         self._current_image_id: int | None = None
         self._filter_conditions: dict[str, Any] = {}
+        # アノテーションスナップショット (画像ID キー・列指向)。再検索
+        # (update_from_search_results) では保持し、データセットの再設定 (set_dataset_images)
+        # とクリア (clear_dataset) で全破棄する。書き込み後は invalidate_annotations /
+        # メタデータ更新で画像単位に無効化・更新する。詳細パネル / タグパネル / Rating
+        # エディタが共有する。
+        self._annotation_snapshot = AnnotationSnapshot()
+        # ページ表示時の先読みは GUI スレッドを塞がないよう専用プールで実行する
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
+        self._prefetch_seq = 0
+        # 実行中タスクへの参照 (task.signals が GC されないよう保持) と取得中の画像 ID
+        self._prefetch_tasks: dict[int, _AnnotationPrefetchTask] = {}
+        self._prefetch_inflight_ids: set[int] = set()
+        # 取得中に無効化された画像 ID (スナップショット未格納のため generation が進まない分)。
+        # 先読み結果のうちこれらは書き戻さない。
+        self._prefetch_stale_ids: set[int] = set()
 
         # === UI状態 ===
         self._thumbnail_size: int = 150
@@ -80,17 +133,22 @@ class DatasetStateManager(QObject):
 
     @property
     def all_images(self) -> list[dict[str, Any]]:
-        return self._all_images.copy()
+        return list(self._images)
 
     @property
     def filtered_images(self) -> list[dict[str, Any]]:
-        # Issue #969: 2層統合後は全件と同一。後方互換のため defensive copy を返す。
-        return self._all_images.copy()
+        # Issue #969: 2層統合後は全件と同一。後方互換のため list (defensive copy) を返す。
+        return list(self._images)
+
+    @property
+    def image_result_set(self) -> ImageResultSet:
+        """検索結果の列指向セット (live 参照、全件 list 化を伴わない read-only 用途向け)。"""
+        return self._images
 
     @property
     def image_count(self) -> int:
         """全画像の件数 (Issue #967: 全件 .copy() を伴わない O(1) アクセサ)。"""
-        return len(self._all_images)
+        return len(self._images)
 
     @property
     def filtered_count(self) -> int:
@@ -100,11 +158,37 @@ class DatasetStateManager(QObject):
         ページング (PaginationStateManager.total_items / total_pages) のような高頻度経路
         では件数取得にこのアクセサを使う。Issue #969 の 2 層統合後は image_count と同値。
         """
-        return len(self._all_images)
+        return len(self._images)
 
     @property
     def selected_image_ids(self) -> list[int]:
-        return self._selected_image_ids.copy()
+        """選択画像 ID (ID 昇順)。表示順が必要な場合は ``selected_image_ids_in_display_order``。"""
+        return self._selection.to_list()
+
+    def selected_image_ids_in_display_order(self) -> list[int]:
+        """選択画像 ID を検索結果の表示順 (結果セットの行順) で返す。
+
+        ステージング等、上限で打ち切られ得る受け渡しはグリッドの並び順に従わせる。
+        検索結果に含まれない選択 ID は末尾に ID 昇順で続ける。
+        """
+        index_of = self._images.index_of
+        outside = len(self._images)
+
+        def display_position(image_id: int) -> tuple[int, int]:
+            row = index_of(image_id)
+            return (outside if row is None else row, image_id)
+
+        return sorted(self._selection, key=display_position)
+
+    @property
+    def selection(self) -> ImageIdSelection:
+        """選択画像 ID の集合 (不変・ID 昇順)。list 化を伴わない読み取り用途向け。"""
+        return self._selection
+
+    @property
+    def annotation_snapshot(self) -> AnnotationSnapshot:
+        """GUI ウィジェット間で共有するアノテーションスナップショット (live 参照)。"""
+        return self._annotation_snapshot
 
     @property
     def current_image_id(self) -> int | None:
@@ -131,14 +215,14 @@ class DatasetStateManager(QObject):
             logger.info(f"データセットパス変更: {dataset_path}")
             self.dataset_changed.emit(str(dataset_path))
 
-    def set_dataset_images(self, images: list[dict[str, Any]]) -> None:
+    def set_dataset_images(self, images: Sequence[dict[str, Any]]) -> None:
         """データセットの全画像リストを設定"""
-        self._all_images = images.copy()
-        self._invalidate_image_index()
+        self._images = ImageResultSet.from_rows(images)
+        self._annotation_snapshot.clear()
 
         logger.info(f"データセット画像読み込み: {len(images)}件")
-        self.images_loaded.emit(self._all_images)
-        self.images_filtered.emit(self._all_images)
+        self.images_loaded.emit(self._images)
+        self.images_filtered.emit(self._images)
         self.dataset_loaded.emit(len(images))
 
         # 選択状態をクリア
@@ -147,9 +231,9 @@ class DatasetStateManager(QObject):
     def clear_dataset(self) -> None:
         """データセット状態をクリア"""
         self._dataset_path = None
-        self._all_images = []
+        self._images = ImageResultSet()
         self._filter_conditions = {}
-        self._invalidate_image_index()
+        self._annotation_snapshot.clear()
 
         self.clear_selection()
         # 現在画像のクリアは clear_current_image に一本化する (#1228 Codex P2)。
@@ -162,84 +246,101 @@ class DatasetStateManager(QObject):
 
     # === Filter Management ===
 
-    def update_from_search_results(self, search_results: list[dict[str, Any]]) -> None:
+    def update_from_search_results(self, search_results: Sequence[dict[str, Any]]) -> None:
         """
         検索結果による完全データ更新（クリーンなデータフロー）
 
-        検索結果でマスターデータ (_all_images) を完全置換し、単一データソース
+        検索結果でマスターデータ (_images) を完全置換し、単一データソース
         (Single Source of Truth) として扱う。Issue #969 で検索結果/フィルターの
         2 層を統合したため、ここで保持する 1 リストが全件かつ表示対象を兼ねる。
 
         Args:
-            search_results: 検索結果の画像メタデータリスト
+            search_results: 検索結果の画像メタデータ (``ImageResultSet`` または dict の列)
                 各辞書は以下のキーを含む必要があります:
                 - "id": 画像ID (int)
                 - "stored_image_path": 画像ファイルパス (str)
                 - その他の画像メタデータ (width, height, etc.)
 
         Side Effects:
-            - _all_images を完全置換
+            - _images を完全置換
             - images_loaded と images_filtered シグナルを発行
             - 現在選択中の画像が結果に含まれない場合、選択をクリア
         """
         logger.info(f"検索結果によるデータ完全更新: {len(search_results)}件")
 
-        # 完全データ置換（Single Source of Truth）。Issue #969: 2 層統合により
-        # コピーは 1 回のみ (呼び出し元が保持する list との別オブジェクト化のため必要)。
-        self._all_images = search_results.copy()
-        self._invalidate_image_index()
+        # 完全データ置換（Single Source of Truth）。ImageResultSet は列を共有する
+        # コピー、dict の列は列指向へ変換して呼び出し元の保持物と別オブジェクトにする。
+        self._images = ImageResultSet.from_rows(search_results)
 
         # フィルター条件はクリア（検索結果が新しい基準）
         self._filter_conditions = {}
 
         # シグナル発行で UI コンポーネントに通知
-        self.images_loaded.emit(self._all_images)
-        self.images_filtered.emit(self._all_images)
+        self.images_loaded.emit(self._images)
+        self.images_filtered.emit(self._images)
 
         # 現在の選択状態を検証・クリア
-        if self._current_image_id:
-            current_valid = any(img.get("id") == self._current_image_id for img in self._all_images)
-            if not current_valid:
-                logger.debug(
-                    f"現在の画像ID {self._current_image_id} が検索結果に含まれていないため選択をクリア"
-                )
-                self.clear_current_image()
+        if self._current_image_id and not self._images.has_id(self._current_image_id):
+            logger.debug(
+                f"現在の画像ID {self._current_image_id} が検索結果に含まれていないため選択をクリア"
+            )
+            self.clear_current_image()
 
-        logger.debug(f"データ同期完了: all_images={len(self._all_images)}")
+        logger.debug(f"データ同期完了: all_images={len(self._images)}")
 
     # === Selection Management ===
 
-    def set_selected_images(self, image_ids: list[int]) -> None:
-        """選択画像IDリストを設定"""
-        if self._selected_image_ids != image_ids:
-            self._selected_image_ids = image_ids.copy()
-            self.selection_changed.emit(self._selected_image_ids)
-            logger.debug(f"画像選択変更: {len(image_ids)}件選択")
+    def set_selected_images(self, image_ids: Iterable[int]) -> None:
+        """選択画像IDを設定 (ImageIdSelection はそのまま保持する)"""
+        selection = ImageIdSelection(image_ids)
+        if selection != self._selection:
+            self._selection = selection
+            self.selection_changed.emit(selection)
+            logger.debug(f"画像選択変更: {len(selection)}件選択")
+
+    def add_images_to_selection(self, image_ids: Iterable[int]) -> None:
+        """既存の選択に画像IDを追加 (和集合)"""
+        self.set_selected_images(self._selection.union(image_ids))
 
     def add_to_selection(self, image_id: int) -> None:
         """選択に画像IDを追加"""
-        if image_id not in self._selected_image_ids:
-            self._selected_image_ids.append(image_id)
-            self.selection_changed.emit(self._selected_image_ids)
+        if image_id not in self._selection:
+            self.set_selected_images(self._selection.union((image_id,)))
 
     def remove_from_selection(self, image_id: int) -> None:
         """選択から画像IDを削除"""
-        if image_id in self._selected_image_ids:
-            self._selected_image_ids.remove(image_id)
-            self.selection_changed.emit(self._selected_image_ids)
+        if image_id in self._selection:
+            self.set_selected_images(self._selection.difference((image_id,)))
 
     def toggle_selection(self, image_id: int) -> None:
         """画像IDの選択状態をトグル"""
-        if image_id in self._selected_image_ids:
+        if image_id in self._selection:
             self.remove_from_selection(image_id)
         else:
             self.add_to_selection(image_id)
 
+    def select_range(self, start: int, end: int, *, add_to_existing: bool = False) -> None:
+        """検索結果の [start:end] 行を選択 (行 dict を組み立てず id 列から引く)
+
+        Args:
+            start: 範囲の先頭行 (0 始まり)。
+            end: 範囲の終端行 (排他)。
+            add_to_existing: True なら既存の選択に範囲を加える。
+        """
+        range_ids = self._images.ids_slice(start, end)
+        if add_to_existing:
+            self.add_images_to_selection(range_ids)
+        else:
+            self.set_selected_images(range_ids)
+
+    def select_all_filtered(self) -> None:
+        """検索結果 (表示対象) の全画像を選択"""
+        self.select_range(0, len(self._images))
+
     def clear_selection(self) -> None:
         """全選択をクリア"""
-        if self._selected_image_ids:
-            self._selected_image_ids = []
-            self.selection_changed.emit(self._selected_image_ids)
+        if self._selection:
+            self.set_selected_images(())
 
     def set_current_image(self, image_id: int) -> None:
         """現在の画像IDを設定"""
@@ -250,7 +351,8 @@ class DatasetStateManager(QObject):
             self.current_image_changed.emit(image_id)
 
             # 新しいデータシグナルで完全な画像メタデータを送信
-            image_data = self.get_image_by_id(image_id)
+            # (遅延ロードしたアノテーションをキャッシュに残すため行を固定して merge する)
+            image_data = self._images.pin_by_id(image_id)
             if image_data:
                 self._ensure_annotations_loaded(image_data)
                 self.current_image_data_changed.emit(image_data)
@@ -311,33 +413,12 @@ class DatasetStateManager(QObject):
 
     # === Utility Methods ===
 
-    def _get_all_images_index(self) -> dict[int, dict[str, Any]]:
-        """_all_images の id→metadata インデックスを返す（遅延構築・O(1) 検索用）。
-
-        _all_images の内容が変わる箇所で ``_invalidate_image_index()`` を呼ぶことで、
-        次回アクセス時に再構築される。サムネイル描画 (``_display_page``) が
-        ページ内全件に対して ``get_image_by_id`` を呼ぶ経路を O(n^2)→O(n) にする。
-        """
-        if self._id_index is None:
-            index: dict[int, dict[str, Any]] = {}
-            for img in self._all_images:
-                img_id = img.get("id")
-                if img_id is not None:
-                    index[img_id] = img
-            self._id_index = index
-        return self._id_index
-
-    def _invalidate_image_index(self) -> None:
-        """_all_images の内容変更時にインデックスを無効化する。"""
-        self._id_index = None
-
     def get_filtered_image_ids_slice(self, start: int, end: int) -> list[int]:
         """[start:end] ページ分の画像IDだけを返す (Issue #967)。
 
         ``filtered_images`` プロパティ経由だと全件 shallow copy が発生するが、
-        本メソッドは ``_all_images[start:end]`` のスライス (高々 page_size 件) のみ
-        を走査して id を抽出するため、ページング経路のコピーコストを O(全件) から
-        O(ページ) に下げる。
+        本メソッドは id 列の ``[start:end]`` (高々 page_size 件) のみを読み、行 dict も
+        組み立てないため、ページング経路のコストを O(全件) から O(ページ) に下げる。
 
         Args:
             start: スライス開始インデックス (0 始まり)。
@@ -346,39 +427,36 @@ class DatasetStateManager(QObject):
         Returns:
             ページ内画像IDのリスト (int の id を持つ要素のみ)。
         """
-        return [
-            image_id
-            for image in self._all_images[start:end]
-            if isinstance((image_id := image.get("id")), int)
-        ]
+        return self._images.ids_slice(start, end)
 
     def get_image_by_id(self, image_id: int) -> dict[str, Any] | None:
         """
-        IDで画像メタデータを取得（統一データソース: _all_images インデックス）
+        IDで画像メタデータを取得（統一データソース: _images インデックス）
 
         Args:
             image_id: 検索する画像ID
 
         Returns:
-            画像メタデータ辞書、見つからない場合はNone
+            画像メタデータ辞書、見つからない場合はNone。読み取り用で、書き換えても
+            キャッシュには残らない (キャッシュの更新は本クラスの更新系メソッドで行う)。
         """
-        # all_images インデックスから O(1) 検索（Issue #969: 2 層統合により単一ソース）
-        img = self._get_all_images_index().get(image_id)
+        # id→行インデックスから O(1) 検索（Issue #969: 2 層統合により単一ソース）
+        img = self._images.get_by_id(image_id)
         if img is not None:
             return img
 
         # デバッグ情報の詳細ログ
         logger.debug(
             f"画像ID {image_id} が見つかりません。"
-            f"all_images: {len(self._all_images)}件, "
-            f"IDサンプル: {[img.get('id') for img in self._all_images[:3]]}..."
+            f"all_images: {len(self._images)}件, "
+            f"IDサンプル: {self._images.ids_slice(0, 3)}..."
         )
         return None
 
     def update_image_metadata(self, image_id: int, new_metadata: dict[str, Any]) -> None:
         """単一画像のキャッシュメタデータを更新
 
-        _all_images を更新し、現在選択中の画像ならシグナル発行。
+        _images を更新し、現在選択中の画像ならシグナル発行。
         Issue #969: 2 層統合により更新対象は単一リストのみ。
 
         Args:
@@ -393,26 +471,56 @@ class DatasetStateManager(QObject):
             logger.warning(f"メタデータ検証失敗: {image_id}")
             return
 
-        # _all_imagesを更新
-        found_in_all = False
-        for i, img in enumerate(self._all_images):
-            if img.get("id") == image_id:
-                self._all_images[i] = new_metadata
-                found_in_all = True
-                logger.debug(f"_all_images更新: image_id={image_id}")
-                break
-
-        if found_in_all:
-            # 要素を差し替えたためインデックスの該当エントリが stale になる
-            self._invalidate_image_index()
+        # _imagesを更新 (id→行インデックスで O(1) 差し替え)
+        if self._images.replace(image_id, new_metadata):
+            logger.debug(f"_images更新: image_id={image_id}")
         else:
-            logger.warning(f"画像ID {image_id} が_all_imagesに見つかりません")
+            logger.warning(f"画像ID {image_id} が_imagesに見つかりません")
+
+        # DB 書き込み後の更新なのでスナップショットも追従させる。アノテーションを
+        # 含まないメタデータなら stale な行を破棄して次回選択時に再取得させる。
+        if "tags" in new_metadata:
+            self._annotation_snapshot.put(image_id, new_metadata)
+        else:
+            self._invalidate_snapshot([image_id])
 
         # 現在選択中ならシグナル発行
         if self._current_image_id == image_id:
             self.current_image_data_changed.emit(new_metadata)
             logger.debug(f"キャッシュ更新とシグナル発行完了: {image_id}")
 
+    def apply_manual_edit(
+        self, image_id: int, *, rating: str | None = None, score: float | None = None
+    ) -> bool:
+        """書込待ちの手動 Rating / Score をキャッシュへ先に反映する。
+
+        write-behind キューに積んだ編集が DB に届く前でも、サムネイルや詳細表示が
+        直前の値に戻らないようにする。書込確定後は ``refresh_images`` が DB の値で
+        上書きして整合させる。
+
+        Args:
+            image_id: 対象画像の ID
+            rating: 手動 Rating (変更しないなら None)
+            score: 手動 Score (DB 値 0.0-10.0、変更しないなら None)
+
+        Returns:
+            キャッシュに載っている画像を更新した場合 True。
+        """
+        cached = self._images.pin_by_id(image_id)
+        if cached is None:
+            return False
+        if rating is not None:
+            cached["rating_value"] = rating
+            cached["manual_rating_value"] = rating
+        if score is not None:
+            cached["score_value"] = score
+            cached["manual_score_value"] = score
+        # スナップショットの旧値を返さないよう破棄する (書込確定時に再取得される)
+        self._invalidate_snapshot([image_id])
+        if self._current_image_id == image_id:
+            self.current_image_data_changed.emit(cached)
+        return True
+
     def refresh_image(self, image_id: int) -> None:
         """
         単一画像のメタデータをDBから再読み込み
@@ -424,7 +532,7 @@ class DatasetStateManager(QObject):
 
         Side Effects:
             - DB から最新メタデータを取得
-            - _all_images のキャッシュを更新
+            - _images のキャッシュを更新
             - 現在選択中の画像なら current_image_data_changed シグナル発行
 
         Note:
@@ -476,7 +584,7 @@ class DatasetStateManager(QObject):
             logger.warning("DB Manager not set, cannot refresh image annotations")
             return
 
-        cached = self.get_image_by_id(image_id)
+        cached = self._images.pin_by_id(image_id)
         if cached is None:
             # キャッシュ未登録 (登録直後 / 検索結果外) は full fetch にフォールバック
             self.refresh_image(image_id)
@@ -491,6 +599,7 @@ class DatasetStateManager(QObject):
         if not annotations:
             return
 
+        self._annotation_snapshot.put(image_id, annotations)
         # live 参照を in-place 更新するためパス/processed フィールドは保持される
         cached.update(annotations)
         logger.debug(f"アノテーションキャッシュ更新: image_id={image_id}")
@@ -537,16 +646,28 @@ class DatasetStateManager(QObject):
         if not image_ids:
             return
 
+        # スナップショットは検索結果外の画像も保持し得るため、キャッシュ dict の有無に
+        # 関係なく全 ID を無効化する。
+        snapshot_invalidated = self._invalidate_snapshot(image_ids)
+
         invalidated = 0
         for image_id in image_ids:
-            cached = self.get_image_by_id(image_id)
+            cached = self._images.get_by_id(image_id)
             if cached is None:
                 continue
-            for key in self._ANNOTATION_CACHE_KEYS:
-                cached.pop(key, None)
             invalidated += 1
+            if not any(key in cached for key in self._ANNOTATION_CACHE_KEYS):
+                continue
+            # アノテーションを持つ行だけ固定してキーを落とす
+            pinned = self._images.pin_by_id(image_id)
+            if pinned is not None:
+                for key in self._ANNOTATION_CACHE_KEYS:
+                    pinned.pop(key, None)
 
-        logger.debug(f"アノテーションキャッシュ無効化: {invalidated}/{len(image_ids)} 件")
+        logger.debug(
+            f"アノテーションキャッシュ無効化: {invalidated}/{len(image_ids)} 件 "
+            f"(snapshot={snapshot_invalidated} 件)"
+        )
 
         # 現在表示中の画像は即時再取得して表示を最新化する
         # (refresh_image_annotations はキャッシュ未登録なら refresh_image へフォールバック)
@@ -565,7 +686,7 @@ class DatasetStateManager(QObject):
 
         Side Effects:
             - DB から最新メタデータを一括取得（1クエリ）
-            - _all_images のキャッシュを更新
+            - _images のキャッシュを更新
             - 現在選択中の画像が含まれれば current_image_data_changed シグナル発行
 
         Note:
@@ -625,11 +746,19 @@ class DatasetStateManager(QObject):
         Note:
             アノテーション済み (検索以外の経路 / 取得済み) の dict は "tags" キーを
             持つため何もしない。検索フェーズの dict のみ遅延取得の対象になる。
+            スナップショット (``prefetch_annotations`` で先読み済み) にあれば DB を
+            照会せずに merge する。
         """
         if "tags" in image_data:
             return  # 既にアノテーション済み
         image_id = image_data.get("id")
-        if image_id is None or not self._db_manager:
+        if image_id is None:
+            return
+        snapshot = self._annotation_snapshot.get(image_id)
+        if snapshot is not None:
+            image_data.update(snapshot)
+            return
+        if not self._db_manager:
             return
         try:
             annotations = self._db_manager.image_repo.get_image_annotation_metadata(image_id)
@@ -637,9 +766,126 @@ class DatasetStateManager(QObject):
             logger.opt(exception=True).error(f"アノテーション遅延取得失敗: ID {image_id}: {e}")
             return
         if annotations:
+            self._annotation_snapshot.put(image_id, annotations)
             image_data.update(annotations)
             logger.debug(f"アノテーション遅延取得・merge 完了: ID {image_id}")
 
+    def prefetch_annotations(self, image_ids: Sequence[int]) -> int:
+        """スナップショット未登録の画像アノテーションを一括で先読みする。
+
+        サムネイルページ表示時に呼び出し、ページ内画像のアノテーションを 1 クエリ
+        (``get_image_annotation_metadata_batch``) で取得してスナップショットへ格納する。
+        以降の矢印キー移動による選択切り替えは ``_ensure_annotations_loaded`` が
+        スナップショットから merge するため、選択ごとの DB 往復が発生しない。
+
+        Args:
+            image_ids: 先読み対象の画像 ID リスト (登録済み ID は無視)。
+
+        Returns:
+            新たにスナップショットへ格納した画像数。
+
+        Note:
+            - _db_manager 未設定時や取得失敗時は 0 を返す (選択時の単一取得にフォールバック)。
+        """
+        missing = self._annotation_snapshot.missing_ids(image_ids)
+        if not missing or not self._db_manager:
+            return 0
+        try:
+            annotations_by_id = self._db_manager.image_repo.get_image_annotation_metadata_batch(missing)
+        except Exception as e:
+            logger.opt(exception=True).error(f"アノテーション先読み失敗: count={len(missing)}: {e}")
+            return 0
+        for image_id, annotations in annotations_by_id.items():
+            self._annotation_snapshot.put(image_id, annotations)
+        logger.debug(f"アノテーション先読み完了: {len(annotations_by_id)}/{len(missing)} 件")
+        return len(annotations_by_id)
+
+    def _invalidate_snapshot(self, image_ids: Sequence[int]) -> int:
+        """スナップショットの行を破棄し、取得中の先読み結果も書き戻さないよう印を付ける。
+
+        Args:
+            image_ids: 無効化対象の画像 ID。
+
+        Returns:
+            スナップショットから破棄した行数。
+        """
+        self._prefetch_stale_ids.update(
+            image_id for image_id in image_ids if image_id in self._prefetch_inflight_ids
+        )
+        return self._annotation_snapshot.invalidate(image_ids)
+
+    def prefetch_annotations_async(self, image_ids: Sequence[int]) -> None:
+        """``prefetch_annotations`` をバックグラウンドで実行する (ページ表示用)。
+
+        取得はワーカースレッドで行い、結果は GUI スレッドの ``_on_prefetch_finished``
+        でスナップショットへ格納する。取得中に無効化 (書き込み・データセット差し替え) が
+        あった場合は結果を破棄する。取得中の ID は重複して要求しない。
+
+        Args:
+            image_ids: 先読み対象の画像 ID (登録済み・取得中の ID は無視)。
+        """
+        if not self._db_manager:
+            return
+        missing = [
+            image_id
+            for image_id in self._annotation_snapshot.missing_ids(image_ids)
+            if image_id not in self._prefetch_inflight_ids
+        ]
+        if not missing:
+            return
+        self._prefetch_seq += 1
+        task = _AnnotationPrefetchTask(
+            self._prefetch_seq, self._annotation_snapshot.generation, missing, self._db_manager.image_repo
+        )
+        task.signals.finished.connect(self._on_prefetch_finished)
+        self._prefetch_tasks[self._prefetch_seq] = task
+        self._prefetch_inflight_ids.update(missing)
+        self._prefetch_pool.start(task)
+
+    def _on_prefetch_finished(
+        self, task_id: int, generation: int, annotations_by_id: dict[int, dict[str, Any]]
+    ) -> None:
+        task = self._prefetch_tasks.pop(task_id, None)
+        stale: set[int] = set()
+        if task is not None:
+            self._prefetch_inflight_ids.difference_update(task.image_ids)
+            stale = self._prefetch_stale_ids.intersection(task.image_ids)
+            self._prefetch_stale_ids.difference_update(stale)
+        if generation != self._annotation_snapshot.generation:
+            logger.debug(f"アノテーション先読み結果を破棄 (取得中に無効化): task_id={task_id}")
+            return
+        stored = 0
+        for image_id in self._annotation_snapshot.missing_ids(annotations_by_id):
+            if image_id in stale:
+                continue
+            self._annotation_snapshot.put(image_id, annotations_by_id[image_id])
+            stored += 1
+        logger.debug(f"アノテーション先読み完了 (非同期): {stored}/{len(annotations_by_id)} 件")
+
+    def wait_for_prefetch(self, timeout_ms: int = 5000) -> bool:
+        """実行中の非同期先読みの完了を待つ (終了処理・テスト用)。"""
+        return bool(self._prefetch_pool.waitForDone(timeout_ms))
+
+    def get_annotations(self, image_ids: Sequence[int]) -> dict[int, dict[str, Any]]:
+        """複数画像のアノテーションをスナップショット経由で取得する。
+
+        未登録分のみ ``prefetch_annotations`` で一括取得するため、複数選択時の
+        Rating エディタ等が画像ごとに DB を照会する必要がない。
+
+        Args:
+            image_ids: 取得対象の画像 ID リスト。
+
+        Returns:
+            ``{image_id: アノテーション辞書}``。DB にも存在しない ID は含まれない。
+        """
+        self.prefetch_annotations(image_ids)
+        result: dict[int, dict[str, Any]] = {}
+        for image_id in image_ids:
+            annotations = self._annotation_snapshot.get(image_id)
+            if annotations is not None:
+                result[image_id] = annotations
+        return result
+
     def _get_image_from_db(self, image_id: int) -> dict[str, Any] | None:
         """DB から単一画像メタデータを取得する（キャッシュ未登録画像の選択用）。
 
@@ -663,15 +909,15 @@ class DatasetStateManager(QObject):
 
     def has_images(self) -> bool:
         """画像が読み込まれているかチェック"""
-        return len(self._all_images) > 0
+        return len(self._images) > 0
 
     def has_filtered_images(self) -> bool:
         """表示対象画像があるかチェック (Issue #969: 2 層統合後は has_images と同値)"""
-        return len(self._all_images) > 0
+        return len(self._images) > 0
 
     def is_image_selected(self, image_id: int) -> bool:
         """指定画像IDが選択されているかチェック"""
-        return image_id in self._selected_image_ids
+        return image_id in self._selection
 
     # === Debug Methods ===
 
@@ -679,11 +925,12 @@ class DatasetStateManager(QObject):
         """状態サマリーを取得（デバッグ用）"""
         return {
             "dataset_path": str(self._dataset_path) if self._dataset_path else None,
-            "total_images": len(self._all_images),
-            "filtered_images": len(self._all_images),
-            "selected_images": len(self._selected_image_ids),
+            "total_images": len(self._images),
+            "filtered_images": len(self._images),
+            "selected_images": len(self._selection),
             "current_image_id": self._current_image_id,
             "has_filter": bool(self._filter_conditions),
+            "annotation_snapshot": len(self._annotation_snapshot),
             "thumbnail_size": self._thumbnail_size,
             "layout_mode": self._layout_mode,
         }
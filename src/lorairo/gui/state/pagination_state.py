@@ -9,6 +9,7 @@ Single Source of Truth (SoT) として管理する。
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import QObject, Signal
@@ -222,7 +223,7 @@ class PaginationStateManager(QObject):
 
     # === Private Methods ===
 
-    def _on_images_filtered(self, _filtered_images: list[Any]) -> None:
+    def _on_images_filtered(self, _filtered_images: Sequence[Any]) -> None:
         """
         DatasetStateManager の検索結果が更新されたときの処理。
 
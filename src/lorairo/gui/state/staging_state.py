@@ -9,6 +9,7 @@
 """
 
 from collections import OrderedDict
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -56,7 +57,7 @@ class StagingStateManager(QObject):
         """
         self._dataset_state_manager = dataset_state_manager
 
-    def add_image_ids(self, image_ids: list[int]) -> None:
+    def add_image_ids(self, image_ids: Iterable[int]) -> None:
         """指定した画像 ID をステージングへ追加する (上限・重複排除を適用)。
 
         変更があった場合のみ staged_images_changed を発行する。
@@ -88,11 +89,11 @@ class StagingStateManager(QObject):
         self.staged_images_changed.emit(self.get_image_ids())
 
     def add_selected_images(self) -> None:
-        """DatasetStateManager.selected_image_ids をステージングへ追加する。"""
+        """DatasetStateManager の選択画像を表示順でステージングへ追加する。"""
         if self._dataset_state_manager is None:
             logger.warning("DatasetStateManager not set in StagingStateManager")
             return
-        selected_ids = self._dataset_state_manager.selected_image_ids
+        selected_ids = self._dataset_state_manager.selected_image_ids_in_display_order()
         if not selected_ids:
             logger.info("No images selected")
             return
@@ -35,21 +35,24 @@ worker dispatch・PipelineControlService 所有・staging fan-out・タブ間遷
       / ``selected_image_details_widget`` / ``main_splitter``
 """
 
+from collections.abc import Sequence
 from typing import Any
 
 from PySide6.QtCore import QSettings, Qt, Signal, Slot
 from PySide6.QtWidgets import QSplitter, QWidget
 
 from ...database.db_manager import ImageDatabaseManager
+from ...database.image_id_selection import ImageIdSelection
 from ...services.model_selection_service import ModelSelectionService
 from ...services.refinement_service import RefinementService
 from ...services.service_container import ServiceContainer
 from ...utils.log import logger
 from ..designer.SearchTab_ui import Ui_SearchTab
 from ..message_box import show_critical
-from ..services.image_db_write_service import ImageDBWriteService
+from ..services.image_db_write_service import ImageDBWriteService, ManualEditFlushResult
 from ..services.search_filter_service import SearchFilterService
 from ..services.worker_service import WorkerService
+from ..services.write_behind_queue import WriteBehindQueue
 from ..state.dataset_state import DatasetStateManager
 from ..state.staging_state import StagingStateManager
 from ..widgets.filter_search_panel import FilterSearchPanel
@@ -106,6 +109,8 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
 
         # rating/score 書込サービス (詳細パネル編集に使う)。_setup_image_db_write_service で生成。
         self._image_db_write_service: ImageDBWriteService | None = None
+        # 単一画像の rating/score 編集とクイックタグの write-behind キュー (同上で生成)
+        self._write_queue: WriteBehindQueue | None = None
         # パネルトグル時の splitter サイズ退避領域 (#865 とは別の表示/非表示制御)
         self._main_splitter_sizes_before_filter_hide: list[int] | None = None
         self._main_splitter_sizes_before_preview_hide: list[int] | None = None
@@ -139,6 +144,13 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
         """サムネ/プレビュー/詳細/splitter の状態管理接続と初期サイズを設定する。"""
         dsm = self._dataset_state_manager
 
+        # サムネイルセレクタ: 表示方式 (paged | virtual) を設定から選択
+        if (
+            self._service_container.config_service.get_setting("gui", "thumbnail_grid", "paged")
+            == "virtual"
+        ):
+            self._thumbnail_selector.enable_virtual_grid()
+
         # サムネイルセレクタ: 選択 SSoT を注入
         if dsm is not None:
             self._thumbnail_selector.set_dataset_state(dsm)
@@ -243,8 +255,10 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
         )
 
     def _setup_image_db_write_service(self) -> None:
-        """ImageDBWriteService を生成し、詳細パネルの編集シグナルを接続する。
+        """ImageDBWriteService と write-behind キューを生成し、詳細パネルの編集シグナルを接続する。
 
+        単一画像の rating/score 編集とクイックタグはキューに積み、まとめて非同期に書き込む。
+        検索の直前にはキューを書き切り、検索結果に未反映の編集が漏れないようにする。
         SelectedImageDetailsWidget が編集シグナル (rating_updated / score_updated /
         save_requested) を持たない (閲覧専用) 構成では接続をスキップする。
         """
@@ -253,6 +267,9 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
             return
 
         self._image_db_write_service = ImageDBWriteService(self._db_manager)
+        self._write_queue = WriteBehindQueue(self._image_db_write_service, parent=self)
+        self._write_queue.flushed.connect(self._on_edits_flushed)
+        self._filter_search_panel.set_pre_search_hook(self.flush_pending_edits)
         widget = self._selected_image_details_widget
         if (
             hasattr(widget, "rating_updated")
@@ -297,8 +314,8 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
     def _handle_quick_tag_add(self, image_ids: list[int], tag: str) -> None:
         """クイックタグダイアログからのタグ追加要求を処理する。
 
-        書込は rating/score 編集と同じ ``ImageDBWriteService`` を再利用し、成功時は
-        ``dataset_state_manager`` のキャッシュを更新する (#896, 書込共有口=案A)。
+        書込は rating/score 編集と同じ write-behind キューに積む (#896, 書込共有口=案A)。
+        書込結果 (キャッシュ更新・完了通知・失敗ダイアログ) は ``_on_edits_flushed`` が扱う。
 
         Args:
             image_ids: 対象画像の ID リスト。
@@ -306,18 +323,13 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
         """
         logger.info(f"Quick tag add: tag='{tag}' for {len(image_ids)} images")
 
-        if self._image_db_write_service is None:
+        if self._write_queue is None:
             logger.warning("ImageDBWriteService not initialized")
-            success = False
+            accepted = False
         else:
-            success = self._image_db_write_service.add_tag_batch(image_ids, tag)
-            if success and self._dataset_state_manager is not None:
-                self._dataset_state_manager.refresh_images(image_ids)
+            accepted = self._write_queue.enqueue_tag(image_ids, tag)
 
-        if success:
-            self.status_message.emit(f"クイックタグ '{tag}' を追加しました")
-            logger.info(f"Quick tag add completed: tag='{tag}', {len(image_ids)} images updated")
-        else:
+        if not accepted:
             show_critical(self, "タグ追加失敗", f"クイックタグ '{tag}' の追加に失敗しました。")
             logger.error(f"Failed quick tag add: tag='{tag}', image_count={len(image_ids)}")
 
@@ -357,9 +369,9 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
 
     @Slot()
     def _on_stage_to_annotation_clicked(self) -> None:
-        """「選択をステージングへ」 → 現在選択中の画像 ID を載せて上方 emit する。"""
+        """「選択をステージングへ」 → 現在選択中の画像 ID (表示順) を載せて上方 emit する。"""
         image_ids = (
-            list(self._dataset_state_manager.selected_image_ids)
+            self._dataset_state_manager.selected_image_ids_in_display_order()
             if self._dataset_state_manager is not None
             else []
         )
@@ -536,29 +548,82 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
 
     # -- rating/score 編集ハンドラ -------------------------------------------
 
-    def _on_rating_update_requested(self, image_id: int, rating: str) -> None:
-        """詳細パネルの Rating 更新シグナルハンドラ (ImageDBWriteService 経由)。"""
-        if self._image_db_write_service is None:
+    def flush_pending_edits(self) -> bool:
+        """write-behind キューの未書込編集を同期的に書き切る (検索・一括編集の前に呼ぶ)。
+
+        Returns:
+            未書込の編集が残っていなければ True。書き込み中のバッチが終わらず
+            書き切れなかった場合は False (編集はキューに残り、完了後に書き込まれる)。
+        """
+        if self._write_queue is None:
+            return True
+        self._write_queue.flush_now()
+        return not self._write_queue.is_flushing and not self._write_queue.pending_count
+
+    def shutdown(self) -> None:
+        """タブ破棄前の後始末。未書込の編集を失わないよう書き切る。"""
+        if self._write_queue is not None:
+            self._write_queue.shutdown()
+
+    def _on_edits_flushed(self, result: ManualEditFlushResult) -> None:
+        """write-behind キューの書込結果をキャッシュと UI に反映する。"""
+        if result.written_image_ids and self._dataset_state_manager is not None:
+            self._dataset_state_manager.refresh_images(result.written_image_ids)
+        for tag in result.added_tags:
+            self.status_message.emit(f"クイックタグ '{tag}' を追加しました")
+        if result.missing_image_ids:
+            self.status_message.emit(
+                f"編集を保存できませんでした: 削除済みの画像 {len(result.missing_image_ids)} 件"
+            )
+        if result.failed_image_ids:
+            logger.error(f"Rating/Score の保存に失敗: image_ids={result.failed_image_ids}")
+            show_critical(
+                self,
+                "保存失敗",
+                f"{len(result.failed_image_ids)} 件の画像の Rating/Score を保存できませんでした。",
+            )
+        if result.failed_tags:
+            logger.error(f"Failed quick tag add: tags={result.failed_tags}")
+            show_critical(
+                self,
+                "タグ追加失敗",
+                f"クイックタグ '{', '.join(result.failed_tags)}' の追加に失敗しました。",
+            )
+
+    def _enqueue_rating(self, image_id: int, rating: str) -> None:
+        if self._write_queue is None:
             logger.warning("ImageDBWriteService未初期化")
             return
-        if self._image_db_write_service.update_rating(image_id, rating):
-            logger.debug(f"Rating更新: image_id={image_id}, rating={rating}")
+        if self._write_queue.enqueue_rating(image_id, rating):
+            if self._dataset_state_manager is not None:
+                self._dataset_state_manager.apply_manual_edit(image_id, rating=rating)
+            logger.debug(f"Rating更新を予約: image_id={image_id}, rating={rating}")
         else:
             logger.error(f"Rating更新失敗: image_id={image_id}, rating={rating}")
 
-    def _on_score_update_requested(self, image_id: int, score: int) -> None:
-        """詳細パネルの Score 更新シグナルハンドラ (ImageDBWriteService 経由)。"""
-        if self._image_db_write_service is None:
+    def _enqueue_score(self, image_id: int, score: int) -> None:
+        if self._write_queue is None:
             logger.warning("ImageDBWriteService未初期化")
             return
-        if self._image_db_write_service.update_score(image_id, score):
-            logger.debug(f"Score更新: image_id={image_id}, score={score}")
+        if self._write_queue.enqueue_score(image_id, score):
+            if self._dataset_state_manager is not None:
+                # UI 値 (0-1000) → DB 値 (0-10)
+                self._dataset_state_manager.apply_manual_edit(image_id, score=score / 100.0)
+            logger.debug(f"Score更新を予約: image_id={image_id}, score={score}")
         else:
             logger.error(f"Score更新失敗: image_id={image_id}, score={score}")
 
+    def _on_rating_update_requested(self, image_id: int, rating: str) -> None:
+        """詳細パネルの Rating 更新シグナルハンドラ (write-behind キュー経由)。"""
+        self._enqueue_rating(image_id, rating)
+
+    def _on_score_update_requested(self, image_id: int, score: int) -> None:
+        """詳細パネルの Score 更新シグナルハンドラ (write-behind キュー経由)。"""
+        self._enqueue_score(image_id, score)
+
     def _on_save_requested(self, save_data: dict[str, Any]) -> None:
-        """詳細パネルの保存要求 (rating + score の一括書込) を処理する。"""
-        if self._image_db_write_service is None:
+        """詳細パネルの保存要求 (rating + score) をキューに積む。"""
+        if self._write_queue is None:
             logger.warning("ImageDBWriteService未初期化")
             return
         image_id = save_data.get("image_id")
@@ -568,64 +633,61 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
         rating = save_data.get("rating")
         score = save_data.get("score")
         if rating:
-            self._image_db_write_service.update_rating(image_id, rating)
+            self._enqueue_rating(image_id, rating)
         if score is not None:
-            self._image_db_write_service.update_score(image_id, score)
-        logger.debug(f"保存完了: image_id={image_id}, rating={rating}, score={score}")
+            self._enqueue_score(image_id, score)
 
     def _handle_rating_changed(self, image_id: int, rating: str) -> None:
-        """単一 Rating 変更を書き込み、成功時にキャッシュを更新する。"""
-        if self._image_db_write_service is None:
-            logger.warning("ImageDBWriteService未初期化")
-            return
-        if self._image_db_write_service.update_rating(image_id, rating):
-            if self._dataset_state_manager is not None:
-                self._dataset_state_manager.refresh_image(image_id)
-            logger.debug(f"Rating更新成功: image_id={image_id}, rating={rating}")
-        else:
-            logger.error(f"Rating更新失敗: image_id={image_id}, rating={rating}")
+        """単一 Rating 変更をキューに積み、キャッシュへ先に反映する。"""
+        self._enqueue_rating(image_id, rating)
 
     def _handle_score_changed(self, image_id: int, score: int) -> None:
-        """単一 Score 変更を書き込み、成功時にキャッシュを更新する。"""
-        if self._image_db_write_service is None:
-            logger.warning("ImageDBWriteService未初期化")
-            return
-        if self._image_db_write_service.update_score(image_id, score):
-            if self._dataset_state_manager is not None:
-                self._dataset_state_manager.refresh_image(image_id)
-            logger.debug(f"Score更新成功: image_id={image_id}, score={score}")
-        else:
-            logger.error(f"Score更新失敗: image_id={image_id}, score={score}")
+        """単一 Score 変更をキューに積み、キャッシュへ先に反映する。"""
+        self._enqueue_score(image_id, score)
 
     def _handle_batch_rating_changed(self, image_ids: list[int], rating: str) -> None:
-        """複数選択への Rating バッチ変更を書き込み、成功時にキャッシュを一括更新する。"""
+        """複数選択への Rating バッチ変更を書き込み、成功時にキャッシュを一括更新する。
+
+        先に積まれた単一画像の編集が後から上書きしないよう、キューを書き切ってから書き込む。
+        """
         logger.info(f"バッチRating変更: {len(image_ids)}件, rating='{rating}'")
         if self._image_db_write_service is None:
             logger.warning("ImageDBWriteService未初期化")
             return
-        if self._image_db_write_service.update_rating_batch(image_ids, rating):
+        if not self.flush_pending_edits():
+            self.status_message.emit("未保存の編集を書き込み中です。しばらくしてから再実行してください")
+            return
+        # 連続 ID を BETWEEN にまとめさせるため ImageIdSelection で渡す
+        if self._image_db_write_service.update_rating_batch(ImageIdSelection(image_ids), rating):
             if self._dataset_state_manager is not None:
                 self._dataset_state_manager.refresh_images(image_ids)
             logger.info("バッチRating更新完了")
 
     def _handle_batch_score_changed(self, image_ids: list[int], score: int) -> None:
-        """複数選択への Score バッチ変更を書き込み、成功時にキャッシュを一括更新する。"""
+        """複数選択への Score バッチ変更を書き込み、成功時にキャッシュを一括更新する。
+
+        先に積まれた単一画像の編集が後から上書きしないよう、キューを書き切ってから書き込む。
+        """
         logger.info(f"バッチScore変更: {len(image_ids)}件, score={score}")
         if self._image_db_write_service is None:
             logger.warning("ImageDBWriteService未初期化")
             return
-        if self._image_db_write_service.update_score_batch(image_ids, score):
+        if not self.flush_pending_edits():
+            self.status_message.emit("未保存の編集を書き込み中です。しばらくしてから再実行してください")
+            return
+        # 連続 ID を BETWEEN にまとめさせるため ImageIdSelection で渡す
+        if self._image_db_write_service.update_score_batch(ImageIdSelection(image_ids), score):
             if self._dataset_state_manager is not None:
                 self._dataset_state_manager.refresh_images(image_ids)
             logger.info("バッチScore更新完了")
 
-    def _handle_selection_changed_for_rating(self, image_ids: list[int]) -> None:
+    def _handle_selection_changed_for_rating(self, image_ids: Sequence[int]) -> None:
         """選択変更に応じて詳細パネルの rating/score 表示を更新する。
 
         0 件: 表示クリア / 1 件: 単一表示 / 2 件以上: バッチ表示。
 
         Args:
-            image_ids: 選択画像 ID リスト。
+            image_ids: 選択画像 ID (ImageIdSelection)。
         """
         widget = self._selected_image_details_widget
         if not hasattr(widget, "_rating_score_widget"):
@@ -678,5 +740,13 @@ class SearchTabWidget(QWidget, Ui_SearchTab):
                     logger.debug(f"単一選択: rating widget更新 image_id={image_ids[0]}")
         else:
             if self._db_manager is not None:
-                rating_widget.populate_from_selection(image_ids, self._db_manager)
+                if self._dataset_state_manager is not None:
+                    # 共有アノテーションスナップショットから一括取得し、画像ごとの DB 照会を避ける
+                    rating_widget.populate_from_selection(
+                        image_ids,
+                        self._db_manager,
+                        metadata_by_id=self._dataset_state_manager.get_annotations(image_ids),
+                    )
+                else:
+                    rating_widget.populate_from_selection(image_ids, self._db_manager)
                 logger.debug(f"バッチモード: {len(image_ids)}件")
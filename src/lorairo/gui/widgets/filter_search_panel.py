@@ -206,6 +206,8 @@ class FilterSearchPanel(QScrollArea):
         # === 依存注入される Service ===
         self.search_filter_service: SearchFilterService | None = None
         self.worker_service: WorkerService | None = None
+        # 検索直前に呼ぶフック (SearchTab の write-behind キューのフラッシュ等)
+        self._pre_search_hook: Callable[[], object] | None = None
 
         # === Sub-component の生成 (ADR 0036 §2) ===
         self._pipeline = PipelineStateMachine()
@@ -510,6 +512,14 @@ class FilterSearchPanel(QScrollArea):
 
         logger.debug("WorkerService set for FilterSearchPanel")
 
+    def set_pre_search_hook(self, hook: "Callable[[], object] | None") -> None:
+        """検索実行の直前に呼ぶフックを設定する。
+
+        未書込の編集 (write-behind キュー) を検索より先に DB へ反映するために使う。
+        フックの戻り値は使わない。
+        """
+        self._pre_search_hook = hook
+
     def set_favorite_filters_service(self, service: Any) -> None:
         """FavoriteFiltersService を設定する (旧 API 互換)。"""
         self._favorite_filter.set_favorite_filters_service(service)
@@ -960,6 +970,9 @@ class FilterSearchPanel(QScrollArea):
             logger.error("SearchFilterService not set: search aborted")
             return
 
+        if self._pre_search_hook is not None:
+            self._pre_search_hook()
+
         if not self.worker_service:
             logger.warning("WorkerService not set, falling back to synchronous search")
             self._execute_synchronous_search()
@@ -14,7 +14,7 @@ from lorairo.gui.widgets.ds_card import DsCard
 from lorairo.gui.widgets.ds_summary_stat import DsSummaryStat
 from lorairo.gui.widgets.tag_cloud_widget import FlowLayout
 from lorairo.services.cost_estimation_service import (
-    CostEstimationService,
+    create_cost_estimation_service,
     format_duration,
 )
 from lorairo.services.pipeline_composition import InferenceLedger, LedgerEntry
@@ -80,7 +80,7 @@ class InferenceLedgerWidget(DsCard):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(title=_TITLE_TEXT, parent=parent)
 
-        self._cost_service = CostEstimationService()
+        self._cost_service = create_cost_estimation_service()
 
         # card 本体エリア
         body = QWidget(self)
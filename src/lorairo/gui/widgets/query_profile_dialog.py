@@ -0,0 +1,186 @@
+"""DB クエリプロファイル診断ダイアログ
+
+:mod:`lorairo.database.query_profiler` の計測を GUI から有効化し、正規化 SQL x
+Repository メソッドごとのレイテンシ、``EXPLAIN QUERY PLAN`` と全件走査を表示する。
+GUI での実際の検索操作を計測し、遅いフィルタの組合せとインデックス不足を調べる用途。
+"""
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QHideEvent, QShowEvent
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QDialogButtonBox,
+    QDoubleSpinBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+
+from lorairo.database.query_profiler import QueryProfiler, QueryStat, get_query_profiler
+
+_COLUMNS = ("呼び出し元", "回数", "平均 (ms)", "p95 (ms)", "最大 (ms)", "遅延", "全件走査", "SQL")
+_SQL_COLUMN = len(_COLUMNS) - 1
+# 計測中の自動更新間隔
+_REFRESH_INTERVAL_MS = 2000
+
+
+class QueryProfileDialog(QDialog):
+    """DB クエリプロファイル診断ダイアログ
+
+    計測の有効/無効・EXPLAIN しきい値の切替と、合計時間の長い順のステートメント一覧を
+    表示する。行を選択すると SQL とクエリプランを下段に表示する。
+    """
+
+    def __init__(self, profiler: QueryProfiler | None = None, parent: QWidget | None = None) -> None:
+        """QueryProfileDialog初期化
+
+        Args:
+            profiler: 表示対象のプロファイラ。省略時はプロセス共通のもの。
+            parent: 親ウィジェット。
+        """
+        super().__init__(parent)
+        self._profiler = profiler or get_query_profiler()
+        self._stats: list[QueryStat] = []
+        self._setup_ui()
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(_REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def _setup_ui(self) -> None:
+        """UI構築"""
+        self.setWindowTitle("DBクエリプロファイル")
+        self.resize(1000, 640)
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        self.enable_checkbox = QCheckBox("計測を有効化")
+        self.enable_checkbox.setChecked(self._profiler.enabled)
+        self.enable_checkbox.toggled.connect(self._on_enable_toggled)
+        controls.addWidget(self.enable_checkbox)
+
+        controls.addWidget(QLabel("EXPLAIN しきい値:"))
+        self.slow_ms_spin = QDoubleSpinBox()
+        self.slow_ms_spin.setRange(0.0, 60000.0)
+        self.slow_ms_spin.setDecimals(1)
+        self.slow_ms_spin.setSuffix(" ms")
+        self.slow_ms_spin.setValue(self._profiler.slow_ms)
+        self.slow_ms_spin.valueChanged.connect(self._on_slow_ms_changed)
+        controls.addWidget(self.slow_ms_spin)
+        controls.addStretch()
+
+        self.refresh_button = QPushButton("更新")
+        self.refresh_button.clicked.connect(self.refresh)
+        controls.addWidget(self.refresh_button)
+        self.reset_button = QPushButton("リセット")
+        self.reset_button.clicked.connect(self._on_reset_clicked)
+        controls.addWidget(self.reset_button)
+        layout.addLayout(controls)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        self.table = QTableWidget(0, len(_COLUMNS))
+        self.table.setHorizontalHeaderLabels(list(_COLUMNS))
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(_SQL_COLUMN, QHeaderView.ResizeMode.Stretch)
+        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        splitter.addWidget(self.table)
+
+        self.detail_view = QTextEdit()
+        self.detail_view.setReadOnly(True)
+        self.detail_view.setPlaceholderText("行を選択すると SQL とクエリプランを表示します")
+        splitter.addWidget(self.detail_view)
+        splitter.setSizes([420, 180])
+        layout.addWidget(splitter)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    # === Public API ===
+
+    def refresh(self) -> None:
+        """プロファイラの集計を読み直して表示を更新する。"""
+        self._stats = self._profiler.snapshot()
+        self.table.setRowCount(len(self._stats))
+        for row, stat in enumerate(self._stats):
+            values = (
+                stat.caller,
+                str(stat.count),
+                f"{stat.mean_ms:.2f}",
+                f"{stat.percentile_ms(0.95):.2f}",
+                f"{stat.max_ms:.2f}",
+                str(stat.slow_count),
+                ", ".join(stat.full_scans),
+                stat.sql,
+            )
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if 0 < column < 6:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+        full_scans = sorted({table for stat in self._stats for table in stat.full_scans})
+        state = "計測中" if self._profiler.enabled else "停止中"
+        self.status_label.setText(
+            f"{state} / ステートメント {len(self._stats)} 件 / "
+            f"全件走査: {', '.join(full_scans) if full_scans else 'なし'}"
+        )
+
+    # === Internal ===
+
+    def _sync_refresh_timer(self) -> None:
+        if self._profiler.enabled:
+            self._refresh_timer.start()
+        else:
+            self._refresh_timer.stop()
+
+    def _on_enable_toggled(self, checked: bool) -> None:
+        if checked:
+            self._profiler.enable(slow_ms=self.slow_ms_spin.value())
+        else:
+            self._profiler.disable()
+        self._sync_refresh_timer()
+        self.refresh()
+
+    def _on_slow_ms_changed(self, value: float) -> None:
+        self._profiler.slow_ms = value
+
+    def _on_reset_clicked(self) -> None:
+        self._profiler.reset()
+        self.detail_view.clear()
+        self.refresh()
+
+    def _on_selection_changed(self) -> None:
+        rows = {index.row() for index in self.table.selectedIndexes()}
+        if len(rows) != 1 or next(iter(rows)) >= len(self._stats):
+            self.detail_view.clear()
+            return
+        stat = self._stats[next(iter(rows))]
+        plan = "\n".join(stat.plan) if stat.plan else "(未取得: しきい値未満、または SELECT 以外)"
+        self.detail_view.setPlainText(f"{stat.caller}\n\n{stat.sql}\n\n-- EXPLAIN QUERY PLAN --\n{plan}")
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """再表示時に最新の集計を読み直し、自動更新を再開する。"""
+        super().showEvent(event)
+        self.enable_checkbox.setChecked(self._profiler.enabled)
+        self._sync_refresh_timer()
+        self.refresh()
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """非表示の間は自動更新を止める (計測自体は継続する)。"""
+        self._refresh_timer.stop()
+        super().hideEvent(event)
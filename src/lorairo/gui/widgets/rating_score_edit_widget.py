@@ -21,6 +21,7 @@ MainWindow右パネルのタブとして配置され、単一画像の評価編
 - MainWindow が ImageDBWriteService 経由で保存処理を実行
 """
 
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar
 
 from PySide6.QtCore import Qt, Signal, Slot
@@ -579,7 +580,12 @@ class RatingScoreEditWidget(QWidget):
             f"DB score={score_db}, UI score={score_ui}"
         )
 
-    def populate_from_selection(self, image_ids: list[int], db_manager: Any) -> None:
+    def populate_from_selection(
+        self,
+        image_ids: Sequence[int],
+        db_manager: Any,
+        metadata_by_id: Mapping[int, dict[str, Any]] | None = None,
+    ) -> None:
         """
         複数選択時のフォームフィールドを入力（バッチモード）
 
@@ -588,6 +594,8 @@ class RatingScoreEditWidget(QWidget):
         Args:
             image_ids: 選択画像IDリスト
             db_manager: ImageDatabaseManager インスタンス（メタデータ取得用）
+            metadata_by_id: 取得済みのアノテーション辞書 (DatasetStateManager の
+                スナップショット由来)。含まれる画像は DB を照会しない。
 
         処理:
             1. 全画像のメタデータを取得
@@ -603,7 +611,7 @@ class RatingScoreEditWidget(QWidget):
             return
 
         self._is_batch_mode = True
-        self._selected_image_ids = image_ids.copy()
+        self._selected_image_ids = list(image_ids)
         self._current_image_id = None  # バッチモードでは単一IDなし
 
         # シグナルをブロックして UI を更新
@@ -615,7 +623,9 @@ class RatingScoreEditWidget(QWidget):
         scores: set[float] = set()
 
         for image_id in image_ids:
-            metadata = db_manager.image_repo.get_image_metadata(image_id)
+            metadata = metadata_by_id.get(image_id) if metadata_by_id is not None else None
+            if metadata is None:
+                metadata = db_manager.image_repo.get_image_metadata(image_id)
             if metadata:
                 rating = metadata.get("rating")
                 if rating:
@@ -52,7 +52,7 @@ from lorairo.gui import theme
 from lorairo.gui.widgets.ds_badge import DsBadge
 from lorairo.gui.widgets.ds_chip import DsChip
 from lorairo.services.cost_estimation_service import (
-    CostEstimationService,
+    create_cost_estimation_service,
     format_per_image_cost,
 )
 from lorairo.services.model_route_service import required_provider_for
@@ -99,8 +99,6 @@ _STAGE_TO_TYPE = {stage: token for token, stage in _TYPE_TO_STAGE.items()}
 
 _LOCAL_PROVIDER_LABEL = "local"
 
-_cost_service = CostEstimationService()
-
 
 def _provider_label(info: StageModelInfo) -> str:
     """フィルタ / 表示に使う provider ラベルを返す。ローカルは ``"local"``。"""
@@ -220,7 +218,9 @@ class _ModelRow(QFrame):
         right_layout.setContentsMargins(0, 0, 0, 0)
         right_layout.setSpacing(2)
         right_layout.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
-        cost_label = QLabel(format_per_image_cost(_cost_service.per_image_usd(info), info.is_api), self)
+        cost_label = QLabel(
+            format_per_image_cost(create_cost_estimation_service().per_image_usd(info), info.is_api), self
+        )
         cost_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         cost_label.setStyleSheet(
             f"font-family: {theme.FONT_MONO_CSS}; font-size: {theme.FONT_SIZE_SMALL}px;"
@@ -71,6 +71,16 @@ def _format_time(value: datetime | None) -> str:
     return value.strftime("%H:%M:%S")
 
 
+def _format_telemetry_tooltip(entry: JobEntry) -> str:
+    """ステージ別計測をツールチップ用テキストに整形する。"""
+    if entry.telemetry is None:
+        return ""
+    lines = ["ステージ別計測", *entry.telemetry.format_lines()]
+    if entry.telemetry.profile:
+        lines.append("プロファイル: ログに出力済み")
+    return "\n".join(lines)
+
+
 class _SummaryStatCard(QFrame):
     """サマリ帯 1 マス (DS SummaryStat 文法、Issue #805)。
 
@@ -210,12 +220,19 @@ class SyncJobLedgerWidget(DsCard):
 
             # 種別 = TypeBadge 文法、状態 = status chip 文法 (DS v12)
             table.setCellWidget(row, 0, self._build_badge(entry.job_type))
-            table.setItem(row, 1, QTableWidgetItem(entry.title))
+            title_item = QTableWidgetItem(entry.title)
+            summary_item = self._build_summary_item(entry.summary, entry.status)
+            if entry.telemetry is not None:
+                # ステージ別の所要時間・スループットを行のツールチップで示す
+                tooltip = _format_telemetry_tooltip(entry)
+                title_item.setToolTip(tooltip)
+                summary_item.setToolTip(tooltip)
+            table.setItem(row, 1, title_item)
             status_label = _STATUS_LABELS.get(entry.status, entry.status.value)
             table.setCellWidget(row, 2, self._build_status_chip(status_label, entry.status))
             table.setItem(row, 3, QTableWidgetItem(_format_time(entry.started_at)))
             table.setItem(row, 4, QTableWidgetItem(_format_time(entry.finished_at)))
-            table.setItem(row, 5, self._build_summary_item(entry.summary, entry.status))
+            table.setItem(row, 5, summary_item)
 
             if not entry.status.is_terminal:
                 table.setCellWidget(row, len(_COLUMNS) - 1, self._build_cancel_button(entry.job_id))
@@ -0,0 +1,399 @@
+# src/lorairo/gui/widgets/thumbnail_grid_view.py
+"""
+仮想化サムネイルグリッド (QAbstractListModel + QStyledItemDelegate + QListView)。
+
+ページ毎に QGraphicsScene を作り直す従来表示と異なり、検索結果全件を 1 つのモデルの
+行として持ち、ビューが描画する (= 画面に見えている) セルだけを描く。サムネイルは
+描画時にキャッシュミスしたものだけをまとめて要求し、上限付き LRU に保持するため、
+結果件数に依らずメモリ使用量は一定で、ページ切替なしに連続スクロールできる。
+
+選択状態の SSoT は従来通り DatasetStateManager とし、デリゲートは描画時に参照する。
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QItemSelection,
+    QItemSelectionModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+from ...utils.log import logger
+from .. import theme
+from .thumbnail_item import ThumbnailItem
+
+if TYPE_CHECKING:
+    from ..state.dataset_state import DatasetStateManager
+
+# 画像IDを取り出すためのロール
+IMAGE_ID_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class ThumbnailListModel(QAbstractListModel):
+    """
+    検索結果全件の画像IDを行に持つサムネイルモデル。
+
+    ``DecorationRole`` の要求時にキャッシュに無い画像IDを要求キューへ積み、
+    イベントループ 1 周分をまとめて ``thumbnails_requested`` で通知する。
+    読み込み結果は ``set_thumbnails`` で受け取り、該当行だけ ``dataChanged`` を発行する。
+
+    Signals:
+        thumbnails_requested (list[int]): 読み込みが必要な画像IDのバッチ
+    """
+
+    thumbnails_requested = Signal(list)
+
+    def __init__(
+        self,
+        cache_capacity: int = 2000,
+        fetch_batch_size: int = 100,
+        parent: QWidget | None = None,
+    ) -> None:
+        """
+        Args:
+            cache_capacity: 保持するサムネイル数の上限 (LRU)
+            fetch_batch_size: 1 回の要求に含める画像IDの上限
+            parent: 親オブジェクト
+        """
+        super().__init__(parent)
+        self._cache_capacity = max(cache_capacity, 1)
+        self._fetch_batch_size = max(fetch_batch_size, 1)
+        self._image_ids: list[int] = []
+        self._row_by_id: dict[int, int] = {}
+        self._pixmaps: OrderedDict[int, QPixmap] = OrderedDict()
+        # 要求済み (結果待ち) の画像ID。同じIDを描画の度に再要求しないために使う
+        self._requested: set[int] = set()
+        self._fetch_queue: list[int] = []
+        self._fetch_timer = QTimer(self)
+        self._fetch_timer.setSingleShot(True)
+        self._fetch_timer.setInterval(0)
+        self._fetch_timer.timeout.connect(self._flush_fetch_queue)
+
+    # === QAbstractListModel ===
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex | None = None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._image_ids)
+
+    def data(
+        self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._image_ids):
+            return None
+        image_id = self._image_ids[index.row()]
+        if role == IMAGE_ID_ROLE:
+            return image_id
+        if role == Qt.ItemDataRole.DecorationRole:
+            pixmap = self._pixmaps.get(image_id)
+            if pixmap is None:
+                self._queue_fetch(image_id)
+                return None
+            self._pixmaps.move_to_end(image_id)
+            return pixmap
+        return None
+
+    # === 公開API ===
+
+    @property
+    def image_ids(self) -> list[int]:
+        """モデルが保持する画像ID (表示順)"""
+        return self._image_ids
+
+    def set_image_ids(self, image_ids: list[int]) -> None:
+        """表示対象の画像IDを差し替える (キャッシュと要求状態もリセット)。"""
+        self.beginResetModel()
+        self._image_ids = list(image_ids)
+        self._row_by_id = {image_id: row for row, image_id in enumerate(self._image_ids)}
+        self._pixmaps.clear()
+        self._requested.clear()
+        self._fetch_queue.clear()
+        self.endResetModel()
+        logger.debug(f"ThumbnailListModel: {len(self._image_ids)}件を設定")
+
+    def row_of(self, image_id: int) -> int | None:
+        """画像IDの行番号を返す (含まれない場合は None)。"""
+        return self._row_by_id.get(image_id)
+
+    def set_thumbnails(self, thumbnails: list[tuple[int, QPixmap]]) -> None:
+        """読み込み済みサムネイルを格納し、該当行を再描画させる。
+
+        Args:
+            thumbnails: (image_id, QPixmap) のリスト。モデルに無い画像IDは無視する
+        """
+        rows: list[int] = []
+        for image_id, pixmap in thumbnails:
+            self._requested.discard(image_id)
+            row = self._row_by_id.get(image_id)
+            if row is None:
+                continue
+            self._pixmaps[image_id] = pixmap
+            self._pixmaps.move_to_end(image_id)
+            rows.append(row)
+        self._evict_overflow()
+        if rows:
+            roles = [Qt.ItemDataRole.DecorationRole]
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), roles)
+
+    def discard_requests(self, image_ids: list[int]) -> None:
+        """結果が届かなくなった要求 (キャンセル等) を取り消し、再描画時に再要求できるようにする。"""
+        self._requested.difference_update(image_ids)
+
+    def clear_thumbnails(self) -> None:
+        """キャッシュ済みサムネイルを破棄する (サムネイルサイズ変更時など)。"""
+        self._pixmaps.clear()
+        self._requested.clear()
+        self._fetch_queue.clear()
+        if self._image_ids:
+            roles = [Qt.ItemDataRole.DecorationRole]
+            self.dataChanged.emit(self.index(0), self.index(len(self._image_ids) - 1), roles)
+
+    @property
+    def cached_count(self) -> int:
+        """キャッシュ中のサムネイル数"""
+        return len(self._pixmaps)
+
+    # === 内部処理 ===
+
+    def _queue_fetch(self, image_id: int) -> None:
+        if image_id in self._requested:
+            return
+        self._requested.add(image_id)
+        self._fetch_queue.append(image_id)
+        if not self._fetch_timer.isActive():
+            self._fetch_timer.start()
+
+    @Slot()
+    def _flush_fetch_queue(self) -> None:
+        """描画 1 周分の要求をバッチに分けて通知する。"""
+        queue, self._fetch_queue = self._fetch_queue, []
+        for start in range(0, len(queue), self._fetch_batch_size):
+            self.thumbnails_requested.emit(queue[start : start + self._fetch_batch_size])
+
+    def _evict_overflow(self) -> None:
+        while len(self._pixmaps) > self._cache_capacity:
+            self._pixmaps.popitem(last=False)
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """
+    サムネイルセルの描画デリゲート。
+
+    ワーカーが表示サイズへ縮小済みの pixmap をそのまま中央に描き、GUI スレッドでの
+    再スケールはセルより大きい場合 (サイズ縮小直後) に限る。未読み込みのセルは
+    プレースホルダを描く。バッジと選択枠は ThumbnailItem と同じ見た目にする。
+    """
+
+    def __init__(
+        self,
+        thumbnail_size: QSize,
+        dataset_state: DatasetStateManager | None = None,
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.thumbnail_size = QSize(thumbnail_size)
+        self.dataset_state = dataset_state
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
+        return QSize(self.thumbnail_size)
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> None:
+        cell = QRect(option.rect.topLeft(), self.thumbnail_size)
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+
+        painter.save()
+        if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+            if pixmap.width() > cell.width() or pixmap.height() > cell.height():
+                pixmap = pixmap.scaled(
+                    cell.size(),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.FastTransformation,
+                )
+            x = cell.x() + (cell.width() - pixmap.width()) // 2
+            y = cell.y() + (cell.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            painter.fillRect(cell.adjusted(1, 1, -1, -1), QColor(Qt.GlobalColor.lightGray))
+
+        image_id = index.data(IMAGE_ID_ROLE)
+        if self.dataset_state is not None and isinstance(image_id, int):
+            rect = QRectF(cell)
+            metadata = self.dataset_state.get_image_by_id(image_id)
+            if metadata:
+                score_text, rating_text, resolution_text = ThumbnailItem._overlay_texts(metadata)
+                if score_text is not None:
+                    ThumbnailItem._draw_badge(painter, rect, score_text, "top-right")
+                if rating_text is not None:
+                    ThumbnailItem._draw_badge(painter, rect, rating_text, "bottom-right")
+                if resolution_text is not None:
+                    ThumbnailItem._draw_badge(painter, rect, resolution_text, "bottom-left")
+            if self.dataset_state.is_image_selected(image_id):
+                painter.setPen(QPen(QColor(theme.ACCENT), 3))
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.drawRect(rect.adjusted(1, 1, -1, -1))
+        elif option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(QPen(QColor(theme.ACCENT), 3))
+            painter.drawRect(QRectF(cell).adjusted(1, 1, -1, -1))
+        painter.restore()
+
+
+class ThumbnailGridView(QListView):
+    """
+    仮想化サムネイルグリッドのビュー。
+
+    IconMode + 均一セルサイズで、Qt が見えている範囲のセルだけを配置・描画する。
+    ビューの選択操作 (クリック / Ctrl / Shift / ドラッグ) は DatasetStateManager へ反映し、
+    他のウィジェットからの選択変更はビューの選択モデルへ戻す。
+    """
+
+    def __init__(
+        self,
+        model: ThumbnailListModel,
+        thumbnail_size: QSize,
+        dataset_state: DatasetStateManager | None = None,
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.dataset_state: DatasetStateManager | None = None
+        self._syncing_selection = False
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setSpacing(0)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(500)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setSelectionRectVisible(True)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+
+        self.thumbnail_model = model
+        self.thumbnail_delegate = ThumbnailDelegate(thumbnail_size, parent=self)
+        self.setModel(model)
+        self.setItemDelegate(self.thumbnail_delegate)
+        self.set_thumbnail_size(thumbnail_size)
+        self.selectionModel().selectionChanged.connect(self._on_view_selection_changed)
+        model.modelReset.connect(self._sync_selection_from_state)
+        self.set_dataset_state(dataset_state)
+
+    def set_thumbnail_size(self, size: QSize) -> None:
+        """セルサイズを変更する。"""
+        self.thumbnail_delegate.thumbnail_size = QSize(size)
+        self.setGridSize(size)
+        self.setIconSize(size)
+        self.scheduleDelayedItemsLayout()
+
+    def set_dataset_state(self, dataset_state: DatasetStateManager | None) -> None:
+        """選択状態の同期先を設定する。"""
+        if self.dataset_state is not None:
+            self.dataset_state.selection_changed.disconnect(self._on_state_selection_changed)
+        self.dataset_state = dataset_state
+        self.thumbnail_delegate.dataset_state = dataset_state
+        if dataset_state is not None:
+            dataset_state.selection_changed.connect(self._on_state_selection_changed)
+            self._sync_selection_from_state()
+
+    def visible_row_range(self) -> tuple[int, int] | None:
+        """ビューポートに見えている行の範囲 ``(先頭, 末尾)`` を返す。非表示・空なら None。
+
+        末尾は左下隅のセル (最下段の先頭) に 1 段分の列数を足して求める。左下隅に
+        セルが無ければ (内容がビューポートより短い場合) 最終行までを見えているものとする。
+        """
+        row_count = self.thumbnail_model.rowCount()
+        if row_count == 0 or not self.isVisible():
+            return None
+        rect = self.viewport().rect()
+        first = self.indexAt(rect.topLeft())
+        last_line = self.indexAt(rect.bottomLeft())
+        columns = max(1, rect.width() // max(1, self.gridSize().width()))
+        first_row = first.row() if first.isValid() else 0
+        last_row = (
+            min(last_line.row() + columns - 1, row_count - 1) if last_line.isValid() else row_count - 1
+        )
+        return first_row, last_row
+
+    def image_id_at(self, index: QModelIndex | QPersistentModelIndex) -> int | None:
+        """インデックスの画像IDを返す。"""
+        image_id = index.data(IMAGE_ID_ROLE) if index.isValid() else None
+        return image_id if isinstance(image_id, int) else None
+
+    @Slot(QItemSelection, QItemSelection)
+    def _on_view_selection_changed(self, _selected: QItemSelection, _deselected: QItemSelection) -> None:
+        """ビュー上の選択操作を DatasetStateManager へ反映する。"""
+        if self._syncing_selection or self.dataset_state is None:
+            return
+        selected_ids = [
+            image_id
+            for index in self.selectionModel().selectedIndexes()
+            if (image_id := self.image_id_at(index)) is not None
+        ]
+        self._syncing_selection = True
+        try:
+            self.dataset_state.set_selected_images(selected_ids)
+            current_id = self.image_id_at(self.currentIndex())
+            if len(selected_ids) == 1 and current_id == selected_ids[0]:
+                self.dataset_state.set_current_image(current_id)
+        finally:
+            self._syncing_selection = False
+
+    @Slot(object)
+    def _on_state_selection_changed(self, _selected_image_ids: Sequence[int]) -> None:
+        if not self._syncing_selection:
+            self._sync_selection_from_state()
+        self.viewport().update()
+
+    @Slot()
+    def _sync_selection_from_state(self) -> None:
+        """DatasetStateManager の選択をビューの選択モデルへ反映する。"""
+        if self.dataset_state is None:
+            return
+        rows = sorted(
+            row
+            for image_id in self.dataset_state.selection
+            if (row := self.thumbnail_model.row_of(image_id)) is not None
+        )
+        # 連続する行は 1 つの範囲にまとめる (全選択でも範囲は 1 つで済む)
+        selection = QItemSelection()
+        run_start = 0
+        for position in range(1, len(rows) + 1):
+            if position == len(rows) or rows[position] != rows[position - 1] + 1:
+                selection.select(
+                    self.thumbnail_model.index(rows[run_start]),
+                    self.thumbnail_model.index(rows[position - 1]),
+                )
+                run_start = position
+        self._syncing_selection = True
+        try:
+            self.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect)
+        finally:
+            self._syncing_selection = False
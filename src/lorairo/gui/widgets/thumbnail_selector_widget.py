@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -29,6 +29,7 @@ from ..workers.terminal import CancelReason
 from ..workers.thumbnail_worker import ThumbnailLoadResult
 from .custom_graphics_view import CustomGraphicsView
 from .pagination_nav_widget import PaginationNavWidget
+from .thumbnail_grid_view import ThumbnailGridView, ThumbnailListModel
 from .thumbnail_item import ThumbnailItem
 
 if TYPE_CHECKING:
@@ -56,6 +57,11 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         thumbnail_items (list[ThumbnailItem]): 表示中のサムネイルアイテム
     """
 
+    # 仮想グリッドで同時に待つサムネイル要求の上限。超えた分は画面外になった要求を
+    # 古い順にキャンセルし、スクロール先の要求を優先する。見えている行を含む要求は
+    # キャンセルしない (1 回の描画で上限を超える数のバッチが要求されることがあるため)。
+    _VIRTUAL_MAX_PENDING_REQUESTS = 4
+
     # === Unified Modern Signals（統一snake_case命名規約） ===
     image_selected = Signal(Path)  # 単一画像選択時
     stage_selected_requested = Signal(list)  # バッチタグのステージング追加要求（visible image_ids）
@@ -117,6 +123,10 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         self._prefetch_queue: list[int] = []
         self._suspend_page_change: bool = False
 
+        # 仮想グリッド (enable_virtual_grid でオプトイン)。request_id → 要求した画像ID
+        self._virtual_grid: ThumbnailGridView | None = None
+        self._virtual_request_ids: dict[str, list[int]] = {}
+
         # 表示中アイテム状態
         self.thumbnail_items: list[ThumbnailItem] = []  # ThumbnailItem のリスト
         self._explicit_path_items: list[tuple[Path, int]] = []  # stagingなど小規模明示パス表示用
@@ -232,6 +242,10 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         self.dataset_state.update_from_search_results(search_result.image_metadata)
         self._suspend_page_change = False
 
+        if self._virtual_grid is not None:
+            self._display_virtual_grid()
+            return
+
         if self.pagination_nav:
             self.pagination_nav.setVisible(True)
             self.pagination_nav.update_state(
@@ -252,6 +266,10 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         page_num = getattr(thumbnail_result, "page_num", None)
         request_id = getattr(thumbnail_result, "request_id", None)
 
+        if request_id is not None and request_id in self._virtual_request_ids:
+            self._handle_virtual_thumbnail_result(request_id, thumbnail_result)
+            return
+
         # ページ識別のない結果 (旧経路) は削除済み。識別子欠落または未知の
         # request_id は stale として破棄する。
         if page_num is None or request_id is None or request_id not in self._request_id_to_page:
@@ -504,24 +522,31 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
             if pixmap is None:
                 pixmap = QPixmap(self.thumbnail_size)
                 pixmap.fill(Qt.GlobalColor.lightGray)
-
-            scaled_pixmap = pixmap.scaled(
-                self.thumbnail_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
+            elif (
+                pixmap.rect().width() > self.thumbnail_size.width()
+                or pixmap.rect().height() > self.thumbnail_size.height()
+            ):
+                # ワーカーが縮小済みの pixmap は再スケールしない (サイズを縮めた直後のみ縮小)
+                pixmap = pixmap.scaled(
+                    self.thumbnail_size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
             self._add_thumbnail_item_from_cache(
                 image_path=image_path,
                 image_id=image_id,
                 index=index,
                 column_count=column_count,
-                pixmap=scaled_pixmap,
+                pixmap=pixmap,
             )
 
         row_count = (len(page_image_ids) + column_count - 1) // column_count
         self.scene.setSceneRect(0, 0, grid_width, row_count * self.thumbnail_size.height())
         self._update_image_count_display()
         self.graphics_view.viewport().update()
+        if self.dataset_state and page_image_ids:
+            # ページ内アノテーションをワーカーで一括先読みし、以降の選択移動を DB 往復なしにする
+            self.dataset_state.prefetch_annotations_async(page_image_ids)
         if self.pagination_nav and self.pagination_state:
             self.pagination_nav.update_state(
                 current=page,
@@ -554,7 +579,9 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         self._update_image_count_display()
 
         # 検索結果はページキャッシュから再表示する。staging等の明示パス表示は小規模用途として再構築する。
-        if self.pagination_state and self.page_cache.has_page(self._current_display_page):
+        if self._is_virtual_grid_active():
+            self._apply_virtual_grid_size()
+        elif self.pagination_state and self.page_cache.has_page(self._current_display_page):
             self._display_page(self._current_display_page)
         elif self._explicit_path_items:
             self._display_explicit_path_items()
@@ -566,20 +593,37 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         現在読み込まれている画像数をヘッダーに表示する。
         """
         if hasattr(self, "labelThumbnailCount"):
-            count = len(self.thumbnail_items)
+            count = len(self._visible_image_ids())
             self.labelThumbnailCount.setText(f"画像: {count}件")
 
     def _on_context_menu_requested(self, pos: QPoint) -> None:
         """サムネイル一覧の右クリックメニューを表示"""
         # 右クリックしたアイテムが未選択なら単一選択に切替
         item = self.graphics_view.itemAt(pos)
-        if isinstance(item, ThumbnailItem) and self.dataset_state:
-            if not self.dataset_state.is_image_selected(item.image_id):
-                self.dataset_state.set_selected_images([item.image_id])
-                self.dataset_state.set_current_image(item.image_id)
+        if isinstance(item, ThumbnailItem):
+            self._select_clicked_if_unselected(item.image_id)
+        self._exec_context_menu(self.graphics_view.mapToGlobal(pos))
 
+    def _on_virtual_context_menu_requested(self, pos: QPoint) -> None:
+        """仮想グリッドの右クリックメニューを表示"""
+        if self._virtual_grid is None:
+            return
+        image_id = self._virtual_grid.image_id_at(self._virtual_grid.indexAt(pos))
+        if image_id is not None:
+            self._select_clicked_if_unselected(image_id)
+        self._exec_context_menu(self._virtual_grid.viewport().mapToGlobal(pos))
+
+    def _select_clicked_if_unselected(self, image_id: int) -> None:
+        """右クリックされた未選択アイテムを単一選択にする。"""
+        if self.dataset_state and not self.dataset_state.is_image_selected(image_id):
+            self.dataset_state.set_selected_images([image_id])
+            self.dataset_state.set_current_image(image_id)
+
+    def _exec_context_menu(self, global_pos: QPoint) -> None:
+        """選択状態に応じた右クリックメニューを表示して選択されたアクションを実行する。"""
         selected_ids = self.dataset_state.selected_image_ids if self.dataset_state else []
-        visible_ids = {thumb.image_id for thumb in self.thumbnail_items}
+        visible_id_list = self._visible_image_ids()
+        visible_ids = set(visible_id_list)
         visible_selected_ids = [id_ for id_ in selected_ids if id_ in visible_ids]
 
         menu = QMenu(self)
@@ -596,13 +640,13 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
 
         # すべて選択
         action_select_all = menu.addAction("すべて選択")
-        action_select_all.setEnabled(bool(self.thumbnail_items))
+        action_select_all.setEnabled(bool(visible_id_list))
 
         # 選択解除
         action_deselect = menu.addAction("選択解除")
         action_deselect.setEnabled(bool(selected_ids))
 
-        action = menu.exec(self.graphics_view.mapToGlobal(pos))
+        action = menu.exec(global_pos)
         if action == action_stage:
             self.stage_selected_requested.emit(visible_selected_ids)
         elif action == action_quick_tag:
@@ -614,10 +658,10 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
 
     def _select_all_items(self) -> None:
         """すべてのサムネイルアイテムを選択する。"""
-        if not self.dataset_state or not self.thumbnail_items:
+        all_image_ids = self._visible_image_ids()
+        if not self.dataset_state or not all_image_ids:
             return
 
-        all_image_ids = [item.image_id for item in self.thumbnail_items]
         self.dataset_state.set_selected_images(all_image_ids)
         logger.debug(f"Selected all {len(all_image_ids)} items")
 
@@ -638,6 +682,7 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         """
         self.page_cache.clear()
         self._cancel_pending_thumbnail_requests()
+        self._cancel_virtual_requests()
         self._prefetch_queue.clear()
         self._prefetch_request_ids.clear()
         self._request_id_to_page.clear()
@@ -738,6 +783,8 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         self.dataset_state = dataset_state
         self._connect_dataset_state()
         self._ensure_pagination_state()
+        if self._virtual_grid is not None:
+            self._virtual_grid.set_dataset_state(dataset_state)
 
         # scene.selectionChanged は多重接続を避けて再接続
         self._disconnect_selection_sync()
@@ -789,13 +836,13 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
 
     # === State Manager Integration ===
 
-    @Slot(list)
-    def _on_images_filtered(self, image_metadata: list[dict[str, Any]]) -> None:
+    @Slot(object)
+    def _on_images_filtered(self, image_metadata: Sequence[dict[str, Any]]) -> None:
         """DatasetStateManagerの画像更新通知を受ける。表示更新はページネーション経路で行う。"""
         logger.debug(f"DatasetStateManager images_filtered received: {len(image_metadata)} images")
 
-    @Slot(list)
-    def _on_state_selection_changed(self, selected_image_ids: list[int]) -> None:
+    @Slot(object)
+    def _on_state_selection_changed(self, selected_image_ids: Sequence[int]) -> None:
         """状態管理からの選択変更通知 - UI更新トリガー"""
         # 選択状態は動的取得されるため、再描画のみトリガー
         for item in self.thumbnail_items:
@@ -829,11 +876,9 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         drag_modifiers = self.graphics_view._drag_modifiers
 
         if drag_modifiers & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier):
-            # Ctrl/Shift+ドラッグ: 既存選択を維持して追加（重複排除、順序維持）
-            current_ids = self.dataset_state.selected_image_ids
-            merged = list(dict.fromkeys(current_ids + selected_image_ids))
+            # Ctrl/Shift+ドラッグ: 既存選択を維持して追加（和集合）
             self.dataset_state.blockSignals(True)
-            self.dataset_state.set_selected_images(merged)
+            self.dataset_state.add_images_to_selection(selected_image_ids)
             self.dataset_state.blockSignals(False)
         else:
             # 通常ドラッグ: 選択を置換
@@ -841,9 +886,7 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
             self.dataset_state.set_selected_images(selected_image_ids)
             self.dataset_state.blockSignals(False)
 
-        logger.debug(
-            f"Selection synced to state: {len(self.dataset_state.selected_image_ids)} images selected"
-        )
+        logger.debug(f"Selection synced to state: {len(self.dataset_state.selection)} images selected")
 
     @Slot(int)
     def _on_state_current_image_changed(self, current_image_id: int) -> None:
@@ -956,6 +999,7 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         self._active_search_result = None
         if self.pagination_nav:
             self.pagination_nav.setVisible(False)
+        self._set_virtual_grid_visible(False)
 
         for path_str, image_id in items:
             path = Path(path_str) if path_str else Path()
@@ -985,6 +1029,8 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         self.thumbnail_items.clear()
         self._explicit_path_items.clear()
         self._current_display_page = 1
+        if self._virtual_grid is not None:
+            self._virtual_grid.thumbnail_model.set_image_ids([])
 
         # 新しいキャッシュもクリア（メモリ効率化）
         self.clear_cache()
@@ -1082,10 +1128,8 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         ]
 
         if add_to_existing:
-            # 既存選択を維持して範囲を追加（重複排除、順序維持）
-            current_ids = list(self.dataset_state.selected_image_ids)
-            merged = list(dict.fromkeys(current_ids + range_ids))
-            self.dataset_state.set_selected_images(merged)
+            # 既存選択を維持して範囲を追加（和集合）
+            self.dataset_state.add_images_to_selection(range_ids)
         else:
             self.dataset_state.set_selected_images(range_ids)
 
@@ -1102,7 +1146,10 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         検索結果はページキャッシュから再表示する。staging等の明示パス表示は
         小規模用途として private な明示パスリストから再構築する。
         """
-        if self.pagination_state and self.page_cache.has_page(self._current_display_page):
+        if self._is_virtual_grid_active():
+            # 仮想グリッドはビュー自身がリサイズに追従する。サイズ変更のみ反映する
+            self._apply_virtual_grid_size()
+        elif self.pagination_state and self.page_cache.has_page(self._current_display_page):
             logger.debug(f"ページキャッシュからレイアウト更新: page={self._current_display_page}")
             self._display_page(self._current_display_page)
         elif self._explicit_path_items:
@@ -1132,9 +1179,188 @@ class ThumbnailSelectorWidget(QWidget, Ui_ThumbnailSelectorWidget):
         if not self.dataset_state:
             return []
 
-        selected_ids = set(self.dataset_state.selected_image_ids)
+        selected_ids = self.dataset_state.selection
+        if self._is_virtual_grid_active():
+            paths: list[Path] = []
+            for image_id in self._visible_image_ids():
+                if image_id not in selected_ids:
+                    continue
+                metadata = self.dataset_state.get_image_by_id(image_id)
+                stored_path = metadata.get("stored_image_path") if metadata else ""
+                paths.append(Path(stored_path) if stored_path else Path())
+            return paths
         return [item.image_path for item in self.thumbnail_items if item.image_id in selected_ids]
 
+    # === Virtual Grid ===
+
+    def enable_virtual_grid(self, cache_capacity: int = 2000) -> None:
+        """検索結果の表示を仮想化グリッド (連続スクロール) に切り替える。
+
+        有効化後は ``initialize_pagination_search`` が検索結果全件をモデルに設定し、
+        ページネーションの代わりに見えているセルのサムネイルだけを都度読み込む。
+        staging 等の ``load_thumbnails_from_paths`` 表示は従来の Graphics View を使う。
+
+        Args:
+            cache_capacity: GUI 側に保持するサムネイル数の上限
+        """
+        if self._virtual_grid is not None:
+            return
+        model = ThumbnailListModel(cache_capacity=cache_capacity, parent=self)
+        model.thumbnails_requested.connect(self._on_virtual_thumbnails_requested)
+        self._virtual_grid = ThumbnailGridView(
+            model,
+            self.thumbnail_size,
+            dataset_state=self.dataset_state,
+            parent=self.widgetThumbnailsContent,
+        )
+        self._virtual_grid.customContextMenuRequested.connect(self._on_virtual_context_menu_requested)
+        self._virtual_grid.hide()
+        content_layout = self.widgetThumbnailsContent.layout()
+        if content_layout is not None:
+            content_layout.addWidget(self._virtual_grid)
+        logger.debug("ThumbnailSelectorWidget: 仮想グリッド表示を有効化")
+
+    @property
+    def virtual_grid(self) -> ThumbnailGridView | None:
+        """仮想グリッドビュー (未有効化なら None)"""
+        return self._virtual_grid
+
+    def _is_virtual_grid_active(self) -> bool:
+        return self._virtual_grid is not None and not self._virtual_grid.isHidden()
+
+    def _set_virtual_grid_visible(self, visible: bool) -> None:
+        """仮想グリッドと Graphics View の表示を切り替える。"""
+        if self._virtual_grid is None:
+            return
+        self._virtual_grid.setVisible(visible)
+        self.graphics_view.setVisible(not visible)
+
+    def _visible_image_ids(self) -> list[int]:
+        """現在の表示対象 (仮想グリッドなら検索結果全件) の画像IDを返す。"""
+        if self._virtual_grid is not None and self._is_virtual_grid_active():
+            return self._virtual_grid.thumbnail_model.image_ids
+        return [item.image_id for item in self.thumbnail_items]
+
+    def _display_virtual_grid(self) -> None:
+        """DatasetStateManager の検索結果全件を仮想グリッドに設定する。"""
+        if self._virtual_grid is None or not self.dataset_state:
+            return
+        self._cancel_virtual_requests()
+        self.scene.clear()
+        self.thumbnail_items.clear()
+        if self.pagination_nav:
+            self.pagination_nav.setVisible(False)
+        self._hide_loading_overlay()
+        self._set_virtual_grid_visible(True)
+        self._apply_virtual_grid_size()
+        image_ids = self.dataset_state.get_filtered_image_ids_slice(0, self.dataset_state.filtered_count)
+        self._virtual_grid.thumbnail_model.set_image_ids(image_ids)
+        self._virtual_grid.scrollToTop()
+        self._update_image_count_display()
+
+    def _apply_virtual_grid_size(self) -> None:
+        """サムネイルサイズ変更を仮想グリッドへ反映する (読み込み済みサムネイルは破棄)。"""
+        if self._virtual_grid is None or self._virtual_grid.gridSize() == self.thumbnail_size:
+            return
+        self._cancel_virtual_requests()
+        self._virtual_grid.set_thumbnail_size(self.thumbnail_size)
+        self._virtual_grid.thumbnail_model.clear_thumbnails()
+
+    @Slot(list)
+    def _on_virtual_thumbnails_requested(self, image_ids: list[int]) -> None:
+        """仮想グリッドで描画されたがキャッシュに無いサムネイルの読み込みを要求する。"""
+        if self._virtual_grid is None:
+            return
+        model = self._virtual_grid.thumbnail_model
+        if not self._worker_service or not self._active_search_result:
+            model.discard_requests(image_ids)
+            return
+
+        visible_rows = self._virtual_grid.visible_row_range()
+        while len(self._virtual_request_ids) >= self._VIRTUAL_MAX_PENDING_REQUESTS:
+            offscreen_request_id = next(
+                (
+                    pending_id
+                    for pending_id, pending_ids in self._virtual_request_ids.items()
+                    if not self._is_virtual_request_visible(pending_ids, visible_rows)
+                ),
+                None,
+            )
+            if offscreen_request_id is None:
+                break
+            self._cancel_virtual_request(offscreen_request_id, CancelReason.PREFETCH_REPLACED)
+
+        request_id = uuid.uuid4().hex[:12]
+        self._virtual_request_ids[request_id] = image_ids
+        try:
+            # 仮想グリッドの要求はページを持たないため page_num=0 とする
+            worker_id = self._worker_service.start_thumbnail_page_load(
+                search_result=self._active_search_result,
+                thumbnail_size=self.thumbnail_size,
+                image_ids=image_ids,
+                page_num=0,
+                request_id=request_id,
+                cancel_previous=False,
+            )
+        except Exception:
+            self._virtual_request_ids.pop(request_id, None)
+            model.discard_requests(image_ids)
+            logger.exception(f"Failed to request virtual grid thumbnails: request_id={request_id}")
+            return
+        self._request_id_to_worker_id[request_id] = worker_id
+
+    def _is_virtual_request_visible(
+        self, image_ids: list[int], visible_rows: tuple[int, int] | None
+    ) -> bool:
+        """要求中の画像のいずれかが仮想グリッドの表示範囲にあるか。"""
+        if self._virtual_grid is None or visible_rows is None:
+            return False
+        first_row, last_row = visible_rows
+        model = self._virtual_grid.thumbnail_model
+        return any(
+            row is not None and first_row <= row <= last_row
+            for row in (model.row_of(image_id) for image_id in image_ids)
+        )
+
+    def _handle_virtual_thumbnail_result(
+        self, request_id: str, thumbnail_result: ThumbnailLoadResult
+    ) -> None:
+        """仮想グリッド向けサムネイル読み込み結果をモデルへ反映する。"""
+        self._virtual_request_ids.pop(request_id, None)
+        self._request_id_to_worker_id.pop(request_id, None)
+        if self._virtual_grid is None:
+            return
+
+        thumbnails: list[tuple[int, QPixmap]] = []
+        for image_id, qimage in thumbnail_result.loaded_thumbnails:
+            qpixmap = QPixmap.fromImage(qimage)
+            if qpixmap.isNull():
+                logger.warning(f"QPixmap変換失敗: image_id={image_id}")
+                continue
+            thumbnails.append((image_id, qpixmap))
+        self._virtual_grid.thumbnail_model.set_thumbnails(thumbnails)
+
+        if self.dataset_state and thumbnails:
+            # 表示中セルのアノテーションをワーカーで先読みし、以降の選択移動を DB 往復なしにする
+            self.dataset_state.prefetch_annotations_async([image_id for image_id, _ in thumbnails])
+
+    def _cancel_virtual_request(self, request_id: str, reason: CancelReason) -> None:
+        """仮想グリッドの未完了要求を 1 件キャンセルする。"""
+        image_ids = self._virtual_request_ids.pop(request_id, [])
+        worker_id = self._request_id_to_worker_id.pop(request_id, None)
+        if self._virtual_grid is not None:
+            self._virtual_grid.thumbnail_model.discard_requests(image_ids)
+        if worker_id and self._worker_service and hasattr(self._worker_service, "cancel_thumbnail_load"):
+            try:
+                self._worker_service.cancel_thumbnail_load(worker_id, reason=reason)
+            except Exception:
+                logger.exception(f"Failed to cancel thumbnail worker: worker_id={worker_id}")
+
+    def _cancel_virtual_requests(self) -> None:
+        """仮想グリッドの未完了要求をすべてキャンセルする。"""
+        for request_id in list(self._virtual_request_ids):
+            self._cancel_virtual_request(request_id, CancelReason.THUMBNAIL_REPLACED)
+
 
 if __name__ == "__main__":
     import sys
@@ -53,6 +53,7 @@ from ..tab.results_tab import ResultsTabWidget
 from ..tab.search_tab import SearchTabWidget
 from ..watchdog import MainThreadWatchdog
 from ..widgets.error_notification_widget import ErrorNotificationWidget
+from ..widgets.query_profile_dialog import QueryProfileDialog
 from ..widgets.registration_summary_widget import RegistrationSummaryWidget
 from ..widgets.tag_management_dialog import TagManagementDialog
 
@@ -121,6 +122,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     # Tag management UI components
     tag_management_dialog: TagManagementDialog | None
+    query_profile_dialog: QueryProfileDialog | None
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -144,6 +146,10 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 self.menuTools.addAction(self.actionTagManagement)
                 logger.debug("Tag management menu action added to Tools menu")
 
+                self.actionQueryProfile = QAction("DBクエリプロファイル...", self)
+                self.actionQueryProfile.triggered.connect(self._show_query_profile_dialog)
+                self.menuTools.addAction(self.actionQueryProfile)
+
             # Batch APIインポートメニューアクション追加
             if hasattr(self, "menuFile"):
                 self.actionBatchImport = QAction("Batch API結果インポート...", self)
@@ -561,6 +567,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
             # Dialog初期化（遅延生成）
             self.tag_management_dialog = None
+            self.query_profile_dialog = None
 
         except Exception as e:
             logger.opt(exception=True).error(f"❌ ErrorNotificationWidget初期化失敗: {e}")
@@ -852,6 +859,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             logger.opt(exception=True).error(f"Failed to show tag management dialog: {e}")
             show_critical(self, "エラー", f"タグ管理の表示に失敗しました:\n{e}")
 
+    def _show_query_profile_dialog(self) -> None:
+        """DBクエリプロファイル診断ダイアログを表示（オンデマンド）"""
+        if self.query_profile_dialog is None:
+            self.query_profile_dialog = QueryProfileDialog(parent=self)
+        self.query_profile_dialog.show()
+        self.query_profile_dialog.raise_()
+        self.query_profile_dialog.activateWindow()
+
     def _connect_menu_actions(self) -> None:
         """ファイル/編集/ヘルプメニューのアクション Signal 接続を行う。
 
@@ -1502,7 +1517,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         target_ids = (
             selected_ids
             if isinstance(selected_ids, list)
-            else self.dataset_state_manager.selected_image_ids
+            else self.dataset_state_manager.selected_image_ids_in_display_order()
         )
         if not target_ids:
             dataset_selected_count = len(self.dataset_state_manager.selected_image_ids)
@@ -1639,6 +1654,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             event: クローズイベント
         """
         self._save_window_state()
+        # 検索タブの write-behind キューに残った手動編集を書き切る (終了で失わない)。
+        if self.search_tab is not None:
+            self.search_tab.shutdown()
         # メインスレッド watchdog を停止する (#1221)。
         watchdog = getattr(self, "_main_thread_watchdog", None)
         if watchdog is not None:
@@ -1656,6 +1674,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # closeEvent は親閉鎖で発火しないため、Jobs タブ経由で明示的に停止して待つ。
         if self.jobs_tab is not None:
             self.jobs_tab.provider_batch_job_widget.shutdown()
+        # ワーカー停止後のアイドル時メンテナンス (PRAGMA optimize / 空きページ返却 / WAL 切り詰め)。
+        # 空きページ返却は idle_vacuum_pages で上限を設けてあるが、それでも数百 ms かかり得るので
+        # 先にウィンドウを隠し、閉じる操作への応答を待たせない。
+        db_manager = getattr(self, "db_manager", None)
+        if db_manager is not None:
+            self.hide()
+            db_manager.run_idle_maintenance()
         super().closeEvent(event)
 
     def _save_window_state(self) -> None:
@@ -14,6 +14,12 @@ from image_annotator_lib import PHashAnnotationResults
 from PySide6.QtCore import Signal
 
 from lorairo.annotation.annotation_runner import AnnotationRunner
+from lorairo.annotation.concurrent_dispatcher import (
+    ConcurrentAnnotationDispatcher,
+    DispatchOutcome,
+    WebApiDispatchSettings,
+    build_dispatch_requests,
+)
 from lorairo.services.annotation_save_service import AnnotationSaveService
 from lorairo.services.job_ledger_service import (
     StageModelInput,
@@ -171,6 +177,12 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
         self._phash_to_input_path: dict[str, str] = {}
         self._phash_to_input_filename: dict[str, str] = {}
         self._path_to_image_id: dict[str, int] = {}
+        # WebAPI 並列ディスパッチで完了チャンクごとに保存済みの (pHash → モデル) と件数。
+        # 最終保存 (_save_results_to_database) で二重保存しないために保持する。
+        self._streamed_saves: dict[str, set[str]] = {}
+        self._streamed_save_success = 0
+        self._streamed_save_skip = 0
+        self._streaming_allowed_image_ids: set[int] | None = None
 
         logger.info(
             f"AnnotationWorker初期化 - Images: {len(self.image_paths)}, "
@@ -446,6 +458,13 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
         # 実行開始時点のステージ別進捗 (全モデル 0 件処理済み) を通知する。
         self._emit_stage_progress(stage_inputs, processed_count=0)
 
+        dispatch_settings = WebApiDispatchSettings.from_config(self.db_manager.config_service)
+        webapi_providers = self._concurrent_webapi_providers(dispatch_settings, stage_inputs)
+        if webapi_providers:
+            return self._run_annotation_concurrent(
+                dispatch_settings, webapi_providers, phash_list, stage_inputs
+            )
+
         try:
             self._check_cancellation()
             bulk_results = self.annotation_runner.execute_annotation(
@@ -497,13 +516,20 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
     def _run_annotation_per_model_fallback(
         self,
         phash_list: list[str] | None,
+        model_ids: list[str] | None = None,
     ) -> tuple[PHashAnnotationResults, list[ModelErrorDetail]]:
-        """一括呼び出し失敗時の互換 fallback としてモデル単位で実行する。"""
+        """一括呼び出し失敗時の互換 fallback としてモデル単位で実行する。
+
+        Args:
+            phash_list: input path 順の pHash list (None なら lib 側で計算)。
+            model_ids: 実行するモデル。省略時は選択モデル全て。
+        """
         merged_results: PHashAnnotationResults = PHashAnnotationResults()
         model_errors: list[ModelErrorDetail] = []
-        total_models = len(self.litellm_model_ids)
+        target_model_ids = list(self.litellm_model_ids if model_ids is None else model_ids)
+        total_models = len(target_model_ids)
 
-        logger.debug(f"モデル単位 fallback 実行開始: {total_models}モデル = {self.litellm_model_ids}")
+        logger.debug(f"モデル単位 fallback 実行開始: {total_models}モデル = {target_model_ids}")
 
         # Issue #805: per-model 完了/失敗を一意キー (litellm_model_id) で追跡する。
         # 未起動モデルを 100% と誤表示しないよう、ステージ進捗の率は
@@ -513,7 +539,7 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
         completed_keys: set[str] = set()
         errored_keys: set[str] = set()
 
-        for model_idx, litellm_model_id in enumerate(self.litellm_model_ids):
+        for model_idx, litellm_model_id in enumerate(target_model_ids):
             self._check_cancellation()
 
             processed_steps = model_idx * len(self.image_paths)
@@ -607,6 +633,171 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
         logger.debug(f"モデル単位 fallback 実行完了: 最終結果={len(merged_results)}件")
         return merged_results, model_errors
 
+    def _concurrent_webapi_providers(
+        self,
+        settings: WebApiDispatchSettings,
+        stage_inputs: list[StageModelInput],
+    ) -> dict[str, str]:
+        """並列ディスパッチ対象の WebAPI モデル (litellm_model_id → provider) を返す。
+
+        設定 ``annotation.concurrent_webapi`` が無効、または registry から WebAPI モデルを
+        解決できない場合は空辞書を返し、従来の一括呼び出しを使う。
+        """
+        if not settings.enabled:
+            return {}
+        return {
+            stage_input.key: stage_input.provider
+            for stage_input in stage_inputs
+            if stage_input.requires_api_key
+        }
+
+    def _run_annotation_concurrent(
+        self,
+        settings: WebApiDispatchSettings,
+        webapi_providers: dict[str, str],
+        phash_list: list[str] | None,
+        stage_inputs: list[StageModelInput],
+    ) -> tuple[PHashAnnotationResults, list[ModelErrorDetail]]:
+        """WebAPI モデルを (モデル × 画像チャンク) 単位で並列送信し、完了順に保存する。
+
+        provider ごとのレート制限・429 再試行・同時実行数調整は
+        ConcurrentAnnotationDispatcher が行う。完了したチャンクの結果はこのスレッド上で
+        即時に DB 保存し、最終保存では保存済み分を除外する。ローカルモデルが混在する
+        場合は WebAPI 分の完了後にモデル単位で実行する。
+
+        Returns:
+            (マージされたアノテーション結果, モデルエラー詳細リスト) のタプル。
+        """
+        merged_results: PHashAnnotationResults = PHashAnnotationResults()
+        model_errors: list[ModelErrorDetail] = []
+        errored_keys: set[str] = set()
+        throughput_stats = getattr(self.annotation_runner.annotator_adapter, "throughput_stats", None)
+        chunk_size = settings.resolve_chunk_size(webapi_providers, throughput_stats)
+        requests = build_dispatch_requests(
+            self.image_paths, webapi_providers, chunk_size=chunk_size, phash_list=phash_list
+        )
+        self._streaming_allowed_image_ids = self._resolve_batch_image_ids()
+        completed_requests = 0
+
+        def _on_result(outcome: DispatchOutcome) -> None:
+            nonlocal completed_requests
+            completed_requests += 1
+            self._handle_dispatch_outcome(outcome, merged_results, model_errors, errored_keys)
+            self._report_progress_throttled(
+                5 + int(completed_requests / max(len(requests), 1) * 80),
+                f"WebAPI 並列実行中: {completed_requests}/{len(requests)}リクエスト",
+                current_item=outcome.request.model_id,
+                processed_count=completed_requests,
+                total_count=len(requests),
+            )
+
+        logger.info(
+            f"WebAPI 並列ディスパッチ開始: {len(webapi_providers)}モデル, {len(requests)}リクエスト "
+            f"(chunk={chunk_size})"
+        )
+        dispatcher = ConcurrentAnnotationDispatcher(
+            self.annotation_runner.execute_annotation,
+            settings.provider_limits,
+            retry_policy=settings.retry_policy,
+        )
+        report = dispatcher.dispatch(
+            requests, on_result=_on_result, is_canceled=self.cancellation.is_canceled
+        )
+        for stats in report.provider_stats.values():
+            self.telemetry.count("webapi_retries", stats.retries)
+            self.telemetry.count("webapi_throttled", stats.throttled)
+        self._check_cancellation()
+
+        completed_keys = {key for key in webapi_providers if key not in errored_keys}
+        local_model_ids = [key for key in self.litellm_model_ids if key not in webapi_providers]
+        if local_model_ids:
+            local_results, local_errors = self._run_annotation_per_model_fallback(
+                phash_list, model_ids=local_model_ids
+            )
+            self._merge_annotation_results(merged_results, local_results)
+            model_errors.extend(local_errors)
+            local_errored = {error.model_name for error in local_errors} | self._stage_errored_model_keys(
+                local_results
+            )
+            errored_keys |= local_errored & set(local_model_ids)
+            completed_keys |= {key for key in local_model_ids if key not in local_errored}
+
+        self._emit_stage_progress(
+            stage_inputs,
+            processed_count=len(self.image_paths),
+            completed_keys=completed_keys,
+            errored_keys=errored_keys,
+        )
+        return merged_results, model_errors
+
+    def _handle_dispatch_outcome(
+        self,
+        outcome: DispatchOutcome,
+        merged_results: PHashAnnotationResults,
+        model_errors: list[ModelErrorDetail],
+        errored_keys: set[str],
+    ) -> None:
+        """並列ディスパッチの 1 リクエスト分の結果を集約し、成功分を即時保存する。"""
+        request = outcome.request
+        if outcome.error is not None or outcome.results is None:
+            error = outcome.error or RuntimeError("annotation result is missing")
+            errored_keys.add(request.model_id)
+            self._save_error_records(
+                error,
+                list(request.image_paths),
+                model_name=request.model_id,
+                error_type=self._ERROR_TYPE_L2,
+            )
+            model_errors.extend(
+                ModelErrorDetail(
+                    model_name=request.model_id,
+                    image_path=Path(image_path).name,
+                    error_message=str(error),
+                    error_type=self._ERROR_TYPE_L2,
+                )
+                for image_path in request.image_paths
+            )
+            return
+
+        valid_results = self._collect_valid_model_results(outcome.results, {request.model_id}, model_errors)
+        self._collect_l1_model_errors(valid_results, model_errors)
+        errored_keys.update(self._stage_errored_model_keys(valid_results))
+        self._merge_annotation_results(merged_results, valid_results)
+        if valid_results:
+            self._save_streamed_results(valid_results)
+
+    def _save_streamed_results(self, results: PHashAnnotationResults) -> None:
+        """完了チャンクの結果を保存し、最終保存から除外するため記録する。"""
+        with self.telemetry.stage("db_write", items=len(results)):
+            save_result = self._create_save_service().save_annotation_results(
+                results, allowed_image_ids=self._streaming_allowed_image_ids
+            )
+        self._streamed_save_success += save_result.success_count
+        self._streamed_save_skip += save_result.skip_count
+        for phash, annotations in results.items():
+            self._streamed_saves.setdefault(phash, set()).update(annotations.keys())
+
+    def _exclude_streamed_results(self, results: PHashAnnotationResults) -> PHashAnnotationResults:
+        """並列ディスパッチ中に保存済みの (pHash, モデル) を除いた結果を返す。"""
+        pending: PHashAnnotationResults = PHashAnnotationResults()
+        for phash, annotations in results.items():
+            saved_models = self._streamed_saves.get(phash, set())
+            remaining = {
+                model: result for model, result in annotations.items() if model not in saved_models
+            }
+            if remaining:
+                pending[phash] = remaining
+        return pending
+
+    def _create_save_service(self) -> AnnotationSaveService:
+        """このワーカーの DB リポジトリで AnnotationSaveService を生成する。"""
+        return AnnotationSaveService(
+            annotation_repo=self.db_manager.annotation_repo,
+            image_repo=self.db_manager.image_repo,
+            model_repo=self.db_manager.model_repo,
+            error_record_repo=self.db_manager.error_record_repo,
+        )
+
     def execute(self) -> AnnotationExecutionResult:
         """アノテーション処理実行
 
@@ -652,14 +843,19 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
                 total_count=len(self.image_paths),
             )
             self._check_cancellation()
-            preflight_errors = self._apply_refusal_prefilter()
+            with self.telemetry.stage("prefilter", items=len(self.image_paths)):
+                preflight_errors = self._apply_refusal_prefilter()
 
             # Phase 1: アノテーション実行(5-90%)
             self._report_progress(5, "アノテーション処理を開始...", total_count=len(self.image_paths))
             self._check_cancellation()
 
-            merged_results, model_errors = self._run_annotation()
+            with self.telemetry.stage(
+                "inference", items=len(self.image_paths) * len(self.litellm_model_ids)
+            ):
+                merged_results, model_errors = self._run_annotation()
             model_errors = preflight_errors + model_errors
+            self.telemetry.count("model_errors", len(model_errors))
 
             # Phase 2: DB保存(90-95%)
             self._report_progress(
@@ -670,9 +866,10 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
             )
             self._check_cancellation()
 
-            db_save_success, db_save_skip, image_summaries, phash_to_filename = (
-                self._save_results_to_database(merged_results)
-            )
+            with self.telemetry.stage("db_write", items=len(merged_results)):
+                db_save_success, db_save_skip, image_summaries, phash_to_filename = (
+                    self._save_results_to_database(merged_results)
+                )
 
             # Phase 3: 統計集計(95-100%)
             self._report_progress(
@@ -681,7 +878,8 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
                 processed_count=len(self.image_paths),
                 total_count=len(self.image_paths),
             )
-            model_statistics = self._build_model_statistics(merged_results)
+            with self.telemetry.stage("statistics"):
+                model_statistics = self._build_model_statistics(merged_results)
 
             self._report_progress(
                 100,
@@ -740,12 +938,7 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
             )
             return []
 
-        save_service = AnnotationSaveService(
-            annotation_repo=self.db_manager.annotation_repo,
-            image_repo=self.db_manager.image_repo,
-            model_repo=self.db_manager.model_repo,
-            error_record_repo=self.db_manager.error_record_repo,
-        )
+        save_service = self._create_save_service()
         original_count = len(self.image_paths)
         try:
             # refusal filter は rating ゲートと独立 (Issue #803 Codex P2)。過去に provider が
@@ -817,12 +1010,13 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
         # (同一 pHash の未選択別版へ結果を書き込み汚染しないため)。
         allowed_image_ids = self._resolve_batch_image_ids()
 
-        save_result = AnnotationSaveService(
-            annotation_repo=self.db_manager.annotation_repo,
-            image_repo=self.db_manager.image_repo,
-            model_repo=self.db_manager.model_repo,
-            error_record_repo=self.db_manager.error_record_repo,
-        ).save_annotation_results(results, allowed_image_ids=allowed_image_ids)
+        # WebAPI 並列ディスパッチで保存済みの分は除外し、件数だけ合算する
+        pending_results = self._exclude_streamed_results(results) if self._streamed_saves else results
+        save_result = self._create_save_service().save_annotation_results(
+            pending_results, allowed_image_ids=allowed_image_ids
+        )
+        success_count = save_result.success_count + self._streamed_save_success
+        skip_count = save_result.skip_count + self._streamed_save_skip
 
         # GUIサマリー用: phash→ファイル名マップを構築 (#633: 別版で複数 image_id になり得る)
         phash_to_image_ids = self.db_manager.image_repo.find_image_ids_by_phashes_multi(set(results.keys()))
@@ -836,8 +1030,8 @@ class AnnotationWorker(LoRAIroWorkerBase["AnnotationExecutionResult"]):
             if phash_to_image_ids.get(phash)
         ]
 
-        logger.info(f"DB保存完了: {save_result.success_count}/{save_result.total_count}件成功")
-        return save_result.success_count, save_result.skip_count, image_summaries, phash_to_filename
+        logger.info(f"DB保存完了: {success_count}件成功 (スキップ {skip_count}件)")
+        return success_count, skip_count, image_summaries, phash_to_filename
 
     def _resolve_batch_image_ids(self) -> set[int] | None:
         """このバッチの image_paths を DB 上の image_id 集合に解決する (#633)。
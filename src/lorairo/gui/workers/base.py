@@ -3,6 +3,7 @@
 import time
 import traceback
 from abc import abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, ClassVar
@@ -10,6 +11,7 @@ from typing import TYPE_CHECKING, ClassVar
 from PySide6.QtCore import QObject, Signal
 
 from ...utils.log import logger
+from ...utils.stage_telemetry import StageTelemetry, TelemetrySnapshot
 
 if TYPE_CHECKING:
     from ...database.db_manager import ImageDatabaseManager
@@ -117,6 +119,8 @@ class LoRAIroWorkerBase[T](QObject):
     finished = Signal(object)  # result: T
     error_occurred = Signal(str)
     canceled = Signal()
+    # 終端シグナル (finished / error_occurred / canceled) の直前に 1 回だけ発行する
+    telemetry_ready = Signal(object)  # TelemetrySnapshot
 
     _OPERATION_TYPE: ClassVar[str] = ""
 
@@ -127,6 +131,10 @@ class LoRAIroWorkerBase[T](QObject):
         self.cancellation = CancellationController()
         self.progress = ProgressReporter()
         self.status = WorkerStatus.IDLE
+        # ステージ別計測 (サブクラスは self.telemetry.stage("decode") 等で区間を囲む)
+        self.telemetry = StageTelemetry(self.__class__.__name__)
+        self.profiling_enabled = False
+        self.telemetry_snapshot: TelemetrySnapshot | None = None
 
         # 内部シグナル接続
         self.progress.progress_updated.connect(self.progress_updated)
@@ -149,16 +157,22 @@ class LoRAIroWorkerBase[T](QObject):
         実行中は現在スレッドのキャンセル状態を SQL 中断レジストリへ公開し (#1206)、
         協調キャンセルが tag DB の実行中クエリを SQLite progress handler 経由で
         打ち切れるようにする。
+
+        ``execute()`` 中の ``save_error_record`` はバッファ付きシンク経由で一括保存し、
+        終了シグナルの発行前にフラッシュする (``_error_record_scope``)。
         """
         from . import sql_abort
 
         sql_abort.register_current_thread(self.cancellation)
+        self.telemetry.start(profile=self.profiling_enabled)
         try:
             self._set_status(WorkerStatus.RUNNING)
             logger.debug(f"ワーカー実行開始: {self.__class__.__name__}")
 
-            result = self.execute()
+            with self._error_record_scope():
+                result = self.execute()
 
+            self._publish_telemetry()
             if not self.cancellation.is_canceled():
                 self._set_status(WorkerStatus.COMPLETED)
                 self.finished.emit(result)
@@ -170,10 +184,12 @@ class LoRAIroWorkerBase[T](QObject):
 
         except CancellationError as e:
             logger.debug(f"ワーカー実行キャンセル: {self.__class__.__name__}: {e}")
+            self._publish_telemetry()
             self._set_status(WorkerStatus.CANCELED)
             self.canceled.emit()
 
         except Exception as e:
+            self._publish_telemetry()
             if self.cancellation.is_canceled() and self._is_query_interrupt_error(e):
                 # 協調キャンセルによる SQL 中断 (progress handler 経由) は正常なキャンセル
                 # 終端として扱う (#1206)。エラー記録・エラーシグナルにしない。
@@ -189,6 +205,35 @@ class LoRAIroWorkerBase[T](QObject):
         finally:
             sql_abort.unregister_current_thread()
 
+    def _error_record_scope(self) -> AbstractContextManager[object]:
+        """execute() 中のエラーレコードをまとめて書き込むスコープを返す。
+
+        db_manager を持たないワーカーでは何もしない。
+        """
+        if self._db_manager is None:
+            return nullcontext()
+        return self._db_manager.buffered_error_records()
+
+    def enable_profiling(self, enabled: bool = True) -> None:
+        """この実行でプロファイラ (pyinstrument / cProfile) を有効にする。start 前に呼ぶ。"""
+        self.profiling_enabled = enabled
+
+    def _publish_telemetry(self) -> None:
+        """計測を終了し、終端シグナルより先に結果を発行する。
+
+        同じスレッドから発行したシグナルはキュー接続でも発行順に届くため、受け手
+        (WorkerManager) は終端イベントの生成時点で計測結果を持っている。
+        """
+        if not self.telemetry.is_running:
+            return
+        snapshot = self.telemetry.stop()
+        self.telemetry_snapshot = snapshot
+        if snapshot.stages:
+            logger.debug("ワーカー計測: " + " | ".join(snapshot.format_lines()))
+        if snapshot.profile:
+            logger.info(f"ワーカープロファイル ({self.__class__.__name__}):\n{snapshot.profile}")
+        self.telemetry_ready.emit(snapshot)
+
     @staticmethod
     def _is_query_interrupt_error(e: Exception) -> bool:
         """SQLite progress handler による中断 (interrupted) 由来の例外か判定する (#1206)。"""
@@ -6,6 +6,7 @@ from typing import Any
 from PySide6.QtCore import QCoreApplication, QObject, QThread, Signal
 
 from ...utils.log import logger
+from ...utils.stage_telemetry import TelemetrySnapshot, profiling_enabled_by_env
 from .base import LoRAIroWorkerBase
 from .terminal import CancelReason, WorkerOutcome, WorkerTerminalEvent
 
@@ -47,6 +48,8 @@ class WorkerManager(QObject):
     def __init__(self, parent: QObject | None = None):
         super().__init__(parent)
         self.active_workers: dict[str, dict[str, Any]] = {}
+        # True の間に開始したワーカーはプロファイラ付きで実行する (実行単位の切替)
+        self.profiling_enabled = profiling_enabled_by_env()
         logger.debug("WorkerManager initialized")
 
     # === Worker Management ===
@@ -75,9 +78,13 @@ class WorkerManager(QObject):
         # スレッド作成・設定
         thread = QThread()
         worker.moveToThread(thread)
+        if self.profiling_enabled:
+            worker.enable_profiling()
 
         # シグナル接続
         thread.started.connect(worker.run)
+        # 計測結果は終端シグナルより先に届く (LoRAIroWorkerBase._publish_telemetry)
+        worker.telemetry_ready.connect(lambda snapshot: self._on_worker_telemetry(worker_id, snapshot))
         worker.finished.connect(lambda result: self._on_worker_finished(worker_id, result))
         worker.error_occurred.connect(lambda error: self._on_worker_error(worker_id, error))
         worker.canceled.connect(lambda: self._on_worker_canceled(worker_id))
@@ -101,6 +108,7 @@ class WorkerManager(QObject):
             "cancel_reason": None,
             "terminal_emitted": False,
             "unresponsive": False,
+            "telemetry": None,
         }
 
         thread.start()
@@ -319,6 +327,12 @@ class WorkerManager(QObject):
 
     # === Private Event Handlers ===
 
+    def _on_worker_telemetry(self, worker_id: str, snapshot: TelemetrySnapshot) -> None:
+        """ワーカー計測結果を終端イベント生成まで保持する。"""
+        worker_info = self.active_workers.get(worker_id)
+        if worker_info is not None:
+            worker_info["telemetry"] = snapshot
+
     def _on_worker_finished(self, worker_id: str, result: Any) -> None:
         """ワーカー完了イベントハンドラー"""
         if self._finalize_terminal(worker_id, WorkerOutcome.SUCCEEDED, result=result):
@@ -421,6 +435,7 @@ class WorkerManager(QObject):
             result=result,
             error=error,
             cancel_reason=cancel_reason,
+            telemetry=worker_info.get("telemetry"),
         )
         if not self._emit_terminal_once(worker_id, event):
             return False
@@ -76,19 +76,21 @@ class RefinementWorker(LoRAIroWorkerBase[RefinementResult]):
         DB 往復の合間で協調キャンセルを効かせる (#1024)。キャンセル時は
         `CancellationError` が伝播し、`run()` が canceled シグナルで終端する。
         """
-        recommendations = self._service.recommend_for_tags(
-            self._tags,
-            format_map=self._format_map,
-            repo=self._repo,
-            cancel_check=self._check_cancellation,
-            image_id=self._image_id,
-        )
+        with self.telemetry.stage("evaluate", items=len(self._tags)):
+            recommendations = self._service.recommend_for_tags(
+                self._tags,
+                format_map=self._format_map,
+                repo=self._repo,
+                cancel_check=self._check_cancellation,
+                image_id=self._image_id,
+            )
         # 候補タグの使用カウントも worker スレッド内で一括解決する
         # (メインスレッドで tag DB を待たない #1046 方針と整合。#1052)。
         # 評価完了後に supersede された場合は counts 解決前に協調キャンセルで
         # 終端し、pending の新要求へ枠を早く譲る (Codex P2)
         self._check_cancellation()
-        candidate_counts = self._service.resolve_candidate_counts(recommendations, repo=self._repo)
+        with self.telemetry.stage("db_read", items=len(recommendations)):
+            candidate_counts = self._service.resolve_candidate_counts(recommendations, repo=self._repo)
         logger.debug(
             f"refinement worker 完了: image_id={self._image_id}, gen={self._generation}, "
             f"対象={len(self._tags)}, 表示={len(recommendations)}"
@@ -1,5 +1,6 @@
 """データベース登録専用ワーカー"""
 
+import itertools
 import traceback
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -12,8 +13,11 @@ from .base import LoRAIroWorkerBase
 from .progress_helper import ProgressHelper
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
     from ...database.db_manager import ImageDatabaseManager
     from ...filesystem import FileSystemManager
+    from ...utils.directory_scan import ScannedImage
 
 
 @dataclass(frozen=True)
@@ -66,6 +70,9 @@ class DatabaseRegistrationWorker(LoRAIroWorkerBase[DatabaseRegistrationResult]):
         RegistrationOutcome.FAILED: "errors",
     }
 
+    # 走査結果を登録に回す単位 (画像数)。タグ ID の一括解決もこの単位で行う。
+    _REGISTRATION_CHUNK_SIZE: ClassVar[int] = 256
+
     def __init__(
         self, directory: Path, db_manager: "ImageDatabaseManager", fsm: "FileSystemManager"
     ) -> None:
@@ -78,8 +85,10 @@ class DatabaseRegistrationWorker(LoRAIroWorkerBase[DatabaseRegistrationResult]):
     def execute(self) -> DatabaseRegistrationResult:
         """データベース登録処理を実行
 
-        指定ディレクトリ内の画像ファイルを検索し、重複チェックを行った後に
-        データベースへの登録を実行する。進捗状況は定期的に報告される。
+        ディレクトリ走査の結果を ``_REGISTRATION_CHUNK_SIZE`` 件ずつ受け取り、チャンクごとに
+        関連ファイルのタグ ID 解決と登録を行う。走査は後続ディレクトリをバックグラウンドで
+        続けるため、最初のチャンクが揃った時点で登録が始まる。総数は走査が終わるまで
+        分からないため、それまでは処理件数だけを報告する (``total_count=0``)。
 
         Returns:
             DatabaseRegistrationResult: 登録結果（成功数、スキップ数、エラー数、処理時間）
@@ -91,52 +100,99 @@ class DatabaseRegistrationWorker(LoRAIroWorkerBase[DatabaseRegistrationResult]):
 
         start_time = time.time()
 
-        # 画像ファイル一覧取得
         self._report_progress(5, "画像ファイルを検索中...")
-        image_files = list(self.fsm.get_image_files(self.directory))
-        total_count = len(image_files)
-
-        if total_count == 0:
-            logger.warning(f"画像ファイルが見つかりません: {self.directory}")
-            return DatabaseRegistrationResult(
-                0, 0, 0, [], 0.0, variant_count=0, directory=self.directory, detail=[]
-            )
-
-        logger.info(f"登録対象画像: {total_count}件")
-
-        # 関連ファイル(.txt/.caption)を事前読み込みし、タグIDを一括解決（N+1回避）
-        self._report_progress(8, "関連アノテーションを解析中...")
-        annotations_by_path = self._preload_associated_annotations(image_files)
-        tag_id_cache = self._build_tag_id_cache(annotations_by_path)
+        scanned_images = self.fsm.scan_image_files(
+            self.directory, is_canceled=self.cancellation.is_canceled
+        )
 
         # 統計情報初期化 (#633: variant を追加し全経路統一)
         stats = {"registered": 0, "variant": 0, "skipped": 0, "errors": 0}
         processed_paths: list[Path] = []
         detail: list[RegistrationDetailItem] = []
+        tag_id_cache: dict[str, int | None] = {}
+        discovered = 0
+
+        for chunk, scan_complete in self._iter_scan_chunks(scanned_images):
+            offset = discovered
+            discovered += len(chunk)
+            # 走査完了後は総数が確定するので通常の割合表示に切り替える
+            total_count = discovered if scan_complete else 0
+            if offset == 0:
+                self._report_progress(10, f"バッチ登録開始: {len(chunk)}件 (画像の検索と並行)")
+
+            annotations_by_path = self._read_chunk_annotations(chunk)
+            # チャンク内の関連ファイルのタグIDを一括解決（N+1回避、解決済みタグは再問い合わせしない）
+            with self.telemetry.stage("tag_resolve", items=len(annotations_by_path)):
+                tag_id_cache.update(self._build_tag_id_cache(annotations_by_path, resolved=tag_id_cache))
+
+            # 走査はパス順で返るため、重複画像のどちらを元画像として登録するかは決定的
+            for i, image_path in enumerate((scanned.path for scanned in chunk), start=offset):
+                # キャンセルチェック
+                self._check_cancellation()
+
+                # 単一画像の登録と統計更新
+                self._process_single_image_in_batch(
+                    image_path,
+                    i,
+                    total_count,
+                    stats,
+                    processed_paths,
+                    detail,
+                    annotations=annotations_by_path.get(image_path),
+                    tag_id_cache=tag_id_cache,
+                )
 
-        # バッチ処理開始
-        self._report_progress(10, f"バッチ登録開始: {total_count}件")
+        if discovered == 0:
+            logger.warning(f"画像ファイルが見つかりません: {self.directory}")
+            return DatabaseRegistrationResult(
+                0, 0, 0, [], 0.0, variant_count=0, directory=self.directory, detail=[]
+            )
 
-        for i, image_path in enumerate(image_files):
-            # キャンセルチェック
-            self._check_cancellation()
+        logger.info(f"登録対象画像: {discovered}件")
 
-            # 単一画像の登録と統計更新
-            self._process_single_image_in_batch(
-                image_path,
-                i,
-                total_count,
-                stats,
-                processed_paths,
-                detail,
-                annotations=annotations_by_path.get(image_path),
-                tag_id_cache=tag_id_cache,
-            )
+        # 再スキャン時にデコードを省けるよう pHash / 画像情報のキャッシュを確定する
+        with self.telemetry.stage("feature_cache_flush"):
+            self.db_manager.flush_feature_cache()
+
+        # 大量登録で古くなったクエリ統計を更新し、膨らんだ WAL を切り詰める
+        with self.telemetry.stage("db_maintenance"):
+            self.db_manager.note_bulk_write(stats["registered"] + stats["variant"])
 
         # 完了処理
         self._report_progress(100, "データベース登録完了")
         return self._build_registration_result(stats, processed_paths, detail, start_time)
 
+    def _iter_scan_chunks(
+        self, scanned_images: "Iterable[ScannedImage]"
+    ) -> "Iterator[tuple[list[ScannedImage], bool]]":
+        """走査結果を ``_REGISTRATION_CHUNK_SIZE`` 件ずつに区切って返す。
+
+        チャンクが揃うまでの待ち時間は ``scan`` ステージとして計測する。
+
+        Args:
+            scanned_images: ``FileSystemManager.scan_image_files`` の走査結果。
+
+        Yields:
+            (チャンク, 走査が完了したか)。走査完了はチャンクの次の 1 件を先読みして判定する
+            (総数がチャンクサイズの倍数でも最後のチャンクで完了を報告できる)。
+        """
+        iterator = iter(scanned_images)
+        lookahead: list[ScannedImage] = []
+        while True:
+            with self.telemetry.stage("scan") as timing:
+                chunk = lookahead + list(
+                    itertools.islice(iterator, self._REGISTRATION_CHUNK_SIZE - len(lookahead))
+                )
+                lookahead = list(itertools.islice(iterator, 1))
+                timing.items = len(chunk)
+            self._check_cancellation()
+            if not chunk:
+                return
+            scan_complete = not lookahead
+            yield chunk, scan_complete
+            if scan_complete:
+                return
+
     def _process_single_image_in_batch(
         self,
         image_path: Path,
@@ -214,7 +270,7 @@ class DatabaseRegistrationWorker(LoRAIroWorkerBase[DatabaseRegistrationResult]):
         Args:
             image_path: 登録対象の画像ファイルパス
             i: 現在の処理インデックス（0始まり）
-            total_count: 処理対象の総画像数
+            total_count: 処理対象の総画像数。走査中で総数が未確定なら 0
             annotations: 事前読み込み済みのアノテーション。
             tag_id_cache: 正規化済みタグ→tag_idのキャッシュ。
 
@@ -230,21 +286,30 @@ class DatabaseRegistrationWorker(LoRAIroWorkerBase[DatabaseRegistrationResult]):
         )
 
         # 統一登録エントリ: 分類・保存・関連ファイル・alias を一元適用
-        side_effect_result = self.db_manager.register_image_with_side_effects(
-            image_path,
-            self.fsm,
-            associated_annotations=annotations,
-            tag_id_cache=tag_id_cache,
-        )
+        # (pHash 算出・重複判定・ファイルコピー・DB 書き込みを含む 1 画像分)
+        with self.telemetry.stage("register", items=1) as timing:
+            timing.bytes = image_path.stat().st_size
+            side_effect_result = self.db_manager.register_image_with_side_effects(
+                image_path,
+                self.fsm,
+                associated_annotations=annotations,
+                tag_id_cache=tag_id_cache,
+            )
         outcome = side_effect_result.outcome
+        self.telemetry.count(f"outcome.{outcome.value}")
         image_id = side_effect_result.image_id if side_effect_result.image_id is not None else -1
         logger.debug(f"登録 outcome={outcome.value}: {image_path}")
 
-        # 進捗報告（ProgressHelper使用）
-        percentage = ProgressHelper.calculate_percentage(i + 1, total_count, 10, 85)  # 10-95%
+        # 進捗報告（ProgressHelper使用）。総数未確定の間は割合を進めず処理件数のみ示す
+        if total_count > 0:
+            percentage = ProgressHelper.calculate_percentage(i + 1, total_count, 10, 85)  # 10-95%
+            status_message = f"登録中: {image_path.name}"
+        else:
+            percentage = 10
+            status_message = f"登録中: {image_path.name} ({i + 1}件目、検索継続中)"
         self._report_progress_throttled(
             percentage,
-            f"登録中: {image_path.name}",
+            status_message,
             current_item=str(image_path),
             processed_count=i + 1,
             total_count=total_count,
@@ -297,33 +362,43 @@ class DatabaseRegistrationWorker(LoRAIroWorkerBase[DatabaseRegistrationResult]):
 
         return registration_result
 
-    def _preload_associated_annotations(self, image_files: list[Path]) -> dict[Path, dict[str, object]]:
-        """関連アノテーション(.txt/.caption)を事前に一括読み込みする。
+    def _read_chunk_annotations(self, chunk: "list[ScannedImage]") -> dict[Path, dict[str, object]]:
+        """チャンク内の画像の関連アノテーション(.txt/.caption)を読み込む。
+
+        サイドカーの有無は走査時のディレクトリ一覧で判明しているため、存在確認は行わず
+        サイドカーのある画像だけを読む。
 
         Args:
-            image_files: 画像ファイルパスのリスト。
+            chunk: 走査結果のチャンク。
 
         Returns:
-            画像パス→アノテーション辞書のマッピング（アノテーションがある画像のみ）。
+            画像パス→アノテーション辞書のマッピング（アノテーションがある画像のみ）
         """
         annotations_by_path: dict[Path, dict[str, object]] = {}
-        for image_path in image_files:
-            self._check_cancellation()
-            annotations = self.file_reader.get_existing_annotations(image_path)
+        for scanned in chunk:
+            if not scanned.has_sidecars:
+                continue
+            annotations = self.file_reader.read_sidecar_files(
+                scanned.path, tag_path=scanned.tag_path, caption_path=scanned.caption_path
+            )
             if annotations:
-                annotations_by_path[image_path] = annotations
+                annotations_by_path[scanned.path] = annotations
         return annotations_by_path
 
     def _build_tag_id_cache(
-        self, annotations_by_path: dict[Path, dict[str, object]]
+        self,
+        annotations_by_path: dict[Path, dict[str, object]],
+        *,
+        resolved: "Mapping[str, int | None] | None" = None,
     ) -> dict[str, int | None]:
         """事前読み込み済みアノテーションからタグを収集し、tag_idを一括解決する。
 
         Args:
-            annotations_by_path: _preload_associated_annotations() の結果。
+            annotations_by_path: _read_chunk_annotations() の結果。
+            resolved: 前のチャンクで解決済みのキャッシュ。含まれるタグは問い合わせない。
 
         Returns:
-            正規化済みタグ文字列→tag_idのキャッシュ。解決失敗時は空辞書。
+            新たに解決した正規化済みタグ文字列→tag_idのキャッシュ。解決失敗時は空辞書。
         """
         from genai_tag_db_tools.utils.cleanup_str import TagCleaner
 
@@ -336,7 +411,7 @@ class DatabaseRegistrationWorker(LoRAIroWorkerBase[DatabaseRegistrationResult]):
                 if not isinstance(raw_tag, str):
                     continue
                 normalized = TagCleaner.clean_format(raw_tag).strip()
-                if normalized:
+                if normalized and (resolved is None or normalized not in resolved):
                     all_tags.add(normalized)
 
         if not all_tags:
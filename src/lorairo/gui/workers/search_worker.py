@@ -1,6 +1,7 @@
 """データベース検索専用ワーカー"""
 
 import traceback
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -17,7 +18,7 @@ if TYPE_CHECKING:
 class SearchResult:
     """検索結果"""
 
-    image_metadata: list[dict[str, Any]]
+    image_metadata: Sequence[dict[str, Any]]  # 検索経路では ImageResultSet (列指向)
     total_count: int
     search_time: float
     filter_conditions: "SearchConditions"
@@ -50,9 +51,11 @@ class SearchWorker(LoRAIroWorkerBase[SearchResult]):
             # キャンセルチェック
             self._check_cancellation()
 
-            image_metadata, total_count = self.criteria_processor.execute_search_with_filters(
-                self.search_conditions
-            )
+            with self.telemetry.stage("db_read") as timing:
+                image_metadata, total_count = self.criteria_processor.execute_search_with_filters(
+                    self.search_conditions
+                )
+                timing.items = len(image_metadata)
             self._check_cancellation()
 
             search_time = time.time() - start_time
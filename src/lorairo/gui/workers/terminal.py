@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from lorairo.utils.stage_telemetry import TelemetrySnapshot
+
 
 class WorkerOutcome(Enum):
     """Authoritative worker lifecycle outcome observed by WorkerManager."""
@@ -39,3 +41,5 @@ class WorkerTerminalEvent:
     result: Any | None = None
     error: str | None = None
     cancel_reason: CancelReason | None = None
+    # ワーカーが終端前に発行したステージ別計測 (UNRESPONSIVE 等で未着なら None)
+    telemetry: TelemetrySnapshot | None = None
@@ -1,12 +1,14 @@
 """サムネイル読み込み専用ワーカー"""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QImage
+from PySide6.QtGui import QImage, QImageReader
 
+from ...services.image_result_set import ImageResultSet
 from ...utils.log import logger
 from .base import LoRAIroWorkerBase
 from .progress_helper import ProgressHelper
@@ -25,7 +27,9 @@ class ThumbnailLoadResult:
     failed_count: int
     total_count: int
     processing_time: float
-    image_metadata: list[dict[str, Any]] | None = None  # 検索結果メタデータ（DatasetStateManager同期用）
+    image_metadata: Sequence[dict[str, Any]] | None = (
+        None  # 検索結果メタデータ（DatasetStateManager同期用）
+    )
     request_id: str | None = None  # リクエスト識別子（古い結果の破棄用）
     page_num: int | None = None  # ページ番号（ページネーション用）
     image_ids: list[int] | None = None  # 処理対象画像ID（ページ単位表示用）
@@ -61,7 +65,14 @@ class ThumbnailWorker(LoRAIroWorkerBase[ThumbnailLoadResult]):
         source_metadata = self.search_result.image_metadata
         target_metadata = source_metadata
 
-        if self.image_id_filter:
+        if self.image_id_filter and isinstance(source_metadata, ImageResultSet):
+            # 列指向の検索結果は id→行インデックスでページ分だけ引く (全件走査しない)
+            target_metadata = [
+                item
+                for image_id in self.image_id_filter
+                if (item := source_metadata.get_by_id(image_id)) is not None
+            ]
+        elif self.image_id_filter:
             metadata_by_id = {
                 item.get("id"): item for item in source_metadata if item.get("id") is not None
             }
@@ -170,7 +181,7 @@ class ThumbnailWorker(LoRAIroWorkerBase[ThumbnailLoadResult]):
 
     def _process_batch(
         self,
-        batch_items: list[dict[str, Any]],
+        batch_items: Sequence[dict[str, Any]],
         loaded_thumbnails: list[tuple[int, QImage]],
     ) -> tuple[int, int]:
         """単一バッチのサムネイルを処理する。
@@ -205,18 +216,13 @@ class ThumbnailWorker(LoRAIroWorkerBase[ThumbnailLoadResult]):
                     continue
 
                 # サムネイル読み込み（QImageでスレッドセーフ）
-                qimage = QImage(str(thumbnail_path))
-                if qimage.isNull():
+                with self.telemetry.stage("decode", items=1) as timing:
+                    timing.bytes = thumbnail_path.stat().st_size
+                    scaled_qimage = self._read_scaled(thumbnail_path)
+                if scaled_qimage.isNull():
                     batch_failed += 1
                     continue
 
-                # サイズ調整
-                scaled_qimage = qimage.scaled(
-                    self.thumbnail_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-
                 loaded_thumbnails.append((image_id, scaled_qimage))
                 batch_loaded += 1
 
@@ -235,6 +241,37 @@ class ThumbnailWorker(LoRAIroWorkerBase[ThumbnailLoadResult]):
 
         return batch_loaded, batch_failed
 
+    def _read_scaled(self, path: Path) -> QImage:
+        """サムネイルサイズに収まるよう縮小しながら画像を読み込む。
+
+        ``QImageReader.setScaledSize`` を使い、JPEG / WebP はデコーダ側の縮小
+        (DCT スケーリング / libwebp スケーリング) でフル解像度デコードを避ける。
+        それ以外の形式は Qt がデコード後に縮小する (従来の ``QImage.scaled`` 相当)。
+
+        Args:
+            path: 画像ファイルパス。
+
+        Returns:
+            ``thumbnail_size`` に KeepAspectRatio で収まる QImage。読み込み失敗時は null QImage。
+        """
+        reader = QImageReader(str(path))
+        source_size = reader.size()
+        if source_size.isValid() and not source_size.isEmpty():
+            reader.setScaledSize(
+                source_size.scaled(self.thumbnail_size, Qt.AspectRatioMode.KeepAspectRatio)
+            )
+            return reader.read()
+
+        # ヘッダからサイズを取得できない形式は全体を読み込んでから縮小する
+        qimage = reader.read()
+        if qimage.isNull():
+            return qimage
+        return qimage.scaled(
+            self.thumbnail_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
     def _get_thumbnail_path(self, image_data: dict[str, Any], image_id: int) -> Path | None:
         """サムネイル用の最適な画像パスを取得する。
 
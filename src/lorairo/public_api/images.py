@@ -134,6 +134,8 @@ def _register_into_db(
             failed += 1
             errors.append(f"{image_file.name}: {e!s}")
 
+    db_manager.note_bulk_write(registered + variant)
+
     return RegistrationResult(
         total=len(image_files),
         successful=registered,
@@ -10,6 +10,7 @@ from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from lorairo.database.maintenance import note_bulk_write
 from lorairo.database.repository.annotation_record import AnnotationRepository, AnnotationSaveItem
 from lorairo.database.repository.error_record import ErrorRecordRepository
 from lorairo.database.repository.image import ImageRepository
@@ -19,7 +20,7 @@ from lorairo.domain.score_scaler import calibrate_to_display, is_ai_scored_model
 from lorairo.utils.log import logger
 
 if TYPE_CHECKING:
-    from lorairo.database.schema import AnnotationsDict, RatingAnnotationData
+    from lorairo.database.schema import AnnotationsDict, ErrorRecordData, RatingAnnotationData
 
 # Provider Batch import 1 コミットあたりの画像数 (#1158)。
 # import は画像ごとに数百タグ + レーティングを書き込むため、既定 (BATCH_CHUNK_SIZE=15000
@@ -361,6 +362,7 @@ class AnnotationSaveService:
         models_cache: dict[str, Any],
         result: AnnotationsDict,
         image_id: int | None = None,
+        outcome_records: list[ErrorRecordData] | None = None,
     ) -> None:
         """1モデル分のアノテーション結果をAnnotationsDictに追記する。
 
@@ -375,6 +377,8 @@ class AnnotationSaveService:
             models_cache: model_name → Model の事前取得キャッシュ。
             result: 追記先の AnnotationsDict。
             image_id: 対象画像 ID。outcome を error_records に記録する際に必要。
+            outcome_records: 指定時は outcome をここに積み、呼び出し元がループ後に
+                ``_flush_outcome_records`` でまとめて保存する。None なら即時保存する。
         """
         if self._is_legacy_sentinel_model_id(model_name):
             logger.warning(
@@ -390,13 +394,24 @@ class AnnotationSaveService:
             # LoRAIro では retry せず error_records に記録 → 送信前 filter で除外。
             error_message = str(error or "")
             if image_id is not None:
-                self._error_record_repo.save_error_record(
-                    operation_type="annotation",
-                    error_type=outcome_error_type,
-                    error_message=error_message,
-                    image_id=image_id,
-                    model_name=model_name,
-                )
+                if outcome_records is not None:
+                    outcome_records.append(
+                        {
+                            "operation_type": "annotation",
+                            "error_type": outcome_error_type,
+                            "error_message": error_message,
+                            "image_id": image_id,
+                            "model_name": model_name,
+                        }
+                    )
+                else:
+                    self._error_record_repo.save_error_record(
+                        operation_type="annotation",
+                        error_type=outcome_error_type,
+                        error_message=error_message,
+                        image_id=image_id,
+                        model_name=model_name,
+                    )
                 logger.warning(
                     f"Annotation outcome recorded to error_records: model={model_name}, "
                     f"image_id={image_id}, type={outcome_error_type}"
@@ -436,6 +451,7 @@ class AnnotationSaveService:
         phash_annotations: dict[str, Any],
         models_cache: dict[str, Any],
         image_id: int | None = None,
+        outcome_records: list[ErrorRecordData] | None = None,
     ) -> AnnotationsDict:
         """1画像分のアノテーション結果をAnnotationsDictに変換する。
 
@@ -443,6 +459,7 @@ class AnnotationSaveService:
             phash_annotations: model_name → UnifiedAnnotationResult のマッピング。
             models_cache: model_name → Model の事前取得キャッシュ。
             image_id: 対象画像 ID。refusal を error_records に記録する際に必要。
+            outcome_records: refusal の記録先バッファ (``_process_model_result`` 参照)。
 
         Returns:
             DB保存用のAnnotationsDict。
@@ -455,9 +472,32 @@ class AnnotationSaveService:
             "ratings": [],
         }
         for model_name, unified_result in phash_annotations.items():
-            self._process_model_result(model_name, unified_result, models_cache, result, image_id=image_id)
+            self._process_model_result(
+                model_name,
+                unified_result,
+                models_cache,
+                result,
+                image_id=image_id,
+                outcome_records=outcome_records,
+            )
         return result
 
+    def _flush_outcome_records(self, records: list[ErrorRecordData]) -> None:
+        """ループ中に積んだ outcome レコードを 1 トランザクションで保存する。
+
+        refusal が大量に返るバッチで 1 件ごとに commit すると書き込みロックを奪い合うため、
+        ``ErrorRecordSink`` と同じく複数行 INSERT にまとめる。保存失敗はアノテーション保存を
+        止めないようログに残すだけにする (二次エラー防止)。
+        """
+        if not records:
+            return
+        try:
+            self._error_record_repo.save_error_records_batch(records)
+        except Exception as e:
+            logger.opt(exception=True).error(
+                f"Annotation outcome の一括保存に失敗しました ({len(records)}件): {e}"
+            )
+
     def _collect_names_and_tags(self, results: Any) -> tuple[set[str], set[str]]:
         """全結果からユニークなモデル名とタグ文字列を収集する。
 
@@ -624,6 +664,8 @@ class AnnotationSaveService:
                     error_count += 1
                     logger.opt(exception=True).error(log_message(item, e))
 
+        # 大量保存で古くなったクエリ統計を更新し、膨らんだ WAL を切り詰める
+        note_bulk_write(self._annotation_repo.session_factory, success_count)
         return (success_count, error_count, error_details)
 
     @staticmethod
@@ -699,6 +741,7 @@ class AnnotationSaveService:
         error_count = 0
         error_details: list[str] = []
         prepared_items: list[_PreparedAnnotationSave] = []
+        outcome_records: list[ErrorRecordData] = []
 
         for phash, phash_annotations in results.items():
             try:
@@ -716,7 +759,10 @@ class AnnotationSaveService:
                 appended = False
                 for image_id in target_image_ids:
                     annotations_dict = self._build_annotations_dict(
-                        phash_annotations, models_cache, image_id=image_id
+                        phash_annotations,
+                        models_cache,
+                        image_id=image_id,
+                        outcome_records=outcome_records,
                     )
                     if not annotations_dict or not any(annotations_dict.values()):
                         logger.debug(f"画像ID {image_id} に保存するアノテーションがありません")
@@ -736,6 +782,7 @@ class AnnotationSaveService:
                 error_details.append(error_msg)
                 error_count += 1
                 logger.opt(exception=True).error(f"保存失敗 phash={phash[:8]}...: {e}")
+        self._flush_outcome_records(outcome_records)
 
         success_count, batch_error_count, batch_error_details = self._save_prepared_batch(
             prepared_items,
@@ -791,6 +838,7 @@ class AnnotationSaveService:
         error_count = 0
         error_details: list[str] = []
         prepared_items: list[_PreparedAnnotationSave] = []
+        outcome_records: list[ErrorRecordData] = []
 
         for image_id, image_annotations in wrapped_results.items():
             try:
@@ -798,6 +846,7 @@ class AnnotationSaveService:
                     image_annotations,
                     models_cache,
                     image_id=image_id,
+                    outcome_records=outcome_records,
                 )
                 if not annotations_dict or not any(annotations_dict.values()):
                     logger.debug(f"画像ID {image_id} に保存するアノテーションがありません")
@@ -813,6 +862,7 @@ class AnnotationSaveService:
                 error_details.append(error_msg)
                 error_count += 1
                 logger.opt(exception=True).error(f"Provider Batch result 保存失敗 image_id={image_id}: {e}")
+        self._flush_outcome_records(outcome_records)
 
         success_count, batch_error_count, batch_error_details = self._save_prepared_batch(
             prepared_items,
@@ -859,8 +909,10 @@ class AnnotationSaveService:
             error_type in {"SAFETY_REFUSAL", "CONTENT_POLICY_REFUSAL", "EMPTY_ANNOTATION"}
             resolved_at IS NULL
 
-        を満たす image_id 集合を取得し、対応する image_path を除外する。
-        path → image_id の解決には `_repository.get_image_id_by_filepath()` を使う。
+        を満たす image_id を候補の中から取得し、対応する image_path を除外する。
+        候補 path を先に image_id へ解決し (``images.path_key`` 索引)、refusal 検索は
+        その ID に絞る (``ix_error_records_image_id_resolved``)。プロジェクト全体の
+        refusal ID 集合は読み込まない。
         DB に未登録の画像 path は filter 対象外として通過させる (新規画像扱い)。
 
         Args:
@@ -872,21 +924,24 @@ class AnnotationSaveService:
         if not image_paths:
             return []
 
+        # ADR 0023 Phase 1.5 (Codex P2 r3209342204): N+1 回避のため、path → image_id
+        # は 1 クエリでバッチ解決する (path_key IN (...) の索引検索)。
+        path_to_image_id = self._image_repo.get_image_ids_by_filepaths(image_paths)
+        candidate_ids = {image_id for image_id in path_to_image_id.values() if image_id is not None}
+        if not candidate_ids:
+            return list(image_paths)
+
         refused_image_ids = set(
             self._error_record_repo.get_error_image_ids(
                 operation_type="annotation",
                 resolved=False,
                 error_types=list(self.REFUSAL_ERROR_TYPES),
+                image_ids=sorted(candidate_ids),
             )
         )
         if not refused_image_ids:
             return list(image_paths)
 
-        # ADR 0023 Phase 1.5 (Codex P2 r3209342204): N+1 回避のため、path → image_id
-        # は 1 クエリでバッチ解決する。`get_image_ids_by_filepaths()` は filename IN
-        # 句 + Python 側 resolve 比較で大量パスを sub-second で処理する。
-        path_to_image_id = self._image_repo.get_image_ids_by_filepaths(image_paths)
-
         filtered: list[str] = []
         excluded_count = 0
         for path in image_paths:
@@ -14,13 +14,17 @@
   推定時間にはジョブ数として寄与する。
 - pricing 未取得の API モデル (litellm に単価がない) は per-image cost = None。
   表示は "—"、バッチ合計では「一部不明」フラグを立てる。
+- 実行履歴のあるモデルは :class:`ModelThroughputStats` の実測値 (1 枚あたりの秒数・
+  トークン数) を優先し、固定仮定は未計測モデルの既定値としてのみ使う。
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from lorairo.services.model_throughput_stats import ModelThroughputStats
 from lorairo.services.pipeline_composition import InferenceLedger, StageModelInfo
+from lorairo.utils.log import logger
 
 # --- 概算用の固定仮定 (後から調整可能なよう module 定数に集約) ---------------
 
@@ -31,7 +35,8 @@ OUTPUT_TOKENS_PER_IMAGE = 400
 """構造化出力 (tags + caption + score) 相当の output トークン概算。"""
 
 SECONDS_PER_JOB = 3.0
-"""推論 1 ジョブの粗い所要秒数 (ワイヤーの `18 jobs · 推定 48s` ≈ 2.7s/job 由来)。"""
+"""推論 1 ジョブの粗い所要秒数 (ワイヤーの `18 jobs · 推定 48s` ≈ 2.7s/job 由来)。
+実測値の無いモデルにのみ使う。"""
 
 _LOCAL_FREE_LABEL = "ローカル（無料）"
 _UNKNOWN_COST_LABEL = "—"
@@ -71,17 +76,27 @@ class BatchCostEstimate:
         total_usd: per-image cost が判明したモデルの概算コスト合計 (USD)。
         has_unknown: pricing 未取得 (per-image cost = None) のモデルを含むか。
             True のとき total_usd は「判明分のみの下限」を意味する。
-        est_seconds: 総推論ジョブ数 × SECONDS_PER_JOB の推定所要秒数。
+        est_seconds: モデルごとの 1 枚あたり秒数 (実測、未計測は SECONDS_PER_JOB)
+            × ステージング枚数の合計。
+        measured_models: 実測の所要時間を使ったモデル数。
     """
 
     total_usd: float
     has_unknown: bool
     est_seconds: float
+    measured_models: int = 0
 
 
 class CostEstimationService:
     """StageModelInfo / InferenceLedger からコストと時間を概算する (Qt-free)。"""
 
+    def __init__(self, throughput: ModelThroughputStats | None = None) -> None:
+        """
+        Args:
+            throughput: モデル別の実測統計。None なら常に固定仮定を使う。
+        """
+        self.throughput = throughput
+
     def per_image_usd(self, model: StageModelInfo) -> float | None:
         """1 枚あたりの概算コスト (USD) を返す。
 
@@ -90,29 +105,56 @@ class CostEstimationService:
 
         Returns:
             ローカル ML モデルは 0.0。pricing 未取得の API モデルは None。
-            それ以外は固定 token 仮定による概算値。
+            それ以外は実測トークン数 (未計測は固定 token 仮定) による概算値。
         """
         if not model.is_api:
             return 0.0
         if model.input_cost_per_token is None or model.output_cost_per_token is None:
             return None
+        input_tokens, output_tokens = self.tokens_per_image(model.litellm_model_id)
+        return input_tokens * model.input_cost_per_token + output_tokens * model.output_cost_per_token
+
+    def tokens_per_image(self, litellm_model_id: str) -> tuple[float, float]:
+        """1 枚あたりの (入力, 出力) トークン数。未計測の値は固定仮定で補う。"""
+        stats = self.throughput.get(litellm_model_id) if self.throughput is not None else None
+        input_tokens = stats.input_tokens_per_image if stats is not None else None
+        output_tokens = stats.output_tokens_per_image if stats is not None else None
         return (
-            INPUT_TOKENS_PER_IMAGE * model.input_cost_per_token
-            + OUTPUT_TOKENS_PER_IMAGE * model.output_cost_per_token
+            input_tokens if input_tokens is not None else INPUT_TOKENS_PER_IMAGE,
+            output_tokens if output_tokens is not None else OUTPUT_TOKENS_PER_IMAGE,
         )
 
+    def seconds_per_image(self, litellm_model_id: str) -> tuple[float, bool]:
+        """1 枚あたりの所要秒数と、それが実測値かどうかを返す。"""
+        if self.throughput is not None:
+            seconds = self.throughput.seconds_per_image(litellm_model_id)
+            if seconds is not None:
+                return seconds, True
+        return SECONDS_PER_JOB, False
+
+    def estimate_seconds(self, litellm_model_ids: list[str], image_count: int) -> tuple[float, int]:
+        """モデル群で image_count 枚を処理する推定秒数と、実測値を使ったモデル数を返す。"""
+        total = 0.0
+        measured = 0
+        for model_id in dict.fromkeys(litellm_model_ids):
+            seconds, is_measured = self.seconds_per_image(model_id)
+            total += seconds * image_count
+            measured += int(is_measured)
+        return total, measured
+
     def estimate_batch(self, ledger: InferenceLedger) -> BatchCostEstimate:
         """推論台帳からバッチ全体のコスト・時間概算を返す。
 
         各ユニークモデルの per-image cost × ステージング枚数を合計する。
         per-image cost が None (pricing 未取得) のモデルは合計から除外しつつ
-        has_unknown を立てる。総時間は総ジョブ数 × SECONDS_PER_JOB。
+        has_unknown を立てる。総時間はモデルごとの 1 枚あたり秒数 × ステージング枚数の合計
+        (未計測モデルは SECONDS_PER_JOB)。
 
         Args:
             ledger: PipelineCompositionService.ledger() の戻り値。
 
         Returns:
-            BatchCostEstimate: total_usd / has_unknown / est_seconds。
+            BatchCostEstimate: total_usd / has_unknown / est_seconds / measured_models。
         """
         total_usd = 0.0
         has_unknown = False
@@ -122,5 +164,27 @@ class CostEstimationService:
                 has_unknown = True
                 continue
             total_usd += per_image * ledger.staged_count
-        est_seconds = ledger.total_jobs * SECONDS_PER_JOB
-        return BatchCostEstimate(total_usd=total_usd, has_unknown=has_unknown, est_seconds=est_seconds)
+        est_seconds, measured_models = self.estimate_seconds(
+            [entry.model.litellm_model_id for entry in ledger.entries], ledger.staged_count
+        )
+        return BatchCostEstimate(
+            total_usd=total_usd,
+            has_unknown=has_unknown,
+            est_seconds=est_seconds,
+            measured_models=measured_models,
+        )
+
+
+def create_cost_estimation_service() -> CostEstimationService:
+    """ServiceContainer の実測統計を使う CostEstimationService を生成する。
+
+    統計を取得できない場合 (初期化失敗・テスト用の差し替え等) は固定仮定のみで見積もる。
+    """
+    from lorairo.services.service_container import get_service_container
+
+    try:
+        throughput = get_service_container().model_throughput_stats
+    except Exception as e:
+        logger.debug(f"スループット統計を取得できないため固定仮定で見積もります: {e}")
+        throughput = None
+    return CostEstimationService(throughput if isinstance(throughput, ModelThroughputStats) else None)
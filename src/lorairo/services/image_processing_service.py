@@ -122,6 +122,7 @@ class ImageProcessingService:
                 progress = int((index + 1) / total_images * 100)
                 progress_callback(progress)
 
+        self.idm.flush_feature_cache()
         logger.info("画像処理が完了しました。")
         if status_callback:
             status_callback("画像処理が完了しました。")
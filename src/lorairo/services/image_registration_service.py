@@ -10,11 +10,12 @@ from pathlib import Path
 from typing import Any, ClassVar
 
 from loguru import logger
-from PIL import Image
 
 from lorairo.filesystem import FileSystemManager
 from lorairo.public_api.exceptions import ImageRegistrationError
 from lorairo.public_api.types import RegistrationResult
+from lorairo.utils.image_decode import decode_image
+from lorairo.utils.image_feature_cache import ImageFeatureCache
 
 
 @dataclass
@@ -43,8 +44,14 @@ class ImageRegistrationService:
     # サポートする画像形式。GUI と同じ FileSystemManager の定義を SSoT とする。
     SUPPORTED_EXTENSIONS: ClassVar[set[str]] = {ext.lower() for ext in FileSystemManager.image_extensions}
 
-    def __init__(self) -> None:
-        """初期化。"""
+    def __init__(self, feature_cache: ImageFeatureCache | None = None) -> None:
+        """初期化。
+
+        Args:
+            feature_cache: 画像特徴量キャッシュ。指定時は pHash / 画像情報を
+                ``(path, size, mtime_ns)`` 単位で再利用し、再スキャン時のデコードを省く。
+        """
+        self._feature_cache = feature_cache
         logger.debug("ImageRegistrationService 初期化")
 
     def register_images(
@@ -93,6 +100,7 @@ class ImageRegistrationService:
                 error_msg = f"{image_file.name}: {e!s}"
                 tally.errors.append(error_msg)
                 logger.warning(f"登録エラー: {error_msg}")
+        self._flush_feature_cache()
 
         result = RegistrationResult(
             total=len(image_files),
@@ -211,7 +219,10 @@ class ImageRegistrationService:
         # 画像を reject せず dedup を見送る」なので broad に捕捉して None を返す (codex review
         # #648 P2)。捕捉できないと外側ループが当該画像を failed に誤計上する。
         try:
-            info = FileSystemManager.get_image_info(image_path)
+            if self._feature_cache is not None:
+                info = self._feature_cache.image_info(image_path, FileSystemManager.get_image_info)
+            else:
+                info = FileSystemManager.get_image_info(image_path)
         except Exception as e:
             logger.warning(f"画像情報取得に失敗、pHash単独dedupを見送り: {image_path.name}, {e}")
             return None
@@ -254,6 +265,7 @@ class ImageRegistrationService:
                     phash_map[phash].append(str(image_file))
             except Exception as e:
                 logger.warning(f"pHash計算失敗: {image_file.name} - {e}")
+        self._flush_feature_cache()
 
         # 重複（2個以上）のみを抽出
         duplicates = {phash: files for phash, files in phash_map.items() if len(files) > 1}
@@ -293,12 +305,26 @@ class ImageRegistrationService:
                           計算失敗時は None。
         """
         try:
-            import imagehash
-
-            img = Image.open(image_path)
-            phash = imagehash.phash(img)
-            return str(phash)
+            if self._feature_cache is not None:
+                return self._feature_cache.phash(image_path, self._compute_phash)
+            return self._compute_phash(image_path)
 
         except Exception as e:
             logger.debug(f"pHash計算失敗: {image_path.name} - {type(e).__name__}")
             return None
+
+    @staticmethod
+    def _compute_phash(image_path: Path) -> str:
+        """画像をデコードして pHash を算出する (キャッシュ無し)。"""
+        import imagehash
+
+        # pHash は重複検出・アノテーション保存の完全一致キーのため、縮小デコード
+        # (max_edge) は使わずフル解像度でデコードする。縮小デコードでは既存 DB の
+        # pHash と一致しなくなる画像が出る。
+        with decode_image(image_path) as img:
+            return str(imagehash.phash(img))
+
+    def _flush_feature_cache(self) -> None:
+        """特徴量キャッシュの未保存分を書き込む (キャッシュ未設定時は何もしない)。"""
+        if self._feature_cache is not None:
+            self._feature_cache.flush()
@@ -0,0 +1,233 @@
+"""
+検索結果の列指向メタデータセット。
+
+``SearchCriteriaProcessor.execute_search_with_filters`` が返し、``DatasetStateManager``
+が保持する。検索結果 10 万件規模では行ごとの dict (キー 20 前後) だけで数百 MB を
+占めるため、キーごとの列にまとめて保持する。int / float だけの列 (id / width /
+height / スコア等) は ``array`` に、文字列列は列内で同一値を共有して格納する。
+
+``Sequence[dict]`` として振る舞うため、従来の list-of-dicts を受け取っていた
+呼び出し元 (len / 添字 / スライス / 反復) はそのまま動く。行 dict は参照された時点で
+組み立てる (遅延 materialize)。
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, overload
+
+# 列に値が無い (元 dict にキーが無かった) ことを表すセンチネル
+_MISSING: Any = object()
+
+
+def _pack_column(values: list[Any]) -> Sequence[Any]:
+    """列の値を型に応じたコンパクトな格納形式に変換する。
+
+    全要素が int (bool を除く) なら ``array('q')``、全要素が float なら ``array('d')``。
+    それ以外は list のまま返し、文字列は列内で同一値のオブジェクトを共有させる。
+    """
+    kinds = {type(value) for value in values}
+    if kinds == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if kinds == {float}:
+        return array("d", values)
+    if str in kinds:
+        shared: dict[str, str] = {}
+        return [shared.setdefault(value, value) if type(value) is str else value for value in values]
+    return values
+
+
+class ImageResultSet(Sequence[dict[str, Any]]):
+    """
+    検索結果メタデータの列指向コンテナ。
+
+    ``get_by_id`` / ``index_of`` は id→行インデックスで O(1)。同じ id が複数行に
+    ある場合は先頭の行を返す。
+
+    行 dict の扱い:
+        - 添字・``get_by_id``・反復・スライスは読み取り用。固定済みの行はその dict を、
+          未固定の行は列から組み立てた新しい dict を返す (参照するだけで行を固定しない)。
+          未固定の行の dict を書き換えても結果セットには残らない。
+        - ``pin_by_id`` で取り出した dict はその行に固定 (pin) され、以後どの経路でも
+          同じオブジェクトを返す。in-place 更新 (アノテーションの遅延 merge 等) は
+          この dict に対して行う。
+    """
+
+    __slots__ = ("_columns", "_index", "_keys", "_pinned", "_size")
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]] | None = None, size: int = 0) -> None:
+        """
+        Args:
+            columns: キー → 列 (長さ ``size``)。値が無い行は ``_MISSING``。
+            size: 行数。
+        """
+        self._columns: dict[str, Sequence[Any]] = dict(columns or {})
+        self._keys: tuple[str, ...] = tuple(self._columns)
+        self._size = size
+        self._pinned: dict[int, dict[str, Any]] = {}
+        self._index: dict[int, int] = {}
+        ids = self._columns.get("id", ())
+        for row, image_id in enumerate(ids):
+            if isinstance(image_id, int) and not isinstance(image_id, bool):
+                self._index.setdefault(image_id, row)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> ImageResultSet:
+        """
+        メタデータ dict の列から結果セットを構築する。
+
+        Args:
+            rows: ``get_images_by_filter`` 形状のメタデータ辞書。``ImageResultSet`` を
+                渡した場合は列を共有するコピーを返す。
+
+        Returns:
+            構築した結果セット。
+        """
+        if isinstance(rows, ImageResultSet):
+            return rows.copy()
+        raw: dict[str, list[Any]] = {}
+        size = 0
+        for row in rows:
+            for key, value in row.items():
+                column = raw.get(key)
+                if column is None:
+                    column = raw[key] = [_MISSING] * size
+                column.append(value)
+            size += 1
+            for column in raw.values():
+                if len(column) < size:
+                    column.append(_MISSING)
+        return cls({key: _pack_column(values) for key, values in raw.items()}, size)
+
+    def copy(self) -> ImageResultSet:
+        """列を共有する浅いコピーを返す (固定済み行 dict も共有する)。"""
+        clone = ImageResultSet.__new__(ImageResultSet)
+        clone._columns = self._columns
+        clone._keys = self._keys
+        clone._size = self._size
+        clone._index = self._index
+        clone._pinned = dict(self._pinned)
+        return clone
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._row_dict(row) for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ImageResultSet index out of range")
+        return self._row_dict(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for row in range(self._size):
+            yield self._row_dict(row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str | bytes):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ImageResultSet(rows={self._size}, columns={list(self._keys)})"
+
+    def has_id(self, image_id: int) -> bool:
+        """画像IDが結果に含まれるか (O(1))。"""
+        return image_id in self._index
+
+    def index_of(self, image_id: int) -> int | None:
+        """画像IDの行インデックスを返す。含まれなければ None。"""
+        return self._index.get(image_id)
+
+    def get_by_id(self, image_id: int) -> dict[str, Any] | None:
+        """
+        画像IDの行 dict を読み取り用に返す (行を固定しない)。
+
+        Args:
+            image_id: 画像ID
+
+        Returns:
+            行のメタデータ辞書。含まれなければ None
+        """
+        row = self._index.get(image_id)
+        return None if row is None else self._row_dict(row)
+
+    def pin_by_id(self, image_id: int) -> dict[str, Any] | None:
+        """
+        画像IDの行を固定し、その live 参照を返す (in-place 更新用)。
+
+        Args:
+            image_id: 画像ID
+
+        Returns:
+            固定した行のメタデータ辞書。含まれなければ None
+        """
+        row = self._index.get(image_id)
+        return None if row is None else self._pin(row)
+
+    def ids_slice(self, start: int, end: int) -> list[int]:
+        """[start:end] 行の画像IDを返す (行 dict を組み立てない)。int の id のみ。"""
+        ids = self._columns.get("id", ())
+        return [
+            image_id
+            for image_id in ids[start:end]
+            if isinstance(image_id, int) and not isinstance(image_id, bool)
+        ]
+
+    def column(self, key: str) -> list[Any]:
+        """
+        1 キー分の値を行順で返す (ソート / 範囲選択用、行 dict を組み立てない)。
+
+        固定済み行の in-place 更新を反映する。キーが無い行は None。
+        """
+        values = self._columns.get(key)
+        result = [None] * self._size if values is None else [None if v is _MISSING else v for v in values]
+        for row, pinned in self._pinned.items():
+            result[row] = pinned.get(key)
+        return result
+
+    def replace(self, image_id: int, metadata: dict[str, Any]) -> bool:
+        """
+        画像IDの行を ``metadata`` (live 参照として固定) で置き換える。
+
+        Returns:
+            置き換えた場合 True、画像IDが結果に含まれない場合 False
+        """
+        row = self._index.get(image_id)
+        if row is None:
+            return False
+        self._pinned[row] = metadata
+        return True
+
+    def _pin(self, row: int) -> dict[str, Any]:
+        pinned = self._pinned.get(row)
+        if pinned is not None:
+            return pinned
+        # 別スレッドと同時に固定しても同じ dict を共有させる
+        return self._pinned.setdefault(row, self._build(row))
+
+    def _row_dict(self, row: int) -> dict[str, Any]:
+        pinned = self._pinned.get(row)
+        return pinned if pinned is not None else self._build(row)
+
+    def _build(self, row: int) -> dict[str, Any]:
+        metadata: dict[str, Any] = {}
+        for key in self._keys:
+            value = self._columns[key][row]
+            if value is not _MISSING:
+                metadata[key] = value
+        return metadata
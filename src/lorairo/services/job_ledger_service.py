@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
+from lorairo.utils.stage_telemetry import StageTiming, TelemetrySnapshot
+
 # ADR 0066 §5 / Issue #754: model installer 用 job_type。
 # OperationType.MODEL_INSTALL (gui/services/operation_events.py) と同値で、
 # 未インストールモデルの明示ダウンロードジョブが本台帳に載る。
@@ -140,6 +142,8 @@ class JobEntry:
     summary: str = ""
     # Issue #805: 実行中ジョブのステージ別進捗 (terminal 後は据え置き、UI は実行中のみ表示)。
     stage_progress: list[StageProgress] = field(default_factory=list)
+    # 終端時にワーカーから届いたステージ別計測 (decode / db_read / inference 等)。
+    telemetry: TelemetrySnapshot | None = None
 
 
 def build_stage_progress(
@@ -323,6 +327,41 @@ class JobLedgerService:
         entry.stage_progress = stages
         return entry
 
+    def set_telemetry(self, job_id: str, telemetry: TelemetrySnapshot) -> JobEntry | None:
+        """ジョブのステージ別計測を記録する。
+
+        Args:
+            job_id: 対象ジョブ識別子。
+            telemetry: ワーカーの計測結果。
+
+        Returns:
+            更新後の JobEntry。未登録の job_id なら None。
+        """
+        entry = self._entries.get(job_id)
+        if entry is None:
+            return None
+        entry.telemetry = telemetry
+        return entry
+
+    def stage_totals(self, job_type: str | None = None) -> list[StageTiming]:
+        """台帳内ジョブのステージ別計測を同名ステージごとに合算する。
+
+        どのステージが時間を使っているかをジョブ種別単位で見るための集計。
+
+        Args:
+            job_type: 対象ジョブ種別 (None なら全種別)。
+
+        Returns:
+            合計秒数の降順に並べたステージ別合計。
+        """
+        totals: dict[str, StageTiming] = {}
+        for entry in self._entries.values():
+            if entry.telemetry is None or (job_type is not None and entry.job_type != job_type):
+                continue
+            for stage in entry.telemetry.stages:
+                totals.setdefault(stage.name, StageTiming(name=stage.name)).merge(stage)
+        return sorted(totals.values(), key=lambda stage: stage.seconds, reverse=True)
+
     def summary(self, *, now: datetime | None = None) -> JobsSummary:
         """サマリ帯 (SummaryStat) 用の集計値を返す (Issue #805)。
 
@@ -0,0 +1,280 @@
+"""モデル別の実測スループット統計 (所要時間・トークン数・失敗率)。
+
+コスト / 所要時間の概算 (:class:`CostEstimationService`) や CLI / ワーカーのチャンクサイズ
+選択は、固定の仮定 (1 ジョブ 3 秒・入力 1500 トークン等) では高速なローカルタガーと
+低速な Vision LLM の両方で桁違いにずれる。実際のアノテーション実行で観測した値を
+モデルごとの指数移動平均 (EWMA) として永続化し、次回以降の見積もりに使う。
+
+統計はプロジェクトに依存しないため、画像特徴量キャッシュと同じ ``cache/`` 配下の
+SQLite に保存する。壊れていたり :data:`THROUGHPUT_STATS_VERSION` が異なる場合は
+:func:`lorairo.utils.sqlite_cache.open_versioned_cache` が作り直す (観測し直せばよい使い捨てのデータ)。
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from lorairo.utils.log import logger
+from lorairo.utils.sqlite_cache import open_versioned_cache
+
+# 保存形式を変えたら上げる。既存の統計は次回オープン時に破棄される。
+THROUGHPUT_STATS_VERSION = 1
+# 画像 1 枚あたりの EWMA 係数。1 回の観測 (N 枚) は N ステップ分の重みを持つ
+# (0.05 → 直近およそ 14 枚で重みが半分になる)。
+PER_IMAGE_ALPHA = 0.05
+# チャンクサイズ推奨で 1 チャンクの所要時間として狙う秒数
+DEFAULT_TARGET_CHUNK_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS model_throughput (
+    model_id TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    images INTEGER NOT NULL,
+    seconds_per_image REAL,
+    input_tokens_per_image REAL,
+    output_tokens_per_image REAL,
+    failure_rate REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+_UPSERT = """
+INSERT INTO model_throughput (
+    model_id, runs, images, seconds_per_image, input_tokens_per_image,
+    output_tokens_per_image, failure_rate, updated_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(model_id) DO UPDATE SET
+    runs = excluded.runs,
+    images = excluded.images,
+    seconds_per_image = excluded.seconds_per_image,
+    input_tokens_per_image = excluded.input_tokens_per_image,
+    output_tokens_per_image = excluded.output_tokens_per_image,
+    failure_rate = excluded.failure_rate,
+    updated_at = excluded.updated_at
+"""
+
+
+@dataclass(frozen=True)
+class ModelThroughput:
+    """1 モデル分の実測統計 (EWMA)。
+
+    Attributes:
+        model_id: ``litellm_model_id``。
+        runs: 観測回数 (ライブラリ呼び出し回数)。
+        images: 観測した画像の累計枚数。
+        seconds_per_image: 1 枚あたりの所要秒数。成功が 1 件も無い観測しか無ければ None。
+        input_tokens_per_image: 1 枚あたりの入力トークン数。ライブラリが使用量を返さなければ None。
+        output_tokens_per_image: 1 枚あたりの出力トークン数。同上。
+        failure_rate: 失敗 (error 付き結果・例外) の割合 (0.0-1.0)。
+        updated_at: 最終更新時刻 (UNIX 秒)。
+    """
+
+    model_id: str
+    runs: int
+    images: int
+    seconds_per_image: float | None
+    input_tokens_per_image: float | None
+    output_tokens_per_image: float | None
+    failure_rate: float
+    updated_at: float
+
+
+def _blend(current: float | None, observed: float | None, weight: float) -> float | None:
+    """EWMA を更新する。どちらかが未観測ならもう一方をそのまま使う。"""
+    if observed is None:
+        return current
+    if current is None:
+        return observed
+    return current + (observed - current) * weight
+
+
+class ModelThroughputStats:
+    """モデル別の実測スループット統計ストア。
+
+    全件をメモリに保持し、更新時のみ SQLite へ書き込む (モデル数は高々数十件)。
+    アノテーションはワーカースレッドや並列ディスパッチのスレッドから記録されるため、
+    アクセスはロックで直列化する。
+    """
+
+    def __init__(self, db_path: Path | str, *, alpha: float = PER_IMAGE_ALPHA) -> None:
+        """
+        Args:
+            db_path: 統計 DB のパス。``":memory:"`` でプロセス内のみの統計
+            alpha: 画像 1 枚あたりの EWMA 係数
+        """
+        self._db_path = str(db_path)
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._conn = self._open()
+        self._stats = self._load()
+
+    def _open(self) -> sqlite3.Connection:
+        return open_versioned_cache(
+            self._db_path, THROUGHPUT_STATS_VERSION, _SCHEMA, label="スループット統計"
+        )
+
+    def _load(self) -> dict[str, ModelThroughput]:
+        rows = self._conn.execute(
+            "SELECT model_id, runs, images, seconds_per_image, input_tokens_per_image, "
+            "output_tokens_per_image, failure_rate, updated_at FROM model_throughput"
+        ).fetchall()
+        return {row[0]: ModelThroughput(*row) for row in rows}
+
+    def record(
+        self,
+        model_id: str,
+        *,
+        images: int,
+        seconds: float,
+        failures: int = 0,
+        input_tokens: int | None = None,
+        output_tokens: int | None = None,
+    ) -> ModelThroughput | None:
+        """1 回のライブラリ呼び出しの観測値を取り込む。
+
+        Args:
+            model_id: 観測したモデル
+            images: 呼び出しの画像枚数
+            seconds: 呼び出しの所要秒数
+            failures: 失敗した画像数 (例外で全滅した場合は images)
+            input_tokens: 呼び出し全体の入力トークン数 (不明なら None)
+            output_tokens: 呼び出し全体の出力トークン数 (不明なら None)
+
+        Returns:
+            更新後の統計。images が 0 なら何もせず None
+        """
+        if images <= 0:
+            return None
+        failures = min(max(failures, 0), images)
+        succeeded = images - failures
+        # 即座に失敗した呼び出しの時間は推論時間を代表しないため、成功が無ければ時間は取り込まない
+        observed_seconds = seconds / images if succeeded > 0 else None
+        observed_input = input_tokens / images if input_tokens is not None else None
+        observed_output = output_tokens / images if output_tokens is not None else None
+        weight = 1.0 - (1.0 - self.alpha) ** images
+
+        with self._lock:
+            current = self._stats.get(model_id)
+            if current is None:
+                updated = ModelThroughput(
+                    model_id=model_id,
+                    runs=1,
+                    images=images,
+                    seconds_per_image=observed_seconds,
+                    input_tokens_per_image=observed_input,
+                    output_tokens_per_image=observed_output,
+                    failure_rate=failures / images,
+                    updated_at=time.time(),
+                )
+            else:
+                updated = ModelThroughput(
+                    model_id=model_id,
+                    runs=current.runs + 1,
+                    images=current.images + images,
+                    seconds_per_image=_blend(current.seconds_per_image, observed_seconds, weight),
+                    input_tokens_per_image=_blend(current.input_tokens_per_image, observed_input, weight),
+                    output_tokens_per_image=_blend(
+                        current.output_tokens_per_image, observed_output, weight
+                    ),
+                    failure_rate=current.failure_rate + (failures / images - current.failure_rate) * weight,
+                    updated_at=time.time(),
+                )
+            self._stats[model_id] = updated
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        _UPSERT,
+                        (
+                            updated.model_id,
+                            updated.runs,
+                            updated.images,
+                            updated.seconds_per_image,
+                            updated.input_tokens_per_image,
+                            updated.output_tokens_per_image,
+                            updated.failure_rate,
+                            updated.updated_at,
+                        ),
+                    )
+            except sqlite3.Error as e:
+                # 永続化に失敗してもプロセス内の統計は使える
+                logger.warning(f"スループット統計の書き込みに失敗しました: {e}")
+        return updated
+
+    def get(self, model_id: str) -> ModelThroughput | None:
+        """モデルの統計を返す。未観測なら None。"""
+        with self._lock:
+            return self._stats.get(model_id)
+
+    def all(self) -> list[ModelThroughput]:
+        """全モデルの統計を model_id 順で返す。"""
+        with self._lock:
+            return [self._stats[model_id] for model_id in sorted(self._stats)]
+
+    def seconds_per_image(self, model_id: str) -> float | None:
+        """1 枚あたりの実測所要秒数。未計測なら None。"""
+        stats = self.get(model_id)
+        return stats.seconds_per_image if stats is not None else None
+
+    def recommend_batch_size(
+        self,
+        model_ids: Iterable[str],
+        *,
+        default: int,
+        minimum: int = 1,
+        maximum: int,
+        target_seconds: float = DEFAULT_TARGET_CHUNK_SECONDS,
+    ) -> int:
+        """1 チャンクの所要時間が target_seconds 前後になる画像枚数を返す。
+
+        チャンク内では指定モデルを順に実行するため、1 枚あたりの秒数はモデルの合計で見積もる。
+        1 モデルでも未計測なら見積もれないため default を返す。
+
+        Args:
+            model_ids: チャンクで実行するモデル
+            default: 見積もれない場合の枚数
+            minimum: 下限
+            maximum: 上限 (チャンクあたりのメモリ使用量の上限)
+            target_seconds: 1 チャンクの目標所要秒数
+
+        Returns:
+            推奨チャンクサイズ
+        """
+        total = 0.0
+        ids = list(dict.fromkeys(model_ids))
+        for model_id in ids:
+            seconds = self.seconds_per_image(model_id)
+            if seconds is None:
+                return default
+            total += seconds
+        if not ids or total <= 0:
+            return default
+        return max(minimum, min(maximum, int(target_seconds / total)))
+
+    def reset(self, model_id: str | None = None) -> int:
+        """統計を削除する。model_id を省略すると全件削除する。
+
+        Returns:
+            削除した件数
+        """
+        with self._lock:
+            targets = [model_id] if model_id is not None else list(self._stats)
+            removed = [target for target in targets if self._stats.pop(target, None) is not None]
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "DELETE FROM model_throughput WHERE model_id = ?", [(m,) for m in removed]
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"スループット統計の削除に失敗しました: {e}")
+        return len(removed)
+
+    def close(self) -> None:
+        """接続を閉じる。"""
+        with self._lock:
+            self._conn.close()
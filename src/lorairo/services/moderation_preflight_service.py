@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from sqlalchemy.exc import IntegrityError
 
@@ -15,6 +15,9 @@ from lorairo.services.annotation_save_service import AnnotationSaveResult, Annot
 from lorairo.services.configuration_service import ConfigurationService
 from lorairo.utils.log import logger
 
+if TYPE_CHECKING:
+    from lorairo.database.schema import ErrorRecordData
+
 MODERATION_LITELLM_MODEL_ID = "openai/omni-moderation-latest"
 MODERATION_PROVIDER = "openai"
 MODERATION_ERROR_TYPE_MISSING_KEY = "moderation_preflight_missing_openai_key"
@@ -91,12 +94,25 @@ class ModerationPreflightService:
         self._annotation_save_service = annotation_save_service
         self._config_service = config_service
         self._moderation_runner = moderation_runner
+        # apply() 実行中の skip 理由バッファ。ループ後に 1 トランザクションで保存する。
+        self._pending_skip_records: list[ErrorRecordData] | None = None
 
     def apply(self, image_paths: list[str]) -> ModerationPreflightResult:
-        """Return image paths that may proceed to WebAPI annotation."""
+        """Return image paths that may proceed to WebAPI annotation.
+
+        Skip reasons are buffered for the whole call and written in one batch at the end.
+        """
         if not image_paths:
             return ModerationPreflightResult(allowed_paths=[])
 
+        self._pending_skip_records = []
+        try:
+            return self._apply(image_paths)
+        finally:
+            records, self._pending_skip_records = self._pending_skip_records, None
+            self._flush_skip_records(records)
+
+    def _apply(self, image_paths: list[str]) -> ModerationPreflightResult:
         path_to_image_id = self._image_repo.get_image_ids_by_filepaths(image_paths)
         known_ids = [image_id for image_id in set(path_to_image_id.values()) if image_id is not None]
         latest_rating_map = (
@@ -388,19 +404,18 @@ class ModerationPreflightService:
         reason: str,
         message: str,
     ) -> ModerationPreflightSkip:
-        try:
-            self._error_record_repo.save_error_record(
-                operation_type="annotation",
-                error_type=reason,
-                error_message=message,
-                image_id=image_id,
-                file_path=image_path,
-                model_name=MODERATION_LITELLM_MODEL_ID,
-            )
-        except Exception:
-            logger.opt(exception=True).warning(
-                f"moderation preflight skip reason could not be saved: path={image_path}"
-            )
+        record: ErrorRecordData = {
+            "operation_type": "annotation",
+            "error_type": reason,
+            "error_message": message,
+            "image_id": image_id,
+            "file_path": image_path,
+            "model_name": MODERATION_LITELLM_MODEL_ID,
+        }
+        if self._pending_skip_records is not None:
+            self._pending_skip_records.append(record)
+        else:
+            self._flush_skip_records([record])
         return ModerationPreflightSkip(
             image_path=image_path,
             image_id=image_id,
@@ -408,6 +423,16 @@ class ModerationPreflightService:
             message=message,
         )
 
+    def _flush_skip_records(self, records: list[ErrorRecordData]) -> None:
+        if not records:
+            return
+        try:
+            self._error_record_repo.save_error_records_batch(records)
+        except Exception:
+            logger.opt(exception=True).warning(
+                f"moderation preflight skip reasons could not be saved: count={len(records)}"
+            )
+
 
 def build_annotation_runner_runner(execute_annotation: Callable[..., Any]) -> ModerationRunner:
     """Adapt `AnnotationRunner.execute_annotation` to the moderation runner protocol."""
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from ..database.db_manager import ImageDatabaseManager
+from .image_result_set import ImageResultSet
 from .search_models import SearchConditions
 
 if TYPE_CHECKING:
@@ -131,7 +132,7 @@ class SearchCriteriaProcessor:
         self.db_manager = db_manager
         logger.debug("SearchCriteriaProcessor initialized")
 
-    def execute_search_with_filters(self, conditions: SearchConditions) -> tuple[list[dict[str, Any]], int]:
+    def execute_search_with_filters(self, conditions: SearchConditions) -> tuple[ImageResultSet, int]:
         """
         統一検索実行（直接呼び出し方式）
 
@@ -142,7 +143,7 @@ class SearchCriteriaProcessor:
             conditions: 検索条件オブジェクト
 
         Returns:
-            tuple: (検索結果リスト, 総件数)
+            tuple: (検索結果 (列指向の ImageResultSet), 総件数)
         """
         try:
             # フロントエンドフィルターが必要な条件のみ分離
@@ -169,7 +170,8 @@ class SearchCriteriaProcessor:
                 total_count,
                 applied_frontend_filters,
             )
-            return images, reported_count
+            # 行 dict の list は GUI に保持させず列指向へ詰め替える (10 万件規模のメモリ削減)
+            return ImageResultSet.from_rows(images), reported_count
 
         except Exception as e:
             logger.opt(exception=True).error(f"検索実行中にエラーが発生しました: {e}")
@@ -6,12 +6,13 @@ Phase 1: Qt依存除去による CLI対応
 """
 
 import os
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
 
-    from sqlalchemy.orm import Session
+    from sqlalchemy.orm import Session, sessionmaker
 
     from lorairo.annotation.annotator_adapter import AnnotatorLibraryAdapter
     from lorairo.services.annotation_save_service import AnnotationSaveService
@@ -19,10 +20,17 @@ if TYPE_CHECKING:
     from lorairo.services.refinement_service import RefinementService
     from lorairo.services.tag_management_service import TagManagementService
 
+from ..annotation.inference_cache import DEFAULT_MAX_BYTES, InferenceResultCache
 from ..database.db_core import DefaultSessionLocal, ensure_tag_db_initialized
 from ..database.db_manager import ImageDatabaseManager
 from ..database.repository.image import ImageRepository
 from ..filesystem import FileSystemManager
+from ..utils.config import (
+    DEFAULT_FEATURE_CACHE_PATH,
+    DEFAULT_INFERENCE_CACHE_PATH,
+    DEFAULT_THROUGHPUT_STATS_PATH,
+)
+from ..utils.image_feature_cache import ImageFeatureCache
 from ..utils.log import logger
 from .configuration_service import ConfigurationService
 from .dataset_export_service import DatasetExportService
@@ -30,6 +38,7 @@ from .image_processing_service import ImageProcessingService
 from .image_registration_service import ImageRegistrationService
 from .model_registry_protocol import ModelRegistryServiceProtocol
 from .model_sync_service import ModelSyncService
+from .model_throughput_stats import ModelThroughputStats
 from .project_management_service import ProjectManagementService
 
 
@@ -98,12 +107,28 @@ class ServiceContainer:
         self._project_management_service: ProjectManagementService | None = None
         self._image_registration_service: ImageRegistrationService | None = None
 
+        # 画像特徴量キャッシュ (pHash / 画像情報、プロジェクト横断)
+        self._image_feature_cache: ImageFeatureCache | None = None
+        self._inference_cache: InferenceResultCache | None = None
+        self._inference_cache_resolved = False
+        self._model_throughput_stats: ModelThroughputStats | None = None
+        self._model_throughput_stats_resolved = False
+
         # アノテーション保存サービス
         self._annotation_save_service: AnnotationSaveService | None = None
 
         # Provider Batch 共通 workflow サービス
         self._provider_batch_workflow_service: ProviderBatchWorkflowService | None = None
 
+        # set_active_project の状態。session factory (書き込み / 読み取り専用) は DB ファイル
+        # 単位でキャッシュし、常駐プロセス (lorairo-cli serve) でプロジェクトを往復しても
+        # engine を作り直さない
+        self._active_project_db_path: Path | None = None
+        self._default_img_db_path: Path | None = None
+        self._project_session_factories: dict[
+            Path, tuple[tuple[int, int], sessionmaker[Session], sessionmaker[Session]]
+        ] = {}
+
     @property
     def config_service(self) -> ConfigurationService:
         """設定サービス取得（遅延初期化）"""
@@ -151,6 +176,7 @@ class ServiceContainer:
                 self.config_service,
                 self.file_system_manager,
                 image_repo=self.image_repository,
+                feature_cache=self.image_feature_cache,
             )
             logger.debug("ImageDatabaseManager初期化完了")
         return self._db_manager
@@ -220,8 +246,17 @@ class ServiceContainer:
         """
         if self._annotator_library is None:
             from lorairo.annotation.annotator_adapter import AnnotatorLibraryAdapter
+            from lorairo.annotation.model_residency import ModelResidencyManager
 
-            self._annotator_library = AnnotatorLibraryAdapter(self.config_service)
+            self._annotator_library = AnnotatorLibraryAdapter(
+                self.config_service,
+                inference_cache=self.inference_cache,
+                model_residency=ModelResidencyManager.from_config(self.config_service),
+                throughput_stats=self.model_throughput_stats,
+                per_model_timing=bool(
+                    self.config_service.get_setting("annotation", "per_model_throughput", False)
+                ),
+            )
             logger.info("AnnotatorLibraryAdapter初期化完了（Phase 4統合）")
         return self._annotator_library
 
@@ -325,10 +360,66 @@ class ServiceContainer:
     def image_registration_service(self) -> ImageRegistrationService:
         """画像登録サービス取得（遅延初期化）"""
         if self._image_registration_service is None:
-            self._image_registration_service = ImageRegistrationService()
+            self._image_registration_service = ImageRegistrationService(
+                feature_cache=self.image_feature_cache
+            )
             logger.debug("ImageRegistrationService初期化完了")
         return self._image_registration_service
 
+    @property
+    def image_feature_cache(self) -> ImageFeatureCache:
+        """画像特徴量キャッシュ取得（遅延初期化）
+
+        ファイル識別子 (path, size, mtime_ns) 単位の pHash / 画像情報キャッシュ。
+        プロジェクトに依存しないため切り替え時も破棄しない。
+        """
+        if self._image_feature_cache is None:
+            self._image_feature_cache = ImageFeatureCache(DEFAULT_FEATURE_CACHE_PATH)
+            logger.debug(f"ImageFeatureCache初期化完了: {DEFAULT_FEATURE_CACHE_PATH}")
+        return self._image_feature_cache
+
+    @property
+    def inference_cache(self) -> InferenceResultCache | None:
+        """推論結果キャッシュ取得（遅延初期化）
+
+        設定 ``annotation.inference_cache`` が無効なら None。画像内容 (pHash + サイズ) を
+        キーにするためプロジェクトに依存せず、切り替え時も破棄しない。
+        """
+        if not self._inference_cache_resolved:
+            self._inference_cache_resolved = True
+            if self.config_service.get_setting("annotation", "inference_cache", True) is True:
+                max_mb = self.config_service.get_setting("annotation", "inference_cache_max_mb", None)
+                max_bytes = (
+                    int(max_mb * 1024 * 1024)
+                    if isinstance(max_mb, int | float) and not isinstance(max_mb, bool) and max_mb > 0
+                    else DEFAULT_MAX_BYTES
+                )
+                try:
+                    self._inference_cache = InferenceResultCache(
+                        DEFAULT_INFERENCE_CACHE_PATH, max_bytes=max_bytes
+                    )
+                    logger.debug(f"InferenceResultCache初期化完了: {DEFAULT_INFERENCE_CACHE_PATH}")
+                except Exception as e:
+                    # キャッシュが使えなくても推論は続ける
+                    logger.warning(f"推論結果キャッシュを開けないため無効化します: {e}")
+        return self._inference_cache
+
+    @property
+    def model_throughput_stats(self) -> ModelThroughputStats | None:
+        """モデル別実測スループット統計取得（遅延初期化）
+
+        アノテーション実行で観測した所要時間・トークン数・失敗率を記録し、コスト / 所要時間の
+        概算とチャンクサイズ選択に使う。プロジェクト横断。開けなければ None (固定仮定を使う)。
+        """
+        if not self._model_throughput_stats_resolved:
+            self._model_throughput_stats_resolved = True
+            try:
+                self._model_throughput_stats = ModelThroughputStats(DEFAULT_THROUGHPUT_STATS_PATH)
+                logger.debug(f"ModelThroughputStats初期化完了: {DEFAULT_THROUGHPUT_STATS_PATH}")
+            except Exception as e:
+                logger.warning(f"スループット統計を開けないため固定の見積もりを使います: {e}")
+        return self._model_throughput_stats
+
     @property
     def annotation_save_service(self) -> "AnnotationSaveService":
         """アノテーション保存サービス取得（遅延初期化）
@@ -384,6 +475,10 @@ class ServiceContainer:
         依存するサービス (db_manager, dataset_export_service 等) もリセットし、
         次回参照時に新しい image_repository を使って再初期化させる。
 
+        既にアクティブな同一 DB への切替は何もしない (依存サービスを保持する)。
+        セッションファクトリは DB ファイル単位でキャッシュし、ファイルが作り直された
+        場合だけ engine を作り直す。
+
         Args:
             project_name: 切り替えるプロジェクト名。
 
@@ -391,23 +486,90 @@ class ServiceContainer:
             ProjectNotFoundError: プロジェクトが見つからない場合。
         """
         from ..database import db_core
-        from ..database.db_core import create_project_session_factory
 
         project_info = self.project_management_service.get_project(project_name)
         db_path = project_info.path / "image_database.db"
 
+        cached = self._project_session_factories.get(db_path)
+        if (
+            self._active_project_db_path == db_path
+            and cached is not None
+            and cached[0] == _file_identity(db_path)
+        ):
+            db_core.IMG_DB_PATH = db_path
+            return
+
+        if self._default_img_db_path is None:
+            self._default_img_db_path = db_core.IMG_DB_PATH
+
         # P1: _get_current_project_id() が get_current_project_root() → IMG_DB_PATH.parent を
         # 参照するため、セッション切り替えと同時にグローバルも更新して project_id が
         # 正しいプロジェクトに紐付くようにする
         db_core.IMG_DB_PATH = db_path
 
-        session_factory = create_project_session_factory(db_path)
-        self._image_repository = ImageRepository(session_factory=session_factory)
+        session_factory, read_session_factory = self._project_session_factory(db_path)
+        self._image_repository = ImageRepository(
+            session_factory=session_factory, read_session_factory=read_session_factory
+        )
+        self._active_project_db_path = db_path
 
         # FileSystemManager をプロジェクトディレクトリで初期化（CLI の DB 書き込みに必要）
         self.file_system_manager.initialize(project_info.path)
 
-        # 依存サービスをリセット（次参照時に新しい image_repository で再初期化）
+        self._reset_project_dependent_services()
+
+        logger.info(f"アクティブプロジェクト切替: {project_name} -> {db_path}")
+
+    def clear_active_project(self) -> None:
+        """set_active_project を取り消し、プロジェクト未指定の状態に戻す。
+
+        常駐プロセスで ``--project`` を伴わないリクエストへ前のプロジェクトの
+        リポジトリが漏れないようにする。キャッシュ済みのセッションファクトリは保持する。
+        """
+        if self._active_project_db_path is None:
+            return
+
+        from ..database import db_core
+
+        if self._default_img_db_path is not None:
+            db_core.IMG_DB_PATH = self._default_img_db_path
+        self._active_project_db_path = None
+        self._image_repository = None
+        self._file_system_manager = None
+        self._reset_project_dependent_services()
+        logger.debug("アクティブプロジェクトを解除")
+
+    @property
+    def active_project_db_path(self) -> Path | None:
+        """set_active_project で切り替えた DB パス (未切替なら None)"""
+        return self._active_project_db_path
+
+    def _project_session_factory(
+        self, db_path: Path
+    ) -> "tuple[sessionmaker[Session], sessionmaker[Session]]":
+        """DB ファイル単位でキャッシュした (書き込み, 読み取り専用) セッションファクトリを返す。"""
+        from ..database.db_core import create_project_session_factories
+
+        cached = self._project_session_factories.pop(db_path, None)
+        if cached is not None:
+            identity, session_factory, read_session_factory = cached
+            if identity == _file_identity(db_path):
+                self._project_session_factories[db_path] = cached
+                return session_factory, read_session_factory
+            # 削除・再作成された DB ファイルを古い接続で掴み続けない
+            _dispose_session_factory(session_factory)
+            _dispose_session_factory(read_session_factory)
+
+        session_factory, read_session_factory = create_project_session_factories(db_path)
+        self._project_session_factories[db_path] = (
+            _file_identity(db_path),
+            session_factory,
+            read_session_factory,
+        )
+        return session_factory, read_session_factory
+
+    def _reset_project_dependent_services(self) -> None:
+        """image_repository に依存するサービスをリセットする (次回参照時に再初期化)。"""
         self._db_manager = None
         self._dataset_export_service = None
         self._image_processing_service = None
@@ -418,8 +580,6 @@ class ServiceContainer:
         # session factory で作り直す (#931 Codex P2)。
         self._refinement_service = None
 
-        logger.info(f"アクティブプロジェクト切替: {project_name} -> {db_path}")
-
     def get_service_summary(self) -> dict[str, Any]:
         """サービス初期化状況のサマリー取得
 
@@ -441,6 +601,9 @@ class ServiceContainer:
                 "favorite_filters_service": self._favorite_filters_service is not None,
                 "project_management_service": self._project_management_service is not None,
                 "image_registration_service": self._image_registration_service is not None,
+                "image_feature_cache": self._image_feature_cache is not None,
+                "inference_cache": self._inference_cache is not None,
+                "model_throughput_stats": self._model_throughput_stats is not None,
                 "provider_batch_workflow_service": self._provider_batch_workflow_service is not None,
             },
             "container_initialized": ServiceContainer._initialized,
@@ -448,8 +611,38 @@ class ServiceContainer:
             if self._use_production_mode
             else "Phase 1-2 (Mock Implementation)",
             "environment": "CLI" if self._cli_mode else "GUI",
+            "database_pools": self._database_pool_summary(),
         }
 
+    def _database_pool_summary(self) -> dict[str, Any]:
+        """アクティブな image_repository の書き込み / 読み取りエンジンのプール計測値。
+
+        image_repository 未初期化、またはエンジンを特定できない場合は空 dict。
+        """
+        if self._image_repository is None:
+            return {}
+
+        from sqlalchemy.engine import Engine
+
+        from ..database import db_core
+        from ..database.pool_metrics import get_engine_metrics
+
+        def _engine_of(factory: Any, default: Any) -> Engine | None:
+            if factory in (db_core.DefaultSessionLocal, db_core.DefaultReadSessionLocal):
+                bind = default
+            else:
+                bind = getattr(factory, "kw", {}).get("bind")
+            return bind if isinstance(bind, Engine) else None
+
+        write_engine = _engine_of(self._image_repository.session_factory, db_core.default_engine)
+        read_engine = _engine_of(self._image_repository.read_session_factory, db_core.default_read_engine)
+        summary: dict[str, Any] = {}
+        if write_engine is not None:
+            summary["write"] = get_engine_metrics(write_engine)
+        if read_engine is not None and read_engine is not write_engine:
+            summary["read"] = get_engine_metrics(read_engine)
+        return summary
+
     def reset_container(self) -> None:
         """ServiceContainer状態リセット（主にテスト用）
 
@@ -466,6 +659,10 @@ class ServiceContainer:
         self._dataset_export_service = None
         self._model_sync_service = None
         self._model_registry = None
+        # 追跡対象から外れるロード済みモデルが残らないよう解放する
+        model_residency = getattr(self._annotator_library, "model_residency", None)
+        if model_residency is not None:
+            model_residency.clear()
         self._annotator_library = None
         self._tag_management_service = None
         self._refinement_service = None
@@ -474,6 +671,22 @@ class ServiceContainer:
         self._image_registration_service = None
         self._annotation_save_service = None
         self._provider_batch_workflow_service = None
+        if self._image_feature_cache is not None:
+            self._image_feature_cache.close()
+            self._image_feature_cache = None
+        if self._inference_cache is not None:
+            self._inference_cache.close()
+            self._inference_cache = None
+        self._inference_cache_resolved = False
+        if self._model_throughput_stats is not None:
+            self._model_throughput_stats.close()
+            self._model_throughput_stats = None
+        self._model_throughput_stats_resolved = False
+        for _identity, session_factory, read_session_factory in self._project_session_factories.values():
+            _dispose_session_factory(session_factory)
+            _dispose_session_factory(read_session_factory)
+        self._project_session_factories.clear()
+        self._active_project_db_path = None
 
         # クラスレベルリセット
         ServiceContainer._instance = None
@@ -529,6 +742,22 @@ class ServiceContainer:
         return self._use_production_mode
 
 
+def _file_identity(path: Path) -> tuple[int, int]:
+    """DB ファイルの同一性 (st_dev, st_ino)。存在しなければ (0, 0)。"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return (0, 0)
+    return (stat.st_dev, stat.st_ino)
+
+
+def _dispose_session_factory(session_factory: "sessionmaker[Session]") -> None:
+    """セッションファクトリが束縛している engine の接続を閉じる。"""
+    bind = session_factory.kw.get("bind")
+    if bind is not None:
+        bind.dispose()
+
+
 # 便利な関数でサービス取得を簡略化
 def get_service_container() -> ServiceContainer:
     """ServiceContainerシングルトンインスタンス取得"""
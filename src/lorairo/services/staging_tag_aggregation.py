@@ -146,22 +146,32 @@ class StagingTagAggregationService:
 
         from sqlalchemy import select
 
-        from lorairo.database.schema import Tag
+        from lorairo.database.schema import Tag, TagString
 
-        all_rows: list[tuple[int, str, bool | None]] = []
+        id_rows: list[tuple[int, int, bool | None]] = []
+        # タグ行は整数 ID だけ読み、文字列は出現した語彙 ID ぶんだけ後から 1 回ずつ引く。
+        # 同じタグは同じ文字列オブジェクトを共有する (大量行でのメモリ削減)。
+        vocabulary: dict[int, str] = {}
         session = self._db.image_repo.get_session()
         with session:
             for i in range(0, len(image_ids), _CHUNK_SIZE):
                 chunk = image_ids[i : i + _CHUNK_SIZE]
                 chunk_rows = session.execute(
-                    select(Tag.image_id, Tag.tag, Tag.is_edited_manually).where(
+                    select(Tag.image_id, Tag.tag_string_id, Tag.is_edited_manually).where(
                         Tag.image_id.in_(chunk),
                         Tag.rejected_at.is_(None),
                     )
                 ).all()
-                all_rows.extend(
-                    (row.image_id, row.tag, row.is_edited_manually)
+                id_rows.extend(
+                    (row.image_id, row.tag_string_id, row.is_edited_manually)
                     for row in chunk_rows
                     if row.image_id is not None
                 )
-        return all_rows
+            string_ids = sorted({string_id for _, string_id, _ in id_rows})
+            for i in range(0, len(string_ids), _CHUNK_SIZE):
+                chunk = string_ids[i : i + _CHUNK_SIZE]
+                for string_id, tag in session.execute(
+                    select(TagString.id, TagString.tag).where(TagString.id.in_(chunk))
+                ):
+                    vocabulary[string_id] = tag
+        return [(image_id, vocabulary[string_id], is_manual) for image_id, string_id, is_manual in id_rows]
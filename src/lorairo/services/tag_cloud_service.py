@@ -237,7 +237,7 @@ class TagCloudService:
         """未 reject タグを全ロードして {image_id: [tag, ...]} を返す。"""
         from sqlalchemy import select
 
-        from lorairo.database.schema import Image, Tag
+        from lorairo.database.schema import Image, Tag, TagString
 
         result: dict[int, list[str]] = {}
         try:
@@ -246,10 +246,17 @@ class TagCloudService:
                 image_ids = [row[0] for row in session.execute(select(Image.id)).all()]
                 for iid in image_ids:
                     result[iid] = []
-                rows = session.execute(select(Tag.image_id, Tag.tag).where(Tag.rejected_at.is_(None))).all()
-                for image_id, tag in rows:
+                # タグ行は整数 ID だけ読み、文字列は語彙から 1 回ずつ引いて共有する。
+                vocabulary = {
+                    string_id: tag.lower()
+                    for string_id, tag in session.execute(select(TagString.id, TagString.tag)).all()
+                }
+                rows = session.execute(
+                    select(Tag.image_id, Tag.tag_string_id).where(Tag.rejected_at.is_(None))
+                ).all()
+                for image_id, string_id in rows:
                     if image_id in result:
-                        result[image_id].append(tag.lower())
+                        result[image_id].append(vocabulary[string_id])
         except Exception as exc:
             logger.opt(exception=True).error(f"タグ読込エラー: {exc}")
             raise
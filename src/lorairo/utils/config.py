@@ -28,6 +28,9 @@ PROJECT_ROOT = get_project_root()
 DEFAULT_CONFIG_PATH = PROJECT_ROOT / "config" / "lorairo.toml"
 DEFAULT_LOG_PATH = PROJECT_ROOT / "logs" / "lorairo.log"
 DEFAULT_CLI_LOG_PATH = PROJECT_ROOT / "logs" / "lorairo-cli.log"
+DEFAULT_FEATURE_CACHE_PATH = PROJECT_ROOT / "cache" / "image_features.sqlite"
+DEFAULT_INFERENCE_CACHE_PATH = PROJECT_ROOT / "cache" / "inference_results.sqlite"
+DEFAULT_THROUGHPUT_STATS_PATH = PROJECT_ROOT / "cache" / "model_throughput.sqlite"
 
 # Runtime defaults used after merging user configuration.
 # Keep this as the single source of truth for default configuration values.
@@ -107,9 +110,54 @@ DEFAULT_CONFIG = {
         # DB に併用すると一時的な書き込み競合が起こり得るため、即時失敗せず一定時間
         # リトライ待機する (PRAGMA busy_timeout / Issue #767)。
         "busy_timeout_ms": 30000,
+        # 検索・件数・facet 用の読み取り専用エンジンの常駐接続数。書き込みは別エンジンで
+        # プロセス内直列化するため、読み取りは書き込みトランザクション中も待たされない。
+        "read_pool_size": 4,
+        # クエリのレイテンシ / EXPLAIN QUERY PLAN 計測 (診断用、既定は無効)。
+        # slow_query_ms 以上かかった SELECT のプランを記録し、全件走査を検出する。
+        "query_profiling": False,
+        "slow_query_ms": 50,
+        # DB サイズと空きメモリから cache_size / mmap_size / temp_store を調整する。
+        "storage_tuning": True,
+        # 一括登録・アノテーション保存の後のメンテナンス (database/maintenance.py)。
+        # 前回の ANALYZE 以降この行数を書き込んだら統計を更新し、WAL がこのサイズを
+        # 超えたら切り詰める。終了時には空きページ率が vacuum_free_ratio を超えたら
+        # 1 回あたり idle_vacuum_pages ページまで返却する (終了を長く止めない)。
+        "analyze_after_rows": 1000,
+        "wal_truncate_mb": 64,
+        "optimize_interval_s": 3600,
+        "vacuum_free_ratio": 0.1,
+        "idle_vacuum_pages": 2048,
         # Note: tag_db_package and tag_db_filename were removed (2026-01-02)
         # Tag databases are now managed via genai-tag-db-tools public API (initialize_databases)
     },
+    "annotation": {
+        # WebAPI モデルを (モデル × 画像チャンク) 単位で並列送信する (既定は無効: 従来の一括呼び出し)。
+        # provider ごとにトークンバケットのレート制限・429 再試行・AIMD 同時実行数調整を行い、
+        # 完了したチャンクから順に DB へ保存する。
+        "concurrent_webapi": False,
+        "webapi_chunk_size": 0,  # 1 リクエストあたりの画像数。0 = 実測スループットから自動 (未計測は 4)
+        "webapi_max_attempts": 4,  # 1 リクエストの最大試行回数 (初回を含む)
+        # provider 別の契約クォータ。未記載の provider は "default" を使う。
+        "provider_limits": {
+            "default": {"requests_per_minute": 60, "max_concurrency": 4},
+            "openai": {"requests_per_minute": 500, "max_concurrency": 16},
+            "anthropic": {"requests_per_minute": 50, "max_concurrency": 8},
+            "google": {"requests_per_minute": 60, "max_concurrency": 8},
+            "openrouter": {"requests_per_minute": 200, "max_concurrency": 8},
+        },
+        # 推論結果キャッシュ (pHash + ファイルサイズ + モデル + バージョン + プロンプトで引く)。
+        # 重複画像の再アノテーションやクラッシュ後の再実行で推論 / API 呼び出しを省く。
+        # 中身の確認・削除は `lorairo-cli annotate cache stats|clear`。
+        "inference_cache": True,
+        "inference_cache_max_mb": 1024,  # 合計サイズ上限。超えたら古い順に削除
+        # ロード済みローカル ML モデルを実行間で保持するメモリ予算 (MiB)。
+        # 超えたら最後に使ったのが古いモデルから解放する。0 = 物理メモリの半分。
+        "local_model_memory_budget_mb": 0,
+        # 複数モデルを指定した呼び出しをモデルごとに分けて実行し、モデル別の所要時間を
+        # スループット統計に記録する。既定は無効 (1 回の呼び出しのまま、単一モデルの呼び出しだけ記録)。
+        "per_model_throughput": False,
+    },
     "log": {"level": "INFO", "file_path": str(DEFAULT_LOG_PATH), "rotation": "25 MB", "levels": {}},
     "model_selection": {
         # Issue #249: route preference の永続化。
@@ -119,6 +167,12 @@ DEFAULT_CONFIG = {
         # warning log + auto 表示にフォールバックする (configuration_window.py 参照)。
         "route_preference": "auto",
     },
+    "gui": {
+        # 検索結果サムネイルの表示方式。paged | virtual
+        # paged: ページ単位の QGraphicsScene 表示 (既定)
+        # virtual: 検索結果全件を連続スクロールする仮想化グリッド (見えているセルのみ読み込む)
+        "thumbnail_grid": "paged",
+    },
 }
 
 LEGACY_BLANK_AS_DEFAULT_KEYS = {
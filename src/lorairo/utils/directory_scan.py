@@ -0,0 +1,180 @@
+"""``os.scandir`` ベースの並列ディレクトリスキャナ。
+
+``Path.rglob("*")`` + エントリ毎の ``is_file()`` は、ネットワークドライブや 9p マウント上の
+データセットではエントリ数分の stat 往復になり、全件列挙が終わるまで後続処理を始められない。
+
+本モジュールはサブディレクトリ単位で ``os.scandir`` をスレッドプールに投げ、
+見つかった画像をパス順 (各ディレクトリ内を名前順にした深さ優先) で逐次 yield する。``DirEntry`` の型情報 (多くの環境で stat 不要) を使い、
+同じディレクトリ一覧から画像と同名の ``.txt`` / ``.caption`` サイドカーも対応付けるため、
+呼び出し側でサイドカーの存在確認 (``exists()``) を画像ごとに行う必要がない。
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Collection, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .log import logger
+
+# サブツリー走査の並列数。I/O 待ちが支配的なため CPU 数とは独立に決める。
+DEFAULT_SCAN_WORKERS = 8
+
+# キャンセル確認の間隔 (秒)。巨大ディレクトリの一覧待ち中もこの間隔で中断できる。
+_CANCEL_POLL_INTERVAL = 0.1
+
+TAG_SIDECAR_SUFFIX = ".txt"
+CAPTION_SIDECAR_SUFFIX = ".caption"
+
+
+@dataclass(frozen=True)
+class ScannedImage:
+    """スキャンで見つかった画像と、同じディレクトリにあるサイドカーファイル。
+
+    Attributes:
+        path: 画像ファイルパス
+        tag_path: 同名の ``.txt`` (タグ) ファイル。無ければ None
+        caption_path: 同名の ``.caption`` ファイル。無ければ None
+    """
+
+    path: Path
+    tag_path: Path | None = None
+    caption_path: Path | None = None
+
+    @property
+    def has_sidecars(self) -> bool:
+        """サイドカーファイルが1つ以上あるか。"""
+        return self.tag_path is not None or self.caption_path is not None
+
+
+@dataclass
+class _DirectoryListing:
+    images: list[ScannedImage] = field(default_factory=list)
+    subdirectories: list[str] = field(default_factory=list)
+
+
+def _scan_directory(directory: str, extensions: frozenset[str]) -> _DirectoryListing:
+    """1ディレクトリ分を列挙し、画像 (サイドカー付き) とサブディレクトリを名前順で返す。
+
+    読めないディレクトリ・エントリは ``rglob`` と同様に読み飛ばす。
+    """
+    listing = _DirectoryListing()
+    file_names: dict[str, str] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    # rglob と同じくディレクトリのシンボリックリンクは辿らない
+                    if entry.is_dir(follow_symlinks=False):
+                        listing.subdirectories.append(entry.path)
+                    elif entry.is_file():
+                        file_names[os.path.normcase(entry.name)] = entry.name
+                except OSError as e:
+                    logger.debug(f"エントリを読み飛ばします: {entry.path}, {e}")
+    except OSError as e:
+        logger.warning(f"ディレクトリを読み込めません: {directory}, {e}")
+        return listing
+
+    for name in file_names.values():
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in extensions:
+            continue
+        # Path.with_suffix と同じく最後の拡張子だけを置き換えた名前で照合する
+        tag_name = file_names.get(os.path.normcase(stem + TAG_SIDECAR_SUFFIX))
+        caption_name = file_names.get(os.path.normcase(stem + CAPTION_SIDECAR_SUFFIX))
+        listing.images.append(
+            ScannedImage(
+                path=Path(directory, name),
+                tag_path=Path(directory, tag_name) if tag_name else None,
+                caption_path=Path(directory, caption_name) if caption_name else None,
+            )
+        )
+    listing.images.sort(key=lambda scanned: scanned.path.name)
+    listing.subdirectories.sort(key=os.path.basename)
+    return listing
+
+
+_Entry = ScannedImage | Future[_DirectoryListing]
+
+
+def _ordered_entries(
+    listing: _DirectoryListing, submit: Callable[[str], Future[_DirectoryListing]]
+) -> Iterator[_Entry]:
+    """画像とサブディレクトリ (列挙を投入済みの Future) を名前順に並べて返す。
+
+    サブディレクトリはここで一括投入するため、消費が追いつく前に並列で列挙が進む。
+    """
+    keyed: list[tuple[str, _Entry]] = [(image.path.name, image) for image in listing.images]
+    keyed.extend(
+        (os.path.basename(subdirectory), submit(subdirectory)) for subdirectory in listing.subdirectories
+    )
+    keyed.sort(key=lambda pair: pair[0])
+    return (entry for _name, entry in keyed)
+
+
+def _wait_listing(
+    future: Future[_DirectoryListing], is_canceled: Callable[[], bool] | None
+) -> _DirectoryListing | None:
+    """列挙結果を待つ。キャンセルされたら None。"""
+    while True:
+        if is_canceled is not None and is_canceled():
+            return None
+        try:
+            return future.result(timeout=_CANCEL_POLL_INTERVAL)
+        except TimeoutError:
+            continue
+
+
+def scan_image_files(
+    root: Path,
+    extensions: Collection[str],
+    *,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    is_canceled: Callable[[], bool] | None = None,
+) -> Iterator[ScannedImage]:
+    """ディレクトリ配下の画像を再帰的に走査し、パス順に yield する。
+
+    サブディレクトリはスレッドプールで並列に列挙されるが、yield 順は列挙の完了順に
+    依存しない。各ディレクトリの画像とサブディレクトリを名前順に並べた深さ優先順
+    (= ``sorted(paths)`` と同じ順) で返すため、重複画像のどちらを先に登録するかが
+    実行ごとに変わらない。
+    ジェネレータを途中で閉じる (``break`` / ``close()``) と未着手の走査は破棄される。
+
+    Args:
+        root: 走査するルートディレクトリ
+        extensions: 対象とする画像拡張子 (``".jpg"`` 形式、大文字小文字は無視)
+        max_workers: 並列に列挙するディレクトリ数の上限
+        is_canceled: True を返したら走査を打ち切るコールバック
+
+    Yields:
+        ScannedImage: 画像パスとサイドカーファイル
+    """
+    exts = frozenset(ext.lower() for ext in extensions)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dir-scan")
+
+    def submit(directory: str) -> Future[_DirectoryListing]:
+        return executor.submit(_scan_directory, directory, exts)
+
+    # 深さ優先の走査スタック (各要素はディレクトリ 1 つ分の名前順エントリ)
+    stack: list[Iterator[_Entry]] = [iter([submit(str(root))])]
+    directory_count = 0
+    try:
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+            if isinstance(entry, ScannedImage):
+                yield entry
+                continue
+            listing = _wait_listing(entry, is_canceled)
+            if listing is None:
+                logger.debug(f"ディレクトリ走査をキャンセルしました: {root}")
+                return
+            directory_count += 1
+            stack.append(_ordered_entries(listing, submit))
+        logger.debug(f"ディレクトリ走査完了: {root} ({directory_count}ディレクトリ)")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
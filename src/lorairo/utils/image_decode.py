@@ -0,0 +1,211 @@
+"""縮小デコードユーティリティ。
+
+小さな画像しか必要としないホットパス (アノテーション入力など) で、
+フル解像度デコードを避けるための共通入口。
+
+- JPEG は Pillow の ``draft()`` により DCT スケーリング (1/2, 1/4, 1/8) でデコード時に縮小する。
+- 追加のデコーダ (例: OpenCV ``IMREAD_REDUCED_*``) は :class:`DecodeBackend` として
+  登録し ``set_decode_backend`` で選択できる。選択したバックエンドが対象外の
+  入力には Pillow 経路へフォールバックする。
+- WebP / PNG 等は Pillow がデコード時縮小に対応しないためフル解像度でデコードする。
+
+返す画像の長辺は「デコード時に無償で縮小できた範囲」で ``max_edge`` 以上を保つ。
+正確なサイズが必要な呼び出し元は従来通り ``thumbnail`` / ``resize`` で仕上げる。
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Protocol
+
+from PIL import Image
+
+from .log import logger
+
+# draft() による DCT スケーリングに対応する Pillow のフォーマット名
+REDUCIBLE_FORMATS = frozenset({"JPEG", "MPO"})
+
+
+class DecodeBackend(Protocol):
+    """画像デコードバックエンドのインターフェース。"""
+
+    name: str
+
+    def decode(self, path: Path, max_edge: int | None) -> Image.Image | None:
+        """画像をデコードする。
+
+        Args:
+            path: 画像ファイルパス
+            max_edge: 必要な長辺の下限 (px)。None はフル解像度
+
+        Returns:
+            ロード済みの Pillow 画像。このバックエンドで扱わない入力は None
+            (Pillow 経路へフォールバックする)
+        """
+        ...
+
+
+def draft_size_for(size: tuple[int, int], max_edge: int) -> tuple[int, int]:
+    """長辺が ``max_edge`` 以上に収まる ``draft()`` 要求サイズを返す。
+
+    ``draft()`` は要求サイズの各辺を下回らない最大の縮小率を選ぶため、
+    アスペクト比を保った縮小後サイズを渡す。
+
+    Args:
+        size: 元画像サイズ ``(width, height)``
+        max_edge: 必要な長辺の下限 (px)
+
+    Returns:
+        ``draft()`` に渡す要求サイズ
+    """
+    width, height = size
+    long_edge = max(width, height, 1)
+    ratio = min(1.0, max_edge / long_edge)
+    return max(1, math.ceil(width * ratio)), max(1, math.ceil(height * ratio))
+
+
+def reduce_on_load(img: Image.Image, max_edge: int | None) -> bool:
+    """未ロードの画像にデコード時縮小を設定する。
+
+    ``Image.open`` 直後 (``load()`` 前) に呼ぶ。JPEG 以外や縮小不要な場合は何もしない。
+    ``img.size`` は縮小後サイズに変わるため、元サイズが必要なら先に取得しておくこと。
+
+    Args:
+        img: ``Image.open`` で開いた未ロード画像
+        max_edge: 必要な長辺の下限 (px)。None は何もしない
+
+    Returns:
+        デコード時縮小が適用された場合 True
+    """
+    if max_edge is None or img.format not in REDUCIBLE_FORMATS:
+        return False
+    original_size = img.size
+    if max(original_size) < max_edge * 2:
+        # 1/2 にも縮められない (draft が何もしない) サイズ
+        return False
+    img.draft(None, draft_size_for(original_size, max_edge))
+    return img.size != original_size
+
+
+class PillowDecodeBackend:
+    """Pillow によるデコード。JPEG は ``draft()`` で縮小デコードする (既定・フォールバック)。"""
+
+    name = "pillow"
+
+    def decode(self, path: Path, max_edge: int | None) -> Image.Image:
+        img = Image.open(path)
+        try:
+            reduce_on_load(img, max_edge)
+            img.load()
+        except BaseException:
+            img.close()
+            raise
+        return img
+
+
+class OpenCVDecodeBackend:
+    """OpenCV ``IMREAD_REDUCED_COLOR_*`` による JPEG の縮小デコード。
+
+    JPEG かつ 1/2 以上縮小できる場合のみ担当する。EXIF 回転は Pillow 経路と揃えるため
+    適用しない。出力は常に RGB (グレースケール JPEG も RGB 化される)。
+    ``Image.fromarray`` の結果には元ファイルの情報が無いため、Pillow 経路と同じく
+    ``filename`` に元パスを設定する (推論キャッシュのキーがファイルサイズを参照する)。
+    """
+
+    name = "opencv"
+
+    _REDUCED_SUFFIXES = frozenset({".jpg", ".jpeg"})
+
+    def decode(self, path: Path, max_edge: int | None) -> Image.Image | None:
+        if max_edge is None or path.suffix.lower() not in self._REDUCED_SUFFIXES:
+            return None
+        try:
+            import cv2
+            import numpy as np
+        except ImportError:
+            return None
+
+        with Image.open(path) as header:
+            long_edge = max(header.size)
+        flag = None
+        for factor, reduced_flag in (
+            (8, cv2.IMREAD_REDUCED_COLOR_8),
+            (4, cv2.IMREAD_REDUCED_COLOR_4),
+            (2, cv2.IMREAD_REDUCED_COLOR_2),
+        ):
+            if long_edge // factor >= max_edge:
+                flag = reduced_flag
+                break
+        if flag is None:
+            return None
+
+        # cv2.imread は非 ASCII パスを開けない環境があるため、バイト列からデコードする
+        buffer = np.fromfile(path, dtype=np.uint8)
+        array = cv2.imdecode(buffer, flag | cv2.IMREAD_IGNORE_ORIENTATION)
+        if array is None:
+            return None
+        image = Image.fromarray(cv2.cvtColor(array, cv2.COLOR_BGR2RGB))
+        image.filename = str(path)  # type: ignore[attr-defined]
+        return image
+
+
+_PILLOW_BACKEND = PillowDecodeBackend()
+_BACKENDS: dict[str, DecodeBackend] = {
+    _PILLOW_BACKEND.name: _PILLOW_BACKEND,
+    OpenCVDecodeBackend.name: OpenCVDecodeBackend(),
+}
+_active_backend: DecodeBackend = _PILLOW_BACKEND
+
+
+def register_decode_backend(backend: DecodeBackend) -> None:
+    """デコードバックエンドを登録する (同名は上書き)。
+
+    Args:
+        backend: 登録するバックエンド
+    """
+    _BACKENDS[backend.name] = backend
+
+
+def set_decode_backend(name: str) -> None:
+    """使用するデコードバックエンドを切り替える。
+
+    Args:
+        name: 登録済みバックエンド名 (``"pillow"`` / ``"opencv"`` 等)
+
+    Raises:
+        ValueError: 未登録のバックエンド名が指定された場合
+    """
+    global _active_backend
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown decode backend: {name} (available: {sorted(_BACKENDS)})")
+    _active_backend = backend
+    logger.debug(f"Image decode backend set to {name}")
+
+
+def get_decode_backend() -> DecodeBackend:
+    """現在のデコードバックエンドを返す。"""
+    return _active_backend
+
+
+def decode_image(path: Path, max_edge: int | None = None) -> Image.Image:
+    """画像をデコードする。``max_edge`` 指定時は可能な範囲でデコード時に縮小する。
+
+    Args:
+        path: 画像ファイルパス
+        max_edge: 必要な長辺の下限 (px)。None はフル解像度デコード
+
+    Returns:
+        ロード済みの Pillow 画像。動画像 (アニメ GIF / WebP) は後続フレーム用に
+        ファイルハンドルを保持するため、呼び出し元で ``close()`` すること
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+        PIL.UnidentifiedImageError: 画像として認識できない場合
+    """
+    if max_edge is not None and _active_backend is not _PILLOW_BACKEND:
+        decoded = _active_backend.decode(path, max_edge)
+        if decoded is not None:
+            return decoded
+    return _PILLOW_BACKEND.decode(path, max_edge)
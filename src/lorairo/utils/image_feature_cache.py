@@ -0,0 +1,252 @@
+"""画像特徴量の永続キャッシュ。
+
+登録・重複検出のたびにフルデコードしていた pHash / ``get_image_info`` の結果
+(幅・高さ・形式・モード・アルファ有無・色空間・グレースケール判定) を、
+ファイル識別子 ``(絶対パス, サイズ, mtime_ns)`` をキーに SQLite へ保存する。
+同じディレクトリの再スキャンでは ``os.stat`` だけで結果を返せるため、
+数十万ファイル規模のステージングディレクトリでも新規・重複の判定がデコード無しで済む。
+
+キャッシュはプロジェクト DB とは独立した使い捨てファイルで、壊れていたり
+:data:`FEATURE_CACHE_VERSION` が異なる場合は作り直す。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .log import logger
+from .sqlite_cache import open_versioned_cache
+
+# 特徴量の算出方法 (pHash / get_image_info の判定パラメータ等) を変えたら上げる。
+# 既存キャッシュは次回オープン時に破棄される。
+FEATURE_CACHE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS image_features (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    phash TEXT,
+    info_json TEXT
+)
+"""
+
+# 同一パスの行を上書きする。ファイル識別子 (size, mtime_ns) が変わっていない場合のみ
+# 今回算出しなかった列 (NULL) に既存値を残す。
+_UPSERT = """
+INSERT INTO image_features (path, size, mtime_ns, phash, info_json)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET
+    phash = COALESCE(
+        excluded.phash,
+        CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns THEN phash END
+    ),
+    info_json = COALESCE(
+        excluded.info_json,
+        CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns THEN info_json END
+    ),
+    size = excluded.size,
+    mtime_ns = excluded.mtime_ns
+"""
+
+
+@dataclass(frozen=True)
+class FileIdentity:
+    """キャッシュキーとなるファイル識別子。"""
+
+    path: str
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: Path) -> FileIdentity:
+        """ファイルを stat して識別子を作る。
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        stat = os.stat(path)
+        return cls(os.path.normcase(os.path.abspath(path)), stat.st_size, stat.st_mtime_ns)
+
+
+@dataclass
+class _Entry:
+    identity: FileIdentity
+    phash: str | None = None
+    info_json: str | None = None
+
+
+class ImageFeatureCache:
+    """``(path, size, mtime_ns)`` をキーにした画像特徴量キャッシュ。
+
+    書き込みは ``FLUSH_THRESHOLD`` 件ごとにまとめてコミットする。バッチ処理の終わりに
+    ``flush()`` を呼ぶこと (呼び忘れても失うのは未保存のキャッシュ分のみ)。
+    ワーカースレッドからも使えるよう、接続へのアクセスはロックで直列化する。
+
+    Attributes:
+        hits: キャッシュヒット数
+        misses: キャッシュミス数 (算出関数を呼んだ回数)
+    """
+
+    FLUSH_THRESHOLD = 500
+
+    def __init__(self, db_path: Path | str) -> None:
+        """
+        Args:
+            db_path: キャッシュ DB のパス。``":memory:"`` でプロセス内のみのキャッシュ
+        """
+        self._db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._pending: dict[str, _Entry] = {}
+        self.hits = 0
+        self.misses = 0
+        self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        return open_versioned_cache(
+            self._db_path, FEATURE_CACHE_VERSION, _SCHEMA, label="画像特徴量キャッシュ"
+        )
+
+    def phash(self, path: Path, compute: Callable[[Path], str]) -> str:
+        """pHash をキャッシュから返す。ミス時は ``compute`` で算出して保存する。
+
+        Args:
+            path: 画像ファイルパス
+            compute: pHash 算出関数 (例: ``utils.tools.calculate_phash``)
+
+        Returns:
+            pHash 文字列
+
+        Raises:
+            Exception: ``compute`` が送出した例外 (キャッシュには保存しない)
+        """
+        identity = self._identify(path)
+        if identity is None:
+            return compute(path)
+        entry = self._lookup(identity)
+        if entry is not None and entry.phash is not None:
+            self.hits += 1
+            return entry.phash
+        self.misses += 1
+        value = compute(path)
+        self._store(identity, phash=value)
+        return value
+
+    def image_info(self, path: Path, compute: Callable[[Path], dict[str, Any]]) -> dict[str, Any]:
+        """画像情報をキャッシュから返す。ミス時は ``compute`` で算出して保存する。
+
+        Args:
+            path: 画像ファイルパス
+            compute: 画像情報算出関数 (例: ``FileSystemManager.get_image_info``)
+
+        Returns:
+            画像情報辞書 (呼び出し元が変更してよい新規 dict)
+
+        Raises:
+            Exception: ``compute`` が送出した例外 (キャッシュには保存しない)
+        """
+        identity = self._identify(path)
+        if identity is None:
+            return compute(path)
+        entry = self._lookup(identity)
+        if entry is not None and entry.info_json is not None:
+            self.hits += 1
+            info: dict[str, Any] = json.loads(entry.info_json)
+            return info
+        self.misses += 1
+        value = compute(path)
+        try:
+            info_json = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"画像情報を JSON 化できないためキャッシュしません: {path.name}, {e}")
+            return value
+        self._store(identity, info_json=info_json)
+        return value
+
+    @staticmethod
+    def _identify(path: Path) -> FileIdentity | None:
+        """ファイル識別子を返す。stat できない場合は None (算出関数側のエラー処理に委ねる)。"""
+        try:
+            return FileIdentity.of(path)
+        except OSError:
+            return None
+
+    def _lookup(self, identity: FileIdentity) -> _Entry | None:
+        """識別子が一致するエントリを返す (未保存の書き込みを優先)。"""
+        with self._lock:
+            entry = self._pending.get(identity.path)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, phash, info_json FROM image_features WHERE path = ?",
+                    (identity.path,),
+                ).fetchone()
+                if row is None:
+                    return None
+                entry = _Entry(FileIdentity(identity.path, row[0], row[1]), row[2], row[3])
+        return entry if entry.identity == identity else None
+
+    def _store(
+        self, identity: FileIdentity, *, phash: str | None = None, info_json: str | None = None
+    ) -> None:
+        with self._lock:
+            entry = self._pending.get(identity.path)
+            if entry is None or entry.identity != identity:
+                entry = _Entry(identity)
+                self._pending[identity.path] = entry
+            if phash is not None:
+                entry.phash = phash
+            if info_json is not None:
+                entry.info_json = info_json
+            should_flush = len(self._pending) >= self.FLUSH_THRESHOLD
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> int:
+        """未保存の書き込みをコミットする。
+
+        Returns:
+            書き込んだ件数
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows = [
+                (e.identity.path, e.identity.size, e.identity.mtime_ns, e.phash, e.info_json)
+                for e in self._pending.values()
+            ]
+            try:
+                with self._conn:
+                    self._conn.executemany(_UPSERT, rows)
+            except sqlite3.Error as e:
+                # キャッシュの書き込み失敗は処理を止めない (次回再計算されるだけ)
+                logger.warning(f"画像特徴量キャッシュの書き込みに失敗しました: {e}")
+                return 0
+            finally:
+                self._pending.clear()
+        logger.debug(f"画像特徴量キャッシュ書き込み: {len(rows)}件")
+        return len(rows)
+
+    def close(self) -> None:
+        """未保存分を書き込んで接続を閉じる。"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        キャッシュの統計情報を取得する。
+
+        Returns:
+            統計情報の辞書
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM image_features").fetchone()[0]
+            pending = len(self._pending)
+        return {"entries": entries, "pending": pending, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,83 @@
+"""使い捨て SQLite キャッシュファイルの共通オープン処理。
+
+画像特徴量キャッシュ・推論結果キャッシュ・スループット統計は、いずれもプロジェクト DB
+とは独立した ``cache/`` 配下の SQLite で、保存形式のバージョン (``PRAGMA user_version``)
+が異なる場合はテーブルを作り直し、ファイルが壊れていれば削除して作り直す。
+その手順を :func:`open_versioned_cache` にまとめる。
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Sequence
+from pathlib import Path
+
+from .log import logger
+
+MEMORY_PATH = ":memory:"
+# WAL モードで本体と並んで作られるファイルの接尾辞
+_SIDECAR_SUFFIXES = ("-wal", "-shm")
+
+
+def open_versioned_cache(
+    db_path: Path | str, version: int, schema: str | Sequence[str], *, label: str
+) -> sqlite3.Connection:
+    """キャッシュ DB を開き、バージョンとスキーマを揃えた接続を返す。
+
+    ``user_version`` が ``version`` と異なれば既存テーブルを全て削除してから
+    ``schema`` を適用する。開けない (壊れている) ファイルは ``-wal`` / ``-shm`` ごと
+    削除して作り直す。接続は WAL / ``synchronous=NORMAL`` で、別スレッドから
+    使えるよう ``check_same_thread=False`` で開く (呼び出し側でロックすること)。
+
+    Args:
+        db_path: キャッシュ DB のパス。``":memory:"`` でプロセス内のみ
+        version: 保存形式のバージョン
+        schema: ``CREATE ... IF NOT EXISTS`` 文 (複数なら順に実行する)
+        label: ログ用のキャッシュ名
+
+    Returns:
+        スキーマ適用済みの接続
+
+    Raises:
+        sqlite3.DatabaseError: 作り直した後も開けない場合
+    """
+    path = str(db_path)
+    statements = (schema,) if isinstance(schema, str) else tuple(schema)
+    if path != MEMORY_PATH:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    try:
+        return _connect(path, version, statements)
+    except sqlite3.DatabaseError as e:
+        logger.warning(f"{label}を作り直します ({path}): {e}")
+        if path != MEMORY_PATH:
+            remove_cache_files(path)
+        return _connect(path, version, statements)
+
+
+def remove_cache_files(db_path: Path | str) -> None:
+    """キャッシュ DB 本体と ``-wal`` / ``-shm`` を削除する。"""
+    path = Path(db_path)
+    path.unlink(missing_ok=True)
+    for suffix in _SIDECAR_SUFFIXES:
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def _connect(path: str, version: int, statements: tuple[str, ...]) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != version:
+            tables = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            ).fetchall()
+            for (table,) in tables:
+                conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        for statement in statements:
+            conn.execute(statement)
+        conn.commit()
+    except sqlite3.DatabaseError:
+        conn.close()
+        raise
+    return conn
@@ -0,0 +1,287 @@
+"""ワーカー処理のステージ別計測 (タイミング・件数・バイト数) とサンプリングプロファイル。
+
+進捗率だけでは「遅い」の原因 (デコード / DB 読み書き / 推論 / ファイルコピー) を
+切り分けられないため、ワーカーは名前付きステージを :meth:`StageTelemetry.stage` で
+囲んで計測し、終了時に :class:`TelemetrySnapshot` として Jobs 台帳へ渡す。
+
+計測自体は ``time.perf_counter`` の差分を足すだけで常時有効にできる軽さにしてある。
+関数単位の内訳が必要なときだけ、実行単位で :class:`SamplingProfiler` を有効にする
+(pyinstrument がインストールされていればそれを、無ければ標準の cProfile を使う)。
+
+Qt に依存しないため、GUI ワーカー以外 (CLI / サービス) からも利用できる。
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from .log import logger
+
+# 実行単位のプロファイルを既定で有効にする環境変数 (WorkerManager が参照する)
+PROFILE_ENV_VAR = "LORAIRO_WORKER_PROFILE"
+# プロファイルレポートに残す関数の数 (cProfile 使用時)
+PROFILE_TOP_FUNCTIONS = 30
+
+
+@dataclass
+class StageTiming:
+    """1 ステージ分の累積計測値。
+
+    Attributes:
+        name: ステージ名 ("decode" / "db_read" / "inference" / "db_write" / "file_copy" 等)。
+        calls: ステージに入った回数。
+        seconds: 累積経過秒数。
+        items: 処理件数 (画像数等)。
+        bytes: 処理バイト数。
+    """
+
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    items: int = 0
+    bytes: int = 0
+
+    @property
+    def items_per_second(self) -> float | None:
+        """件数スループット。件数か時間が 0 なら None。"""
+        if not self.items or self.seconds <= 0:
+            return None
+        return self.items / self.seconds
+
+    @property
+    def bytes_per_second(self) -> float | None:
+        """バイトスループット。バイト数か時間が 0 なら None。"""
+        if not self.bytes or self.seconds <= 0:
+            return None
+        return self.bytes / self.seconds
+
+    def merge(self, other: StageTiming) -> None:
+        """同名ステージの計測値を加算する。"""
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.items += other.items
+        self.bytes += other.bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 化しやすい辞書に変換する。"""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "seconds": round(self.seconds, 6),
+            "items": self.items,
+            "bytes": self.bytes,
+            "items_per_second": self.items_per_second,
+            "bytes_per_second": self.bytes_per_second,
+        }
+
+
+@dataclass(frozen=True)
+class TelemetrySnapshot:
+    """1 実行分の計測結果 (不変)。
+
+    Attributes:
+        label: 計測対象 (ワーカークラス名等)。
+        wall_seconds: 計測開始から終了までの経過秒数。
+        stages: ステージ別計測値 (最初に計測した順)。
+        counters: 任意のカウンタ (キャッシュヒット数・リトライ数等)。
+        profile: プロファイル有効時のレポート文字列。
+    """
+
+    label: str
+    wall_seconds: float
+    stages: tuple[StageTiming, ...] = ()
+    counters: dict[str, int] = field(default_factory=dict)
+    profile: str | None = None
+
+    @property
+    def accounted_seconds(self) -> float:
+        """ステージで計測された秒数の合計 (ネストしたステージは二重に数える)。"""
+        return sum(stage.seconds for stage in self.stages)
+
+    def get_stage(self, name: str) -> StageTiming | None:
+        """名前でステージを取得する。"""
+        return next((stage for stage in self.stages if stage.name == name), None)
+
+    def format_lines(self) -> list[str]:
+        """ログ・ツールチップ向けの 1 ステージ 1 行の表記を返す。"""
+        lines = [f"{self.label}: {self.wall_seconds:.3f}s"]
+        for stage in sorted(self.stages, key=lambda s: s.seconds, reverse=True):
+            share = f" ({stage.seconds / self.wall_seconds:.0%})" if self.wall_seconds > 0 else ""
+            parts = [f"{stage.name}: {stage.seconds:.3f}s{share} x{stage.calls}"]
+            if stage.items_per_second is not None:
+                parts.append(f"{stage.items} items, {stage.items_per_second:.1f}/s")
+            if stage.bytes_per_second is not None:
+                parts.append(
+                    f"{stage.bytes / 1_048_576:.1f} MiB, {stage.bytes_per_second / 1_048_576:.1f} MiB/s"
+                )
+            lines.append("  " + " / ".join(parts))
+        if self.counters:
+            lines.append(
+                "  " + ", ".join(f"{name}={value}" for name, value in sorted(self.counters.items()))
+            )
+        return lines
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 化しやすい辞書に変換する (プロファイル本文は含めない)。"""
+        return {
+            "label": self.label,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "stages": [stage.to_dict() for stage in self.stages],
+            "counters": dict(self.counters),
+            "profiled": self.profile is not None,
+        }
+
+
+class SamplingProfiler:
+    """実行単位のプロファイラ。
+
+    pyinstrument (サンプリング) が使えればそれを、無ければ cProfile (決定的) を使う。
+    どちらも開始したスレッドだけを計測するため、ワーカースレッド内で start/stop する。
+    """
+
+    def __init__(self) -> None:
+        self._profiler: Any = None
+        self.backend = "pyinstrument" if importlib.util.find_spec("pyinstrument") else "cProfile"
+
+    def start(self) -> None:
+        """計測を開始する。"""
+        if self.backend == "pyinstrument":
+            from pyinstrument import Profiler
+
+            self._profiler = Profiler()
+            self._profiler.start()
+        else:
+            import cProfile
+
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self) -> str:
+        """計測を終了し、テキストレポートを返す。"""
+        if self._profiler is None:
+            return ""
+        profiler, self._profiler = self._profiler, None
+        if self.backend == "pyinstrument":
+            profiler.stop()
+            return str(profiler.output_text(unicode=True, color=False))
+
+        import pstats
+
+        profiler.disable()
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+        return stream.getvalue()
+
+
+def profiling_enabled_by_env() -> bool:
+    """環境変数で実行単位のプロファイルが既定有効になっているかを返す。"""
+    return os.environ.get(PROFILE_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+class StageTelemetry:
+    """名前付きステージの計測器。
+
+    ``with telemetry.stage("decode") as timing:`` で囲んだ区間の経過時間を足し込み、
+    ``timing.items`` / ``timing.bytes`` に処理量を加算する。同名ステージは累積される。
+    ワーカー内のスレッドプール等からも記録できるよう、集計はロックで保護する。
+    """
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self._lock = threading.Lock()
+        self._stages: dict[str, StageTiming] = {}
+        self._counters: dict[str, int] = {}
+        self._started_at: float | None = None
+        self._profiler: SamplingProfiler | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """計測中か。"""
+        return self._started_at is not None
+
+    def start(self, *, profile: bool = False) -> None:
+        """計測を開始する (以前の計測値は破棄する)。
+
+        Args:
+            profile: True なら同じスレッドでプロファイラも開始する。
+        """
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+        self._started_at = time.perf_counter()
+        if profile:
+            self._profiler = SamplingProfiler()
+            try:
+                self._profiler.start()
+            except Exception as e:
+                # 他のプロファイラが動作中 (sys.setprofile 競合) 等。計測本体は続ける
+                logger.warning(f"プロファイラを開始できませんでした ({self._profiler.backend}): {e}")
+                self._profiler = None
+
+    def stop(self) -> TelemetrySnapshot:
+        """計測を終了し、結果を返す。"""
+        wall = time.perf_counter() - self._started_at if self._started_at is not None else 0.0
+        self._started_at = None
+        profile = None
+        if self._profiler is not None:
+            try:
+                profile = self._profiler.stop()
+            except Exception as e:
+                logger.warning(f"プロファイル結果の取得に失敗しました: {e}")
+            self._profiler = None
+        return self._snapshot(wall, profile)
+
+    def snapshot(self) -> TelemetrySnapshot:
+        """計測を続けたまま現時点の結果を返す。"""
+        wall = time.perf_counter() - self._started_at if self._started_at is not None else 0.0
+        return self._snapshot(wall, None)
+
+    @contextmanager
+    def stage(self, name: str, *, items: int = 0, bytes: int = 0) -> Iterator[StageTiming]:
+        """ステージ区間を計測する。
+
+        Args:
+            name: ステージ名。
+            items: 区間の処理件数 (区間内で ``timing.items`` に加算してもよい)。
+            bytes: 区間の処理バイト数 (区間内で ``timing.bytes`` に加算してもよい)。
+
+        Yields:
+            この区間の計測値。終了時 (例外時も) に累積値へ加算される。
+        """
+        timing = StageTiming(name=name, calls=1, items=items, bytes=bytes)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.seconds = time.perf_counter() - start
+            self.record(timing)
+
+    def record(self, timing: StageTiming) -> None:
+        """計測済みの値をステージに加算する (別スレッドで測った値の取り込み等)。"""
+        with self._lock:
+            current = self._stages.get(timing.name)
+            if current is None:
+                self._stages[timing.name] = replace(timing)
+            else:
+                current.merge(timing)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """カウンタを加算する。"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def _snapshot(self, wall: float, profile: str | None) -> TelemetrySnapshot:
+        with self._lock:
+            stages = tuple(replace(stage) for stage in self._stages.values())
+            counters = dict(self._counters)
+        return TelemetrySnapshot(
+            label=self.label, wall_seconds=wall, stages=stages, counters=counters, profile=profile
+        )
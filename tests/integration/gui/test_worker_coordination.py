@@ -2,7 +2,7 @@
 
 import time
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -19,7 +19,7 @@ class TestWorkerSystemCoordination:
     @pytest.fixture
     def mock_db_manager(self):
         """モックデータベースマネージャー"""
-        mock = Mock()
+        mock = MagicMock()
         mock.get_images_by_filter.return_value = (
             [
                 {"id": 1, "stored_image_path": "/test/image1.jpg"},
@@ -276,7 +276,7 @@ class TestWorkerSystemPerformance:
 
     def test_worker_creation_overhead(self):
         """ワーカー作成オーバーヘッドテスト"""
-        mock_db_manager = Mock()
+        mock_db_manager = MagicMock()
         mock_db_manager.get_images_by_filter.return_value = ([], 0)
 
         start_time = time.time()
@@ -298,7 +298,7 @@ class TestWorkerSystemPerformance:
 
     def test_concurrent_worker_performance(self):
         """並行ワーカーパフォーマンステスト"""
-        mock_db_manager = Mock()
+        mock_db_manager = MagicMock()
         mock_db_manager.get_images_by_filter.return_value = ([], 0)
 
         # 複数ワーカーの並行実行シミュレーション
@@ -327,7 +327,7 @@ class TestWorkerSystemPerformance:
 
     def test_memory_usage_stability(self):
         """メモリ使用量安定性テスト"""
-        mock_db_manager = Mock()
+        mock_db_manager = MagicMock()
         mock_db_manager.get_images_by_filter.return_value = ([], 0)
 
         # 多数のワーカーを作成・実行・削除してメモリリークをチェック
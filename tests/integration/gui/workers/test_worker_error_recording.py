@@ -223,11 +223,12 @@ class TestThumbnailWorkerErrorRecording:
             db_manager=db_manager,
         )
 
-        with patch("lorairo.gui.workers.thumbnail_worker.QImage") as mock_qimage:
-            # QImageがNullを返すようにモック
+        with patch("lorairo.gui.workers.thumbnail_worker.QImageReader") as mock_reader:
+            # QImageReader.read() がNullを返すようにモック
             mock_instance = Mock()
             mock_instance.isNull.return_value = True
-            mock_qimage.return_value = mock_instance
+            mock_reader.return_value.size.return_value = QSize()
+            mock_reader.return_value.read.return_value = mock_instance
 
             result = worker.execute()
 
@@ -271,7 +272,7 @@ class TestThumbnailWorkerErrorRecording:
         )
 
         # QImage例外をシミュレート
-        with patch("lorairo.gui.workers.thumbnail_worker.QImage", side_effect=Exception("QImage Error")):
+        with patch("lorairo.gui.workers.thumbnail_worker.QImageReader", side_effect=Exception("QImage Error")):
             result = worker.execute()
 
         # エラーカウントが増加していることを確認
@@ -0,0 +1,485 @@
+"""パフォーマンスベンチマーク共通設定。
+
+合成プロジェクト生成 (:func:`build_synthetic_project`) と計測結果の JSON 記録
+(:class:`BenchmarkRecorder`) を提供する。
+
+合成プロジェクトは実プロジェクトと同じ経路 (``create_project_session_factories``) で
+DB を準備し、画像・処理済み画像・複数モデルのタグ / キャプション / スコア / レーティングを
+スキーマへ直接一括挿入する。乱数はシード固定のため、同じ規模指定なら毎回同じ内容になる。
+エクスポート・サムネイル・登録用に一部の画像だけ実ファイル (小さな WebP / PNG) を書く。
+
+環境変数:
+    LORAIRO_BENCH_IMAGES: 合成画像数 (既定 5000)
+    LORAIRO_BENCH_OUTPUT: 計測結果 JSON の出力先 (既定 .benchmarks/latest.json)
+
+ネットワーク・GPU は使わない (タグ DB は tests/conftest.py のモック)。2 つの結果
+JSON は ``scripts/compare_benchmarks.py`` で比較し、しきい値超過を退行として検出する。
+"""
+
+import datetime
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+import pytest
+from PIL import Image as PILImage
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from lorairo.database.db_core import create_project_session_factories
+from lorairo.database.repository.base import resolve_tag_string_ids
+from lorairo.database.schema import (
+    Caption,
+    Image,
+    Model,
+    ModelType,
+    ProcessedImage,
+    Project,
+    Rating,
+    Score,
+    Tag,
+    model_function_associations,
+)
+
+T = TypeVar("T")
+
+# 結果 JSON の形式バージョン (compare_benchmarks.py と合わせる)
+BENCHMARK_SCHEMA_VERSION = 1
+# 既定の退行しきい値: ベースライン中央値からの増加率
+DEFAULT_THRESHOLD = 0.25
+
+# 検索フィルタ (lorairo-cli debug db-profile と共通) がヒットするよう語彙の先頭に置くタグ
+_SEED_TAGS = ("1girl", "solo", "monochrome", "long hair", "smile", "outdoors", "simple background")
+_RATINGS = ("PG", "PG-13", "R", "X", "XXX")
+_RATING_WEIGHTS = (50, 25, 15, 7, 3)
+_CAPTION_WORDS = ("a", "girl", "smile", "standing", "in", "garden", "with", "long", "hair", "sky")
+_EPOCH = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+
+@dataclass(frozen=True)
+class SyntheticProjectSpec:
+    """合成プロジェクトの規模。
+
+    Attributes:
+        images: 画像数
+        tags_per_image: 1 画像・1 タガーあたりのタグ数
+        tag_vocabulary: タグ語彙数 (Zipf 風の偏りで選ぶ)
+        taggers: タグ付けモデル数 (各画像に全タガーのタグが付く)
+        rating_fraction: AI レーティングを持つ画像の割合
+        score_fraction: スコアを持つ画像の割合
+        caption_fraction: キャプションを持つ画像の割合
+        resolutions: 処理済み画像の解像度 (長辺)
+        file_backed_images: 実ファイルを書く画像数 (エクスポート / サムネイル用)
+        file_size: 実ファイルの一辺 (px)
+        seed: 乱数シード
+    """
+
+    images: int = 5000
+    tags_per_image: int = 20
+    tag_vocabulary: int = 3000
+    taggers: int = 2
+    rating_fraction: float = 0.6
+    score_fraction: float = 0.5
+    caption_fraction: float = 0.7
+    resolutions: tuple[int, ...] = (512, 1024)
+    file_backed_images: int = 200
+    file_size: int = 256
+    seed: int = 20240101
+
+
+@dataclass
+class SyntheticProject:
+    """生成済みの合成プロジェクト。
+
+    Attributes:
+        spec: 生成条件
+        root: プロジェクトディレクトリ
+        db_path: プロジェクト DB
+        session_factory: 書き込みセッションファクトリ
+        read_session_factory: 読み取り専用セッションファクトリ
+        image_ids: 全画像 ID (挿入順)
+        file_backed_ids: 実ファイルを持つ画像 ID
+        tagger_ids: タガーモデル ID
+        vocabulary: タグ語彙
+        build_seconds: 生成にかかった秒数
+    """
+
+    spec: SyntheticProjectSpec
+    root: Path
+    db_path: Path
+    session_factory: sessionmaker[Session]
+    read_session_factory: sessionmaker[Session]
+    image_ids: list[int]
+    file_backed_ids: list[int]
+    tagger_ids: list[int]
+    vocabulary: list[str]
+    build_seconds: float = 0.0
+
+
+def _vocabulary(size: int) -> list[str]:
+    return [*_SEED_TAGS, *(f"tag_{n:05d}" for n in range(max(0, size - len(_SEED_TAGS))))]
+
+
+def _write_image(path: Path, size: int, rng: random.Random) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+    PILImage.new("RGB", (size, size), color).save(path)
+
+
+def _insert_models(session: Session, spec: SyntheticProjectSpec) -> tuple[list[Model], Model, Model]:
+    """タガー / スコアラー / キャプショナーを登録し、機能タイプを関連付ける。"""
+    type_ids = {row.name: row.id for row in session.execute(select(ModelType.id, ModelType.name))}
+    taggers = [
+        Model(name=f"bench-tagger-{n}", litellm_model_id=f"local/bench-tagger-{n}", provider="local")
+        for n in range(spec.taggers)
+    ]
+    scorer = Model(name="bench-scorer", litellm_model_id="local/bench-scorer", provider="local")
+    captioner = Model(name="bench-captioner", litellm_model_id="local/bench-captioner", provider="local")
+    session.add_all([*taggers, scorer, captioner])
+    session.flush()
+    session.execute(
+        insert(model_function_associations),
+        [
+            *({"model_id": m.id, "type_id": type_ids["tags"]} for m in taggers),
+            *({"model_id": m.id, "type_id": type_ids["ratings"]} for m in taggers),
+            {"model_id": scorer.id, "type_id": type_ids["scores"]},
+            {"model_id": captioner.id, "type_id": type_ids["caption"]},
+        ],
+    )
+    return taggers, scorer, captioner
+
+
+def _insert_images(
+    session: Session, spec: SyntheticProjectSpec, project_id: int, file_dir: Path, rng: random.Random
+) -> list[int]:
+    """オリジナル画像行を登録する (先頭 ``file_backed_images`` 件は実ファイルも書く)。"""
+    image_rows = []
+    for index in range(spec.images):
+        file_backed = index < spec.file_backed_images
+        filename = f"bench_{index:06d}.png"
+        stored = (
+            str(file_dir / "original_images" / filename)
+            if file_backed
+            else f"image_dataset/original_images/2024/01/01/{filename}"
+        )
+        if file_backed:
+            _write_image(Path(stored), spec.file_size, rng)
+        size = rng.choice((512, 768, 1024, 2048))
+        created_at = _EPOCH + datetime.timedelta(minutes=rng.randrange(2 * 365 * 24 * 60))
+        image_rows.append(
+            {
+                "uuid": str(uuid.UUID(int=rng.getrandbits(128))),
+                "phash": f"{rng.getrandbits(64):016x}",
+                "original_image_path": f"/datasets/source/{filename}",
+                "stored_image_path": stored,
+                "width": size,
+                "height": rng.choice((size, size * 3 // 4, size * 4 // 3)),
+                "format": "PNG",
+                "mode": "RGB",
+                "has_alpha": False,
+                "filename": filename,
+                "extension": ".png",
+                "project_id": project_id,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+    session.execute(insert(Image), image_rows)
+    return list(session.execute(select(Image.id).order_by(Image.id)).scalars())
+
+
+def _insert_processed_images(
+    session: Session, spec: SyntheticProjectSpec, image_ids: list[int], file_dir: Path, rng: random.Random
+) -> None:
+    """解像度ごとの処理済み画像行を登録する。"""
+    processed_rows = []
+    for position, image_id in enumerate(image_ids):
+        for resolution in spec.resolutions:
+            name = f"bench_{position:06d}_{resolution}.webp"
+            if position < spec.file_backed_images:
+                stored = str(file_dir / str(resolution) / name)
+                _write_image(Path(stored), min(resolution, spec.file_size), rng)
+            else:
+                stored = f"image_dataset/{resolution}/2024/01/01/{name}"
+            processed_rows.append(
+                {
+                    "image_id": image_id,
+                    "stored_image_path": stored,
+                    "width": resolution,
+                    "height": resolution,
+                    "mode": "RGB",
+                    "has_alpha": False,
+                    "filename": name,
+                }
+            )
+    session.execute(insert(ProcessedImage), processed_rows)
+
+
+def _insert_tags(
+    session: Session,
+    spec: SyntheticProjectSpec,
+    image_ids: list[int],
+    taggers: list[Model],
+    vocabulary: list[str],
+    rng: random.Random,
+) -> None:
+    """タガーごとに Zipf 風の頻度でタグを付ける (tag_id は語彙の位置 + 1)。"""
+    # 先頭の語彙ほど多くの画像に付く
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    tag_string_ids = resolve_tag_string_ids(session, vocabulary)
+    tag_rows = []
+    for image_id in image_ids:
+        for tagger in taggers:
+            chosen: set[int] = set()
+            while len(chosen) < min(spec.tags_per_image, len(vocabulary)):
+                chosen.update(rng.choices(range(len(vocabulary)), weights, k=spec.tags_per_image))
+            tag_rows.extend(
+                {
+                    "image_id": image_id,
+                    "model_id": tagger.id,
+                    "tag_string_id": tag_string_ids[vocabulary[vocab_index]],
+                    "tag_id": vocab_index + 1,
+                    "confidence_score": round(rng.uniform(0.35, 1.0), 3),
+                    "existing": False,
+                    "is_edited_manually": False,
+                }
+                for vocab_index in sorted(chosen)[: spec.tags_per_image]
+            )
+    session.execute(insert(Tag), tag_rows)
+
+
+def _insert_annotations(
+    session: Session,
+    spec: SyntheticProjectSpec,
+    image_ids: list[int],
+    models: tuple[list[Model], Model, Model],
+    rng: random.Random,
+) -> None:
+    """キャプション / スコア / Rating を指定の割合で付ける。"""
+    taggers, scorer, captioner = models
+    caption_rows, score_rows, rating_rows = [], [], []
+    for image_id in image_ids:
+        if rng.random() < spec.caption_fraction:
+            words = rng.sample(_CAPTION_WORDS, k=6)
+            caption_rows.append(
+                {"image_id": image_id, "model_id": captioner.id, "caption": " ".join(words)}
+            )
+        if rng.random() < spec.score_fraction:
+            score_rows.append(
+                {"image_id": image_id, "model_id": scorer.id, "score": round(rng.uniform(0.0, 10.0), 3)}
+            )
+        if rng.random() < spec.rating_fraction:
+            for tagger in taggers:
+                rating = rng.choices(_RATINGS, _RATING_WEIGHTS)[0]
+                rating_rows.append(
+                    {
+                        "image_id": image_id,
+                        "model_id": tagger.id,
+                        "raw_rating_value": rating.lower(),
+                        "normalized_rating": rating,
+                        "confidence_score": round(rng.uniform(0.5, 1.0), 3),
+                    }
+                )
+    for model, rows in ((Caption, caption_rows), (Score, score_rows), (Rating, rating_rows)):
+        if rows:
+            session.execute(insert(model), rows)
+
+
+def build_synthetic_project(root: Path, spec: SyntheticProjectSpec) -> SyntheticProject:
+    """``root`` に合成プロジェクトを作る。
+
+    Args:
+        root: プロジェクトディレクトリ (空であること)
+        spec: 規模
+
+    Returns:
+        生成したプロジェクト
+    """
+    start = time.perf_counter()
+    rng = random.Random(spec.seed)
+    db_path = root / "image_database.db"
+    write_sf, read_sf = create_project_session_factories(db_path)
+    vocabulary = _vocabulary(spec.tag_vocabulary)
+    file_dir = root / "image_dataset"
+
+    with write_sf() as session:
+        project = Project(name="benchmark", path=str(root))
+        session.add(project)
+        models = _insert_models(session, spec)
+        image_ids = _insert_images(session, spec, project.id, file_dir, rng)
+        _insert_processed_images(session, spec, image_ids, file_dir, rng)
+        _insert_tags(session, spec, image_ids, models[0], vocabulary, rng)
+        _insert_annotations(session, spec, image_ids, models, rng)
+        tagger_ids = [tagger.id for tagger in models[0]]
+        session.commit()
+
+    return SyntheticProject(
+        spec=spec,
+        root=root,
+        db_path=db_path,
+        session_factory=write_sf,
+        read_session_factory=read_sf,
+        image_ids=image_ids,
+        file_backed_ids=image_ids[: spec.file_backed_images],
+        tagger_ids=tagger_ids,
+        vocabulary=vocabulary,
+        build_seconds=time.perf_counter() - start,
+    )
+
+
+@dataclass
+class BenchmarkResult:
+    """1 ベンチマーク分の計測値 (ミリ秒)。"""
+
+    runs_ms: list[float]
+    threshold: float = DEFAULT_THRESHOLD
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "median_ms": round(statistics.median(self.runs_ms), 3),
+            "min_ms": round(min(self.runs_ms), 3),
+            "max_ms": round(max(self.runs_ms), 3),
+            "runs_ms": [round(run, 3) for run in self.runs_ms],
+            "threshold": self.threshold,
+            "params": self.params,
+        }
+
+
+class BenchmarkRecorder:
+    """ホットパスの実行時間を測り、セッション終了時に JSON へ書き出す。"""
+
+    def __init__(self, output_path: Path) -> None:
+        self.output_path = output_path
+        self.results: dict[str, BenchmarkResult] = {}
+        self.dataset: dict[str, Any] = {}
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[[], T],
+        *,
+        repeat: int = 5,
+        warmup: int = 1,
+        threshold: float = DEFAULT_THRESHOLD,
+        setup: Callable[[], Any] | None = None,
+        **params: Any,
+    ) -> T:
+        """``func`` を ``warmup`` 回空回ししてから ``repeat`` 回計測する。
+
+        Args:
+            name: ベンチマーク名 (結果 JSON のキー)
+            func: 計測対象
+            repeat: 計測回数 (中央値を比較に使う)
+            warmup: 計測前の空回し回数
+            threshold: 退行とみなす中央値の増加率
+            setup: 各回の直前に計測外で呼ぶ準備処理
+            **params: 結果に残す条件 (件数など)
+
+        Returns:
+            最後の実行の戻り値
+        """
+        result: T | None = None
+        for _ in range(warmup):
+            if setup is not None:
+                setup()
+            func()
+        runs: list[float] = []
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = func()
+            runs.append((time.perf_counter() - start) * 1000)
+        self.record(name, runs, threshold=threshold, **params)
+        return result  # type: ignore[return-value]
+
+    def record(
+        self, name: str, runs_ms: list[float], *, threshold: float = DEFAULT_THRESHOLD, **params: Any
+    ) -> None:
+        """別の方法で測った計測値 (子プロセス内の時間など) を記録する。
+
+        Args:
+            name: ベンチマーク名 (結果 JSON のキー)
+            runs_ms: 各回の計測値 (ミリ秒)
+            threshold: 退行とみなす中央値の増加率
+            **params: 結果に残す条件
+        """
+        self.results[name] = BenchmarkResult(runs_ms=runs_ms, threshold=threshold, params=params)
+        print(f"\n[BENCH] {name}: median={statistics.median(runs_ms):.2f}ms min={min(runs_ms):.2f}ms")
+
+    def write(self) -> Path:
+        """計測結果を JSON に書き出す。"""
+        payload = {
+            "schema": BENCHMARK_SCHEMA_VERSION,
+            "created_at": datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+            "git": _git_info(),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "cpu_count": os.cpu_count(),
+                "sqlite": sqlite3.sqlite_version,
+            },
+            "dataset": self.dataset,
+            "benchmarks": {name: result.to_dict() for name, result in sorted(self.results.items())},
+        }
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.output_path.write_text(
+            json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        return self.output_path
+
+
+def _git_info() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=30,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.SubprocessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder() -> Iterator[BenchmarkRecorder]:
+    """計測結果をセッション終了時に ``LORAIRO_BENCH_OUTPUT`` へ書き出すレコーダー。"""
+    output = Path(os.environ.get("LORAIRO_BENCH_OUTPUT", ".benchmarks/latest.json"))
+    recorder = BenchmarkRecorder(output)
+    yield recorder
+    if recorder.results:
+        path = recorder.write()
+        print(f"\n[BENCH] results written to {path}")
+
+
+@pytest.fixture(scope="session")
+def synthetic_project(
+    tmp_path_factory: pytest.TempPathFactory, benchmark_recorder: BenchmarkRecorder
+) -> SyntheticProject:
+    """``LORAIRO_BENCH_IMAGES`` 件規模の合成プロジェクト (セッションで 1 回だけ生成)。"""
+    spec = SyntheticProjectSpec(
+        images=int(os.environ.get("LORAIRO_BENCH_IMAGES", SyntheticProjectSpec.images))
+    )
+    project = build_synthetic_project(tmp_path_factory.mktemp("bench_project"), spec)
+    benchmark_recorder.dataset = {**asdict(spec), "build_seconds": round(project.build_seconds, 3)}
+    print(f"\n[BENCH] synthetic project: {spec.images} images built in {project.build_seconds:.1f}s")
+    return project
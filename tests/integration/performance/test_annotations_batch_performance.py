@@ -0,0 +1,179 @@
+"""ImageRepository.get_image_annotations_batch の Core 行版 vs ORM グラフ版ベンチマーク。
+
+数千件規模のバッチ (Export / ResultsTab / CLI) で、列指定 SELECT から直接 dict を
+組み立てる Core 行版が ORM グラフ版 (selectinload + ``_assemble_annotations``) より
+速く、かつ同一の出力を返すことを計測・記録する。
+基準値超過はテスト失敗ではなく警告のみ（CI 環境依存が大きいため）。
+"""
+
+import time
+import uuid
+import warnings
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from lorairo.database.repository.base import resolve_tag_string_ids
+from lorairo.database.repository.image import ImageRepository
+from lorairo.database.schema import Base, Caption, Image, Model, Rating, Score, ScoreLabel, Tag
+
+
+def _orm_annotations_batch(repository: ImageRepository, image_ids: list[int]) -> dict[int, dict[str, Any]]:
+    """ORM グラフ版 (selectinload + ``_assemble_annotations``) の一括取得。比較の基準。"""
+    result: dict[int, dict[str, Any]] = {}
+    with repository.session_factory() as session:
+        for i in range(0, len(image_ids), repository.BATCH_CHUNK_SIZE):
+            chunk = image_ids[i : i + repository.BATCH_CHUNK_SIZE]
+            stmt = (
+                select(Image)
+                .where(Image.id.in_(chunk))
+                .options(
+                    selectinload(Image.tags),
+                    selectinload(Image.captions),
+                    selectinload(Image.scores),
+                    selectinload(Image.score_labels).selectinload(ScoreLabel.model),
+                    selectinload(Image.ratings).selectinload(Rating.model),
+                )
+            )
+            for image in session.execute(stmt).unique().scalars():
+                result[image.id] = repository._assemble_annotations(image, include_rejected=False)
+    return result
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+class TestAnnotationsBatchPerformance:
+    """5,000件 x 各種アノテーションでの一括取得パフォーマンステスト。
+
+    CI の通常実行では -m "not slow" で除外される。
+    """
+
+    TOTAL_IMAGES = 5_000
+    TAGS_PER_IMAGE = 20
+    # Core 行版が ORM 版に対して達成すべき最低速度比
+    TARGET_SPEEDUP = 1.5
+
+    @pytest.fixture(scope="class")
+    def perf_repository(self, tmp_path_factory):
+        """アノテーション付き画像を持つ SQLite DB を 1 回だけ作成し、(repository, image_ids) を返す。"""
+        db_path = tmp_path_factory.mktemp("annotations_perf_db") / "perf_test.db"
+        engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as session:
+            tagger = Model(name="wd-tagger", litellm_model_id="local/wd-tagger")
+            scorer = Model(name="aesthetic_shadow_v2", litellm_model_id="local/aesthetic_shadow_v2")
+            session.add_all([tagger, scorer])
+            session.flush()
+
+            session.bulk_insert_mappings(
+                Image,
+                [
+                    {
+                        "uuid": str(uuid.uuid4()),
+                        "phash": f"phash_{i:08d}",
+                        "original_image_path": f"/tmp/orig_{i}.webp",
+                        "stored_image_path": f"image_dataset/512/2024/01/01/img_{i:05d}.webp",
+                        "width": 512,
+                        "height": 512,
+                        "format": "webp",
+                        "extension": "webp",
+                    }
+                    for i in range(self.TOTAL_IMAGES)
+                ],
+            )
+            session.flush()
+            image_ids = [row.id for row in session.query(Image.id).all()]
+
+            tag_string_ids = resolve_tag_string_ids(
+                session, [f"tag_{n}" for n in range(self.TAGS_PER_IMAGE)]
+            )
+            session.bulk_insert_mappings(
+                Tag,
+                [
+                    {
+                        "image_id": image_id,
+                        "model_id": tagger.id,
+                        "tag_string_id": tag_string_ids[f"tag_{n}"],
+                        "confidence_score": 0.5,
+                        "existing": False,
+                        "is_edited_manually": False,
+                    }
+                    for image_id in image_ids
+                    for n in range(self.TAGS_PER_IMAGE)
+                ],
+            )
+            session.bulk_insert_mappings(
+                Caption,
+                [
+                    {"image_id": image_id, "model_id": tagger.id, "caption": f"caption {image_id}"}
+                    for image_id in image_ids
+                ],
+            )
+            session.bulk_insert_mappings(
+                Score,
+                [{"image_id": image_id, "model_id": scorer.id, "score": 0.5} for image_id in image_ids],
+            )
+            session.bulk_insert_mappings(
+                ScoreLabel,
+                [
+                    {"image_id": image_id, "model_id": scorer.id, "label": "aesthetic"}
+                    for image_id in image_ids
+                ],
+            )
+            session.bulk_insert_mappings(
+                Rating,
+                [
+                    {
+                        "image_id": image_id,
+                        "model_id": tagger.id,
+                        "raw_rating_value": "general",
+                        "normalized_rating": "PG",
+                    }
+                    for image_id in image_ids
+                ],
+            )
+            session.commit()
+
+        yield ImageRepository(session_factory=SessionLocal), image_ids
+
+        engine.dispose()
+
+    def test_core_rows_faster_than_orm_graph(self, perf_repository) -> None:
+        """Core 行版が ORM 版と同一結果を返し、TARGET_SPEEDUP 倍以上速いことを記録する。"""
+        repository, image_ids = perf_repository
+
+        start = time.perf_counter()
+        orm_result = _orm_annotations_batch(repository, image_ids)
+        orm_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        core_result = repository.get_image_annotations_batch(image_ids)
+        core_elapsed = time.perf_counter() - start
+
+        speedup = orm_elapsed / core_elapsed if core_elapsed > 0 else float("inf")
+        perf_summary = (
+            f"[PERF] images={len(image_ids)}, orm={orm_elapsed:.2f}s, core={core_elapsed:.2f}s, "
+            f"speedup={speedup:.1f}x (target>={self.TARGET_SPEEDUP}x)"
+        )
+        print(f"\n{perf_summary}")
+
+        if speedup < self.TARGET_SPEEDUP:
+            warnings.warn(
+                f"パフォーマンス基準未達: speedup={speedup:.1f}x < {self.TARGET_SPEEDUP}x. {perf_summary}",
+                UserWarning,
+                stacklevel=2,
+            )
+
+        # 動作保証: 出力契約が一致すること (ORM 版は relation 順未規定のため id 順で比較)
+        assert core_result.keys() == orm_result.keys()
+        for image_id in image_ids:
+            core = core_result[image_id]
+            orm = orm_result[image_id]
+            for key in ("tags", "captions", "scores", "score_labels", "ratings"):
+                assert core[key] == sorted(orm[key], key=lambda entry: entry["id"])
+            assert core["quality_summary"] == orm["quality_summary"]
+        assert len(core_result[image_ids[0]]["tags"]) == self.TAGS_PER_IMAGE
@@ -0,0 +1,300 @@
+"""合成プロジェクトに対するホットパスのベンチマーク。
+
+検索 (フィルタ組合せ別の件数取得 / 1 ページ取得)・アノテーション一括取得 / 一括保存・
+タグクラウド構築・画像登録・エクスポート・サムネイル読み込み・CLI 起動 import の実行時間を計測し、
+conftest の :class:`BenchmarkRecorder` で JSON に記録する。各テストは結果の妥当性も
+確認するため、計測と同時に動作保証にもなる。
+
+CI の通常実行では -m "not slow" で除外される。実行と比較::
+
+    LORAIRO_BENCH_OUTPUT=.benchmarks/head.json uv run pytest -m benchmark
+    python scripts/compare_benchmarks.py .benchmarks/base.json .benchmarks/head.json
+"""
+
+import random
+import statistics
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image as PILImage
+from PySide6.QtCore import QSize
+
+from lorairo.cli.commands.debug import (
+    DB_PROFILE_FILTERS,
+    DB_PROFILE_PAGE_SIZE,
+    STARTUP_TIME_BUDGET_S,
+    measure_import,
+)
+from lorairo.database.db_manager import ImageDatabaseManager
+from lorairo.database.filter_criteria import ImageFilterCriteria
+from lorairo.database.repository.annotation_record import AnnotationSaveItem
+from lorairo.database.repository.image import ImageRepository
+from lorairo.filesystem import FileSystemManager
+from lorairo.gui.workers.search_worker import SearchResult
+from lorairo.gui.workers.thumbnail_worker import ThumbnailWorker
+from lorairo.services.dataset_export_service import DatasetExportService
+from lorairo.services.search_models import SearchConditions
+from lorairo.services.tag_cloud_service import TagCloudService
+
+from .conftest import BenchmarkRecorder, SyntheticProject
+
+pytestmark = [pytest.mark.slow, pytest.mark.integration, pytest.mark.benchmark]
+
+# アノテーション一括取得 / 保存の対象件数 (Export / ResultsTab の 1 バッチ相当)
+ANNOTATION_BATCH_SIZE = 1000
+SAVE_BATCH_SIZE = 200
+REGISTRATION_BATCH_SIZE = 20
+
+
+@pytest.fixture(scope="module")
+def fsm(synthetic_project: SyntheticProject) -> FileSystemManager:
+    fsm = FileSystemManager()
+    fsm.initialize(synthetic_project.root)
+    return fsm
+
+
+@pytest.fixture(scope="module")
+def db_manager(synthetic_project: SyntheticProject, fsm: FileSystemManager) -> ImageDatabaseManager:
+    config_service = Mock()
+    config_service.get_preferred_resolutions.return_value = [(512, 512)]
+    image_repo = ImageRepository(
+        session_factory=synthetic_project.session_factory,
+        read_session_factory=synthetic_project.read_session_factory,
+    )
+    return ImageDatabaseManager(
+        config_service=config_service,
+        fsm=fsm,
+        session_factory=synthetic_project.session_factory,
+        image_repo=image_repo,
+    )
+
+
+@pytest.mark.parametrize(
+    ("filter_name", "filter_kwargs"), DB_PROFILE_FILTERS, ids=[f[0] for f in DB_PROFILE_FILTERS]
+)
+def test_search_by_filter(
+    filter_name: str,
+    filter_kwargs: dict,
+    db_manager: ImageDatabaseManager,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """フィルタ組合せごとの件数取得と 1 ページ取得 (GUI 検索と同じ include_annotations=False)。"""
+    repository = db_manager.image_repo
+    criteria = ImageFilterCriteria(**filter_kwargs)
+    page_criteria = replace(criteria, limit=DB_PROFILE_PAGE_SIZE, include_annotations=False)
+
+    count = benchmark_recorder.measure(
+        f"search.count.{filter_name}", lambda: repository.get_images_count_only(criteria)
+    )
+    page, total = benchmark_recorder.measure(
+        f"search.page.{filter_name}",
+        lambda: repository.get_images_by_filter(page_criteria),
+        page_size=DB_PROFILE_PAGE_SIZE,
+    )
+
+    assert total == count
+    assert len(page) == min(count, DB_PROFILE_PAGE_SIZE)
+
+
+def test_search_with_annotations(
+    synthetic_project: SyntheticProject,
+    db_manager: ImageDatabaseManager,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """アノテーション先読みありの検索 (Export / CLI search の経路)。"""
+    criteria = ImageFilterCriteria(tags=["1girl"], include_nsfw=True, limit=DB_PROFILE_PAGE_SIZE)
+
+    page, total = benchmark_recorder.measure(
+        "search.page_with_annotations.tag",
+        lambda: db_manager.image_repo.get_images_by_filter(criteria),
+        page_size=DB_PROFILE_PAGE_SIZE,
+    )
+
+    assert total > 0
+    assert page[0]["tags"]
+
+
+def test_get_image_annotations_batch(
+    synthetic_project: SyntheticProject,
+    db_manager: ImageDatabaseManager,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    image_ids = synthetic_project.image_ids[:ANNOTATION_BATCH_SIZE]
+
+    annotations = benchmark_recorder.measure(
+        "annotations.get_batch",
+        lambda: db_manager.image_repo.get_image_annotations_batch(image_ids),
+        images=len(image_ids),
+    )
+
+    assert annotations.keys() == set(image_ids)
+    expected_tags = synthetic_project.spec.tags_per_image * synthetic_project.spec.taggers
+    assert len(annotations[image_ids[0]]["tags"]) == expected_tags
+
+
+def test_save_annotations_batch(
+    synthetic_project: SyntheticProject,
+    db_manager: ImageDatabaseManager,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """既存タガーの結果を上書き保存する (再アノテーションの経路)。
+
+    外部タグ DB (canonical 解決) はネットワーク / 配布 DB に依存するため無効化し、
+    tag_id は合成語彙の ID を渡して DB 側の保存コストだけを計測する。
+    """
+    annotation_repo = db_manager.annotation_repo
+    annotation_repo.merged_reader = None
+    annotation_repo._merged_reader_initialized = True
+    rng = random.Random(synthetic_project.spec.seed)
+    model_id = synthetic_project.tagger_ids[0]
+    tags_per_image = synthetic_project.spec.tags_per_image
+    items = [
+        AnnotationSaveItem(
+            image_id=image_id,
+            annotations={
+                "tags": [
+                    {"tag": tag, "model_id": model_id, "tag_id": index + 1, "confidence_score": 0.9}
+                    for index, tag in rng.sample(
+                        list(enumerate(synthetic_project.vocabulary[:200])), k=tags_per_image
+                    )
+                ],
+                "scores": [{"score": 0.5, "model_id": model_id, "is_edited_manually": False}],
+            },
+            skip_existence_check=True,
+        )
+        for image_id in synthetic_project.image_ids[-SAVE_BATCH_SIZE:]
+    ]
+
+    saved = benchmark_recorder.measure(
+        "annotations.save_batch",
+        lambda: annotation_repo.save_annotations_batch(items),
+        repeat=3,
+        images=len(items),
+        tags_per_image=tags_per_image,
+    )
+
+    assert saved == len(items)
+
+
+def test_tag_cloud_build_graph(
+    db_manager: ImageDatabaseManager, benchmark_recorder: BenchmarkRecorder
+) -> None:
+    """タグ辞書のロードを含むコールドビルドと、キャッシュ済みのドリルダウン。"""
+    service = TagCloudService(db_manager)
+
+    cold = benchmark_recorder.measure(
+        "tag_cloud.build_graph.cold",
+        lambda: service.build_graph("girl"),
+        repeat=3,
+        setup=service.refresh,
+    )
+    drilldown = benchmark_recorder.measure(
+        "tag_cloud.build_graph.drilldown", lambda: service.build_graph("hair", selected_tags=["1girl"])
+    )
+
+    assert cold.matched_images > 0
+    assert cold.nodes
+    assert drilldown.matched_images <= cold.total_images
+
+
+def test_register_original_images(
+    tmp_path: Path,
+    synthetic_project: SyntheticProject,
+    db_manager: ImageDatabaseManager,
+    fsm: FileSystemManager,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """新規画像の登録 (pHash 計算・重複判定・コピー・DB 挿入)。"""
+    repeat = 3
+    rng = random.Random(synthetic_project.spec.seed)
+    batches: list[list[Path]] = []
+    for run in range(repeat + 1):  # warmup 1 回分を含む
+        batch = []
+        for index in range(REGISTRATION_BATCH_SIZE):
+            path = tmp_path / f"incoming_{run}" / f"new_{index:03d}.png"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 単色だと pHash が重複するため、ランダムなノイズ画像にする
+            PILImage.frombytes("RGB", (64, 64), rng.randbytes(64 * 64 * 3)).resize((512, 512)).save(path)
+            batch.append(path)
+        batches.append(batch)
+    pending = iter(batches)
+
+    def register_batch() -> list:
+        return [db_manager.register_original_image(path, fsm) for path in next(pending)]
+
+    results = benchmark_recorder.measure(
+        "registration.register_original_image",
+        register_batch,
+        repeat=repeat,
+        images=REGISTRATION_BATCH_SIZE,
+    )
+
+    assert all(result is not None for result in results)
+
+
+def test_export_txt(
+    tmp_path: Path,
+    synthetic_project: SyntheticProject,
+    db_manager: ImageDatabaseManager,
+    fsm: FileSystemManager,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """実ファイルを持つ画像の txt エクスポート (画像コピー + タグ / キャプション書き出し)。"""
+    image_ids = synthetic_project.file_backed_ids
+    service = DatasetExportService(
+        config_service=Mock(),
+        file_system_manager=fsm,
+        db_manager=db_manager,
+        search_processor=Mock(),
+    )
+    outputs = iter(range(1000))
+
+    def export() -> Path:
+        return service.export_with_criteria(
+            output_path=tmp_path / f"export_{next(outputs)}",
+            format_type="txt",
+            resolution=512,
+            criteria=ImageFilterCriteria(image_ids=image_ids),
+        )
+
+    output = benchmark_recorder.measure("export.txt", export, repeat=3, images=len(image_ids))
+
+    assert len(list(output.glob("*.txt"))) == len(image_ids)
+
+
+def test_thumbnail_loading(
+    qapp,
+    synthetic_project: SyntheticProject,
+    db_manager: ImageDatabaseManager,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """検索結果 1 ページ分のサムネイル読み込み (ThumbnailWorker のデコード + 縮小)。"""
+    metadata, _ = db_manager.image_repo.get_images_by_filter(
+        ImageFilterCriteria(image_ids=synthetic_project.file_backed_ids, include_annotations=False)
+    )
+    search_result = SearchResult(
+        image_metadata=metadata,
+        total_count=len(metadata),
+        search_time=0.0,
+        filter_conditions=SearchConditions(search_type="tags", keywords=[], tag_logic="and"),
+    )
+    worker = ThumbnailWorker(
+        search_result=search_result, thumbnail_size=QSize(128, 128), db_manager=db_manager
+    )
+
+    result = benchmark_recorder.measure("thumbnail.load_page", worker.execute, images=len(metadata))
+
+    assert result.failed_count == 0
+    assert len(result.loaded_thumbnails) == len(synthetic_project.file_backed_ids)
+
+
+def test_cli_import_time(benchmark_recorder: BenchmarkRecorder) -> None:
+    """``import lorairo.cli.main`` の時間 (fresh interpreter 内で計測) が起動予算に収まる。"""
+    reports = [measure_import() for _ in range(5)]
+    runs_ms = [report.import_seconds * 1000 for report in reports]
+
+    benchmark_recorder.record("cli.import_main", runs_ms, modules=reports[-1].module_count)
+
+    assert statistics.median(runs_ms) <= STARTUP_TIME_BUDGET_S * 1000
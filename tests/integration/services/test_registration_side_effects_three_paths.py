@@ -25,6 +25,7 @@ from lorairo.filesystem import FileSystemManager
 from lorairo.gui.workers.registration_worker import DatabaseRegistrationWorker
 from lorairo.public_api.images import _register_into_db
 from lorairo.services.configuration_service import ConfigurationService
+from lorairo.utils.directory_scan import ScannedImage
 
 # 分類 outcome の代表的な並び (新規 / 別版 / 重複 / 失敗) を 1 バッチに混在させる
 _OUTCOME_SEQUENCE = [
@@ -67,10 +68,9 @@ class TestRegistrationSideEffectStatsThreePaths:
         worker_db = Mock(spec=ImageDatabaseManager)
         worker_db.register_image_with_side_effects.side_effect = list(side_effect_results)
         worker_fsm = Mock(spec=FileSystemManager)
-        worker_fsm.get_image_files.return_value = image_files
+        worker_fsm.scan_image_files.return_value = [ScannedImage(path) for path in image_files]
         worker = DatabaseRegistrationWorker(tmp_path, worker_db, worker_fsm)
-        # 関連ファイル preload / tag cache は本テストの対象外なので空にする
-        worker._preload_associated_annotations = Mock(return_value={})
+        # tag cache は本テストの対象外なので空にする (走査結果にサイドカーは無い)
         worker._build_tag_id_cache = Mock(return_value={})
         worker_result = worker.execute()
 
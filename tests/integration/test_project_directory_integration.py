@@ -354,3 +354,94 @@ class TestServiceContainerSetActiveProject:
             assert container._dataset_export_service is None
         finally:
             del os.environ["LORAIRO_CLI_MODE"]
+
+    def test_set_active_project_same_project_keeps_services(self, tmp_path: Path) -> None:
+        """同一プロジェクトへの再切替は依存サービスとセッションファクトリを保持する"""
+        import os
+
+        from lorairo.services.service_container import ServiceContainer
+
+        os.environ["LORAIRO_CLI_MODE"] = "1"
+        try:
+            ServiceContainer.reset_for_testing()
+            container = ServiceContainer()
+            self._create_project_dir(tmp_path, "foo")
+            fake_config = {"directories": {"database_base_dir": str(tmp_path)}}
+
+            with patch(
+                "lorairo.services.project_management_service.get_config",
+                return_value=fake_config,
+            ):
+                container.set_active_project("foo")
+                repo = container.image_repository
+                db_manager = container.db_manager
+                container.set_active_project("foo")
+
+            assert container.image_repository is repo
+            assert container.db_manager is db_manager
+        finally:
+            del os.environ["LORAIRO_CLI_MODE"]
+
+    def test_clear_active_project_restores_default_db(self, tmp_path: Path) -> None:
+        """clear_active_project でプロジェクト未指定の状態に戻り、再切替は engine を再利用する"""
+        import os
+
+        from lorairo.database import db_core
+        from lorairo.services.service_container import ServiceContainer
+
+        os.environ["LORAIRO_CLI_MODE"] = "1"
+        try:
+            ServiceContainer.reset_for_testing()
+            container = ServiceContainer()
+            default_db_path = db_core.IMG_DB_PATH
+            project_dir = self._create_project_dir(tmp_path, "foo")
+            fake_config = {"directories": {"database_base_dir": str(tmp_path)}}
+
+            with patch(
+                "lorairo.services.project_management_service.get_config",
+                return_value=fake_config,
+            ):
+                container.set_active_project("foo")
+                session_factory = container.image_repository.session_factory
+                container.clear_active_project()
+
+                assert container.active_project_db_path is None
+                assert db_core.IMG_DB_PATH == default_db_path
+
+                container.set_active_project("foo")
+
+            assert container.active_project_db_path == project_dir / "image_database.db"
+            assert container.image_repository.session_factory is session_factory
+        finally:
+            del os.environ["LORAIRO_CLI_MODE"]
+
+    def test_set_active_project_uses_read_only_engine_for_search(self, tmp_path: Path) -> None:
+        """プロジェクト DB の検索は読み取り専用エンジンで行い、プール計測がサマリーに出る"""
+        import os
+
+        from lorairo.services.service_container import ServiceContainer
+
+        os.environ["LORAIRO_CLI_MODE"] = "1"
+        try:
+            ServiceContainer.reset_for_testing()
+            container = ServiceContainer()
+            self._create_project_dir(tmp_path, "foo")
+            fake_config = {"directories": {"database_base_dir": str(tmp_path)}}
+
+            with patch(
+                "lorairo.services.project_management_service.get_config",
+                return_value=fake_config,
+            ):
+                container.set_active_project("foo")
+
+            repo = container.image_repository
+            assert repo.read_session_factory is not repo.session_factory
+            assert repo.get_images_count_only() == 0
+
+            pools = container.get_service_summary()["database_pools"]
+            assert pools["write"]["role"] == "write"
+            assert "writer_gate" in pools["write"]
+            assert pools["read"]["role"] == "read"
+            assert pools["read"]["checkouts"] >= 1
+        finally:
+            del os.environ["LORAIRO_CLI_MODE"]
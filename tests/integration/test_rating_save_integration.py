@@ -11,6 +11,7 @@ from sqlalchemy import select
 
 from lorairo.database.filter_criteria import ImageFilterCriteria
 from lorairo.database.repository.annotation_record import AnnotationRepository
+from lorairo.database.repository.base import resolve_tag_string_ids
 from lorairo.database.repository.image import ImageRepository
 from lorairo.database.schema import Caption, Image, Model, Rating, Score, ScoreLabel, Tag
 from lorairo.services.annotation_save_service import AnnotationSaveService
@@ -264,7 +265,11 @@ def test_missing_model_filter_excludes_any_annotation_type_for_model(
         model_id = seeded_ids["model_id"]
         session.add_all(
             [
-                Tag(image_id=images[0].id, model_id=model_id, tag="tagged"),
+                Tag(
+                    image_id=images[0].id,
+                    model_id=model_id,
+                    tag_string_id=resolve_tag_string_ids(session, ["tagged"])["tagged"],
+                ),
                 Caption(image_id=images[1].id, model_id=model_id, caption="captioned"),
                 Score(image_id=images[2].id, model_id=model_id, score=0.8),
                 ScoreLabel(image_id=images[3].id, model_id=model_id, label="aesthetic"),
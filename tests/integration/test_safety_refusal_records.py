@@ -12,11 +12,13 @@ from types import SimpleNamespace
 
 import pytest
 from PIL import Image
+from sqlalchemy import update
 from sqlalchemy.orm import sessionmaker
 
 from lorairo.database.repository.annotation_record import AnnotationRepository
 from lorairo.database.repository.error_record import ErrorRecordRepository
 from lorairo.database.repository.image import ImageRepository
+from lorairo.database.schema import Image as ImageRow
 from lorairo.services.annotation_save_service import AnnotationSaveService
 
 SAFETY_REFUSAL = "SAFETY_REFUSAL"
@@ -423,6 +425,11 @@ def test_get_image_ids_by_filepaths_isolates_row_resolution_failures(
     動作を直接検証する。
     """
     image_id, file_path = registered_image
+    # path_key の索引検索で引ける行は stored_image_path を resolve しないため、
+    # キー未設定の行 (旧 DB / 衝突) として filename + resolve 比較のフォールバックを通す。
+    with repo.session_factory() as session:
+        session.execute(update(ImageRow).where(ImageRow.id == image_id).values(path_key=None))
+        session.commit()
 
     # 既存 row に対する `_safe_resolve_stored_path` を OSError で失敗させる。
     # row-level guard で例外が吸収され、result["sample.png"] は None になる
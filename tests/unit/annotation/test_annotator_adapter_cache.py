@@ -0,0 +1,139 @@
+"""AnnotatorLibraryAdapter.annotate() の推論結果キャッシュ統合テスト。"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from lorairo.annotation.annotator_adapter import AnnotatorLibraryAdapter
+from lorairo.annotation.inference_cache import InferenceResultCache
+from lorairo.utils import image_decode
+from lorairo.utils.image_decode import decode_image, set_decode_backend
+
+pytestmark = pytest.mark.unit
+
+
+def _fake_annotate(images_list, model_name_list, phash_list, **_kwargs):
+    return {
+        phash: {model: {"tags": [f"{model}:{phash}"], "error": None} for model in model_name_list}
+        for phash in phash_list
+    }
+
+
+@pytest.fixture
+def images(tmp_path: Path) -> list[Image.Image]:
+    loaded = []
+    for index, color in enumerate([(255, 0, 0), (0, 255, 0)]):
+        path = tmp_path / f"img{index}.png"
+        Image.new("RGB", (16, 16), color).save(path)
+        loaded.append(Image.open(path))
+    return loaded
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    cache = InferenceResultCache(tmp_path / "inference.sqlite")
+    yield cache
+    cache.close()
+
+
+def _adapter(cache: InferenceResultCache, prompt: str = "") -> AnnotatorLibraryAdapter:
+    config_service = MagicMock()
+
+    def get_setting(section: str, key: str, default: str = "") -> str:
+        if section == "prompts" and key == "additional":
+            return prompt
+        return default
+
+    config_service.get_setting.side_effect = get_setting
+    config_service.get_api_keys.return_value = {}
+    return AnnotatorLibraryAdapter(config_service, inference_cache=cache)
+
+
+def test_second_call_is_served_from_cache(cache, images):
+    adapter = _adapter(cache)
+    with patch("image_annotator_lib.annotate", side_effect=_fake_annotate) as mock_annotate:
+        first = adapter.annotate(images, ["wd-v3"], ["p0", "p1"])
+        second = adapter.annotate(images, ["wd-v3"], ["p0", "p1"])
+
+    assert mock_annotate.call_count == 1
+    assert second == first
+    assert cache.hits == 2
+
+
+def test_only_missing_models_are_inferred(cache, images):
+    adapter = _adapter(cache)
+    with patch("image_annotator_lib.annotate", side_effect=_fake_annotate) as mock_annotate:
+        adapter.annotate(images, ["wd-v3"], ["p0", "p1"])
+        result = adapter.annotate(images, ["wd-v3", "gpt-4o"], ["p0", "p1"])
+
+    second_call = mock_annotate.call_args_list[1].kwargs
+    assert second_call["model_name_list"] == ["gpt-4o"]
+    assert second_call["phash_list"] == ["p0", "p1"]
+    assert set(result["p0"]) == {"wd-v3", "gpt-4o"}
+
+
+def test_error_results_are_not_cached(cache, images):
+    adapter = _adapter(cache)
+
+    def failing_annotate(images_list, model_name_list, phash_list, **_kwargs):
+        return {p: {m: {"tags": [], "error": "rate limited"} for m in model_name_list} for p in phash_list}
+
+    with patch("image_annotator_lib.annotate", side_effect=failing_annotate) as mock_annotate:
+        adapter.annotate(images, ["gpt-4o"], ["p0", "p1"])
+        adapter.annotate(images, ["gpt-4o"], ["p0", "p1"])
+
+    assert mock_annotate.call_count == 2
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_prompt_change_misses_cache(cache, images):
+    with patch("image_annotator_lib.annotate", side_effect=_fake_annotate) as mock_annotate:
+        _adapter(cache).annotate(images, ["gpt-4o"], ["p0", "p1"])
+        _adapter(cache, prompt="describe lighting").annotate(images, ["gpt-4o"], ["p0", "p1"])
+
+    assert mock_annotate.call_count == 2
+
+
+def test_images_without_phash_bypass_cache(cache, images):
+    adapter = _adapter(cache)
+    with patch("image_annotator_lib.annotate", side_effect=lambda **kw: {}) as mock_annotate:
+        adapter.annotate(images, ["wd-v3"])
+
+    assert mock_annotate.call_args.kwargs["phash_list"] is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_in_memory_images_are_inferred_but_not_cached(cache):
+    adapter = _adapter(cache)
+    in_memory = [Image.new("RGB", (8, 8))]
+    with patch("image_annotator_lib.annotate", side_effect=_fake_annotate) as mock_annotate:
+        adapter.annotate(in_memory, ["wd-v3"], ["p0"])
+        adapter.annotate(in_memory, ["wd-v3"], ["p0"])
+
+    assert mock_annotate.call_count == 2
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_opencv_decoded_images_are_cached(cache, tmp_path):
+    pytest.importorskip("cv2")
+    paths = []
+    for index, color in enumerate([(255, 0, 0), (0, 255, 0)]):
+        path = tmp_path / f"big{index}.jpg"
+        Image.new("RGB", (1600, 1200), color).save(path, format="JPEG")
+        paths.append(path)
+    previous = image_decode.get_decode_backend()
+    set_decode_backend("opencv")
+    try:
+        decoded = [decode_image(path, max_edge=200) for path in paths]
+    finally:
+        image_decode._active_backend = previous
+    adapter = _adapter(cache)
+
+    with patch("image_annotator_lib.annotate", side_effect=_fake_annotate) as mock_annotate:
+        adapter.annotate(decoded, ["wd-v3"], ["p0", "p1"])
+        adapter.annotate(decoded, ["wd-v3"], ["p0", "p1"])
+
+    assert mock_annotate.call_count == 1
+    assert cache.hits == 2
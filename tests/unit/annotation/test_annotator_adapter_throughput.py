@@ -0,0 +1,125 @@
+"""AnnotatorLibraryAdapter.annotate() のスループット計測統合テスト。"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from lorairo.annotation.annotator_adapter import AnnotatorLibraryAdapter
+from lorairo.annotation.model_residency import ModelResidencyManager
+from lorairo.services.model_throughput_stats import ModelThroughputStats
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def stats():
+    stats = ModelThroughputStats(":memory:")
+    yield stats
+    stats.close()
+
+
+@pytest.fixture
+def images() -> list[Image.Image]:
+    return [Image.new("RGB", (8, 8), (i * 40, 0, 0)) for i in range(3)]
+
+
+def _adapter(stats: ModelThroughputStats | None, **kwargs) -> AnnotatorLibraryAdapter:
+    config_service = MagicMock()
+    config_service.get_setting.side_effect = lambda section, key, default="": default
+    config_service.get_api_keys.return_value = {}
+    return AnnotatorLibraryAdapter(config_service, throughput_stats=stats, **kwargs)
+
+
+def test_each_model_is_called_and_recorded_separately_when_opted_in(stats, images):
+    def fake_annotate(images_list, model_name_list, phash_list, **_kwargs):
+        (model,) = model_name_list
+        results = {}
+        for index, phash in enumerate(phash_list):
+            error = "boom" if model == "gpt-4o" and index == 0 else None
+            usage = {"prompt_tokens": 1200, "completion_tokens": 300} if model == "gpt-4o" else None
+            results[phash] = {model: {"tags": ["x"], "error": error, "usage": usage}}
+        return results
+
+    with patch("image_annotator_lib.annotate", side_effect=fake_annotate) as mock_annotate:
+        result = _adapter(stats, per_model_timing=True).annotate(
+            images, ["wd-v3", "gpt-4o"], ["p0", "p1", "p2"]
+        )
+
+    assert [c.kwargs["model_name_list"] for c in mock_annotate.call_args_list] == [["wd-v3"], ["gpt-4o"]]
+    assert set(result["p0"]) == {"wd-v3", "gpt-4o"}
+
+    local = stats.get("wd-v3")
+    api = stats.get("gpt-4o")
+    assert local is not None and api is not None
+    assert local.images == 3
+    assert local.failure_rate == 0.0
+    assert local.seconds_per_image is not None
+    assert local.input_tokens_per_image is None
+    assert api.failure_rate == pytest.approx(1 / 3)
+    assert api.input_tokens_per_image == pytest.approx(1200)
+    assert api.output_tokens_per_image == pytest.approx(300)
+
+
+def test_missing_results_count_as_failures(stats, images):
+    def partial_annotate(images_list, model_name_list, phash_list, **_kwargs):
+        return {phash_list[0]: {model_name_list[0]: {"tags": ["x"], "error": None}}}
+
+    with patch("image_annotator_lib.annotate", side_effect=partial_annotate):
+        _adapter(stats).annotate(images, ["wd-v3"], ["p0", "p1", "p2"])
+
+    recorded = stats.get("wd-v3")
+    assert recorded is not None
+    assert recorded.failure_rate == pytest.approx(2 / 3)
+
+
+def test_library_exception_is_recorded_and_reraised(stats, images):
+    with (
+        patch("image_annotator_lib.annotate", side_effect=RuntimeError("down")),
+        pytest.raises(RuntimeError),
+    ):
+        _adapter(stats).annotate(images, ["gpt-4o"], ["p0", "p1", "p2"])
+
+    recorded = stats.get("gpt-4o")
+    assert recorded is not None
+    assert recorded.failure_rate == 1.0
+    assert recorded.seconds_per_image is None
+
+
+def test_without_stats_models_are_called_together(images):
+    with patch("image_annotator_lib.annotate", return_value={}) as mock_annotate:
+        _adapter(None).annotate(images, ["wd-v3", "gpt-4o"], ["p0", "p1", "p2"])
+
+    mock_annotate.assert_called_once()
+    assert mock_annotate.call_args.kwargs["model_name_list"] == ["wd-v3", "gpt-4o"]
+
+
+def test_multi_model_call_stays_single_and_unrecorded_by_default(stats, images):
+    with patch("image_annotator_lib.annotate", return_value={}) as mock_annotate:
+        _adapter(stats).annotate(images, ["wd-v3", "gpt-4o"], ["p0", "p1", "p2"])
+
+    mock_annotate.assert_called_once()
+    assert mock_annotate.call_args.kwargs["model_name_list"] == ["wd-v3", "gpt-4o"]
+    assert stats.all() == []
+
+
+def test_call_that_loads_a_local_model_is_not_recorded(stats, images):
+    residency = ModelResidencyManager(1024**3, release_fn=lambda _model: True, rss_fn=lambda: None)
+    adapter = _adapter(stats, model_residency=residency)
+    infos = [SimpleNamespace(name="wd-v3", litellm_model_id="wd-v3", is_api=False, estimated_size_gb=0.1)]
+
+    def fake_annotate(images_list, model_name_list, phash_list, **_kwargs):
+        return {phash: {"wd-v3": {"tags": ["x"], "error": None}} for phash in phash_list}
+
+    with (
+        patch.object(adapter, "list_annotator_info", return_value=infos),
+        patch("image_annotator_lib.annotate", side_effect=fake_annotate),
+    ):
+        adapter.annotate(images, ["wd-v3"], ["p0", "p1", "p2"])
+        assert stats.get("wd-v3") is None  # 初回ロードを含む呼び出し
+
+        adapter.annotate(images, ["wd-v3"], ["p0", "p1", "p2"])
+
+    recorded = stats.get("wd-v3")
+    assert recorded is not None and recorded.runs == 1
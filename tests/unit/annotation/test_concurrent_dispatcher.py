@@ -0,0 +1,404 @@
+"""ConcurrentAnnotationDispatcher ユニットテスト
+
+実 provider の代わりに偽の provider 関数 (FakeProvider) を注入し、
+レート制限・429 再試行・AIMD 同時実行数調整・完了順ストリーミングを検証する。
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from lorairo.annotation.concurrent_dispatcher import (
+    AimdConcurrency,
+    ConcurrentAnnotationDispatcher,
+    DispatchOutcome,
+    ProviderLimits,
+    RetryPolicy,
+    TokenBucket,
+    WebApiDispatchSettings,
+    build_dispatch_requests,
+    classify_error,
+)
+from lorairo.services.model_throughput_stats import ModelThroughputStats
+
+pytestmark = pytest.mark.unit
+
+NO_WAIT_RETRY = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0, jitter=0.0)
+
+
+class FakeClock:
+    """手動で進める時計。"""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class RateLimitError(Exception):
+    """litellm.RateLimitError 相当 (status_code=429)。"""
+
+    status_code = 429
+
+    def __init__(self, message: str = "429 Too Many Requests", retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class FakeProvider:
+    """AnnotationRunner.execute_annotation 互換の偽 provider。
+
+    ``failures`` に (model_id, 先頭画像) → 失敗させる例外/結果エラーのリストを与えると、
+    呼び出しごとに先頭から消費する。同時実行数の最大値も記録する。
+    """
+
+    def __init__(self, *, latency: float = 0.0, failures: dict | None = None) -> None:
+        self.latency = latency
+        self.failures = {key: list(values) for key, values in (failures or {}).items()}
+        self.calls: list[tuple[str, tuple[str, ...]]] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *, image_paths, litellm_model_ids, phash_list=None):
+        (model_id,) = litellm_model_ids
+        with self._lock:
+            self.calls.append((model_id, tuple(image_paths)))
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            planned = self.failures.get((model_id, image_paths[0]))
+            failure = planned.pop(0) if planned else None
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if isinstance(failure, Exception):
+                raise failure
+            error = failure if isinstance(failure, str) else None
+            return {
+                f"phash-{path}": {model_id: SimpleNamespace(tags=["cat"], error=error)}
+                for path in image_paths
+            }
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_second=1.0, capacity=2, clock=clock, sleep=clock.advance)
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(1.0)
+
+        clock.advance(1.0)
+        assert bucket.try_acquire() == 0.0
+
+    def test_acquire_waits_with_injected_sleep(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_second=2.0, capacity=1, clock=clock, sleep=clock.advance)
+
+        assert bucket.acquire()
+        start = clock.now
+        assert bucket.acquire()
+        assert clock.now - start == pytest.approx(0.5)
+
+    def test_pause_blocks_until_retry_after(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_second=10.0, capacity=5, clock=clock, sleep=clock.advance)
+
+        bucket.pause(3.0)
+
+        assert bucket.try_acquire() == pytest.approx(3.0)
+        clock.advance(3.0)
+        # 停止中はバーストも使い切った扱いになる
+        assert bucket.try_acquire() == pytest.approx(0.1)
+
+    def test_acquire_returns_false_when_canceled(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_second=1.0, capacity=1, clock=clock, sleep=clock.advance)
+        bucket.pause(60.0)
+
+        assert bucket.acquire(is_canceled=lambda: True) is False
+
+
+class TestAimdConcurrency:
+    def test_multiplicative_decrease_with_cooldown(self):
+        clock = FakeClock()
+        limiter = AimdConcurrency(8, maximum=16, decrease_cooldown=1.0, clock=clock)
+
+        limiter.on_throttle()
+        limiter.on_throttle()  # 同時に飛んでいた分の 429 は 1 回の減少にまとめる
+        assert limiter.limit == 4
+
+        clock.advance(1.5)
+        limiter.on_throttle()
+        assert limiter.limit == 2
+
+    def test_additive_increase_up_to_maximum(self):
+        limiter = AimdConcurrency(2, maximum=3)
+
+        limiter.on_success()
+        assert limiter.limit == 2
+        limiter.on_success()
+        assert limiter.limit == 3
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.limit == 3
+
+    def test_decrease_never_goes_below_minimum(self):
+        clock = FakeClock()
+        limiter = AimdConcurrency(1, minimum=1, maximum=4, clock=clock)
+
+        limiter.on_throttle()
+
+        assert limiter.limit == 1
+
+
+class TestClassifyError:
+    def test_429_is_throttled_and_honors_retry_after(self):
+        classification = classify_error(RateLimitError(retry_after=7))
+
+        assert classification.retryable is True
+        assert classification.throttled is True
+        assert classification.retry_after == 7.0
+
+    def test_retry_after_header_on_response(self):
+        exc = Exception("quota exceeded")
+        exc.response = SimpleNamespace(status_code=429, headers={"retry-after": "2.5"})  # type: ignore[attr-defined]
+
+        classification = classify_error(exc)
+
+        assert classification.throttled is True
+        assert classification.retry_after == 2.5
+
+    def test_server_error_is_retryable_without_throttle(self):
+        exc = Exception("upstream")
+        exc.status_code = 503  # type: ignore[attr-defined]
+
+        assert classify_error(exc) == (True, False, None)
+
+    def test_client_error_is_not_retryable(self):
+        exc = Exception("bad request")
+        exc.status_code = 400  # type: ignore[attr-defined]
+
+        assert classify_error(exc).retryable is False
+        assert classify_error(ValueError("broken image")).retryable is False
+
+    def test_timeout_class_name_is_retryable(self):
+        class APITimeoutError(Exception):
+            pass
+
+        assert classify_error(APITimeoutError("timed out")) == (True, False, None)
+
+
+class TestRetryPolicy:
+    def test_exponential_backoff_capped(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.0)
+
+        assert [policy.delay_for(attempt) for attempt in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_retry_after_overrides_backoff(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=30.0, jitter=0.0)
+
+        assert policy.delay_for(1, retry_after=12.0) == 12.0
+        assert policy.delay_for(1, retry_after=120.0) == 30.0
+
+
+class TestBuildDispatchRequests:
+    def test_chunk_major_order_with_phashes(self):
+        requests = build_dispatch_requests(
+            ["a", "b", "c"],
+            {"openai/gpt-4o": "openai", "claude": "anthropic"},
+            chunk_size=2,
+            phash_list=["pa", "pb", "pc"],
+        )
+
+        assert [(r.model_id, r.image_paths, r.phash_list) for r in requests] == [
+            ("openai/gpt-4o", ("a", "b"), ("pa", "pb")),
+            ("claude", ("a", "b"), ("pa", "pb")),
+            ("openai/gpt-4o", ("c",), ("pc",)),
+            ("claude", ("c",), ("pc",)),
+        ]
+
+
+class TestConcurrentAnnotationDispatcher:
+    @staticmethod
+    def _dispatcher(provider, limits=None, retry_policy=NO_WAIT_RETRY):
+        return ConcurrentAnnotationDispatcher(
+            provider,
+            limits or {"default": ProviderLimits(requests_per_minute=60_000, max_concurrency=4)},
+            retry_policy=retry_policy,
+        )
+
+    def test_streams_every_result_on_calling_thread(self):
+        provider = FakeProvider(latency=0.01)
+        requests = build_dispatch_requests(
+            [f"img{i}" for i in range(6)], {"m1": "openai", "m2": "google"}, chunk_size=2
+        )
+        caller_thread = threading.get_ident()
+        received: list[DispatchOutcome] = []
+        callback_threads: set[int] = set()
+
+        def on_result(outcome: DispatchOutcome) -> None:
+            callback_threads.add(threading.get_ident())
+            received.append(outcome)
+
+        report = self._dispatcher(provider).dispatch(requests, on_result=on_result)
+
+        assert report.total_requests == report.completed_requests == 6
+        assert callback_threads == {caller_thread}
+        assert all(outcome.succeeded for outcome in received)
+        assert {(o.request.model_id, o.request.image_paths) for o in received} == {
+            (r.model_id, r.image_paths) for r in requests
+        }
+        assert set(report.provider_stats) == {"openai", "google"}
+
+    def test_retries_429_and_reduces_concurrency(self):
+        provider = FakeProvider(failures={("m1", "img0"): [RateLimitError(retry_after=0)]})
+        dispatcher = self._dispatcher(
+            provider, {"openai": ProviderLimits(requests_per_minute=60_000, max_concurrency=8)}
+        )
+
+        received: list[DispatchOutcome] = []
+        report = dispatcher.dispatch(
+            build_dispatch_requests(["img0"], {"m1": "openai"}, chunk_size=1), on_result=received.append
+        )
+
+        (outcome,) = received
+        assert outcome.succeeded
+        assert outcome.attempts == 2
+        stats = report.provider_stats["openai"]
+        assert (stats.retries, stats.throttled, stats.failures) == (1, 1, 0)
+        # 初期値 (上限の半分 = 4) から 429 で半減
+        assert stats.final_concurrency == 2
+
+    def test_result_level_rate_limit_error_is_retried(self):
+        provider = FakeProvider(failures={("m1", "img0"): ["RateLimitError: 429 rate limit exceeded"]})
+
+        received: list[DispatchOutcome] = []
+        report = self._dispatcher(provider).dispatch(
+            build_dispatch_requests(["img0"], {"m1": "openai"}, chunk_size=1), on_result=received.append
+        )
+
+        assert received[0].attempts == 2
+        assert received[0].results["phash-img0"]["m1"].error is None
+        assert report.provider_stats["openai"].throttled == 1
+
+    def test_non_retryable_error_is_reported_once(self):
+        provider = FakeProvider(failures={("m1", "img0"): [ValueError("invalid image")]})
+
+        received: list[DispatchOutcome] = []
+        report = self._dispatcher(provider).dispatch(
+            build_dispatch_requests(["img0", "img1"], {"m1": "openai"}, chunk_size=1),
+            on_result=received.append,
+        )
+
+        failed = [outcome for outcome in received if not outcome.succeeded]
+        assert len(failed) == 1
+        assert isinstance(failed[0].error, ValueError)
+        assert failed[0].attempts == 1
+        assert report.provider_stats["openai"].failures == 1
+
+    def test_gives_up_after_max_attempts(self):
+        provider = FakeProvider(failures={("m1", "img0"): [RateLimitError(retry_after=0)] * 5})
+
+        received: list[DispatchOutcome] = []
+        self._dispatcher(provider).dispatch(
+            build_dispatch_requests(["img0"], {"m1": "openai"}, chunk_size=1), on_result=received.append
+        )
+
+        assert received[0].attempts == NO_WAIT_RETRY.max_attempts
+        assert isinstance(received[0].error, RateLimitError)
+
+    def test_in_flight_requests_respect_provider_concurrency(self):
+        provider = FakeProvider(latency=0.02)
+        limits = {
+            "openai": ProviderLimits(requests_per_minute=60_000, max_concurrency=3, initial_concurrency=3)
+        }
+
+        report = self._dispatcher(provider, limits).dispatch(
+            build_dispatch_requests([f"img{i}" for i in range(12)], {"m1": "openai"}, chunk_size=1)
+        )
+
+        assert report.completed_requests == 12
+        assert 1 < provider.max_in_flight <= 3
+
+    def test_cancellation_stops_pending_requests(self):
+        provider = FakeProvider(latency=0.01)
+        limits = {"default": ProviderLimits(requests_per_minute=60_000, max_concurrency=1)}
+        canceled = threading.Event()
+
+        report = self._dispatcher(provider, limits).dispatch(
+            build_dispatch_requests([f"img{i}" for i in range(20)], {"m1": "openai"}, chunk_size=1),
+            on_result=lambda outcome: canceled.set(),
+            is_canceled=canceled.is_set,
+        )
+
+        assert report.canceled is True
+        assert report.completed_requests < report.total_requests
+        assert len(provider.calls) < 20
+
+
+class TestWebApiDispatchSettings:
+    def test_disabled_for_unconfigured_or_mock_config(self):
+        settings = WebApiDispatchSettings.from_config(Mock())
+
+        assert settings.enabled is False
+        assert settings.chunk_size == 4
+
+    def test_reads_annotation_section(self):
+        values = {
+            "concurrent_webapi": True,
+            "webapi_chunk_size": 8,
+            "webapi_max_attempts": 6,
+            "provider_limits": {
+                "default": {"requests_per_minute": 30, "max_concurrency": 2},
+                "OpenAI": {"requests_per_minute": 500},
+            },
+        }
+        config = Mock()
+        config.get_setting.side_effect = lambda section, key, default=None: values.get(key, default)
+
+        settings = WebApiDispatchSettings.from_config(config)
+
+        assert settings.enabled is True
+        assert settings.chunk_size == 8
+        assert settings.retry_policy.max_attempts == 6
+        assert settings.provider_limits["default"] == ProviderLimits(30.0, 2)
+        # 未指定のキーは default の値を引き継ぐ
+        assert settings.provider_limits["openai"] == ProviderLimits(500.0, 2)
+
+    def test_zero_chunk_size_selects_from_measured_throughput(self):
+        config = Mock()
+        config.get_setting.side_effect = lambda section, key, default=None: (
+            0 if key == "webapi_chunk_size" else default
+        )
+        settings = WebApiDispatchSettings.from_config(config)
+        throughput = ModelThroughputStats(":memory:")
+        throughput.record("fast", images=10, seconds=10.0)
+        throughput.record("slow", images=2, seconds=20.0)
+
+        assert settings.auto_chunk_size is True
+        assert settings.chunk_size == 4
+        # fast: 30 秒 / 1 秒 = 16 (上限), slow: 30 / 10 = 3 → 遅い方に合わせる
+        assert settings.resolve_chunk_size(["fast"], throughput) == 16
+        assert settings.resolve_chunk_size(["fast", "slow"], throughput) == 3
+        # 未計測モデルは既定のチャンクサイズで見積もる
+        assert settings.resolve_chunk_size(["unknown"], throughput) == 4
+        throughput.close()
+
+    def test_fixed_chunk_size_ignores_throughput(self):
+        throughput = ModelThroughputStats(":memory:")
+        throughput.record("slow", images=2, seconds=20.0)
+
+        assert WebApiDispatchSettings(chunk_size=8).resolve_chunk_size(["slow"], throughput) == 8
+        throughput.close()
@@ -0,0 +1,172 @@
+"""InferenceResultCache (推論結果の内容アドレス型キャッシュ) のユニットテスト。"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from lorairo.annotation.inference_cache import (
+    INFERENCE_CACHE_VERSION,
+    InferenceCacheKey,
+    InferenceResultCache,
+    hash_prompt,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _key(phash: str = "p1", model_id: str = "wd-v3", **overrides) -> InferenceCacheKey:
+    fields = {
+        "phash": phash,
+        "file_size": 100,
+        "model_id": model_id,
+        "model_version": "1.0",
+        "prompt_hash": hash_prompt(None),
+    }
+    fields.update(overrides)
+    return InferenceCacheKey(**fields)
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    cache = InferenceResultCache(tmp_path / "cache" / "inference.sqlite")
+    yield cache
+    cache.close()
+
+
+class TestGetPut:
+    def test_round_trip_counts_hits_and_misses(self, cache):
+        cache.put_many([(_key(), {"tags": ["1girl"], "error": None})])
+
+        found = cache.get_many([_key(), _key(phash="p2")])
+
+        assert found == {_key(): {"tags": ["1girl"], "error": None}}
+        assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [("file_size", 101), ("model_version", "2.0"), ("prompt_hash", hash_prompt("more detail"))],
+    )
+    def test_any_key_component_change_is_a_miss(self, cache, field, value):
+        cache.put_many([(_key(), {"tags": ["a"]})])
+
+        assert cache.get_many([_key(**{field: value})]) == {}
+
+    def test_results_persist_across_reopen(self, tmp_path):
+        path = tmp_path / "inference.sqlite"
+        first = InferenceResultCache(path)
+        first.put_many([(_key(), {"tags": ["a"]})])
+        first.close()
+
+        second = InferenceResultCache(path)
+        try:
+            assert second.get_many([_key()]) == {_key(): {"tags": ["a"]}}
+        finally:
+            second.close()
+
+    def test_non_json_value_is_skipped(self, cache):
+        assert cache.put_many([(_key(), lambda: None)]) == 0
+        assert cache.get_stats()["entries"] == 0
+
+    def test_pydantic_result_is_stored_as_json_and_read_back_as_dict(self, cache):
+        class Result(BaseModel):
+            tags: list[str]
+            error: str | None = None
+
+        cache.put_many([(_key(), Result(tags=["1girl"]))])
+
+        payload = cache._conn.execute("SELECT payload FROM inference_results").fetchone()[0]
+        assert json.loads(payload) == {"tags": ["1girl"], "error": None}
+        assert cache.get_many([_key()]) == {_key(): {"tags": ["1girl"], "error": None}}
+
+
+class TestEviction:
+    def test_least_recently_used_entries_are_evicted_over_budget(self, tmp_path):
+        cache = InferenceResultCache(tmp_path / "inference.sqlite", max_bytes=2500)
+        try:
+            payload = "x" * 1000
+            cache.put_many([(_key("old"), payload)])
+            cache.put_many([(_key("used"), payload)])
+            # "used" を参照して最終使用時刻を更新しておく
+            cache.get_many([_key("used")])
+            cache.put_many([(_key("new"), payload)])
+
+            found = cache.get_many([_key("old"), _key("used"), _key("new")])
+        finally:
+            cache.close()
+
+        assert set(found) == {_key("used"), _key("new")}
+        assert cache.evictions == 1
+
+
+class TestInvalidate:
+    def test_invalidate_by_model(self, cache):
+        cache.put_many([(_key(model_id="wd-v3"), 1), (_key(model_id="gpt-4o"), 2)])
+
+        assert cache.invalidate(model_id="wd-v3") == 1
+        assert cache.get_stats()["models"] == {"gpt-4o": 1}
+
+    def test_invalidate_by_phash(self, cache):
+        cache.put_many([(_key("p1"), 1), (_key("p2"), 2)])
+
+        assert cache.invalidate(phash="p1") == 1
+        assert set(cache.get_many([_key("p1"), _key("p2")])) == {_key("p2")}
+
+    def test_invalidate_without_filters_clears_all(self, cache):
+        cache.put_many([(_key("p1"), 1), (_key("p2", model_id="gpt-4o"), 2)])
+
+        assert cache.invalidate() == 2
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestStats:
+    def test_stats_report_sizes_and_hit_rate(self, cache):
+        cache.put_many([(_key(), "value")])
+        cache.get_many([_key(), _key("p2")])
+
+        stats = cache.get_stats()
+
+        assert stats["entries"] == 1
+        assert stats["total_bytes"] > 0
+        assert stats["models"] == {"wd-v3": 1}
+        assert stats["hit_rate"] == 0.5
+
+    def test_hit_rate_is_none_without_lookups(self, cache):
+        assert cache.get_stats()["hit_rate"] is None
+
+
+class TestRecovery:
+    def test_version_mismatch_drops_cached_results(self, tmp_path):
+        path = tmp_path / "inference.sqlite"
+        cache = InferenceResultCache(path)
+        cache.put_many([(_key(), 1)])
+        cache.close()
+        with sqlite3.connect(path) as conn:
+            conn.execute(f"PRAGMA user_version = {INFERENCE_CACHE_VERSION + 1}")
+
+        reopened = InferenceResultCache(path)
+        try:
+            assert reopened.get_many([_key()]) == {}
+        finally:
+            reopened.close()
+
+    def test_corrupt_file_is_recreated(self, tmp_path):
+        path = tmp_path / "inference.sqlite"
+        path.write_bytes(b"not a sqlite database" * 100)
+
+        cache = InferenceResultCache(path)
+        try:
+            cache.put_many([(_key(), 1)])
+            assert cache.get_many([_key()]) == {_key(): 1}
+        finally:
+            cache.close()
+
+    def test_unreadable_payload_is_treated_as_miss_and_removed(self, cache):
+        cache.put_many([(_key(), 1)])
+        cache._conn.execute("UPDATE inference_results SET payload = ?", (b"broken",))
+        cache._conn.commit()
+
+        assert cache.get_many([_key()]) == {}
+        assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,269 @@
+"""ModelResidencyManager (ローカルモデルのメモリ予算付き LRU 常駐管理) のユニットテスト。"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lorairo.annotation import model_residency
+from lorairo.annotation.annotator_adapter import AnnotatorLibraryAdapter
+from lorairo.annotation.model_residency import (
+    UNKNOWN_MODEL_BYTES,
+    ModelResidencyManager,
+    resolve_budget_bytes,
+)
+
+pytestmark = pytest.mark.unit
+
+MB = 1024 * 1024
+
+
+class FakeProcess:
+    """推論呼び出しごとに RSS を増やす擬似プロセス。"""
+
+    def __init__(self) -> None:
+        self.rss = 100 * MB
+        self.now = 0.0
+
+    def load(self, size: int) -> None:
+        self.rss += size
+
+    def clock(self) -> float:
+        self.now += 1.0
+        return self.now
+
+
+@pytest.fixture
+def process() -> FakeProcess:
+    return FakeProcess()
+
+
+@pytest.fixture
+def release() -> MagicMock:
+    return MagicMock(return_value=True)
+
+
+def _manager(process: FakeProcess, release: MagicMock, budget: int) -> ModelResidencyManager:
+    return ModelResidencyManager(
+        budget, release_fn=release, rss_fn=lambda: process.rss, clock=process.clock
+    )
+
+
+class TestUse:
+    def test_first_use_records_measured_rss_growth(self, process, release):
+        manager = _manager(process, release, budget=1000 * MB)
+
+        with manager.use(["wd-v3"], {"wd-v3": 400 * MB}):
+            process.load(300 * MB)
+
+        stats = manager.get_stats()
+        assert stats["models"]["wd-v3"] == {"size_bytes": 300 * MB, "measured": True, "uses": 1}
+        assert (manager.loads, manager.warm_hits) == (1, 0)
+
+    def test_second_use_is_a_warm_hit(self, process, release):
+        manager = _manager(process, release, budget=1000 * MB)
+        with manager.use(["wd-v3"]):
+            process.load(300 * MB)
+
+        with manager.use(["wd-v3"]):
+            pass
+
+        assert (manager.loads, manager.warm_hits) == (1, 1)
+        release.assert_not_called()
+
+    def test_growth_is_split_by_estimated_size(self, process, release):
+        manager = _manager(process, release, budget=1000 * MB)
+
+        with manager.use(["small", "large"], {"small": 100 * MB, "large": 300 * MB}):
+            process.load(400 * MB)
+
+        models = manager.get_stats()["models"]
+        assert models["small"]["size_bytes"] == 100 * MB
+        assert models["large"]["size_bytes"] == 300 * MB
+
+    def test_estimate_is_used_when_rss_is_unavailable(self, process, release):
+        manager = ModelResidencyManager(
+            2000 * MB, release_fn=release, rss_fn=lambda: None, clock=process.clock
+        )
+
+        with manager.use(["wd-v3", "unknown"], {"wd-v3": 200 * MB}):
+            pass
+
+        models = manager.get_stats()["models"]
+        assert models["wd-v3"] == {"size_bytes": 200 * MB, "measured": False, "uses": 1}
+        assert models["unknown"]["size_bytes"] == UNKNOWN_MODEL_BYTES
+
+
+class TestConcurrency:
+    def test_lock_is_not_held_during_inference(self, process, release):
+        manager = _manager(process, release, budget=1000 * MB)
+        entered = threading.Event()
+        finish = threading.Event()
+
+        def slow_call() -> None:
+            with manager.use(["a"], {"a": 100 * MB}):
+                entered.set()
+                finish.wait(timeout=5)
+
+        worker = threading.Thread(target=slow_call)
+        worker.start()
+        try:
+            assert entered.wait(timeout=5)
+            with manager.use(["b"], {"b": 100 * MB}) as loaded:
+                assert loaded == ("b",)
+            assert manager.is_resident("b")
+        finally:
+            finish.set()
+            worker.join(timeout=5)
+        assert manager.is_resident("a")
+
+    def test_overlapping_calls_use_estimates_instead_of_rss_growth(self, process, release):
+        manager = _manager(process, release, budget=2000 * MB)
+
+        with manager.use(["a"], {"a": 100 * MB}):
+            with manager.use(["b"], {"b": 200 * MB}):
+                process.load(700 * MB)  # 他スレッドの確保も混ざった増分
+
+        models = manager.get_stats()["models"]
+        assert models["a"] == {"size_bytes": 100 * MB, "measured": False, "uses": 1}
+        assert models["b"] == {"size_bytes": 200 * MB, "measured": False, "uses": 1}
+
+    def test_models_in_use_by_another_call_are_not_released(self, process, release):
+        manager = _manager(process, release, budget=300 * MB)
+        with manager.use(["a"], {"a": 200 * MB}):
+            process.load(200 * MB)
+
+        with manager.use(["a"]):
+            with manager.use(["b"], {"b": 200 * MB}):
+                assert release.call_count == 0
+
+        assert release.call_count == 1
+
+
+class TestEviction:
+    def test_least_recently_used_model_is_released_before_loading(self, process, release):
+        manager = _manager(process, release, budget=500 * MB)
+        for model_id in ("a", "b"):
+            with manager.use([model_id], {model_id: 200 * MB}):
+                process.load(200 * MB)
+        with manager.use(["a"]):
+            pass
+
+        with manager.use(["c"], {"c": 200 * MB}):
+            process.load(200 * MB)
+
+        release.assert_called_once_with("b")
+        assert set(manager.get_stats()["models"]) == {"a", "c"}
+        assert manager.evictions == 1
+
+    def test_models_in_use_are_not_released_before_the_call(self, process, release):
+        manager = _manager(process, release, budget=300 * MB)
+        with manager.use(["a"], {"a": 200 * MB}):
+            process.load(200 * MB)
+
+        with manager.use(["a", "b"], {"b": 200 * MB}):
+            assert release.call_count == 0
+            process.load(200 * MB)
+
+        # 呼び出し後は予算に収まるまで古いものから解放される
+        assert manager.resident_bytes <= 300 * MB
+        assert release.call_count == 1
+
+    def test_model_larger_than_budget_is_not_retained(self, process, release):
+        manager = _manager(process, release, budget=100 * MB)
+
+        with manager.use(["huge"], {"huge": 800 * MB}):
+            process.load(800 * MB)
+
+        release.assert_called_once_with("huge")
+        assert not manager.is_resident("huge")
+
+    def test_release_failure_keeps_model_tracked(self, process):
+        release = MagicMock(side_effect=RuntimeError("boom"))
+        manager = _manager(process, release, budget=100 * MB)
+
+        with manager.use(["huge"], {"huge": 800 * MB}):
+            process.load(800 * MB)
+
+        # 解放できなかったモデルはロードされたままなので常駐として数え続ける
+        assert set(manager.get_stats()["models"]) == {"huge"}
+        assert manager.evictions == 0
+
+    def test_missing_release_api_disables_tracking(self, process):
+        release = MagicMock(return_value=False)
+        manager = _manager(process, release, budget=100 * MB)
+
+        with manager.use(["huge"], {"huge": 800 * MB}):
+            process.load(800 * MB)
+        with manager.use(["other"], {"other": 800 * MB}) as loaded:
+            assert loaded == ()
+
+        release.assert_called_once_with("huge")
+        stats = manager.get_stats()
+        assert stats["enabled"] is False
+        assert set(stats["models"]) == {"huge"}
+        assert manager.evictions == 0
+
+    def test_clear_releases_all_models(self, process, release):
+        manager = _manager(process, release, budget=1000 * MB)
+        with manager.use(["a", "b"]):
+            process.load(200 * MB)
+
+        manager.clear()
+
+        assert sorted(call.args[0] for call in release.call_args_list) == ["a", "b"]
+        assert manager.resident_bytes == 0
+
+
+class TestBudget:
+    def test_explicit_budget_in_mib(self):
+        assert resolve_budget_bytes(2048) == 2048 * MB
+
+    @pytest.mark.parametrize("value", [0, None, -1, True, "1024"])
+    def test_auto_budget_uses_half_of_physical_memory(self, monkeypatch, value):
+        monkeypatch.setattr(model_residency, "physical_memory_bytes", lambda: 16 * 1024 * MB)
+
+        assert resolve_budget_bytes(value) == 8 * 1024 * MB
+
+
+class TestReleaseLibraryModel:
+    def test_returns_false_without_library_release_api(self, monkeypatch):
+        monkeypatch.delattr("image_annotator_lib.release_model", raising=False)
+        with patch("importlib.import_module") as import_module:
+            import_module.return_value = SimpleNamespace()
+
+            assert model_residency.release_library_model("wd-v3") is False
+
+    def test_calls_public_release_api(self):
+        library = SimpleNamespace(release_model=MagicMock())
+        with patch("importlib.import_module", return_value=library):
+            assert model_residency.release_library_model("wd-v3") is True
+
+        library.release_model.assert_called_once_with("wd-v3")
+
+
+class TestAdapterIntegration:
+    def test_only_local_models_are_tracked(self, process, release):
+        manager = _manager(process, release, budget=1000 * MB)
+        config_service = MagicMock()
+        config_service.get_setting.return_value = ""
+        config_service.get_api_keys.return_value = {}
+        adapter = AnnotatorLibraryAdapter(config_service, model_residency=manager)
+        infos = [
+            SimpleNamespace(name="wd-v3", litellm_model_id="wd-v3", is_api=False, estimated_size_gb=0.5),
+            SimpleNamespace(
+                name="gpt-4o", litellm_model_id="openai/gpt-4o", is_api=True, estimated_size_gb=None
+            ),
+        ]
+
+        with (
+            patch.object(adapter, "list_annotator_info", return_value=infos),
+            patch("image_annotator_lib.annotate", return_value={}) as mock_annotate,
+        ):
+            adapter.annotate([MagicMock()], ["wd-v3", "openai/gpt-4o"])
+            adapter.annotate([MagicMock()], ["wd-v3"])
+
+        assert mock_annotate.call_count == 2
+        assert set(manager.get_stats()["models"]) == {"wd-v3"}
+        assert (manager.loads, manager.warm_hits) == (1, 1)
@@ -0,0 +1,100 @@
+"""annotate cache (推論結果キャッシュ) コマンドのユニットテスト。"""
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from lorairo.annotation.inference_cache import InferenceCacheKey, InferenceResultCache
+from lorairo.cli.main import app
+
+pytestmark = pytest.mark.unit
+
+runner = CliRunner()
+
+
+def _key(phash: str, model_id: str) -> InferenceCacheKey:
+    return InferenceCacheKey(phash, 100, model_id, "1.0", "prompt")
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "inference.sqlite"
+    cache = InferenceResultCache(path)
+    cache.put_many([(_key("p1", "wd-v3"), 1), (_key("p2", "wd-v3"), 2), (_key("p1", "gpt-4o"), 3)])
+    cache.close()
+    monkeypatch.setattr("lorairo.cli.commands.annotate.DEFAULT_INFERENCE_CACHE_PATH", path)
+    return path
+
+
+def _json_lines(output: str) -> list[dict]:
+    return [json.loads(line) for line in output.splitlines() if line.startswith("{")]
+
+
+def test_stats_json_reports_entries_per_model(cache_path):
+    result = runner.invoke(app, ["--json", "annotate", "cache", "stats"])
+
+    assert result.exit_code == 0, result.output
+    lines = _json_lines(result.stdout)
+    items = {line["model_id"]: line["entries"] for line in lines if line["kind"] == "item"}
+    assert items == {"gpt-4o": 1, "wd-v3": 2}
+    assert lines[-1]["kind"] == "result"
+    assert lines[-1]["entries"] == 3
+
+
+def test_stats_table_output(cache_path):
+    result = runner.invoke(app, ["annotate", "cache", "stats"])
+
+    assert result.exit_code == 0, result.output
+    assert "wd-v3" in result.stdout
+
+
+def test_clear_by_model_keeps_other_models(cache_path):
+    result = runner.invoke(app, ["--json", "annotate", "cache", "clear", "--model", "wd-v3", "--force"])
+
+    assert result.exit_code == 0, result.output
+    assert _json_lines(result.stdout)[-1]["deleted"] == 2
+    cache = InferenceResultCache(cache_path)
+    try:
+        assert cache.get_stats()["models"] == {"gpt-4o": 1}
+    finally:
+        cache.close()
+
+
+def test_clear_without_filters_removes_everything(cache_path):
+    result = runner.invoke(app, ["--json", "annotate", "cache", "clear", "--force"])
+
+    assert result.exit_code == 0, result.output
+    assert _json_lines(result.stdout)[-1]["deleted"] == 3
+
+
+def _entries(cache_path: Path) -> int:
+    cache = InferenceResultCache(cache_path)
+    try:
+        return cache.get_stats()["entries"]
+    finally:
+        cache.close()
+
+
+def test_clear_requires_force_in_json_mode(cache_path):
+    result = runner.invoke(app, ["--json", "annotate", "cache", "clear"])
+
+    assert result.exit_code == 2
+    last = _json_lines(result.stdout)[-1]
+    assert last["kind"] == "error"
+    assert last["code"] == "INVALID_INPUT"
+    assert _entries(cache_path) == 3
+
+
+def test_clear_asks_for_confirmation_without_force(cache_path):
+    cancelled = runner.invoke(app, ["annotate", "cache", "clear"], input="n\n")
+
+    assert cancelled.exit_code == 0, cancelled.output
+    assert "Cancelled" in cancelled.stdout
+    assert _entries(cache_path) == 3
+
+    confirmed = runner.invoke(app, ["annotate", "cache", "clear", "--model", "gpt-4o"], input="y\n")
+
+    assert confirmed.exit_code == 0, confirmed.output
+    assert _entries(cache_path) == 2
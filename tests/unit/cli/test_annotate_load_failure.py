@@ -164,6 +164,25 @@ def test_load_batch_raises_on_memory_error(
         _load_batch_images(records)
 
 
+@pytest.mark.unit
+@pytest.mark.cli
+def test_load_batch_reduces_jpeg_only_when_db_phash_present(tmp_path: Path) -> None:
+    """pHash を持つレコードの JPEG は縮小デコード、持たないレコードはフル解像度でロードする。"""
+    path = tmp_path / "large.jpg"
+    Image.new("RGB", (1600, 1200), color=(10, 20, 30)).save(path, "JPEG")
+    records = [
+        {"id": 1, "phash": "p", "stored_image_path": str(path)},
+        {"id": 2, "phash": None, "stored_image_path": str(path)},
+    ]
+
+    images, loaded_records, loaded, failed = _load_batch_images(records, max_edge=200)
+
+    assert (loaded, failed) == (2, 0)
+    assert [r["id"] for r in loaded_records] == [1, 2]
+    assert images[0].size == (200, 150)
+    assert images[1].size == (1600, 1200)
+
+
 # ===== End-to-end CLI exit code =====
 
 
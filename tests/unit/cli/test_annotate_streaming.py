@@ -22,6 +22,7 @@ from lorairo.cli.commands.annotate import (
 )
 from lorairo.cli.main import app
 from lorairo.services.annotation_save_service import AnnotationSaveResult
+from lorairo.services.model_throughput_stats import ModelThroughputStats
 from lorairo.services.project_management_service import ProjectManagementService
 from lorairo.services.service_container import ServiceContainer
 
@@ -239,6 +240,35 @@ def test_streaming_single_batch_when_batch_size_ge_dataset(
     assert "Loaded 3 image(s)" in result.stdout
 
 
+@pytest.mark.unit
+@pytest.mark.cli
+@patch("lorairo.cli.commands.annotate.get_service_container")
+def test_omitted_batch_size_uses_measured_throughput(
+    mock_get_container: MagicMock,
+    project_with_n_images,
+) -> None:
+    """--batch-size 省略時は実測スループットからチャンクサイズを選び、推定時間を表示する。
+
+    1 枚 10 秒のモデル → 30 秒 / 10 秒 = 3 枚ずつ → 7 件で annotate 3 回。
+    """
+    image_files = project_with_n_images(7)
+    mock_container = _build_container(image_files)
+    throughput = ModelThroughputStats(":memory:")
+    throughput.record("gpt-4o-mini", images=2, seconds=20.0)
+    mock_container.model_throughput_stats = throughput
+    mock_get_container.return_value = mock_container
+
+    result = runner.invoke(
+        app,
+        ["annotate", "run", "--project", "stream_dataset", "--model", "gpt-4o-mini"],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert mock_container.annotator_library.annotate.call_count == 3
+    assert "Estimated time: 1m10s for 7 image(s) (measured 1/1 model(s), batch size 3)" in result.stdout
+    throughput.close()
+
+
 @pytest.mark.unit
 @pytest.mark.cli
 @pytest.mark.parametrize("bad_value", ["0", "-1"])
@@ -75,3 +75,59 @@ def test_app_object_available_without_heavy_imports() -> None:
     )
     result = _run_probe(probe)
     assert result.returncode == 0, f"stdout={result.stdout!r}\nstderr={result.stderr!r}"
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+def test_import_main_within_startup_budget() -> None:
+    """Test: `import lorairo.cli.main` が起動予算 (重いモジュール無し / モジュール数) に収まる。
+
+    時間予算 (``STARTUP_TIME_BUDGET_S``) は実行環境の負荷に左右されるため、ここでは検証せず
+    ベンチマーク (``tests/integration/performance/test_hot_path_benchmarks.py``) で計測する。
+    """
+    from lorairo.cli.commands.debug import STARTUP_MODULE_BUDGET, measure_import
+
+    report = measure_import("lorairo.cli.main")
+
+    assert report.heavy_modules_loaded() == []
+    assert report.module_count <= STARTUP_MODULE_BUDGET, (
+        f"{report.module_count} modules > budget {STARTUP_MODULE_BUDGET}; "
+        "run `lorairo-cli debug import-time` to see what was added"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+def test_help_does_not_import_subcommand_modules() -> None:
+    """Test: root の `--help` はサブコマンドモジュールを import しない。"""
+    probe = (
+        "import sys\n"
+        "from lorairo.cli.main import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith('lorairo.cli.commands.'))\n"
+        "assert not loaded, f'unexpected eager import: {loaded}'\n"
+    )
+    result = _run_probe(probe)
+    assert result.returncode == 0, f"stdout={result.stdout!r}\nstderr={result.stderr!r}"
+    assert "images" in result.stdout
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+def test_subcommand_imports_only_its_group() -> None:
+    """Test: サブコマンド実行時は該当グループのモジュールだけを import する。"""
+    probe = (
+        "import sys\n"
+        "from lorairo.cli.main import main\n"
+        "try:\n"
+        "    main(['project', '--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'lorairo.cli.commands.project' in sys.modules\n"
+        "assert 'lorairo.cli.commands.annotate' not in sys.modules\n"
+    )
+    result = _run_probe(probe)
+    assert result.returncode == 0, f"stdout={result.stdout!r}\nstderr={result.stderr!r}"
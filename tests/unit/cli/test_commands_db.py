@@ -0,0 +1,101 @@
+"""db コマンド群のユニットテスト。"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from typer.testing import CliRunner
+
+from lorairo.cli.main import app
+from lorairo.database.db_core import create_db_engine
+from lorairo.database.maintenance import DatabaseMaintenanceService, MaintenanceThresholds
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def maintenance_service(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'image_database.db'}?check_same_thread=False")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+        connection.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        connection.exec_driver_sql("CREATE INDEX ix_items_name ON items (name)")
+        connection.exec_driver_sql(
+            "WITH RECURSIVE s(v) AS (SELECT 1 UNION ALL SELECT v + 1 FROM s WHERE v < 200) "
+            "INSERT INTO items (name) SELECT 'n' || v FROM s"
+        )
+    yield DatabaseMaintenanceService(engine, MaintenanceThresholds())
+    engine.dispose()
+
+
+@pytest.fixture
+def mock_container(monkeypatch, maintenance_service):
+    container = MagicMock()
+    container.db_manager.maintenance_service = maintenance_service
+    monkeypatch.setattr("lorairo.cli.commands.db.api_get_project", MagicMock(return_value=MagicMock()))
+    monkeypatch.setattr("lorairo.cli.commands.db.get_service_container", MagicMock(return_value=container))
+    return container
+
+
+def _jsonl(stdout: str) -> list[dict]:
+    return [json.loads(line) for line in stdout.strip().splitlines() if line.strip()]
+
+
+@pytest.mark.unit
+class TestDbMaintain:
+    def test_json_emits_actions_and_before_after_stats(self, mock_container):
+        result = runner.invoke(app, ["--json", "db", "maintain", "--project", "proj"])
+
+        assert result.exit_code == 0, result.output
+        rows = _jsonl(result.stdout)
+        items, final = rows[:-1], rows[-1]
+        assert [row["action"] for row in items] == [
+            "analyze",
+            "optimize",
+            "incremental_vacuum",
+            "wal_checkpoint",
+        ]
+        assert all(row["kind"] == "item" and row["ok"] for row in items)
+        assert final["kind"] == "result"
+        assert final["ok"] is True
+        assert final["dry_run"] is False
+        assert final["before"]["stat1_rows"] == 0
+        assert final["after"]["stat1_rows"] > 0
+        assert final["after"]["wal_bytes"] == 0
+
+    def test_dry_run_reports_stats_without_changes(self, mock_container, maintenance_service):
+        result = runner.invoke(app, ["--json", "db", "maintain", "--project", "proj", "--dry-run"])
+
+        assert result.exit_code == 0, result.output
+        rows = _jsonl(result.stdout)
+        assert len(rows) == 1
+        assert rows[0]["dry_run"] is True
+        assert rows[0]["after"] is None
+        assert maintenance_service.collect_stats().stat1_rows == 0
+
+    def test_vacuum_switches_to_incremental_auto_vacuum(self, mock_container):
+        result = runner.invoke(app, ["--json", "db", "maintain", "--project", "proj", "--vacuum"])
+
+        assert result.exit_code == 0, result.output
+        rows = _jsonl(result.stdout)
+        assert "vacuum" in [row.get("action") for row in rows[:-1]]
+        assert rows[-1]["before"]["auto_vacuum"] == "none"
+        assert rows[-1]["after"]["auto_vacuum"] == "incremental"
+        assert rows[-1]["after"]["journal_mode"] == "wal"
+
+    def test_human_output_prints_stats_table(self, mock_container):
+        result = runner.invoke(app, ["db", "maintain", "--project", "proj"])
+
+        assert result.exit_code == 0, result.output
+        assert "Free pages" in result.output
+        assert "wal_checkpoint" in result.output
+
+    def test_non_file_database_is_an_error(self, mock_container):
+        mock_container.db_manager.maintenance_service = None
+
+        result = runner.invoke(app, ["--json", "db", "maintain", "--project", "proj"])
+
+        assert result.exit_code != 0
+        assert _jsonl(result.stdout)[-1]["kind"] == "error"
@@ -0,0 +1,126 @@
+"""debug コマンド (import-time / db-profile) のテスト。"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from lorairo.cli.commands.debug import (
+    DB_PROFILE_FILTERS,
+    ImportReport,
+    ImportTiming,
+    _parse_importtime,
+)
+from lorairo.cli.main import app
+
+runner = CliRunner()
+
+pytestmark = [pytest.mark.unit, pytest.mark.cli]
+
+
+def _report(target: str, modules: list[str]) -> ImportReport:
+    return ImportReport(
+        target=target,
+        import_seconds=0.25,
+        modules=modules,
+        timings=[ImportTiming("slow", 9000, 12000), ImportTiming("fast", 10, 10)],
+    )
+
+
+def test_parse_importtime_skips_header_and_strips_indent() -> None:
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        300 |   lorairo.cli._emit\n"
+        "unrelated line\n"
+    )
+
+    assert _parse_importtime(stderr) == [ImportTiming("lorairo.cli._emit", 120, 300)]
+
+
+def test_heavy_modules_match_by_prefix() -> None:
+    report = _report("lorairo.cli.main", ["sqlalchemy.orm", "torchvision", "typer"])
+
+    assert report.heavy_modules_loaded() == ["sqlalchemy"]
+
+
+def test_import_time_json_reports_budget() -> None:
+    report = _report("lorairo.cli.main", ["typer", "PIL.Image"])
+    with patch("lorairo.cli.commands.debug.measure_import", return_value=report) as measure:
+        result = runner.invoke(app, ["--json", "debug", "import-time", "--top", "1"])
+
+    assert result.exit_code == 0, result.stdout
+    payload = json.loads(result.stdout.strip().splitlines()[-1])
+    measure.assert_called_once_with("lorairo.cli.main")
+    assert payload["heavy_modules"] == ["PIL"]
+    assert payload["within_budget"] is False
+    assert [entry["module"] for entry in payload["slowest"]] == ["slow"]
+
+
+def test_import_time_resolves_command_group_module() -> None:
+    with patch(
+        "lorairo.cli.commands.debug.measure_import",
+        return_value=_report("lorairo.cli.commands.images", []),
+    ) as measure:
+        result = runner.invoke(app, ["--json", "debug", "import-time", "images"])
+
+    assert result.exit_code == 0, result.stdout
+    measure.assert_called_once_with("lorairo.cli.commands.images")
+    assert json.loads(result.stdout.strip().splitlines()[-1])["within_budget"] is None
+
+
+def test_import_time_unknown_group_is_invalid_input() -> None:
+    result = runner.invoke(app, ["--json", "debug", "import-time", "missing"])
+
+    assert result.exit_code == 2
+    assert json.loads(result.stdout.strip().splitlines()[-1])["code"] == "INVALID_INPUT"
+
+
+def _profiled_repository(tmp_path) -> MagicMock:
+    """プロファイラに登録された実エンジンへ SELECT を流す ImageRepository もどき。"""
+    from sqlalchemy import text
+
+    from lorairo.database.db_core import create_db_engine
+
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'profile.sqlite'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE images (id INTEGER PRIMARY KEY, width INTEGER)"))
+
+    def count(criteria) -> int:
+        if criteria.caption:
+            raise ValueError("boom")
+        with engine.connect() as connection:
+            return int(connection.execute(text("SELECT count(*) FROM images WHERE width > 0")).scalar_one())
+
+    repository = MagicMock()
+    repository.get_images_count_only.side_effect = count
+    repository.get_images_by_filter.return_value = ([], 0)
+    return repository
+
+
+def test_db_profile_json_reports_statements_and_full_scans(tmp_path) -> None:
+    from lorairo.database.query_profiler import get_query_profiler
+
+    container = MagicMock()
+    container.db_manager.image_repo = _profiled_repository(tmp_path)
+    with (
+        patch("lorairo.public_api.project.get_project") as get_project,
+        patch("lorairo.services.service_container.get_service_container", return_value=container),
+    ):
+        result = runner.invoke(app, ["--json", "debug", "db-profile", "-p", "demo", "--repeat", "2"])
+
+    assert result.exit_code == 0, result.stdout
+    lines = [json.loads(line) for line in result.stdout.strip().splitlines()]
+    items, final = lines[:-1], lines[-1]
+    get_project.assert_called_once_with("demo")
+    container.set_active_project.assert_called_once_with("demo")
+    assert final["count"] == len(items) == 1
+    assert items[0]["sql"] == "SELECT count(*) FROM images WHERE width > ?"
+    assert items[0]["full_scans"] == ["images"]
+    assert final["full_scans"] == ["images"]
+    filters = {entry["name"]: entry for entry in final["filters"]}
+    assert len(filters) == len(DB_PROFILE_FILTERS)
+    assert filters["caption"]["error"] == "boom"
+    assert filters["all"]["matched"] == 0
+    # 計測を有効化していなかったプロセスでは終了後に元へ戻す
+    assert not get_query_profiler().enabled
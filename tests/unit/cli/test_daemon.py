@@ -0,0 +1,216 @@
+"""``lorairo-cli serve`` デーモンと thin client のテスト。"""
+
+import json
+import socket
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import typer
+
+from lorairo.cli import _daemon
+from lorairo.cli._daemon import (
+    CliDaemonServer,
+    requested_project,
+    resolve_client_socket,
+    send_request,
+    should_forward,
+    supports_unix_sockets,
+)
+from lorairo.cli.main import _run_in_daemon, app, main
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.cli,
+    pytest.mark.skipif(not supports_unix_sockets(), reason="Unix domain sockets are not available"),
+]
+
+
+@pytest.fixture
+def socket_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # AF_UNIX のパス長制限 (~104 bytes) に収めるため短い一時ディレクトリを使う
+    return tmp_path_factory.mktemp("d") / "cli.sock"
+
+
+def _serve(server: CliDaemonServer) -> Iterator[CliDaemonServer]:
+    thread = threading.Thread(target=server.serve_until_idle, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        send_request(server.socket_path, {"op": "shutdown"}, timeout=5)
+        thread.join(timeout=5)
+        server.server_close()
+
+
+@pytest.fixture
+def echo_server(socket_path: Path) -> Iterator[CliDaemonServer]:
+    """argv を JSONL の result 行として返すだけのデーモン。"""
+    seen: list[list[str]] = []
+
+    def runner(argv: list[str], json_mode: bool) -> int:
+        print(json.dumps({"kind": "result", "ok": True, "argv": argv, "json": json_mode}))
+        print("log line", file=sys.stderr)
+        return 3 if "fail" in argv else 0
+
+    server = CliDaemonServer(socket_path, runner, idle_timeout=30, before_request=seen.append)
+    server.seen = seen  # type: ignore[attr-defined]
+    yield from _serve(server)
+
+
+def test_resolve_client_socket() -> None:
+    assert resolve_client_socket({}) is None
+    assert resolve_client_socket({"LORAIRO_CLI_DAEMON": "0"}) is None
+    assert resolve_client_socket({"LORAIRO_CLI_DAEMON": "1"}) == _daemon.default_socket_path()
+    assert resolve_client_socket({"LORAIRO_CLI_DAEMON": "/run/x.sock"}) == Path("/run/x.sock")
+
+
+def test_should_forward_only_json_commands() -> None:
+    assert should_forward(["images", "show", "1"], json_mode=True)
+    assert not should_forward(["images", "show", "1"], json_mode=False)
+    assert not should_forward(["--log-level", "DEBUG", "serve"], json_mode=True)
+    assert not should_forward(["serve", "--stop"], json_mode=True)
+    assert not should_forward(["debug", "import-time"], json_mode=True)
+    assert not should_forward(["--help"], json_mode=True)
+
+
+def test_requested_project() -> None:
+    assert requested_project(["images", "list", "--project", "demo"]) == "demo"
+    assert requested_project(["errors", "list", "-p", "demo"]) == "demo"
+    assert requested_project(["export", "create", "--project=demo"]) == "demo"
+    assert requested_project(["images", "show", "--", "--project", "x"]) is None
+    assert requested_project(["version"]) is None
+
+
+def test_round_trip_returns_captured_output(echo_server: CliDaemonServer) -> None:
+    response = send_request(
+        echo_server.socket_path, {"argv": ["tags", "add", "fail"], "json": True}, timeout=5
+    )
+
+    assert response["exit_code"] == 3
+    assert json.loads(response["stdout"]) == {
+        "kind": "result",
+        "ok": True,
+        "argv": ["tags", "add", "fail"],
+        "json": True,
+    }
+    assert response["stderr"] == "log line\n"
+    assert response["elapsed_ms"] >= 0
+    assert echo_server.seen == [["tags", "add", "fail"]]  # type: ignore[attr-defined]
+
+
+def test_invalid_request_is_rejected(echo_server: CliDaemonServer) -> None:
+    response = send_request(echo_server.socket_path, {"argv": "images list"}, timeout=5)
+
+    assert response["exit_code"] == 2
+    assert "argv must be a list of strings" in response["stderr"]
+
+
+def test_ping_reports_request_count(echo_server: CliDaemonServer) -> None:
+    send_request(echo_server.socket_path, {"argv": ["version"]}, timeout=5)
+
+    response = send_request(echo_server.socket_path, {"op": "ping"}, timeout=5)
+
+    assert response["ok"] is True
+    assert response["requests"] == 1
+
+
+def test_stalled_client_does_not_block_later_requests(socket_path: Path) -> None:
+    server = CliDaemonServer(socket_path, lambda argv, json_mode: 0, idle_timeout=30, request_timeout=0.2)
+    served = _serve(server)
+    next(served)
+    stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stalled.connect(str(socket_path))
+    try:
+        # 改行を送らずに止まるクライアント
+        stalled.sendall(b'{"op": ')
+
+        response = send_request(socket_path, {"op": "ping"}, timeout=5)
+
+        assert response["ok"] is True
+        assert stalled.recv(1) == b""  # サーバ側がタイムアウトで切断済み
+    finally:
+        stalled.close()
+        served.close()
+
+
+def test_idle_timeout_stops_server_and_removes_socket(socket_path: Path) -> None:
+    server = CliDaemonServer(socket_path, lambda argv, json_mode: 0, idle_timeout=0.05)
+    try:
+        server.serve_until_idle()
+    finally:
+        server.server_close()
+
+    assert not socket_path.exists()
+
+
+def test_second_server_on_same_socket_is_refused(echo_server: CliDaemonServer) -> None:
+    with pytest.raises(FileExistsError):
+        CliDaemonServer(echo_server.socket_path, lambda argv, json_mode: 0, idle_timeout=1)
+
+
+def test_socket_is_created_private(echo_server: CliDaemonServer) -> None:
+    mode = echo_server.socket_path.stat().st_mode & 0o777
+
+    assert mode & 0o077 == 0
+
+
+def test_bind_refuses_directory_shared_with_other_users(socket_path: Path) -> None:
+    socket_path.parent.chmod(0o755)
+
+    with pytest.raises(_daemon.InsecureSocketDirectoryError, match="chmod 700"):
+        CliDaemonServer(socket_path, lambda argv, json_mode: 0, idle_timeout=1)
+
+
+def test_bind_refuses_symlinked_directory(tmp_path_factory: pytest.TempPathFactory) -> None:
+    real = tmp_path_factory.mktemp("r")
+    link = real.parent / f"{real.name}-link"
+    link.symlink_to(real, target_is_directory=True)
+
+    with pytest.raises(_daemon.InsecureSocketDirectoryError, match="symlink"):
+        CliDaemonServer(link / "cli.sock", lambda argv, json_mode: 0, idle_timeout=1)
+
+
+def test_client_refuses_socket_in_shared_directory(echo_server: CliDaemonServer) -> None:
+    echo_server.socket_path.parent.chmod(0o755)
+    try:
+        with pytest.raises(_daemon.DaemonUnavailableError, match="Refusing to connect"):
+            send_request(echo_server.socket_path, {"op": "ping"}, timeout=5)
+    finally:
+        echo_server.socket_path.parent.chmod(0o700)
+
+
+def test_main_falls_back_to_local_execution_without_daemon(
+    socket_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("LORAIRO_CLI_DAEMON", str(socket_path))
+
+    main(["--json", "version"])
+
+    assert json.loads(capsys.readouterr().out)["version"] == "0.0.8"
+
+
+def test_main_forwards_json_commands_to_daemon(
+    socket_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """thin client の stdout はデーモンが実行した CLI の JSONL と一致する。"""
+    server = CliDaemonServer(socket_path, _run_in_daemon(typer.main.get_command(app)), idle_timeout=30)
+    served = _serve(server)
+    next(served)
+    try:
+        monkeypatch.setenv("LORAIRO_CLI_DAEMON", str(socket_path))
+        main(["--json", "version"])
+        forwarded = capsys.readouterr().out
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--json", "no-such-command"])
+        error = json.loads(capsys.readouterr().out)
+    finally:
+        next(served, None)
+
+    assert json.loads(forwarded)["version"] == "0.0.8"
+    assert server.request_count == 2
+    assert exc_info.value.code != 0
+    assert error["kind"] == "error"
@@ -687,3 +687,58 @@ def test_describe_translations_suppress_and_unsuppress_expose_apply_field() -> N
         input_row = next(row for row in rows if row.get("type") == "model" and row["name"] == input_name)
         apply_field = next(f for f in input_row["fields"] if f["name"] == "apply")
         assert apply_field["default"] is False
+
+
+def test_describe_debug_import_time_exposes_budget_result() -> None:
+    result = runner.invoke(app, ["--json", "describe", "debug import-time", "--schema", "json_schema"])
+
+    assert result.exit_code == 0
+    rows = _jsonl(result.stdout)
+    assert rows[0]["read_only"] is True
+    output = next(row for row in rows if row.get("type") == "schema" and row["role"] == "output")
+    assert output["name"] == "DebugImportTimeResult"
+    assert {"import_seconds", "module_count", "heavy_modules", "within_budget", "slowest"} <= set(
+        output["schema"]["properties"]
+    )
+
+
+def test_describe_annotate_cache_clear_requires_force_in_json_mode() -> None:
+    result = runner.invoke(app, ["--json", "describe", "annotate cache clear"])
+
+    assert result.exit_code == 0
+    rows = _jsonl(result.stdout)
+    assert rows[0]["read_only"] is False
+    inputs = next(row for row in rows if row.get("type") == "model" and row["role"] == "input")
+    force = next(field for field in inputs["fields"] if field["name"] == "force")
+    assert force["default"] is False
+    assert "JSON mode" in force["description"]
+
+    stats = runner.invoke(app, ["--json", "describe", "annotate cache stats"])
+    assert stats.exit_code == 0
+    assert _jsonl(stats.stdout)[0]["read_only"] is True
+
+
+def test_describe_debug_db_profile_exposes_statement_rows() -> None:
+    result = runner.invoke(app, ["--json", "describe", "debug db-profile", "--schema", "json_schema"])
+
+    assert result.exit_code == 0
+    rows = _jsonl(result.stdout)
+    assert rows[0]["read_only"] is True
+    outputs = {row["name"]: row for row in rows if row.get("type") == "schema" and row["role"] == "output"}
+    assert set(outputs) == {"DbProfileStatementItem", "DebugDbProfileResult"}
+    assert {"plan", "full_scans", "p95_ms"} <= set(
+        outputs["DbProfileStatementItem"]["schema"]["properties"]
+    )
+    assert {"filters", "callers", "full_scans"} <= set(
+        outputs["DebugDbProfileResult"]["schema"]["properties"]
+    )
+
+
+def test_describe_serve_documents_socket_and_stop() -> None:
+    result = runner.invoke(app, ["--json", "describe", "serve"])
+
+    assert result.exit_code == 0
+    rows = _jsonl(result.stdout)
+    assert rows[0]["read_only"] is False
+    inputs = next(row for row in rows if row.get("type") == "model" and row["role"] == "input")
+    assert {field["name"] for field in inputs["fields"]} == {"socket", "idle_timeout", "stop"}
@@ -0,0 +1,60 @@
+"""database ユニットテスト共通設定。
+
+``ImageRepository.get_image_annotations_batch`` (Core 行版) の出力契約テストが
+比較対象に使う ORM グラフ版の参照実装を提供する。
+"""
+
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from lorairo.database.repository.image import ImageRepository
+from lorairo.database.schema import Image as ImageRecord
+from lorairo.database.schema import Rating, ScoreLabel
+
+
+def _image_annotations_batch_orm(
+    repository: ImageRepository, image_ids: list[int], *, include_rejected: bool = False
+) -> dict[int, dict[str, Any]]:
+    """``get_image_annotations_batch`` の ORM グラフ版 (参照実装)。
+
+    Core 行版と出力契約が一致することの検証に使う。
+    """
+    result: dict[int, dict[str, Any]] = {
+        image_id: {
+            "tags": [],
+            "captions": [],
+            "scores": [],
+            "score_labels": [],
+            "ratings": [],
+            "quality_summary": {},
+        }
+        for image_id in image_ids
+    }
+    with repository.session_factory() as session:
+        for i in range(0, len(image_ids), repository.BATCH_CHUNK_SIZE):
+            chunk = image_ids[i : i + repository.BATCH_CHUNK_SIZE]
+            stmt = (
+                select(ImageRecord)
+                .where(ImageRecord.id.in_(chunk))
+                .options(
+                    selectinload(ImageRecord.tags),
+                    selectinload(ImageRecord.captions),
+                    selectinload(ImageRecord.scores),
+                    selectinload(ImageRecord.score_labels).selectinload(ScoreLabel.model),
+                    selectinload(ImageRecord.ratings).selectinload(Rating.model),
+                )
+            )
+            for image in session.execute(stmt).unique().scalars():
+                result[image.id] = repository._assemble_annotations(
+                    image, include_rejected=include_rejected
+                )
+    return result
+
+
+@pytest.fixture
+def orm_annotations_batch():
+    """ORM 参照実装 ``(repository, image_ids, *, include_rejected=False)`` を返す。"""
+    return _image_annotations_batch_orm
@@ -23,15 +23,16 @@
 from __future__ import annotations
 
 import datetime
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
 from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from lorairo.database.db_manager import ImageDatabaseManager
 from lorairo.database.repository.annotation_record import AnnotationRepository, AnnotationSaveItem
-from lorairo.database.repository.base import BaseRepository
+from lorairo.database.repository.base import BaseRepository, resolve_tag_string_ids
 from lorairo.database.schema import (
     MANUAL_EDIT_LITELLM_ID,
     MANUAL_EDIT_NAME,
@@ -45,6 +46,11 @@ from lorairo.database.schema import (
 from lorairo.services.configuration_service import ConfigurationService
 
 
+def _tag(session: Session, text: str, **columns: Any) -> Tag:
+    """語彙 tag_strings を引いてタグ行を作る (tags は文字列を tag_string_id で参照する)。"""
+    return Tag(tag_string_id=resolve_tag_string_ids(session, [text])[text], **columns)
+
+
 @pytest.fixture
 def memory_session_factory():
     """in-memory SQLite セッションファクトリ（schema 全テーブル）。"""
@@ -439,10 +445,11 @@ class TestSaveTagsAndCaptions:
         rejected_at = datetime.datetime(2026, 6, 11, tzinfo=datetime.UTC)
         with memory_session_factory() as session:
             session.add(
-                Tag(
+                _tag(
+                    session,
+                    "blue_hair",
                     image_id=image_id,
                     model_id=None,
-                    tag="blue_hair",
                     rejected_at=rejected_at,
                     existing=False,
                 )
@@ -535,7 +542,7 @@ class TestSaveTagsAndCaptions:
     ) -> None:
         """既存 raw 行 (`blue_hair`) は整形後キーで突合し、整形済み値へ揃える。"""
         with memory_session_factory() as session:
-            session.add(Tag(image_id=image_id, model_id=None, tag="blue_hair", existing=False))
+            session.add(_tag(session, "blue_hair", image_id=image_id, model_id=None, existing=False))
             session.commit()
 
         annotation_repository.save_annotations(
@@ -885,7 +892,7 @@ class TestRejectReasonWritePaths:
 
     def _add_tag(self, memory_session_factory, image_id: int, tag: str) -> None:
         with memory_session_factory() as session:
-            session.add(Tag(image_id=image_id, tag=tag, existing=False))
+            session.add(_tag(session, tag, image_id=image_id, existing=False))
             session.commit()
 
     def _reject_reason(self, memory_session_factory, image_id: int, tag: str) -> str | None:
@@ -1112,10 +1119,11 @@ class TestManualReAddRevivesSoftReject:
             session.add(other)
             session.flush()
             other_id = other.id
+            cat_id = resolve_tag_string_ids(session, ["cat"])["cat"]
             session.execute(
                 text(
-                    "INSERT INTO tags (image_id, model_id, tag, existing, rejected_at, reject_reason)"
-                    f" VALUES ({image_id}, {other_id}, 'cat', 0, '2026-06-10 00:00:00', 'not_needed')"
+                    "INSERT INTO tags (image_id, model_id, tag_string_id, existing, rejected_at, reject_reason)"
+                    f" VALUES ({image_id}, {other_id}, {cat_id}, 0, '2026-06-10 00:00:00', 'not_needed')"
                 )
             )
             session.commit()
@@ -1147,7 +1155,7 @@ class TestMixedCaseStoredTagWritePaths:
 
     def _add_tag(self, session_factory, image_id: int, tag: str) -> None:
         with session_factory() as session:
-            session.add(Tag(image_id=image_id, tag=tag, tag_id=None, is_edited_manually=True))
+            session.add(_tag(session, tag, image_id=image_id, tag_id=None, is_edited_manually=True))
             session.commit()
 
     def _tag_row(self, session_factory, image_id: int) -> Tag:
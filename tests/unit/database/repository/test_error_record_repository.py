@@ -213,6 +213,20 @@ class TestGetErrorImageIds:
         assert unresolved == [200]
         assert resolved == [100]
 
+    def test_image_ids_limits_search_to_candidates(
+        self, error_record_repository: ErrorRecordRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """image_ids 指定時は候補内のエラー画像のみ (チャンク分割しても重複なし)。"""
+        monkeypatch.setattr(ErrorRecordRepository, "BATCH_CHUNK_SIZE", 2)
+        for image_id in (1, 2, 3, 5, 8):
+            _insert_error(error_record_repository, image_id=image_id)
+        _insert_error(error_record_repository, image_id=3)
+
+        ids = error_record_repository.get_error_image_ids(image_ids=[3, 4, 5, 3, 8])
+
+        assert sorted(ids) == [3, 5, 8]
+        assert error_record_repository.get_error_image_ids(image_ids=[]) == []
+
 
 @pytest.mark.unit
 class TestGetErrorRecords:
@@ -342,6 +356,38 @@ class TestMarkErrorsResolvedBatch:
         assert count == 1
 
 
+@pytest.mark.unit
+class TestSaveErrorRecordsBatch:
+    """`save_error_records_batch` (ErrorRecordSink からの一括保存)。"""
+
+    def test_inserts_all_records_in_one_call(self, error_record_repository, memory_session_factory) -> None:
+        records = [
+            {"operation_type": "registration", "error_type": "OSError", "error_message": f"e{i}"}
+            for i in range(3)
+        ]
+        records.append(
+            {
+                "operation_type": "annotation",
+                "error_type": "APIError",
+                "error_message": "timeout",
+                "model_name": "gpt-4o",
+                "stack_trace": "trace",
+            }
+        )
+
+        assert error_record_repository.save_error_records_batch(records) == 4
+
+        with memory_session_factory() as session:
+            rows = session.execute(select(ErrorRecord).order_by(ErrorRecord.id)).scalars().all()
+        assert [row.error_message for row in rows] == ["e0", "e1", "e2", "timeout"]
+        assert rows[3].model_name == "gpt-4o"
+        assert rows[0].image_id is None
+        assert all(row.resolved_at is None and row.created_at is not None for row in rows)
+
+    def test_empty_input_returns_zero(self, error_record_repository) -> None:
+        assert error_record_repository.save_error_records_batch([]) == 0
+
+
 @pytest.mark.unit
 class TestImageDatabaseManagerDIContract:
     """ImageDatabaseManager が injected `error_record_repo` 経由で呼ぶ (DI contract)。
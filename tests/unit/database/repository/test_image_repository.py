@@ -22,15 +22,16 @@ from __future__ import annotations
 
 import datetime
 from types import SimpleNamespace
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
 from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from lorairo.database.db_manager import ImageDatabaseManager
 from lorairo.database.filter_criteria import ImageFilterCriteria, KeywordSearchGroup
-from lorairo.database.repository.base import BaseRepository
+from lorairo.database.repository.base import BaseRepository, resolve_tag_string_ids
 from lorairo.database.repository.image import ImageRepository
 from lorairo.database.schema import (
     Caption,
@@ -59,6 +60,11 @@ def image_repository(memory_session_factory) -> ImageRepository:
     return ImageRepository(session_factory=memory_session_factory)
 
 
+def _tag(session: Session, text: str, **columns: Any) -> Tag:
+    """語彙 tag_strings を引いてタグ行を作る (tags は文字列を tag_string_id で参照する)。"""
+    return Tag(tag_string_id=resolve_tag_string_ids(session, [text])[text], **columns)
+
+
 def _insert_image(
     repo: ImageRepository,
     *,
@@ -662,8 +668,8 @@ class TestGetImageAnnotationsSoftReject:
         with memory_session_factory() as session:
             session.add_all(
                 [
-                    Tag(image_id=image_id, tag="black_hair", rejected_at=None),
-                    Tag(image_id=image_id, tag="blue_hair", rejected_at=rejected_at),
+                    _tag(session, "black_hair", image_id=image_id, rejected_at=None),
+                    _tag(session, "blue_hair", image_id=image_id, rejected_at=rejected_at),
                     Caption(image_id=image_id, caption="adopted caption", rejected_at=None),
                     Caption(image_id=image_id, caption="rejected caption", rejected_at=rejected_at),
                 ]
@@ -688,8 +694,8 @@ class TestGetImageAnnotationsSoftReject:
         with memory_session_factory() as session:
             session.add_all(
                 [
-                    Tag(image_id=image_id, tag="black_hair", rejected_at=None),
-                    Tag(image_id=image_id, tag="blue_hair", rejected_at=rejected_at),
+                    _tag(session, "black_hair", image_id=image_id, rejected_at=None),
+                    _tag(session, "blue_hair", image_id=image_id, rejected_at=rejected_at),
                     Caption(image_id=image_id, caption="adopted caption", rejected_at=None),
                     Caption(image_id=image_id, caption="rejected caption", rejected_at=rejected_at),
                 ]
@@ -715,9 +721,10 @@ class TestGetImageAnnotationsSoftReject:
         )
         with memory_session_factory() as session:
             session.add(
-                Tag(
+                _tag(
+                    session,
+                    "blue_hair",
                     image_id=image_id,
-                    tag="blue_hair",
                     rejected_at=datetime.datetime(2026, 6, 11, tzinfo=datetime.UTC),
                 )
             )
@@ -740,9 +747,10 @@ def _insert_tag(
     """タイムスタンプを明示したタグ行を 1 件挿入する。"""
     with session_factory() as session:
         session.add(
-            Tag(
+            _tag(
+                session,
+                tag,
                 image_id=image_id,
-                tag=tag,
                 model_id=model_id,
                 is_edited_manually=is_edited_manually,
                 existing=existing,
@@ -867,10 +875,11 @@ class TestImageFilterCriteriaExactSet:
         with memory_session_factory() as session:
             session.add_all(
                 [
-                    Tag(image_id=img_adopted, tag="cat", rejected_at=None),
-                    Tag(
+                    _tag(session, "cat", image_id=img_adopted, rejected_at=None),
+                    _tag(
+                        session,
+                        "cat",
                         image_id=img_rejected,
-                        tag="cat",
                         rejected_at=datetime.datetime(2026, 6, 11, tzinfo=datetime.UTC),
                     ),
                 ]
@@ -1052,7 +1061,7 @@ class TestLazyAnnotationLoading:
         """include_annotations 未指定 (=True) では従来通りアノテーションを含む。"""
         image_id = _insert_image(image_repository, uuid="anno-on", phash="anno-on")
         with memory_session_factory() as session:
-            session.add(Tag(image_id=image_id, tag="cat", rejected_at=None))
+            session.add(_tag(session, "cat", image_id=image_id, rejected_at=None))
             session.commit()
 
         results, _ = image_repository.get_images_by_filter(ImageFilterCriteria(include_nsfw=True))
@@ -1067,7 +1076,7 @@ class TestLazyAnnotationLoading:
         """include_annotations=False では id/カラムのみで、アノテーションキーを含まない。"""
         image_id = _insert_image(image_repository, uuid="anno-off", phash="anno-off")
         with memory_session_factory() as session:
-            session.add(Tag(image_id=image_id, tag="cat", rejected_at=None))
+            session.add(_tag(session, "cat", image_id=image_id, rejected_at=None))
             session.commit()
 
         results, total = image_repository.get_images_by_filter(
@@ -1092,7 +1101,7 @@ class TestLazyAnnotationLoading:
         with memory_session_factory() as session:
             session.add_all(
                 [
-                    Tag(image_id=image_id, tag="cat", rejected_at=None),
+                    _tag(session, "cat", image_id=image_id, rejected_at=None),
                     Caption(image_id=image_id, caption="a cat", rejected_at=None),
                 ]
             )
@@ -1111,6 +1120,35 @@ class TestLazyAnnotationLoading:
         """未登録 image_id では None を返す。"""
         assert image_repository.get_image_annotation_metadata(99999) is None
 
+    def test_get_image_annotation_metadata_batch_matches_single(
+        self, image_repository: ImageRepository, memory_session_factory
+    ) -> None:
+        """一括取得は単一取得と同じ形状を返し、未登録 ID は含めない。"""
+        first = _insert_image(image_repository, uuid="batch-1", phash="batch-1", filename="b1.png")
+        second = _insert_image(image_repository, uuid="batch-2", phash="batch-2", filename="b2.png")
+        with memory_session_factory() as session:
+            session.add_all(
+                [
+                    _tag(session, "cat", image_id=first, rejected_at=None),
+                    _tag(session, "dog", image_id=second, rejected_at=None),
+                    Caption(image_id=second, caption="a dog", rejected_at=None),
+                ]
+            )
+            session.commit()
+
+        batch = image_repository.get_image_annotation_metadata_batch([first, second, 99999])
+
+        assert set(batch) == {first, second}
+        assert batch[first] == image_repository.get_image_annotation_metadata(first)
+        assert batch[second]["tags_text"] == "dog"
+        assert batch[second]["caption_text"] == "a dog"
+
+    def test_get_image_annotation_metadata_batch_empty_input(
+        self, image_repository: ImageRepository
+    ) -> None:
+        """空入力では DB を照会せず空 dict を返す。"""
+        assert image_repository.get_image_annotation_metadata_batch([]) == {}
+
 
 @pytest.mark.unit
 class TestExportInvariantRejectReason:
@@ -1126,29 +1164,32 @@ class TestExportInvariantRejectReason:
         image_id = _insert_image(image_repository)
         now = datetime.datetime.now(datetime.UTC)
         with memory_session_factory() as session:
-            session.add(Tag(image_id=image_id, tag="active_tag", existing=False))
+            session.add(_tag(session, "active_tag", image_id=image_id, existing=False))
             session.add(
-                Tag(
+                _tag(
+                    session,
+                    "disabled_tag",
                     image_id=image_id,
-                    tag="disabled_tag",
                     existing=False,
                     rejected_at=now,
                     reject_reason="not_needed",
                 )
             )
             session.add(
-                Tag(
+                _tag(
+                    session,
+                    "wrong_tag",
                     image_id=image_id,
-                    tag="wrong_tag",
                     existing=False,
                     rejected_at=now,
                     reject_reason="incorrect",
                 )
             )
             session.add(
-                Tag(
+                _tag(
+                    session,
+                    "moved_tag",
                     image_id=image_id,
-                    tag="moved_tag",
                     existing=False,
                     rejected_at=now,
                     reject_reason="replaced",
@@ -1216,10 +1257,10 @@ class TestTagCaptionSearchCombination:
         with session_factory() as session:
             session.add_all(
                 [
-                    Tag(image_id=a, tag="cat", rejected_at=None),
+                    _tag(session, "cat", image_id=a, rejected_at=None),
                     Caption(image_id=a, caption="a fluffy cat", rejected_at=None),
                     Caption(image_id=b, caption="a dog running", rejected_at=None),
-                    Tag(image_id=c, tag="bird", rejected_at=None),
+                    _tag(session, "bird", image_id=c, rejected_at=None),
                     Caption(image_id=c, caption="sky", rejected_at=None),
                 ]
             )
@@ -1270,8 +1311,8 @@ class TestKeywordGroupSearch:
         with memory_session_factory() as session:
             session.add_all(
                 [
-                    Tag(image_id=dog, tag="dog", rejected_at=None),
-                    Tag(image_id=cat, tag="cat", rejected_at=None),
+                    _tag(session, "dog", image_id=dog, rejected_at=None),
+                    _tag(session, "cat", image_id=cat, rejected_at=None),
                 ]
             )
             session.commit()
@@ -1295,9 +1336,9 @@ class TestKeywordGroupSearch:
         with memory_session_factory() as session:
             session.add_all(
                 [
-                    Tag(image_id=img1, tag="cat", rejected_at=None),
+                    _tag(session, "cat", image_id=img1, rejected_at=None),
                     Caption(image_id=img1, caption="a photo outdoor", rejected_at=None),
-                    Tag(image_id=img2, tag="dog", rejected_at=None),
+                    _tag(session, "dog", image_id=img2, rejected_at=None),
                     Caption(image_id=img2, caption="indoor scene", rejected_at=None),
                 ]
             )
@@ -1329,7 +1370,7 @@ class TestKeywordGroupSearch:
                 [
                     Caption(image_id=untagged_hit, caption="hello world", rejected_at=None),
                     Caption(image_id=untagged_miss, caption="goodbye", rejected_at=None),
-                    Tag(image_id=tagged, tag="x", rejected_at=None),
+                    _tag(session, "x", image_id=tagged, rejected_at=None),
                     Caption(image_id=tagged, caption="hello world", rejected_at=None),
                 ]
             )
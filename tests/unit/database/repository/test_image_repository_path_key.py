@@ -0,0 +1,133 @@
+"""ImageRepository のパス → 画像 ID 解決 (images.path_key) のテスト。"""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from lorairo.database import db_core
+from lorairo.database.repository.image import ImageRepository
+from lorairo.database.schema import Base, Image
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def project_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "main_dataset_20260101_001"
+    root.mkdir()
+    monkeypatch.setattr(db_core, "get_current_project_root", lambda: root)
+    return root
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def repository(engine) -> ImageRepository:
+    return ImageRepository(session_factory=sessionmaker(engine))
+
+
+def _add(repository: ImageRepository, stored_path: str) -> int:
+    image_id, inserted = repository.add_original_image(
+        {
+            "uuid": str(uuid.uuid4()),
+            "phash": uuid.uuid4().hex[:16],
+            "original_image_path": f"/src/{Path(stored_path).name}",
+            "stored_image_path": stored_path,
+            "width": 8,
+            "height": 8,
+            "format": "PNG",
+            "extension": ".png",
+            "filename": Path(stored_path).name,
+        }
+    )
+    assert inserted
+    return image_id
+
+
+def test_add_original_image_stores_project_relative_key(repository, engine, project_root):
+    image_id = _add(repository, "image_dataset\\original_images\\src\\a.png")
+
+    with sessionmaker(engine)() as session:
+        key = session.execute(select(Image.path_key).where(Image.id == image_id)).scalar_one()
+    assert key == "image_dataset/original_images/src/a.png"
+
+
+def test_same_named_files_resolve_by_directory(repository, project_root):
+    ids = {
+        name: _add(repository, f"image_dataset/original_images/{name}/a.png") for name in ("x", "y", "z")
+    }
+    inputs = [str(project_root / "image_dataset/original_images" / name / "a.png") for name in ("z", "x")]
+    missing = str(project_root / "image_dataset/original_images/w/a.png")
+
+    result = repository.get_image_ids_by_filepaths([*inputs, missing])
+
+    assert result == {inputs[0]: ids["z"], inputs[1]: ids["x"], missing: None}
+    assert repository.get_image_id_by_filepath(inputs[1]) == ids["x"]
+
+
+def test_keyed_paths_skip_filename_scan(repository, engine, project_root):
+    _add(repository, "image_dataset/original_images/x/a.png")
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    result = repository.get_image_ids_by_filepaths(
+        [str(project_root / "image_dataset/original_images/x/a.png")]
+    )
+
+    assert list(result.values()) == [1]
+    assert len(statements) == 1
+    assert "path_key IN" in statements[0]
+
+
+def test_duplicate_stored_path_is_inserted_without_key(repository, engine, project_root):
+    first = _add(repository, "image_dataset/original_images/x/a.png")
+    second = _add(repository, "image_dataset/original_images/x/../x/a.png")
+
+    with sessionmaker(engine)() as session:
+        keys = dict(session.execute(select(Image.id, Image.path_key)).all())
+    assert keys[first] == "image_dataset/original_images/x/a.png"
+    assert keys[second] is None
+
+
+def test_rows_without_key_fall_back_to_resolve_comparison(repository, engine, project_root):
+    with sessionmaker(engine)() as session:
+        legacy = Image(
+            uuid=str(uuid.uuid4()),
+            phash="ff" * 8,
+            original_image_path="/src/legacy.png",
+            stored_image_path="image_dataset/original_images/old/legacy.png",
+            width=8,
+            height=8,
+            format="PNG",
+            extension=".png",
+            filename="legacy.png",
+        )
+        session.add(legacy)
+        session.commit()
+        legacy_id = legacy.id
+    target = str(project_root / "image_dataset/original_images/old/legacy.png")
+
+    assert repository.get_image_ids_by_filepaths([target]) == {target: legacy_id}
+
+
+def test_symlinked_input_path_resolves_to_stored_row(repository, project_root, tmp_path):
+    real_dir = project_root / "image_dataset/original_images/x"
+    real_dir.mkdir(parents=True)
+    (real_dir / "a.png").write_bytes(b"")
+    image_id = _add(repository, "image_dataset/original_images/x/a.png")
+    link = tmp_path / "link"
+    link.symlink_to(real_dir)
+
+    target = str(link / "a.png")
+    assert repository.get_image_ids_by_filepaths([target]) == {target: image_id}
@@ -20,6 +20,8 @@ def mock_session():
 def repo(mock_session):
     repo = AnnotationRepository.__new__(AnnotationRepository)
     repo.session_factory = MagicMock(return_value=mock_session)
+    # tag_strings 語彙の解決は実 DB が必要なため、文字列ごとに固定 ID を返す
+    repo._resolve_tag_string_ids = MagicMock(side_effect=lambda _session, tags, *_: dict.fromkeys(tags, 1))
     return repo
 
 
@@ -215,7 +217,8 @@ class TestBatchAddSearchKeyCase:
 
         assert (success, added) == (True, 1)
         added_row = mock_session.add.call_args.args[0]
-        assert added_row.tag == "Mixed Case"
+        assert repo._resolve_tag_string_ids.call_args.args[1] == ["Mixed Case"]
+        assert added_row.tag_string_id == 1
 
 
 @pytest.mark.unit
@@ -355,7 +358,8 @@ class TestAddTagToImagesBatchCanonical:
         assert ok is True
         assert count == 1
         added = mock_session.add.call_args.args[0]
-        assert added.tag == "blue_sky"
+        assert repo._resolve_tag_string_ids.call_args.args[1] == ["blue_sky"]
+        assert added.tag_string_id == 1
         assert added.tag_id == 42
         assert added.is_edited_manually is True
 
@@ -382,8 +386,9 @@ class TestAddTagToImagesBatchCanonical:
         assert ok is True
         assert count == 3
         assert repo._resolve_canonical_and_tag_id.call_count == 1
+        assert {call.args[1][0] for call in repo._resolve_tag_string_ids.call_args_list} == {"blue_sky"}
         for call in mock_session.add.call_args_list:
-            assert call.args[0].tag == "blue_sky"
+            assert call.args[0].tag_string_id == 1
 
     def test_dedup_normalizes_formatting_difference(self, repo, mock_session):
         """既存行が書式違い (space/underscore) でも canonical dedup で重複を検出する。
@@ -0,0 +1,242 @@
+"""DB ストレージ調整とメンテナンス (database/maintenance.py) の単体テスト。"""
+
+from __future__ import annotations
+
+import gc
+import threading
+import weakref
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from lorairo.database import maintenance
+from lorairo.database.db_core import _prepare_project_database, create_db_engine, create_session_factory
+from lorairo.database.maintenance import (
+    DatabaseMaintenanceService,
+    MaintenanceSkippedError,
+    MaintenanceThresholds,
+    available_memory_bytes,
+    engine_for_session_factory,
+    get_maintenance_service,
+    note_bulk_write,
+    tune_storage_pragmas,
+)
+from lorairo.database.pool_metrics import install_writer_gate
+
+pytestmark = pytest.mark.unit
+
+MIB = 1024 * 1024
+GIB = 1024 * MIB
+
+
+class TestTuneStoragePragmas:
+    def test_small_db_uses_floors(self):
+        pragmas = tune_storage_pragmas(1 * MIB, 16 * GIB)
+
+        assert pragmas.cache_size_kib == 8 * 1024
+        assert pragmas.mmap_size == 64 * MIB
+        assert pragmas.temp_store == "MEMORY"
+        assert pragmas.page_size == 4096
+
+    def test_large_db_is_capped(self):
+        pragmas = tune_storage_pragmas(4 * GIB, 64 * GIB)
+
+        assert pragmas.cache_size_kib == 256 * 1024
+        assert pragmas.mmap_size == 1 * GIB
+        assert pragmas.page_size == 8192
+
+    def test_low_memory_limits_cache_and_mmap(self):
+        pragmas = tune_storage_pragmas(2 * GIB, 512 * MIB)
+
+        assert pragmas.cache_size_kib == 8 * 1024
+        assert pragmas.mmap_size == 64 * MIB
+        assert pragmas.temp_store == "DEFAULT"
+
+    def test_unknown_memory_uses_conservative_default(self):
+        assert tune_storage_pragmas(0, None) == tune_storage_pragmas(0, 2 * GIB)
+
+
+def test_available_memory_reads_mem_available(tmp_path, monkeypatch):
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text(
+        "MemTotal:       16384000 kB\nMemFree:          512000 kB\nMemAvailable:   8192000 kB\n"
+    )
+    monkeypatch.setattr(maintenance, "_MEMINFO_PATH", meminfo)
+
+    assert available_memory_bytes() == 8192000 * 1024  # MemFree ではなく MemAvailable
+
+
+def _file_engine(tmp_path):
+    return create_db_engine(f"sqlite:///{tmp_path / 'maintenance.db'}?check_same_thread=False")
+
+
+def test_create_db_engine_applies_storage_pragmas(tmp_path, monkeypatch):
+    monkeypatch.setattr("lorairo.database.db_core.available_memory_bytes", lambda: 16 * GIB)
+    engine = _file_engine(tmp_path)
+
+    with engine.connect() as connection:
+        cache_size = connection.execute(text("PRAGMA cache_size")).scalar_one()
+        mmap_size = connection.execute(text("PRAGMA mmap_size")).scalar_one()
+
+    assert cache_size == -8 * 1024  # 負値 = KiB 指定
+    assert mmap_size == 64 * MIB
+    engine.dispose()
+
+
+def test_new_project_db_uses_incremental_auto_vacuum(tmp_path):
+    engine = _prepare_project_database(tmp_path / "project" / "image_database.db")
+
+    stats = get_maintenance_service(engine).collect_stats()
+
+    assert stats.auto_vacuum == "incremental"
+    assert stats.journal_mode == "wal"
+    engine.dispose()
+
+
+class TestDatabaseMaintenanceService:
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = _file_engine(tmp_path)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+            connection.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, body BLOB)")
+            connection.exec_driver_sql("CREATE INDEX ix_items_body ON items (body)")
+        yield engine
+        engine.dispose()
+
+    def _insert(self, engine, count: int) -> None:
+        with engine.begin() as connection:
+            for _ in range(count):
+                connection.exec_driver_sql("INSERT INTO items (body) VALUES (randomblob(2000))")
+
+    def test_after_bulk_write_analyzes_first_write_and_past_threshold(self, engine):
+        service = DatabaseMaintenanceService(engine, MaintenanceThresholds(analyze_after_rows=100))
+
+        self._insert(engine, 10)
+        service.after_bulk_write(10)
+        assert service.collect_stats().stat1_rows > 0  # 統計の無い DB は初回で ANALYZE
+
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DELETE FROM sqlite_stat1")
+        service.after_bulk_write(50)
+        assert service.collect_stats().stat1_rows == 0
+        service.after_bulk_write(60)
+        assert service.collect_stats().stat1_rows > 0
+
+    def test_after_bulk_write_truncates_large_wal(self, engine):
+        service = DatabaseMaintenanceService(engine, MaintenanceThresholds(wal_truncate_bytes=1))
+        self._insert(engine, 50)
+        assert service.collect_stats().wal_bytes > 0
+
+        service.after_bulk_write(50)
+
+        assert service.collect_stats().wal_bytes == 0
+
+    def test_vacuum_then_incremental_vacuum_releases_free_pages(self, engine):
+        service = DatabaseMaintenanceService(engine, MaintenanceThresholds())
+        assert service.incremental_vacuum() == 0  # auto_vacuum=NONE の DB では何もしない
+
+        service.vacuum(page_size=8192)
+        self._insert(engine, 200)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DELETE FROM items")
+        before = service.collect_stats()
+
+        released = service.incremental_vacuum()
+
+        after = service.collect_stats()
+        assert before.page_size == 8192
+        assert before.auto_vacuum == "incremental"
+        assert released == before.freelist_count > 0
+        assert after.freelist_count == 0
+
+    def test_idle_maintenance_caps_incremental_vacuum(self, engine):
+        service = DatabaseMaintenanceService(engine, MaintenanceThresholds(idle_vacuum_pages=5))
+        service.vacuum(page_size=4096)
+        self._insert(engine, 200)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DELETE FROM items")
+        before = service.collect_stats()
+
+        service.run_idle_maintenance()
+
+        assert before.freelist_count > 5
+        assert service.collect_stats().freelist_count == before.freelist_count - 5
+
+    def test_skips_when_writer_gate_times_out(self, engine):
+        gate = install_writer_gate(engine, timeout_s=0.01)
+        service = DatabaseMaintenanceService(engine, MaintenanceThresholds())
+        held = threading.Event()
+        done = threading.Event()
+
+        def hold_gate() -> None:
+            gate.acquire()
+            held.set()
+            done.wait()
+            gate.release()
+
+        holder = threading.Thread(target=hold_gate)
+        holder.start()
+        held.wait()
+        try:
+            with pytest.raises(MaintenanceSkippedError):
+                service.analyze()
+            service.after_bulk_write(10)  # 見送りは例外にしない
+            report = service.maintain()
+        finally:
+            done.set()
+            holder.join()
+
+        assert service.collect_stats().stat1_rows == 0
+        assert not report.ok
+        assert all(action["skipped"] for action in report.actions)
+
+    def test_maintain_reports_before_and_after(self, engine):
+        service = DatabaseMaintenanceService(engine, MaintenanceThresholds())
+        self._insert(engine, 20)
+
+        report = service.maintain()
+
+        assert report.ok
+        assert [action["action"] for action in report.actions] == [
+            "analyze",
+            "optimize",
+            "incremental_vacuum",
+            "wal_checkpoint",
+        ]
+        assert report.before.stat1_rows == 0
+        assert report.after.stat1_rows > 0
+        assert report.after.wal_bytes == 0
+
+
+class TestNoteBulkWrite:
+    def test_ignores_unresolvable_session_factories(self):
+        session_factory = MagicMock()
+
+        assert engine_for_session_factory(session_factory) is None
+        note_bulk_write(session_factory, 10)  # 例外を出さない
+
+    def test_in_memory_engine_has_no_service(self):
+        engine = create_db_engine("sqlite:///:memory:")
+
+        assert engine_for_session_factory(create_session_factory(engine)) is engine
+        assert get_maintenance_service(engine) is None
+        note_bulk_write(create_session_factory(engine), 10)
+
+    def test_service_is_shared_per_engine(self, tmp_path):
+        engine = _file_engine(tmp_path)
+
+        assert get_maintenance_service(engine) is get_maintenance_service(engine)
+        engine.dispose()
+
+    def test_registry_does_not_keep_engine_alive(self, tmp_path):
+        engine = _file_engine(tmp_path)
+        get_maintenance_service(engine)
+        engine.dispose()
+        engine_ref = weakref.ref(engine)
+
+        del engine
+        gc.collect()
+
+        assert engine_ref() is None
@@ -0,0 +1,124 @@
+"""読み取り専用エンジン / 書き込みゲート / プール計測のテスト。
+
+検索・件数取得は ``PRAGMA query_only`` の読み取り専用エンジンで行い、書き込みエンジンは
+:class:`WriterGate` でプロセス内の書き込みトランザクションを直列化する。
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+from lorairo.database import db_core
+from lorairo.database.db_core import create_db_engine, create_read_engine
+from lorairo.database.pool_metrics import WriterGate, get_engine_metrics
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def write_engine(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'split.sqlite'}?check_same_thread=False")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def test_read_engine_rejects_writes(write_engine) -> None:
+    read_engine = create_read_engine(write_engine)
+    try:
+        with write_engine.begin() as connection:
+            connection.execute(text("INSERT INTO items (value) VALUES ('a')"))
+
+        with read_engine.connect() as connection:
+            assert connection.execute(text("SELECT value FROM items")).scalars().all() == ["a"]
+            with pytest.raises(OperationalError, match="readonly"):
+                connection.execute(text("INSERT INTO items (value) VALUES ('b')"))
+    finally:
+        read_engine.dispose()
+
+
+def test_read_engine_uses_configured_pool_size(write_engine) -> None:
+    read_engine = create_read_engine(write_engine)
+    try:
+        assert read_engine is not write_engine
+        assert isinstance(read_engine.pool, QueuePool)
+        assert read_engine.pool.size() == db_core.READ_POOL_SIZE
+        assert get_engine_metrics(read_engine)["role"] == "read"
+        assert "writer_gate" not in get_engine_metrics(read_engine)
+    finally:
+        read_engine.dispose()
+
+
+def test_create_read_engine_returns_write_engine_for_memory_db() -> None:
+    engine = create_db_engine("sqlite:///:memory:")
+
+    assert create_read_engine(engine) is engine
+
+
+def test_pool_metrics_count_checkouts(write_engine) -> None:
+    before = get_engine_metrics(write_engine)["checkouts"]
+
+    with write_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert get_engine_metrics(write_engine)["checked_out"] == 1
+
+    metrics = get_engine_metrics(write_engine)
+    assert metrics["role"] == "write"
+    assert metrics["checkouts"] == before + 1
+    assert metrics["checked_out"] == 0
+    assert metrics["peak_checked_out"] >= 1
+
+
+def test_writer_gate_serializes_concurrent_write_transactions(write_engine) -> None:
+    """2 スレッドの書き込みトランザクションは重ならず、待機がゲート計測に残る。"""
+    first_inserted = threading.Event()
+    order: list[str] = []
+
+    def first() -> None:
+        with write_engine.begin() as connection:
+            connection.execute(text("INSERT INTO items (value) VALUES ('first')"))
+            first_inserted.set()
+            time.sleep(0.2)
+            order.append("first-commit")
+
+    def second() -> None:
+        first_inserted.wait(timeout=5)
+        with write_engine.begin() as connection:
+            connection.execute(text("INSERT INTO items (value) VALUES ('second')"))
+            order.append("second-insert")
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    gate = get_engine_metrics(write_engine)["writer_gate"]
+    assert order == ["first-commit", "second-insert"]
+    assert gate["contended"] >= 1
+    assert gate["wait_ms_max"] > 0
+    assert gate["held"] is False
+
+
+def test_writer_gate_is_reentrant_and_times_out() -> None:
+    gate = WriterGate(timeout_s=0.05)
+    assert gate.acquire()
+    assert gate.acquire()  # 同一スレッドの入れ子セッション
+
+    results: list[bool] = []
+    other = threading.Thread(target=lambda: results.append(gate.acquire()))
+    other.start()
+    other.join()
+
+    gate.release()
+    assert gate.held
+    gate.release()
+    assert not gate.held
+    assert results == [False]
+    assert gate.metrics.timeouts == 1
+    assert gate.metrics.acquisitions == 1
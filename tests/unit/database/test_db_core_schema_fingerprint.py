@@ -0,0 +1,69 @@
+"""プロジェクト DB 準備の schema fingerprint 高速パスのテスト。"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+import lorairo.database.db_core as db_core
+from lorairo.database.db_core import _prepare_project_database, _schema_fingerprint
+
+pytestmark = pytest.mark.unit
+
+
+def _user_version(db_path) -> int:
+    raw = sqlite3.connect(db_path)
+    try:
+        return int(raw.execute("PRAGMA user_version").fetchone()[0])
+    finally:
+        raw.close()
+
+
+def test_prepare_records_fingerprint_for_new_db(tmp_path) -> None:
+    db_path = tmp_path / "image_database.db"
+
+    _prepare_project_database(db_path).dispose()
+
+    assert _user_version(db_path) == _schema_fingerprint() != 0
+
+
+def test_matching_fingerprint_skips_migrations(tmp_path) -> None:
+    db_path = tmp_path / "image_database.db"
+    _prepare_project_database(db_path).dispose()
+
+    with (
+        patch.object(db_core, "_upgrade_alembic_head") as upgrade,
+        patch.object(db_core, "_ensure_model_types_seeded") as seed,
+    ):
+        _prepare_project_database(db_path).dispose()
+
+    upgrade.assert_not_called()
+    seed.assert_not_called()
+
+
+def test_alembic_run_invalidates_fingerprint(tmp_path) -> None:
+    """db_core 外の Alembic 実行後はフル準備に戻り、fingerprint を書き直す。"""
+    db_path = tmp_path / "image_database.db"
+    _prepare_project_database(db_path).dispose()
+
+    db_core._stamp_alembic_head(db_path)
+    assert _user_version(db_path) == 0
+
+    with patch.object(db_core, "_upgrade_alembic_head", wraps=db_core._upgrade_alembic_head) as upgrade:
+        _prepare_project_database(db_path).dispose()
+
+    upgrade.assert_called_once_with(db_path)
+    assert _user_version(db_path) == _schema_fingerprint()
+
+
+def test_untracked_db_keeps_full_preparation(tmp_path) -> None:
+    """alembic_version の無い既存 DB には fingerprint を記録しない。"""
+    db_path = tmp_path / "legacy.db"
+    raw = sqlite3.connect(db_path)
+    raw.execute("CREATE TABLE legacy (id INTEGER PRIMARY KEY)")
+    raw.commit()
+    raw.close()
+
+    _prepare_project_database(db_path).dispose()
+
+    assert _user_version(db_path) == 0
@@ -436,6 +436,28 @@ class TestDetectDuplicateImage:
             result = manager.detect_duplicate_image(Path("/data/img.jpg"))
         assert result == 5
 
+    def test_feature_cache_skips_recomputation_for_unchanged_file(
+        self, manager: ImageDatabaseManager, mock_image_repo: Mock, tmp_path: Path
+    ) -> None:
+        """特徴量キャッシュ設定時、同一ファイルの 2 回目は pHash / 画像情報を再計算しない。"""
+        from lorairo.utils.image_feature_cache import ImageFeatureCache
+
+        image_path = tmp_path / "img.jpg"
+        image_path.write_bytes(b"fake")
+        manager.feature_cache = ImageFeatureCache(":memory:")
+        attrs = {"width": 800, "height": 600, "has_alpha": False, "is_grayscale_like": False}
+        mock_image_repo.find_phash_candidates.return_value = [{"id": 5, **attrs}]
+        with (
+            patch("lorairo.database.db_manager.calculate_phash", return_value="aabbccdd") as mock_phash,
+            patch.object(FileSystemManager, "get_image_info", return_value=attrs) as mock_info,
+        ):
+            assert manager.detect_duplicate_image(image_path) == 5
+            assert manager.detect_duplicate_image(image_path) == 5
+        manager.feature_cache.close()
+
+        mock_phash.assert_called_once()
+        mock_info.assert_called_once()
+
     def test_returns_none_when_variant(self, manager: ImageDatabaseManager, mock_image_repo: Mock) -> None:
         """pHash 一致だが属性差がある別版は重複とみなさず None を返す (ADR 0061)。"""
         attrs = {"width": 800, "height": 600, "has_alpha": False, "is_grayscale_like": False}
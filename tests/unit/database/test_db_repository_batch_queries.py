@@ -3,13 +3,28 @@
 N+1クエリ解消のために追加されたバッチメソッドをテストする。
 """
 
+import datetime
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from sqlalchemy import create_engine, select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
 
+from lorairo.database.repository.base import resolve_tag_string_ids
 from lorairo.database.repository.image import ImageRepository
-from lorairo.database.schema import Model
+from lorairo.database.schema import (
+    MANUAL_EDIT_LITELLM_ID,
+    MANUAL_EDIT_NAME,
+    Base,
+    Caption,
+    Image,
+    Model,
+    Rating,
+    Score,
+    ScoreLabel,
+    Tag,
+)
 
 
 class TestGetImagesMetadataBatch:
@@ -709,8 +724,8 @@ class TestGetImageAnnotationsBatch:
     def test_empty_list_returns_empty_dict(self, repository):
         assert repository.get_image_annotations_batch([]) == {}
 
-    def test_missing_ids_get_empty_skeleton(self, repository):
-        """取得できた id は組み立て結果、取得できない id は空スケルトンを返す。"""
+    def test_orm_reference_missing_ids_get_empty_skeleton(self, repository, orm_annotations_batch):
+        """ORM 参照実装: 取得できた id は組み立て結果、取得できない id は空スケルトンを返す。"""
         mock_session = MagicMock()
         repository.session_factory.return_value.__enter__ = Mock(return_value=mock_session)
         repository.session_factory.return_value.__exit__ = Mock(return_value=False)
@@ -728,7 +743,7 @@ class TestGetImageAnnotationsBatch:
             "quality_summary": {"x": 1},
         }
         with patch.object(repository, "_assemble_annotations", return_value=assembled) as mock_assemble:
-            result = repository.get_image_annotations_batch([1, 2])
+            result = orm_annotations_batch(repository, [1, 2])
 
         mock_assemble.assert_called_once_with(img, include_rejected=False)
         assert result[1] == assembled
@@ -743,6 +758,116 @@ class TestGetImageAnnotationsBatch:
         }
 
 
+class TestGetImageAnnotationsBatchCoreRows:
+    """Core 行版 get_image_annotations_batch が ORM 参照実装と同じ出力契約を守ることを検証する。"""
+
+    @pytest.fixture
+    def populated_repository(self):
+        """2 画像分の tags/captions/scores/score_labels/ratings を持つ in-memory DB。"""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(engine)
+        now = datetime.datetime.now(datetime.UTC)
+        with factory() as session:
+            tagger = Model(name="wd-tagger", litellm_model_id="local/wd-tagger")
+            scorer = Model(name="aesthetic_shadow_v2", litellm_model_id="local/aesthetic_shadow_v2")
+            manual = Model(name=MANUAL_EDIT_NAME, litellm_model_id=MANUAL_EDIT_LITELLM_ID)
+            session.add_all([tagger, scorer, manual])
+            session.flush()
+            for index in (1, 2):
+                image = Image(
+                    uuid=f"uuid-{index}",
+                    phash=f"phash-{index}",
+                    original_image_path=f"/tmp/{index}.png",
+                    stored_image_path=f"/tmp/{index}.png",
+                    width=64,
+                    height=64,
+                    format="PNG",
+                    extension=".png",
+                )
+                session.add(image)
+                session.flush()
+                tag_string_ids = resolve_tag_string_ids(session, [f"cat{index}", "rejected"])
+                session.add_all(
+                    [
+                        Tag(
+                            image_id=image.id,
+                            model_id=tagger.id,
+                            tag_string_id=tag_string_ids[f"cat{index}"],
+                            confidence_score=0.9,
+                        ),
+                        Tag(
+                            image_id=image.id,
+                            model_id=tagger.id,
+                            tag_string_id=tag_string_ids["rejected"],
+                            rejected_at=now,
+                        ),
+                        Caption(image_id=image.id, model_id=tagger.id, caption=f"a cat {index}"),
+                        Caption(image_id=image.id, caption="old", rejected_at=now),
+                        Score(image_id=image.id, model_id=scorer.id, score=0.75),
+                        Score(image_id=image.id, model_id=manual.id, score=8.0, is_edited_manually=True),
+                        ScoreLabel(image_id=image.id, model_id=scorer.id, label="very aesthetic"),
+                        Rating(
+                            image_id=image.id,
+                            model_id=tagger.id,
+                            raw_rating_value="general",
+                            normalized_rating="PG",
+                        ),
+                        Rating(
+                            image_id=image.id,
+                            model_id=manual.id,
+                            raw_rating_value="R",
+                            normalized_rating="R",
+                        ),
+                    ]
+                )
+            session.commit()
+            image_ids = list(session.scalars(select(Image.id).order_by(Image.id)))
+        return ImageRepository(session_factory=factory), image_ids
+
+    @staticmethod
+    def _sorted(result):
+        """ORM 参照実装は relation 順が未規定のため id 順に揃えて比較する。"""
+        return {
+            image_id: {
+                key: sorted(value, key=lambda entry: entry["id"]) if isinstance(value, list) else value
+                for key, value in annotations.items()
+            }
+            for image_id, annotations in result.items()
+        }
+
+    @pytest.mark.parametrize("include_rejected", [False, True])
+    def test_matches_orm_reference(self, populated_repository, include_rejected, orm_annotations_batch):
+        repository, image_ids = populated_repository
+        query_ids = [*image_ids, 9999]
+
+        core = repository.get_image_annotations_batch(query_ids, include_rejected=include_rejected)
+        orm = orm_annotations_batch(repository, query_ids, include_rejected=include_rejected)
+
+        assert self._sorted(core) == self._sorted(orm)
+
+    def test_rejected_rows_filtered_and_model_names_joined(self, populated_repository):
+        repository, image_ids = populated_repository
+
+        result = repository.get_image_annotations_batch(image_ids)
+        first = result[image_ids[0]]
+
+        assert [t["tag"] for t in first["tags"]] == ["cat1"]
+        assert [c["caption"] for c in first["captions"]] == ["a cat 1"]
+        assert first["score_labels"][0]["model"] == "aesthetic_shadow_v2"
+        assert {r["source"] for r in first["ratings"]} == {"AI", "Manual"}
+        assert first["quality_summary"]["known_count"] >= 1
+        assert result[image_ids[1]]["tags"][0]["tag"] == "cat2"
+
+    def test_chunking_preserves_all_images(self, populated_repository):
+        repository, image_ids = populated_repository
+        repository.BATCH_CHUNK_SIZE = 1
+
+        result = repository.get_image_annotations_batch(image_ids)
+
+        assert all(len(result[image_id]["tags"]) == 1 for image_id in image_ids)
+
+
 class TestGetLowResImagePathsBatch:
     """get_low_res_image_paths_batch メソッドのテスト (#1140 N+1 解消)。"""
 
@@ -0,0 +1,171 @@
+"""ErrorRecordSink (バッファ付きエラーレコード書き込み) の単体テスト。"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from lorairo.database.db_manager import ImageDatabaseManager
+from lorairo.database.error_record_sink import ErrorRecordSink
+from lorairo.database.repository.error_record import ErrorRecordRepository
+from lorairo.database.schema import Base, ErrorRecord
+from lorairo.services.configuration_service import ConfigurationService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def session_factory(tmp_path: Path):
+    # 書き込みスレッドから同じ DB を見るためファイル DB を使う (:memory: は接続ごとに別 DB)
+    engine = create_engine(f"sqlite:///{tmp_path / 'errors.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def repository(session_factory) -> ErrorRecordRepository:
+    return ErrorRecordRepository(session_factory=session_factory)
+
+
+def _record(index: int) -> dict:
+    return {
+        "operation_type": "registration",
+        "error_type": "FileNotFoundError",
+        "error_message": f"missing {index}",
+        "file_path": f"/src/{index}.png",
+    }
+
+
+def _count(session_factory) -> int:
+    with session_factory() as session:
+        return session.execute(select(func.count(ErrorRecord.id))).scalar_one()
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestErrorRecordSink:
+    def test_submit_does_not_write_until_flush(self, repository, session_factory):
+        sink = ErrorRecordSink(repository, batch_size=100, flush_interval=60.0)
+        try:
+            for i in range(5):
+                sink.submit(_record(i))
+
+            assert sink.pending == 5
+            assert _count(session_factory) == 0
+            assert sink.flush() == 5
+            assert _count(session_factory) == 5
+            assert (sink.submitted, sink.written, sink.flushes) == (5, 5, 1)
+        finally:
+            sink.close()
+
+    def test_full_batch_is_written_by_background_thread(self, repository, session_factory):
+        sink = ErrorRecordSink(repository, batch_size=10, flush_interval=60.0)
+        try:
+            for i in range(10):
+                sink.submit(_record(i))
+
+            assert _wait_until(lambda: sink.written == 10)
+            assert sink.flushes == 1
+            assert _count(session_factory) == 10
+        finally:
+            sink.close()
+
+    def test_partial_batch_is_written_after_interval(self, repository, session_factory):
+        sink = ErrorRecordSink(repository, batch_size=100, flush_interval=0.05)
+        try:
+            sink.submit(_record(0))
+
+            assert _wait_until(lambda: sink.written == 1)
+        finally:
+            sink.close()
+
+    def test_close_flushes_and_later_submits_write_synchronously(self, repository, session_factory):
+        sink = ErrorRecordSink(repository, batch_size=100, flush_interval=60.0)
+        sink.submit(_record(0))
+
+        sink.close()
+        assert _count(session_factory) == 1
+
+        sink.submit(_record(1))
+        assert _count(session_factory) == 2
+        assert sink.pending == 0
+
+    def test_write_failure_is_counted_as_dropped(self):
+        failing = Mock(spec=ErrorRecordRepository)
+        failing.save_error_records_batch.side_effect = RuntimeError("DB down")
+        sink = ErrorRecordSink(failing, batch_size=100, flush_interval=60.0)
+        sink.submit(_record(0))
+        sink.submit(_record(1))
+
+        assert sink.flush() == 2
+        assert (sink.written, sink.dropped) == (0, 2)
+        sink.close()
+
+    def test_concurrent_submitters_lose_nothing(self, repository, session_factory):
+        sink = ErrorRecordSink(repository, batch_size=25, flush_interval=0.01)
+
+        def produce(offset: int) -> None:
+            for i in range(100):
+                sink.submit(_record(offset + i))
+
+        threads = [threading.Thread(target=produce, args=(n * 100,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sink.close()
+
+        assert sink.written == 400
+        assert _count(session_factory) == 400
+
+
+class TestBufferedErrorRecords:
+    @pytest.fixture
+    def manager(self, session_factory) -> ImageDatabaseManager:
+        return ImageDatabaseManager(Mock(spec=ConfigurationService), session_factory=session_factory)
+
+    def test_save_error_record_is_buffered_inside_scope(self, manager, session_factory):
+        with manager.buffered_error_records():
+            assert manager.save_error_record("registration", "OSError", "broken") == 0
+            assert manager.error_record_sink.pending == 1
+
+        assert manager.error_record_sink.pending == 0
+        assert _count(session_factory) == 1
+        manager.error_record_sink.close()
+
+    def test_scope_flushes_on_exception(self, manager, session_factory):
+        with pytest.raises(RuntimeError), manager.buffered_error_records():
+            manager.save_error_record("annotation", "APIError", "timeout")
+            raise RuntimeError("worker failed")
+
+        assert _count(session_factory) == 1
+        manager.error_record_sink.close()
+
+    def test_other_threads_and_outside_scope_write_immediately(self, manager, session_factory):
+        results: list[int] = []
+        with manager.buffered_error_records():
+            thread = threading.Thread(
+                target=lambda: results.append(manager.save_error_record("annotation", "APIError", "x"))
+            )
+            thread.start()
+            thread.join()
+            assert results[0] > 0
+            assert _count(session_factory) == 1
+
+        assert manager.save_error_record("annotation", "APIError", "y") > 0
+        assert _count(session_factory) == 2
+        manager.error_record_sink.close()
@@ -0,0 +1,113 @@
+"""ImageIdSelection (ソート済み画像 ID 集合) と image_id_condition の単体テスト。"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import sessionmaker
+
+from lorairo.database.image_id_selection import ImageIdSelection
+from lorairo.database.repository.annotation_record import AnnotationRepository
+from lorairo.database.repository.base import MAX_ID_RANGE_TERMS, image_id_condition
+from lorairo.database.schema import Base, Image, Model, Rating, Tag
+
+pytestmark = pytest.mark.unit
+
+
+def _sql(condition) -> str:
+    return str(condition.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class TestImageIdSelection:
+    def test_constructor_sorts_and_dedupes(self):
+        selection = ImageIdSelection([5, 1, 3, 1, 5])
+
+        assert selection.to_list() == [1, 3, 5]
+        assert len(selection) == 3
+        assert selection == [1, 3, 5]
+        assert [1, 3, 5] == selection
+        assert selection != [5, 3, 1]
+        assert selection[-1] == 5
+        assert selection[1:] == [3, 5]
+
+    def test_contains(self):
+        selection = ImageIdSelection(range(0, 100, 2))
+
+        assert 10 in selection
+        assert 11 not in selection
+        assert "10" not in selection
+        assert True not in selection
+
+    def test_set_operations(self):
+        selection = ImageIdSelection([1, 2, 3, 4])
+
+        assert selection | [6, 0] == [0, 1, 2, 3, 4, 6]
+        assert selection & [2, 4, 9] == [2, 4]
+        assert selection - [1, 4, 9] == [2, 3]
+        assert selection == [1, 2, 3, 4]  # 元の集合は変わらない
+
+    @pytest.mark.parametrize("other_size", [10, 1000])
+    def test_small_and_large_changes_agree(self, other_size):
+        base = ImageIdSelection(range(0, 3000, 3))
+        other = list(range(1, other_size * 2, 2))
+
+        assert base.union(other) == sorted(set(base) | set(other))
+        assert base.difference(other) == sorted(set(base) - set(other))
+        assert base.intersection(other) == sorted(set(base) & set(other))
+
+    def test_runs(self):
+        assert ImageIdSelection([1, 2, 3, 7, 9, 10]).runs() == [(1, 3), (7, 7), (9, 10)]
+        assert ImageIdSelection().runs() == []
+
+
+class TestImageIdCondition:
+    def test_plain_iterable_uses_in(self):
+        assert _sql(image_id_condition(Tag.image_id, [1, 2, 3])) == "tags.image_id IN (1, 2, 3)"
+
+    def test_selection_collapses_runs_into_between(self):
+        sql = _sql(image_id_condition(Tag.image_id, ImageIdSelection([*range(1, 1001), 5000])))
+
+        assert sql == "tags.image_id BETWEEN 1 AND 1000 OR tags.image_id IN (5000)"
+
+    def test_fragmented_selection_falls_back_to_in(self):
+        fragmented = ImageIdSelection(i * 3 + j for i in range(MAX_ID_RANGE_TERMS + 1) for j in range(2))
+
+        assert "BETWEEN" not in _sql(image_id_condition(Tag.image_id, fragmented))
+        assert "BETWEEN" not in _sql(image_id_condition(Tag.image_id, ImageIdSelection([1, 3, 5])))
+
+    def test_update_rating_batch_with_selection(self):
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(engine)
+        now = datetime.now(UTC)
+        with session_factory() as session:
+            session.add(Model(name="manual", provider="lorairo", litellm_model_id="manual"))
+            for i in range(1, 7):
+                session.add(
+                    Image(
+                        uuid=f"uuid-{i}",
+                        phash=f"phash-{i}",
+                        original_image_path=f"/src/{i}.png",
+                        stored_image_path=f"/img/{i}.png",
+                        width=64,
+                        height=64,
+                        format="PNG",
+                        extension=".png",
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+            session.commit()
+            model_id = session.execute(select(Model.id)).scalar_one()
+
+        repository = AnnotationRepository(session_factory=session_factory)
+        success, count = repository.update_rating_batch(ImageIdSelection([1, 2, 3, 5]), "PG", model_id)
+
+        assert (success, count) == (True, 4)
+        with session_factory() as session:
+            rated = session.execute(select(Rating.image_id).order_by(Rating.image_id)).scalars().all()
+        assert rated == [1, 2, 3, 5]
+        engine.dispose()
@@ -10,6 +10,7 @@ import pytest
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
 
+from lorairo.database.repository.base import resolve_tag_string_ids
 from lorairo.database.repository.image import ImageRepository
 
 # ---------------------------------------------------------------------------
@@ -78,7 +79,7 @@ def _create_model_with_tag(session_factory, litellm_model_id: str, image_id: int
         tag = Tag(
             image_id=image_id,
             model_id=model.id,
-            tag="test_tag",
+            tag_string_id=resolve_tag_string_ids(session, ["test_tag"])["test_tag"],
         )
         session.add(tag)
         session.commit()
@@ -0,0 +1,125 @@
+"""Alembic migration `a9b0c1d2e3f4` tag_strings 語彙テーブルと tags.tag_string_id。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect, text
+
+
+def _make_alembic_config(db_path: Path) -> Config:
+    project_root = Path(__file__).resolve().parents[3]
+    cfg = Config(str(project_root / "alembic.ini"))
+    cfg.set_main_option("script_location", str(project_root / "src/lorairo/database/migrations"))
+    cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    return cfg
+
+
+def _seed_pre_tag_strings_db(db_path: Path) -> None:
+    """tag_strings 追加前 (revision f8a9b0c1d2e3) の tags を用意する。"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE tags (
+                    id INTEGER NOT NULL PRIMARY KEY,
+                    image_id INTEGER,
+                    model_id INTEGER,
+                    tag VARCHAR NOT NULL
+                )
+                """
+            )
+        )
+        conn.execute(text("CREATE INDEX ix_tags_tag ON tags (tag)"))
+        conn.execute(text("CREATE UNIQUE INDEX uq_tags_image_model_tag ON tags (image_id, model_id, tag)"))
+        conn.execute(
+            text(
+                "INSERT INTO tags (id, image_id, model_id, tag) VALUES "
+                "(1, 1, 1, 'solo'), (2, 1, 2, 'solo'), (3, 2, 1, 'Smile'), (4, 2, 1, 'smile')"
+            )
+        )
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO alembic_version (version_num) VALUES ('f8a9b0c1d2e3')"))
+    engine.dispose()
+
+
+@pytest.mark.unit
+def test_tag_strings_migration_backfills_tag_string_ids(tmp_path: Path) -> None:
+    db_path = tmp_path / "tag_strings.db"
+    cfg = _make_alembic_config(db_path)
+    _seed_pre_tag_strings_db(db_path)
+
+    command.upgrade(cfg, "a9b0c1d2e3f4")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        vocab = dict(conn.execute(text("SELECT tag, id FROM tag_strings")).all())
+        assert set(vocab) == {"solo", "Smile", "smile"}  # 大文字小文字は別語彙
+        rows = dict(conn.execute(text("SELECT id, tag_string_id FROM tags")).all())
+        assert rows == {1: vocab["solo"], 2: vocab["solo"], 3: vocab["Smile"], 4: vocab["smile"]}
+        # tag_string_id はリポジトリが書き込み時に設定する (トリガーは作らない)
+        triggers = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger'")).all()
+        assert triggers == []
+
+    inspector = inspect(engine)
+    columns = {column["name"]: column for column in inspector.get_columns("tags")}
+    assert "tag" not in columns
+    assert columns["tag_string_id"]["nullable"] is False
+    indexes = {index["name"]: index for index in inspector.get_indexes("tags")}
+    assert "ix_tags_tag_string_id" in indexes
+    assert "ix_tags_tag" not in indexes
+    assert indexes["uq_tags_image_model_tag"]["column_names"] == ["image_id", "model_id", "tag_string_id"]
+    engine.dispose()
+
+
+@pytest.mark.unit
+def test_tag_strings_migration_drops_legacy_triggers(tmp_path: Path) -> None:
+    """行単位トリガーで同期していた初版の適用済み DB からもトリガーを取り除く。"""
+    db_path = tmp_path / "tag_strings.db"
+    cfg = _make_alembic_config(db_path)
+    _seed_pre_tag_strings_db(db_path)
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE tag_strings (id INTEGER PRIMARY KEY, tag VARCHAR NOT NULL UNIQUE)"))
+        conn.execute(text("ALTER TABLE tags ADD COLUMN tag_string_id INTEGER REFERENCES tag_strings (id)"))
+        conn.execute(
+            text(
+                "CREATE TRIGGER trg_tags_tag_string_insert AFTER INSERT ON tags BEGIN "
+                "INSERT OR IGNORE INTO tag_strings (tag) VALUES (NEW.tag); END"
+            )
+        )
+
+    command.upgrade(cfg, "a9b0c1d2e3f4")
+
+    with engine.begin() as conn:
+        triggers = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger'")).all()
+        assert triggers == []
+        assert conn.execute(text("SELECT COUNT(*) FROM tags WHERE tag_string_id IS NULL")).scalar() == 0
+    engine.dispose()
+
+
+@pytest.mark.unit
+def test_tag_strings_migration_downgrade_restores_text_column(tmp_path: Path) -> None:
+    db_path = tmp_path / "tag_strings.db"
+    cfg = _make_alembic_config(db_path)
+    _seed_pre_tag_strings_db(db_path)
+    command.upgrade(cfg, "a9b0c1d2e3f4")
+
+    command.downgrade(cfg, "f8a9b0c1d2e3")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    inspector = inspect(engine)
+    assert "tag_strings" not in inspector.get_table_names()
+    assert "tag_string_id" not in {column["name"] for column in inspector.get_columns("tags")}
+    indexes = {index["name"]: index for index in inspector.get_indexes("tags")}
+    assert "ix_tags_tag" in indexes
+    assert indexes["uq_tags_image_model_tag"]["column_names"] == ["image_id", "model_id", "tag"]
+    with engine.begin() as conn:
+        rows = conn.execute(text("SELECT id, tag FROM tags ORDER BY id")).all()
+        assert rows == [(1, "solo"), (2, "solo"), (3, "Smile"), (4, "smile")]
+        conn.execute(text("INSERT INTO tags (id, image_id, model_id, tag) VALUES (9, 9, 1, 'x')"))
+    engine.dispose()
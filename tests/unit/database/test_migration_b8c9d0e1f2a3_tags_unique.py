@@ -73,7 +73,7 @@ def test_tags_unique_migration_collapses_duplicates(tmp_path: Path) -> None:
     cfg = _make_alembic_config(db_path)
     _seed_pre_unique_db(db_path)
 
-    command.upgrade(cfg, "head")
+    command.upgrade(cfg, "b8c9d0e1f2a3")
 
     engine = create_engine(f"sqlite:///{db_path}")
     with engine.connect() as conn:
@@ -107,7 +107,7 @@ def test_tags_unique_migration_adds_unique_index(tmp_path: Path) -> None:
     cfg = _make_alembic_config(db_path)
     _seed_pre_unique_db(db_path)
 
-    command.upgrade(cfg, "head")
+    command.upgrade(cfg, "b8c9d0e1f2a3")
 
     engine = create_engine(f"sqlite:///{db_path}")
     inspector = inspect(engine)
@@ -0,0 +1,115 @@
+"""Alembic migration `e7f8a9b0c1d2` images.path_key の追加と backfill。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect, text
+
+from lorairo.database.db_core import stored_path_key
+
+
+def _make_alembic_config(db_path: Path) -> Config:
+    project_root = Path(__file__).resolve().parents[3]
+    cfg = Config(str(project_root / "alembic.ini"))
+    cfg.set_main_option("script_location", str(project_root / "src/lorairo/database/migrations"))
+    cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    return cfg
+
+
+def _seed_pre_path_key_db(db_path: Path, stored_paths: list[str]) -> None:
+    """path_key 追加前 (revision c9d0e1f2a3b4) の images を用意する。"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE images (
+                    id INTEGER NOT NULL PRIMARY KEY,
+                    stored_image_path VARCHAR NOT NULL
+                )
+                """
+            )
+        )
+        for image_id, stored_path in enumerate(stored_paths, start=1):
+            conn.execute(
+                text("INSERT INTO images (id, stored_image_path) VALUES (:id, :path)"),
+                {"id": image_id, "path": stored_path},
+            )
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO alembic_version (version_num) VALUES ('c9d0e1f2a3b4')"))
+    engine.dispose()
+
+
+def _path_keys(db_path: Path) -> dict[int, str | None]:
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, path_key FROM images ORDER BY id")).all()
+    engine.dispose()
+    return dict(rows)
+
+
+@pytest.mark.unit
+def test_path_key_migration_backfills_project_relative_keys(tmp_path: Path) -> None:
+    project_dir = tmp_path / "main_dataset_20260101_001"
+    project_dir.mkdir()
+    db_path = project_dir / "image_database.db"
+    stored = [
+        "image_dataset/original_images/2026/01/01/src/a.png",
+        "lorairo_data/main_dataset_20260101_001/image_dataset/original_images/2026/01/01/src/b.png",
+        "image_dataset\\original_images\\2026\\01\\01\\other\\a.png",
+        "/elsewhere/c.png",
+    ]
+    _seed_pre_path_key_db(db_path, stored)
+
+    command.upgrade(_make_alembic_config(db_path), "head")
+
+    keys = _path_keys(db_path)
+    assert keys == {
+        1: "image_dataset/original_images/2026/01/01/src/a.png",
+        2: "image_dataset/original_images/2026/01/01/src/b.png",
+        3: "image_dataset/original_images/2026/01/01/other/a.png",
+        4: "/elsewhere/c.png",
+    }
+    # 実行時のキー計算 (db_core.stored_path_key) と一致する
+    root = project_dir.resolve()
+    assert [keys[i] for i in range(1, 5)] == [stored_path_key(p, root) for p in stored]
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    indexes = {index["name"]: index for index in inspect(engine).get_indexes("images")}
+    engine.dispose()
+    assert indexes["uq_images_path_key"]["unique"]
+
+
+@pytest.mark.unit
+def test_path_key_migration_leaves_duplicate_paths_null(tmp_path: Path) -> None:
+    db_path = tmp_path / "image_database.db"
+    _seed_pre_path_key_db(
+        db_path,
+        ["image_dataset/x/a.png", "image_dataset/x/../x/a.png", "image_dataset/x/b.png"],
+    )
+
+    command.upgrade(_make_alembic_config(db_path), "head")
+
+    keys = _path_keys(db_path)
+    assert keys[1] == "image_dataset/x/a.png"
+    assert keys[2] is None
+    assert keys[3] == "image_dataset/x/b.png"
+
+
+@pytest.mark.unit
+def test_path_key_migration_downgrade_removes_column(tmp_path: Path) -> None:
+    db_path = tmp_path / "image_database.db"
+    _seed_pre_path_key_db(db_path, ["image_dataset/x/a.png"])
+    cfg = _make_alembic_config(db_path)
+
+    command.upgrade(cfg, "e7f8a9b0c1d2")
+    command.downgrade(cfg, "c9d0e1f2a3b4")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    columns = {column["name"] for column in inspect(engine).get_columns("images")}
+    engine.dispose()
+    assert "path_key" not in columns
@@ -0,0 +1,145 @@
+"""クエリプロファイラ (レイテンシ集計 / EXPLAIN QUERY PLAN / 全件走査検出) のテスト。"""
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from lorairo.database.db_core import create_db_engine
+from lorairo.database.query_profiler import (
+    QueryProfiler,
+    QueryStat,
+    find_full_scans,
+    normalize_sql,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def engine(tmp_path) -> Iterator[Engine]:
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'profile.sqlite'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, size INTEGER)"))
+        connection.execute(text("CREATE INDEX ix_items_name ON items (name)"))
+        connection.execute(text("INSERT INTO items (name, size) VALUES ('a', 1), ('b', 2)"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def profiler(engine: Engine) -> Iterator[QueryProfiler]:
+    profiler = QueryProfiler(caller_modules=(__name__,))
+    profiler.register_engine(engine)
+    profiler.enable(slow_ms=0)
+    yield profiler
+    profiler.disable()
+
+
+class ItemRepository:
+    """呼び出し元検出用の Repository もどき (このモジュールを呼び出し元として扱う)。"""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+    def find_by_size(self, size: int) -> list[str]:
+        with self.engine.connect() as connection:
+            return list(
+                connection.execute(
+                    text("SELECT name FROM items WHERE size = :size"), {"size": size}
+                ).scalars()
+            )
+
+
+def test_normalize_sql_collapses_literals_and_in_lists() -> None:
+    sql = "SELECT *\n  FROM images WHERE id IN (?, ?, ?) AND name = 'x''y' AND score >= 5.5 LIMIT 100"
+
+    assert (
+        normalize_sql(sql) == "SELECT * FROM images WHERE id IN (...) AND name = ? AND score >= ? LIMIT ?"
+    )
+    # 識別子に含まれる数字は残す
+    assert normalize_sql("SELECT anon_1.id FROM t AS anon_1") == "SELECT anon_1.id FROM t AS anon_1"
+
+
+def test_find_full_scans_ignores_index_and_constant_scans() -> None:
+    plan = [
+        "SCAN images",
+        "SEARCH tags USING INDEX ix_tags_image_id (image_id=?)",
+        "SCAN annotations USING COVERING INDEX ix_annotations",
+        "SCAN CONSTANT ROW",
+        "SCAN TABLE captions",
+    ]
+
+    assert find_full_scans(plan) == ["images", "captions"]
+
+
+def test_query_stat_histogram_and_percentiles() -> None:
+    stat = QueryStat(sql="SELECT 1", caller="X.y")
+    for elapsed in (0.2, 0.8, 3.0, 40.0):
+        stat.record(elapsed, slow=elapsed >= 10)
+
+    assert stat.count == 4
+    assert stat.slow_count == 1
+    assert stat.mean_ms == pytest.approx(11.0)
+    assert stat.percentile_ms(0.5) == 1.0
+    assert stat.percentile_ms(1.0) == 40.0  # バケット上端 (50) ではなく最大値で頭打ち
+    assert sum(stat.to_dict()["histogram"].values()) == 4
+
+
+def test_profiler_records_caller_plan_and_full_scan(engine: Engine, profiler: QueryProfiler) -> None:
+    repository = ItemRepository(engine)
+    assert repository.find_by_size(1) == ["a"]
+    assert repository.find_by_size(2) == ["b"]
+    with engine.connect() as connection:
+        connection.execute(text("SELECT size FROM items WHERE name = 'a'")).all()
+
+    stats = {stat.sql: stat for stat in profiler.snapshot()}
+    by_size = stats["SELECT name FROM items WHERE size = ?"]
+    assert by_size.caller == "ItemRepository.find_by_size"
+    assert by_size.count == 2
+    assert by_size.full_scans == ["items"]
+    assert by_size.plan_samples == 2
+
+    by_name = stats["SELECT size FROM items WHERE name = ?"]
+    assert by_name.caller.endswith(".test_profiler_records_caller_plan_and_full_scan")
+    assert by_name.full_scans == []
+    assert any("ix_items_name" in detail for detail in by_name.plan)
+
+    summary = profiler.summary(top=1)
+    assert len(summary["statements"]) == 1
+    assert summary["full_scans"] == ["items"]
+    assert summary["callers"][0]["count"] + summary["callers"][1]["count"] == 3
+
+
+def test_plan_is_not_sampled_below_threshold(engine: Engine, profiler: QueryProfiler) -> None:
+    profiler.slow_ms = 60_000
+
+    ItemRepository(engine).find_by_size(1)
+
+    (stat,) = [stat for stat in profiler.snapshot() if "size = ?" in stat.sql]
+    assert stat.count == 1
+    assert stat.plan_samples == 0
+    assert stat.plan == []
+
+
+def test_disable_removes_listeners_and_reset_clears(engine: Engine, profiler: QueryProfiler) -> None:
+    ItemRepository(engine).find_by_size(1)
+    profiler.disable()
+    ItemRepository(engine).find_by_size(1)
+
+    assert [stat.count for stat in profiler.snapshot() if "size = ?" in stat.sql] == [1]
+
+    profiler.reset()
+    assert profiler.snapshot() == []
+    assert not profiler.enabled
+
+
+def test_failed_statement_does_not_leak_start_time(engine: Engine, profiler: QueryProfiler) -> None:
+    with engine.connect() as connection:
+        with pytest.raises(Exception, match="no such table"):
+            connection.execute(text("SELECT * FROM missing_table"))
+        connection.rollback()
+        connection.execute(text("SELECT 1")).all()
+
+        assert connection.info.get("lorairo_query_profiler_start") == []
@@ -0,0 +1,175 @@
+"""tag_strings 語彙テーブルと tags.tag_string_id の書き込み・参照のテスト。"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from lorairo.database.repository.annotation_record import AnnotationRepository, AnnotationSaveItem
+from lorairo.database.repository.image import ImageRepository
+from lorairo.database.schema import Base, Image, Model, Tag, TagString
+from lorairo.services.tag_cloud_service import TagCloudService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def repository(session_factory) -> AnnotationRepository:
+    repo = AnnotationRepository(session_factory=session_factory)
+    repo.merged_reader = None
+    repo._merged_reader_initialized = True
+    return repo
+
+
+@pytest.fixture
+def image_ids(session_factory) -> list[int]:
+    with session_factory() as session:
+        images = [
+            Image(
+                uuid=f"tag-strings-{index}",
+                phash=f"tag-strings-phash-{index}",
+                original_image_path=f"/tmp/tag-strings-{index}.png",
+                stored_image_path=f"/tmp/tag-strings-{index}.png",
+                width=64,
+                height=64,
+                format="PNG",
+                extension=".png",
+                filename=f"tag-strings-{index}.png",
+            )
+            for index in range(2)
+        ]
+        session.add_all(images)
+        session.commit()
+        return [image.id for image in images]
+
+
+def _synced(session) -> list[tuple[str, str]]:
+    return [
+        (tag, interned)
+        for tag, interned in session.execute(
+            select(Tag.tag, TagString.tag)
+            .join(TagString, TagString.id == Tag.tag_string_id)
+            .order_by(Tag.id)
+        )
+    ]
+
+
+def test_save_annotations_batch_interns_each_string_once(repository, session_factory, image_ids):
+    repository.save_annotations_batch(
+        [
+            AnnotationSaveItem(
+                image_id=image_id,
+                annotations={
+                    "tags": [
+                        {"tag": "solo", "model_id": None, "tag_id": None},
+                        {"tag": "smile", "model_id": None, "tag_id": None},
+                    ]
+                },
+            )
+            for image_id in image_ids
+        ]
+    )
+
+    with session_factory() as session:
+        assert _synced(session) == [("solo", "solo"), ("smile", "smile")] * 2
+        assert sorted(session.execute(select(TagString.tag)).scalars()) == ["smile", "solo"]
+
+
+def test_batch_add_and_replace_set_tag_string_id(repository, session_factory, image_ids):
+    with session_factory() as session:
+        session.add(TagString(tag="1girl"))
+        session.commit()
+
+    repository.add_tag_to_images_batch(image_ids, "1girl", None, resolved=("1girl", None))
+    repository.replace_tag_for_images_batch(image_ids[:1], "1girl", "solo")
+
+    with session_factory() as session:
+        rows = session.execute(
+            select(Tag.image_id, Tag.tag, TagString.tag)
+            .join(TagString, TagString.id == Tag.tag_string_id)
+            .where(Tag.rejected_at.is_(None))
+            .order_by(Tag.id)
+        ).all()
+        assert rows == [(image_ids[1], "1girl", "1girl"), (image_ids[0], "solo", "solo")]
+        assert session.execute(select(TagString.tag).order_by(TagString.id)).scalars().all() == [
+            "1girl",
+            "solo",
+        ]
+
+
+def test_tag_text_condition_matches_through_vocabulary(session_factory, image_ids):
+    with session_factory() as session:
+        vocab = {tag: TagString(tag=tag) for tag in ("solo", "smile")}
+        session.add_all(vocab.values())
+        session.flush()
+        session.add_all(
+            [
+                Tag(image_id=image_ids[0], tag_string_id=vocab["solo"].id),
+                Tag(image_id=image_ids[1], tag_string_id=vocab["smile"].id),
+            ]
+        )
+        session.commit()
+
+        exact = session.execute(
+            select(Tag.image_id).where(ImageRepository._tag_text_condition("solo", True))
+        ).scalars()
+        like = session.execute(
+            select(Tag.image_id).where(ImageRepository._tag_text_condition("s%", False))
+        ).scalars()
+
+        assert list(exact) == [image_ids[0]]
+        assert sorted(like) == image_ids
+
+
+def test_tag_cloud_reads_strings_from_vocabulary(session_factory, image_ids):
+    with session_factory() as session:
+        vocab = {tag: TagString(tag=tag) for tag in ("Solo", "Smile")}
+        session.add_all(vocab.values())
+        session.flush()
+        session.add_all(
+            [
+                Tag(image_id=image_ids[0], tag_string_id=vocab["Solo"].id),
+                Tag(image_id=image_ids[1], tag_string_id=vocab["Smile"].id),
+            ]
+        )
+        session.commit()
+    db_manager = MagicMock()
+    db_manager.image_repo.get_session.side_effect = session_factory
+
+    loaded = TagCloudService(db_manager)._load_tags()
+
+    assert loaded == {image_ids[0]: ["solo"], image_ids[1]: ["smile"]}
+
+
+def test_tag_string_id_is_required_and_unique_per_image_model(session_factory, image_ids):
+    with session_factory() as session:
+        vocab = TagString(tag="solo")
+        model = Model(name="wd-tagger", litellm_model_id="local/wd-tagger")
+        session.add_all([vocab, model])
+        session.flush()
+        session.add(Tag(image_id=image_ids[0], model_id=model.id, tag_string_id=vocab.id))
+        session.commit()
+
+        session.add(Tag(image_id=image_ids[0], model_id=model.id, tag_string_id=vocab.id))
+        with pytest.raises(IntegrityError):
+            session.commit()
+        session.rollback()
+
+        session.add(Tag(image_id=image_ids[1]))
+        with pytest.raises(IntegrityError):
+            session.commit()
+        session.rollback()
+
+        assert session.execute(select(Tag.tag)).scalars().all() == ["solo"]
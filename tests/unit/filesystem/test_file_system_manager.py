@@ -278,6 +278,22 @@ class TestGetImageInfo:
         info = FileSystemManager.get_image_info(rgb_image_path)
         assert "color_space" in info
 
+    def test_large_jpeg_grayscale_is_judged_at_full_resolution(self, tmp_path: Path) -> None:
+        """大きな JPEG もフル解像度デコードから判定し、元の寸法を返す (保存値を変えない)。"""
+        path = tmp_path / "large.jpg"
+        Image.new("RGB", (2400, 1600), color=(128, 128, 128)).save(path, "JPEG")
+
+        info = FileSystemManager.get_image_info(path)
+
+        assert (info["width"], info["height"]) == (2400, 1600)
+        assert info["is_grayscale_like"] is True
+        with Image.open(path) as img:
+            img.load()
+            assert FileSystemManager._compute_grayscale_likeness(img) == (
+                info["is_grayscale_like"],
+                info["colorfulness_score"],
+            )
+
 
 class TestGrayscaleLikeDetection:
     """get_image_info のグレースケール相当判定 (Issue #631 / ADR 0061) のテスト"""
@@ -0,0 +1,149 @@
+# tests/unit/gui/cache/test_annotation_snapshot.py
+"""AnnotationSnapshot のユニットテスト"""
+
+import datetime
+
+import pytest
+
+from lorairo.gui.cache.annotation_snapshot import AnnotationSnapshot
+
+
+def make_annotations(tag: str = "cat") -> dict:
+    """get_image_annotation_metadata 形状のアノテーション辞書を生成"""
+    created = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    return {
+        "tags": [
+            {
+                "id": 1,
+                "tag": tag,
+                "tag_id": 10,
+                "model_id": 2,
+                "model_name": "wd-tagger",
+                "source": "AI",
+                "existing": False,
+                "is_edited_manually": False,
+                "confidence_score": 0.9,
+                "created_at": created,
+                "updated_at": created,
+            }
+        ],
+        "tags_text": tag,
+        "captions": [],
+        "caption_text": "",
+        "scores": [],
+        "score_value": 0.0,
+        "ai_score_value": None,
+        "manual_score_value": None,
+        "score_labels": [],
+        "ratings": [],
+        "rating_value": "",
+        "ai_rating_value": "",
+        "manual_rating_value": "",
+        "quality_summary": {"tier": None},
+    }
+
+
+@pytest.fixture
+def snapshot():
+    """空の AnnotationSnapshot"""
+    return AnnotationSnapshot()
+
+
+class TestAnnotationSnapshotRoundTrip:
+    """格納と復元"""
+
+    def test_get_returns_equivalent_dict(self, snapshot):
+        """put した辞書と同じ内容が get で復元される"""
+        annotations = make_annotations()
+        snapshot.put(1, annotations)
+
+        assert snapshot.get(1) == annotations
+        assert 1 in snapshot
+        assert len(snapshot) == 1
+
+    def test_get_returns_fresh_dict(self, snapshot):
+        """get の戻り値を変更してもスナップショットは変わらない"""
+        snapshot.put(1, make_annotations())
+
+        first = snapshot.get(1)
+        first["tags"].clear()
+        first["quality_summary"]["tier"] = "changed"
+
+        second = snapshot.get(1)
+        assert second["tags"][0]["tag"] == "cat"
+        assert second["quality_summary"] == {"tier": None}
+
+    def test_partial_dict_keeps_only_present_keys(self, snapshot):
+        """元 dict に無いスカラーキーは復元結果にも含まれない"""
+        snapshot.put(1, {"tags": [{"tag": "cat"}], "tags_text": "cat"})
+
+        restored = snapshot.get(1)
+        assert restored["tags_text"] == "cat"
+        assert restored["tags"][0]["tag"] == "cat"
+        assert "captions" not in restored
+        assert "rating_value" not in restored
+
+    def test_repeated_strings_are_interned(self, snapshot):
+        """タグ文字列は画像間で同一オブジェクトを共有する"""
+        snapshot.put(1, make_annotations("".join(["long", "_tag"])))
+        snapshot.put(2, make_annotations("".join(["long", "_ta", "g"])))
+
+        assert snapshot.get(1)["tags"][0]["tag"] is snapshot.get(2)["tags"][0]["tag"]
+
+
+class TestAnnotationSnapshotInvalidation:
+    """無効化と行の再利用"""
+
+    def test_invalidate_removes_rows(self, snapshot):
+        """invalidate した画像は get で None になる"""
+        snapshot.put(1, make_annotations())
+        snapshot.put(2, make_annotations("dog"))
+
+        assert snapshot.invalidate([1, 999]) == 1
+        assert snapshot.get(1) is None
+        assert snapshot.get(2)["tags_text"] == "dog"
+
+    def test_invalidate_advances_generation_only_when_rows_removed(self, snapshot):
+        """未格納 ID だけの invalidate では世代番号を進めない"""
+        snapshot.put(1, make_annotations())
+        generation = snapshot.generation
+
+        assert snapshot.invalidate([999]) == 0
+        assert snapshot.generation == generation
+        assert snapshot.invalidate([1]) == 1
+        assert snapshot.generation == generation + 1
+
+    def test_free_rows_are_reused(self, snapshot):
+        """無効化で空いた行は次の put で再利用される"""
+        snapshot.put(1, make_annotations())
+        snapshot.invalidate([1])
+        snapshot.put(2, make_annotations("dog"))
+
+        stats = snapshot.get_stats()
+        assert stats["rows"] == 1
+        assert stats["free_rows"] == 0
+
+    def test_missing_ids_preserves_order_and_dedupes(self, snapshot):
+        """未格納IDを入力順・重複なしで返す"""
+        snapshot.put(2, make_annotations())
+
+        assert snapshot.missing_ids([3, 2, 1, 3]) == [3, 1]
+
+    def test_clear_resets_everything(self, snapshot):
+        """clear で全行と統計がリセットされる"""
+        snapshot.put(1, make_annotations())
+        snapshot.get(1)
+        snapshot.clear()
+
+        assert len(snapshot) == 0
+        assert snapshot.get_stats() == {"images": 0, "rows": 0, "free_rows": 0, "hits": 0, "misses": 0}
+
+    def test_hit_miss_counters(self, snapshot):
+        """get のヒット/ミスを計上する"""
+        snapshot.put(1, make_annotations())
+        snapshot.get(1)
+        snapshot.get(2)
+
+        stats = snapshot.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
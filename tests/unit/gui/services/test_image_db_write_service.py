@@ -188,3 +188,43 @@ class TestImageDBWriteService:
 
         with pytest.raises(AttributeError):
             service.update_score(1, 500)
+
+    def test_apply_manual_edits_uses_single_batch(self, service, mock_db_manager):
+        """Rating/Score は画像ごとに 1 item にまとめ、save_annotations_batch 1 回で保存する"""
+        mock_db_manager.get_manual_edit_model_id.return_value = 42
+        mock_db_manager.annotation_repo.add_tag_to_images_batch.return_value = (True, 2)
+
+        result = service.apply_manual_edits({1: "R", 2: "PG"}, {1: 750}, {"portrait": [2, 3]})
+
+        mock_db_manager.annotation_repo.save_annotations_batch.assert_called_once()
+        items = mock_db_manager.annotation_repo.save_annotations_batch.call_args.args[0]
+        assert [item.image_id for item in items] == [1, 2]
+        assert items[0].annotations["ratings"][0]["normalized_rating"] == "R"
+        assert items[0].annotations["scores"][0]["score"] == 7.5
+        assert "scores" not in items[1].annotations
+        mock_db_manager.annotation_repo.save_annotations.assert_not_called()
+        assert result.written_image_ids == [1, 2, 3]
+        assert result.added_tags == ["portrait"]
+        assert result.ok
+
+    def test_apply_manual_edits_isolates_missing_and_failed_images(self, service, mock_db_manager):
+        """バッチ失敗時は画像単位に書き直し、削除済み画像と DB エラーを切り分ける"""
+        from sqlalchemy.exc import SQLAlchemyError
+
+        mock_db_manager.get_manual_edit_model_id.return_value = 42
+        mock_db_manager.annotation_repo.save_annotations_batch.side_effect = ValueError("missing")
+
+        def save(image_id, annotations):
+            if image_id == 2:
+                raise ValueError("image not found")
+            if image_id == 3:
+                raise SQLAlchemyError("locked")
+
+        mock_db_manager.annotation_repo.save_annotations.side_effect = save
+
+        result = service.apply_manual_edits({1: "R", 2: "PG", 3: "X"}, {}, {})
+
+        assert result.written_image_ids == [1]
+        assert result.missing_image_ids == [2]
+        assert result.failed_image_ids == [3]
+        assert not result.ok
@@ -133,6 +133,12 @@ class TestWorkerBatchProgress:
         service_with_statusbar.on_worker_batch_progress("w1", 0, 0, "file.jpg")
         mock_statusbar.showMessage.assert_called_once()
 
+    def test_unknown_total_shows_running_count(self, service_with_statusbar, mock_statusbar):
+        service_with_statusbar.on_worker_batch_progress("w1", 3, 0, "file.jpg")
+        msg = mock_statusbar.showMessage.call_args[0][0]
+        assert "3件" in msg
+        assert "/0" not in msg
+
 
 class TestBatchAnnotationStarted:
     def test_no_statusbar(self, service_no_statusbar):
@@ -0,0 +1,160 @@
+# tests/unit/gui/services/test_write_behind_queue.py
+"""WriteBehindQueue の合成・フラッシュ・終了時書き切りのテスト。"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from lorairo.gui.services.image_db_write_service import ManualEditFlushResult
+from lorairo.gui.services.write_behind_queue import WriteBehindQueue
+
+pytestmark = pytest.mark.gui
+
+
+def _written(ratings, scores, tag_adds):
+    ids = set(ratings) | set(scores)
+    for image_ids in tag_adds.values():
+        ids.update(image_ids)
+    return ManualEditFlushResult(written_image_ids=sorted(ids), added_tags=list(tag_adds))
+
+
+@pytest.fixture
+def write_service() -> Mock:
+    service = Mock()
+    service.apply_manual_edits.side_effect = _written
+    return service
+
+
+@pytest.fixture
+def queue(qtbot, write_service: Mock) -> WriteBehindQueue:
+    queue = WriteBehindQueue(write_service, flush_interval_ms=20, max_pending=100)
+    yield queue
+    queue.shutdown()
+
+
+def test_edits_are_coalesced_per_image(queue: WriteBehindQueue, write_service: Mock) -> None:
+    queue.enqueue_rating(1, "PG")
+    queue.enqueue_rating(1, "R")
+    queue.enqueue_score(1, 300)
+    queue.enqueue_rating(2, "X")
+    queue.enqueue_tag([1, 2], "portrait")
+    queue.enqueue_tag([2, 3], "portrait")
+
+    assert queue.pending_count == 2 + 3
+    result = queue.flush_now()
+
+    write_service.apply_manual_edits.assert_called_once_with(
+        {1: "R", 2: "X"}, {1: 300}, {"portrait": [1, 2, 3]}
+    )
+    assert result is not None and result.written_image_ids == [1, 2, 3]
+    assert queue.pending_count == 0
+
+
+def test_invalid_edits_are_rejected(queue: WriteBehindQueue) -> None:
+    assert queue.enqueue_rating(1, "NSFW") is False
+    assert queue.enqueue_score(1, 1001) is False
+    assert queue.enqueue_tag([], "x") is False
+    assert queue.pending_count == 0
+    assert queue.flush_now() is None
+
+
+def test_timer_flushes_in_background(qtbot, queue: WriteBehindQueue, write_service: Mock) -> None:
+    with qtbot.waitSignal(queue.flushed, timeout=2000) as blocker:
+        queue.enqueue_rating(7, "PG")
+
+    assert blocker.args[0].written_image_ids == [7]
+    assert write_service.apply_manual_edits.call_count == 1
+
+
+def test_max_pending_flushes_without_waiting_for_timer(qtbot, write_service: Mock) -> None:
+    queue = WriteBehindQueue(write_service, flush_interval_ms=60_000, max_pending=2)
+    with qtbot.waitSignal(queue.flushed, timeout=2000):
+        queue.enqueue_rating(1, "PG")
+        queue.enqueue_rating(2, "PG")
+    queue.shutdown()
+
+    write_service.apply_manual_edits.assert_called_once_with({1: "PG", 2: "PG"}, {}, {})
+
+
+def test_edits_during_flush_go_to_next_batch_in_order(qtbot, queue: WriteBehindQueue) -> None:
+    """書き込み中に届いた編集は次のバッチになり、書き込み順は編集順と一致する。"""
+    release = threading.Event()
+    batches: list[dict[int, str]] = []
+
+    def slow_apply(ratings, scores, tag_adds):
+        batches.append(ratings)
+        if len(batches) == 1:
+            release.wait(timeout=5)
+        return _written(ratings, scores, tag_adds)
+
+    queue._write_service.apply_manual_edits.side_effect = slow_apply
+    queue.enqueue_rating(1, "PG")
+    queue.flush()
+    assert queue.is_flushing
+    queue.enqueue_rating(1, "XXX")
+    release.set()
+
+    qtbot.waitUntil(lambda: len(batches) == 2 and not queue.is_flushing, timeout=3000)
+    assert batches == [{1: "PG"}, {1: "XXX"}]
+
+
+def test_shutdown_writes_pending_edits(queue: WriteBehindQueue, write_service: Mock) -> None:
+    queue.enqueue_score(4, 500)
+
+    queue.shutdown()
+
+    write_service.apply_manual_edits.assert_called_once_with({}, {4: 500}, {})
+
+
+def test_flush_now_keeps_pending_edits_when_in_flight_batch_times_out(
+    qtbot, queue: WriteBehindQueue
+) -> None:
+    """書き込み中のバッチを待ちきれなければ、後続の編集を先に書き込まずキューへ残す。"""
+    release = threading.Event()
+    batches: list[dict[int, str]] = []
+
+    def slow_apply(ratings, scores, tag_adds):
+        batches.append(ratings)
+        if len(batches) == 1:
+            release.wait(timeout=5)
+        return _written(ratings, scores, tag_adds)
+
+    queue._write_service.apply_manual_edits.side_effect = slow_apply
+    queue.enqueue_rating(1, "PG")
+    queue.flush()
+    queue.enqueue_rating(1, "XXX")
+
+    assert queue.flush_now(timeout_ms=50) is None
+    assert queue.is_flushing
+    assert queue.pending_count == 1
+    assert batches == [{1: "PG"}]
+
+    release.set()
+    qtbot.waitUntil(lambda: len(batches) == 2 and not queue.is_flushing, timeout=3000)
+    assert batches == [{1: "PG"}, {1: "XXX"}]
+
+
+def test_flush_now_reports_completed_batch_before_sync_write(qtbot, queue: WriteBehindQueue) -> None:
+    """待ち終えたバッチの結果を先に通知し、完了通知が後から届いても二重に通知しない。"""
+    release = threading.Event()
+
+    def slow_apply(ratings, scores, tag_adds):
+        if 1 in ratings:
+            release.wait(timeout=5)
+        return _written(ratings, scores, tag_adds)
+
+    queue._write_service.apply_manual_edits.side_effect = slow_apply
+    flushed: list[list[int]] = []
+    queue.flushed.connect(lambda result: flushed.append(result.written_image_ids))
+    queue.enqueue_rating(1, "PG")
+    queue.flush()
+    queue.enqueue_rating(2, "R")
+    release.set()
+
+    result = queue.flush_now()
+
+    assert result is not None and result.written_image_ids == [2]
+    assert not queue.is_flushing
+    qtbot.wait(50)
+    assert flushed == [[1], [2]]
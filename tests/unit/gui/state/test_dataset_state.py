@@ -5,7 +5,9 @@ from unittest.mock import Mock
 
 import pytest
 
+from lorairo.database.image_id_selection import ImageIdSelection
 from lorairo.gui.state.dataset_state import DatasetStateManager
+from lorairo.services.image_result_set import ImageResultSet
 
 
 class TestDatasetStateManager:
@@ -359,6 +361,22 @@ class TestDatasetStateManager:
 
         assert state_manager.get_image_by_id(1)["width"] == 4096
 
+    def test_apply_manual_edit_updates_cache_and_current_image(
+        self, state_manager, sample_image_metadata, qtbot
+    ):
+        """書込待ちの手動編集がキャッシュと表示中画像へ即座に反映されること"""
+        state_manager.set_dataset_images(sample_image_metadata)
+        state_manager._current_image_id = 1
+
+        with qtbot.waitSignal(state_manager.current_image_data_changed, timeout=1000) as blocker:
+            assert state_manager.apply_manual_edit(1, rating="R", score=8.0) is True
+
+        cached = state_manager.get_image_by_id(1)
+        assert cached["manual_rating_value"] == cached["rating_value"] == "R"
+        assert cached["manual_score_value"] == cached["score_value"] == 8.0
+        assert blocker.args[0]["rating_value"] == "R"
+        assert state_manager.apply_manual_edit(99, rating="R") is False
+
     def test_get_image_by_id_index_invalidated_on_clear(self, state_manager, sample_image_metadata):
         """clear_dataset 後はインデックスが空になり None を返すこと"""
         state_manager.set_dataset_images(sample_image_metadata)
@@ -367,6 +385,100 @@ class TestDatasetStateManager:
         state_manager.clear_dataset()
         assert state_manager.get_image_by_id(1) is None
 
+    # === 列指向の検索結果セット ===
+
+    def test_search_results_are_held_as_result_set(self, state_manager, sample_image_metadata):
+        """検索結果は ImageResultSet で保持し、シグナルも list 化せずに渡すこと"""
+        result_set = ImageResultSet.from_rows(sample_image_metadata)
+        received = Mock()
+        state_manager.images_filtered.connect(received)
+
+        state_manager.update_from_search_results(result_set)
+
+        emitted = received.call_args.args[0]
+        assert isinstance(emitted, ImageResultSet)
+        assert emitted is state_manager.image_result_set
+        assert emitted is not result_set  # 呼び出し元の保持物とは別オブジェクト
+        assert state_manager.filtered_images == sample_image_metadata
+        assert state_manager.get_filtered_image_ids_slice(1, 3) == [2, 3]
+
+    def test_current_image_kept_when_still_in_results(self, state_manager, sample_image_metadata):
+        """現在画像が新しい検索結果に含まれていれば選択を維持すること"""
+        state_manager.set_dataset_images(sample_image_metadata)
+        state_manager.set_current_image(2)
+
+        state_manager.update_from_search_results(ImageResultSet.from_rows(sample_image_metadata[1:]))
+        assert state_manager.current_image_id == 2
+
+        state_manager.update_from_search_results(ImageResultSet.from_rows(sample_image_metadata[2:]))
+        assert state_manager.current_image_id is None
+
+    def test_read_access_does_not_pin_rows(self, state_manager, sample_image_metadata):
+        """get_image_by_id は読み取り用で、行を固定せず書き換えもキャッシュに残らないこと"""
+        state_manager.set_dataset_images(sample_image_metadata)
+
+        state_manager.get_image_by_id(3)["width"] = 1
+
+        assert state_manager.image_result_set._pinned == {}
+        assert state_manager.get_image_by_id(3)["width"] == 1200
+
+    def test_manual_edit_pins_only_the_edited_row(self, state_manager, sample_image_metadata):
+        """in-place 更新する経路だけが行を固定すること"""
+        state_manager.set_dataset_images(sample_image_metadata)
+
+        assert state_manager.apply_manual_edit(2, rating="r")
+
+        assert set(state_manager.image_result_set._pinned) == {1}
+        assert state_manager.get_image_by_id(2)["rating_value"] == "r"
+
+    # === ソート済み ID 集合による選択 ===
+
+    def test_selection_in_display_order_follows_result_rows(self, state_manager):
+        """表示順の選択 ID は結果セットの行順で、結果外の ID は末尾に ID 昇順で続くこと"""
+        state_manager.update_from_search_results([{"id": image_id} for image_id in (30, 10, 20)])
+        state_manager.set_selected_images([99, 10, 30, 5])
+
+        assert state_manager.selected_image_ids == [5, 10, 30, 99]
+        assert state_manager.selected_image_ids_in_display_order() == [30, 10, 5, 99]
+
+    def test_selection_is_emitted_as_image_id_selection(self, state_manager):
+        """選択は ImageIdSelection (ID 昇順) で保持し、シグナルも list 化せずに渡すこと"""
+        received = Mock()
+        state_manager.selection_changed.connect(received)
+
+        state_manager.set_selected_images([3, 1, 3])
+
+        emitted = received.call_args.args[0]
+        assert isinstance(emitted, ImageIdSelection)
+        assert emitted is state_manager.selection
+        assert state_manager.selected_image_ids == [1, 3]
+
+        # 同じ集合の再設定では発行しない
+        state_manager.set_selected_images(ImageIdSelection([1, 3]))
+        assert received.call_count == 1
+
+    def test_select_all_filtered_and_range(self, state_manager):
+        """検索結果の行範囲から選択を作れること"""
+        state_manager.set_dataset_images(
+            [{"id": 100 + i, "stored_image_path": f"/{i}.png"} for i in range(10)]
+        )
+
+        state_manager.select_all_filtered()
+        assert len(state_manager.selection) == 10
+        assert state_manager.selection.runs() == [(100, 109)]
+
+        state_manager.select_range(2, 4)
+        assert state_manager.selected_image_ids == [102, 103]
+
+        state_manager.select_range(7, 9, add_to_existing=True)
+        assert state_manager.selected_image_ids == [102, 103, 107, 108]
+
+        state_manager.add_images_to_selection([100])
+        assert state_manager.selection.runs() == [(100, 100), (102, 103), (107, 108)]
+
+        state_manager.clear_selection()
+        assert not state_manager.selection
+
     # === Issue #965: アノテーション遅延取得 ===
 
     def test_set_current_image_lazy_loads_annotations(self, state_manager):
@@ -510,6 +622,119 @@ class TestDatasetStateManager:
 
         db_manager.image_repo.get_image_annotation_metadata.assert_not_called()
 
+    # === アノテーションスナップショット (ページ単位先読み) ===
+
+    def test_prefetch_annotations_serves_selection_without_queries(self, state_manager):
+        """先読み済み画像の選択は単一取得クエリを発行しない"""
+        state_manager.update_from_search_results(
+            [{"id": i, "stored_image_path": f"/test/image{i}.jpg"} for i in (1, 2, 3)]
+        )
+        db_manager = Mock()
+        db_manager.image_repo.get_image_annotation_metadata_batch.return_value = {
+            i: {"tags": [{"tag": f"tag{i}"}], "tags_text": f"tag{i}"} for i in (1, 2, 3)
+        }
+        state_manager.set_db_manager(db_manager)
+
+        assert state_manager.prefetch_annotations([1, 2, 3]) == 3
+
+        received = Mock()
+        state_manager.current_image_data_changed.connect(received)
+        for image_id in (1, 2, 3):
+            state_manager.set_current_image(image_id)
+
+        db_manager.image_repo.get_image_annotation_metadata.assert_not_called()
+        assert received.call_args[0][0]["tags_text"] == "tag3"
+
+    def test_prefetch_annotations_skips_already_snapshotted(self, state_manager):
+        """スナップショット済み ID は再取得しない"""
+        db_manager = Mock()
+        db_manager.image_repo.get_image_annotation_metadata_batch.return_value = {1: {"tags": []}}
+        state_manager.set_db_manager(db_manager)
+
+        state_manager.prefetch_annotations([1])
+        state_manager.prefetch_annotations([1])
+
+        db_manager.image_repo.get_image_annotation_metadata_batch.assert_called_once_with([1])
+
+    def test_prefetch_annotations_async_fills_snapshot_on_gui_thread(self, state_manager, qtbot):
+        """非同期先読みはワーカーで取得し、完了後にスナップショットへ格納する"""
+        db_manager = Mock()
+        db_manager.image_repo.get_image_annotation_metadata_batch.return_value = {
+            i: {"tags": [], "tags_text": f"tag{i}"} for i in (1, 2)
+        }
+        state_manager.set_db_manager(db_manager)
+
+        state_manager.prefetch_annotations_async([1, 2])
+        state_manager.prefetch_annotations_async([1, 2])  # 取得中の ID は再要求しない
+
+        qtbot.waitUntil(lambda: 2 in state_manager.annotation_snapshot)
+        db_manager.image_repo.get_image_annotation_metadata_batch.assert_called_once_with([1, 2])
+        assert state_manager.annotation_snapshot.get(1)["tags_text"] == "tag1"
+
+    def test_prefetch_annotations_async_drops_result_invalidated_in_flight(self, state_manager, qtbot):
+        """取得中に無効化された場合、古い結果をスナップショットへ書き戻さない"""
+        db_manager = Mock()
+        db_manager.image_repo.get_image_annotation_metadata_batch.return_value = {
+            1: {"tags": [], "tags_text": "stale"}
+        }
+        state_manager.set_db_manager(db_manager)
+        generation = state_manager.annotation_snapshot.generation
+        state_manager._prefetch_tasks[0] = Mock(image_ids=[1, 2])
+        state_manager._prefetch_inflight_ids.update([1, 2])
+
+        state_manager.invalidate_annotations([1])
+        state_manager._on_prefetch_finished(
+            0, generation, {1: {"tags": [], "tags_text": "stale"}, 2: {"tags": [], "tags_text": "fresh"}}
+        )
+
+        assert 1 not in state_manager.annotation_snapshot
+        # 無効化されていない ID の結果は捨てない
+        assert state_manager.annotation_snapshot.get(2)["tags_text"] == "fresh"
+        assert not state_manager._prefetch_stale_ids
+
+    def test_invalidate_annotations_drops_snapshot_rows(self, state_manager):
+        """invalidate_annotations はスナップショットも無効化し次回選択で DB を再照会させる"""
+        state_manager.update_from_search_results([{"id": 1, "stored_image_path": "/test/image1.jpg"}])
+        db_manager = Mock()
+        db_manager.image_repo.get_image_annotation_metadata_batch.return_value = {
+            1: {"tags": [{"tag": "old_tag"}], "tags_text": "old_tag"}
+        }
+        db_manager.image_repo.get_image_annotation_metadata.return_value = {
+            "tags": [{"tag": "new_tag"}],
+            "tags_text": "new_tag",
+        }
+        state_manager.set_db_manager(db_manager)
+        state_manager.prefetch_annotations([1])
+
+        state_manager.invalidate_annotations([1])
+        assert 1 not in state_manager.annotation_snapshot
+
+        state_manager.set_current_image(1)
+        assert state_manager.get_image_by_id(1)["tags_text"] == "new_tag"
+
+    def test_get_annotations_fetches_only_missing(self, state_manager):
+        """get_annotations はスナップショット未登録分だけを一括取得する"""
+        db_manager = Mock()
+        db_manager.image_repo.get_image_annotation_metadata_batch.return_value = {
+            2: {"tags": [], "score_value": 7.0}
+        }
+        state_manager.set_db_manager(db_manager)
+        state_manager.annotation_snapshot.put(1, {"tags": [], "score_value": 5.0})
+
+        result = state_manager.get_annotations([1, 2])
+
+        db_manager.image_repo.get_image_annotation_metadata_batch.assert_called_once_with([2])
+        assert result[1]["score_value"] == 5.0
+        assert result[2]["score_value"] == 7.0
+
+    def test_clear_dataset_clears_snapshot(self, state_manager):
+        """データセットクリアでスナップショットも破棄される"""
+        state_manager.annotation_snapshot.put(1, {"tags": []})
+
+        state_manager.clear_dataset()
+
+        assert len(state_manager.annotation_snapshot) == 0
+
     # === Issue #967: 全件コピーを伴わない軽量アクセサ ===
 
     def test_count_accessors(self, state_manager, sample_image_metadata):
@@ -6,14 +6,15 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from lorairo.gui.state.dataset_state import DatasetStateManager
 from lorairo.gui.state.staging_state import StagingStateManager
 
 
 def _dsm_with(metadata_by_id: dict[int, dict[str, str]], selected: list[int] | None = None) -> MagicMock:
-    """get_image_by_id / selected_image_ids を備えた DatasetStateManager モックを返す。"""
+    """get_image_by_id / 表示順の選択 ID を備えた DatasetStateManager モックを返す。"""
     dsm = MagicMock()
     dsm.get_image_by_id.side_effect = lambda image_id: metadata_by_id.get(image_id)
-    dsm.selected_image_ids = selected or []
+    dsm.selected_image_ids_in_display_order.return_value = selected or []
     return dsm
 
 
@@ -86,6 +87,21 @@ def test_add_selected_images_uses_dataset_state_selection(metadata):
     assert manager.get_image_ids() == [2, 4]
 
 
+@pytest.mark.unit
+def test_add_selected_images_follows_search_result_order():
+    dsm = DatasetStateManager()
+    dsm.update_from_search_results(
+        [{"id": image_id, "stored_image_path": f"/data/{image_id}.webp"} for image_id in (30, 10, 20)]
+    )
+    dsm.set_selected_images([10, 30])
+    manager = StagingStateManager()
+    manager.set_dataset_state_manager(dsm)
+
+    manager.add_selected_images()
+
+    assert manager.get_image_ids() == [30, 10]
+
+
 @pytest.mark.unit
 def test_max_staging_images_cap():
     big_metadata = {i: {"stored_image_path": f"/d/{i}.webp"} for i in range(1, 600)}
@@ -12,12 +12,14 @@ orientation 維持 (#865)・パネルトグル・入口 Signal・MainWindow 連
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QSplitter, QWidget
 
+from lorairo.gui.services.image_db_write_service import ManualEditFlushResult
+from lorairo.gui.services.write_behind_queue import WriteBehindQueue
 from lorairo.gui.state.dataset_state import DatasetStateManager
 from lorairo.gui.state.staging_state import StagingStateManager
 from lorairo.gui.tab.search_tab import SearchTabWidget
@@ -56,6 +58,16 @@ def dataset_state_manager() -> DatasetStateManager:
     return DatasetStateManager()
 
 
+def _use_mock_write_service(tab: SearchTabWidget, result: ManualEditFlushResult) -> Mock:
+    """書込サービスを Mock に差し替え、write-behind キューもそれに付け替える。"""
+    service = Mock()
+    service.apply_manual_edits.return_value = result
+    tab._image_db_write_service = service
+    tab._write_queue = WriteBehindQueue(service, parent=tab)
+    tab._write_queue.flushed.connect(tab._on_edits_flushed)
+    return service
+
+
 @pytest.fixture
 def tab(
     qtbot,
@@ -289,28 +301,29 @@ def test_show_quick_tag_dialog_empty_ids_noop(tab: SearchTabWidget, monkeypatch)
 
 @pytest.mark.gui
 def test_handle_quick_tag_add_success_emits_status(tab: SearchTabWidget, qtbot) -> None:
-    """書込成功で status_message を emit し dataset キャッシュを更新する (#896)。"""
-    tab._image_db_write_service = Mock()
-    tab._image_db_write_service.add_tag_batch.return_value = True
+    """書込確定で status_message を emit し dataset キャッシュを更新する (#896)。"""
+    service = _use_mock_write_service(
+        tab, ManualEditFlushResult(written_image_ids=[1, 2], added_tags=["portrait"])
+    )
     tab._dataset_state_manager = Mock()
 
     with qtbot.waitSignal(tab.status_message, timeout=1000) as blocker:
         tab._handle_quick_tag_add([1, 2], "portrait")
 
     assert "portrait" in blocker.args[0]
-    tab._image_db_write_service.add_tag_batch.assert_called_once_with([1, 2], "portrait")
+    service.apply_manual_edits.assert_called_once_with({}, {}, {"portrait": [1, 2]})
     tab._dataset_state_manager.refresh_images.assert_called_once_with([1, 2])
 
 
 @pytest.mark.gui
 def test_handle_quick_tag_add_failure_shows_critical(tab: SearchTabWidget, monkeypatch) -> None:
     """書込失敗で QMessageBox.critical を表示する (#896)。"""
-    tab._image_db_write_service = Mock()
-    tab._image_db_write_service.add_tag_batch.return_value = False
+    _use_mock_write_service(tab, ManualEditFlushResult(failed_tags=["x"]))
     calls: list[bool] = []
     monkeypatch.setattr("lorairo.gui.tab.search_tab.show_critical", lambda *a, **k: calls.append(True))
 
     tab._handle_quick_tag_add([1], "x")
+    tab.flush_pending_edits()
 
     assert calls == [True]
 
@@ -381,37 +394,114 @@ class TestSelectionToDetails:
 
         tab._handle_selection_changed_for_rating([1, 2, 3])
 
+        widget._rating_score_widget.populate_from_selection.assert_called_once()
+        call = widget._rating_score_widget.populate_from_selection.call_args
+        assert call.args == ([1, 2, 3], tab._db_manager)
+        # DSM 接続時は共有アノテーションスナップショット経由の取得結果を渡す
+        assert "metadata_by_id" in call.kwargs
+
+    def test_multiple_selection_uses_annotation_snapshot(self, tab: SearchTabWidget) -> None:
+        widget = Mock()
+        tab._selected_image_details_widget = widget
+        tab._db_manager = Mock()
+        tab._dataset_state_manager = Mock()
+        tab._dataset_state_manager.get_annotations.return_value = {1: {"score_value": 5.0}}
+
+        tab._handle_selection_changed_for_rating([1, 2])
+
+        tab._dataset_state_manager.get_annotations.assert_called_once_with([1, 2])
         widget._rating_score_widget.populate_from_selection.assert_called_once_with(
-            [1, 2, 3], tab._db_manager
+            [1, 2], tab._db_manager, metadata_by_id={1: {"score_value": 5.0}}
         )
 
 
-# == 7. rating / score 編集 (ImageDBWriteService 経由) =========================
+# == 7. rating / score 編集 (write-behind キュー / ImageDBWriteService 経由) ===
 
 
 @pytest.mark.gui
 class TestRatingScoreEditing:
-    """詳細パネル編集シグナルが ImageDBWriteService 経由で書き込まれる配線の検証。"""
+    """詳細パネル編集シグナルが write-behind キュー経由でまとめて書き込まれる配線の検証。"""
 
     def test_rating_changed_writes_and_refreshes(self, tab: SearchTabWidget) -> None:
-        tab._image_db_write_service = Mock()
-        tab._image_db_write_service.update_rating.return_value = True
+        service = _use_mock_write_service(tab, ManualEditFlushResult(written_image_ids=[5]))
         tab._dataset_state_manager = Mock()
 
         tab._handle_rating_changed(5, "PG")
+        service.apply_manual_edits.assert_not_called()  # キー操作ごとには書き込まない
+        tab.flush_pending_edits()
 
-        tab._image_db_write_service.update_rating.assert_called_once_with(5, "PG")
-        tab._dataset_state_manager.refresh_image.assert_called_once_with(5)
+        service.apply_manual_edits.assert_called_once_with({5: "PG"}, {}, {})
+        tab._dataset_state_manager.refresh_images.assert_called_once_with([5])
 
     def test_score_changed_writes_and_refreshes(self, tab: SearchTabWidget) -> None:
-        tab._image_db_write_service = Mock()
-        tab._image_db_write_service.update_score.return_value = True
+        service = _use_mock_write_service(tab, ManualEditFlushResult(written_image_ids=[5]))
         tab._dataset_state_manager = Mock()
 
         tab._handle_score_changed(5, 80)
+        tab.flush_pending_edits()
+
+        service.apply_manual_edits.assert_called_once_with({}, {5: 80}, {})
+        tab._dataset_state_manager.refresh_images.assert_called_once_with([5])
+
+    def test_queued_edits_update_cache_before_write(self, tab: SearchTabWidget) -> None:
+        service = _use_mock_write_service(tab, ManualEditFlushResult(written_image_ids=[5]))
+        tab._dataset_state_manager = Mock()
+
+        tab._handle_rating_changed(5, "PG")
+        tab._handle_score_changed(5, 80)
+
+        service.apply_manual_edits.assert_not_called()
+        assert tab._dataset_state_manager.apply_manual_edit.call_args_list == [
+            call(5, rating="PG"),
+            call(5, score=0.8),
+        ]
+
+    def test_rapid_edits_are_coalesced_into_one_write(self, tab: SearchTabWidget) -> None:
+        service = _use_mock_write_service(tab, ManualEditFlushResult(written_image_ids=[5, 6]))
+
+        tab._handle_rating_changed(5, "PG")
+        tab._handle_rating_changed(5, "R")
+        tab._handle_rating_changed(6, "X")
+        tab._handle_score_changed(5, 80)
+        tab.flush_pending_edits()
+
+        service.apply_manual_edits.assert_called_once_with({5: "R", 6: "X"}, {5: 80}, {})
+
+    def test_pending_edits_flush_before_search(self, tab: SearchTabWidget) -> None:
+        service = _use_mock_write_service(tab, ManualEditFlushResult(written_image_ids=[5]))
+        tab._handle_rating_changed(5, "PG")
+
+        tab._filter_search_panel._on_search_requested()
+
+        service.apply_manual_edits.assert_called_once_with({5: "PG"}, {}, {})
+
+    def test_batch_rating_flushes_pending_edits_first(self, tab: SearchTabWidget) -> None:
+        service = _use_mock_write_service(tab, ManualEditFlushResult(written_image_ids=[1]))
+        service.update_rating_batch.return_value = True
+        calls: list[str] = []
+        service.apply_manual_edits.side_effect = lambda *a: (
+            calls.append("queued") or ManualEditFlushResult()
+        )
+        service.update_rating_batch.side_effect = lambda *a: calls.append("batch") or True
+
+        tab._handle_rating_changed(1, "PG")
+        tab._handle_batch_rating_changed([1, 2], "X")
+
+        assert calls == ["queued", "batch"]
+
+    def test_batch_rating_is_skipped_while_queued_edits_cannot_be_written(
+        self, tab: SearchTabWidget
+    ) -> None:
+        service = _use_mock_write_service(tab, ManualEditFlushResult())
+        tab._write_queue = Mock(is_flushing=True, pending_count=1)
+        messages: list[str] = []
+        tab.status_message.connect(messages.append)
+
+        tab._handle_batch_rating_changed([1, 2], "X")
 
-        tab._image_db_write_service.update_score.assert_called_once_with(5, 80)
-        tab._dataset_state_manager.refresh_image.assert_called_once_with(5)
+        tab._write_queue.flush_now.assert_called_once_with()
+        service.update_rating_batch.assert_not_called()
+        assert len(messages) == 1
 
     def test_batch_rating_changed_writes_batch(self, tab: SearchTabWidget) -> None:
         tab._image_db_write_service = Mock()
@@ -486,12 +576,13 @@ class TestEntrySignals:
 
     def test_stage_button_emits_with_selected_ids(self, tab: SearchTabWidget, qtbot) -> None:
         tab._dataset_state_manager = Mock()
-        tab._dataset_state_manager.selected_image_ids = [3, 4]
+        # 表示順 (ID 昇順ではない) のまま渡す
+        tab._dataset_state_manager.selected_image_ids_in_display_order.return_value = [4, 3]
 
         with qtbot.waitSignal(tab.stage_to_annotation_requested, timeout=1000) as blocker:
             tab.pushButtonStageToBatchTag.click()
 
-        assert blocker.args == [[3, 4]]
+        assert blocker.args == [[4, 3]]
 
 
 # == 10. MainWindow → タブ スロット ===========================================
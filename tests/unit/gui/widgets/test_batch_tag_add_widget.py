@@ -110,8 +110,8 @@ class TestStagingListManagement:
             {"id": 2, "stored_image_path": "/path/to/image2.jpg"},
             {"id": 3, "stored_image_path": "/path/to/image3.jpg"},
         ]
-        state_manager._all_images = mock_images
-        state_manager._selected_image_ids = [1, 2]
+        state_manager.update_from_search_results(mock_images)
+        state_manager.set_selected_images([1, 2])
 
         widget.set_dataset_state_manager(state_manager)
         return widget, state_manager
@@ -166,8 +166,8 @@ class TestStagingListManagement:
         state_manager = DatasetStateManager()
         # Create 550 mock images (exceeds limit)
         mock_images = [{"id": i, "stored_image_path": f"/path/to/image{i}.jpg"} for i in range(1, 551)]
-        state_manager._all_images = mock_images
-        state_manager._selected_image_ids = list(range(1, 551))  # Select all 550
+        state_manager.update_from_search_results(mock_images)
+        state_manager.set_selected_images(list(range(1, 551)))  # Select all 550
 
         widget.set_dataset_state_manager(state_manager)
 
@@ -248,8 +248,8 @@ class TestTagAddRequest:
             {"id": 1, "stored_image_path": "/path/to/image1.jpg"},
             {"id": 2, "stored_image_path": "/path/to/image2.jpg"},
         ]
-        state_manager._all_images = mock_images
-        state_manager._selected_image_ids = [1, 2]
+        state_manager.update_from_search_results(mock_images)
+        state_manager.set_selected_images([1, 2])
 
         widget.set_dataset_state_manager(state_manager)
         widget._on_add_selected_clicked()  # Add to staging
@@ -350,8 +350,8 @@ class TestStagingCountLabel:
 
         state_manager = DatasetStateManager()
         mock_images = [{"id": 1, "stored_image_path": "/path/to/image1.jpg"}]
-        state_manager._all_images = mock_images
-        state_manager._selected_image_ids = [1]
+        state_manager.update_from_search_results(mock_images)
+        state_manager.set_selected_images([1])
 
         widget.set_dataset_state_manager(state_manager)
 
@@ -371,8 +371,8 @@ class TestStagingCountLabel:
 
         state_manager = DatasetStateManager()
         mock_images = [{"id": 1, "stored_image_path": "/path/to/image1.jpg"}]
-        state_manager._all_images = mock_images
-        state_manager._selected_image_ids = [1]
+        state_manager.update_from_search_results(mock_images)
+        state_manager.set_selected_images([1])
 
         widget.set_dataset_state_manager(state_manager)
 
@@ -396,8 +396,8 @@ class TestEdgeCases:
         qtbot.addWidget(widget)
 
         state_manager = DatasetStateManager()
-        state_manager._all_images = []  # No images in state
-        state_manager._selected_image_ids = [999]  # Non-existent ID
+        state_manager.update_from_search_results([])  # No images in state
+        state_manager.set_selected_images([999])  # Non-existent ID
 
         widget.set_dataset_state_manager(state_manager)
 
@@ -417,18 +417,18 @@ class TestEdgeCases:
             {"id": 2, "stored_image_path": "/path/to/image2.jpg"},
             {"id": 3, "stored_image_path": "/path/to/image3.jpg"},
         ]
-        state_manager._all_images = mock_images
+        state_manager.update_from_search_results(mock_images)
 
         widget.set_dataset_state_manager(state_manager)
 
         # Add images in different batches
-        state_manager._selected_image_ids = [1]
+        state_manager.set_selected_images([1])
         widget._on_add_selected_clicked()
 
-        state_manager._selected_image_ids = [3]
+        state_manager.set_selected_images([3])
         widget._on_add_selected_clicked()
 
-        state_manager._selected_image_ids = [2]
+        state_manager.set_selected_images([2])
         widget._on_add_selected_clicked()
 
         # Order should be [1, 3, 2] (insertion order preserved)
@@ -0,0 +1,67 @@
+"""QueryProfileDialog単体テスト
+
+計測の有効化切替とステートメント一覧・クエリプラン表示を検証する。
+"""
+
+import pytest
+from sqlalchemy import text
+
+from lorairo.database.db_core import create_db_engine
+from lorairo.database.query_profiler import QueryProfiler
+from lorairo.gui.widgets.query_profile_dialog import QueryProfileDialog
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'profile.sqlite'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, size INTEGER)"))
+    profiler = QueryProfiler()
+    profiler.register_engine(engine)
+    profiler.engine = engine  # type: ignore[attr-defined]
+    yield profiler
+    profiler.disable()
+    engine.dispose()
+
+
+def _run_query(profiler: QueryProfiler) -> None:
+    with profiler.engine.connect() as connection:  # type: ignore[attr-defined]
+        connection.execute(text("SELECT id FROM items WHERE size = 3")).all()
+
+
+@pytest.mark.gui
+def test_enable_checkbox_toggles_profiling_and_lists_statements(qtbot, profiler: QueryProfiler) -> None:
+    dialog = QueryProfileDialog(profiler=profiler)
+    qtbot.addWidget(dialog)
+    dialog.slow_ms_spin.setValue(0.0)
+    assert dialog.table.rowCount() == 0
+
+    dialog.enable_checkbox.setChecked(True)
+    _run_query(profiler)
+    dialog.refresh()
+
+    assert profiler.enabled
+    assert dialog.table.rowCount() == 1
+    assert dialog.table.item(0, 7).text() == "SELECT id FROM items WHERE size = ?"
+    assert dialog.table.item(0, 6).text() == "items"
+    assert "items" in dialog.status_label.text()
+
+    dialog.table.selectRow(0)
+    assert "SCAN items" in dialog.detail_view.toPlainText()
+
+    dialog.enable_checkbox.setChecked(False)
+    assert not profiler.enabled
+
+
+@pytest.mark.gui
+def test_reset_clears_statements(qtbot, profiler: QueryProfiler) -> None:
+    profiler.enable(slow_ms=0)
+    _run_query(profiler)
+    dialog = QueryProfileDialog(profiler=profiler)
+    qtbot.addWidget(dialog)
+    assert dialog.table.rowCount() == 1
+
+    dialog.reset_button.click()
+
+    assert dialog.table.rowCount() == 0
+    assert dialog.detail_view.toPlainText() == ""
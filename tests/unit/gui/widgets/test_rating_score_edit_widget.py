@@ -368,6 +368,18 @@ class TestRatingScoreEditWidgetBatchMode:
         assert widget.ui.sliderScore.value() == 850
         assert widget.ui.labelScoreValue.text() == "8.50"
 
+    def test_populate_from_selection_uses_prefetched_metadata(self, widget, mock_db_manager):
+        """取得済みメタデータが渡された画像は DB を照会しない"""
+        mock_db_manager.image_repo.get_image_metadata.return_value = {"rating": "R", "score_value": 8.5}
+
+        widget.populate_from_selection(
+            [1, 2], mock_db_manager, metadata_by_id={1: {"rating": "R", "score_value": 8.5}}
+        )
+
+        mock_db_manager.image_repo.get_image_metadata.assert_called_once_with(2)
+        assert widget.ui.comboBoxRating.currentText() == "R"
+        assert widget.ui.sliderScore.value() == 850
+
     def test_populate_from_selection_different_scores(self, widget, mock_db_manager):
         """異なるScoreの場合、デフォルト値が表示される"""
         mock_db_manager.image_repo.get_image_metadata.side_effect = [
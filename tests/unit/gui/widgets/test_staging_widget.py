@@ -155,8 +155,8 @@ class TestStagingListManagement:
             {"id": 2, "stored_image_path": "/path/to/image2.jpg"},
             {"id": 3, "stored_image_path": "/path/to/image3.jpg"},
         ]
-        state_manager._all_images = mock_images
-        state_manager._selected_image_ids = [1, 2]
+        state_manager.update_from_search_results(mock_images)
+        state_manager.set_selected_images([1, 2])
 
         widget.set_dataset_state_manager(state_manager)
         return widget, state_manager
@@ -217,8 +217,8 @@ class TestStagingListManagement:
         state_manager = DatasetStateManager()
         # 550枚のモック画像
         mock_images = [{"id": i, "stored_image_path": f"/path/to/image{i}.jpg"} for i in range(1, 551)]
-        state_manager._all_images = mock_images
-        state_manager._selected_image_ids = list(range(1, 551))
+        state_manager.update_from_search_results(mock_images)
+        state_manager.set_selected_images(list(range(1, 551)))
 
         widget.set_dataset_state_manager(state_manager)
 
@@ -297,7 +297,7 @@ class TestAccessors:
             {"id": 1, "stored_image_path": "/path/to/image1.jpg"},
             {"id": 2, "stored_image_path": "/path/to/image2.jpg"},
         ]
-        state_manager._all_images = mock_images
+        state_manager.update_from_search_results(mock_images)
 
         widget.set_dataset_state_manager(state_manager)
         widget.add_image_ids([1, 2])
@@ -351,7 +351,7 @@ class TestSignals:
             {"id": 1, "stored_image_path": "/path/to/image1.jpg"},
             {"id": 2, "stored_image_path": "/path/to/image2.jpg"},
         ]
-        state_manager._all_images = mock_images
+        state_manager.update_from_search_results(mock_images)
 
         widget.set_dataset_state_manager(state_manager)
         return widget
@@ -413,7 +413,7 @@ class TestCountLabel:
 
         state_manager = DatasetStateManager()
         mock_images = [{"id": 1, "stored_image_path": "/path/to/image1.jpg"}]
-        state_manager._all_images = mock_images
+        state_manager.update_from_search_results(mock_images)
 
         widget.set_dataset_state_manager(state_manager)
         return widget
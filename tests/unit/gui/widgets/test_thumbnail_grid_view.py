@@ -0,0 +1,147 @@
+"""仮想化サムネイルグリッド (ThumbnailListModel / ThumbnailGridView) のユニットテスト。"""
+
+import pytest
+from PySide6.QtCore import QItemSelectionModel, QSize, Qt
+from PySide6.QtGui import QPixmap
+
+from lorairo.gui.state.dataset_state import DatasetStateManager
+from lorairo.gui.widgets.thumbnail_grid_view import IMAGE_ID_ROLE, ThumbnailGridView, ThumbnailListModel
+
+pytestmark = [pytest.mark.unit, pytest.mark.gui]
+
+
+def _pixmap(size: int = 16) -> QPixmap:
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.green)
+    return pixmap
+
+
+class TestThumbnailListModel:
+    @pytest.fixture
+    def model(self, qtbot):
+        model = ThumbnailListModel(cache_capacity=3, fetch_batch_size=2)
+        model.set_image_ids([10, 20, 30, 40, 50])
+        return model
+
+    def test_rows_expose_image_ids(self, model):
+        assert model.rowCount() == 5
+        assert model.index(2).data(IMAGE_ID_ROLE) == 30
+        assert model.row_of(40) == 3
+        assert model.row_of(99) is None
+
+    def test_cache_miss_requests_in_batches(self, model, qtbot):
+        requested: list[list[int]] = []
+        model.thumbnails_requested.connect(requested.append)
+
+        for row in range(3):
+            assert model.index(row).data(Qt.ItemDataRole.DecorationRole) is None
+        # 同じ行を再描画しても二重に要求しない
+        model.index(0).data(Qt.ItemDataRole.DecorationRole)
+
+        qtbot.waitUntil(lambda: len(requested) == 2)
+        assert requested == [[10, 20], [30]]
+
+    def test_set_thumbnails_serves_pixmap_and_emits_data_changed(self, model, qtbot):
+        with qtbot.waitSignal(model.dataChanged) as blocker:
+            model.set_thumbnails([(20, _pixmap()), (40, _pixmap()), (99, _pixmap())])
+
+        top_left, bottom_right, _roles = blocker.args
+        assert (top_left.row(), bottom_right.row()) == (1, 3)
+        assert isinstance(model.index(1).data(Qt.ItemDataRole.DecorationRole), QPixmap)
+        assert model.cached_count == 2
+
+    def test_lru_eviction_keeps_recently_drawn(self, model):
+        model.set_thumbnails([(10, _pixmap()), (20, _pixmap()), (30, _pixmap())])
+        # 10 を描画して最近使用にする
+        model.index(0).data(Qt.ItemDataRole.DecorationRole)
+
+        model.set_thumbnails([(40, _pixmap())])
+
+        assert model.cached_count == 3
+        assert model.index(0).data(Qt.ItemDataRole.DecorationRole) is not None
+        assert model.index(1).data(Qt.ItemDataRole.DecorationRole) is None
+
+    def test_discarded_requests_are_requested_again(self, model, qtbot):
+        requested: list[list[int]] = []
+        model.thumbnails_requested.connect(requested.append)
+        model.index(0).data(Qt.ItemDataRole.DecorationRole)
+        qtbot.waitUntil(lambda: requested == [[10]])
+
+        model.discard_requests([10])
+        model.index(0).data(Qt.ItemDataRole.DecorationRole)
+
+        qtbot.waitUntil(lambda: requested == [[10], [10]])
+
+
+class TestThumbnailGridView:
+    @pytest.fixture
+    def view_with_state(self, qtbot):
+        state = DatasetStateManager()
+        state.update_from_search_results(
+            [{"id": i, "stored_image_path": f"/tmp/{i}.png"} for i in (1, 2, 3)]
+        )
+        model = ThumbnailListModel()
+        model.set_image_ids([1, 2, 3])
+        view = ThumbnailGridView(model, QSize(64, 64), dataset_state=state)
+        qtbot.addWidget(view)
+        return view, state
+
+    def test_view_selection_updates_dataset_state(self, view_with_state):
+        view, state = view_with_state
+        model = view.thumbnail_model
+
+        view.selectionModel().select(model.index(0), QItemSelectionModel.SelectionFlag.Select)
+        view.selectionModel().select(model.index(2), QItemSelectionModel.SelectionFlag.Select)
+
+        assert sorted(state.selected_image_ids) == [1, 3]
+
+    def test_state_selection_updates_view(self, view_with_state):
+        view, state = view_with_state
+
+        state.set_selected_images([2])
+
+        rows = [index.row() for index in view.selectionModel().selectedIndexes()]
+        assert rows == [1]
+
+    def test_state_selection_merges_contiguous_rows(self, qtbot):
+        image_ids = list(range(1, 1001))
+        state = DatasetStateManager()
+        state.update_from_search_results(
+            [{"id": i, "stored_image_path": f"/tmp/{i}.png"} for i in image_ids]
+        )
+        model = ThumbnailListModel()
+        model.set_image_ids(image_ids)
+        view = ThumbnailGridView(model, QSize(64, 64), dataset_state=state)
+        qtbot.addWidget(view)
+
+        state.set_selected_images(image_ids)
+        assert view.selectionModel().selection().count() == 1
+
+        state.set_selected_images([5, 1, 2, 3, 7, 6])
+        ranges = [(r.top(), r.bottom()) for r in view.selectionModel().selection()]
+        assert sorted(ranges) == [(0, 2), (4, 6)]
+
+    def test_visible_row_range(self, qtbot):
+        model = ThumbnailListModel()
+        model.set_image_ids(list(range(1, 101)))
+        view = ThumbnailGridView(model, QSize(64, 64))
+        qtbot.addWidget(view)
+        assert view.visible_row_range() is None  # 非表示
+
+        view.resize(64 * 4 + view.verticalScrollBar().sizeHint().width() + 8, 64 * 2 + 8)
+        view.show()
+        qtbot.waitExposed(view)
+        view.doItemsLayout()
+
+        first_row, last_row = view.visible_row_range()
+        assert first_row == 0
+        assert last_row == 11  # 4 列 x 3 段 (3 段目は一部だけ見えている)
+
+    def test_set_thumbnail_size_updates_grid(self, view_with_state):
+        view, _ = view_with_state
+
+        view.set_thumbnail_size(QSize(200, 200))
+
+        assert view.gridSize() == QSize(200, 200)
+        assert view.thumbnail_delegate.thumbnail_size == QSize(200, 200)
+        assert view.visualRect(view.thumbnail_model.index(0)).size() == QSize(200, 200)
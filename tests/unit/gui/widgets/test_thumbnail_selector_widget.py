@@ -727,6 +727,123 @@ class TestThumbnailSelectorWidgetPagination:
         assert widget._request_id_to_worker_id == {}
 
 
+class TestThumbnailSelectorWidgetVirtualGrid:
+    """仮想グリッド表示 (enable_virtual_grid) の統合テスト"""
+
+    @pytest.fixture
+    def widget_with_state(self, qtbot):
+        state = DatasetStateManager()
+        widget = ThumbnailSelectorWidget(dataset_state=state)
+        widget.enable_virtual_grid()
+        qtbot.addWidget(widget)
+        return widget, state
+
+    @staticmethod
+    def _thumbnail_result(request_id: str, image_ids: list[int]) -> ThumbnailLoadResult:
+        qimage = QImage(64, 64, QImage.Format.Format_RGB32)
+        qimage.fill(0x00FF00)
+        return ThumbnailLoadResult(
+            loaded_thumbnails=[(image_id, qimage) for image_id in image_ids],
+            failed_count=0,
+            total_count=len(image_ids),
+            processing_time=0.01,
+            image_metadata=[],
+            request_id=request_id,
+            page_num=0,
+            image_ids=image_ids,
+        )
+
+    def test_search_populates_model_without_pagination(self, widget_with_state):
+        widget, _ = widget_with_state
+        worker_service = Mock()
+        search_result = TestThumbnailSelectorWidgetPagination._build_search_result(250)
+
+        widget.initialize_pagination_search(search_result=search_result, worker_service=worker_service)
+
+        grid = widget.virtual_grid
+        assert grid is not None
+        assert grid.thumbnail_model.rowCount() == 250
+        assert grid.isHidden() is False
+        assert widget.graphics_view.isHidden() is True
+        assert widget.pagination_nav is None or widget.pagination_nav.isHidden() is True
+        assert widget.labelThumbnailCount.text() == "画像: 250件"
+
+    def test_requested_thumbnails_are_loaded_into_model(self, widget_with_state):
+        widget, _ = widget_with_state
+        worker_service = Mock()
+        worker_service.start_thumbnail_page_load.return_value = "thumbnail_virtual_1"
+        search_result = TestThumbnailSelectorWidgetPagination._build_search_result(3)
+        widget.initialize_pagination_search(search_result=search_result, worker_service=worker_service)
+
+        widget._on_virtual_thumbnails_requested([1, 2])
+
+        kwargs = worker_service.start_thumbnail_page_load.call_args.kwargs
+        assert kwargs["image_ids"] == [1, 2]
+        assert kwargs["cancel_previous"] is False
+        widget.handle_thumbnail_page_result(self._thumbnail_result(kwargs["request_id"], [1, 2]))
+
+        assert widget.virtual_grid is not None
+        assert widget.virtual_grid.thumbnail_model.cached_count == 2
+        assert widget._virtual_request_ids == {}
+        assert widget._request_id_to_worker_id == {}
+
+    def test_oldest_request_is_cancelled_over_limit(self, widget_with_state):
+        widget, _ = widget_with_state
+        worker_service = Mock()
+        worker_service.start_thumbnail_page_load.side_effect = [f"worker_{i}" for i in range(10)]
+        search_result = TestThumbnailSelectorWidgetPagination._build_search_result(10)
+        widget.initialize_pagination_search(search_result=search_result, worker_service=worker_service)
+
+        for image_id in range(1, widget._VIRTUAL_MAX_PENDING_REQUESTS + 2):
+            widget._on_virtual_thumbnails_requested([image_id])
+
+        worker_service.cancel_thumbnail_load.assert_called_once_with(
+            "worker_0", reason=CancelReason.PREFETCH_REPLACED
+        )
+        assert len(widget._virtual_request_ids) == widget._VIRTUAL_MAX_PENDING_REQUESTS
+
+    def test_visible_requests_are_not_cancelled_over_limit(self, widget_with_state):
+        """1 回の描画で上限を超えるバッチが要求されても、見えている行の要求は残す"""
+        widget, _ = widget_with_state
+        worker_service = Mock()
+        worker_service.start_thumbnail_page_load.side_effect = [f"worker_{i}" for i in range(10)]
+        search_result = TestThumbnailSelectorWidgetPagination._build_search_result(10)
+        widget.initialize_pagination_search(search_result=search_result, worker_service=worker_service)
+        assert widget.virtual_grid is not None
+
+        with patch.object(widget.virtual_grid, "visible_row_range", return_value=(0, 5)):
+            # 画像 8 (行 7) は画面外、画像 1-5 (行 0-4) は表示範囲内
+            for image_id in [8, 1, 2, 3, 4, 5]:
+                widget._on_virtual_thumbnails_requested([image_id])
+
+        # 画面外の要求だけをキャンセルし、見えている要求は上限を超えても保持する
+        worker_service.cancel_thumbnail_load.assert_called_once_with(
+            "worker_0", reason=CancelReason.PREFETCH_REPLACED
+        )
+        assert sorted(ids[0] for ids in widget._virtual_request_ids.values()) == [1, 2, 3, 4, 5]
+
+    def test_select_all_and_selected_paths_cover_all_results(self, widget_with_state):
+        widget, state = widget_with_state
+        search_result = TestThumbnailSelectorWidgetPagination._build_search_result(150)
+        widget.initialize_pagination_search(search_result=search_result, worker_service=Mock())
+
+        widget._select_all_items()
+
+        assert len(state.selected_image_ids) == 150
+        assert widget.get_selected_images()[0] == Path("/tmp/image_1.png")
+
+    def test_explicit_paths_switch_back_to_graphics_view(self, widget_with_state):
+        widget, _ = widget_with_state
+        search_result = TestThumbnailSelectorWidgetPagination._build_search_result(3)
+        widget.initialize_pagination_search(search_result=search_result, worker_service=Mock())
+
+        widget.load_thumbnails_from_paths([])
+
+        assert widget.virtual_grid is not None
+        assert widget.virtual_grid.isHidden() is True
+        assert widget.graphics_view.isHidden() is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
 
@@ -593,6 +593,7 @@ class TestSendSelectedToBatchTag:
         mock_window = Mock()
         mock_window.dataset_state_manager = Mock()
         mock_window.dataset_state_manager.selected_image_ids = []
+        mock_window.dataset_state_manager.selected_image_ids_in_display_order.return_value = []
         mock_window.annotate_tab = Mock()
         # #869: サムネイルセレクタは search_tab.thumbnail_selector 経由 (直接参照は無い)
         with patch("lorairo.gui.window.main_window.QMessageBox") as mock_qmb:
@@ -605,6 +606,7 @@ class TestSendSelectedToBatchTag:
         mock_window = Mock()
         mock_window.dataset_state_manager = Mock()
         mock_window.dataset_state_manager.selected_image_ids = [7]
+        mock_window.dataset_state_manager.selected_image_ids_in_display_order.return_value = [7]
         mock_window.annotate_tab = Mock()
         mock_window.tabWidgetMainMode = Mock()
         mock_window.staging_state_manager.get_image_ids.return_value = [7]
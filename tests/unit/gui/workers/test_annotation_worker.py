@@ -1416,3 +1416,98 @@ class TestAnnotationWorkerStageProgress:
 
         assert captured == []
         assert result.total_images == 1
+
+
+class TestAnnotationWorkerConcurrentWebApi:
+    """annotation.concurrent_webapi 有効時の並列ディスパッチ経路"""
+
+    @staticmethod
+    def _db_manager(settings: dict) -> Mock:
+        db_manager = Mock()
+        db_manager.config_service.get_setting.side_effect = lambda section, key, default=None: (
+            settings.get(key, default) if section == "annotation" else default
+        )
+        db_manager.image_repo.get_phashes_by_filepaths.return_value = {}
+        db_manager.image_repo.get_image_ids_by_filepaths.return_value = {}
+        db_manager.image_repo.find_image_ids_by_phashes_multi.return_value = {}
+        return db_manager
+
+    @staticmethod
+    def _registry() -> Mock:
+        from lorairo.services.model_registry_protocol import ModelInfo
+
+        registry = Mock()
+        registry.get_available_models.return_value = [
+            ModelInfo("gpt-4o", "openai", ["tags"], "gpt-4o", True, None),
+            ModelInfo("wd-tagger", "local", ["tags"], "wd-tagger", False, None),
+        ]
+        return registry
+
+    @staticmethod
+    def _runner() -> Mock:
+        def execute_annotation(*, image_paths, litellm_model_ids, phash_list=None):
+            return {
+                f"phash-{path}": {model: {"tags": ["cat"], "error": None} for model in litellm_model_ids}
+                for path in image_paths
+            }
+
+        runner = Mock()
+        runner.execute_annotation.side_effect = execute_annotation
+        return runner
+
+    def test_streams_webapi_chunks_and_saves_each_pair_once(self, monkeypatch):
+        from lorairo.gui.workers import annotation_worker as aw_mod
+
+        save_service = Mock()
+        save_service.filter_refused_image_paths.side_effect = lambda paths: paths
+        save_service.save_annotation_results.side_effect = lambda results, **kwargs: SimpleNamespace(
+            success_count=len(results), skip_count=0, total_count=len(results)
+        )
+        monkeypatch.setattr(aw_mod, "AnnotationSaveService", lambda **kwargs: save_service)
+        runner = self._runner()
+        image_paths = [f"/path/img{i}.jpg" for i in range(3)]
+
+        worker = AnnotationWorker(
+            annotation_runner=runner,
+            image_paths=image_paths,
+            litellm_model_ids=["gpt-4o", "wd-tagger"],
+            db_manager=self._db_manager({"concurrent_webapi": True, "webapi_chunk_size": 2}),
+            model_registry=self._registry(),
+            run_options=SimpleNamespace(dry_run=False, rating_gate=False),
+        )
+
+        result = worker.execute()
+
+        webapi_calls = [
+            call.kwargs
+            for call in runner.execute_annotation.call_args_list
+            if call.kwargs["litellm_model_ids"] == ["gpt-4o"]
+        ]
+        assert sorted(len(call["image_paths"]) for call in webapi_calls) == [1, 2]
+        saved_pairs = [
+            (phash, model)
+            for call in save_service.save_annotation_results.call_args_list
+            for phash, annotations in call.args[0].items()
+            for model in annotations
+        ]
+        # WebAPI 分はチャンクごとに保存済み、最終保存はローカルモデル分のみ
+        assert sorted(saved_pairs) == sorted(
+            (f"phash-{path}", model) for path in image_paths for model in ("gpt-4o", "wd-tagger")
+        )
+        # チャンク保存 (2 + 1 pHash) と最終保存 (3 pHash) の合算
+        assert result.db_save_success == 3 + 3
+        assert set(result.results["phash-/path/img0.jpg"]) == {"gpt-4o", "wd-tagger"}
+
+    def test_disabled_setting_keeps_bulk_call(self, mock_annotation_runner):
+        worker = AnnotationWorker(
+            annotation_runner=mock_annotation_runner,
+            image_paths=["/path/img0.jpg"],
+            litellm_model_ids=["gpt-4o"],
+            db_manager=self._db_manager({"concurrent_webapi": False}),
+            model_registry=self._registry(),
+            run_options=SimpleNamespace(dry_run=False, rating_gate=False),
+        )
+
+        worker.execute()
+
+        mock_annotation_runner.execute_annotation.assert_called_once()
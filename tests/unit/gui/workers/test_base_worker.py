@@ -1,7 +1,7 @@
 # tests/unit/gui/workers/test_base_worker.py
 
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -413,7 +413,7 @@ class TestLoRAIroWorkerBaseUnhandledError:
 
     def test_run_records_error_to_db_when_db_manager_provided(self):
         """db_manager提供時、ハンドルされない例外がDBに記録される"""
-        mock_db = Mock()
+        mock_db = MagicMock()
         worker = ConcreteWorkerWithDb(db_manager=mock_db, should_fail=True)
 
         worker.run()
@@ -436,7 +436,7 @@ class TestLoRAIroWorkerBaseUnhandledError:
 
     def test_run_handles_save_error_record_secondary_failure(self):
         """save_error_record失敗（二次エラー）でもrun()は正常終了し error_occurred が発行される"""
-        mock_db = Mock()
+        mock_db = MagicMock()
         mock_db.save_error_record.side_effect = RuntimeError("DB障害")
         worker = ConcreteWorkerWithDb(db_manager=mock_db, should_fail=True)
         error_mock = Mock()
@@ -448,7 +448,7 @@ class TestLoRAIroWorkerBaseUnhandledError:
 
     def test_run_uses_operation_type_class_variable(self):
         """_OPERATION_TYPE クラス変数が operation_type として使われる"""
-        mock_db = Mock()
+        mock_db = MagicMock()
         worker = ConcreteWorkerWithDb(db_manager=mock_db, should_fail=True)
 
         worker.run()
@@ -458,7 +458,7 @@ class TestLoRAIroWorkerBaseUnhandledError:
 
     def test_run_does_not_double_record_when_error_already_recorded(self):
         """_error_already_recorded=True の場合、基底クラスは再記録しない"""
-        mock_db = Mock()
+        mock_db = MagicMock()
         worker = ConcreteWorkerPreRecords(db_manager=mock_db)
 
         worker.run()
@@ -467,7 +467,7 @@ class TestLoRAIroWorkerBaseUnhandledError:
 
     def test_run_treats_cancellation_as_non_error(self):
         """CancellationError はエラーシグナルやDB記録を発生させない"""
-        mock_db = Mock()
+        mock_db = MagicMock()
         worker = ConcreteWorkerCanceled(db_manager=mock_db)
         error_mock = Mock()
         canceled_mock = Mock()
@@ -504,6 +504,103 @@ class TestLoRAIroWorkerBaseUnhandledError:
         assert WorkerStatus.CANCELED in status_calls
 
 
+class TestLoRAIroWorkerBaseErrorRecordBuffering:
+    """execute() 中のエラーレコードのバッファリングとフラッシュ順序"""
+
+    def _db_with_scope(self, events: list[str]) -> Mock:
+        mock_db = Mock()
+        scope = MagicMock()
+        scope.__enter__.side_effect = lambda *args: events.append("enter")
+        scope.__exit__.side_effect = lambda *args: events.append("flush") or False
+        mock_db.buffered_error_records.return_value = scope
+        return mock_db
+
+    def test_flushes_before_finished(self):
+        events: list[str] = []
+        worker = ConcreteWorkerWithDb(db_manager=self._db_with_scope(events))
+        worker.finished.connect(lambda _result: events.append("finished"))
+
+        worker.run()
+
+        assert events == ["enter", "flush", "finished"]
+
+    def test_flushes_before_canceled(self):
+        events: list[str] = []
+        worker = ConcreteWorkerCanceled(db_manager=self._db_with_scope(events))
+        worker.canceled.connect(lambda: events.append("canceled"))
+
+        worker.run()
+
+        assert events == ["enter", "flush", "canceled"]
+
+    def test_unhandled_error_is_recorded_after_scope(self):
+        events: list[str] = []
+        mock_db = self._db_with_scope(events)
+        mock_db.save_error_record.side_effect = lambda **_kwargs: events.append("record")
+        worker = ConcreteWorkerWithDb(db_manager=mock_db, should_fail=True)
+        worker.error_occurred.connect(lambda _msg: events.append("error"))
+
+        worker.run()
+
+        assert events == ["enter", "flush", "record", "error"]
+
+
+class ConcreteWorkerWithStages(LoRAIroWorkerBase[str]):
+    """ステージ計測付きのテスト用ワーカー"""
+
+    def __init__(self, should_fail: bool = False):
+        super().__init__()
+        self.should_fail = should_fail
+
+    def execute(self) -> str:
+        with self.telemetry.stage("decode", items=2) as timing:
+            timing.bytes += 512
+        if self.should_fail:
+            raise RuntimeError("テスト例外")
+        return "done"
+
+
+class TestLoRAIroWorkerBaseTelemetry:
+    """ステージ別計測の発行テスト"""
+
+    def test_telemetry_emitted_before_finished(self):
+        worker = ConcreteWorkerWithStages()
+        order: list[str] = []
+        snapshots: list = []
+        worker.telemetry_ready.connect(
+            lambda snapshot: (order.append("telemetry"), snapshots.append(snapshot))
+        )
+        worker.finished.connect(lambda _result: order.append("finished"))
+
+        worker.run()
+
+        assert order == ["telemetry", "finished"]
+        decode = snapshots[0].get_stage("decode")
+        assert decode is not None
+        assert (decode.items, decode.bytes) == (2, 512)
+        assert worker.telemetry_snapshot is snapshots[0]
+        assert snapshots[0].profile is None
+
+    def test_telemetry_emitted_before_error(self):
+        worker = ConcreteWorkerWithStages(should_fail=True)
+        order: list[str] = []
+        worker.telemetry_ready.connect(lambda _snapshot: order.append("telemetry"))
+        worker.error_occurred.connect(lambda _error: order.append("error"))
+
+        worker.run()
+
+        assert order == ["telemetry", "error"]
+
+    def test_profiling_enabled_per_run(self):
+        worker = ConcreteWorkerWithStages()
+        worker.enable_profiling()
+
+        worker.run()
+
+        assert worker.telemetry_snapshot is not None
+        assert worker.telemetry_snapshot.profile
+
+
 class TestLoRAIroWorkerBaseAlias:
     """LoRAIroWorkerBase エイリアステスト"""
 
@@ -527,7 +624,7 @@ class TestSearchWorkerCancellation:
 
         from lorairo.gui.workers.search_worker import SearchWorker
 
-        mock_db = Mock()
+        mock_db = MagicMock()
         mock_conditions = MagicMock()
 
         worker = SearchWorker(db_manager=mock_db, search_conditions=mock_conditions)
@@ -7,6 +7,7 @@ from loguru import logger as loguru_logger
 
 from lorairo.gui.workers.manager import WorkerManager
 from lorairo.gui.workers.terminal import CancelReason, WorkerOutcome
+from lorairo.utils.stage_telemetry import TelemetrySnapshot
 
 
 @pytest.fixture
@@ -149,6 +150,20 @@ class TestWorkerManagerCancellation:
         finished_mock.assert_called_once_with("worker-1", {"ok": True})
         canceled_mock.assert_not_called()
 
+    def test_terminal_event_carries_worker_telemetry(self, manager):
+        manager.active_workers["worker-1"] = {"worker": Mock(), "thread": Mock(), "auto_cleanup": True}
+        terminal_mock = Mock()
+        manager.worker_terminal.connect(terminal_mock)
+        snapshot = TelemetrySnapshot(label="Worker", wall_seconds=1.0)
+
+        manager._on_worker_telemetry("worker-1", snapshot)
+        manager._on_worker_finished("worker-1", "ok")
+        # 終端後に届いた計測は無視される
+        manager._on_worker_telemetry("worker-1", snapshot)
+
+        event = terminal_mock.call_args.args[0]
+        assert event.telemetry is snapshot
+
     def test_error_after_cancel_request_wins_over_canceled(self, manager):
         manager.active_workers["worker-1"] = {"worker": Mock(), "thread": Mock(), "auto_cleanup": True}
         error_mock = Mock()
@@ -104,3 +104,34 @@ class TestThumbnailWorkerPaging:
         assert result.total_count == 2
         assert result.image_ids == [10, 20]
         assert [image_id for image_id, _ in result.loaded_thumbnails] == [10, 20]
+
+
+class TestThumbnailWorkerReadScaled:
+    """縮小読み込み (_read_scaled) のテスト。"""
+
+    def test_large_jpeg_is_read_at_thumbnail_size(self, tmp_path):
+        from PIL import Image
+
+        path = tmp_path / "large.jpg"
+        Image.new("RGB", (2000, 1000), color=(200, 10, 10)).save(path, "JPEG")
+        worker = ThumbnailWorker(
+            search_result=_build_search_result([]),
+            thumbnail_size=QSize(128, 128),
+            db_manager=Mock(),
+        )
+
+        qimage = worker._read_scaled(path)
+
+        assert not qimage.isNull()
+        assert (qimage.width(), qimage.height()) == (128, 64)
+
+    def test_unreadable_file_returns_null_image(self, tmp_path):
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"not an image")
+        worker = ThumbnailWorker(
+            search_result=_build_search_result([]),
+            thumbnail_size=QSize(128, 128),
+            db_manager=Mock(),
+        )
+
+        assert worker._read_scaled(path).isNull()
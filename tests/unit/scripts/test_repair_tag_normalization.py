@@ -10,6 +10,7 @@ import pytest
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, sessionmaker
 
+from lorairo.database.repository.base import resolve_tag_string_ids
 from lorairo.database.schema import Base, Tag
 
 _SCRIPT_PATH = Path(__file__).resolve().parents[3] / "scripts" / "repair_tag_normalization.py"
@@ -49,7 +50,8 @@ def _make_db(tmp_path: Path) -> tuple[Path, sessionmaker[Session]]:
 def _add_tag(
     session: Session, *, tag: str, image_id: int = 1, model_id: int | None = 1, **kwargs: object
 ) -> Tag:
-    row = Tag(tag=tag, image_id=image_id, model_id=model_id, existing=False, **kwargs)
+    tag_string_id = resolve_tag_string_ids(session, [tag])[tag]
+    row = Tag(tag_string_id=tag_string_id, image_id=image_id, model_id=model_id, existing=False, **kwargs)
     session.add(row)
     return row
 
@@ -294,12 +294,18 @@ def test_save_provider_batch_results_by_image_id_records_refusal(
     assert result.success_count == 0
     assert result.skip_count == 1
     assert result.error_count == 0
-    mock_repository.save_error_record.assert_called_once_with(
-        operation_type="annotation",
-        error_type="SAFETY_REFUSAL",
-        error_message="policy refused",
-        image_id=7,
-        model_name="openai/gpt-test",
+    # ループ中の refusal はまとめて 1 回の一括保存で書き込む
+    mock_repository.save_error_record.assert_not_called()
+    mock_repository.save_error_records_batch.assert_called_once_with(
+        [
+            {
+                "operation_type": "annotation",
+                "error_type": "SAFETY_REFUSAL",
+                "error_message": "policy refused",
+                "image_id": 7,
+                "model_name": "openai/gpt-test",
+            }
+        ]
     )
     mock_repository.save_annotations.assert_not_called()
 
@@ -857,3 +863,25 @@ class TestAppendScoresWebApi:
             result=result,
         )
         assert len(result["scores"]) == 0
+
+
+@pytest.mark.unit
+def test_filter_refused_image_paths_queries_only_candidate_ids(
+    service: AnnotationSaveService, mock_repository: MagicMock
+) -> None:
+    """refusal 検索は候補 path の image_id に絞り、プロジェクト全体を読み込まない。"""
+    mock_repository.get_image_ids_by_filepaths.return_value = {"/a.png": 3, "/b.png": 1, "/new.png": None}
+    mock_repository.get_error_image_ids.return_value = [3]
+
+    assert service.filter_refused_image_paths(["/a.png", "/b.png", "/new.png"]) == ["/b.png", "/new.png"]
+    assert mock_repository.get_error_image_ids.call_args.kwargs["image_ids"] == [1, 3]
+
+
+@pytest.mark.unit
+def test_filter_refused_image_paths_skips_refusal_query_for_unregistered_paths(
+    service: AnnotationSaveService, mock_repository: MagicMock
+) -> None:
+    mock_repository.get_image_ids_by_filepaths.return_value = {"/new.png": None}
+
+    assert service.filter_refused_image_paths(["/new.png"]) == ["/new.png"]
+    mock_repository.get_error_image_ids.assert_not_called()
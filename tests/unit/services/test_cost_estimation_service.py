@@ -12,6 +12,7 @@ from lorairo.services.cost_estimation_service import (
     format_duration,
     format_per_image_cost,
 )
+from lorairo.services.model_throughput_stats import ModelThroughputStats
 from lorairo.services.pipeline_composition import (
     InferenceLedger,
     LedgerEntry,
@@ -113,6 +114,48 @@ class TestEstimateBatch:
         assert estimate.total_usd == pytest.approx(per_image * 4)
 
 
+class TestMeasuredThroughput:
+    @pytest.fixture
+    def throughput(self):
+        stats = ModelThroughputStats(":memory:")
+        yield stats
+        stats.close()
+
+    def test_measured_seconds_replace_fixed_assumption(self, throughput):
+        throughput.record("wd-tagger", images=10, seconds=2.0)
+        service = CostEstimationService(throughput)
+        ledger = InferenceLedger(
+            entries=(
+                LedgerEntry(model=_local_model("wd-tagger"), stage_count=1),
+                LedgerEntry(model=_local_model("unmeasured"), stage_count=1),
+            ),
+            staged_count=5,
+        )
+
+        estimate = service.estimate_batch(ledger)
+
+        assert estimate.est_seconds == pytest.approx(5 * 0.2 + 5 * SECONDS_PER_JOB)
+        assert estimate.measured_models == 1
+
+    def test_measured_tokens_drive_per_image_cost(self, throughput):
+        throughput.record("openai/gpt-4o", images=2, seconds=6.0, input_tokens=1000, output_tokens=200)
+        service = CostEstimationService(throughput)
+
+        per_image = service.per_image_usd(_api_model("openai/gpt-4o", 2.5e-06, 1.0e-05))
+
+        assert per_image == pytest.approx(500 * 2.5e-06 + 100 * 1.0e-05)
+
+    def test_missing_token_usage_falls_back_to_constants(self, throughput):
+        throughput.record("openai/gpt-4o", images=2, seconds=6.0)
+        service = CostEstimationService(throughput)
+
+        assert service.tokens_per_image("openai/gpt-4o") == (
+            INPUT_TOKENS_PER_IMAGE,
+            OUTPUT_TOKENS_PER_IMAGE,
+        )
+        assert service.seconds_per_image("openai/gpt-4o") == (pytest.approx(3.0), True)
+
+
 class TestFormatHelpers:
     def test_format_local_is_free(self):
         assert format_per_image_cost(0.0, is_api=False) == "ローカル（無料）"
@@ -12,6 +12,7 @@ from PIL import Image
 from lorairo.public_api.exceptions import ImageRegistrationError
 from lorairo.public_api.types import RegistrationResult
 from lorairo.services.image_registration_service import ImageRegistrationService
+from lorairo.utils.image_feature_cache import ImageFeatureCache
 
 # ==================== ローカル fixture ====================
 
@@ -421,6 +422,32 @@ class TestDetectDuplicateImages:
 
         assert "ディレクトリではありません" in str(excinfo.value)
 
+    def test_detect_duplicate_images_rescan_uses_feature_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """特徴量キャッシュ付きでは再スキャン時に pHash を再計算しない。"""
+        scan_dir = tmp_path / "scan"
+        scan_dir.mkdir()
+        _make_image(scan_dir / "a.png", color=(10, 10, 10))
+        _make_image(scan_dir / "b.png", color=(10, 10, 10))
+        cache = ImageFeatureCache(tmp_path / "features.sqlite")
+        service = ImageRegistrationService(feature_cache=cache)
+        computed: list[Path] = []
+        original = ImageRegistrationService._compute_phash
+        monkeypatch.setattr(
+            ImageRegistrationService,
+            "_compute_phash",
+            staticmethod(lambda p: computed.append(p) or original(p)),
+        )
+
+        first = service.detect_duplicate_images(scan_dir)
+        second = service.detect_duplicate_images(scan_dir)
+        cache.close()
+
+        assert first == second
+        assert len(first) == 1
+        assert len(computed) == 2
+
 
 # ==================== get_image_files ====================
 
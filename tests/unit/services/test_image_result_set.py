@@ -0,0 +1,127 @@
+"""ImageResultSet (列指向の検索結果セット) の単体テスト。"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+
+import pytest
+
+from lorairo.services.image_result_set import ImageResultSet
+
+pytestmark = pytest.mark.unit
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {
+            "id": 100 + i,
+            "stored_image_path": f"/images/{i}.png",
+            "width": 512 + i,
+            "height": 768,
+            "format": "PNG",
+            "has_alpha": False,
+            "created_at": datetime(2026, 1, 1),
+        }
+        for i in range(count)
+    ]
+
+
+class TestImageResultSet:
+    def test_rows_round_trip_as_sequence(self):
+        rows = _rows(3)
+        result_set = ImageResultSet.from_rows(rows)
+
+        assert len(result_set) == 3
+        assert result_set == rows
+        assert list(result_set) == rows
+        assert result_set[-1] == rows[2]
+        assert result_set[1:3] == rows[1:3]
+        with pytest.raises(IndexError):
+            result_set[3]
+
+    def test_numeric_columns_are_packed_into_arrays(self):
+        result_set = ImageResultSet.from_rows(_rows(3))
+
+        assert isinstance(result_set._columns["id"], array)
+        assert isinstance(result_set._columns["width"], array)
+        assert isinstance(result_set._columns["has_alpha"], list)
+        assert result_set[0]["has_alpha"] is False
+        # 列内の同一文字列は 1 オブジェクトを共有する
+        formats = result_set._columns["format"]
+        assert formats[0] is formats[2]
+
+    def test_missing_keys_are_not_materialized(self):
+        result_set = ImageResultSet.from_rows([{"id": 1}, {"id": 2, "score": 0.5}, {"id": 3}])
+
+        assert result_set[0] == {"id": 1}
+        assert result_set[1] == {"id": 2, "score": 0.5}
+        assert result_set.column("score") == [None, 0.5, None]
+
+    def test_id_lookup(self):
+        result_set = ImageResultSet.from_rows(_rows(5))
+
+        assert result_set.has_id(103)
+        assert not result_set.has_id(999)
+        assert result_set.index_of(103) == 3
+        assert result_set.get_by_id(103)["stored_image_path"] == "/images/3.png"
+        assert result_set.get_by_id(999) is None
+        assert result_set.ids_slice(1, 3) == [101, 102]
+
+    def test_pinned_rows_keep_in_place_updates(self):
+        result_set = ImageResultSet.from_rows(_rows(3))
+
+        result_set.pin_by_id(101)["tags"] = ["cat"]
+
+        assert result_set[1] is result_set.pin_by_id(101)
+        assert result_set.get_by_id(101) is result_set[1]
+        assert list(result_set)[1]["tags"] == ["cat"]
+        assert "tags" not in result_set[0]
+        assert result_set.column("tags") == [None, ["cat"], None]
+
+    def test_iteration_does_not_pin_rows(self):
+        result_set = ImageResultSet.from_rows(_rows(3))
+
+        for row in result_set:
+            row["tags"] = ["dropped"]
+
+        assert result_set._pinned == {}
+        assert "tags" not in result_set.get_by_id(100)
+
+    def test_read_access_does_not_pin_rows(self):
+        result_set = ImageResultSet.from_rows(_rows(3))
+
+        result_set.get_by_id(100)["tags"] = ["dropped"]
+        result_set[1]["tags"] = ["dropped"]
+
+        assert result_set._pinned == {}
+        assert result_set.get_by_id(100) is not result_set.get_by_id(100)
+        assert result_set.column("tags") == [None, None, None]
+
+    def test_replace_swaps_row_by_id(self):
+        result_set = ImageResultSet.from_rows(_rows(3))
+        new_metadata = {"id": 102, "stored_image_path": "/processed/2.webp", "width": 1024}
+
+        assert result_set.replace(102, new_metadata)
+        assert not result_set.replace(999, {"id": 999})
+        assert result_set.get_by_id(102) is new_metadata
+        assert result_set.column("width") == [512, 513, 1024]
+
+    def test_copy_shares_columns_but_not_replacements(self):
+        original = ImageResultSet.from_rows(_rows(2))
+        pinned = original.pin_by_id(100)
+
+        clone = ImageResultSet.from_rows(original)
+        clone.replace(101, {"id": 101})
+
+        assert clone._columns is original._columns
+        assert clone.get_by_id(100) is pinned
+        assert original.get_by_id(101) == _rows(2)[1]
+
+    def test_empty(self):
+        result_set = ImageResultSet()
+
+        assert len(result_set) == 0
+        assert result_set == []
+        assert result_set.get_by_id(1) is None
+        assert result_set.ids_slice(0, 10) == []
@@ -17,6 +17,7 @@ from lorairo.services.job_ledger_service import (
     StageModelInput,
     build_stage_progress,
 )
+from lorairo.utils.stage_telemetry import StageTiming, TelemetrySnapshot
 
 
 @pytest.fixture
@@ -282,3 +283,36 @@ class TestJobsSummary:
         summary = ledger.summary()
 
         assert (summary.running, summary.queued, summary.done_7d, summary.failed_7d) == (0, 0, 0, 0)
+
+
+def _telemetry(*stages: StageTiming) -> TelemetrySnapshot:
+    return TelemetrySnapshot(label="Worker", wall_seconds=sum(s.seconds for s in stages), stages=stages)
+
+
+@pytest.mark.unit
+class TestJobLedgerTelemetry:
+    def test_set_telemetry_unknown_job_returns_none(self, ledger):
+        assert ledger.set_telemetry("missing", _telemetry()) is None
+
+    def test_stage_totals_merge_same_stage_per_job_type(self, ledger):
+        ledger.register("reg_1", "batch_registration", "登録 1")
+        ledger.set_telemetry("reg_1", _telemetry(StageTiming("register", 10, 2.0, items=10, bytes=100)))
+        ledger.register("reg_2", "batch_registration", "登録 2")
+        ledger.set_telemetry(
+            "reg_2",
+            _telemetry(StageTiming("register", 5, 1.0, items=5), StageTiming("scan", 1, 4.0, items=15)),
+        )
+        ledger.register("ann_1", "annotation", "アノテーション")
+        ledger.set_telemetry("ann_1", _telemetry(StageTiming("inference", 1, 9.0, items=3)))
+        ledger.register("no_telemetry", "batch_registration", "計測なし")
+
+        totals = ledger.stage_totals("batch_registration")
+
+        assert [stage.name for stage in totals] == ["scan", "register"]
+        register = totals[1]
+        assert (register.calls, register.seconds, register.items, register.bytes) == (15, 3.0, 15, 100)
+        assert [stage.name for stage in ledger.stage_totals()] == ["inference", "scan", "register"]
+        # 集計は台帳の計測値を変更しない
+        entry = ledger.get("reg_1")
+        assert entry is not None and entry.telemetry is not None
+        assert entry.telemetry.stages[0].calls == 10
@@ -0,0 +1,132 @@
+"""ModelThroughputStats 単体テスト。"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lorairo.services.model_throughput_stats import THROUGHPUT_STATS_VERSION, ModelThroughputStats
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def stats(tmp_path: Path):
+    stats = ModelThroughputStats(tmp_path / "throughput.sqlite")
+    yield stats
+    stats.close()
+
+
+class TestRecord:
+    def test_first_observation_is_taken_as_is(self, stats):
+        updated = stats.record("wd-v3", images=10, seconds=5.0, failures=1)
+
+        assert updated is not None
+        assert updated.runs == 1
+        assert updated.images == 10
+        assert updated.seconds_per_image == pytest.approx(0.5)
+        assert updated.failure_rate == pytest.approx(0.1)
+        assert updated.input_tokens_per_image is None
+
+    def test_larger_observations_weigh_more(self, tmp_path):
+        small = ModelThroughputStats(":memory:", alpha=0.1)
+        large = ModelThroughputStats(":memory:", alpha=0.1)
+        for store in (small, large):
+            store.record("m", images=1, seconds=1.0)
+        small.record("m", images=1, seconds=3.0)
+        large.record("m", images=20, seconds=60.0)
+
+        assert small.seconds_per_image("m") == pytest.approx(1.0 + 2.0 * 0.1)
+        assert large.seconds_per_image("m") == pytest.approx(1.0 + 2.0 * (1 - 0.9**20))
+        assert large.seconds_per_image("m") > small.seconds_per_image("m")
+
+    def test_all_failed_call_does_not_update_seconds(self, stats):
+        stats.record("gpt-4o", images=4, seconds=8.0)
+        updated = stats.record("gpt-4o", images=4, seconds=0.01, failures=4)
+
+        assert updated is not None
+        assert updated.seconds_per_image == pytest.approx(2.0)
+        assert updated.failure_rate > 0.0
+
+    def test_token_usage_is_tracked_per_image(self, stats):
+        stats.record("gpt-4o", images=2, seconds=4.0, input_tokens=3000, output_tokens=500)
+
+        recorded = stats.get("gpt-4o")
+        assert recorded is not None
+        assert recorded.input_tokens_per_image == pytest.approx(1500)
+        assert recorded.output_tokens_per_image == pytest.approx(250)
+
+    def test_zero_images_is_ignored(self, stats):
+        assert stats.record("m", images=0, seconds=1.0) is None
+        assert stats.get("m") is None
+
+
+class TestPersistence:
+    def test_stats_survive_reopen(self, tmp_path):
+        path = tmp_path / "throughput.sqlite"
+        first = ModelThroughputStats(path)
+        first.record("wd-v3", images=8, seconds=2.0)
+        first.close()
+
+        reopened = ModelThroughputStats(path)
+        try:
+            assert reopened.seconds_per_image("wd-v3") == pytest.approx(0.25)
+        finally:
+            reopened.close()
+
+    def test_version_mismatch_discards_stats(self, tmp_path):
+        path = tmp_path / "throughput.sqlite"
+        first = ModelThroughputStats(path)
+        first.record("wd-v3", images=8, seconds=2.0)
+        first.close()
+        with sqlite3.connect(path) as conn:
+            conn.execute(f"PRAGMA user_version = {THROUGHPUT_STATS_VERSION + 1}")
+
+        reopened = ModelThroughputStats(path)
+        try:
+            assert reopened.all() == []
+        finally:
+            reopened.close()
+
+    def test_corrupt_file_is_recreated(self, tmp_path):
+        path = tmp_path / "throughput.sqlite"
+        path.write_bytes(b"not a sqlite database" * 100)
+
+        stats = ModelThroughputStats(path)
+        try:
+            stats.record("m", images=1, seconds=1.0)
+            assert stats.seconds_per_image("m") == pytest.approx(1.0)
+        finally:
+            stats.close()
+
+    def test_reset_single_model_and_all(self, stats):
+        stats.record("a", images=1, seconds=1.0)
+        stats.record("b", images=1, seconds=1.0)
+
+        assert stats.reset("a") == 1
+        assert [s.model_id for s in stats.all()] == ["b"]
+        assert stats.reset() == 1
+        assert stats.all() == []
+
+
+class TestRecommendBatchSize:
+    def test_unmeasured_model_returns_default(self, stats):
+        stats.record("fast", images=10, seconds=1.0)
+
+        assert stats.recommend_batch_size(["fast", "unknown"], default=10, maximum=32) == 10
+
+    def test_targets_chunk_duration_from_summed_models(self, stats):
+        stats.record("a", images=10, seconds=10.0)
+        stats.record("b", images=10, seconds=5.0)
+
+        # 1 枚あたり 1.0 + 0.5 秒 → 30 秒で 20 枚
+        assert stats.recommend_batch_size(["a", "b"], default=10, maximum=32, target_seconds=30.0) == 20
+
+    def test_result_is_clamped(self, stats):
+        stats.record("fast", images=100, seconds=0.1)
+        stats.record("slow", images=1, seconds=120.0)
+
+        assert stats.recommend_batch_size(["fast"], default=10, maximum=32) == 32
+        assert stats.recommend_batch_size(["slow"], default=10, minimum=1, maximum=32) == 1
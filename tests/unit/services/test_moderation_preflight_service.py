@@ -80,6 +80,23 @@ def test_existing_ratings_allow_and_block_without_moderation(deps: dict[str, Moc
     deps["runner"].assert_not_called()
 
 
+@pytest.mark.unit
+def test_skip_reasons_are_saved_in_one_batch(deps: dict[str, Mock]) -> None:
+    deps["image_repo"].get_image_ids_by_filepaths.return_value = {"/img/x1.png": 1, "/img/x2.png": 2}
+    deps["image_repo"].get_latest_normalized_ratings_by_image_ids.return_value = {1: "X", 2: "XXX"}
+
+    _service(deps).apply(["/img/x1.png", "/img/x2.png"])
+
+    deps["error_record_repo"].save_error_record.assert_not_called()
+    deps["error_record_repo"].save_error_records_batch.assert_called_once()
+    (records,) = deps["error_record_repo"].save_error_records_batch.call_args.args
+    assert [(record["image_id"], record["error_type"]) for record in records] == [
+        (1, MODERATION_ERROR_TYPE_BLOCKED),
+        (2, MODERATION_ERROR_TYPE_BLOCKED),
+    ]
+    assert all(record["model_name"] == MODERATION_LITELLM_MODEL_ID for record in records)
+
+
 @pytest.mark.unit
 def test_unrated_moderation_allows_after_saved_safe_rating(deps: dict[str, Mock]) -> None:
     deps["image_repo"].get_image_ids_by_filepaths.return_value = {"/img/unrated.png": 10}
@@ -243,3 +243,30 @@ class TestSidecarAnnotationReader:
                 txt_path.unlink()
             if caption_path.exists():
                 caption_path.unlink()
+
+    def test_read_sidecar_files_skips_existence_checks(self, tmp_path):
+        """走査済みのサイドカーを渡すと存在確認せずに読み込む"""
+        reader = SidecarAnnotationReader()
+        image_path = tmp_path / "img.jpg"
+        caption_path = tmp_path / "img.caption"
+        caption_path.write_text("a caption", encoding="utf-8")
+
+        with (
+            patch("lorairo.annotation.sidecar_reader.Path.exists") as mock_exists,
+            patch(
+                "genai_tag_db_tools.utils.cleanup_str.TagCleaner.clean_format",
+                return_value="a caption",
+            ),
+        ):
+            result = reader.read_sidecar_files(image_path, caption_path=caption_path)
+
+        mock_exists.assert_not_called()
+        assert result is not None
+        assert result["tags"] == []
+        assert result["captions"] == ["a caption"]
+
+    def test_read_sidecar_files_without_sidecars_returns_none(self):
+        """サイドカーが無い場合は None"""
+        reader = SidecarAnnotationReader()
+
+        assert reader.read_sidecar_files(Path("img.jpg")) is None
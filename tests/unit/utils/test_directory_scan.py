@@ -0,0 +1,87 @@
+"""directory_scan (os.scandir ベースの並列ディレクトリスキャナ) のユニットテスト。"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from lorairo.utils.directory_scan import ScannedImage, scan_image_files
+
+pytestmark = pytest.mark.unit
+
+_EXTENSIONS = [".jpg", ".png"]
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x")
+    return path
+
+
+def _scan(root: Path, **kwargs) -> dict[Path, ScannedImage]:
+    return {scanned.path: scanned for scanned in scan_image_files(root, _EXTENSIONS, **kwargs)}
+
+
+class TestScanImageFiles:
+    def test_matches_rglob_result(self, tmp_path):
+        for relative in ["a.jpg", "b.PNG", "note.txt", "x/c.jpg", "x/y/z/d.png", "x/y/e.gif", "w/f.jpeg"]:
+            _touch(tmp_path / relative)
+
+        expected = {p for p in tmp_path.rglob("*") if p.is_file() and p.suffix.lower() in _EXTENSIONS}
+
+        assert set(_scan(tmp_path)) == expected
+
+    def test_yields_in_path_order(self, tmp_path):
+        for relative in ["b.jpg", "a/z.png", "a/b/c.jpg", "c/a.jpg", "a.jpg", "a/a.jpg", "d.png"]:
+            _touch(tmp_path / relative)
+
+        paths = [scanned.path for scanned in scan_image_files(tmp_path, _EXTENSIONS, max_workers=4)]
+
+        # 列挙の完了順に関係なく sorted(paths) と同じ順になる
+        assert paths == sorted(paths)
+        assert len(paths) == 7
+
+    def test_sidecars_are_resolved_from_listing(self, tmp_path):
+        image = _touch(tmp_path / "sub" / "img.v2.jpg")
+        tag = _touch(tmp_path / "sub" / "img.v2.txt")
+        caption = _touch(tmp_path / "sub" / "img.v2.caption")
+        bare = _touch(tmp_path / "sub" / "bare.png")
+        _touch(tmp_path / "sub" / "img.txt")  # with_suffix では対応しない名前
+
+        result = _scan(tmp_path)
+
+        assert result[image] == ScannedImage(image, tag_path=tag, caption_path=caption)
+        assert result[bare] == ScannedImage(bare)
+        assert not result[bare].has_sidecars
+
+    def test_missing_root_yields_nothing(self, tmp_path):
+        assert _scan(tmp_path / "missing") == {}
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlink 非対応環境")
+    def test_directory_symlinks_are_not_followed(self, tmp_path):
+        outside = tmp_path / "outside"
+        _touch(outside / "linked.jpg")
+        root = tmp_path / "root"
+        root.mkdir()
+        try:
+            (root / "link").symlink_to(outside, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlink を作成できない環境")
+
+        assert _scan(root) == {}
+
+    def test_cancellation_stops_scan(self, tmp_path):
+        for index in range(20):
+            _touch(tmp_path / f"d{index}" / "img.jpg")
+
+        assert _scan(tmp_path, is_canceled=lambda: True) == {}
+
+    def test_closing_generator_stops_scan(self, tmp_path):
+        for index in range(20):
+            _touch(tmp_path / f"d{index}" / "img.jpg")
+
+        scanner = scan_image_files(tmp_path, _EXTENSIONS, max_workers=2)
+        first = next(scanner)
+        scanner.close()
+
+        assert first.path.name == "img.jpg"
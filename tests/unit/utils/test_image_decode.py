@@ -0,0 +1,123 @@
+"""image_decode (縮小デコードユーティリティ) のユニットテスト。"""
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from lorairo.utils import image_decode
+from lorairo.utils.image_decode import (
+    OpenCVDecodeBackend,
+    decode_image,
+    draft_size_for,
+    get_decode_backend,
+    reduce_on_load,
+    register_decode_backend,
+    set_decode_backend,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _save(path: Path, size: tuple[int, int], fmt: str) -> Path:
+    Image.new("RGB", size, (200, 40, 40)).save(path, format=fmt)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend():
+    backend = get_decode_backend()
+    yield
+    image_decode._active_backend = backend
+
+
+class TestDraftSizeFor:
+    def test_keeps_aspect_ratio(self):
+        assert draft_size_for((4000, 2000), 500) == (500, 250)
+
+    def test_never_upscales(self):
+        assert draft_size_for((300, 200), 500) == (300, 200)
+
+
+class TestReduceOnLoad:
+    def test_jpeg_is_reduced_but_not_below_max_edge(self, tmp_path):
+        path = _save(tmp_path / "big.jpg", (2400, 1600), "JPEG")
+
+        with Image.open(path) as img:
+            assert reduce_on_load(img, 256) is True
+            img.load()
+            assert max(img.size) >= 256
+            assert max(img.size) <= 600
+
+    def test_png_is_left_untouched(self, tmp_path):
+        path = _save(tmp_path / "big.png", (2400, 1600), "PNG")
+
+        with Image.open(path) as img:
+            assert reduce_on_load(img, 256) is False
+            assert img.size == (2400, 1600)
+
+    def test_small_jpeg_is_left_untouched(self, tmp_path):
+        path = _save(tmp_path / "small.jpg", (400, 300), "JPEG")
+
+        with Image.open(path) as img:
+            assert reduce_on_load(img, 256) is False
+            assert img.size == (400, 300)
+
+
+class TestDecodeImage:
+    def test_full_resolution_without_max_edge(self, tmp_path):
+        path = _save(tmp_path / "big.jpg", (1600, 1200), "JPEG")
+
+        img = decode_image(path)
+
+        assert img.size == (1600, 1200)
+
+    def test_reduced_with_max_edge(self, tmp_path):
+        path = _save(tmp_path / "big.jpg", (1600, 1200), "JPEG")
+
+        img = decode_image(path, max_edge=200)
+
+        assert img.size == (200, 150)
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            decode_image(tmp_path / "missing.jpg", max_edge=200)
+
+    def test_opencv_backend_reduces_jpeg(self, tmp_path):
+        pytest.importorskip("cv2")
+        path = _save(tmp_path / "big.jpg", (1600, 1200), "JPEG")
+        set_decode_backend("opencv")
+
+        img = decode_image(path, max_edge=200)
+
+        assert img.mode == "RGB"
+        assert img.size == (200, 150)
+        assert img.filename == str(path)  # Pillow 経路と同じく元ファイルを辿れる
+
+    def test_backend_returning_none_falls_back_to_pillow(self, tmp_path):
+        path = _save(tmp_path / "big.png", (640, 480), "PNG")
+        set_decode_backend(OpenCVDecodeBackend.name)
+
+        img = decode_image(path, max_edge=200)
+
+        assert img.size == (640, 480)
+
+    def test_registered_backend_is_used(self, tmp_path):
+        path = _save(tmp_path / "big.jpg", (640, 480), "JPEG")
+        marker = Image.new("RGB", (1, 1))
+
+        class _StubBackend:
+            name = "stub"
+
+            def decode(self, path, max_edge):
+                return marker
+
+        register_decode_backend(_StubBackend())
+        set_decode_backend("stub")
+
+        assert decode_image(path, max_edge=100) is marker
+        image_decode._BACKENDS.pop("stub")
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown decode backend"):
+            set_decode_backend("nope")
@@ -0,0 +1,136 @@
+"""ImageFeatureCache (画像特徴量の永続キャッシュ) のユニットテスト。"""
+
+import os
+import sqlite3
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from lorairo.utils import image_feature_cache
+from lorairo.utils.image_feature_cache import FEATURE_CACHE_VERSION, ImageFeatureCache
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def image_path(tmp_path: Path) -> Path:
+    path = tmp_path / "img.png"
+    Image.new("RGB", (32, 16), (10, 20, 30)).save(path)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    cache = ImageFeatureCache(tmp_path / "cache" / "features.sqlite")
+    yield cache
+    cache.close()
+
+
+class TestPhash:
+    def test_second_call_is_served_from_cache(self, cache, image_path):
+        compute = Mock(return_value="abcd")
+
+        assert cache.phash(image_path, compute) == "abcd"
+        assert cache.phash(image_path, compute) == "abcd"
+
+        compute.assert_called_once_with(image_path)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_modified_file_is_recomputed(self, cache, image_path):
+        compute = Mock(side_effect=["old", "new"])
+        cache.phash(image_path, compute)
+        cache.flush()
+
+        stat = image_path.stat()
+        os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.phash(image_path, compute) == "new"
+        assert compute.call_count == 2
+
+    def test_compute_error_is_not_cached(self, cache, image_path):
+        compute = Mock(side_effect=[ValueError("broken"), "abcd"])
+
+        with pytest.raises(ValueError):
+            cache.phash(image_path, compute)
+        assert cache.phash(image_path, compute) == "abcd"
+
+    def test_missing_file_delegates_to_compute(self, cache, tmp_path):
+        compute = Mock(side_effect=FileNotFoundError("gone"))
+
+        with pytest.raises(FileNotFoundError):
+            cache.phash(tmp_path / "missing.png", compute)
+        compute.assert_called_once()
+
+
+class TestImageInfo:
+    def test_persists_across_instances(self, tmp_path, image_path):
+        db_path = tmp_path / "features.sqlite"
+        info = {"width": 32, "height": 16, "has_alpha": False, "colorfulness_score": 1.5}
+        first = ImageFeatureCache(db_path)
+        first.image_info(image_path, Mock(return_value=info))
+        first.close()
+
+        second = ImageFeatureCache(db_path)
+        compute = Mock()
+        try:
+            assert second.image_info(image_path, compute) == info
+        finally:
+            second.close()
+        compute.assert_not_called()
+
+    def test_returns_independent_dicts(self, cache, image_path):
+        cache.image_info(image_path, Mock(return_value={"width": 32}))
+
+        result = cache.image_info(image_path, Mock())
+        result["uuid"] = "x"
+
+        assert cache.image_info(image_path, Mock()) == {"width": 32}
+
+    def test_phash_and_info_share_a_row(self, cache, image_path):
+        cache.phash(image_path, Mock(return_value="abcd"))
+        cache.flush()
+        cache.image_info(image_path, Mock(return_value={"width": 32}))
+        cache.flush()
+
+        assert cache.get_stats()["entries"] == 1
+        assert cache.phash(image_path, Mock()) == "abcd"
+
+
+class TestFlushAndVersioning:
+    def test_flushes_automatically_at_threshold(self, cache, tmp_path, monkeypatch):
+        monkeypatch.setattr(ImageFeatureCache, "FLUSH_THRESHOLD", 2)
+        for index in range(2):
+            path = tmp_path / f"{index}.png"
+            path.write_bytes(b"x")
+            cache.phash(path, Mock(return_value=str(index)))
+
+        assert cache.get_stats()["pending"] == 0
+        assert cache.get_stats()["entries"] == 2
+
+    def test_version_mismatch_discards_entries(self, tmp_path, image_path, monkeypatch):
+        db_path = tmp_path / "features.sqlite"
+        first = ImageFeatureCache(db_path)
+        first.phash(image_path, Mock(return_value="abcd"))
+        first.close()
+
+        monkeypatch.setattr(image_feature_cache, "FEATURE_CACHE_VERSION", FEATURE_CACHE_VERSION + 1)
+        second = ImageFeatureCache(db_path)
+        try:
+            assert second.get_stats()["entries"] == 0
+        finally:
+            second.close()
+
+    def test_corrupted_file_is_recreated(self, tmp_path, image_path):
+        db_path = tmp_path / "features.sqlite"
+        db_path.write_bytes(b"this is not a sqlite database" * 10)
+
+        cache = ImageFeatureCache(db_path)
+        try:
+            assert cache.phash(image_path, Mock(return_value="abcd")) == "abcd"
+            cache.flush()
+        finally:
+            cache.close()
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM image_features").fetchone()[0] == 1
@@ -0,0 +1,62 @@
+"""open_versioned_cache (使い捨て SQLite キャッシュの共通オープン処理) のユニットテスト。"""
+
+from pathlib import Path
+
+import pytest
+
+from lorairo.utils.sqlite_cache import open_versioned_cache
+
+pytestmark = pytest.mark.unit
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT)"
+
+
+def _open(path: Path, version: int = 1):
+    return open_versioned_cache(path, version, _SCHEMA, label="テストキャッシュ")
+
+
+def test_version_mismatch_drops_existing_tables(tmp_path):
+    db_path = tmp_path / "cache.sqlite"
+    conn = _open(db_path)
+    conn.execute("CREATE TABLE leftover (id INTEGER)")
+    conn.execute("INSERT INTO entries VALUES ('a', '1')")
+    conn.commit()
+    conn.close()
+
+    conn = _open(db_path, version=2)
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert tables == {"entries"}
+        assert conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+
+def test_corrupted_file_is_rebuilt_with_its_wal_sidecars(tmp_path):
+    db_path = tmp_path / "nested" / "cache.sqlite"
+    db_path.parent.mkdir()
+    db_path.write_bytes(b"this is not a sqlite database" * 10)
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    shm_path = db_path.with_name(db_path.name + "-shm")
+    wal_path.write_bytes(b"stale wal")
+    shm_path.write_bytes(b"stale shm")
+
+    conn = _open(db_path)
+    try:
+        conn.execute("INSERT INTO entries VALUES ('a', '1')")
+        conn.commit()
+        assert conn.execute("SELECT value FROM entries").fetchone()[0] == "1"
+    finally:
+        conn.close()
+    assert not wal_path.exists() or wal_path.read_bytes() != b"stale wal"
+    assert not shm_path.exists() or shm_path.read_bytes() != b"stale shm"
+
+
+def test_memory_cache_creates_no_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    conn = open_versioned_cache(":memory:", 1, [_SCHEMA], label="テストキャッシュ")
+    conn.close()
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,107 @@
+"""StageTelemetry (ワーカーのステージ別計測) のユニットテスト。"""
+
+import pytest
+
+from lorairo.utils.stage_telemetry import SamplingProfiler, StageTelemetry, StageTiming
+
+
+def _busy() -> int:
+    return sum(i * i for i in range(20_000))
+
+
+@pytest.mark.unit
+class TestStageTelemetry:
+    def test_stage_accumulates_time_items_and_bytes(self):
+        telemetry = StageTelemetry("Worker")
+        telemetry.start()
+
+        for _ in range(3):
+            with telemetry.stage("decode", items=1) as timing:
+                timing.bytes += 1024
+                _busy()
+        with telemetry.stage("db_write", items=10):
+            pass
+        snapshot = telemetry.stop()
+
+        decode = snapshot.get_stage("decode")
+        assert decode is not None
+        assert (decode.calls, decode.items, decode.bytes) == (3, 3, 3072)
+        assert decode.seconds > 0
+        assert decode.items_per_second is not None
+        assert [stage.name for stage in snapshot.stages] == ["decode", "db_write"]
+        assert snapshot.wall_seconds >= snapshot.accounted_seconds
+        assert not telemetry.is_running
+
+    def test_stage_is_recorded_when_body_raises(self):
+        telemetry = StageTelemetry("Worker")
+        telemetry.start()
+
+        with pytest.raises(RuntimeError), telemetry.stage("inference"):
+            raise RuntimeError("boom")
+
+        stage = telemetry.stop().get_stage("inference")
+        assert stage is not None
+        assert stage.calls == 1
+
+    def test_start_discards_previous_run(self):
+        telemetry = StageTelemetry("Worker")
+        telemetry.start()
+        with telemetry.stage("scan"):
+            pass
+        telemetry.count("outcome.registered", 2)
+        telemetry.stop()
+
+        telemetry.start()
+        snapshot = telemetry.stop()
+
+        assert snapshot.stages == ()
+        assert snapshot.counters == {}
+
+    def test_snapshot_is_isolated_from_later_updates(self):
+        telemetry = StageTelemetry("Worker")
+        telemetry.start()
+        with telemetry.stage("db_read", items=1):
+            pass
+        snapshot = telemetry.snapshot()
+        with telemetry.stage("db_read", items=1):
+            pass
+
+        stage = snapshot.get_stage("db_read")
+        assert stage is not None
+        assert stage.calls == 1
+        assert telemetry.is_running
+
+    def test_format_lines_and_to_dict(self):
+        telemetry = StageTelemetry("ThumbnailWorker")
+        telemetry.start()
+        telemetry.record(StageTiming("decode", calls=2, seconds=0.5, items=2, bytes=2 * 1_048_576))
+        telemetry.count("failed", 1)
+        snapshot = telemetry.stop()
+
+        lines = snapshot.format_lines()
+        assert lines[0].startswith("ThumbnailWorker:")
+        assert "decode: 0.500s" in lines[1]
+        assert "4.0/s" in lines[1]
+        assert "4.0 MiB/s" in lines[1]
+        assert lines[-1].strip() == "failed=1"
+        data = snapshot.to_dict()
+        assert data["stages"][0]["items_per_second"] == pytest.approx(4.0)
+        assert data["profiled"] is False
+
+    def test_profile_produces_report(self):
+        telemetry = StageTelemetry("Worker")
+        telemetry.start(profile=True)
+        _busy()
+        snapshot = telemetry.stop()
+
+        assert snapshot.profile
+        assert snapshot.to_dict()["profiled"] is True
+
+    def test_profiler_falls_back_to_cprofile(self, monkeypatch):
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+        profiler = SamplingProfiler()
+        profiler.start()
+        _busy()
+
+        assert profiler.backend == "cProfile"
+        assert "_busy" in profiler.stop()
@@ -22,6 +22,19 @@ from lorairo.gui.workers.registration_worker import (
 from lorairo.gui.workers.search_worker import SearchWorker
 from lorairo.services.configuration_service import ConfigurationService
 from lorairo.services.search_models import SearchConditions
+from lorairo.utils.directory_scan import ScannedImage
+
+
+def _scanned(image_files: list[Path]) -> list[ScannedImage]:
+    """FileSystemManager.scan_image_files の走査結果を実ファイルから組み立てる。"""
+    return [
+        ScannedImage(
+            path,
+            tag_path=path.with_suffix(".txt") if path.with_suffix(".txt").exists() else None,
+            caption_path=path.with_suffix(".caption") if path.with_suffix(".caption").exists() else None,
+        )
+        for path in image_files
+    ]
 
 
 class TestDatabaseRegistrationWorker:
@@ -62,7 +75,7 @@ class TestDatabaseRegistrationWorker:
     def mock_fsm(self, mock_image_files):
         """ファイルシステムのみMock化（外部依存）"""
         mock = Mock(spec=FileSystemManager)
-        mock.get_image_files.return_value = mock_image_files
+        mock.scan_image_files.return_value = _scanned(mock_image_files)
         return mock
 
     def test_api_method_names_are_correct(self, temp_dir, real_db_manager, mock_fsm):
@@ -161,7 +174,7 @@ class TestDatabaseRegistrationWorker:
         tag_file.write_text("tag1, tag2, tag3", encoding="utf-8")
         caption_file.write_text("test caption", encoding="utf-8")
 
-        mock_fsm.get_image_files.return_value = [image_file]
+        mock_fsm.scan_image_files.return_value = _scanned([image_file])
 
         # DB操作をMock化 (#633: detect_duplicate_image は統一エントリ内で処理されるため除去)
         with (
@@ -196,7 +209,7 @@ class TestDatabaseRegistrationWorker:
     def test_empty_directory_handling(self, temp_dir, real_db_manager):
         """空ディレクトリ処理テスト"""
         mock_fsm = Mock(spec=FileSystemManager)
-        mock_fsm.get_image_files.return_value = []
+        mock_fsm.scan_image_files.return_value = _scanned([])
 
         worker = DatabaseRegistrationWorker(temp_dir, real_db_manager, mock_fsm)
         result = worker.execute()
@@ -205,6 +218,101 @@ class TestDatabaseRegistrationWorker:
         assert result.skipped_count == 0
         assert result.error_count == 0
 
+    def test_scanned_sidecars_are_read_without_probing(self, temp_dir, real_db_manager, mock_fsm):
+        """走査結果のサイドカーを使い、画像ごとの存在確認なしで事前読み込みする"""
+        image_b = temp_dir / "b.jpg"
+        image_a = temp_dir / "a.jpg"
+        tag_file = temp_dir / "b.txt"
+        tag_file.write_text("tag1", encoding="utf-8")
+        mock_fsm.scan_image_files.return_value = [
+            ScannedImage(image_a),
+            ScannedImage(image_b, tag_path=tag_file),
+        ]
+        worker = DatabaseRegistrationWorker(temp_dir, real_db_manager, mock_fsm)
+
+        annotations = {"tags": ["tag1"], "captions": [], "image_path": str(image_b)}
+        with (
+            patch.object(worker.file_reader, "get_existing_annotations") as mock_probe,
+            patch.object(worker.file_reader, "read_sidecar_files", return_value=annotations) as mock_read,
+            patch.object(worker, "_build_tag_id_cache", return_value={}),
+            patch.object(worker, "_process_single_image_in_batch") as mock_process,
+        ):
+            worker.execute()
+
+        mock_probe.assert_not_called()
+        mock_read.assert_called_once_with(image_b, tag_path=tag_file, caption_path=None)
+        # 走査結果 (パス順) のまま登録する
+        assert [c.args[0] for c in mock_process.call_args_list] == [image_a, image_b]
+        assert mock_process.call_args_list[0].kwargs["annotations"] is None
+        assert mock_process.call_args_list[1].kwargs["annotations"] is annotations
+        _, kwargs = mock_fsm.scan_image_files.call_args
+        assert kwargs["is_canceled"] == worker.cancellation.is_canceled
+
+    def test_registers_in_chunks_while_scan_is_streaming(self, temp_dir, real_db_manager, mock_fsm):
+        """走査結果をチャンク単位で登録し、タグIDは未解決のタグだけをチャンクごとに解決する"""
+        images = []
+        for name in ("c", "a", "b"):
+            image = temp_dir / f"{name}.jpg"
+            image.write_bytes(b"fake")
+            images.append(image)
+        registered_before_scan_end: list[int] = []
+
+        def streaming_scan(*_args, **_kwargs):
+            for image in images:
+                yield ScannedImage(image)
+            registered_before_scan_end.append(mock_process.call_count)
+
+        mock_fsm.scan_image_files.side_effect = streaming_scan
+        worker = DatabaseRegistrationWorker(temp_dir, real_db_manager, mock_fsm)
+        worker._REGISTRATION_CHUNK_SIZE = 2
+        annotations = {
+            images[0]: {"tags": ["shared", "first"]},
+            images[1]: {"tags": ["shared"]},
+            images[2]: {"tags": ["shared", "last"]},
+        }
+
+        with (
+            patch.object(
+                worker,
+                "_read_chunk_annotations",
+                side_effect=lambda chunk: {s.path: annotations[s.path] for s in chunk},
+            ),
+            patch.object(
+                real_db_manager.annotation_repo,
+                "batch_resolve_tag_ids",
+                side_effect=lambda tags: dict.fromkeys(tags, 1),
+            ) as mock_resolve,
+            patch(
+                "genai_tag_db_tools.utils.cleanup_str.TagCleaner.clean_format", side_effect=lambda tag: tag
+            ),
+            patch.object(worker, "_process_single_image_in_batch") as mock_process,
+        ):
+            worker.execute()
+
+        # 1チャンク目 (c, a) は走査完了前に登録が始まっている
+        assert registered_before_scan_end == [2]
+        # 走査結果の順 (スキャナがパス順を保証する) のまま登録する
+        assert [c.args[0] for c in mock_process.call_args_list] == images
+        # 総数未確定のチャンクは total_count=0、最後のチャンクで確定
+        assert [c.args[2] for c in mock_process.call_args_list] == [0, 0, 3]
+        assert [set(c.args[0]) for c in mock_resolve.call_args_list] == [{"shared", "first"}, {"last"}]
+
+    def test_total_is_reported_when_scan_ends_on_chunk_boundary(self, temp_dir, real_db_manager, mock_fsm):
+        """総数がチャンクサイズの倍数 (256 件ちょうど) でも最後のチャンクで総数を確定する"""
+        images = [temp_dir / f"img{index:03d}.jpg" for index in range(256)]
+        mock_fsm.scan_image_files.return_value = iter([ScannedImage(image) for image in images])
+        worker = DatabaseRegistrationWorker(temp_dir, real_db_manager, mock_fsm)
+        assert worker._REGISTRATION_CHUNK_SIZE == 256
+
+        with (
+            patch.object(worker, "_read_chunk_annotations", return_value={}),
+            patch.object(worker, "_process_single_image_in_batch") as mock_process,
+        ):
+            worker.execute()
+
+        assert mock_process.call_count == 256
+        assert {c.args[2] for c in mock_process.call_args_list} == {256}
+
 
 class TestSearchWorker:
     """SearchWorker の改善されたユニットテスト"""
@@ -778,7 +886,7 @@ class TestRegistrationErrorHandling:
     def mock_fsm(self, mock_image_files):
         """ファイルシステムのみMock化"""
         mock = Mock(spec=FileSystemManager)
-        mock.get_image_files.return_value = mock_image_files
+        mock.scan_image_files.return_value = _scanned(mock_image_files)
         return mock
 
     @pytest.fixture
@@ -803,7 +911,7 @@ class TestRegistrationErrorHandling:
             image_file = temp_dir / f"image_{i}.jpg"
             image_file.write_bytes(b"fake")
             image_files.append(image_file)
-        mock_fsm.get_image_files.return_value = image_files
+        mock_fsm.scan_image_files.return_value = _scanned(image_files)
 
         worker = DatabaseRegistrationWorker(temp_dir, real_db_manager, mock_fsm)
 
@@ -892,7 +1000,7 @@ class TestRegistrationErrorHandling:
     def test_empty_directory_handling_integration(self, temp_dir, real_db_manager):
         """空ディレクトリ処理テスト（統合テスト版）"""
         mock_fsm = Mock(spec=FileSystemManager)
-        mock_fsm.get_image_files.return_value = []
+        mock_fsm.scan_image_files.return_value = _scanned([])
 
         worker = DatabaseRegistrationWorker(temp_dir, real_db_manager, mock_fsm)
         result = worker.execute()
@@ -934,7 +1042,7 @@ class TestRegistrationErrorHandling:
         tag_file.write_text("tag1, tag2", encoding="utf-8")
         caption_file.write_text("test caption", encoding="utf-8")
 
-        mock_fsm.get_image_files.return_value = [image_file]
+        mock_fsm.scan_image_files.return_value = _scanned([image_file])
 
         # #633: 重複時の関連ファイル取り込みは統一エントリ register_image_with_side_effects
         # 内の _import_associated_files が担う。register_original_image を重複扱いにして
@@ -969,7 +1077,7 @@ class TestRegistrationErrorHandling:
         tag_file = temp_dir / "alias_fail_test.txt"
         image_file.write_bytes(b"fake_image")
         tag_file.write_text("tag1", encoding="utf-8")
-        mock_fsm.get_image_files.return_value = [image_file]
+        mock_fsm.scan_image_files.return_value = _scanned([image_file])
 
         with (
             patch.object(real_db_manager, "register_original_image") as mock_register,
@@ -1001,7 +1109,7 @@ class TestRegistrationErrorHandling:
             image_files.append(image_file)
 
         mock_fsm = Mock(spec=FileSystemManager)
-        mock_fsm.get_image_files.return_value = image_files
+        mock_fsm.scan_image_files.return_value = _scanned(image_files)
 
         with (
             patch.object(real_db_manager, "register_original_image") as mock_register,